@@ -0,0 +1,47 @@
+"""
+Hash del contenido textual de las notas.
+
+El texto de una nota es su título y su contenido normalizados (saltos de línea `\\n`, Unicode
+NFC y sin espacios ni saltos de línea al principio o al final), unidos por una línea en blanco
+cuando hay título. Es el texto que se indexa y se envía a los modelos de embeddings, y su hash
+(SHA-256 de los bytes UTF-8) sirve para:
+
+- saber si un guardado ha cambiado el texto (los metadatos, el proyecto o un texto idéntico
+  no lo cambian), de modo que los índices derivados no se recalculen;
+- encontrar notas exactamente duplicadas de un usuario;
+- cachear embeddings por texto para todo el sistema.
+
+PostgreSQL mantiene `notes.content_hash` como columna generada con `note_content_hash()`
+(migración `add_note_content_hash`), el equivalente SQL de `content_hash()`. Ambas deben
+producir los mismos bytes: se usa SHA-256 en lugar de BLAKE2b porque es el que PostgreSQL
+trae de serie.
+"""
+
+import hashlib
+import unicodedata
+
+HASH_SIZE = 32
+
+_TRIMMED = " \t\n"
+
+
+def normalize_text(text: str | None) -> str:
+    if not text:
+        return ""
+    return unicodedata.normalize("NFC", text.replace("\r\n", "\n")).strip(_TRIMMED)
+
+
+def note_text(title: str | None, content: str) -> str:
+    """Texto normalizado de una nota: el que se hashea y se envía a los embeddings."""
+    title, content = normalize_text(title), normalize_text(content)
+    return f"{title}\n\n{content}" if title else content
+
+
+def text_hash(text: str) -> bytes:
+    """Hash de un texto ya normalizado (ver `note_text`)."""
+    return hashlib.sha256(text.encode("utf-8")).digest()
+
+
+def content_hash(title: str | None, content: str) -> bytes:
+    """Hash del texto de una nota; coincide con `notes.content_hash`."""
+    return text_hash(note_text(title, content))
@@ -0,0 +1,273 @@
+"""
+Empaquetado del contexto del asistente en un presupuesto de tokens.
+
+- Tokens: estimación local a razón de cuatro caracteres por token, sin el tokenizador del
+  modelo. Para texto en español o inglés queda algo por encima del recuento real, así que
+  un contexto que cabe según la estimación cabe también en el prompt.
+- Relevancia de una nota: keywords que coinciden con la consulta, palabras de la consulta en
+  el título, pertenencia al proyecto pedido, número de enlaces y antigüedad.
+- Empaquetado voraz: primero el contexto aprendido del perfil, después las descripciones de
+  los proyectos de las notas más relevantes y por último las notas, por relevancia. Cada
+  sección tiene un tope propio y la que no cabe entera se recorta si queda sitio para un
+  extracto útil. El plan se hace con las longitudes, antes de leer ningún texto: de cada
+  nota y proyecto solo se leen los caracteres que caben.
+"""
+
+import json
+import math
+import re
+import uuid
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from src.pkm_app.core.application.dtos.assistant_context_dto import (
+    AssembledContext,
+    ContextCandidate,
+    ContextExcerpts,
+    ContextItem,
+)
+
+CHARS_PER_TOKEN = 4
+
+MAX_TERMS = 32
+_WORD = re.compile(r"\w+")
+
+KEYWORD_WEIGHT = 3.0
+TITLE_WEIGHT = 2.0
+PROJECT_WEIGHT = 1.5
+LINK_WEIGHT = 0.5
+RECENCY_WEIGHT = 1.0
+RECENCY_HALF_LIFE_DAYS = 30.0
+
+# Topes por sección, en tokens, y fracción máxima del presupuesto del perfil y los proyectos
+PROFILE_MAX_TOKENS = 400
+PROFILE_SHARE = 0.25
+PROJECT_MAX_TOKENS = 150
+PROJECTS_SHARE = 0.25
+MAX_PROJECTS = 3
+NOTE_MAX_TOKENS = 400
+# Un extracto recortado más corto que esto no merece su cabecera
+MIN_EXCERPT_CHARS = 80
+
+# Separador entre secciones; cada sección se presupuesta con él incluido
+_SEPARATOR = "\n\n"
+
+
+def estimate_tokens(text: str) -> int:
+    return tokens_for_chars(len(text))
+
+
+def tokens_for_chars(chars: int) -> int:
+    return -(-chars // CHARS_PER_TOKEN)
+
+
+def query_words(query: str) -> list[str]:
+    """Palabras de la consulta en minúsculas, sin repetir, en orden de aparición."""
+    words = (word for word in _WORD.findall(query.lower()) if len(word) > 1)
+    return list(dict.fromkeys(words))[:MAX_TERMS]
+
+
+def query_terms(query: str) -> list[str]:
+    """Nombres de keyword que se buscan: las palabras de la consulta y sus parejas seguidas."""
+    words = query_words(query)
+    pairs = [f"{first} {second}" for first, second in zip(words, words[1:])]
+    return (words + pairs)[:MAX_TERMS]
+
+
+def relevance(
+    candidate: ContextCandidate,
+    words: Sequence[str],
+    project_id: uuid.UUID | None,
+    now: datetime,
+) -> float:
+    """Puntuación de una nota candidata; `now` es el instante desde el que se mide la edad."""
+    title_words = set(_WORD.findall((candidate.title or "").lower()))
+    age_days = max((now - candidate.updated_at).total_seconds(), 0.0) / 86400
+    return (
+        KEYWORD_WEIGHT * candidate.keyword_hits
+        + TITLE_WEIGHT * sum(word in title_words for word in words)
+        + PROJECT_WEIGHT * (project_id is not None and candidate.project_id == project_id)
+        + LINK_WEIGHT * math.log1p(candidate.link_count)
+        + RECENCY_WEIGHT * 0.5 ** (age_days / RECENCY_HALF_LIFE_DAYS)
+    )
+
+
+def rank(
+    candidates: Sequence[ContextCandidate],
+    words: Sequence[str],
+    project_id: uuid.UUID | None,
+    now: datetime,
+) -> list[ContextCandidate]:
+    """Candidatas de más a menos relevante; a igualdad, la más reciente primero."""
+    scores = {c.note_id: relevance(c, words, project_id, now) for c in candidates}
+    return sorted(
+        candidates,
+        key=lambda c: (-scores[c.note_id], -c.updated_at.timestamp(), c.note_id),
+    )
+
+
+def render_learned_context(learned_context: Mapping[str, Any] | None) -> str:
+    if not learned_context:
+        return ""
+    return json.dumps(learned_context, ensure_ascii=False, sort_keys=True, default=str)
+
+
+@dataclass(frozen=True, slots=True)
+class PlannedSection:
+    """Sección del contexto: cabecera y cuántos caracteres del texto de la fuente se usan."""
+
+    kind: str
+    id: uuid.UUID | None
+    title: str | None
+    heading: str
+    chars: int
+    truncated: bool
+
+
+def _fit(
+    kind: str,
+    entity_id: uuid.UUID | None,
+    title: str | None,
+    heading: str,
+    length: int,
+    max_tokens: int,
+) -> PlannedSection | None:
+    """La sección con tantos caracteres como quepan en `max_tokens`; None si no cabe."""
+    available = max_tokens * CHARS_PER_TOKEN - len(heading) - 1 - len(_SEPARATOR)
+    if length <= available:
+        return PlannedSection(kind, entity_id, title, heading, length, False)
+    if available < MIN_EXCERPT_CHARS:
+        return None
+    return PlannedSection(kind, entity_id, title, heading, available, True)
+
+
+def _tokens(section: PlannedSection) -> int:
+    return tokens_for_chars(len(section.heading) + 1 + section.chars + len(_SEPARATOR))
+
+
+def note_heading(candidate: ContextCandidate) -> str:
+    title = candidate.title or "Sin título"
+    return f"## Nota: {title} ({candidate.updated_at:%Y-%m-%d})"
+
+
+def plan(
+    ranked: Sequence[ContextCandidate],
+    learned_context: str,
+    project_id: uuid.UUID | None,
+    max_tokens: int,
+) -> list[PlannedSection]:
+    """
+    Reparte `max_tokens` entre el perfil, los proyectos y las notas (ya ordenadas). Las
+    longitudes de las notas y proyectos son las de las candidatas (en bytes, así que nunca
+    por debajo de los caracteres).
+    """
+    sections: list[PlannedSection] = []
+    remaining = max_tokens
+
+    def add(section: PlannedSection | None) -> None:
+        nonlocal remaining
+        if section is not None:
+            sections.append(section)
+            remaining -= _tokens(section)
+
+    if learned_context:
+        limit = min(PROFILE_MAX_TOKENS, int(max_tokens * PROFILE_SHARE), remaining)
+        add(_fit("profile", None, None, "## Perfil del usuario", len(learned_context), limit))
+
+    # El proyecto pedido va delante de los de las notas más relevantes
+    requested = [c for c in ranked if project_id is not None and c.project_id == project_id]
+    projects: dict[uuid.UUID, ContextCandidate] = {}
+    for candidate in [*requested, *ranked]:
+        if len(projects) == MAX_PROJECTS:
+            break
+        if candidate.project_id and candidate.project_description_length:
+            projects.setdefault(candidate.project_id, candidate)
+    projects_budget = int(max_tokens * PROJECTS_SHARE)
+    for project in projects.values():
+        limit = min(PROJECT_MAX_TOKENS, projects_budget, remaining)
+        heading = f"## Proyecto: {project.project_name}"
+        section = _fit(
+            "project",
+            project.project_id,
+            project.project_name,
+            heading,
+            project.project_description_length,
+            limit,
+        )
+        if section is not None:
+            projects_budget -= _tokens(section)
+            add(section)
+
+    for candidate in ranked:
+        limit = min(NOTE_MAX_TOKENS, remaining)
+        # Ni sin cabecera cabría: ahorra formatearla para el resto de candidatas
+        if limit * CHARS_PER_TOKEN - 1 - len(_SEPARATOR) < min(
+            candidate.content_length, MIN_EXCERPT_CHARS
+        ):
+            continue
+        heading = note_heading(candidate)
+        add(
+            _fit(
+                "note",
+                candidate.note_id,
+                candidate.title,
+                heading,
+                candidate.content_length,
+                limit,
+            )
+        )
+    return sections
+
+
+def _cut(text: str, chars: int, truncated: bool) -> str:
+    """Los primeros `chars` caracteres; si se recorta, sin dejar una palabra a medias."""
+    text = text[:chars]
+    if truncated and len(text) == chars:
+        head, _, _ = text.rpartition(" ")
+        if len(head) > chars // 2:
+            return head
+    return text
+
+
+def assemble(
+    sections: Sequence[PlannedSection],
+    learned_context: str,
+    excerpts: ContextExcerpts,
+    max_tokens: int,
+    version: str,
+) -> AssembledContext:
+    """Compone el texto del contexto con los extractos leídos para cada sección del plan."""
+    parts: list[str] = []
+    items: list[ContextItem] = []
+    for section in sections:
+        if section.kind == "profile":
+            source: str | None = learned_context
+        elif section.kind == "project":
+            source = excerpts.projects.get(section.id)  # type: ignore[arg-type]
+        else:
+            source = excerpts.notes.get(section.id)  # type: ignore[arg-type]
+        if source is None:
+            # Borrada entre la clasificación y la lectura
+            continue
+        body = _cut(source, section.chars, section.truncated)
+        part = f"{section.heading}\n{body}"
+        parts.append(part)
+        items.append(
+            ContextItem(
+                kind=section.kind,  # type: ignore[arg-type]
+                id=section.id,
+                title=section.title,
+                tokens=estimate_tokens(part),
+                truncated=section.truncated and len(source) >= section.chars,
+            )
+        )
+    text = _SEPARATOR.join(parts)
+    return AssembledContext(
+        text=text,
+        items=items,
+        tokens=estimate_tokens(text),
+        max_tokens=max_tokens,
+        version=version,
+    )
@@ -9,13 +9,31 @@ However, for convenience or maintaining backward compatibility during transition
 key DTOs are also re-exported here.
 """
 
+from .assistant_context_dto import (
+    AssembledContext,
+    ContextCandidate,
+    ContextExcerpts,
+    ContextItem,
+    ContextState,
+)
+from .change_feed_dto import (
+    ChangeEntityType,
+    ChangeFeedPage,
+    ChangeOperation,
+    ChangeRecord,
+)
 from .keyword_dto import (
     KeywordBase,
     KeywordCreate,
     KeywordSchema,
     KeywordUpdate,
 )
+from .llm_dto import LLMRequest, LLMResponse, LLMUsage
+from .metadata_filter_dto import MetadataFilter
+from .near_duplicate_dto import NearDuplicateCluster, NearDuplicateNote, NoteText
+from .note_columns_dto import NoteColumns
 from .note_dto import (
+    DuplicateNoteGroup,
     NoteBase,
     NoteCreate,
     NoteSchema,
@@ -28,6 +46,13 @@ from .note_link_dto import (
     NoteLinkSchema,
     NoteLinkUpdate,
 )
+from .outbox_dto import (
+    NoteIndexBatch,
+    NoteIndexDocument,
+    NoteIndexTombstone,
+    OutboxMessage,
+    OutboxOperation,
+)
 from .project_dto import (
     ProjectBase,
     ProjectCreate,
@@ -46,6 +71,12 @@ from .user_profile_dto import (
     UserProfileSchema,
     UserProfileUpdate,
 )
+from .vector_index_dto import (
+    VectorBatch,
+    VectorFilter,
+    VectorPayload,
+    VectorSearchHit,
+)
 
 __all__ = [
     # UserProfile DTOs
@@ -79,4 +110,38 @@ __all__ = [
     "NoteUpdate",
     "NoteSchema",
     "NoteWithLinksSchema",
+    "DuplicateNoteGroup",
+    "NoteColumns",
+    # Near-duplicate DTOs
+    "NearDuplicateNote",
+    "NearDuplicateCluster",
+    "NoteText",
+    # Metadata filter DTOs
+    "MetadataFilter",
+    # Change feed DTOs
+    "ChangeEntityType",
+    "ChangeOperation",
+    "ChangeRecord",
+    "ChangeFeedPage",
+    # Outbox DTOs
+    "OutboxOperation",
+    "OutboxMessage",
+    "NoteIndexDocument",
+    "NoteIndexTombstone",
+    "NoteIndexBatch",
+    # Vector index DTOs
+    "VectorPayload",
+    "VectorBatch",
+    "VectorFilter",
+    "VectorSearchHit",
+    # LLM gateway DTOs
+    "LLMRequest",
+    "LLMResponse",
+    "LLMUsage",
+    # Assistant context DTOs
+    "ContextState",
+    "ContextCandidate",
+    "ContextExcerpts",
+    "ContextItem",
+    "AssembledContext",
 ]
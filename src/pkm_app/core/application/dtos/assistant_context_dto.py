@@ -0,0 +1,65 @@
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Literal
+
+from pydantic import BaseModel, ConfigDict, Field
+
+# --- Assistant Context Schemas ---
+
+
+@dataclass(frozen=True)
+class ContextState:
+    """Latest change of a user's context sources and the profile's learned context."""
+
+    last_changed_at: datetime | None
+    learned_context: dict[str, Any] | None
+    # Committed changes not yet numbered in the change feed (its cursor does not cover them)
+    pending_changes: bool = False
+
+
+@dataclass(frozen=True)
+class ContextCandidate:
+    """Ranking features of a note that may go into an assistant context (no content)."""
+
+    note_id: uuid.UUID
+    title: str | None
+    updated_at: datetime
+    content_length: int
+    keyword_hits: int
+    link_count: int
+    project_id: uuid.UUID | None = None
+    project_name: str | None = None
+    project_description_length: int = 0
+
+
+@dataclass(frozen=True)
+class ContextExcerpts:
+    """Leading characters of the notes' contents and projects' descriptions, by id."""
+
+    notes: dict[uuid.UUID, str]
+    projects: dict[uuid.UUID, str]
+
+
+class ContextItem(BaseModel):
+    """A section of an assembled context."""
+
+    kind: Literal["profile", "project", "note"] = Field(description="Source of the section.")
+    id: uuid.UUID | None = Field(default=None, description="Note or project ID.")
+    title: str | None = Field(default=None, description="Note title or project name.")
+    tokens: int = Field(ge=0, description="Estimated tokens of the section.")
+    truncated: bool = Field(description="True if only a prefix of the text fits the budget.")
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+
+class AssembledContext(BaseModel):
+    """Prompt context for the assistant, packed into a token budget."""
+
+    text: str = Field(description="Context ready to be placed in a prompt.")
+    items: list[ContextItem] = Field(description="Sections of `text`, in order.")
+    tokens: int = Field(ge=0, description="Estimated tokens of `text`.")
+    max_tokens: int = Field(ge=1, description="Token budget the context was packed into.")
+    version: str = Field(description="Version of the user's data the context was built from.")
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
@@ -0,0 +1,54 @@
+import uuid
+from datetime import datetime
+from typing import Literal
+
+from pydantic import BaseModel, ConfigDict, Field
+
+# --- Change Feed Schemas ---
+
+ChangeEntityType = Literal["note", "project", "source", "keyword", "note_link"]
+ChangeOperation = Literal["upsert", "delete"]
+
+
+class ChangeRecord(BaseModel):
+    """
+    Latest change of one entity since the client's cursor.
+
+    Records carry no entity payload: on `upsert` the client re-fetches the entity (skipping it
+    if it already holds `version`), on `delete` (a tombstone) it drops its local copy.
+    """
+
+    seq: int = Field(description="Position of the change in the user's change feed.")
+    entity_type: ChangeEntityType = Field(description="Kind of entity that changed.")
+    entity_id: uuid.UUID = Field(description="ID of the entity that changed.")
+    operation: ChangeOperation = Field(
+        description="'upsert' if the entity was created or updated, 'delete' if it was deleted."
+    )
+    version: int | None = Field(
+        default=None,
+        description="Row version after the change (None for note links, which are unversioned).",
+    )
+    changed_at: datetime = Field(description="Timestamp of the change.")
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+
+class ChangeFeedPage(BaseModel):
+    """
+    One page of a user's change feed.
+
+    Clients store `next_cursor` and pass it back on the next call. While `has_more` is true
+    there are further changes to fetch right away. Cursor 0 returns no changes, only the
+    current cursor: the client loads its data through the regular list endpoints and follows
+    the feed from there. When `reset_required` is true the cursor predates purged tombstones
+    and the client does the same after discarding its local copy.
+    """
+
+    changes: list[ChangeRecord] = Field(default_factory=list)
+    next_cursor: int = Field(description="Cursor to pass on the next call.")
+    has_more: bool = Field(default=False, description="More changes are pending after this page.")
+    reset_required: bool = Field(
+        default=False, description="The cursor is too old; a full resync is needed."
+    )
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
@@ -76,6 +76,11 @@ class KeywordSchema(KeywordBase):
     id: uuid.UUID = Field(description="Unique identifier for the keyword.")
     user_id: str = Field(description="Identifier of the user who owns this keyword.")
     created_at: datetime = Field(description="Timestamp of when the keyword was created.")
+    version: int | None = Field(
+        default=None,
+        description="Row version of the keyword for optimistic concurrency control "
+        "(pass it as expected_version when updating).",
+    )
 
     model_config = ConfigDict(
         from_attributes=True,  # Allow creating from ORM models
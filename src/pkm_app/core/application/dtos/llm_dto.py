@@ -0,0 +1,65 @@
+from pydantic import BaseModel, ConfigDict, Field
+
+# --- LLM Gateway Schemas ---
+
+
+class LLMRequest(BaseModel):
+    """
+    A single prompt for a text-generation model.
+
+    Requests are content-addressed: two requests with the same fields are the same request, so
+    deterministic ones (temperature 0) are answered from the gateway cache.
+    """
+
+    model: str = Field(min_length=1, description="Provider model identifier, with version.")
+    prompt: str = Field(description="User prompt.")
+    system: str | None = Field(default=None, description="Optional system instruction.")
+    temperature: float = Field(default=0.0, ge=0.0, le=2.0, description="Sampling temperature.")
+    max_output_tokens: int | None = Field(
+        default=None, ge=1, description="Upper bound for the generated tokens."
+    )
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    @property
+    def deterministic(self) -> bool:
+        """Whether repeating the request must give the same answer (and can be cached)."""
+        return self.temperature == 0
+
+
+class LLMResponse(BaseModel):
+    """Text generated for an `LLMRequest` and the tokens the provider billed for it."""
+
+    text: str = Field(description="Generated text.")
+    model: str = Field(description="Model that generated the text, as reported by the provider.")
+    input_tokens: int = Field(default=0, ge=0, description="Prompt tokens billed.")
+    output_tokens: int = Field(default=0, ge=0, description="Generated tokens billed.")
+    cached: bool = Field(
+        default=False,
+        description="True if served from the cache or shared with an identical in-flight call.",
+    )
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+
+class LLMUsage(BaseModel):
+    """Counters of an LLM gateway since it was created."""
+
+    requests: int = Field(default=0, ge=0, description="Requests received.")
+    memory_hits: int = Field(default=0, ge=0, description="Answered from the in-memory cache.")
+    database_hits: int = Field(default=0, ge=0, description="Answered from the persistent cache.")
+    shared: int = Field(
+        default=0, ge=0, description="Answered by joining an identical request already in flight."
+    )
+    provider_calls: int = Field(default=0, ge=0, description="Calls made to the provider.")
+    provider_requests: int = Field(
+        default=0, ge=0, description="Requests sent to the provider (calls carry batches)."
+    )
+    failed_calls: int = Field(default=0, ge=0, description="Provider calls that raised.")
+    input_tokens: int = Field(default=0, ge=0, description="Prompt tokens billed by the provider.")
+    output_tokens: int = Field(default=0, ge=0, description="Generated tokens billed.")
+    provider_seconds: float = Field(
+        default=0.0, ge=0.0, description="Wall time spent in provider calls, added up."
+    )
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
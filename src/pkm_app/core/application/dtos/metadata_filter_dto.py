@@ -0,0 +1,57 @@
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+# --- Metadata Filter Schemas ---
+
+
+def _validate_path(path: str) -> str:
+    if not path or any(not segment.strip() for segment in path.split(".")):
+        raise ValueError(f"Ruta de metadata inválida: '{path}'.")
+    return path
+
+
+class MetadataFilter(BaseModel):
+    """
+    Filter over a JSONB metadata column (`notes.note_metadata`, `sources.link_metadata`).
+    All provided criteria are combined with AND. Key paths use dots to address
+    nested keys (e.g. 'source.author').
+    """
+
+    contains: dict[str, Any] | None = Field(
+        default=None,
+        description="JSON document that the metadata must contain (PostgreSQL `@>` operator).",
+    )
+    has_keys: list[str] | None = Field(
+        default=None,
+        description="Key paths that must exist in the metadata, regardless of their value.",
+    )
+    path_equals: dict[str, Any] | None = Field(
+        default=None,
+        description="Mapping of key path to the exact JSON value expected at that path.",
+    )
+
+    model_config = ConfigDict(
+        extra="forbid",
+        frozen=True,
+    )
+
+    @field_validator("has_keys")
+    @classmethod
+    def validate_has_keys(cls, value: list[str] | None) -> list[str] | None:
+        if value is not None:
+            for path in value:
+                _validate_path(path)
+        return value
+
+    @field_validator("path_equals")
+    @classmethod
+    def validate_path_equals(cls, value: dict[str, Any] | None) -> dict[str, Any] | None:
+        if value is not None:
+            for path in value:
+                _validate_path(path)
+        return value
+
+    def is_empty(self) -> bool:
+        """Returns True when no criterion has been provided."""
+        return not (self.contains or self.has_keys or self.path_equals)
@@ -0,0 +1,42 @@
+import uuid
+from dataclasses import dataclass
+
+from pydantic import BaseModel, ConfigDict, Field
+
+# --- Near-duplicate Schemas ---
+
+
+@dataclass(frozen=True)
+class NoteText:
+    """Content of a note that still needs its MinHash signature (backfill)."""
+
+    note_id: uuid.UUID
+    user_id: str
+    content: str
+
+
+class NearDuplicateNote(BaseModel):
+    """A note of a near-duplicate cluster and its similarity to the cluster's anchor."""
+
+    note_id: uuid.UUID = Field(description="ID of the near-duplicate note.")
+    similarity: float = Field(
+        ge=0.0,
+        le=1.0,
+        description="Jaccard similarity of word shingles with the anchor, estimated by MinHash.",
+    )
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+
+class NearDuplicateCluster(BaseModel):
+    """
+    Notes whose content is nearly identical to an anchor note.
+
+    Found through LSH buckets and kept only if the estimated similarity reaches the requested
+    threshold; matches are ordered from most to least similar.
+    """
+
+    anchor_id: uuid.UUID = Field(description="ID of the note the others are compared with.")
+    notes: list[NearDuplicateNote] = Field(description="Near duplicates of the anchor.")
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
@@ -0,0 +1,84 @@
+import uuid
+from dataclasses import dataclass
+from functools import cached_property
+
+import numpy as np
+
+# --- Note Columns (columnar batches for analytic scans) ---
+
+UUID_DTYPE = np.dtype("V16")
+TIMESTAMP_DTYPE = np.dtype("datetime64[us]")
+NIL_UUID = np.void(bytes(16))
+NO_TYPE = -1
+
+
+@dataclass(frozen=True, eq=False)
+class NoteColumns:
+    """
+    Columnar batch of note metadata `(id, project_id, type, created_at, updated_at)`.
+
+    Each column is a NumPy array with one entry per note (about 50 bytes per note instead of
+    a full NoteSchema object):
+    - `ids` / `project_ids`: 16-byte UUIDs (`V16`); a note without project has the nil UUID.
+    - `type_codes`: int16 codes into `type_categories`; `NO_TYPE` (-1) when the note has no type.
+    - `created_at` / `updated_at`: UTC timestamps as `datetime64[us]`.
+
+    Batches streamed from the same query share their type coding: the categories of a later
+    batch extend those of the earlier ones, so codes can be compared across batches.
+    """
+
+    ids: np.ndarray
+    project_ids: np.ndarray
+    type_codes: np.ndarray
+    type_categories: tuple[str, ...]
+    created_at: np.ndarray
+    updated_at: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the column arrays."""
+        return sum(
+            column.nbytes
+            for column in (
+                self.ids,
+                self.project_ids,
+                self.type_codes,
+                self.created_at,
+                self.updated_at,
+            )
+        )
+
+    @cached_property
+    def index(self) -> dict[bytes, int]:
+        """Row position of each note, keyed by the 16 bytes of its id (built on first use)."""
+        return {note_id: row for row, note_id in enumerate(self.ids.tolist())}
+
+    def position(self, note_id: uuid.UUID) -> int | None:
+        """Row of `note_id` in this batch, or None if it is not in it."""
+        return self.index.get(note_id.bytes)
+
+    def note_id(self, row: int) -> uuid.UUID:
+        return uuid.UUID(bytes=self.ids[row].tobytes())
+
+    def project_id(self, row: int) -> uuid.UUID | None:
+        value = self.project_ids[row]
+        return None if value == NIL_UUID else uuid.UUID(bytes=value.tobytes())
+
+    def note_type(self, row: int) -> str | None:
+        code = int(self.type_codes[row])
+        return None if code == NO_TYPE else self.type_categories[code]
+
+    def has_project(self) -> np.ndarray:
+        """Boolean mask of the notes that belong to a project."""
+        return self.project_ids != NIL_UUID
+
+    def type_mask(self, note_type: str | None) -> np.ndarray:
+        """Boolean mask of the notes of type `note_type` (None selects notes without type)."""
+        if note_type is None:
+            return self.type_codes == NO_TYPE
+        if note_type not in self.type_categories:
+            return np.zeros(len(self), dtype=bool)
+        return self.type_codes == self.type_categories.index(note_type)
@@ -87,6 +87,11 @@ class NoteSchema(NoteBase):
     user_id: str = Field(description="Identifier of the user who owns this note.")
     created_at: datetime = Field(description="Timestamp of when the note was created.")
     updated_at: datetime = Field(description="Timestamp of the last update to the note.")
+    version: int | None = Field(
+        default=None,
+        description="Row version of the note for optimistic concurrency control "
+        "(pass it as expected_version when updating).",
+    )
 
     project: ProjectSchema | None = Field(
         default=None, description="The project associated with this note, if any."
@@ -123,3 +128,17 @@ class NoteWithLinksSchema(NoteSchema):
         frozen=True,
         extra="forbid",
     )
+
+
+class DuplicateNoteGroup(BaseModel):
+    """
+    Notes of one user whose normalized title and content are identical.
+
+    Normalization ignores line-ending style, Unicode composition and leading/trailing
+    whitespace; notes differing only in metadata, project or keywords are duplicates.
+    """
+
+    content_hash: str = Field(description="Hex SHA-256 of the shared normalized text.")
+    note_ids: list[uuid.UUID] = Field(description="IDs of the duplicate notes, oldest first.")
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
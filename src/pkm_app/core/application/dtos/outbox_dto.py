@@ -0,0 +1,70 @@
+import uuid
+from datetime import datetime
+from typing import Literal
+
+from pydantic import BaseModel, ConfigDict, Field
+
+# --- Outbox Schemas ---
+
+OutboxOperation = Literal["upsert", "delete"]
+
+
+class OutboxMessage(BaseModel):
+    """
+    Pending change of a note, written in the same transaction as the change itself.
+
+    Messages carry no note content: the relay reads the note's current state when it
+    delivers, so several messages for the same note collapse into a single upsert.
+    """
+
+    id: int = Field(description="Position in the outbox (delivery order).")
+    note_id: uuid.UUID = Field(description="ID of the note that changed.")
+    user_id: str = Field(description="Owner of the note.")
+    operation: OutboxOperation = Field(
+        description="'upsert' if the note was created or updated, 'delete' if it was deleted."
+    )
+    version: int = Field(description="Row version of the note after (or at) the change.")
+    created_at: datetime = Field(description="When the change was written.")
+    attempts: int = Field(default=0, description="Failed delivery attempts so far.")
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+
+class NoteIndexDocument(BaseModel):
+    """Current state of a note as the vector store indexes it."""
+
+    note_id: uuid.UUID
+    user_id: str
+    project_id: uuid.UUID | None = None
+    type: str | None = None
+    title: str | None = None
+    content: str
+    content_hash: bytes = Field(
+        description="Hash of the normalized text; unchanged hash means no re-embedding."
+    )
+    version: int = Field(description="Row version; stores ignore documents older than theirs.")
+    updated_at: datetime
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+
+class NoteIndexTombstone(BaseModel):
+    """Deleted note: stores drop it and ignore later upserts with a version up to `version`."""
+
+    note_id: uuid.UUID
+    user_id: str
+    version: int
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+
+class NoteIndexBatch(BaseModel):
+    """One coalesced delivery: at most one upsert or one delete per note."""
+
+    upserts: list[NoteIndexDocument] = Field(default_factory=list)
+    deletes: list[NoteIndexTombstone] = Field(default_factory=list)
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    def __len__(self) -> int:
+        return len(self.upserts) + len(self.deletes)
@@ -64,6 +64,11 @@ class ProjectSchema(ProjectBase):
     user_id: str = Field(description="Identifier of the user who owns this project.")
     created_at: datetime = Field(description="Timestamp of when the project was created.")
     updated_at: datetime = Field(description="Timestamp of the last update to the project.")
+    version: int | None = Field(
+        default=None,
+        description="Row version of the project for optimistic concurrency control "
+        "(pass it as expected_version when updating).",
+    )
     # Relationships like child_projects or a fully resolved parent_project
     # are typically handled by specific use cases or separate queries
     # to avoid overly complex default schemas.
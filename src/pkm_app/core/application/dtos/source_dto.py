@@ -73,6 +73,11 @@ class SourceSchema(SourceBase):
     user_id: str = Field(description="Identifier of the user who owns this source.")
     created_at: datetime = Field(description="Timestamp of when the source was created.")
     updated_at: datetime = Field(description="Timestamp of the last update to the source.")
+    version: int | None = Field(
+        default=None,
+        description="Row version of the source for optimistic concurrency control "
+        "(pass it as expected_version when updating).",
+    )
 
     model_config = ConfigDict(
         from_attributes=True,  # Allow creating from ORM models
@@ -0,0 +1,85 @@
+import uuid
+from dataclasses import dataclass
+
+import numpy as np
+from pydantic import BaseModel, ConfigDict, Field
+
+# --- Vector Index Schemas ---
+
+VECTOR_DTYPE = np.dtype("float32")
+
+
+class VectorPayload(BaseModel):
+    """Attributes stored with a vector; searches can filter on them inside the index."""
+
+    user_id: str
+    project_id: uuid.UUID | None = None
+    type: str | None = None
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+
+class VectorFilter(BaseModel):
+    """
+    Restricts a search to one user's vectors and, optionally, to a project and/or a type.
+
+    `None` means "any value" (there is no way to select vectors *without* a project or type).
+    """
+
+    user_id: str
+    project_id: uuid.UUID | None = None
+    type: str | None = None
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+
+class VectorSearchHit(BaseModel):
+    """One search result: the id of the vector and its cosine similarity to the query."""
+
+    id: uuid.UUID
+    score: float = Field(description="Cosine similarity in [-1, 1]; higher is closer.")
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+
+@dataclass(frozen=True, eq=False)
+class VectorBatch:
+    """
+    Columnar batch of vectors to upsert.
+
+    `vectors` is a float32 matrix with one row per id, so a batch of embeddings is handed to
+    an index without building a Python list per vector. Ids must be unique within a batch
+    (an index may upload parts of a batch concurrently) and vectors must be non-zero
+    (cosine similarity is undefined for them).
+    """
+
+    ids: tuple[uuid.UUID, ...]
+    vectors: np.ndarray
+    payloads: tuple[VectorPayload, ...]
+
+    def __post_init__(self) -> None:
+        vectors = np.asarray(self.vectors, dtype=VECTOR_DTYPE)
+        if vectors.ndim != 2:
+            raise ValueError("vectors must be a 2-D matrix (one row per id)")
+        if not len(self.ids) == len(vectors) == len(self.payloads):
+            raise ValueError("ids, vectors and payloads must have the same length")
+        if len(set(self.ids)) != len(self.ids):
+            raise ValueError("ids must be unique within a batch")
+        if len(vectors) and not np.all(np.linalg.norm(vectors, axis=1) > 0):
+            raise ValueError("vectors must be non-zero")
+        object.__setattr__(self, "vectors", vectors)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def dimension(self) -> int:
+        return int(self.vectors.shape[1])
+
+    def slice(self, start: int, stop: int) -> "VectorBatch":
+        """Rows `start:stop` of the batch (the vectors are a view, not a copy)."""
+        return VectorBatch(
+            ids=self.ids[start:stop],
+            vectors=self.vectors[start:stop],
+            payloads=self.payloads[start:stop],
+        )
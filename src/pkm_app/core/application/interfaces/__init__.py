@@ -1,17 +1,53 @@
+from src.pkm_app.core.application.interfaces.assistant_context_interface import (
+    IAssistantContextRepository,
+)
+from src.pkm_app.core.application.interfaces.change_feed_interface import IChangeFeedRepository
+from src.pkm_app.core.application.interfaces.embedding_interface import (
+    IEmbeddingCacheRepository,
+    ITextEmbedder,
+)
 from src.pkm_app.core.application.interfaces.keyword_interface import IKeywordRepository
+from src.pkm_app.core.application.interfaces.llm_interface import (
+    ILLMGateway,
+    ILLMProvider,
+    ILLMResponseCacheRepository,
+)
+from src.pkm_app.core.application.interfaces.near_duplicate_interface import (
+    INearDuplicateRepository,
+)
 from src.pkm_app.core.application.interfaces.note_interface import INoteRepository
 from src.pkm_app.core.application.interfaces.note_link_interface import INoteLinkRepository
+from src.pkm_app.core.application.interfaces.outbox_interface import (
+    INoteIndexSink,
+    IOutboxRepository,
+)
 from src.pkm_app.core.application.interfaces.project_interface import IProjectRepository
 from src.pkm_app.core.application.interfaces.source_interface import ISourceRepository
-from src.pkm_app.core.application.interfaces.unit_of_work_interface import IUnitOfWork
+from src.pkm_app.core.application.interfaces.unit_of_work_interface import (
+    IReadOnlyUnitOfWork,
+    IUnitOfWork,
+)
 from src.pkm_app.core.application.interfaces.user_profile_interface import IUserProfileRepository
+from src.pkm_app.core.application.interfaces.vector_index_interface import IVectorIndex
 
 __all__ = [
+    "IAssistantContextRepository",
+    "IChangeFeedRepository",
+    "IEmbeddingCacheRepository",
     "IKeywordRepository",
+    "ILLMGateway",
+    "ILLMProvider",
+    "ILLMResponseCacheRepository",
+    "INearDuplicateRepository",
     "INoteRepository",
     "INoteLinkRepository",
+    "INoteIndexSink",
+    "IOutboxRepository",
     "IProjectRepository",
     "ISourceRepository",
+    "ITextEmbedder",
+    "IReadOnlyUnitOfWork",
     "IUnitOfWork",
     "IUserProfileRepository",
+    "IVectorIndex",
 ]
@@ -0,0 +1,54 @@
+import uuid
+from abc import ABC, abstractmethod
+from collections.abc import Mapping, Sequence
+
+from src.pkm_app.core.application.dtos.assistant_context_dto import (
+    ContextCandidate,
+    ContextExcerpts,
+    ContextState,
+)
+
+
+class IAssistantContextRepository(ABC):
+    """
+    Interfaz abstracta de las lecturas con las que se arma el contexto del asistente (ver
+    `core/application/context_packing.py`).
+
+    Separa la clasificación de la lectura del texto: los candidatos llegan sin contenido,
+    solo con las señales para ordenarlos y la longitud de su texto, y después se piden de una
+    vez los prefijos que caben en el presupuesto.
+    """
+
+    @abstractmethod
+    async def get_state(self, user_id: str) -> ContextState:
+        """
+        Instante del último cambio registrado de las notas, proyectos, keywords o enlaces del
+        usuario, si quedan cambios suyos sin numerar en el feed de cambios y el
+        `learned_context` de su perfil.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def find_candidates(
+        self, user_id: str, terms: Sequence[str], project_id: uuid.UUID | None, limit: int
+    ) -> list[ContextCandidate]:
+        """
+        Notas candidatas del usuario con sus señales de relevancia: las que tienen keywords
+        cuyo nombre está en `terms`, las más recientes del proyecto indicado y las más
+        recientes del usuario; como mucho `limit` de cada grupo (y por keyword).
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_excerpts(
+        self,
+        user_id: str,
+        notes: Mapping[uuid.UUID, int],
+        projects: Mapping[uuid.UUID, int],
+    ) -> ContextExcerpts:
+        """
+        Los primeros caracteres (tantos como indica cada entrada) del contenido de las notas y
+        de la descripción de los proyectos, en una sola consulta. Se omiten los que no son
+        del usuario.
+        """
+        raise NotImplementedError
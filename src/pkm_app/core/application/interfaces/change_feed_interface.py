@@ -0,0 +1,34 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+from src.pkm_app.core.application.dtos.change_feed_dto import ChangeFeedPage
+
+
+class IChangeFeedRepository(ABC):
+    """
+    Interfaz abstracta para el feed de cambios de un usuario (sincronización incremental).
+
+    Cada creación, actualización o borrado de notas, proyectos, fuentes, keywords y enlaces
+    deja un registro con el último cambio de la entidad; los borrados dejan una lápida.
+    """
+
+    @abstractmethod
+    async def get_changes_since(self, user_id: str, cursor: int, limit: int) -> ChangeFeedPage:
+        """
+        Devuelve, en orden de `seq`, hasta `limit` cambios del usuario posteriores a `cursor`.
+
+        Con `cursor` 0 (primera sincronización) no se devuelven cambios, solo el cursor
+        actual. Si `cursor` es anterior a lápidas ya purgadas, la página tampoco trae cambios
+        y marca `reset_required`.
+        Debe ejecutarse dentro de una transacción que se confirme después: la lectura asigna
+        su posición a los cambios confirmados que aún no la tenían.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def purge_tombstones(self, older_than: datetime) -> int:
+        """
+        Elimina las lápidas entregadas anteriores a `older_than` y devuelve cuántas se han
+        eliminado. Los cursores anteriores a ellas pasan a requerir una resincronización.
+        """
+        raise NotImplementedError
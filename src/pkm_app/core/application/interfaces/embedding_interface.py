@@ -0,0 +1,41 @@
+from abc import ABC, abstractmethod
+from collections.abc import Mapping, Sequence
+
+import numpy as np
+
+
+class ITextEmbedder(ABC):
+    """
+    Interfaz abstracta de un modelo de embeddings de texto.
+
+    Los textos llegan ya normalizados (ver `content_hashing.note_text`): dos textos iguales
+    deben producir el mismo vector, que es lo que permite cachearlos por su hash.
+    """
+
+    @property
+    @abstractmethod
+    def model(self) -> str:
+        """Identificador del modelo (y versión) que produce los vectores."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def embed(self, texts: Sequence[str]) -> np.ndarray:
+        """Una fila float32 por texto, en el mismo orden."""
+        raise NotImplementedError
+
+
+class IEmbeddingCacheRepository(ABC):
+    """
+    Interfaz abstracta de la caché persistente de embeddings, indexada por modelo y hash del
+    texto. Un vector calculado no cambia nunca, así que las entradas no se invalidan.
+    """
+
+    @abstractmethod
+    async def get_many(self, model: str, hashes: Sequence[bytes]) -> dict[bytes, np.ndarray]:
+        """Vectores cacheados de los hashes indicados; los que no están se omiten."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def put_many(self, model: str, vectors: Mapping[bytes, np.ndarray]) -> None:
+        """Guarda los vectores; si otro proceso ya guardó alguno, se conserva el existente."""
+        raise NotImplementedError
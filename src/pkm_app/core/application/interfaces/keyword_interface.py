@@ -32,9 +32,13 @@ class IKeywordRepository(ABC):
 
     @abstractmethod
     async def update(
-        self, keyword_id: uuid.UUID, keyword_in: KeywordUpdate, user_id: str
+        self,
+        keyword_id: uuid.UUID,
+        keyword_in: KeywordUpdate,
+        user_id: str,
+        expected_version: int | None = None,
     ) -> KeywordSchema | None:
-        """Actualiza un keyword existente."""
+        """Actualiza un keyword existente; ConcurrencyError si hay conflicto de versión."""
         raise NotImplementedError
 
     @abstractmethod
@@ -0,0 +1,69 @@
+from abc import ABC, abstractmethod
+from collections.abc import Mapping, Sequence
+
+from src.pkm_app.core.application.dtos.llm_dto import LLMRequest, LLMResponse, LLMUsage
+
+
+class ILLMProvider(ABC):
+    """
+    Interfaz abstracta de un proveedor de modelos de lenguaje (Gemini, un modelo local, el
+    proveedor falso de los tests...). Solo la usa el gateway: el resto de la aplicación
+    pide texto a `ILLMGateway`.
+    """
+
+    @property
+    @abstractmethod
+    def name(self) -> str:
+        """Identificador del proveedor; forma parte de la clave de caché de las respuestas."""
+        raise NotImplementedError
+
+    @property
+    def max_batch_size(self) -> int:
+        """Peticiones que admite una llamada a `generate`; 1 si el proveedor no agrupa."""
+        return 1
+
+    @abstractmethod
+    async def generate(self, requests: Sequence[LLMRequest]) -> list[LLMResponse]:
+        """Una respuesta por petición, en el mismo orden; como mucho `max_batch_size`."""
+        raise NotImplementedError
+
+
+class ILLMGateway(ABC):
+    """
+    Interfaz abstracta del punto único de acceso a los modelos de lenguaje.
+
+    Quien llama no sabe si la respuesta sale de una caché, de otra petición idéntica en
+    curso o de una llamada al proveedor (agrupada con otras); `usage()` lo contabiliza.
+    """
+
+    @abstractmethod
+    async def generate(self, request: LLMRequest) -> LLMResponse:
+        """Genera la respuesta de una petición."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def generate_many(self, requests: Sequence[LLMRequest]) -> list[LLMResponse]:
+        """Genera las respuestas de varias peticiones a la vez, en el mismo orden."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def usage(self) -> LLMUsage:
+        """Contadores de peticiones, aciertos de caché, llamadas, tokens y latencia."""
+        raise NotImplementedError
+
+
+class ILLMResponseCacheRepository(ABC):
+    """
+    Interfaz abstracta de la caché persistente de respuestas de modelos, indexada por la
+    clave de contenido de la petición (proveedor incluido).
+    """
+
+    @abstractmethod
+    async def get_many(self, keys: Sequence[bytes]) -> dict[bytes, LLMResponse]:
+        """Respuestas cacheadas de las claves indicadas; las que no están se omiten."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def put_many(self, provider: str, responses: Mapping[bytes, LLMResponse]) -> None:
+        """Guarda las respuestas; si otro proceso ya guardó alguna, se conserva la existente."""
+        raise NotImplementedError
@@ -0,0 +1,59 @@
+import uuid
+from abc import ABC, abstractmethod
+from collections.abc import Mapping, Sequence
+
+import numpy as np
+
+from src.pkm_app.core.application.dtos.near_duplicate_dto import NoteText
+
+
+class INearDuplicateRepository(ABC):
+    """
+    Interfaz abstracta del índice LSH de firmas MinHash de las notas (ver
+    `core/application/minhash.py`).
+
+    Todas las búsquedas se resuelven por claves LSH compartidas, sin recorrer las firmas de
+    todas las notas del usuario; la similitud de los candidatos la estima quien llama.
+    """
+
+    @abstractmethod
+    async def save_signatures(
+        self, user_id: str, signatures: Mapping[uuid.UUID, np.ndarray | None]
+    ) -> None:
+        """
+        Guarda (o sustituye) la firma de cada nota y sus claves LSH. Una firma None indica
+        una nota sin palabras, que no será candidata de ninguna otra.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_signatures(
+        self, user_id: str, note_ids: Sequence[uuid.UUID]
+    ) -> dict[uuid.UUID, np.ndarray]:
+        """Firmas de las notas indicadas del usuario; se omiten las que no tienen."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def find_candidates(
+        self, user_id: str, note_id: uuid.UUID, limit: int
+    ) -> dict[uuid.UUID, np.ndarray]:
+        """
+        Notas del usuario que comparten alguna clave LSH con `note_id` (sin incluirla), con
+        sus firmas; como mucho `limit`, las que comparten más claves primero.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def find_candidate_buckets(
+        self, user_id: str, max_bucket_size: int
+    ) -> list[list[uuid.UUID]]:
+        """
+        Grupos de notas del usuario que comparten una misma clave LSH (dos o más notas). De
+        los grupos mayores que `max_bucket_size` solo se devuelven sus primeras notas.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list_unindexed(self, limit: int) -> list[NoteText]:
+        """Hasta `limit` notas, de cualquier usuario, que aún no tienen fila en el índice."""
+        raise NotImplementedError
@@ -2,9 +2,14 @@
 
 import uuid
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from datetime import datetime
 from typing import Optional
 
 from src.pkm_app.core.application.dtos import (
+    DuplicateNoteGroup,
+    MetadataFilter,
+    NoteColumns,
     NoteCreate,
     NoteSchema,
     NoteUpdate,
@@ -36,6 +41,28 @@ class INoteRepository(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    async def get_updated_at(self, note_id: uuid.UUID, user_id: str) -> datetime | None:
+        """
+        Sonda de versión de una nota: su 'updated_at', sin cargar la nota.
+        Devuelve None si la nota no se encuentra o no pertenece al usuario.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_list_stats(
+        self, user_id: str, project_id: uuid.UUID | None = None
+    ) -> tuple[datetime | None, int, int] | None:
+        """
+        Sonda de versión de un listado: (máximo 'updated_at', número de notas, suma de
+        comprobación) de las notas del usuario, o de las del proyecto si se indica
+        'project_id'. La suma de comprobación cambia con cada escritura confirmada, aunque su
+        'updated_at' quede por debajo del máximo. Con 'project_id' el máximo y la suma
+        incluyen el propio proyecto y se devuelve None si el proyecto no se encuentra o no
+        pertenece al usuario.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def create(
         self, note_in: NoteCreate, user_id: str
@@ -49,13 +76,19 @@ class INoteRepository(ABC):
 
     @abstractmethod
     async def update(  # Añadido async
-        self, note_id: uuid.UUID, note_in: NoteUpdate, user_id: str
+        self,
+        note_id: uuid.UUID,
+        note_in: NoteUpdate,
+        user_id: str,
+        expected_version: int | None = None,
     ) -> NoteSchema | None:
         """
         Actualiza una nota existente perteneciente a un usuario específico.
         'note_in' es un esquema Pydantic con los campos a actualizar.
         Devuelve la nota actualizada o None si la nota no se encuentra o no pertenece al usuario.
         Debe manejar la actualización de la asociación de keywords si 'note_in.keywords' está presente.
+        Lanza ConcurrencyError si 'expected_version' no es la versión actual de la nota o si
+        otra operación la modifica a la vez.
         """
         raise NotImplementedError
 
@@ -113,3 +146,37 @@ class INoteRepository(ABC):
         Lista las notas asociadas a una lista de keywords específicas en un proyecto.
         """
         raise NotImplementedError
+
+    @abstractmethod
+    async def search_by_metadata(
+        self,
+        user_id: str,
+        metadata_filter: MetadataFilter,
+        skip: int = 0,
+        limit: int = 20,
+    ) -> list[NoteSchema]:
+        """
+        Lista las notas cuyo 'note_metadata' cumple el filtro indicado
+        (contención, existencia de claves e igualdad por ruta).
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def find_exact_duplicates(
+        self, user_id: str, limit: int = 100
+    ) -> list[DuplicateNoteGroup]:
+        """
+        Grupos de notas del usuario con el mismo texto normalizado (título y contenido), de
+        más a menos notas, hasta 'limit' grupos. Cada grupo lista sus notas de la más antigua
+        a la más reciente.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def stream_columns(self, user_id: str, batch_size: int = 50_000) -> AsyncIterator[NoteColumns]:
+        """
+        Recorre todas las notas de un usuario en lotes columnares (id, proyecto, tipo y
+        fechas) de hasta 'batch_size' notas, leídos con un cursor del servidor.
+        Pensado para análisis masivos, donde cargar NoteSchema completos no es viable.
+        """
+        raise NotImplementedError
@@ -0,0 +1,61 @@
+import uuid
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from datetime import datetime
+
+from src.pkm_app.core.application.dtos.outbox_dto import (
+    NoteIndexBatch,
+    NoteIndexDocument,
+    OutboxMessage,
+)
+
+
+class IOutboxRepository(ABC):
+    """
+    Interfaz abstracta del outbox de notas.
+
+    Los mensajes se escriben en la misma transacción que el cambio de la nota (no hay método
+    para añadirlos); el relay los reclama por lotes, los entrega y los elimina.
+    """
+
+    @abstractmethod
+    async def claim_batch(self, limit: int) -> list[OutboxMessage]:
+        """
+        Bloquea y devuelve, en orden, hasta `limit` mensajes disponibles.
+
+        Los mensajes que otro relay tiene bloqueados se saltan, así que varios relays pueden
+        drenar el outbox a la vez. El bloqueo dura hasta el final de la transacción.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_documents(self, note_ids: Sequence[uuid.UUID]) -> list[NoteIndexDocument]:
+        """Estado actual de las notas indicadas que aún existen."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def complete(self, message_ids: Sequence[int]) -> None:
+        """Elimina los mensajes entregados."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def retry_later(
+        self, message_ids: Sequence[int], error: str, available_at: datetime
+    ) -> None:
+        """Cuenta un intento fallido y aplaza los mensajes hasta `available_at`."""
+        raise NotImplementedError
+
+
+class INoteIndexSink(ABC):
+    """
+    Destino de las entregas del outbox (el almacén vectorial).
+
+    La entrega es al menos una vez y dos relays pueden entregar la misma nota en cualquier
+    orden, así que `apply` debe ser idempotente y respetar las versiones: ignora documentos
+    más antiguos que el que tiene y los de notas borradas en una versión igual o posterior.
+    """
+
+    @abstractmethod
+    async def apply(self, batch: NoteIndexBatch) -> None:
+        """Aplica un lote de altas/actualizaciones y borrados. Si falla, se reintenta entero."""
+        raise NotImplementedError
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from uuid import UUID
 
 from src.pkm_app.core.application.dtos.project_dto import (
@@ -22,6 +23,16 @@ class IProjectRepository(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    async def get_many_by_ids(
+        self, project_ids: Sequence[UUID], user_id: str
+    ) -> dict[UUID, ProjectSchema]:
+        """
+        Obtiene varios proyectos del usuario en una sola consulta, indexados por ID.
+        Los IDs que no se encuentran o no pertenecen al usuario no aparecen en el resultado.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def list_by_user(
         self, user_id: str, skip: int = 0, limit: int = 100
@@ -41,12 +52,18 @@ class IProjectRepository(ABC):
 
     @abstractmethod
     async def update(
-        self, project_id: UUID, project_in: ProjectUpdate, user_id: str
+        self,
+        project_id: UUID,
+        project_in: ProjectUpdate,
+        user_id: str,
+        expected_version: int | None = None,
     ) -> ProjectSchema | None:
         """
         Actualiza un proyecto existente perteneciente a un usuario específico.
         'project_in' es un esquema Pydantic con los campos a actualizar.
         Devuelve el proyecto actualizado o None si no se encuentra o no pertenece al usuario.
+        Lanza ConcurrencyError si la versión no coincide con 'expected_version' o si otra
+        operación modifica el proyecto a la vez.
         """
         raise NotImplementedError
 
@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from uuid import UUID
 
+from src.pkm_app.core.application.dtos.metadata_filter_dto import MetadataFilter
 from src.pkm_app.core.application.dtos.source_dto import SourceCreate, SourceSchema, SourceUpdate
 
 
@@ -18,6 +20,16 @@ class ISourceRepository(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    async def get_many_by_ids(
+        self, source_ids: Sequence[UUID], user_id: str
+    ) -> dict[UUID, SourceSchema]:
+        """
+        Obtiene varias fuentes del usuario en una sola consulta, indexadas por ID.
+        Los IDs que no se encuentran o no pertenecen al usuario no aparecen en el resultado.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def list_by_user(
         self, user_id: str, skip: int = 0, limit: int = 100
@@ -37,12 +49,17 @@ class ISourceRepository(ABC):
 
     @abstractmethod
     async def update(
-        self, source_id: UUID, source_in: SourceUpdate, user_id: str
+        self,
+        source_id: UUID,
+        source_in: SourceUpdate,
+        user_id: str,
+        expected_version: int | None = None,
     ) -> SourceSchema | None:
         """
         Actualiza una fuente existente perteneciente a un usuario específico.
         'source_in' es un esquema Pydantic con los campos a actualizar.
         Devuelve la fuente actualizada o None si no se encuentra o no pertenece al usuario.
+        Lanza ConcurrencyError ante un conflicto de versión (ver 'expected_version').
         """
         raise NotImplementedError
 
@@ -81,3 +98,17 @@ class ISourceRepository(ABC):
         Retorna una lista de fuentes cuyo título coincide parcialmente con la consulta.
         """
         raise NotImplementedError
+
+    @abstractmethod
+    async def search_by_metadata(
+        self,
+        user_id: str,
+        metadata_filter: MetadataFilter,
+        skip: int = 0,
+        limit: int = 20,
+    ) -> list[SourceSchema]:
+        """
+        Busca fuentes cuyo 'link_metadata' cumple el filtro indicado
+        (contención, existencia de claves e igualdad por ruta), con paginación.
+        """
+        raise NotImplementedError
@@ -1,7 +1,10 @@
 from abc import abstractmethod
 from typing import Any, Protocol, TypeVar, runtime_checkable
 
+from .assistant_context_interface import IAssistantContextRepository
+from .change_feed_interface import IChangeFeedRepository
 from .keyword_interface import IKeywordRepository
+from .near_duplicate_interface import INearDuplicateRepository
 
 # Importar las interfaces de repositorio
 from .note_interface import INoteRepository
@@ -28,6 +31,9 @@ class IUnitOfWork(Protocol):
     projects: IProjectRepository
     sources: ISourceRepository
     note_links: INoteLinkRepository
+    changes: IChangeFeedRepository
+    near_duplicates: INearDuplicateRepository
+    assistant_context: IAssistantContextRepository
 
     @abstractmethod
     async def __aenter__(self) -> "IUnitOfWork":
@@ -48,3 +54,16 @@ class IUnitOfWork(Protocol):
     async def rollback(self) -> None:
         """Revierte las transacciones pendientes."""
         ...
+
+
+@runtime_checkable
+class IReadOnlyUnitOfWork(IUnitOfWork, Protocol):
+    """
+    Unit of Work para casos de uso que solo leen (get/list/search).
+
+    Expone los mismos repositorios, pero no gestiona transacciones: `commit()` no confirma
+    nada y `rollback()` solo libera la conexión. Los repositorios solo deben usarse para
+    consultas; las escrituras fallan en la implementación de base de datos.
+    """
+
+    pass
@@ -0,0 +1,56 @@
+import uuid
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+
+import numpy as np
+
+from src.pkm_app.core.application.dtos.vector_index_dto import (
+    VectorBatch,
+    VectorFilter,
+    VectorSearchHit,
+)
+
+
+class IVectorIndex(ABC):
+    """
+    Interfaz abstracta de un índice vectorial de similitud coseno con payload filtrable.
+
+    Todas las implementaciones deben comportarse igual: un alta con un id existente sustituye
+    vector y payload, borrar un id inexistente no falla y las búsquedas filtran por usuario
+    (siempre), proyecto y tipo dentro del índice, antes de elegir los `limit` más cercanos,
+    no descartando resultados después.
+    """
+
+    @property
+    @abstractmethod
+    def dimension(self) -> int:
+        """Dimensión de los vectores del índice."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def upsert(self, batch: VectorBatch) -> None:
+        """
+        Da de alta o sustituye los vectores del lote. Al volver, ya son visibles en las
+        búsquedas. Lanza ValueError si la dimensión no coincide con la del índice.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete(self, ids: Sequence[uuid.UUID]) -> None:
+        """Elimina los vectores indicados; los que no existen se ignoran."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def search(
+        self, vector: np.ndarray | Sequence[float], filter: VectorFilter, limit: int = 10
+    ) -> list[VectorSearchHit]:
+        """
+        Devuelve hasta `limit` vectores que cumplen `filter`, de mayor a menor similitud
+        coseno con `vector`.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def count(self, filter: VectorFilter) -> int:
+        """Número de vectores que cumplen `filter`."""
+        raise NotImplementedError
@@ -0,0 +1,112 @@
+"""
+Contexto de la operación (caso de uso) en curso.
+
+Los casos de uso marcan su método `execute` con `@traced_use_case`. Mientras se ejecuta,
+`current_operation()` devuelve la operación en curso, también desde las tareas asyncio que
+se creen dentro (el contexto viaja en un `ContextVar`).
+
+La infraestructura se suscribe con `add_operation_observer` para acumular sus datos en
+`Operation.data` (ej. sentencias SQL) y publicarlos al terminar la operación. Este módulo no
+conoce a los observadores ni depende de ninguna tecnología concreta.
+"""
+
+import functools
+import logging
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, ParamSpec, Protocol, TypeVar
+
+logger = logging.getLogger(__name__)
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+@dataclass(eq=False)
+class Operation:
+    """Una ejecución de un caso de uso (u otra operación con nombre)."""
+
+    name: str
+    parent: "Operation | None" = None
+    # "use_case" para los `execute` de los casos de uso
+    kind: str = "operation"
+    started_at: float = field(default_factory=time.perf_counter)
+    # Espacio para los observadores, cada uno bajo su propia clave
+    data: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started_at
+
+    def chain(self) -> Iterator["Operation"]:
+        """Esta operación y las que la contienen, de dentro hacia fuera."""
+        operation: Operation | None = self
+        while operation is not None:
+            yield operation
+            operation = operation.parent
+
+
+class OperationObserver(Protocol):
+    def operation_started(self, operation: Operation) -> None: ...
+
+    def operation_finished(self, operation: Operation, error: BaseException | None) -> None: ...
+
+
+_current: ContextVar[Operation | None] = ContextVar("current_operation", default=None)
+_observers: list[OperationObserver] = []
+
+
+def current_operation() -> Operation | None:
+    return _current.get()
+
+
+def add_operation_observer(observer: OperationObserver) -> None:
+    if observer not in _observers:
+        _observers.append(observer)
+
+
+def remove_operation_observer(observer: OperationObserver) -> None:
+    if observer in _observers:
+        _observers.remove(observer)
+
+
+def _notify(method: str, *args: Any) -> None:
+    # Un observador que falla no debe romper el caso de uso
+    for observer in list(_observers):
+        try:
+            getattr(observer, method)(*args)
+        except Exception:
+            logger.exception("Error en el observador de operaciones %r", observer)
+
+
+@contextmanager
+def operation_scope(name: str, kind: str = "operation") -> Iterator[Operation]:
+    """Ejecuta el bloque como la operación `name` (anidada en la actual, si la hay)."""
+    operation = Operation(name=name, parent=_current.get(), kind=kind)
+    token = _current.set(operation)
+    _notify("operation_started", operation)
+    error: BaseException | None = None
+    try:
+        yield operation
+    except BaseException as exc:
+        error = exc
+        raise
+    finally:
+        _current.reset(token)
+        _notify("operation_finished", operation, error)
+
+
+def traced_use_case(
+    func: Callable[P, Awaitable[R]],
+) -> Callable[P, Awaitable[R]]:
+    """Decorador para `execute`: la operación se llama como la clase del caso de uso."""
+
+    @functools.wraps(func)
+    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        with operation_scope(type(args[0]).__name__, kind="use_case"):
+            return await func(*args, **kwargs)
+
+    return wrapper
@@ -0,0 +1,5 @@
+# Casos de uso del contexto que se entrega al asistente.
+
+__all__ = [
+    "AssembleContextUseCase",
+]
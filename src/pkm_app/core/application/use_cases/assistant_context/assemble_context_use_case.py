@@ -0,0 +1,167 @@
+import logging
+import uuid
+from collections import OrderedDict
+from collections.abc import Hashable
+from datetime import UTC, datetime
+
+from src.pkm_app.core.application import context_packing
+from src.pkm_app.core.application.dtos import AssembledContext
+from src.pkm_app.core.application.interfaces.unit_of_work_interface import IUnitOfWork
+from src.pkm_app.core.application.operations import traced_use_case
+from src.pkm_app.core.application.versioning import scope_version
+from src.pkm_app.core.domain.errors import PermissionDeniedError, RepositoryError
+
+logger = logging.getLogger(__name__)
+
+
+class ContextMemo:
+    """
+    LRU de contextos ya armados, compartido por las peticiones del proceso. La clave lleva
+    la versión de los datos del usuario, así que una entrada nunca se invalida: deja de
+    pedirse y acaba saliendo por antigüedad.
+    """
+
+    DEFAULT_SIZE = 1024
+
+    def __init__(self, maxsize: int = DEFAULT_SIZE):
+        if maxsize < 0:
+            raise ValueError("El tamaño de la memoria de contextos no puede ser negativo.")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, AssembledContext] = OrderedDict()
+
+    def get(self, key: Hashable) -> AssembledContext | None:
+        context = self._entries.get(key)
+        if context is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return context
+
+    def put(self, key: Hashable, context: AssembledContext) -> None:
+        if self.maxsize == 0:
+            return
+        self._entries[key] = context
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class AssembleContextUseCase:
+    """
+    Contexto para el asistente: el `learned_context` del perfil, las descripciones de los
+    proyectos y extractos de las notas más relevantes para la consulta, empaquetados en un
+    presupuesto de tokens (ver `core/application/context_packing.py`).
+
+    La versión de los datos es el cursor del feed de cambios del usuario, que se asigna en
+    orden de commit (ver `change_feed_repository.py`): una escritura que confirma tarde
+    también lo mueve, cosa que no garantiza `changed_at` (now() al empezar la transacción).
+    Obtenerlo numera los cambios pendientes, así que el caso de uso escribe y confirma.
+
+    Sin la memoria, después de la versión se leen las candidatas (sin contenido) y los
+    extractos que caben. Con ella, si los datos no han cambiado, solo la versión.
+    """
+
+    DEFAULT_MAX_TOKENS = 2000
+    MAX_MAX_TOKENS = 32000
+    # Candidatas de cada rama: keywords de la consulta, proyecto y recientes
+    CANDIDATE_LIMIT = 200
+
+    def __init__(self, unit_of_work: IUnitOfWork, memo: ContextMemo | None = None):
+        self.unit_of_work = unit_of_work
+        self.memo = memo
+
+    @traced_use_case
+    async def execute(
+        self,
+        user_id: str,
+        query: str = "",
+        max_tokens: int | None = None,
+        project_id: uuid.UUID | None = None,
+    ) -> AssembledContext:
+        """
+        Arma el contexto del usuario para una consulta.
+
+        Args:
+            user_id: ID del usuario propietario de los datos.
+            query: Texto de la consulta; sus palabras se buscan en las keywords y títulos.
+            max_tokens: Presupuesto del contexto, en tokens estimados.
+            project_id: Proyecto en el que se centra la consulta, si lo hay.
+
+        Returns:
+            El texto del contexto, sus secciones y la versión de los datos usada.
+
+        Raises:
+            PermissionDeniedError: Si no se proporciona el user_id.
+            RepositoryError: Si ocurre un error en la capa de persistencia.
+        """
+        if not user_id:
+            raise PermissionDeniedError(
+                "Se requiere ID de usuario para armar el contexto del asistente.",
+                context={"operation": "assemble_context"},
+            )
+        if max_tokens is None or max_tokens <= 0:
+            max_tokens = self.DEFAULT_MAX_TOKENS
+        max_tokens = min(max_tokens, self.MAX_MAX_TOKENS)
+        words = context_packing.query_words(query)
+
+        async with self.unit_of_work as uow:
+            try:
+                # Con cursor 0 el feed solo numera los pendientes y devuelve el cursor actual
+                # (nunca baja: tiene en cuenta las lápidas purgadas)
+                feed = await uow.changes.get_changes_since(user_id=user_id, cursor=0, limit=1)
+                state = await uow.assistant_context.get_state(user_id)
+                # La numeración se confirma, como en la lectura del feed: si se deshiciera,
+                # los mismos cambios tendrían otro cursor en la siguiente petición
+                await uow.commit()
+                learned_context = context_packing.render_learned_context(state.learned_context)
+                version = scope_version(
+                    f"assistant_context:{user_id}:{learned_context}", None, feed.next_cursor
+                )
+                key = (user_id, tuple(words), project_id, max_tokens, version)
+                # Un cambio confirmado que una escritura en curso tiene bloqueado se queda sin
+                # numerar y el cursor aún no lo cubre: se arma sin la memoria
+                memo = None if state.pending_changes else self.memo
+                if memo is not None and (context := memo.get(key)) is not None:
+                    return context
+
+                candidates = await uow.assistant_context.find_candidates(
+                    user_id,
+                    context_packing.query_terms(query),
+                    project_id,
+                    self.CANDIDATE_LIMIT,
+                )
+                # La edad se mide desde el último cambio del usuario y no desde ahora: el
+                # resultado depende solo de los datos, como la clave de la memoria
+                now = state.last_changed_at or datetime.now(UTC)
+                ranked = context_packing.rank(candidates, words, project_id, now)
+                sections = context_packing.plan(ranked, learned_context, project_id, max_tokens)
+                excerpts = await uow.assistant_context.get_excerpts(
+                    user_id,
+                    {s.id: s.chars for s in sections if s.kind == "note"},  # type: ignore[misc]
+                    {s.id: s.chars for s in sections if s.kind == "project"},  # type: ignore[misc]
+                )
+            except Exception as e:
+                await uow.rollback()
+                logger.exception(
+                    "Error inesperado al armar el contexto del asistente",
+                    extra={"user_id": user_id, "operation": "assemble_context"},
+                )
+                raise RepositoryError(
+                    f"Error inesperado en el repositorio al armar el contexto: {str(e)}",
+                    operation="assemble_context",
+                    repository_type="AssistantContextRepository",
+                    context={"project_id": str(project_id) if project_id else None},
+                ) from e
+
+        context = context_packing.assemble(
+            sections, learned_context, excerpts, max_tokens, version
+        )
+        if memo is not None:
+            memo.put(key, context)
+        return context
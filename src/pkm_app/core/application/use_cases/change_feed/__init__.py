@@ -0,0 +1,6 @@
+# Casos de uso del feed de cambios (sincronización incremental de clientes).
+
+__all__ = [
+    "GetChangesSinceUseCase",
+    "PurgeChangeTombstonesUseCase",
+]
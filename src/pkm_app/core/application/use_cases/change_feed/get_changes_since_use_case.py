@@ -0,0 +1,86 @@
+import logging
+
+from src.pkm_app.core.application.dtos import ChangeFeedPage
+from src.pkm_app.core.application.interfaces.unit_of_work_interface import IUnitOfWork
+from src.pkm_app.core.application.operations import traced_use_case
+from src.pkm_app.core.domain.errors import PermissionDeniedError, RepositoryError, ValidationError
+
+logger = logging.getLogger(__name__)
+
+
+class GetChangesSinceUseCase:
+    """
+    Cambios de un usuario posteriores a un cursor, para que un cliente sincronice en
+    O(cambios) en lugar de volver a listar todas sus entidades.
+    """
+
+    DEFAULT_LIMIT = 500
+    MAX_LIMIT = 1000
+
+    def __init__(self, unit_of_work: IUnitOfWork):
+        self.unit_of_work = unit_of_work
+
+    @traced_use_case
+    async def execute(
+        self, user_id: str, cursor: int = 0, limit: int | None = None
+    ) -> ChangeFeedPage:
+        """
+        Devuelve una página del feed de cambios del usuario.
+
+        Args:
+            user_id: ID del usuario que sincroniza.
+            cursor: `next_cursor` de la página anterior, o 0 para obtener el cursor actual
+                antes de la carga inicial.
+            limit: Número máximo de cambios a devolver.
+
+        Returns:
+            La página de cambios, con el cursor para la siguiente llamada.
+
+        Raises:
+            PermissionDeniedError: Si no se proporciona el user_id.
+            ValidationError: Si el cursor es negativo.
+            RepositoryError: Si ocurre un error en la capa de persistencia.
+        """
+        if not user_id:
+            raise PermissionDeniedError(
+                "Se requiere ID de usuario para obtener cambios.",
+                context={"operation": "get_changes_since"},
+            )
+        if cursor < 0:
+            raise ValidationError(
+                "El cursor no puede ser negativo.",
+                context={"operation": "get_changes_since", "cursor": cursor},
+            )
+        if limit is None or limit <= 0:
+            limit = self.DEFAULT_LIMIT
+        limit = min(limit, self.MAX_LIMIT)
+
+        async with self.unit_of_work as uow:
+            try:
+                page = await uow.changes.get_changes_since(
+                    user_id=user_id, cursor=cursor, limit=limit
+                )
+                # La lectura numera los cambios pendientes: se confirma para que los
+                # cursores entregados sigan siendo válidos
+                await uow.commit()
+            except Exception as e:
+                await uow.rollback()
+                logger.exception(
+                    "Error inesperado al obtener cambios desde %s",
+                    cursor,
+                    extra={"user_id": user_id, "operation": "get_changes_since"},
+                )
+                raise RepositoryError(
+                    f"Error inesperado en el repositorio al obtener cambios: {str(e)}",
+                    operation="get_changes_since",
+                    repository_type="ChangeFeedRepository",
+                    context={"cursor": cursor},
+                ) from e
+
+        if page.reset_required:
+            logger.info(
+                "Cursor %s anterior a lápidas purgadas: el cliente debe resincronizar",
+                cursor,
+                extra={"user_id": user_id, "operation": "get_changes_since"},
+            )
+        return page
@@ -0,0 +1,70 @@
+import logging
+from datetime import UTC, datetime, timedelta
+
+from src.pkm_app.core.application.interfaces.unit_of_work_interface import IUnitOfWork
+from src.pkm_app.core.application.operations import traced_use_case
+from src.pkm_app.core.domain.errors import RepositoryError, ValidationError
+
+logger = logging.getLogger(__name__)
+
+
+class PurgeChangeTombstonesUseCase:
+    """
+    Compactación del feed de cambios: elimina las lápidas de borrados más antiguas que la
+    retención. Pensado para ejecutarse periódicamente (cron o tarea programada).
+    """
+
+    DEFAULT_RETENTION = timedelta(days=30)
+
+    def __init__(self, unit_of_work: IUnitOfWork):
+        self.unit_of_work = unit_of_work
+
+    @traced_use_case
+    async def execute(self, retention: timedelta | None = None) -> int:
+        """
+        Elimina las lápidas ya entregadas con más antigüedad que `retention`.
+
+        Los clientes cuyo cursor sea anterior a una lápida eliminada recibirán
+        `reset_required` en su siguiente sincronización.
+
+        Args:
+            retention: Antigüedad mínima de las lápidas a eliminar (30 días por defecto).
+
+        Returns:
+            El número de lápidas eliminadas.
+
+        Raises:
+            ValidationError: Si la retención es negativa.
+            RepositoryError: Si ocurre un error en la capa de persistencia.
+        """
+        retention = self.DEFAULT_RETENTION if retention is None else retention
+        if retention < timedelta(0):
+            raise ValidationError(
+                "La retención de lápidas no puede ser negativa.",
+                context={"operation": "purge_change_tombstones"},
+            )
+        older_than = datetime.now(UTC) - retention
+
+        async with self.unit_of_work as uow:
+            try:
+                purged = await uow.changes.purge_tombstones(older_than=older_than)
+                await uow.commit()
+            except Exception as e:
+                await uow.rollback()
+                logger.exception(
+                    "Error inesperado al purgar lápidas del feed de cambios",
+                    extra={"operation": "purge_change_tombstones"},
+                )
+                raise RepositoryError(
+                    f"Error inesperado en el repositorio al purgar lápidas: {str(e)}",
+                    operation="purge_change_tombstones",
+                    repository_type="ChangeFeedRepository",
+                ) from e
+
+        logger.info(
+            "Purgadas %s lápidas del feed de cambios anteriores a %s",
+            purged,
+            older_than.isoformat(),
+            extra={"operation": "purge_change_tombstones"},
+        )
+        return purged
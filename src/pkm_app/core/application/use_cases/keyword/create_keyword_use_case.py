@@ -5,6 +5,7 @@ from src.pkm_app.core.application.dtos import KeywordCreate, KeywordSchema
 from src.pkm_app.core.application.interfaces.unit_of_work_interface import (
     IUnitOfWork,
 )
+from src.pkm_app.core.application.operations import traced_use_case
 from src.pkm_app.core.domain.errors import PermissionDeniedError, RepositoryError, ValidationError
 
 # Configurar logger para este caso de uso
@@ -15,6 +16,7 @@ class CreateKeywordUseCase:
     def __init__(self, unit_of_work: IUnitOfWork):
         self.unit_of_work = unit_of_work
 
+    @traced_use_case
     async def execute(self, keyword_in: KeywordCreate, user_id: str) -> KeywordSchema:
         """
         Crea una nueva keyword.
@@ -64,7 +66,8 @@ class CreateKeywordUseCase:
                 await uow.commit()
 
                 logger.info(
-                    f"Keyword creada exitosamente con ID {created_keyword_schema.id}",
+                    "Keyword creada exitosamente con ID %s",
+                    created_keyword_schema.id,
                     extra={
                         "user_id": user_id,
                         "keyword_id": str(created_keyword_schema.id),
@@ -4,6 +4,7 @@ import uuid
 from src.pkm_app.core.application.interfaces.unit_of_work_interface import (
     IUnitOfWork,
 )
+from src.pkm_app.core.application.operations import traced_use_case
 from src.pkm_app.core.domain.errors import (
     BusinessRuleViolationError,  # Importar el nuevo error
     EntityNotFoundError,
@@ -20,6 +21,7 @@ class DeleteKeywordUseCase:
     def __init__(self, unit_of_work: IUnitOfWork):
         self.unit_of_work = unit_of_work
 
+    @traced_use_case
     async def execute(self, keyword_id: uuid.UUID, user_id: str) -> bool:
         """
         Elimina una keyword.
@@ -127,7 +129,8 @@ class DeleteKeywordUseCase:
                 await uow.commit()
 
                 logger.info(
-                    f"Keyword {keyword_id} eliminada exitosamente",
+                    "Keyword %s eliminada exitosamente",
+                    keyword_id,
                     extra={
                         "user_id": user_id,
                         "keyword_id": str(keyword_id),
@@ -3,8 +3,9 @@ import uuid
 
 from src.pkm_app.core.application.dtos import KeywordSchema
 from src.pkm_app.core.application.interfaces.unit_of_work_interface import (
-    IUnitOfWork,
+    IReadOnlyUnitOfWork,
 )
+from src.pkm_app.core.application.operations import traced_use_case
 from src.pkm_app.core.domain.errors import (
     EntityNotFoundError,
     PermissionDeniedError,
@@ -17,9 +18,10 @@ logger = logging.getLogger(__name__)
 
 
 class GetKeywordUseCase:
-    def __init__(self, unit_of_work: IUnitOfWork):
+    def __init__(self, unit_of_work: IReadOnlyUnitOfWork):
         self.unit_of_work = unit_of_work
 
+    @traced_use_case
     async def execute(self, keyword_id: uuid.UUID, user_id: str) -> KeywordSchema:
         """
         Obtiene los detalles de una keyword específica.
@@ -100,7 +102,8 @@ class GetKeywordUseCase:
                     )
 
                 logger.info(
-                    f"Keyword {keyword.id} obtenida exitosamente",
+                    "Keyword %s obtenida exitosamente",
+                    keyword.id,
                     extra={
                         "user_id": user_id,
                         "keyword_id": str(keyword.id),
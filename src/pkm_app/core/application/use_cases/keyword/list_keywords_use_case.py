@@ -3,8 +3,9 @@ from typing import Optional
 
 from src.pkm_app.core.application.dtos import KeywordSchema
 from src.pkm_app.core.application.interfaces.unit_of_work_interface import (
-    IUnitOfWork,
+    IReadOnlyUnitOfWork,
 )
+from src.pkm_app.core.application.operations import traced_use_case
 from src.pkm_app.core.domain.errors import PermissionDeniedError, RepositoryError, ValidationError
 
 # Configurar logger para este caso de uso
@@ -16,7 +17,7 @@ class ListKeywordsUseCase:
     DEFAULT_LIMIT = 50
     MAX_LIMIT = 100
 
-    def __init__(self, unit_of_work: IUnitOfWork):
+    def __init__(self, unit_of_work: IReadOnlyUnitOfWork):
         self.unit_of_work = unit_of_work
 
     def _validate_pagination(self, skip: int, limit: int) -> tuple[int, int]:
@@ -35,6 +36,7 @@ class ListKeywordsUseCase:
             limit = self.MAX_LIMIT
         return skip, limit
 
+    @traced_use_case
     async def execute(
         self, user_id: str, skip: int | None = None, limit: int | None = None
     ) -> list[KeywordSchema]:
@@ -86,7 +88,9 @@ class ListKeywordsUseCase:
                 )
 
                 logger.info(
-                    f"Listadas {len(keywords)} keywords para usuario {user_id}",
+                    "Listadas %s keywords para usuario %s",
+                    len(keywords),
+                    user_id,
                     extra={
                         "user_id": user_id,
                         "count": len(keywords),
@@ -5,7 +5,9 @@ from src.pkm_app.core.application.dtos import KeywordSchema, KeywordUpdate
 from src.pkm_app.core.application.interfaces.unit_of_work_interface import (
     IUnitOfWork,
 )
+from src.pkm_app.core.application.operations import traced_use_case
 from src.pkm_app.core.domain.errors import (
+    ConcurrencyError,
     EntityNotFoundError,
     PermissionDeniedError,
     RepositoryError,
@@ -20,8 +22,13 @@ class UpdateKeywordUseCase:
     def __init__(self, unit_of_work: IUnitOfWork):
         self.unit_of_work = unit_of_work
 
+    @traced_use_case
     async def execute(
-        self, keyword_id: uuid.UUID, keyword_in: KeywordUpdate, user_id: str
+        self,
+        keyword_id: uuid.UUID,
+        keyword_in: KeywordUpdate,
+        user_id: str,
+        expected_version: int | None = None,
     ) -> KeywordSchema:
         """
         Actualiza una keyword existente.
@@ -30,12 +37,14 @@ class UpdateKeywordUseCase:
             keyword_id: ID de la keyword a actualizar.
             keyword_in: Datos para actualizar la keyword.
             user_id: ID del usuario que actualiza la keyword.
+            expected_version: Versión de la keyword que leyó el cliente (opcional).
 
         Returns:
             La keyword actualizada.
 
         Raises:
             EntityNotFoundError: Si la keyword no se encuentra o no pertenece al usuario.
+            ConcurrencyError: Si la keyword ya no está en `expected_version` o cambia a la vez.
             ValidationError: Si los datos de entrada son inválidos.
             PermissionDeniedError: Si no se proporciona el user_id o el usuario no tiene permisos.
             RepositoryError: Si ocurre un error en la capa de persistencia.
@@ -111,7 +120,9 @@ class UpdateKeywordUseCase:
 
                 # El método update del repositorio se encargará de la lógica de actualización
                 # y de verificar si el usuario tiene permiso (si es necesario, aunque get_by_id ya lo hizo)
-                updated_keyword = await uow.keywords.update(keyword_id, keyword_in, user_id)
+                updated_keyword = await uow.keywords.update(
+                    keyword_id, keyword_in, user_id, expected_version=expected_version
+                )
                 # El repositorio debería lanzar EntityNotFoundError si no la encuentra durante el update,
                 # o PermissionDeniedError si el user_id no coincide (aunque ya lo validamos antes).
                 # Si devuelve None, también lo manejamos como no encontrado.
@@ -126,7 +137,8 @@ class UpdateKeywordUseCase:
                 await uow.commit()
 
                 logger.info(
-                    f"Keyword {updated_keyword.id} actualizada exitosamente",
+                    "Keyword %s actualizada exitosamente",
+                    updated_keyword.id,
                     extra={
                         "user_id": user_id,
                         "keyword_id": str(updated_keyword.id),
@@ -147,6 +159,19 @@ class UpdateKeywordUseCase:
                 e.context = e.context or {}
                 e.context.update({"operation": "update_keyword"})
                 raise
+            except ConcurrencyError as e:
+                await uow.rollback()
+                logger.warning(
+                    f"Conflicto de versión al actualizar keyword: {str(e)}",
+                    extra={
+                        "user_id": user_id,
+                        "keyword_id": str(keyword_id),
+                        "operation": "update_keyword",
+                        "expected_version": expected_version,
+                    },
+                )
+                e.context.update({"operation": "update_keyword"})
+                raise
             except PermissionDeniedError as e:  # Si el repositorio la lanza por alguna razón
                 await uow.rollback()
                 logger.warning(
@@ -0,0 +1,6 @@
+# Casos de uso de detección de notas casi duplicadas (MinHash + LSH).
+
+__all__ = [
+    "BackfillNoteMinHashUseCase",
+    "FindNearDuplicatesUseCase",
+]
@@ -0,0 +1,78 @@
+import logging
+from collections import defaultdict
+
+from src.pkm_app.core.application.interfaces.unit_of_work_interface import IUnitOfWork
+from src.pkm_app.core.application.minhash import minhash_signature
+from src.pkm_app.core.application.operations import traced_use_case
+from src.pkm_app.core.domain.errors import RepositoryError, ValidationError
+
+logger = logging.getLogger(__name__)
+
+
+class BackfillNoteMinHashUseCase:
+    """
+    Calcula la firma MinHash de las notas que aún no la tienen (las anteriores a la
+    migración `add_note_minhash`). Las notas nuevas o editadas ya la guardan al escribirse;
+    pensado para ejecutarse una vez tras desplegar, o periódicamente si hay escrituras
+    fuera de los casos de uso.
+    """
+
+    DEFAULT_BATCH_SIZE = 1000
+
+    def __init__(self, unit_of_work: IUnitOfWork):
+        self.unit_of_work = unit_of_work
+
+    @traced_use_case
+    async def execute(self, batch_size: int | None = None) -> int:
+        """
+        Indexa todas las notas pendientes, confirmando cada lote por separado.
+
+        Args:
+            batch_size: Notas por lote (y por transacción).
+
+        Returns:
+            El número de notas indexadas.
+
+        Raises:
+            ValidationError: Si el tamaño de lote no es positivo.
+            RepositoryError: Si ocurre un error en la capa de persistencia; los lotes ya
+                confirmados se conservan.
+        """
+        batch_size = self.DEFAULT_BATCH_SIZE if batch_size is None else batch_size
+        if batch_size <= 0:
+            raise ValidationError(
+                "El tamaño de lote debe ser positivo.",
+                context={"operation": "backfill_note_minhash", "batch_size": batch_size},
+            )
+
+        indexed = 0
+        async with self.unit_of_work as uow:
+            try:
+                while notes := await uow.near_duplicates.list_unindexed(batch_size):
+                    by_user: dict[str, dict] = defaultdict(dict)
+                    for note in notes:
+                        by_user[note.user_id][note.note_id] = minhash_signature(note.content)
+                    for user_id, signatures in by_user.items():
+                        await uow.near_duplicates.save_signatures(user_id, signatures)
+                    await uow.commit()
+                    indexed += len(notes)
+            except Exception as e:
+                await uow.rollback()
+                logger.exception(
+                    "Error inesperado al indexar firmas MinHash tras %s notas",
+                    indexed,
+                    extra={"operation": "backfill_note_minhash"},
+                )
+                raise RepositoryError(
+                    f"Error inesperado en el repositorio al indexar firmas MinHash: {str(e)}",
+                    operation="backfill_note_minhash",
+                    repository_type="NearDuplicateRepository",
+                    context={"indexed": indexed},
+                ) from e
+
+        logger.info(
+            "Indexadas las firmas MinHash de %s notas",
+            indexed,
+            extra={"operation": "backfill_note_minhash"},
+        )
+        return indexed
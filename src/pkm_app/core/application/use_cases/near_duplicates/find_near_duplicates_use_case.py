@@ -0,0 +1,183 @@
+import logging
+import uuid
+from collections import Counter
+from collections.abc import Sequence
+
+import numpy as np
+
+from src.pkm_app.core.application.dtos import NearDuplicateCluster, NearDuplicateNote
+from src.pkm_app.core.application.interfaces.unit_of_work_interface import IReadOnlyUnitOfWork
+from src.pkm_app.core.application.minhash import estimated_jaccard
+from src.pkm_app.core.application.operations import traced_use_case
+from src.pkm_app.core.domain.errors import PermissionDeniedError, RepositoryError, ValidationError
+
+logger = logging.getLogger(__name__)
+
+
+def _cluster(
+    anchor_id: uuid.UUID, members: Sequence[uuid.UUID], signatures: dict[uuid.UUID, np.ndarray]
+) -> NearDuplicateCluster:
+    others = [note_id for note_id in members if note_id != anchor_id]
+    similarities = estimated_jaccard(
+        signatures[anchor_id], np.stack([signatures[note_id] for note_id in others])
+    )
+    notes = [
+        NearDuplicateNote(note_id=note_id, similarity=float(similarity))
+        for note_id, similarity in zip(others, similarities.tolist())
+    ]
+    notes.sort(key=lambda note: (-note.similarity, str(note.note_id)))
+    return NearDuplicateCluster(anchor_id=anchor_id, notes=notes)
+
+
+def _similar_pairs(
+    buckets: Sequence[Sequence[uuid.UUID]],
+    signatures: dict[uuid.UUID, np.ndarray],
+    threshold: float,
+) -> set[tuple[uuid.UUID, uuid.UUID]]:
+    """Parejas de cada cubo LSH cuya similitud estimada alcanza el umbral."""
+    pairs: set[tuple[uuid.UUID, uuid.UUID]] = set()
+    for bucket in buckets:
+        ids = sorted(note_id for note_id in bucket if note_id in signatures)
+        if len(ids) < 2:
+            continue
+        matrix = np.stack([signatures[note_id] for note_id in ids])
+        similar = (matrix[:, None, :] == matrix[None, :, :]).mean(axis=2) >= threshold
+        for i, j in zip(*np.nonzero(np.triu(similar, k=1))):
+            pairs.add((ids[i], ids[j]))
+    return pairs
+
+
+def _components(pairs: set[tuple[uuid.UUID, uuid.UUID]]) -> list[list[uuid.UUID]]:
+    parent: dict[uuid.UUID, uuid.UUID] = {}
+
+    def find(note_id: uuid.UUID) -> uuid.UUID:
+        root = parent.setdefault(note_id, note_id)
+        while root != parent[root]:
+            parent[root] = parent[parent[root]]
+            root = parent[root]
+        return root
+
+    for a, b in pairs:
+        parent[find(a)] = find(b)
+    groups: dict[uuid.UUID, list[uuid.UUID]] = {}
+    for note_id in parent:
+        groups.setdefault(find(note_id), []).append(note_id)
+    return list(groups.values())
+
+
+class FindNearDuplicatesUseCase:
+    """
+    Notas casi duplicadas de un usuario (importaciones, recortes web repetidos), por la
+    similitud de Jaccard de sus shingles estimada con MinHash.
+
+    Los candidatos salen del índice LSH: una nota solo se compara con las que comparten
+    alguna banda de su firma, nunca con todas las demás.
+    """
+
+    DEFAULT_THRESHOLD = 0.8
+    DEFAULT_LIMIT = 50
+    MAX_LIMIT = 500
+    # Un cubo LSH enorme (p. ej. una plantilla vacía repetida) se trunca: compararlo entero
+    # sería cuadrático
+    MAX_BUCKET_SIZE = 100
+    MAX_CANDIDATES = 1000
+
+    def __init__(self, unit_of_work: IReadOnlyUnitOfWork):
+        self.unit_of_work = unit_of_work
+
+    @traced_use_case
+    async def execute(
+        self,
+        user_id: str,
+        note_id: uuid.UUID | None = None,
+        threshold: float | None = None,
+        limit: int | None = None,
+    ) -> list[NearDuplicateCluster]:
+        """
+        Devuelve los grupos de notas casi duplicadas del usuario.
+
+        Args:
+            user_id: ID del usuario propietario de las notas.
+            note_id: Si se indica, solo el grupo de esta nota (vacío si no tiene duplicados).
+            threshold: Similitud estimada mínima (0-1] entre dos notas para agruparlas.
+            limit: Número máximo de grupos a devolver, los mayores primero.
+
+        Returns:
+            Los grupos; cada uno con su nota de referencia y la similitud de las demás con ella.
+
+        Raises:
+            PermissionDeniedError: Si no se proporciona el user_id.
+            ValidationError: Si el umbral no está en (0, 1].
+            RepositoryError: Si ocurre un error en la capa de persistencia.
+        """
+        if not user_id:
+            raise PermissionDeniedError(
+                "Se requiere ID de usuario para buscar notas casi duplicadas.",
+                context={"operation": "find_near_duplicates"},
+            )
+        threshold = self.DEFAULT_THRESHOLD if threshold is None else threshold
+        if not 0 < threshold <= 1:
+            raise ValidationError(
+                "El umbral de similitud debe estar en (0, 1].",
+                context={"operation": "find_near_duplicates", "threshold": threshold},
+            )
+        if limit is None or limit <= 0:
+            limit = self.DEFAULT_LIMIT
+        limit = min(limit, self.MAX_LIMIT)
+
+        async with self.unit_of_work as uow:
+            try:
+                if note_id is not None:
+                    return await self._for_note(uow, user_id, note_id, threshold)
+                return await self._for_user(uow, user_id, threshold, limit)
+            except Exception as e:
+                await uow.rollback()
+                logger.exception(
+                    "Error inesperado al buscar notas casi duplicadas",
+                    extra={"user_id": user_id, "operation": "find_near_duplicates"},
+                )
+                raise RepositoryError(
+                    f"Error inesperado en el repositorio al buscar casi duplicados: {str(e)}",
+                    operation="find_near_duplicates",
+                    repository_type="NearDuplicateRepository",
+                    context={"note_id": str(note_id) if note_id else None},
+                ) from e
+
+    async def _for_note(
+        self, uow: IReadOnlyUnitOfWork, user_id: str, note_id: uuid.UUID, threshold: float
+    ) -> list[NearDuplicateCluster]:
+        signatures = await uow.near_duplicates.get_signatures(user_id, [note_id])
+        if note_id not in signatures:
+            return []
+        candidates = await uow.near_duplicates.find_candidates(
+            user_id, note_id, self.MAX_CANDIDATES
+        )
+        if not candidates:
+            return []
+        similarities = estimated_jaccard(signatures[note_id], np.stack(list(candidates.values())))
+        matches = [
+            candidate_id
+            for candidate_id, similarity in zip(candidates, similarities.tolist())
+            if similarity >= threshold
+        ]
+        if not matches:
+            return []
+        return [_cluster(note_id, matches, signatures | candidates)]
+
+    async def _for_user(
+        self, uow: IReadOnlyUnitOfWork, user_id: str, threshold: float, limit: int
+    ) -> list[NearDuplicateCluster]:
+        buckets = await uow.near_duplicates.find_candidate_buckets(user_id, self.MAX_BUCKET_SIZE)
+        if not buckets:
+            return []
+        note_ids = list({note_id for bucket in buckets for note_id in bucket})
+        signatures = await uow.near_duplicates.get_signatures(user_id, note_ids)
+        pairs = _similar_pairs(buckets, signatures, threshold)
+        # La nota de referencia de cada grupo es la que se parece a más notas del grupo
+        degree = Counter(note_id for pair in pairs for note_id in pair)
+        clusters = [
+            _cluster(min(members, key=lambda n: (-degree[n], str(n))), members, signatures)
+            for members in _components(pairs)
+        ]
+        clusters.sort(key=lambda cluster: (-len(cluster.notes), str(cluster.anchor_id)))
+        return clusters[:limit]
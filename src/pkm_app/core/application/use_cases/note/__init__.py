@@ -8,4 +8,5 @@ __all__ = [
     "UpdateNoteUseCase",
     "DeleteNoteUseCase",
     "SearchNotesByProjectUseCase",
-]
+    "FindDuplicateNotesUseCase",
+]
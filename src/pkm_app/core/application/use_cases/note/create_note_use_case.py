@@ -5,6 +5,8 @@ from src.pkm_app.core.application.dtos import NoteCreate, NoteSchema
 from src.pkm_app.core.application.interfaces.unit_of_work_interface import (
     IUnitOfWork,
 )
+from src.pkm_app.core.application.minhash import minhash_signature
+from src.pkm_app.core.application.operations import traced_use_case
 from src.pkm_app.core.domain.errors import PermissionDeniedError, RepositoryError, ValidationError
 
 # Configurar logger para este caso de uso
@@ -15,6 +17,7 @@ class CreateNoteUseCase:
     def __init__(self, unit_of_work: IUnitOfWork):
         self.unit_of_work = unit_of_work
 
+    @traced_use_case
     async def execute(self, note_in: NoteCreate, user_id: str) -> NoteSchema:
         """
         Crea una nueva nota.
@@ -63,10 +66,16 @@ class CreateNoteUseCase:
         async with self.unit_of_work as uow:
             try:
                 created_note_schema = await uow.notes.create(note_in=note_in, user_id=user_id)
+                # La firma MinHash se guarda en la misma transacción que la nota
+                await uow.near_duplicates.save_signatures(
+                    user_id,
+                    {created_note_schema.id: minhash_signature(created_note_schema.content)},
+                )
                 await uow.commit()
 
                 logger.info(
-                    f"Nota creada exitosamente con ID {created_note_schema.id}",
+                    "Nota creada exitosamente con ID %s",
+                    created_note_schema.id,
                     extra={
                         "user_id": user_id,
                         "note_id": str(created_note_schema.id),
@@ -4,6 +4,7 @@ import uuid
 from src.pkm_app.core.application.interfaces.unit_of_work_interface import (
     IUnitOfWork,
 )
+from src.pkm_app.core.application.operations import traced_use_case
 from src.pkm_app.core.domain.errors import NoteNotFoundError, PermissionDeniedError, RepositoryError
 
 # Configurar logger para este caso de uso
@@ -14,6 +15,7 @@ class DeleteNoteUseCase:
     def __init__(self, unit_of_work: IUnitOfWork):
         self.unit_of_work = unit_of_work
 
+    @traced_use_case
     async def execute(self, note_id: uuid.UUID, user_id: str) -> bool:
         """
         Elimina una nota.
@@ -73,7 +75,8 @@ class DeleteNoteUseCase:
                 await uow.commit()
 
                 logger.info(
-                    f"Nota {note_id} eliminada exitosamente",
+                    "Nota %s eliminada exitosamente",
+                    note_id,
                     extra={
                         "user_id": user_id,
                         "note_id": str(note_id),
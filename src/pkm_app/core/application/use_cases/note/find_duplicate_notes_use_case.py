@@ -0,0 +1,62 @@
+import logging
+
+from src.pkm_app.core.application.dtos import DuplicateNoteGroup
+from src.pkm_app.core.application.interfaces.unit_of_work_interface import IReadOnlyUnitOfWork
+from src.pkm_app.core.application.operations import traced_use_case
+from src.pkm_app.core.domain.errors import PermissionDeniedError, RepositoryError
+
+logger = logging.getLogger(__name__)
+
+
+class FindDuplicateNotesUseCase:
+    """
+    Grupos de notas de un usuario con el mismo texto (título y contenido normalizados),
+    encontrados por su hash sin comparar textos.
+    """
+
+    DEFAULT_LIMIT = 100
+    MAX_LIMIT = 1000
+
+    def __init__(self, unit_of_work: IReadOnlyUnitOfWork):
+        self.unit_of_work = unit_of_work
+
+    @traced_use_case
+    async def execute(self, user_id: str, limit: int | None = None) -> list[DuplicateNoteGroup]:
+        """
+        Devuelve los grupos de notas duplicadas del usuario, los más grandes primero.
+
+        Args:
+            user_id: ID del usuario propietario de las notas.
+            limit: Número máximo de grupos a devolver.
+
+        Returns:
+            Los grupos de duplicados; en cada uno, la nota más antigua va primero.
+
+        Raises:
+            PermissionDeniedError: Si no se proporciona el user_id.
+            RepositoryError: Si ocurre un error en la capa de persistencia.
+        """
+        if not user_id:
+            raise PermissionDeniedError(
+                "Se requiere ID de usuario para buscar notas duplicadas.",
+                context={"operation": "find_duplicate_notes"},
+            )
+        if limit is None or limit <= 0:
+            limit = self.DEFAULT_LIMIT
+        limit = min(limit, self.MAX_LIMIT)
+
+        async with self.unit_of_work as uow:
+            try:
+                return await uow.notes.find_exact_duplicates(user_id=user_id, limit=limit)
+            except Exception as e:
+                await uow.rollback()
+                logger.exception(
+                    "Error inesperado al buscar notas duplicadas",
+                    extra={"user_id": user_id, "operation": "find_duplicate_notes"},
+                )
+                raise RepositoryError(
+                    f"Error inesperado en el repositorio al buscar duplicados: {str(e)}",
+                    operation="find_duplicate_notes",
+                    repository_type="NoteRepository",
+                    context={"limit": limit},
+                ) from e
@@ -3,8 +3,10 @@ import uuid
 
 from src.pkm_app.core.application.dtos import NoteSchema
 from src.pkm_app.core.application.interfaces.unit_of_work_interface import (
-    IUnitOfWork,
+    IReadOnlyUnitOfWork,
 )
+from src.pkm_app.core.application.operations import traced_use_case
+from src.pkm_app.core.application.versioning import NotModified, Versioned, entity_version
 from src.pkm_app.core.domain.errors import NoteNotFoundError, PermissionDeniedError, RepositoryError
 
 # Configurar logger para este caso de uso
@@ -12,9 +14,10 @@ logger = logging.getLogger(__name__)
 
 
 class GetNoteUseCase:
-    def __init__(self, unit_of_work: IUnitOfWork):
+    def __init__(self, unit_of_work: IReadOnlyUnitOfWork):
         self.unit_of_work = unit_of_work
 
+    @traced_use_case
     async def execute(self, note_id: uuid.UUID, user_id: str) -> NoteSchema:
         """
         Obtiene los detalles de una nota específica.
@@ -81,7 +84,8 @@ class GetNoteUseCase:
                     )
 
                 logger.info(
-                    f"Nota {note.id} obtenida exitosamente",
+                    "Nota %s obtenida exitosamente",
+                    note.id,
                     extra={
                         "user_id": user_id,
                         "note_id": str(note.id),
@@ -121,3 +125,62 @@ class GetNoteUseCase:
                     repository_type="NoteRepository",
                     context={"note_id": str(note_id)},
                 ) from e
+
+    @traced_use_case
+    async def execute_if_modified(
+        self, note_id: uuid.UUID, user_id: str, known_version: str | None = None
+    ) -> Versioned[NoteSchema] | NotModified:
+        """
+        Lectura condicional de una nota para clientes que refrescan una vista abierta.
+
+        Si `known_version` coincide con la versión actual, responde tras consultar solo el
+        `updated_at` de la nota, sin cargarla.
+
+        Args:
+            note_id: ID de la nota a obtener.
+            user_id: ID del usuario que solicita la nota.
+            known_version: Versión de la nota que ya tiene el cliente, si la tiene.
+
+        Returns:
+            La nota con su versión, o NotModified si no ha cambiado.
+
+        Raises:
+            NoteNotFoundError: Si la nota no se encuentra o no pertenece al usuario.
+            PermissionDeniedError: Si no se proporciona el user_id.
+            RepositoryError: Si ocurre un error en la capa de persistencia.
+        """
+        if not user_id:
+            raise PermissionDeniedError(
+                "Se requiere ID de usuario para obtener una nota.",
+                context={"operation": "get_note"},
+            )
+
+        async with self.unit_of_work as uow:
+            try:
+                if known_version is not None:
+                    updated_at = await uow.notes.get_updated_at(note_id=note_id, user_id=user_id)
+                    if updated_at and entity_version(note_id, updated_at) == known_version:
+                        logger.debug("Nota %s sin cambios para el usuario %s", note_id, user_id)
+                        return NotModified(known_version)
+                note = await uow.notes.get_by_id(note_id=note_id, user_id=user_id)
+            except Exception as e:
+                await uow.rollback()
+                logger.exception(
+                    "Error inesperado al obtener nota %s",
+                    note_id,
+                    extra={"user_id": user_id, "operation": "get_note"},
+                )
+                raise RepositoryError(
+                    f"Error inesperado en el repositorio al obtener nota: {str(e)}",
+                    operation="get_note",
+                    repository_type="NoteRepository",
+                    context={"note_id": str(note_id)},
+                ) from e
+
+        if not note:
+            raise NoteNotFoundError(
+                f"Nota con ID {note_id} no encontrada o no pertenece al usuario.",
+                note_id=note_id,
+                context={"operation": "get_note", "user_id": user_id},
+            )
+        return Versioned(note, entity_version(note.id, note.updated_at))
@@ -2,9 +2,11 @@ import logging
 
 from pkm_app.core.application.dtos import NoteSchema
 from pkm_app.core.application.interfaces.unit_of_work_interface import (
-    IUnitOfWork,
+    IReadOnlyUnitOfWork,
 )
 from pkm_app.core.domain.errors import PermissionDeniedError, RepositoryError, ValidationError
+from src.pkm_app.core.application.operations import traced_use_case
+from src.pkm_app.core.application.versioning import NotModified, Versioned, scope_version
 
 # Configurar logger para este caso de uso
 logger = logging.getLogger(__name__)
@@ -15,7 +17,7 @@ class ListNotesUseCase:
     DEFAULT_LIMIT = 50  # Estandarizado según LS1_005
     MAX_LIMIT = 100  # Estandarizado según LS1_005
 
-    def __init__(self, unit_of_work: IUnitOfWork):
+    def __init__(self, unit_of_work: IReadOnlyUnitOfWork):
         self.unit_of_work = unit_of_work
 
     def _validate_pagination(self, skip: int, limit: int) -> tuple[int, int]:
@@ -34,6 +36,7 @@ class ListNotesUseCase:
             limit = self.MAX_LIMIT
         return skip, limit
 
+    @traced_use_case
     async def execute(
         self, user_id: str, skip: int | None = None, limit: int | None = None
     ) -> list[NoteSchema]:
@@ -87,7 +90,9 @@ class ListNotesUseCase:
                 notes: list[NoteSchema] = notes_result
 
                 logger.info(
-                    f"Listadas {len(notes)} notas para usuario {user_id}",
+                    "Listadas %s notas para usuario %s",
+                    len(notes),
+                    user_id,
                     extra={
                         "user_id": user_id,
                         "count": len(notes),
@@ -114,3 +119,68 @@ class ListNotesUseCase:
                     repository_type="NoteRepository",
                     context={"user_id": user_id, "skip": final_skip, "limit": final_limit},
                 ) from e
+
+    @traced_use_case
+    async def execute_if_modified(
+        self,
+        user_id: str,
+        known_version: str | None = None,
+        skip: int | None = None,
+        limit: int | None = None,
+    ) -> Versioned[list[NoteSchema]] | NotModified:
+        """
+        Lectura condicional del listado para clientes que lo consultan periódicamente.
+
+        La versión de la página se calcula con una sonda (máximo `updated_at`, número de
+        notas del usuario y suma de comprobación) que se resuelve con un index-only scan. Si
+        coincide con `known_version`, no se lee ninguna nota.
+
+        Args:
+            user_id: ID del usuario cuyas notas se listarán.
+            known_version: Versión de la página que ya tiene el cliente, si la tiene.
+            skip: Número de notas a omitir.
+            limit: Número máximo de notas a devolver.
+
+        Returns:
+            Las notas de la página con su versión, o NotModified si no han cambiado.
+
+        Raises:
+            PermissionDeniedError: Si no se proporciona el user_id.
+            RepositoryError: Si ocurre un error en la capa de persistencia.
+        """
+        final_skip, final_limit = self._validate_pagination(
+            skip if skip is not None else self.DEFAULT_SKIP,
+            limit if limit is not None else self.DEFAULT_LIMIT,
+        )
+        if not user_id:
+            raise PermissionDeniedError(
+                "Se requiere ID de usuario para listar notas.",
+                context={"operation": "list_notes"},
+            )
+
+        async with self.unit_of_work as uow:
+            try:
+                # La sonda va antes que la lectura: si una escritura cae entre ambas, el
+                # cliente recibe datos más nuevos que su versión y vuelve a leerlos después
+                stats = await uow.notes.get_list_stats(user_id=user_id)
+                version = scope_version(f"notes:{user_id}:{final_skip}:{final_limit}", *stats)
+                if version == known_version:
+                    logger.debug("Listado de notas sin cambios para el usuario %s", user_id)
+                    return NotModified(version)
+                notes = await uow.notes.list_by_user(
+                    user_id=user_id, skip=final_skip, limit=final_limit
+                )
+                return Versioned(notes, version)
+            except Exception as e:
+                await uow.rollback()
+                logger.exception(
+                    "Error inesperado al listar notas para usuario %s",
+                    user_id,
+                    extra={"operation": "list_notes"},
+                )
+                raise RepositoryError(
+                    f"Error inesperado en el repositorio al listar notas: {str(e)}",
+                    operation="list_notes",
+                    repository_type="NoteRepository",
+                    context={"user_id": user_id, "skip": final_skip, "limit": final_limit},
+                ) from e
@@ -3,8 +3,10 @@ import uuid
 
 from src.pkm_app.core.application.dtos import NoteSchema, ProjectSchema
 from src.pkm_app.core.application.interfaces.unit_of_work_interface import (
-    IUnitOfWork,
+    IReadOnlyUnitOfWork,
 )
+from src.pkm_app.core.application.operations import traced_use_case
+from src.pkm_app.core.application.versioning import NotModified, Versioned, scope_version
 from src.pkm_app.core.domain.errors import (
     PermissionDeniedError,
     ProjectNotFoundError,
@@ -22,7 +24,7 @@ class SearchNotesByProjectUseCase:
     MAX_LIMIT = 100  # Estandarizado según LS1_005
     DEFAULT_ORDER_BY = "created_at"  # Según LS1_006
 
-    def __init__(self, unit_of_work: IUnitOfWork):
+    def __init__(self, unit_of_work: IReadOnlyUnitOfWork):
         self.unit_of_work = unit_of_work
 
     def _validate_pagination(self, skip: int, limit: int) -> tuple[int, int]:
@@ -41,6 +43,7 @@ class SearchNotesByProjectUseCase:
             limit = self.MAX_LIMIT
         return skip, limit
 
+    @traced_use_case
     async def execute(
         self,
         project_id: uuid.UUID,
@@ -136,7 +139,9 @@ class SearchNotesByProjectUseCase:
                 )
 
                 logger.info(
-                    f"Encontradas {len(notes)} notas para proyecto {project_id}",
+                    "Encontradas %s notas para proyecto %s",
+                    len(notes),
+                    project_id,
                     extra={
                         "user_id": user_id,
                         "project_id": str(project_id),
@@ -185,3 +190,93 @@ class SearchNotesByProjectUseCase:
                         "limit": final_limit,
                     },
                 ) from e
+
+    @traced_use_case
+    async def execute_if_modified(
+        self,
+        project_id: uuid.UUID,
+        user_id: str,
+        known_version: str | None = None,
+        skip: int | None = None,
+        limit: int | None = None,
+    ) -> Versioned[tuple[ProjectSchema, list[NoteSchema]]] | NotModified:
+        """
+        Lectura condicional de las notas de un proyecto.
+
+        La sonda (máximo `updated_at` de las notas del proyecto y del propio proyecto, número
+        de notas y suma de comprobación) también comprueba que el proyecto exista. Si la
+        versión coincide con `known_version`, no se leen ni el proyecto ni sus notas.
+
+        Args:
+            project_id: ID del proyecto por el cual buscar notas.
+            user_id: ID del usuario que realiza la búsqueda.
+            known_version: Versión de la página que ya tiene el cliente, si la tiene.
+            skip: Número de notas a omitir.
+            limit: Número máximo de notas a devolver.
+
+        Returns:
+            El proyecto y sus notas con su versión, o NotModified si no han cambiado.
+
+        Raises:
+            PermissionDeniedError: Si no se proporciona el user_id.
+            ProjectNotFoundError: Si el proyecto no existe o no pertenece al usuario.
+            RepositoryError: Si ocurre un error en la capa de persistencia.
+        """
+        final_skip, final_limit = self._validate_pagination(
+            skip if skip is not None else self.DEFAULT_SKIP,
+            limit if limit is not None else self.DEFAULT_LIMIT,
+        )
+        if not user_id:
+            raise PermissionDeniedError(
+                "Se requiere ID de usuario para buscar notas por proyecto.",
+                context={"operation": "search_notes_by_project"},
+            )
+
+        async with self.unit_of_work as uow:
+            try:
+                stats = await uow.notes.get_list_stats(user_id=user_id, project_id=project_id)
+                if stats is None:
+                    raise ProjectNotFoundError(
+                        f"Proyecto con ID {project_id} no encontrado o no pertenece al usuario.",
+                        project_id=project_id,
+                        context={"operation": "search_notes_by_project", "user_id": user_id},
+                    )
+                version = scope_version(
+                    f"project-notes:{user_id}:{project_id}:{final_skip}:{final_limit}", *stats
+                )
+                if version == known_version:
+                    logger.debug("Notas del proyecto %s sin cambios", project_id)
+                    return NotModified(version)
+
+                project = await uow.projects.get_by_id(project_id=project_id, user_id=user_id)
+                if not project:
+                    raise ProjectNotFoundError(
+                        f"Proyecto con ID {project_id} no encontrado o no pertenece al usuario.",
+                        project_id=project_id,
+                        context={"operation": "search_notes_by_project", "user_id": user_id},
+                    )
+                notes = await uow.notes.search_by_project(
+                    project_id=project_id, user_id=user_id, skip=final_skip, limit=final_limit
+                )
+                return Versioned((project, notes), version)
+            except ProjectNotFoundError:
+                await uow.rollback()
+                raise
+            except Exception as e:
+                await uow.rollback()
+                logger.exception(
+                    "Error inesperado al buscar notas por proyecto %s",
+                    project_id,
+                    extra={"user_id": user_id, "operation": "search_notes_by_project"},
+                )
+                raise RepositoryError(
+                    f"Error inesperado en el repositorio al buscar notas por proyecto: {str(e)}",
+                    operation="search_notes_by_project",
+                    repository_type="NoteRepository",
+                    context={
+                        "user_id": user_id,
+                        "project_id": str(project_id),
+                        "skip": final_skip,
+                        "limit": final_limit,
+                    },
+                ) from e
@@ -5,7 +5,10 @@ from src.pkm_app.core.application.dtos import NoteSchema, NoteUpdate
 from src.pkm_app.core.application.interfaces.unit_of_work_interface import (
     IUnitOfWork,
 )
+from src.pkm_app.core.application.minhash import minhash_signature
+from src.pkm_app.core.application.operations import traced_use_case
 from src.pkm_app.core.domain.errors import (
+    ConcurrencyError,
     NoteNotFoundError,
     PermissionDeniedError,
     RepositoryError,
@@ -20,7 +23,14 @@ class UpdateNoteUseCase:
     def __init__(self, unit_of_work: IUnitOfWork):
         self.unit_of_work = unit_of_work
 
-    async def execute(self, note_id: uuid.UUID, note_in: NoteUpdate, user_id: str) -> NoteSchema:
+    @traced_use_case
+    async def execute(
+        self,
+        note_id: uuid.UUID,
+        note_in: NoteUpdate,
+        user_id: str,
+        expected_version: int | None = None,
+    ) -> NoteSchema:
         """
         Actualiza una nota existente.
 
@@ -28,12 +38,16 @@ class UpdateNoteUseCase:
             note_id: ID de la nota a actualizar.
             note_in: Datos para actualizar la nota.
             user_id: ID del usuario que actualiza la nota.
+            expected_version: Versión de la nota que el cliente leyó antes de editarla. Si
+                se indica y ya no es la actual, no se escribe nada.
 
         Returns:
             La nota actualizada.
 
         Raises:
             NoteNotFoundError: Si la nota no se encuentra o no pertenece al usuario.
+            ConcurrencyError: Si la nota ya no está en `expected_version` o si otra operación
+                              la modifica a la vez.
             ValidationError: Si los datos de entrada son inválidos o las entidades
                              relacionadas (proyecto, fuente) no existen o no pertenecen al usuario.
             PermissionDeniedError: Si no se proporciona el user_id.
@@ -74,7 +88,10 @@ class UpdateNoteUseCase:
         async with self.unit_of_work as uow:
             try:
                 updated_note = await uow.notes.update(
-                    note_id=note_id, note_in=note_in, user_id=user_id
+                    note_id=note_id,
+                    note_in=note_in,
+                    user_id=user_id,
+                    expected_version=expected_version,
                 )
                 if updated_note is None:
                     raise NoteNotFoundError(
@@ -82,10 +99,15 @@ class UpdateNoteUseCase:
                         note_id=note_id,
                         context={"operation": "update_note"},
                     )
+                if note_in.content is not None:
+                    await uow.near_duplicates.save_signatures(
+                        user_id, {updated_note.id: minhash_signature(updated_note.content)}
+                    )
                 await uow.commit()
 
                 logger.info(
-                    f"Nota {updated_note.id} actualizada exitosamente",
+                    "Nota %s actualizada exitosamente",
+                    updated_note.id,
                     extra={
                         "user_id": user_id,
                         "note_id": str(updated_note.id),
@@ -113,6 +135,19 @@ class UpdateNoteUseCase:
                 raise NoteNotFoundError(
                     str(e), note_id=note_id, context={"operation": "update_note"}
                 ) from e
+            except ConcurrencyError as e:
+                await uow.rollback()
+                logger.warning(
+                    f"Conflicto de versión al actualizar nota: {str(e)}",
+                    extra={
+                        "user_id": user_id,
+                        "note_id": str(note_id),
+                        "operation": "update_note",
+                        "expected_version": expected_version,
+                    },
+                )
+                e.context.update({"operation": "update_note"})
+                raise
             except ValueError as e:  # Errores de validación, ej: project_id inválido
                 await uow.rollback()
                 logger.warning(
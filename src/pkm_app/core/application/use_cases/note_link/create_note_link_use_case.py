@@ -5,6 +5,7 @@ from src.pkm_app.core.application.dtos import NoteLinkCreate, NoteLinkSchema
 from src.pkm_app.core.application.interfaces.unit_of_work_interface import (
     IUnitOfWork,
 )
+from src.pkm_app.core.application.operations import traced_use_case
 from src.pkm_app.core.domain.errors import PermissionDeniedError, RepositoryError, ValidationError
 
 # Configurar logger para este caso de uso
@@ -15,6 +16,7 @@ class CreateNoteLinkUseCase:
     def __init__(self, unit_of_work: IUnitOfWork):
         self.unit_of_work = unit_of_work
 
+    @traced_use_case
     async def execute(self, note_link_in: NoteLinkCreate, user_id: str) -> NoteLinkSchema:
         """
         Crea un nuevo enlace entre notas.
@@ -92,7 +94,8 @@ class CreateNoteLinkUseCase:
                 await uow.commit()
 
                 logger.info(
-                    f"Enlace entre notas creado exitosamente con ID {created_note_link_schema.id}",
+                    "Enlace entre notas creado exitosamente con ID %s",
+                    created_note_link_schema.id,
                     extra={
                         "user_id": user_id,
                         "note_link_id": str(created_note_link_schema.id),
@@ -4,6 +4,7 @@ import uuid
 from src.pkm_app.core.application.interfaces.unit_of_work_interface import (
     IUnitOfWork,
 )
+from src.pkm_app.core.application.operations import traced_use_case
 from src.pkm_app.core.domain.errors import (
     NoteLinkNotFoundError,
     PermissionDeniedError,
@@ -19,6 +20,7 @@ class DeleteNoteLinkUseCase:
     def __init__(self, unit_of_work: IUnitOfWork):
         self.unit_of_work = unit_of_work
 
+    @traced_use_case
     async def execute(self, note_link_id: uuid.UUID, user_id: str) -> bool:
         """
         Elimina un enlace entre notas.
@@ -77,7 +79,8 @@ class DeleteNoteLinkUseCase:
                 await uow.commit()
 
                 logger.info(
-                    f"Enlace {note_link_id} eliminado exitosamente",
+                    "Enlace %s eliminado exitosamente",
+                    note_link_id,
                     extra={
                         "user_id": user_id,
                         "note_link_id": str(note_link_id),
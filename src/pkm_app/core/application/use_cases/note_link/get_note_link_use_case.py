@@ -3,8 +3,9 @@ import uuid
 
 from src.pkm_app.core.application.dtos import NoteLinkSchema
 from src.pkm_app.core.application.interfaces.unit_of_work_interface import (
-    IUnitOfWork,
+    IReadOnlyUnitOfWork,
 )
+from src.pkm_app.core.application.operations import traced_use_case
 from src.pkm_app.core.domain.errors import (
     NoteLinkNotFoundError,
     PermissionDeniedError,
@@ -17,9 +18,10 @@ logger = logging.getLogger(__name__)
 
 
 class GetNoteLinkUseCase:
-    def __init__(self, unit_of_work: IUnitOfWork):
+    def __init__(self, unit_of_work: IReadOnlyUnitOfWork):
         self.unit_of_work = unit_of_work
 
+    @traced_use_case
     async def execute(self, note_link_id: uuid.UUID, user_id: str) -> NoteLinkSchema:
         """
         Obtiene los detalles de un enlace entre notas específico.
@@ -85,7 +87,8 @@ class GetNoteLinkUseCase:
                     )
 
                 logger.info(
-                    f"Enlace {note_link.id} obtenido exitosamente",
+                    "Enlace %s obtenido exitosamente",
+                    note_link.id,
                     extra={
                         "user_id": user_id,
                         "note_link_id": str(note_link.id),
@@ -4,8 +4,9 @@ from typing import Optional
 
 from src.pkm_app.core.application.dtos import NoteLinkSchema
 from src.pkm_app.core.application.interfaces.unit_of_work_interface import (
-    IUnitOfWork,
+    IReadOnlyUnitOfWork,
 )
+from src.pkm_app.core.application.operations import traced_use_case
 from src.pkm_app.core.domain.errors import PermissionDeniedError, RepositoryError, ValidationError
 
 # Configurar logger para este caso de uso
@@ -17,7 +18,7 @@ class ListNoteLinksUseCase:
     DEFAULT_LIMIT = 50
     MAX_LIMIT = 100
 
-    def __init__(self, unit_of_work: IUnitOfWork):
+    def __init__(self, unit_of_work: IReadOnlyUnitOfWork):
         self.unit_of_work = unit_of_work
 
     def _validate_pagination(self, skip: int, limit: int) -> tuple[int, int]:
@@ -36,6 +37,7 @@ class ListNoteLinksUseCase:
             limit = self.MAX_LIMIT
         return skip, limit
 
+    @traced_use_case
     async def execute(
         self,
         user_id: str,
@@ -129,7 +131,9 @@ class ListNoteLinksUseCase:
                     )
 
                 logger.info(
-                    f"Listados {len(note_links)} enlaces para usuario {user_id}",
+                    "Listados %s enlaces para usuario %s",
+                    len(note_links),
+                    user_id,
                     extra={**log_extra, "count": len(note_links)},
                 )
                 return note_links
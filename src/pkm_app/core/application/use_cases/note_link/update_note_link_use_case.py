@@ -5,6 +5,7 @@ from src.pkm_app.core.application.dtos import NoteLinkSchema, NoteLinkUpdate
 from src.pkm_app.core.application.interfaces.unit_of_work_interface import (
     IUnitOfWork,
 )
+from src.pkm_app.core.application.operations import traced_use_case
 from src.pkm_app.core.domain.errors import (
     NoteLinkNotFoundError,
     PermissionDeniedError,
@@ -20,6 +21,7 @@ class UpdateNoteLinkUseCase:
     def __init__(self, unit_of_work: IUnitOfWork):
         self.unit_of_work = unit_of_work
 
+    @traced_use_case
     async def execute(
         self, note_link_id: uuid.UUID, note_link_in: NoteLinkUpdate, user_id: str
     ) -> NoteLinkSchema:
@@ -108,7 +110,8 @@ class UpdateNoteLinkUseCase:
                 await uow.commit()
 
                 logger.info(
-                    f"Enlace {updated_note_link.id} actualizado exitosamente",
+                    "Enlace %s actualizado exitosamente",
+                    updated_note_link.id,
                     extra={
                         "user_id": user_id,
                         "note_link_id": str(updated_note_link.id),
@@ -4,6 +4,7 @@ from src.pkm_app.core.application.dtos import ProjectCreate, ProjectSchema
 from src.pkm_app.core.application.interfaces.unit_of_work_interface import (
     IUnitOfWork,
 )
+from src.pkm_app.core.application.operations import traced_use_case
 from src.pkm_app.core.domain.errors import PermissionDeniedError, RepositoryError, ValidationError
 
 # Configurar logger para este caso de uso
@@ -29,6 +30,7 @@ class CreateProjectUseCase:
             unit_of_work.__class__.__name__,
         )
 
+    @traced_use_case
     async def execute(self, project_in: ProjectCreate, user_id: str) -> ProjectSchema:
         """
         Crea un nuevo proyecto.
@@ -102,7 +104,8 @@ class CreateProjectUseCase:
                 await uow.commit()
 
                 logger.info(
-                    f"Proyecto creado exitosamente con ID {created_project.id}",
+                    "Proyecto creado exitosamente con ID %s",
+                    created_project.id,
                     extra={
                         "user_id": user_id,
                         "project_id": str(created_project.id),
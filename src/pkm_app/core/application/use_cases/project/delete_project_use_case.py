@@ -5,6 +5,7 @@ from src.pkm_app.core.application.interfaces.project_interface import IProjectRe
 from src.pkm_app.core.application.interfaces.unit_of_work_interface import (
     IUnitOfWork,
 )
+from src.pkm_app.core.application.operations import traced_use_case
 from src.pkm_app.core.domain.errors import (
     PermissionDeniedError,
     ProjectNotFoundError,
@@ -32,6 +33,7 @@ class DeleteProjectUseCase:
             unit_of_work.__class__.__name__,
         )
 
+    @traced_use_case
     async def execute(self, project_id: uuid.UUID, user_id: str) -> bool:
         """
         Elimina un proyecto.
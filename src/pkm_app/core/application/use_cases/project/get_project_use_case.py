@@ -4,8 +4,9 @@ import uuid
 from src.pkm_app.core.application.dtos import ProjectSchema
 from src.pkm_app.core.application.interfaces.project_interface import IProjectRepository
 from src.pkm_app.core.application.interfaces.unit_of_work_interface import (
-    IUnitOfWork,
+    IReadOnlyUnitOfWork,
 )
+from src.pkm_app.core.application.operations import traced_use_case
 from src.pkm_app.core.domain.errors import (
     PermissionDeniedError,
     ProjectNotFoundError,
@@ -22,13 +23,15 @@ class GetProjectUseCase:
     Sigue el patrón de user_profile: inyección explícita de repositorio y unit_of_work, logging robusto y uso de DTOs.
     """
 
-    def __init__(self, project_repository: IProjectRepository, unit_of_work: IUnitOfWork) -> None:
+    def __init__(
+        self, project_repository: IProjectRepository, unit_of_work: IReadOnlyUnitOfWork
+    ) -> None:
         """
         Inicializa el caso de uso de obtención de proyecto.
 
         Args:
             project_repository: Repositorio de proyectos (IProjectRepository).
-            unit_of_work: Unidad de trabajo para transacciones.
+            unit_of_work: Unidad de trabajo de solo lectura.
         """
         self.project_repository = project_repository
         self.unit_of_work = unit_of_work
@@ -38,6 +41,7 @@ class GetProjectUseCase:
             unit_of_work.__class__.__name__,
         )
 
+    @traced_use_case
     async def execute(self, project_id: uuid.UUID, user_id: str) -> ProjectSchema:
         """
         Obtiene los detalles de un proyecto específico.
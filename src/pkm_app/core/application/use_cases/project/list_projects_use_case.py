@@ -3,10 +3,11 @@ import logging
 from src.pkm_app.core.application.dtos import ProjectSchema
 from src.pkm_app.core.application.interfaces.project_interface import IProjectRepository
 from src.pkm_app.core.application.interfaces.unit_of_work_interface import (
-    IUnitOfWork,
+    IReadOnlyUnitOfWork,
 )
 
 # from src.pkm_app.core.application.interfaces import IProjectRepository
+from src.pkm_app.core.application.operations import traced_use_case
 from src.pkm_app.core.domain.errors import PermissionDeniedError, RepositoryError, ValidationError
 
 # Configurar logger para este caso de uso
@@ -18,13 +19,15 @@ class ListProjectsUseCase:
     DEFAULT_LIMIT = 50
     MAX_LIMIT = 100
 
-    def __init__(self, project_repository: IProjectRepository, unit_of_work: IUnitOfWork) -> None:
+    def __init__(
+        self, project_repository: IProjectRepository, unit_of_work: IReadOnlyUnitOfWork
+    ) -> None:
         """
         Inicializa el caso de uso de listado de proyectos.
 
         Args:
             project_repository: Repositorio de proyectos (IProjectRepository).
-            unit_of_work: Unidad de trabajo para transacciones.
+            unit_of_work: Unidad de trabajo de solo lectura.
         """
         self.project_repository = project_repository
         self.unit_of_work = unit_of_work
@@ -50,6 +53,7 @@ class ListProjectsUseCase:
             limit = self.MAX_LIMIT
         return skip, limit
 
+    @traced_use_case
     async def execute(
         self, user_id: str, skip: int | None = None, limit: int | None = None
     ) -> list[ProjectSchema]:
@@ -97,7 +101,9 @@ class ListProjectsUseCase:
                 )
 
                 logger.info(
-                    f"Listados {len(projects)} proyectos para usuario {user_id}",
+                    "Listados %s proyectos para usuario %s",
+                    len(projects),
+                    user_id,
                     extra={
                         "user_id": user_id,
                         "count": len(projects),
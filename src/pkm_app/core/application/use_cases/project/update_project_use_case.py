@@ -6,7 +6,9 @@ from src.pkm_app.core.application.interfaces.project_interface import IProjectRe
 from src.pkm_app.core.application.interfaces.unit_of_work_interface import (
     IUnitOfWork,
 )
+from src.pkm_app.core.application.operations import traced_use_case
 from src.pkm_app.core.domain.errors import (
+    ConcurrencyError,
     PermissionDeniedError,
     ProjectNotFoundError,
     RepositoryError,
@@ -34,8 +36,13 @@ class UpdateProjectUseCase:
             unit_of_work.__class__.__name__,
         )
 
+    @traced_use_case
     async def execute(
-        self, project_id: uuid.UUID, project_in: ProjectUpdate, user_id: str
+        self,
+        project_id: uuid.UUID,
+        project_in: ProjectUpdate,
+        user_id: str,
+        expected_version: int | None = None,
     ) -> ProjectSchema:
         """
         Actualiza un proyecto existente.
@@ -44,12 +51,14 @@ class UpdateProjectUseCase:
             project_id: ID del proyecto a actualizar.
             project_in: Datos para actualizar el proyecto.
             user_id: ID del usuario que actualiza el proyecto.
+            expected_version: Versión del proyecto que leyó el cliente (opcional).
 
         Returns:
             El proyecto actualizado.
 
         Raises:
             ProjectNotFoundError: Si el proyecto no se encuentra o no pertenece al usuario.
+            ConcurrencyError: Si el proyecto ya no está en `expected_version` o cambia a la vez.
             ValidationError: Si los datos de entrada son inválidos.
             PermissionDeniedError: Si no se proporciona el user_id.
             RepositoryError: Si ocurre un error en la capa de persistencia.
@@ -100,7 +109,9 @@ class UpdateProjectUseCase:
                         f"Proyecto {project_id} no encontrado o no pertenece al usuario.",
                         context={"operation": "update_project"},
                     )
-                updated_project = await uow.projects.update(project_id, project_in, user_id)
+                updated_project = await uow.projects.update(
+                    project_id, project_in, user_id, expected_version=expected_version
+                )
                 if updated_project is None:
                     logger.error(
                         "Error inesperado: el método update devolvió None para project_id=%s",
@@ -113,6 +124,16 @@ class UpdateProjectUseCase:
                 await uow.commit()
                 logger.info("Proyecto actualizado exitosamente: %s", project_id)
                 return updated_project
+            except ConcurrencyError as e:
+                await uow.rollback()
+                logger.warning("Conflicto de versión al actualizar proyecto: %s", e)
+                e.context.update({"operation": "update_project"})
+                raise
+            except ValueError as e:
+                # Validaciones del repositorio (padre inexistente, jerarquía circular, ...)
+                await uow.rollback()
+                logger.warning("Error de validación al actualizar proyecto: %s", e)
+                raise ValidationError(str(e), context={"operation": "update_project"}) from e
             except Exception as e:
                 await uow.rollback()
                 logger.error("Error inesperado al actualizar proyecto: %s", e, exc_info=True)
@@ -5,6 +5,7 @@ from src.pkm_app.core.application.dtos import SourceCreate, SourceSchema
 from src.pkm_app.core.application.interfaces.unit_of_work_interface import (
     IUnitOfWork,
 )
+from src.pkm_app.core.application.operations import traced_use_case
 from src.pkm_app.core.domain.errors import PermissionDeniedError, RepositoryError, ValidationError
 
 # Configurar logger para este caso de uso
@@ -15,6 +16,7 @@ class CreateSourceUseCase:
     def __init__(self, unit_of_work: IUnitOfWork):
         self.unit_of_work = unit_of_work
 
+    @traced_use_case
     async def execute(self, source_in: SourceCreate, user_id: str) -> SourceSchema:
         """
         Crea una nueva fuente.
@@ -76,7 +78,8 @@ class CreateSourceUseCase:
                 await uow.commit()
 
                 logger.info(
-                    f"Fuente creada exitosamente con ID {created_source_schema.id}",
+                    "Fuente creada exitosamente con ID %s",
+                    created_source_schema.id,
                     extra={
                         "user_id": user_id,
                         "source_id": str(created_source_schema.id),
@@ -4,6 +4,7 @@ import uuid
 from src.pkm_app.core.application.interfaces.unit_of_work_interface import (
     IUnitOfWork,
 )
+from src.pkm_app.core.application.operations import traced_use_case
 from src.pkm_app.core.domain.errors import (
     PermissionDeniedError,
     RepositoryError,
@@ -19,6 +20,7 @@ class DeleteSourceUseCase:
     def __init__(self, unit_of_work: IUnitOfWork):
         self.unit_of_work = unit_of_work
 
+    @traced_use_case
     async def execute(self, source_id: uuid.UUID, user_id: str) -> bool:
         """
         Elimina una fuente.
@@ -77,7 +79,8 @@ class DeleteSourceUseCase:
                 await uow.commit()
 
                 logger.info(
-                    f"Fuente {source_id} eliminada exitosamente",
+                    "Fuente %s eliminada exitosamente",
+                    source_id,
                     extra={
                         "user_id": user_id,
                         "source_id": str(source_id),
@@ -3,8 +3,9 @@ import uuid
 
 from src.pkm_app.core.application.dtos import SourceSchema
 from src.pkm_app.core.application.interfaces.unit_of_work_interface import (
-    IUnitOfWork,
+    IReadOnlyUnitOfWork,
 )
+from src.pkm_app.core.application.operations import traced_use_case
 from src.pkm_app.core.domain.errors import (
     PermissionDeniedError,
     RepositoryError,
@@ -17,9 +18,10 @@ logger = logging.getLogger(__name__)
 
 
 class GetSourceUseCase:
-    def __init__(self, unit_of_work: IUnitOfWork):
+    def __init__(self, unit_of_work: IReadOnlyUnitOfWork):
         self.unit_of_work = unit_of_work
 
+    @traced_use_case
     async def execute(self, source_id: uuid.UUID, user_id: str) -> SourceSchema:
         """
         Obtiene los detalles de una fuente específica.
@@ -89,7 +91,8 @@ class GetSourceUseCase:
                     )
 
                 logger.info(
-                    f"Fuente {source.id} obtenida exitosamente",
+                    "Fuente %s obtenida exitosamente",
+                    source.id,
                     extra={
                         "user_id": user_id,
                         "source_id": str(source.id),
@@ -2,8 +2,9 @@ import logging
 
 from src.pkm_app.core.application.dtos import SourceSchema
 from src.pkm_app.core.application.interfaces.unit_of_work_interface import (
-    IUnitOfWork,
+    IReadOnlyUnitOfWork,
 )
+from src.pkm_app.core.application.operations import traced_use_case
 from src.pkm_app.core.domain.errors import PermissionDeniedError, RepositoryError, ValidationError
 
 # Configurar logger para este caso de uso
@@ -15,7 +16,7 @@ class ListSourcesUseCase:
     DEFAULT_LIMIT = 50
     MAX_LIMIT = 100
 
-    def __init__(self, unit_of_work: IUnitOfWork):
+    def __init__(self, unit_of_work: IReadOnlyUnitOfWork):
         self.unit_of_work = unit_of_work
 
     def _validate_pagination(self, skip: int, limit: int) -> tuple[int, int]:
@@ -34,6 +35,7 @@ class ListSourcesUseCase:
             limit = self.MAX_LIMIT
         return skip, limit
 
+    @traced_use_case
     async def execute(
         self, user_id: str, skip: int | None = None, limit: int | None = None
     ) -> list[SourceSchema]:
@@ -85,7 +87,9 @@ class ListSourcesUseCase:
                 )
 
                 logger.info(
-                    f"Listadas {len(sources)} fuentes para usuario {user_id}",
+                    "Listadas %s fuentes para usuario %s",
+                    len(sources),
+                    user_id,
                     extra={
                         "user_id": user_id,
                         "count": len(sources),
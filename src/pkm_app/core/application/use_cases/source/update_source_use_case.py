@@ -5,7 +5,9 @@ from src.pkm_app.core.application.dtos import SourceSchema, SourceUpdate
 from src.pkm_app.core.application.interfaces.unit_of_work_interface import (
     IUnitOfWork,
 )
+from src.pkm_app.core.application.operations import traced_use_case
 from src.pkm_app.core.domain.errors import (
+    ConcurrencyError,
     PermissionDeniedError,
     RepositoryError,
     SourceNotFoundError,
@@ -20,8 +22,13 @@ class UpdateSourceUseCase:
     def __init__(self, unit_of_work: IUnitOfWork):
         self.unit_of_work = unit_of_work
 
+    @traced_use_case
     async def execute(
-        self, source_id: uuid.UUID, source_in: SourceUpdate, user_id: str
+        self,
+        source_id: uuid.UUID,
+        source_in: SourceUpdate,
+        user_id: str,
+        expected_version: int | None = None,
     ) -> SourceSchema:
         """
         Actualiza una fuente existente.
@@ -30,12 +37,14 @@ class UpdateSourceUseCase:
             source_id: ID de la fuente a actualizar.
             source_in: Datos para actualizar la fuente.
             user_id: ID del usuario que actualiza la fuente.
+            expected_version: Versión de la fuente que leyó el cliente (opcional).
 
         Returns:
             La fuente actualizada.
 
         Raises:
             SourceNotFoundError: Si la fuente no se encuentra o no pertenece al usuario.
+            ConcurrencyError: Si la fuente ya no está en `expected_version` o cambia a la vez.
             ValidationError: Si los datos de entrada son inválidos.
             PermissionDeniedError: Si no se proporciona el user_id.
             RepositoryError: Si ocurre un error en la capa de persistencia.
@@ -120,7 +129,10 @@ class UpdateSourceUseCase:
         async with self.unit_of_work as uow:
             try:
                 updated_source = await uow.sources.update(
-                    source_id=source_id, source_in=source_in, user_id=user_id
+                    source_id=source_id,
+                    source_in=source_in,
+                    user_id=user_id,
+                    expected_version=expected_version,
                 )
                 if updated_source is None:
                     await uow.rollback()
@@ -140,7 +152,8 @@ class UpdateSourceUseCase:
                 await uow.commit()
 
                 logger.info(
-                    f"Fuente {updated_source.id} actualizada exitosamente",
+                    "Fuente %s actualizada exitosamente",
+                    updated_source.id,
                     extra={
                         "user_id": user_id,
                         "source_id": str(updated_source.id),
@@ -161,6 +174,19 @@ class UpdateSourceUseCase:
                 raise SourceNotFoundError(
                     str(e), source_id=source_id, context={"operation": "update_source"}
                 ) from e
+            except ConcurrencyError as e:
+                await uow.rollback()
+                logger.warning(
+                    f"Conflicto de versión al actualizar fuente: {str(e)}",
+                    extra={
+                        "user_id": user_id,
+                        "source_id": str(source_id),
+                        "operation": "update_source",
+                        "expected_version": expected_version,
+                    },
+                )
+                e.context.update({"operation": "update_source"})
+                raise
             except ValueError as e:  # Errores de validación desde el repositorio
                 await uow.rollback()
                 logger.warning(
@@ -8,6 +8,7 @@ from pkm_app.core.application.dtos.user_profile_dto import UserProfileDTO
 from pkm_app.core.application.interfaces.unit_of_work_interface import IUnitOfWork
 from pkm_app.core.application.interfaces.user_profile_interface import IUserProfileRepository
 from pkm_app.core.domain.entities.user_profile import UserProfile
+from src.pkm_app.core.application.operations import traced_use_case
 
 # Configure logger for this module
 logger = logging.getLogger(__name__)
@@ -48,6 +49,7 @@ class CreateUserProfileUseCase:
             unit_of_work.__class__.__name__,
         )
 
+    @traced_use_case
     async def execute(self, user_profile_data: UserProfileDTO) -> UserProfileDTO | None:
         """
         Execute the use case to create a new user profile.
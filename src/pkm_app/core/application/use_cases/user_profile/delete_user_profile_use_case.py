@@ -6,6 +6,7 @@ from uuid import UUID
 from pkm_app.core.application.interfaces.unit_of_work_interface import IUnitOfWork
 from pkm_app.core.application.interfaces.user_profile_interface import IUserProfileRepository
 from pkm_app.core.domain.errors import EntityNotFoundError
+from src.pkm_app.core.application.operations import traced_use_case
 
 # Configure logger for this module
 logger = logging.getLogger(__name__)
@@ -46,6 +47,7 @@ class DeleteUserProfileUseCase:
             unit_of_work.__class__.__name__,
         )
 
+    @traced_use_case
     async def execute(self, user_profile_id: UUID) -> bool:
         """
         Execute the use case to delete an existing user profile.
@@ -7,6 +7,7 @@ from uuid import UUID
 from pkm_app.core.application.dtos.user_profile_dto import UserProfileDTO
 from pkm_app.core.application.interfaces.user_profile_interface import IUserProfileRepository
 from pkm_app.core.domain.errors import EntityNotFoundError
+from src.pkm_app.core.application.operations import traced_use_case
 
 # Configure logger for this module
 logger = logging.getLogger(__name__)
@@ -40,6 +41,7 @@ class GetUserProfileUseCase:
             user_profile_repository.__class__.__name__,
         )
 
+    @traced_use_case
     async def execute(self, user_profile_id: UUID) -> UserProfileDTO | None:
         """
         Execute the use case to retrieve a user profile.
@@ -5,6 +5,7 @@ from typing import Any, Optional
 
 from pkm_app.core.application.dtos.user_profile_dto import UserProfileDTO
 from pkm_app.core.application.interfaces.user_profile_interface import IUserProfileRepository
+from src.pkm_app.core.application.operations import traced_use_case
 
 # Configure logger for this module
 logger = logging.getLogger(__name__)
@@ -39,6 +40,7 @@ class ListUserProfilesUseCase:
             user_profile_repository.__class__.__name__,
         )
 
+    @traced_use_case
     async def execute(
         self, filters: dict[str, Any] | None = None, offset: int = 0, limit: int = 100
     ) -> list[UserProfileDTO]:
@@ -9,6 +9,7 @@ from pkm_app.core.application.interfaces.unit_of_work_interface import IUnitOfWo
 from pkm_app.core.application.interfaces.user_profile_interface import IUserProfileRepository
 from pkm_app.core.domain.entities.user_profile import UserProfile
 from pkm_app.core.domain.errors import DuplicateEntityError, EntityNotFoundError
+from src.pkm_app.core.application.operations import traced_use_case
 
 # Configure logger for this module
 logger = logging.getLogger(__name__)
@@ -49,6 +50,7 @@ class UpdateUserProfileUseCase:
             unit_of_work.__class__.__name__,
         )
 
+    @traced_use_case
     async def execute(
         self, user_profile_id: UUID, update_data: dict[str, Any]
     ) -> UserProfileDTO | None:
@@ -0,0 +1,64 @@
+"""
+Tokens de versión para lecturas condicionales.
+
+Un cliente que refresca una vista envía el token de la última respuesta; si los datos no han
+cambiado, el caso de uso devuelve `NotModified` sin leer ni serializar las filas.
+
+- Entidad: el token se deriva de su id y `updated_at`.
+- Listado: se deriva del ámbito (usuario, proyecto, página) y de una sonda barata sobre el
+  ámbito completo: `max(updated_at)`, `count(*)` y una suma de comprobación. `updated_at` es
+  el inicio de la transacción que escribió, no su commit, así que una escritura lenta puede
+  confirmar por debajo del máximo; la suma de comprobación cambia con cualquier escritura
+  confirmada.
+
+Los tokens son opacos para el cliente (resumen BLAKE2b), así que pueden cambiar de formato.
+"""
+
+import hashlib
+import uuid
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+@dataclass(frozen=True, slots=True)
+class NotModified:
+    """Los datos no han cambiado desde `version`."""
+
+    version: str
+
+
+@dataclass(frozen=True, slots=True)
+class Versioned(Generic[T]):
+    """Resultado de una lectura condicional junto con su versión actual."""
+
+    data: T
+    version: str
+
+
+def _microseconds(moment: datetime | None) -> int:
+    if moment is None:
+        return 0
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=UTC)
+    return (moment - _EPOCH) // _MICROSECOND
+
+
+def _digest(*parts: object) -> str:
+    return hashlib.blake2b("|".join(map(str, parts)).encode(), digest_size=12).hexdigest()
+
+
+def entity_version(entity_id: uuid.UUID, updated_at: datetime) -> str:
+    return _digest("entity", entity_id, _microseconds(updated_at))
+
+
+def scope_version(
+    scope: str, last_updated_at: datetime | None, count: int, checksum: int = 0
+) -> str:
+    """`scope` identifica el listado (incluida la página) para que cada página tenga su token."""
+    return _digest("scope", scope, _microseconds(last_updated_at), count, checksum)
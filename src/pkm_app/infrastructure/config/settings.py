@@ -1,5 +1,6 @@
 import os
-from typing import cast
+from functools import lru_cache
+from typing import Any, cast
 
 from pydantic import PostgresDsn, computed_field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -20,6 +21,80 @@ class Settings(BaseSettings):
         "postgresql+asyncpg://${DB_USER}:${DB_PASSWORD}@${DB_HOST}:${DB_PORT}/${DB_NAME}"
     )
 
+    # Configuración del engine/pool de SQLAlchemy (ver persistence/sqlalchemy/engine.py).
+    # DB_ENGINE_PRESET elige los valores base ("development" o "production"); los ajustes
+    # con valor None heredan el del preset.
+    DB_ENGINE_PRESET: str = "development"
+    DB_ECHO: bool = False
+    DB_POOL_SIZE: int | None = None
+    DB_MAX_OVERFLOW: int | None = None
+    DB_POOL_TIMEOUT: float | None = None
+    DB_POOL_RECYCLE: int | None = None
+    DB_POOL_PRE_PING: bool | None = None
+    DB_STATEMENT_TIMEOUT_MS: int | None = None
+    DB_STATEMENT_CACHE_SIZE: int | None = None
+    # Compatibilidad con PgBouncer en modo transaction pooling
+    DB_PGBOUNCER_MODE: bool = False
+
+    # Réplicas de lectura (ver persistence/sqlalchemy/replicas.py). URLs asyncpg completas,
+    # como lista JSON: DB_REPLICA_URLS='["postgresql+asyncpg://u:p@replica1:5432/db"]'.
+    # Sin réplicas, las lecturas usan el engine de solo lectura del primario.
+    DB_REPLICA_URLS: list[str] = []
+    DB_REPLICA_STRATEGY: str = "round_robin"  # o "least_connections"
+    # Ventana tras una escritura en la que las lecturas de ese usuario van al primario
+    DB_READ_YOUR_WRITES_SECONDS: float = 5.0
+    # Las réplicas con más retraso que este (o que fallan el chequeo) se expulsan
+    DB_REPLICA_MAX_LAG_SECONDS: float = 10.0
+    DB_REPLICA_HEALTH_CHECK_INTERVAL_SECONDS: float = 5.0
+
+    # Puerto del endpoint /metrics (formato Prometheus, ver infrastructure/monitoring).
+    # Sin valor no se arranca el servidor de métricas; se siguen recogiendo igualmente.
+    METRICS_PORT: int | None = None
+    METRICS_ENABLED: bool = True
+
+    # API HTTP (ver infrastructure/web/api). Sin API_WORKERS se usa un worker por CPU,
+    # limitado para que las conexiones de todos los workers quepan en
+    # API_DB_CONNECTION_BUDGET (max_connections de PostgreSQL menos un margen).
+    API_HOST: str = "127.0.0.1"
+    API_PORT: int = 8000
+    API_WORKERS: int | None = None
+    API_DB_CONNECTION_BUDGET: int = 90
+    # Orígenes permitidos por CORS, como lista JSON: API_CORS_ORIGINS='["http://localhost:3000"]'
+    API_CORS_ORIGINS: list[str] = []
+
+    # Índice vectorial en Qdrant (ver infrastructure/vector_store/qdrant_index.py), vía su
+    # API REST. QDRANT_MAX_CONNECTIONS limita el pool HTTP del proceso y QDRANT_BATCH_SIZE
+    # los puntos por petición de alta o borrado.
+    QDRANT_URL: str = "http://localhost:6333"
+    QDRANT_API_KEY: str | None = None
+    QDRANT_COLLECTION: str = "notes"
+    QDRANT_MAX_CONNECTIONS: int = 8
+    QDRANT_BATCH_SIZE: int = 256
+    QDRANT_TIMEOUT_SECONDS: float = 10.0
+
+    # Embeddings de las notas (ver infrastructure/embeddings), con la API de Gemini y la
+    # clave GEMINI_API_KEY. Cambiar el modelo o la dimensión exige una colección nueva.
+    EMBEDDING_MODEL: str = "gemini-embedding-001"
+    EMBEDDING_DIMENSION: int = 768
+    EMBEDDING_MEMORY_CACHE_SIZE: int = 10_000
+
+    # Relay del outbox hacia Qdrant (`main.py relay`, ver infrastructure/outbox/runner.py):
+    # mensajes por lote y espera con el outbox al día.
+    OUTBOX_BATCH_SIZE: int = 200
+    OUTBOX_IDLE_SECONDS: float = 1.0
+
+    # Modelos de lenguaje (ver infrastructure/llm/gateway.py). LLM_PROVIDER es "gemini" o
+    # "fake" (determinista, sin red). LLM_MAX_CONCURRENCY limita las llamadas simultáneas al
+    # proveedor por proceso y LLM_BATCH_WINDOW_MS lo que espera una petición a completar lote.
+    LLM_PROVIDER: str = "gemini"
+    LLM_MAX_CONCURRENCY: int = 4
+    LLM_BATCH_WINDOW_MS: float = 5.0
+    LLM_MEMORY_CACHE_SIZE: int = 1000
+    LLM_PERSISTENT_CACHE: bool = True
+    LLM_TIMEOUT_SECONDS: float = 60.0
+    GEMINI_API_KEY: str | None = None
+    GEMINI_URL: str = "https://generativelanguage.googleapis.com/v1beta"
+
     model_config = SettingsConfigDict(
         env_file=".env", extra="ignore", case_sensitive=False, env_file_encoding="utf-8"
     )
@@ -56,7 +131,19 @@ class Settings(BaseSettings):
         )
 
 
-settings = Settings()
+@lru_cache
+def get_settings() -> Settings:
+    """Devuelve la instancia de Settings, creada (y leída del entorno/.env) en la primera llamada."""
+    return Settings()
+
+
+def __getattr__(name: str) -> Any:
+    # `settings` se mantiene como atributo del módulo por compatibilidad, pero se crea bajo
+    # demanda para que importar este módulo no lea el entorno ni el archivo .env.
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # Para depuración, puedes imprimir las URLs generadas:
 # print(f"ASYNC_DATABASE_URL: {settings.ASYNC_DATABASE_URL}")
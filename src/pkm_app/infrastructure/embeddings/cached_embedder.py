@@ -0,0 +1,131 @@
+"""
+Embeddings con caché por contenido en dos niveles: un LRU en memoria del proceso y la tabla
+`embedding_cache` compartida por todos los procesos.
+
+Cada texto se identifica por su hash (`content_hashing.text_hash`), así que volver a guardar
+una nota sin cambiar su texto, los textos repetidos dentro de una llamada y las notas
+idénticas de distintos usuarios se calculan una sola vez por modelo. Al modelo solo se le
+envían, en una única llamada, los textos que no están en ninguno de los dos niveles.
+"""
+
+import logging
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+
+import numpy as np
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.pkm_app.core.application.content_hashing import text_hash
+from src.pkm_app.core.application.interfaces.embedding_interface import ITextEmbedder
+from src.pkm_app.infrastructure.monitoring.collectors import CACHE_REQUESTS
+from src.pkm_app.infrastructure.persistence.sqlalchemy.database import get_async_sessionmaker
+from src.pkm_app.infrastructure.persistence.sqlalchemy.repositories.embedding_repository import (
+    VECTOR_DTYPE,
+    SQLAlchemyEmbeddingCacheRepository,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _record(cache: str, hits: int, misses: int) -> None:
+    if hits:
+        CACHE_REQUESTS.inc(cache, "hit", amount=hits)
+    if misses:
+        CACHE_REQUESTS.inc(cache, "miss", amount=misses)
+
+
+class CachedEmbedder(ITextEmbedder):
+    DEFAULT_MEMORY_SIZE = 10_000
+
+    def __init__(
+        self,
+        inner: ITextEmbedder,
+        session_factory: Callable[[], AsyncSession] | None = None,
+        memory_size: int = DEFAULT_MEMORY_SIZE,
+    ):
+        if memory_size < 0:
+            raise ValueError("El tamaño de la caché en memoria no puede ser negativo.")
+        self.inner = inner
+        self.memory_size = memory_size
+        self._memory: OrderedDict[bytes, np.ndarray] = OrderedDict()
+        # Si no se indica, se usa el sessionmaker global en la primera consulta
+        self._session_factory = session_factory
+
+    @property
+    def model(self) -> str:
+        return self.inner.model
+
+    async def embed(self, texts: Sequence[str]) -> np.ndarray:
+        hashes = [text_hash(text) for text in texts]
+        # Un texto repetido en la llamada se busca y se calcula una sola vez
+        pending = dict(zip(hashes, texts))
+        found: dict[bytes, np.ndarray] = {}
+
+        for content_hash in list(pending):
+            vector = self._memory.get(content_hash)
+            if vector is not None:
+                self._memory.move_to_end(content_hash)
+                found[content_hash] = vector
+                del pending[content_hash]
+        _record("embedding_memory", len(found), len(pending))
+
+        if pending:
+            stored = await self._load(list(pending))
+            _record("embedding_database", len(stored), len(pending) - len(stored))
+            for content_hash, vector in stored.items():
+                found[content_hash] = self._remember(content_hash, vector)
+                del pending[content_hash]
+
+        if pending:
+            computed = np.asarray(await self.inner.embed(list(pending.values())), VECTOR_DTYPE)
+            if computed.shape[0] != len(pending):
+                raise ValueError(
+                    f"El modelo '{self.model}' devolvió {computed.shape[0]} vectores "
+                    f"para {len(pending)} textos."
+                )
+            new = dict(zip(pending, computed))
+            await self._store(new)
+            for content_hash, vector in new.items():
+                found[content_hash] = self._remember(content_hash, vector)
+
+        if not hashes:
+            return np.empty((0, 0), dtype=VECTOR_DTYPE)
+        return np.stack([found[content_hash] for content_hash in hashes])
+
+    def _remember(self, content_hash: bytes, vector: np.ndarray) -> np.ndarray:
+        vector = np.array(vector, dtype=VECTOR_DTYPE)
+        vector.flags.writeable = False
+        if self.memory_size:
+            self._memory[content_hash] = vector
+            if len(self._memory) > self.memory_size:
+                self._memory.popitem(last=False)
+        return vector
+
+    # Un fallo de la caché persistente no impide calcular los embeddings: solo se pierde
+    # el ahorro
+    async def _load(self, hashes: list[bytes]) -> dict[bytes, np.ndarray]:
+        session_factory = self._session_factory or get_async_sessionmaker()
+        try:
+            async with session_factory() as session:
+                return await SQLAlchemyEmbeddingCacheRepository(session).get_many(
+                    self.model, hashes
+                )
+        except Exception:
+            logger.warning(
+                "No se pudo leer la caché de embeddings",
+                exc_info=True,
+                extra={"model": self.model, "operation": "embedding_cache_get"},
+            )
+            return {}
+
+    async def _store(self, vectors: dict[bytes, np.ndarray]) -> None:
+        session_factory = self._session_factory or get_async_sessionmaker()
+        try:
+            async with session_factory() as session, session.begin():
+                await SQLAlchemyEmbeddingCacheRepository(session).put_many(self.model, vectors)
+        except Exception:
+            logger.warning(
+                "No se pudo guardar en la caché de embeddings",
+                exc_info=True,
+                extra={"model": self.model, "operation": "embedding_cache_put"},
+            )
@@ -0,0 +1,112 @@
+"""
+Embeddings de Gemini sobre la API REST `batchEmbedContents`, con un cliente httpx compartido
+como el proveedor de lenguaje de Gemini.
+
+Cada petición lleva como mucho `MAX_TEXTS_PER_REQUEST` textos (el límite de la API); una
+llamada con más textos se reparte en varias peticiones simultáneas, hasta `max_connections`.
+Se pide la dimensión configurada (`outputDimensionality`), que forma parte del identificador
+del modelo: vectores de distinta dimensión no comparten caché.
+"""
+
+import asyncio
+from collections.abc import Sequence
+
+import httpx
+import numpy as np
+import orjson
+
+from src.pkm_app.core.application.dtos.vector_index_dto import VECTOR_DTYPE
+from src.pkm_app.core.application.interfaces.embedding_interface import ITextEmbedder
+from src.pkm_app.infrastructure.config.settings import Settings
+
+
+class GeminiEmbedder(ITextEmbedder):
+    DEFAULT_URL = "https://generativelanguage.googleapis.com/v1beta"
+    DEFAULT_MAX_CONNECTIONS = 4
+    MAX_TEXTS_PER_REQUEST = 100
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str,
+        dimension: int,
+        *,
+        url: str = DEFAULT_URL,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        timeout: float = 60.0,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        if not api_key:
+            raise ValueError("Se requiere una clave de API de Gemini.")
+        if dimension < 1:
+            raise ValueError("dimension debe ser al menos 1")
+        self._model = model
+        self._dimension = dimension
+        self._requests = asyncio.Semaphore(max_connections)
+        self._client = httpx.AsyncClient(
+            base_url=url,
+            headers={"content-type": "application/json", "x-goog-api-key": api_key},
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections, max_keepalive_connections=max_connections
+            ),
+            transport=transport,
+        )
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "GeminiEmbedder":
+        return cls(
+            settings.GEMINI_API_KEY or "",
+            settings.EMBEDDING_MODEL,
+            settings.EMBEDDING_DIMENSION,
+            url=settings.GEMINI_URL,
+            max_connections=settings.LLM_MAX_CONCURRENCY,
+            timeout=settings.LLM_TIMEOUT_SECONDS,
+        )
+
+    @property
+    def model(self) -> str:
+        return f"{self._model}/{self._dimension}"
+
+    @property
+    def dimension(self) -> int:
+        return self._dimension
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+    async def embed(self, texts: Sequence[str]) -> np.ndarray:
+        if not texts:
+            return np.empty((0, self._dimension), dtype=VECTOR_DTYPE)
+        chunks = await asyncio.gather(
+            *(
+                self._embed(texts[start : start + self.MAX_TEXTS_PER_REQUEST])
+                for start in range(0, len(texts), self.MAX_TEXTS_PER_REQUEST)
+            )
+        )
+        return np.concatenate(chunks)
+
+    async def _embed(self, texts: Sequence[str]) -> np.ndarray:
+        body = {
+            "requests": [
+                {
+                    "model": f"models/{self._model}",
+                    "content": {"parts": [{"text": text}]},
+                    "outputDimensionality": self._dimension,
+                }
+                for text in texts
+            ]
+        }
+        async with self._requests:
+            response = await self._client.post(
+                f"/models/{self._model}:batchEmbedContents", content=orjson.dumps(body)
+            )
+        response.raise_for_status()
+        embeddings = orjson.loads(response.content)["embeddings"]
+        vectors = np.array([embedding["values"] for embedding in embeddings], dtype=VECTOR_DTYPE)
+        if vectors.shape != (len(texts), self._dimension):
+            raise ValueError(
+                f"Gemini devolvió vectores de forma {vectors.shape}; "
+                f"se esperaba ({len(texts)}, {self._dimension})."
+            )
+        return vectors
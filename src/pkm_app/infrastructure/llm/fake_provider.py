@@ -0,0 +1,72 @@
+"""
+Proveedor de modelos de lenguaje local y determinista, para tests, benchmarks y desarrollo
+sin red ni claves.
+
+La respuesta depende solo de la petición (salvo las respuestas fijadas en `responses`, por
+prompt) y los tokens se estiman a razón de cuatro caracteres por token. Registra los lotes
+que recibe y cuántas llamadas llegó a tener en curso a la vez.
+"""
+
+import asyncio
+import hashlib
+from collections.abc import Mapping, Sequence
+
+from src.pkm_app.core.application.context_packing import CHARS_PER_TOKEN, estimate_tokens
+from src.pkm_app.core.application.dtos import LLMRequest, LLMResponse
+from src.pkm_app.core.application.interfaces.llm_interface import ILLMProvider
+
+
+class FakeLLMProvider(ILLMProvider):
+    def __init__(
+        self,
+        *,
+        name: str = "fake",
+        max_batch_size: int = 16,
+        latency: float = 0.0,
+        responses: Mapping[str, str] | None = None,
+    ):
+        self._name = name
+        self._max_batch_size = max_batch_size
+        self.latency = latency
+        self.responses = dict(responses or {})
+        # Si se fija, la siguiente llamada la lanza (y se borra)
+        self.error: Exception | None = None
+        self.calls: list[list[LLMRequest]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def max_batch_size(self) -> int:
+        return self._max_batch_size
+
+    async def generate(self, requests: Sequence[LLMRequest]) -> list[LLMResponse]:
+        self.calls.append(list(requests))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self.latency:
+                await asyncio.sleep(self.latency)
+            if self.error is not None:
+                error, self.error = self.error, None
+                raise error
+            return [self._answer(request) for request in requests]
+        finally:
+            self.in_flight -= 1
+
+    def _answer(self, request: LLMRequest) -> LLMResponse:
+        text = self.responses.get(request.prompt)
+        if text is None:
+            digest = hashlib.sha256(request.model_dump_json().encode("utf-8")).hexdigest()
+            text = f"Respuesta simulada {digest[:16]} a: {request.prompt}"
+        if request.max_output_tokens is not None:
+            text = text[: request.max_output_tokens * CHARS_PER_TOKEN]
+        return LLMResponse(
+            text=text,
+            model=request.model,
+            input_tokens=estimate_tokens(request.prompt) + estimate_tokens(request.system or ""),
+            output_tokens=estimate_tokens(text),
+        )
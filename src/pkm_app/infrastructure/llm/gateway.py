@@ -0,0 +1,320 @@
+"""
+Gateway de modelos de lenguaje: el único camino de la aplicación hacia el proveedor.
+
+Cada petición determinista (temperatura 0) se identifica por el SHA-256 de su contenido
+(`request_key`) y se resuelve con el primer nivel que la tenga:
+
+1. Un LRU en memoria del proceso.
+2. Otra petición idéntica ya en curso (single-flight): se espera su respuesta en lugar de
+   repetir la llamada.
+3. La tabla `llm_response_cache`, compartida por todos los procesos.
+4. El proveedor.
+
+Las peticiones que llegan al proveedor se agrupan en lotes de hasta `max_batch_size` (los
+proveedores que no agrupan tienen 1); una petición suelta espera como mucho `batch_window`
+segundos a que otras completen su lote. Como mucho `max_concurrency` llamadas al proveedor
+están en curso a la vez; el resto espera su turno en el gateway. Las peticiones con
+temperatura mayor que 0 no se cachean ni se comparten, pero sí se agrupan y se limitan.
+"""
+
+import asyncio
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+
+import orjson
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.pkm_app.core.application.dtos import LLMRequest, LLMResponse, LLMUsage
+from src.pkm_app.core.application.interfaces.llm_interface import ILLMGateway, ILLMProvider
+from src.pkm_app.infrastructure.config.settings import Settings
+from src.pkm_app.infrastructure.llm.fake_provider import FakeLLMProvider
+from src.pkm_app.infrastructure.llm.gemini_provider import GeminiProvider
+from src.pkm_app.infrastructure.monitoring.collectors import (
+    CACHE_REQUESTS,
+    LLM_CALL_DURATION,
+    LLM_TOKENS,
+)
+from src.pkm_app.infrastructure.persistence.sqlalchemy.database import get_async_sessionmaker
+from src.pkm_app.infrastructure.persistence.sqlalchemy.repositories.llm_cache_repository import (
+    SQLAlchemyLLMResponseCacheRepository,
+)
+
+logger = logging.getLogger(__name__)
+
+_Batch = list[tuple[LLMRequest, "asyncio.Future[LLMResponse]"]]
+
+
+def request_key(provider: str, request: LLMRequest) -> bytes:
+    """SHA-256 de la petición y el proveedor: misma clave si y solo si es la misma petición."""
+    payload = {"provider": provider, **request.model_dump()}
+    return hashlib.sha256(orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)).digest()
+
+
+def _provider_from_settings(settings: Settings) -> ILLMProvider:
+    if settings.LLM_PROVIDER == "fake":
+        return FakeLLMProvider()
+    if settings.LLM_PROVIDER == "gemini":
+        return GeminiProvider.from_settings(settings)
+    raise ValueError(f"Proveedor de modelos de lenguaje desconocido: '{settings.LLM_PROVIDER}'")
+
+
+def _record(cache: str, hits: int, misses: int) -> None:
+    if hits:
+        CACHE_REQUESTS.inc(cache, "hit", amount=hits)
+    if misses:
+        CACHE_REQUESTS.inc(cache, "miss", amount=misses)
+
+
+class LLMGateway(ILLMGateway):
+    DEFAULT_MEMORY_SIZE = 1000
+    DEFAULT_MAX_CONCURRENCY = 4
+    DEFAULT_BATCH_WINDOW = 0.005
+
+    def __init__(
+        self,
+        provider: ILLMProvider,
+        session_factory: Callable[[], AsyncSession] | None = None,
+        *,
+        memory_size: int = DEFAULT_MEMORY_SIZE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        batch_window: float = DEFAULT_BATCH_WINDOW,
+        persistent_cache: bool = True,
+    ):
+        if memory_size < 0:
+            raise ValueError("El tamaño de la caché en memoria no puede ser negativo.")
+        if max_concurrency < 1 or provider.max_batch_size < 1:
+            raise ValueError("max_concurrency y max_batch_size deben ser al menos 1.")
+        if batch_window < 0:
+            raise ValueError("batch_window no puede ser negativo.")
+        self.provider = provider
+        self.memory_size = memory_size
+        self.batch_window = batch_window
+        self.persistent_cache = persistent_cache
+        self._memory: OrderedDict[bytes, LLMResponse] = OrderedDict()
+        self._in_flight: dict[bytes, asyncio.Future[LLMResponse]] = {}
+        self._queue: _Batch = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._calls: set[asyncio.Task] = set()
+        self._limiter = asyncio.Semaphore(max_concurrency)
+        self._usage: dict[str, int | float] = {name: 0 for name in LLMUsage.model_fields}
+        # Si no se indica, se usa el sessionmaker global en la primera consulta
+        self._session_factory = session_factory
+
+    @classmethod
+    def from_settings(
+        cls, settings: Settings, provider: ILLMProvider | None = None
+    ) -> "LLMGateway":
+        if provider is None:
+            provider = _provider_from_settings(settings)
+        return cls(
+            provider,
+            memory_size=settings.LLM_MEMORY_CACHE_SIZE,
+            max_concurrency=settings.LLM_MAX_CONCURRENCY,
+            batch_window=settings.LLM_BATCH_WINDOW_MS / 1000,
+            persistent_cache=settings.LLM_PERSISTENT_CACHE,
+        )
+
+    def usage(self) -> LLMUsage:
+        return LLMUsage(**self._usage)
+
+    async def generate(self, request: LLMRequest) -> LLMResponse:
+        return (await self.generate_many([request]))[0]
+
+    async def generate_many(self, requests: Sequence[LLMRequest]) -> list[LLMResponse]:
+        loop = asyncio.get_running_loop()
+        self._usage["requests"] += len(requests)
+        keys = [
+            request_key(self.provider.name, request) if request.deterministic else None
+            for request in requests
+        ]
+
+        # Se clasifican (y se registran como en curso) sin ceder el bucle: una petición
+        # idéntica que llegue después ya encuentra la suya
+        found: dict[bytes, LLMResponse] = {}
+        joined: dict[bytes, asyncio.Future[LLMResponse]] = {}
+        owned: dict[bytes, asyncio.Future[LLMResponse]] = {}
+        for key in keys:
+            if key is None or key in found or key in joined or key in owned:
+                continue
+            if (response := self._memory.get(key)) is not None:
+                self._memory.move_to_end(key)
+                found[key] = response
+            elif (future := self._in_flight.get(key)) is not None:
+                joined[key] = future
+            else:
+                owned[key] = self._in_flight[key] = loop.create_future()
+        _record("llm_memory", len(found), len(joined) + len(owned))
+        self._usage["memory_hits"] += sum(1 for key in keys if key in found)
+
+        try:
+            return await self._resolve(requests, keys, found, joined, owned)
+        finally:
+            for key, future in owned.items():
+                if self._in_flight.get(key) is future:
+                    del self._in_flight[key]
+                # Si la llamada se cancela, quien esperaba su respuesta recibe un error
+                if not future.done():
+                    future.set_exception(RuntimeError("La petición idéntica no terminó."))
+                    future.exception()
+
+    async def _resolve(
+        self,
+        requests: Sequence[LLMRequest],
+        keys: list[bytes | None],
+        found: dict[bytes, LLMResponse],
+        joined: dict[bytes, "asyncio.Future[LLMResponse]"],
+        owned: dict[bytes, "asyncio.Future[LLMResponse]"],
+    ) -> list[LLMResponse]:
+        missing = dict(owned)
+        if missing and self.persistent_cache:
+            stored = await self._load(list(missing))
+            _record("llm_database", len(stored), len(missing) - len(stored))
+            self._usage["database_hits"] += sum(1 for key in keys if key in stored)
+            for key, response in stored.items():
+                found[key] = self._remember(key, response)
+                missing.pop(key).set_result(found[key])
+
+        # Todas las peticiones de la llamada entran en la cola antes de esperar ninguna, para
+        # que compartan lotes
+        first = {key: position for position, key in reversed(list(enumerate(keys)))}
+        calls = {
+            position: self._submit(request)
+            for position, (key, request) in enumerate(zip(keys, requests))
+            if key is None or (key in missing and first[key] == position)
+        }
+        self._usage["shared"] += sum(1 for key in keys if key in joined or key in missing)
+        self._usage["shared"] -= len(missing)
+
+        outcomes = await asyncio.gather(
+            *calls.values(),
+            *(asyncio.shield(future) for future in joined.values()),
+            return_exceptions=True,
+        )
+        results = dict(zip([*calls, *joined], outcomes))
+        computed: dict[bytes, LLMResponse] = {}
+        for key, future in missing.items():
+            outcome = results[first[key]]
+            if isinstance(outcome, BaseException):
+                future.set_exception(outcome)
+                # Marca la excepción como recuperada aunque nadie más esperase esta petición
+                future.exception()
+                continue
+            computed[key] = outcome
+            found[key] = self._remember(key, outcome)
+            future.set_result(found[key])
+        if computed and self.persistent_cache:
+            await self._store(computed)
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                raise outcome
+        for key in joined:
+            found[key] = results[key]
+
+        # Quien hizo la llamada recibe la respuesta del proveedor tal cual; el resto de
+        # posiciones, la copia marcada como cacheada
+        return [
+            results[position] if position in calls else found[key]
+            for position, key in enumerate(keys)
+        ]
+
+    def _remember(self, key: bytes, response: LLMResponse) -> LLMResponse:
+        response = response.model_copy(update={"cached": True})
+        if self.memory_size:
+            self._memory[key] = response
+            if len(self._memory) > self.memory_size:
+                self._memory.popitem(last=False)
+        return response
+
+    # --- Lotes y límite de concurrencia ---
+
+    def _submit(self, request: LLMRequest) -> "asyncio.Future[LLMResponse]":
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[LLMResponse] = loop.create_future()
+        self._queue.append((request, future))
+        if len(self._queue) >= self.provider.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.batch_window, self._flush)
+        return future
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        size = self.provider.max_batch_size
+        while self._queue:
+            batch, self._queue = self._queue[:size], self._queue[size:]
+            task = asyncio.create_task(self._call(batch))
+            self._calls.add(task)
+            task.add_done_callback(self._calls.discard)
+
+    async def _call(self, batch: _Batch) -> None:
+        requests = [request for request, _ in batch]
+        async with self._limiter:
+            start = time.perf_counter()
+            try:
+                responses = await self.provider.generate(requests)
+                if len(responses) != len(requests):
+                    raise ValueError(
+                        f"El proveedor '{self.provider.name}' devolvió {len(responses)} "
+                        f"respuestas para {len(requests)} peticiones."
+                    )
+            except Exception as e:
+                elapsed = time.perf_counter() - start
+                LLM_CALL_DURATION.observe(elapsed, self.provider.name, type(e).__name__)
+                self._usage["failed_calls"] += 1
+                self._usage["provider_seconds"] += elapsed
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                return
+        elapsed = time.perf_counter() - start
+        LLM_CALL_DURATION.observe(elapsed, self.provider.name, "success")
+        self._usage["provider_calls"] += 1
+        self._usage["provider_requests"] += len(requests)
+        self._usage["provider_seconds"] += elapsed
+        for (_, future), response in zip(batch, responses):
+            self._usage["input_tokens"] += response.input_tokens
+            self._usage["output_tokens"] += response.output_tokens
+            for kind, tokens in (
+                ("input", response.input_tokens),
+                ("output", response.output_tokens),
+            ):
+                LLM_TOKENS.inc(self.provider.name, response.model, kind, amount=tokens)
+            if not future.done():
+                future.set_result(response)
+
+    # --- Caché persistente ---
+
+    # Un fallo de la caché persistente no impide llamar al proveedor: solo se pierde el
+    # ahorro. Eso incluye no tener base de datos configurada (get_async_sessionmaker lanza
+    # ValueError), así que la fábrica se pide dentro del try
+    async def _load(self, keys: list[bytes]) -> dict[bytes, LLMResponse]:
+        try:
+            session_factory = self._session_factory or get_async_sessionmaker()
+            async with session_factory() as session:
+                return await SQLAlchemyLLMResponseCacheRepository(session).get_many(keys)
+        except Exception:
+            logger.warning(
+                "No se pudo leer la caché de respuestas de modelos",
+                exc_info=True,
+                extra={"provider": self.provider.name, "operation": "llm_cache_get"},
+            )
+            return {}
+
+    async def _store(self, responses: dict[bytes, LLMResponse]) -> None:
+        try:
+            session_factory = self._session_factory or get_async_sessionmaker()
+            async with session_factory() as session, session.begin():
+                await SQLAlchemyLLMResponseCacheRepository(session).put_many(
+                    self.provider.name, responses
+                )
+        except Exception:
+            logger.warning(
+                "No se pudo guardar en la caché de respuestas de modelos",
+                exc_info=True,
+                extra={"provider": self.provider.name, "operation": "llm_cache_put"},
+            )
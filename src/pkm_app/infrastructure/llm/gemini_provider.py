@@ -0,0 +1,93 @@
+"""
+Proveedor Gemini sobre la API REST `generateContent` (la misma que envuelve `google-genai`),
+con un cliente httpx compartido como el índice de Qdrant.
+
+`generateContent` recibe un único prompt, así que `max_batch_size` es 1: el gateway no
+agrupa sus peticiones, solo las reparte entre sus llamadas concurrentes. Los tokens son los
+de `usageMetadata`, los que factura Google.
+"""
+
+import asyncio
+from collections.abc import Sequence
+from typing import Any
+
+import httpx
+import orjson
+
+from src.pkm_app.core.application.dtos import LLMRequest, LLMResponse
+from src.pkm_app.core.application.interfaces.llm_interface import ILLMProvider
+from src.pkm_app.infrastructure.config.settings import Settings
+
+
+class GeminiProvider(ILLMProvider):
+    DEFAULT_URL = "https://generativelanguage.googleapis.com/v1beta"
+    DEFAULT_MAX_CONNECTIONS = 8
+
+    def __init__(
+        self,
+        api_key: str,
+        *,
+        url: str = DEFAULT_URL,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        timeout: float = 60.0,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        if not api_key:
+            raise ValueError("Se requiere una clave de API de Gemini.")
+        self._client = httpx.AsyncClient(
+            base_url=url,
+            headers={"content-type": "application/json", "x-goog-api-key": api_key},
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections, max_keepalive_connections=max_connections
+            ),
+            transport=transport,
+        )
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "GeminiProvider":
+        return cls(
+            settings.GEMINI_API_KEY or "",
+            url=settings.GEMINI_URL,
+            max_connections=settings.LLM_MAX_CONCURRENCY,
+            timeout=settings.LLM_TIMEOUT_SECONDS,
+        )
+
+    @property
+    def name(self) -> str:
+        return "gemini"
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+    async def generate(self, requests: Sequence[LLMRequest]) -> list[LLMResponse]:
+        return list(await asyncio.gather(*(self._generate(request) for request in requests)))
+
+    async def _generate(self, request: LLMRequest) -> LLMResponse:
+        response = await self._client.post(
+            f"/models/{request.model}:generateContent", content=orjson.dumps(_body(request))
+        )
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+        candidates = data.get("candidates") or [{}]
+        parts = candidates[0].get("content", {}).get("parts", [])
+        usage = data.get("usageMetadata", {})
+        return LLMResponse(
+            text="".join(part.get("text", "") for part in parts),
+            model=data.get("modelVersion") or request.model,
+            input_tokens=usage.get("promptTokenCount", 0),
+            output_tokens=usage.get("candidatesTokenCount", 0),
+        )
+
+
+def _body(request: LLMRequest) -> dict[str, Any]:
+    config: dict[str, Any] = {"temperature": request.temperature}
+    if request.max_output_tokens is not None:
+        config["maxOutputTokens"] = request.max_output_tokens
+    body: dict[str, Any] = {
+        "contents": [{"role": "user", "parts": [{"text": request.prompt}]}],
+        "generationConfig": config,
+    }
+    if request.system:
+        body["systemInstruction"] = {"parts": [{"text": request.system}]}
+    return body
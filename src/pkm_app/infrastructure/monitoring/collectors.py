@@ -0,0 +1,274 @@
+"""
+Métricas de la aplicación: casos de uso, repositorios, cachés y pools de conexiones.
+
+- `pkm_use_case_duration_seconds{use_case, outcome}`: se alimenta de las operaciones de
+  `core.application.operations` (los `execute` marcados con `@traced_use_case`). `outcome`
+  es `success` o el nombre de la excepción (`NoteNotFoundError`, `RepositoryError`, ...).
+- `pkm_repository_duration_seconds{repository, method, outcome}`: métodos públicos de las
+  clases marcadas con `@timed_repository`.
+- `pkm_cache_requests_total{cache, result}` y `pkm_cache_hit_ratio{cache}`: cachés que
+  informan con `record_cache()` y funciones `lru_cache` dadas de alta con
+  `register_function_cache()`.
+- `pkm_db_pool_*{engine, role}`: pools registrados con `register_pool()`; la saturación es la
+  fracción de la capacidad (`pool_size + max_overflow`) en uso.
+- `pkm_outbox_*{relay}`: relays del outbox; `pkm_outbox_lag_seconds` es la antigüedad del
+  mensaje más antiguo del último lote reclamado (0 si el outbox estaba vacío).
+- `pkm_llm_*{provider, ...}`: llamadas del gateway de modelos de lenguaje a su proveedor
+  (cada una puede llevar un lote de peticiones) y tokens facturados por modelo.
+"""
+
+import functools
+import inspect
+import time
+import weakref
+from collections.abc import Callable, Iterator
+from typing import Any, Protocol, TypeVar
+
+from src.pkm_app.core.application.operations import Operation, add_operation_observer
+from src.pkm_app.infrastructure.monitoring.metrics import (
+    Counter,
+    Gauge,
+    Histogram,
+    Samples,
+    metrics_enabled,
+)
+
+T = TypeVar("T", bound=type)
+
+USE_CASE_DURATION = Histogram(
+    "pkm_use_case_duration_seconds",
+    "Duración de los casos de uso por resultado.",
+    ("use_case", "outcome"),
+)
+REPOSITORY_DURATION = Histogram(
+    "pkm_repository_duration_seconds",
+    "Duración de los métodos de repositorio por resultado.",
+    ("repository", "method", "outcome"),
+)
+
+
+def _outcome(error: BaseException | None) -> str:
+    return "success" if error is None else type(error).__name__
+
+
+# --- Casos de uso ---
+
+
+class _UseCaseMetricsObserver:
+    def operation_started(self, operation: Operation) -> None:
+        pass
+
+    def operation_finished(self, operation: Operation, error: BaseException | None) -> None:
+        if operation.kind == "use_case":
+            USE_CASE_DURATION.observe(operation.elapsed, operation.name, _outcome(error))
+
+
+add_operation_observer(_UseCaseMetricsObserver())
+
+
+# --- Repositorios ---
+
+
+def _timed(method: Callable[..., Any]) -> Callable[..., Any]:
+    method_name = method.__name__
+
+    @functools.wraps(method)
+    async def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        if not metrics_enabled():
+            return await method(self, *args, **kwargs)
+        start = time.perf_counter()
+        error: BaseException | None = None
+        try:
+            return await method(self, *args, **kwargs)
+        except BaseException as exc:
+            error = exc
+            raise
+        finally:
+            REPOSITORY_DURATION.observe(
+                time.perf_counter() - start, type(self).__name__, method_name, _outcome(error)
+            )
+
+    return wrapper
+
+
+def timed_repository(cls: T) -> T:
+    """Decorador de clase: mide los métodos `async` públicos definidos en `cls`."""
+    for name, attribute in list(vars(cls).items()):
+        if not name.startswith("_") and inspect.iscoroutinefunction(attribute):
+            setattr(cls, name, _timed(attribute))
+    return cls
+
+
+# --- Cachés ---
+
+_function_caches: dict[str, Callable[..., Any]] = {}
+
+
+def register_function_cache(name: str, function: Callable[..., Any]) -> None:
+    """Exporta los aciertos y fallos de una función decorada con `lru_cache`/`cache`."""
+    if not hasattr(function, "cache_info"):
+        raise ValueError(f"'{name}' no es una función con caché (falta cache_info).")
+    _function_caches[name] = function
+
+
+def _collect_function_caches() -> Samples:
+    for name, function in list(_function_caches.items()):
+        info = function.cache_info()  # type: ignore[attr-defined]
+        yield (name, "hit"), float(info.hits)
+        yield (name, "miss"), float(info.misses)
+
+
+CACHE_REQUESTS = Counter(
+    "pkm_cache_requests_total",
+    "Consultas a cachés por resultado (hit/miss).",
+    ("cache", "result"),
+    collect=_collect_function_caches,
+)
+
+
+def record_cache(cache: str, hit: bool) -> None:
+    CACHE_REQUESTS.inc(cache, "hit" if hit else "miss")
+
+
+def _collect_cache_hit_ratio() -> Samples:
+    requests: dict[str, dict[str, float]] = {}
+    for (cache, result), value in CACHE_REQUESTS.values().items():
+        requests.setdefault(cache, {})[result] = value
+    for cache, counts in requests.items():
+        total = counts.get("hit", 0.0) + counts.get("miss", 0.0)
+        if total:
+            yield (cache,), counts.get("hit", 0.0) / total
+
+
+Gauge(
+    "pkm_cache_hit_ratio",
+    "Fracción de aciertos acumulada de cada caché.",
+    ("cache",),
+    collect=_collect_cache_hit_ratio,
+)
+
+
+# --- Pools de conexiones ---
+
+
+class PoolStats(Protocol):
+    def snapshot(self) -> dict[str, float]: ...
+
+    def capacity(self) -> float: ...
+
+
+_pools: list[tuple[tuple[str, str], "weakref.ref[PoolStats]"]] = []
+
+
+def register_pool(engine: str, role: str, stats: PoolStats) -> None:
+    """Exporta las métricas de un pool mientras `stats` siga vivo (se guarda una weakref)."""
+    _pools[:] = [(labels, ref) for labels, ref in _pools if ref() is not None]
+    _pools.append(((engine, role), weakref.ref(stats)))
+
+
+def _live_pools() -> Iterator[tuple[tuple[str, str], PoolStats]]:
+    for labels, ref in list(_pools):
+        stats = ref()
+        if stats is not None:
+            yield labels, stats
+
+
+def _pool_collector(key: str) -> Callable[[], Samples]:
+    def collect() -> Samples:
+        for labels, stats in _live_pools():
+            yield labels, stats.snapshot()[key]
+
+    return collect
+
+
+def _collect_pool_saturation() -> Samples:
+    for labels, stats in _live_pools():
+        capacity = stats.capacity()
+        yield labels, stats.snapshot()["checked_out"] / capacity if capacity else 0.0
+
+
+_POOL_LABELS = ("engine", "role")
+Gauge(
+    "pkm_db_pool_size",
+    "Conexiones persistentes del pool.",
+    _POOL_LABELS,
+    collect=_pool_collector("pool_size"),
+)
+Gauge(
+    "pkm_db_pool_checked_out",
+    "Conexiones prestadas en este momento.",
+    _POOL_LABELS,
+    collect=_pool_collector("checked_out"),
+)
+Gauge(
+    "pkm_db_pool_overflow",
+    "Conexiones abiertas por encima de pool_size.",
+    _POOL_LABELS,
+    collect=_pool_collector("overflow"),
+)
+Gauge(
+    "pkm_db_pool_saturation",
+    "Fracción de la capacidad del pool (pool_size + max_overflow) en uso.",
+    _POOL_LABELS,
+    collect=_collect_pool_saturation,
+)
+Counter(
+    "pkm_db_pool_wait_seconds_total",
+    "Tiempo total de espera para obtener una conexión.",
+    _POOL_LABELS,
+    collect=_pool_collector("wait_time_total"),
+)
+Counter(
+    "pkm_db_pool_timeouts_total",
+    "Esperas de conexión que agotaron pool_timeout.",
+    _POOL_LABELS,
+    collect=_pool_collector("timeouts"),
+)
+
+
+# --- Outbox ---
+
+OUTBOX_MESSAGES = Counter(
+    "pkm_outbox_messages_total",
+    "Mensajes del outbox por resultado (delivered, coalesced, failed).",
+    ("relay", "result"),
+)
+OUTBOX_BATCH_DURATION = Histogram(
+    "pkm_outbox_batch_duration_seconds",
+    "Duración de cada lote del relay (reclamar, entregar y confirmar) por resultado.",
+    ("relay", "outcome"),
+)
+OUTBOX_DELIVERY_LAG = Histogram(
+    "pkm_outbox_delivery_lag_seconds",
+    "Tiempo desde que se escribe un mensaje hasta que se entrega.",
+    ("relay",),
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 300, 900),
+)
+_outbox_lag: dict[str, float] = {}
+
+
+def record_outbox_lag(relay: str, seconds: float) -> None:
+    _outbox_lag[relay] = seconds
+
+
+Gauge(
+    "pkm_outbox_lag_seconds",
+    "Antigüedad del mensaje más antiguo del último lote reclamado por el relay.",
+    ("relay",),
+    collect=lambda: (((relay,), seconds) for relay, seconds in list(_outbox_lag.items())),
+)
+
+
+# --- Modelos de lenguaje ---
+
+LLM_CALL_DURATION = Histogram(
+    "pkm_llm_call_duration_seconds",
+    "Duración de las llamadas al proveedor de modelos de lenguaje por resultado.",
+    ("provider", "outcome"),
+    buckets=(0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120),
+)
+LLM_TOKENS = Counter(
+    "pkm_llm_tokens_total",
+    "Tokens facturados por el proveedor de modelos de lenguaje (input/output).",
+    ("provider", "model", "kind"),
+)
@@ -0,0 +1,290 @@
+"""
+Métricas en el formato de texto de Prometheus, sin dependencias externas.
+
+Contadores e histogramas agregan por hilo: cada hilo escribe en su propio fragmento
+(`threading.local`) sin tomar ningún lock, y los fragmentos se suman al exportar. El lock
+solo se usa la primera vez que un hilo registra una métrica. Los valores que ya lleva otra
+pieza (pools, cachés de funciones) se leen al exportar mediante un callback `collect`.
+
+Los valores de las etiquetas se pasan en posición, en el orden de `labelnames`:
+
+    USE_CASE_DURATION.observe(0.012, "GetNoteUseCase", "success")
+
+`set_metrics_enabled(False)` convierte todas las operaciones de registro en no-ops.
+"""
+
+import math
+import re
+import threading
+from bisect import bisect_left
+from collections.abc import Callable, Iterable, Sequence
+
+Labels = tuple[str, ...]
+Samples = Iterable[tuple[Labels, float]]
+
+DEFAULT_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)  # fmt: skip
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+_METRIC_NAME = re.compile(r"^[a-zA-Z_:][a-zA-Z0-9_:]*$")
+_LABEL_NAME = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*$")
+
+_enabled = True
+
+
+def set_metrics_enabled(enabled: bool) -> None:
+    global _enabled
+    _enabled = enabled
+
+
+def metrics_enabled() -> bool:
+    return _enabled
+
+
+class MetricsRegistry:
+    """Conjunto de métricas que se exportan juntas."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, "_Metric"] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: "_Metric") -> None:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"La métrica '{metric.name}' ya está registrada.")
+            self._metrics[metric.name] = metric
+
+    def get(self, name: str) -> "_Metric | None":
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        """Todas las métricas en el formato de exposición de texto de Prometheus."""
+        lines: list[str] = []
+        for metric in list(self._metrics.values()):
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(str(value))}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+class _Metric:
+    type_name = "untyped"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        registry: MetricsRegistry | None = REGISTRY,
+    ) -> None:
+        if not _METRIC_NAME.match(name):
+            raise ValueError(f"Nombre de métrica no válido: '{name}'.")
+        for label in labelnames:
+            if not _LABEL_NAME.match(label) or label == "le":
+                raise ValueError(f"Nombre de etiqueta no válido: '{label}'.")
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._local = threading.local()
+        self._shards: list[dict] = []
+        self._shards_lock = threading.Lock()
+        if registry is not None:
+            registry.register(self)
+
+    def _shard(self) -> dict:
+        """Fragmento del hilo actual (se crea y registra la primera vez)."""
+        try:
+            return self._local.shard  # type: ignore[no-any-return]
+        except AttributeError:
+            shard: dict = {}
+            with self._shards_lock:
+                self._shards.append(shard)
+            self._local.shard = shard
+            return shard
+
+    def _shard_snapshots(self) -> list[dict]:
+        with self._shards_lock:
+            shards = list(self._shards)
+        # dict.copy() es atómico bajo el GIL aunque otro hilo esté escribiendo
+        return [shard.copy() for shard in shards]
+
+    def _check_labels(self, labels: Labels) -> None:
+        if len(labels) != len(self.labelnames):
+            raise ValueError(
+                f"'{self.name}' espera las etiquetas {self.labelnames}, recibió {labels}."
+            )
+
+    def _header(self) -> list[str]:
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}",
+        ]
+
+    def render(self) -> list[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Contador monótono. `collect` añade valores que se leen al exportar."""
+
+    type_name = "counter"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        registry: MetricsRegistry | None = REGISTRY,
+        collect: Callable[[], Samples] | None = None,
+    ) -> None:
+        if not name.endswith("_total"):
+            raise ValueError(f"El nombre de un contador debe terminar en '_total': '{name}'.")
+        super().__init__(name, documentation, labelnames, registry)
+        self._collect = collect
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        if not _enabled:
+            return
+        shard = self._shard()
+        shard[labels] = shard.get(labels, 0.0) + amount
+
+    def values(self) -> dict[Labels, float]:
+        totals: dict[Labels, float] = {}
+        for shard in self._shard_snapshots():
+            for labels, value in shard.items():
+                totals[labels] = totals.get(labels, 0.0) + value
+        if self._collect is not None:
+            for labels, value in self._collect():
+                totals[labels] = totals.get(labels, 0.0) + value
+        return totals
+
+    def render(self) -> list[str]:
+        lines = self._header()
+        for labels, value in sorted(self.values().items()):
+            self._check_labels(labels)
+            lines.append(
+                f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+            )
+        return lines
+
+
+class Gauge(_Metric):
+    """Valor instantáneo calculado al exportar por `collect`."""
+
+    type_name = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        registry: MetricsRegistry | None = REGISTRY,
+        *,
+        collect: Callable[[], Samples],
+    ) -> None:
+        super().__init__(name, documentation, labelnames, registry)
+        self._collect = collect
+
+    def values(self) -> dict[Labels, float]:
+        # Las muestras con las mismas etiquetas (ej. dos engines iguales) se suman
+        totals: dict[Labels, float] = {}
+        for labels, value in self._collect():
+            totals[labels] = totals.get(labels, 0.0) + value
+        return totals
+
+    def render(self) -> list[str]:
+        lines = self._header()
+        for labels, value in sorted(self.values().items()):
+            self._check_labels(labels)
+            lines.append(
+                f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+            )
+        return lines
+
+
+class Histogram(_Metric):
+    """Histograma de buckets fijos (`le`), con `_sum` y `_count`."""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        registry: MetricsRegistry | None = REGISTRY,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        buckets = tuple(float(bound) for bound in buckets if not math.isinf(bound))
+        if not buckets or list(buckets) != sorted(set(buckets)):
+            raise ValueError("Los buckets deben ser crecientes y sin repetidos.")
+        super().__init__(name, documentation, labelnames, registry)
+        self.buckets = buckets
+
+    def observe(self, value: float, *labels: str) -> None:
+        if not _enabled:
+            return
+        shard = self._shard()
+        # [cuenta por bucket (no acumulada)..., cuenta de +Inf, suma]
+        data = shard.get(labels)
+        if data is None:
+            data = shard[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+        data[bisect_left(self.buckets, value)] += 1
+        data[-1] += value
+
+    def values(self) -> dict[Labels, tuple[list[int], float]]:
+        """Por etiquetas: cuentas acumuladas por bucket (la última es +Inf) y suma."""
+        merged: dict[Labels, list] = {}
+        for shard in self._shard_snapshots():
+            for labels, data in shard.items():
+                data = list(data)
+                total = merged.get(labels)
+                if total is None:
+                    merged[labels] = data
+                else:
+                    merged[labels] = [a + b for a, b in zip(total, data)]
+        result: dict[Labels, tuple[list[int], float]] = {}
+        for labels, data in merged.items():
+            cumulative, running = [], 0
+            for count in data[:-1]:
+                running += count
+                cumulative.append(running)
+            result[labels] = (cumulative, data[-1])
+        return result
+
+    def render(self) -> list[str]:
+        lines = self._header()
+        bounds = [*map(_format_value, self.buckets), "+Inf"]
+        for labels, (cumulative, total) in sorted(self.values().items()):
+            self._check_labels(labels)
+            names = (*self.labelnames, "le")
+            for bound, count in zip(bounds, cumulative):
+                lines.append(
+                    f"{self.name}_bucket{_format_labels(names, (*labels, bound))} {count}"
+                )
+            label_text = _format_labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{label_text} {_format_value(total)}")
+            lines.append(f"{self.name}_count{label_text} {cumulative[-1]}")
+        return lines
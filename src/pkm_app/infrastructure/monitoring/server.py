@@ -0,0 +1,47 @@
+"""
+Endpoint HTTP `/metrics` con las métricas en formato de texto de Prometheus.
+
+`start_metrics_server(port)` lo sirve desde un hilo en segundo plano con la librería
+estándar, independiente del bucle de eventos de la aplicación. Si la aplicación ya tiene un
+servidor web, basta con devolver `REGISTRY.render()` con el `CONTENT_TYPE` de `metrics.py`.
+"""
+
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from src.pkm_app.infrastructure.monitoring import collectors  # noqa: F401 (registra las métricas)
+from src.pkm_app.infrastructure.monitoring.metrics import CONTENT_TYPE, REGISTRY, MetricsRegistry
+
+logger = logging.getLogger(__name__)
+
+
+def _handler_for(registry: MetricsRegistry) -> type[BaseHTTPRequestHandler]:
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:  # noqa: N802 (nombre impuesto por BaseHTTPRequestHandler)
+            if self.path.split("?", 1)[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = registry.render().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: object) -> None:
+            logger.debug("Petición de métricas: " + format, *args)
+
+    return MetricsHandler
+
+
+def start_metrics_server(
+    port: int, host: str = "0.0.0.0", registry: MetricsRegistry = REGISTRY
+) -> ThreadingHTTPServer:
+    """Arranca el servidor en un hilo daemon; `shutdown()` sobre el resultado lo detiene."""
+    server = ThreadingHTTPServer((host, port), _handler_for(registry))
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, name="metrics-server", daemon=True)
+    thread.start()
+    logger.info("Métricas disponibles en http://%s:%s/metrics", host, server.server_port)
+    return server
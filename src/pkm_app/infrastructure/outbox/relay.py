@@ -0,0 +1,187 @@
+"""
+Relay del outbox de notas: drena `note_outbox` por lotes y los entrega a un `INoteIndexSink`.
+
+Cada lote es una transacción: reclamar mensajes con `FOR UPDATE SKIP LOCKED` (varios relays
+pueden trabajar a la vez sin pisarse), leer el estado actual de las notas, entregar y
+eliminar los mensajes. Si la entrega falla, los mensajes se aplazan con backoff exponencial;
+si el relay cae antes del commit, vuelven a estar disponibles. La entrega es por tanto al
+menos una vez y el destino debe ser idempotente (ver `INoteIndexSink`).
+
+Los mensajes no llevan el contenido de la nota, así que todos los de una misma nota dentro
+de un lote se reducen a una sola entrega con su estado actual.
+"""
+
+import asyncio
+import contextlib
+import logging
+import time
+import uuid
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.pkm_app.core.application.dtos import (
+    NoteIndexBatch,
+    NoteIndexDocument,
+    NoteIndexTombstone,
+    OutboxMessage,
+)
+from src.pkm_app.core.application.interfaces.outbox_interface import (
+    INoteIndexSink,
+    IOutboxRepository,
+)
+from src.pkm_app.infrastructure.monitoring.collectors import (
+    OUTBOX_BATCH_DURATION,
+    OUTBOX_DELIVERY_LAG,
+    OUTBOX_MESSAGES,
+    record_outbox_lag,
+)
+from src.pkm_app.infrastructure.persistence.sqlalchemy.database import get_async_sessionmaker
+from src.pkm_app.infrastructure.persistence.sqlalchemy.repositories.outbox_repository import (
+    SQLAlchemyOutboxRepository,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RelayBatchResult:
+    claimed: int = 0
+    delivered: int = 0
+    failed: int = 0
+
+
+def latest_by_note(messages: Sequence[OutboxMessage]) -> dict[uuid.UUID, OutboxMessage]:
+    """Último mensaje de cada nota (los mensajes llegan ordenados por `id`)."""
+    return {message.note_id: message for message in messages}
+
+
+def coalesce(
+    latest: dict[uuid.UUID, OutboxMessage], documents: Sequence[NoteIndexDocument]
+) -> NoteIndexBatch:
+    """
+    Una entrega por nota: su estado actual si existe, o una lápida si su último mensaje es
+    un borrado. Una nota que ya no existe y cuyo último mensaje es un alta/actualización se
+    omite: su borrado está en otro mensaje (de este relay o de otro).
+    """
+    current = {document.note_id: document for document in documents}
+    upserts: list[NoteIndexDocument] = []
+    deletes: list[NoteIndexTombstone] = []
+    for note_id, message in latest.items():
+        if message.operation == "delete":
+            deletes.append(
+                NoteIndexTombstone(
+                    note_id=note_id, user_id=message.user_id, version=message.version
+                )
+            )
+        elif (document := current.get(note_id)) is not None:
+            upserts.append(document)
+    return NoteIndexBatch(upserts=upserts, deletes=deletes)
+
+
+class OutboxRelay:
+    DEFAULT_BATCH_SIZE = 200
+    BASE_RETRY_DELAY = timedelta(seconds=1)
+    MAX_RETRY_DELAY = timedelta(minutes=5)
+
+    def __init__(
+        self,
+        sink: INoteIndexSink,
+        session_factory: Callable[[], AsyncSession] | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        name: str = "vector_store",
+    ):
+        if batch_size <= 0:
+            raise ValueError("El tamaño de lote del relay debe ser positivo.")
+        self.sink = sink
+        self.batch_size = batch_size
+        self.name = name
+        # Si no se indica, se usa el sessionmaker global al procesar el primer lote
+        self._session_factory = session_factory
+
+    def _retry_delay(self, attempts: int) -> timedelta:
+        return min(self.BASE_RETRY_DELAY * 2 ** (attempts - 1), self.MAX_RETRY_DELAY)
+
+    async def run_once(self) -> RelayBatchResult:
+        """Procesa un lote: mensajes reclamados, entregas hechas y mensajes aplazados."""
+        session_factory = self._session_factory or get_async_sessionmaker()
+        start = time.perf_counter()
+        outcome = "success"
+        try:
+            async with session_factory() as session, session.begin():
+                result, messages = await self._process(SQLAlchemyOutboxRepository(session))
+            if result.failed:
+                outcome = "failed"
+            elif messages:
+                now = datetime.now(UTC)
+                for message in messages:
+                    lag = (now - message.created_at).total_seconds()
+                    OUTBOX_DELIVERY_LAG.observe(lag, self.name)
+                OUTBOX_MESSAGES.inc(self.name, "delivered", amount=result.delivered)
+                OUTBOX_MESSAGES.inc(
+                    self.name, "coalesced", amount=result.claimed - result.delivered
+                )
+            return result
+        except BaseException as exc:
+            outcome = type(exc).__name__
+            raise
+        finally:
+            OUTBOX_BATCH_DURATION.observe(time.perf_counter() - start, self.name, outcome)
+
+    async def _process(
+        self, outbox: IOutboxRepository
+    ) -> tuple[RelayBatchResult, list[OutboxMessage]]:
+        messages = await outbox.claim_batch(self.batch_size)
+        now = datetime.now(UTC)
+        record_outbox_lag(
+            self.name, (now - messages[0].created_at).total_seconds() if messages else 0.0
+        )
+        if not messages:
+            return RelayBatchResult(), messages
+
+        latest = latest_by_note(messages)
+        upserted = [note_id for note_id, m in latest.items() if m.operation == "upsert"]
+        batch = coalesce(latest, await outbox.get_documents(upserted))
+        message_ids = [message.id for message in messages]
+        try:
+            if len(batch):
+                await self.sink.apply(batch)
+        except Exception as exc:
+            attempts = max(message.attempts for message in messages) + 1
+            retry_at = now + self._retry_delay(attempts)
+            logger.warning(
+                "Fallo al entregar %s mensajes del outbox (intento %s); se reintentará a las %s",
+                len(messages),
+                attempts,
+                retry_at.isoformat(),
+                exc_info=True,
+                extra={"relay": self.name, "operation": "outbox_relay"},
+            )
+            await outbox.retry_later(message_ids, repr(exc)[:1000], retry_at)
+            OUTBOX_MESSAGES.inc(self.name, "failed", amount=len(messages))
+            return RelayBatchResult(claimed=len(messages), failed=len(messages)), messages
+
+        await outbox.complete(message_ids)
+        return RelayBatchResult(claimed=len(messages), delivered=len(batch)), messages
+
+    async def run(self, stop: asyncio.Event, idle_interval: float = 1.0) -> None:
+        """
+        Drena el outbox hasta que se activa `stop`.
+
+        Mientras los lotes salen llenos sigue sin pausa; con un lote incompleto (outbox al día)
+        espera `idle_interval` segundos. Un error de base de datos no detiene el bucle.
+        """
+        while not stop.is_set():
+            try:
+                result = await self.run_once()
+            except Exception:
+                logger.exception(
+                    "Error inesperado en el relay del outbox",
+                    extra={"relay": self.name, "operation": "outbox_relay"},
+                )
+                result = RelayBatchResult()
+            if result.claimed < self.batch_size:
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(stop.wait(), idle_interval)
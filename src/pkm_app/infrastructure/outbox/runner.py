@@ -0,0 +1,53 @@
+"""
+Proceso del relay del outbox hacia Qdrant (`main.py relay`).
+
+Encadena los adaptadores: `GeminiEmbedder` detrás de un `CachedEmbedder` (memoria y tabla
+`embedding_cache`), `QdrantNoteIndex` como destino y `OutboxRelay` drenando `note_outbox`.
+Debe haber un único proceso de relay por colección (ver `QdrantNoteIndex`). Con SIGINT o
+SIGTERM termina al acabar el lote en curso.
+"""
+
+import asyncio
+import logging
+import signal
+
+from src.pkm_app.infrastructure.config.settings import Settings, get_settings
+from src.pkm_app.infrastructure.embeddings.cached_embedder import CachedEmbedder
+from src.pkm_app.infrastructure.embeddings.gemini_embedder import GeminiEmbedder
+from src.pkm_app.infrastructure.outbox.relay import OutboxRelay
+from src.pkm_app.infrastructure.persistence.sqlalchemy.database import dispose_engines
+from src.pkm_app.infrastructure.vector_store.qdrant_index import QdrantNoteIndex
+
+logger = logging.getLogger(__name__)
+
+
+async def serve(settings: Settings, stop: asyncio.Event) -> None:
+    """Crea la colección si hace falta y entrega el outbox hasta que se activa `stop`."""
+    model = GeminiEmbedder.from_settings(settings)
+    embedder = CachedEmbedder(model, memory_size=settings.EMBEDDING_MEMORY_CACHE_SIZE)
+    index = QdrantNoteIndex.from_settings(settings, embedder, model.dimension)
+    try:
+        await index.ensure_collection()
+        relay = OutboxRelay(index, batch_size=settings.OUTBOX_BATCH_SIZE)
+        logger.info(
+            "Relay del outbox hacia %s/collections/%s con el modelo %s",
+            settings.QDRANT_URL,
+            settings.QDRANT_COLLECTION,
+            embedder.model,
+        )
+        await relay.run(stop, idle_interval=settings.OUTBOX_IDLE_SECONDS)
+    finally:
+        await index.close()
+        await model.close()
+        await dispose_engines()
+
+
+def run(settings: Settings | None = None) -> None:
+    async def main() -> None:
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(signum, stop.set)
+        await serve(settings or get_settings(), stop)
+
+    asyncio.run(main())
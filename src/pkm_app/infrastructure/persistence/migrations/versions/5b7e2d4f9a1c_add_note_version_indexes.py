@@ -0,0 +1,38 @@
+"""add_note_version_indexes
+
+Revision ID: 5b7e2d4f9a1c
+Revises: c340362ea40a
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5b7e2d4f9a1c"
+down_revision: str | None = "c340362ea40a"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Sondas de versión de las lecturas condicionales (max(updated_at) y count(*) por usuario
+    # o por usuario y proyecto), resueltas con index-only scan
+    op.create_index(
+        "ix_notes_user_id_updated_at", "notes", ["user_id", "updated_at"], unique=False
+    )
+    op.create_index(
+        "ix_notes_user_id_project_id_updated_at",
+        "notes",
+        ["user_id", "project_id", "updated_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_notes_user_id_project_id_updated_at", table_name="notes")
+    op.drop_index("ix_notes_user_id_updated_at", table_name="notes")
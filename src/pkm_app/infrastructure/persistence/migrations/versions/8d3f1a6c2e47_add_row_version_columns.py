@@ -0,0 +1,37 @@
+"""add_row_version_columns
+
+Revision ID: 8d3f1a6c2e47
+Revises: 5b7e2d4f9a1c
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8d3f1a6c2e47"
+down_revision: str | None = "5b7e2d4f9a1c"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+TABLES = ("notes", "projects", "sources", "keywords")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Versión de fila para el control de concurrencia optimista (version_id_col). Con un
+    # DEFAULT constante, PostgreSQL añade la columna sin reescribir la tabla.
+    for table in TABLES:
+        op.add_column(
+            table,
+            sa.Column("version", sa.Integer(), server_default=sa.text("1"), nullable=False),
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in reversed(TABLES):
+        op.drop_column(table, "version")
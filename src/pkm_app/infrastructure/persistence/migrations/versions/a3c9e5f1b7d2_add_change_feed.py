@@ -0,0 +1,153 @@
+"""add_change_feed
+
+Revision ID: a3c9e5f1b7d2
+Revises: 8d3f1a6c2e47
+Create Date: 2026-10-19 14:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "a3c9e5f1b7d2"
+down_revision: str | None = "8d3f1a6c2e47"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Tabla -> (tipo de entidad en el feed, función del trigger)
+TRACKED_TABLES = {
+    "notes": ("note", "record_changes"),
+    "projects": ("project", "record_changes"),
+    "sources": ("source", "record_changes"),
+    "keywords": ("keyword", "record_changes"),
+    "note_links": ("note_link", "record_note_link_changes"),
+}
+
+_UPSERT_CHANGE = """
+        ON CONFLICT (entity_type, entity_id) DO UPDATE
+        SET user_id = EXCLUDED.user_id,
+            operation = EXCLUDED.operation,
+            version = EXCLUDED.version,
+            seq = NULL,
+            changed_at = EXCLUDED.changed_at"""
+
+# Triggers por sentencia con tablas de transición: un INSERT ... SELECT por sentencia en
+# lugar de uno por fila, así que un UPDATE o COPY masivo no paga una llamada por fila.
+# El tipo de entidad llega como argumento del trigger (TG_ARGV[0]).
+_ENTITY_CHANGES_FUNCTION = """
+CREATE FUNCTION {name}() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        INSERT INTO change_log (entity_type, entity_id, user_id, operation, version, changed_at)
+        SELECT TG_ARGV[0], id, user_id, 'delete', {version}, now() FROM old_rows
+        {upsert};
+    ELSE
+        INSERT INTO change_log (entity_type, entity_id, user_id, operation, version, changed_at)
+        SELECT TG_ARGV[0], id, user_id, 'upsert', {version}, now() FROM new_rows
+        {upsert};
+    END IF;
+    RETURN NULL;
+END;
+$$
+"""
+
+# Cambiar las keywords de una nota cambia la nota. En un borrado en cascada de la nota, la
+# nota ya no existe cuando se borran sus filas de note_keywords y no se registra nada.
+_NOTE_KEYWORD_CHANGES_FUNCTION = f"""
+CREATE FUNCTION record_note_keyword_changes() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        INSERT INTO change_log (entity_type, entity_id, user_id, operation, version, changed_at)
+        SELECT 'note', n.id, n.user_id, 'upsert', n.version, now() FROM notes n
+        WHERE n.id IN (SELECT note_id FROM old_rows)
+        {_UPSERT_CHANGE};
+    ELSE
+        INSERT INTO change_log (entity_type, entity_id, user_id, operation, version, changed_at)
+        SELECT 'note', n.id, n.user_id, 'upsert', n.version, now() FROM notes n
+        WHERE n.id IN (SELECT note_id FROM new_rows)
+        {_UPSERT_CHANGE};
+    END IF;
+    RETURN NULL;
+END;
+$$
+"""
+
+
+def _create_triggers(table: str, function: str, argument: str = "") -> None:
+    for event, transition in (("insert", "NEW"), ("update", "NEW"), ("delete", "OLD")):
+        op.execute(
+            f"CREATE TRIGGER {table}_changes_{event} AFTER {event.upper()} ON {table} "
+            f"REFERENCING {transition} TABLE AS {transition.lower()}_rows "
+            f"FOR EACH STATEMENT EXECUTE FUNCTION {function}({argument})"
+        )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(sa.schema.CreateSequence(sa.Sequence("change_log_seq")))
+    op.create_table(
+        "change_log",
+        sa.Column("entity_type", postgresql.VARCHAR(length=20), nullable=False),
+        sa.Column("entity_id", sa.UUID(), nullable=False),
+        sa.Column("user_id", sa.Text(), nullable=False),
+        sa.Column("operation", postgresql.VARCHAR(length=10), nullable=False),
+        sa.Column("version", sa.Integer(), nullable=True),
+        sa.Column("seq", sa.BigInteger(), nullable=True),
+        sa.Column(
+            "changed_at",
+            postgresql.TIMESTAMP(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.CheckConstraint("operation IN ('upsert', 'delete')", name="ck_change_log_operation"),
+        sa.PrimaryKeyConstraint("entity_type", "entity_id"),
+    )
+    op.create_index("ix_change_log_user_id_seq", "change_log", ["user_id", "seq"], unique=False)
+    op.create_table(
+        "change_log_horizon",
+        sa.Column("user_id", sa.Text(), nullable=False),
+        sa.Column("purged_through", sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint("user_id"),
+    )
+
+    op.execute(
+        _ENTITY_CHANGES_FUNCTION.format(
+            name="record_changes", version="version", upsert=_UPSERT_CHANGE
+        )
+    )
+    op.execute(
+        _ENTITY_CHANGES_FUNCTION.format(
+            name="record_note_link_changes", version="NULL::integer", upsert=_UPSERT_CHANGE
+        )
+    )
+    op.execute(_NOTE_KEYWORD_CHANGES_FUNCTION)
+
+    # Las entidades existentes entran como cambios pendientes, como si se acabaran de
+    # escribir. Un cliente que sincroniza desde cero (cursor 0) no las recibe: obtiene solo
+    # el cursor actual, que ya las cubre, parte de un listado completo y a partir de ese
+    # cursor recibe únicamente lo que cambie después
+    for table, (entity_type, function) in TRACKED_TABLES.items():
+        version = "version" if function == "record_changes" else "NULL"
+        op.execute(
+            "INSERT INTO change_log (entity_type, entity_id, user_id, operation, version) "
+            f"SELECT '{entity_type}', id, user_id, 'upsert', {version} FROM {table}"
+        )
+        _create_triggers(table, function, f"'{entity_type}'")
+    _create_triggers("note_keywords", "record_note_keyword_changes")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in [*TRACKED_TABLES, "note_keywords"]:
+        for event in ("insert", "update", "delete"):
+            op.execute(f"DROP TRIGGER IF EXISTS {table}_changes_{event} ON {table}")
+    for function in ("record_note_keyword_changes", "record_note_link_changes", "record_changes"):
+        op.execute(f"DROP FUNCTION IF EXISTS {function}()")
+    op.drop_table("change_log_horizon")
+    op.drop_index("ix_change_log_user_id_seq", table_name="change_log")
+    op.drop_table("change_log")
+    op.execute(sa.schema.DropSequence(sa.Sequence("change_log_seq")))
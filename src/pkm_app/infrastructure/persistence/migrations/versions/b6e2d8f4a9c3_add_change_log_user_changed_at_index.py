@@ -0,0 +1,31 @@
+"""add_change_log_user_changed_at_index
+
+Revision ID: b6e2d8f4a9c3
+Revises: f3b9c1d7a2e6
+Create Date: 2026-10-19 23:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b6e2d8f4a9c3"
+down_revision: str | None = "f3b9c1d7a2e6"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Sonda de versión del contexto del asistente: max(changed_at) por usuario con una sola
+    # bajada por el índice en lugar de recorrer todas las filas del usuario
+    op.create_index(
+        "ix_change_log_user_id_changed_at", "change_log", ["user_id", "changed_at"], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_change_log_user_id_changed_at", table_name="change_log")
@@ -0,0 +1,95 @@
+"""add_note_outbox
+
+Revision ID: b7e2d4a9c1f3
+Revises: a3c9e5f1b7d2
+Create Date: 2026-10-19 16:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "b7e2d4a9c1f3"
+down_revision: str | None = "a3c9e5f1b7d2"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Un UPDATE solo genera mensaje si cambia algo de lo que indexa el almacén vectorial
+_NOTE_OUTBOX_FUNCTION = """
+CREATE FUNCTION record_note_outbox() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO note_outbox (note_id, user_id, operation, version)
+        SELECT id, user_id, 'upsert', version FROM new_rows;
+    ELSIF TG_OP = 'UPDATE' THEN
+        INSERT INTO note_outbox (note_id, user_id, operation, version)
+        SELECT n.id, n.user_id, 'upsert', n.version
+        FROM new_rows n JOIN old_rows o ON o.id = n.id
+        WHERE (n.user_id, n.project_id, n.type, n.title, n.content)
+              IS DISTINCT FROM (o.user_id, o.project_id, o.type, o.title, o.content);
+    ELSE
+        INSERT INTO note_outbox (note_id, user_id, operation, version)
+        SELECT id, user_id, 'delete', version FROM old_rows;
+    END IF;
+    RETURN NULL;
+END;
+$$
+"""
+
+_REFERENCING = {
+    "insert": "NEW TABLE AS new_rows",
+    "update": "NEW TABLE AS new_rows OLD TABLE AS old_rows",
+    "delete": "OLD TABLE AS old_rows",
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "note_outbox",
+        sa.Column("id", sa.BigInteger(), sa.Identity(always=True), nullable=False),
+        sa.Column("note_id", sa.UUID(), nullable=False),
+        sa.Column("user_id", sa.Text(), nullable=False),
+        sa.Column("operation", postgresql.VARCHAR(length=10), nullable=False),
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.Column(
+            "created_at",
+            postgresql.TIMESTAMP(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("attempts", sa.Integer(), server_default="0", nullable=False),
+        sa.Column(
+            "available_at",
+            postgresql.TIMESTAMP(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.CheckConstraint("operation IN ('upsert', 'delete')", name="ck_note_outbox_operation"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.execute(_NOTE_OUTBOX_FUNCTION)
+    # Las notas existentes se entregan una vez para poblar el almacén vectorial
+    op.execute(
+        "INSERT INTO note_outbox (note_id, user_id, operation, version) "
+        "SELECT id, user_id, 'upsert', version FROM notes ORDER BY updated_at"
+    )
+    for event, referencing in _REFERENCING.items():
+        op.execute(
+            f"CREATE TRIGGER notes_outbox_{event} AFTER {event.upper()} ON notes "
+            f"REFERENCING {referencing} "
+            "FOR EACH STATEMENT EXECUTE FUNCTION record_note_outbox()"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for event in _REFERENCING:
+        op.execute(f"DROP TRIGGER IF EXISTS notes_outbox_{event} ON notes")
+    op.execute("DROP FUNCTION IF EXISTS record_note_outbox()")
+    op.drop_table("note_outbox")
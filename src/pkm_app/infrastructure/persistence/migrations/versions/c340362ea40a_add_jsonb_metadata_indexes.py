@@ -0,0 +1,127 @@
+"""add_jsonb_metadata_indexes
+
+Revision ID: c340362ea40a
+Revises: 20250602_201844
+Create Date: 2025-06-10 18:32:05.114270
+
+"""
+
+import re
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c340362ea40a"
+down_revision: str | None = "20250602_201844"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Prefijos de los índices de expresión para claves "calientes" de metadata.
+# El downgrade los localiza por prefijo, independientemente de la configuración actual.
+HOT_KEY_INDEX_PREFIXES = {
+    ("notes", "note_metadata"): "ix_notes_note_metadata_key_",
+    ("sources", "link_metadata"): "ix_sources_link_metadata_key_",
+}
+
+# Claves "calientes" (rutas con puntos) con índice de expresión btree sobre `#>`. Están
+# fijadas aquí para que el esquema no dependa del entorno en que se aplica la migración:
+# una clave nueva se añade con una migración nueva. Copia de `HOT_METADATA_KEYS`
+# (repositories/metadata_filters.py); test_metadata_filters falla si divergen.
+HOT_KEYS = {
+    ("notes", "note_metadata"): ["reviewed", "source.author"],
+    ("sources", "link_metadata"): [],
+}
+
+MAX_IDENTIFIER_LENGTH = 63  # Límite de PostgreSQL para nombres de objetos
+
+
+def _hot_key_index_name(prefix: str, key_path: str) -> str:
+    slug = re.sub(r"[^a-z0-9]+", "_", key_path.lower()).strip("_")
+    return (prefix + slug)[:MAX_IDENTIFIER_LENGTH]
+
+
+def _hot_key_index_names(table: str, column: str) -> dict[str, str]:
+    """Nombre del índice de cada clave caliente; falla si dos claves darían el mismo."""
+    prefix = HOT_KEY_INDEX_PREFIXES[(table, column)]
+    names: dict[str, str] = {}
+    for key_path in HOT_KEYS[(table, column)]:
+        index_name = _hot_key_index_name(prefix, key_path)
+        clashing = [other for other, name in names.items() if name == index_name]
+        if clashing:
+            raise ValueError(
+                f"Las claves de metadata '{clashing[0]}' y '{key_path}' de {table}.{column} "
+                f"darían el mismo índice '{index_name}'."
+            )
+        names[key_path] = index_name
+    return names
+
+
+def _text_array_literal(key_path: str) -> str:
+    """Convierte 'a.b' en el literal SQL '{"a","b"}' (escapando comillas)."""
+    elements = ",".join(
+        '"' + segment.strip().replace("\\", "\\\\").replace('"', '\\"') + '"'
+        for segment in key_path.split(".")
+    )
+    return "'{" + elements.replace("'", "''") + "}'"
+
+
+def _create_hot_key_indexes(table: str, column: str) -> None:
+    for key_path, index_name in _hot_key_index_names(table, column).items():
+        op.execute(
+            f'CREATE INDEX IF NOT EXISTS "{index_name}" '
+            f"ON {table} (({column} #> {_text_array_literal(key_path)}))"
+        )
+
+
+def _drop_hot_key_indexes(table: str, column: str) -> None:
+    prefix = HOT_KEY_INDEX_PREFIXES[(table, column)]
+    index_names = (
+        op.get_bind()
+        .execute(
+            sa.text(
+                "SELECT indexname FROM pg_indexes "
+                "WHERE tablename = :table AND starts_with(indexname, :prefix)"
+            ),
+            {"table": table, "prefix": prefix},
+        )
+        .scalars()
+        .all()
+    )
+    for index_name in index_names:
+        op.execute(f'DROP INDEX IF EXISTS "{index_name}"')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Antes de crear nada: una colisión de nombres deja la migración sin aplicar
+    for table, column in HOT_KEYS:
+        _hot_key_index_names(table, column)
+    op.create_index(
+        "ix_notes_note_metadata_gin",
+        "notes",
+        ["note_metadata"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"note_metadata": "jsonb_path_ops"},
+    )
+    op.create_index(
+        "ix_sources_link_metadata_gin",
+        "sources",
+        ["link_metadata"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"link_metadata": "jsonb_path_ops"},
+    )
+    # Índices de expresión de las claves calientes
+    _create_hot_key_indexes("notes", "note_metadata")
+    _create_hot_key_indexes("sources", "link_metadata")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _drop_hot_key_indexes("sources", "link_metadata")
+    _drop_hot_key_indexes("notes", "note_metadata")
+    op.drop_index("ix_sources_link_metadata_gin", table_name="sources")
+    op.drop_index("ix_notes_note_metadata_gin", table_name="notes")
@@ -0,0 +1,121 @@
+"""add_note_content_hash
+
+Revision ID: c4d8f2a6e9b1
+Revises: b7e2d4a9c1f3
+Create Date: 2026-10-19 17:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "c4d8f2a6e9b1"
+down_revision: str | None = "b7e2d4a9c1f3"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Equivalentes SQL de core/application/content_hashing.py. convert_to() es STABLE porque
+# depende de la codificación de la base de datos, que no cambia: las funciones se declaran
+# IMMUTABLE para poder usarlas en una columna generada. Las llamadas entre ellas van
+# cualificadas con el esquema: la columna generada se recalcula con el search_path de quien
+# escribe, y con otro search_path (pg_dump/pg_restore lo vacía) una llamada sin cualificar no
+# encontraría la función o encontraría otra. Con `SET search_path` no se podrían expandir en
+# línea en las consultas.
+_FUNCTIONS = """
+CREATE FUNCTION note_normalize_text(value text) RETURNS text
+LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+    SELECT btrim(normalize(replace(coalesce(value, ''), E'\\r\\n', E'\\n'), NFC), E' \\t\\n')
+$$;
+
+CREATE FUNCTION note_text(title text, content text) RETURNS text
+LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+    SELECT CASE
+        WHEN public.note_normalize_text(title) = '' THEN public.note_normalize_text(content)
+        ELSE public.note_normalize_text(title) || E'\\n\\n' || public.note_normalize_text(content)
+    END
+$$;
+
+CREATE FUNCTION note_content_hash(title text, content text) RETURNS bytea
+LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+    SELECT sha256(convert_to(public.note_text(title, content), 'UTF8'))
+$$;
+"""
+
+_NOTE_OUTBOX_FUNCTION = """
+CREATE OR REPLACE FUNCTION record_note_outbox() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO note_outbox (note_id, user_id, operation, version)
+        SELECT id, user_id, 'upsert', version FROM new_rows;
+    ELSIF TG_OP = 'UPDATE' THEN
+        INSERT INTO note_outbox (note_id, user_id, operation, version)
+        SELECT n.id, n.user_id, 'upsert', n.version
+        FROM new_rows n JOIN old_rows o ON o.id = n.id
+        WHERE (n.user_id, n.project_id, n.type, {text_columns})
+              IS DISTINCT FROM (o.user_id, o.project_id, o.type, {old_text_columns});
+    ELSE
+        INSERT INTO note_outbox (note_id, user_id, operation, version)
+        SELECT id, user_id, 'delete', version FROM old_rows;
+    END IF;
+    RETURN NULL;
+END;
+$$
+"""
+
+
+def _outbox_function(*text_columns: str) -> str:
+    return _NOTE_OUTBOX_FUNCTION.format(
+        text_columns=", ".join(f"n.{column}" for column in text_columns),
+        old_text_columns=", ".join(f"o.{column}" for column in text_columns),
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(_FUNCTIONS)
+    # Reescribe la tabla una vez para calcular el hash de las notas existentes
+    op.add_column(
+        "notes",
+        sa.Column(
+            "content_hash",
+            postgresql.BYTEA(),
+            sa.Computed("note_content_hash(title, content)", persisted=True),
+            nullable=False,
+        ),
+    )
+    op.create_index(
+        "ix_notes_user_id_content_hash", "notes", ["user_id", "content_hash"], unique=False
+    )
+    # El outbox compara 32 bytes en lugar del título y el contenido completos; un texto
+    # idéntico tras normalizar ya no genera mensaje
+    op.execute(_outbox_function("content_hash"))
+
+    op.create_table(
+        "embedding_cache",
+        sa.Column("model", sa.Text(), nullable=False),
+        sa.Column("content_hash", postgresql.BYTEA(), nullable=False),
+        sa.Column("dimension", sa.Integer(), nullable=False),
+        sa.Column("vector", postgresql.BYTEA(), nullable=False),
+        sa.Column(
+            "created_at",
+            postgresql.TIMESTAMP(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("model", "content_hash"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("embedding_cache")
+    op.execute(_outbox_function("title", "content"))
+    op.drop_index("ix_notes_user_id_content_hash", table_name="notes")
+    op.drop_column("notes", "content_hash")
+    op.execute("DROP FUNCTION IF EXISTS note_content_hash(text, text)")
+    op.execute("DROP FUNCTION IF EXISTS note_text(text, text)")
+    op.execute("DROP FUNCTION IF EXISTS note_normalize_text(text)")
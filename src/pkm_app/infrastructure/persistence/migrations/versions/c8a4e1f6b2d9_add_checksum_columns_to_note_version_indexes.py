@@ -0,0 +1,45 @@
+"""add_checksum_columns_to_note_version_indexes
+
+Revision ID: c8a4e1f6b2d9
+Revises: b6e2d8f4a9c3
+Create Date: 2026-10-20 09:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c8a4e1f6b2d9"
+down_revision: str | None = "b6e2d8f4a9c3"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Índice -> columnas clave de las sondas de versión de los listados
+INDEXES = {
+    "ix_notes_user_id_updated_at": ["user_id", "updated_at"],
+    "ix_notes_user_id_project_id_updated_at": ["user_id", "project_id", "updated_at"],
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # La suma de comprobación de las sondas (version y created_at) también sale del índice:
+    # siguen siendo index-only scans
+    for name, columns in INDEXES.items():
+        op.drop_index(name, table_name="notes")
+        op.create_index(
+            name,
+            "notes",
+            columns,
+            unique=False,
+            postgresql_include=["version", "created_at"],
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, columns in INDEXES.items():
+        op.drop_index(name, table_name="notes")
+        op.create_index(name, "notes", columns, unique=False)
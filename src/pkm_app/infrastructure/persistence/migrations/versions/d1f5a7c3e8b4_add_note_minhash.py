@@ -0,0 +1,54 @@
+"""add_note_minhash
+
+Revision ID: d1f5a7c3e8b4
+Revises: c4d8f2a6e9b1
+Create Date: 2026-10-19 19:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "d1f5a7c3e8b4"
+down_revision: str | None = "c4d8f2a6e9b1"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Las notas existentes no tienen firma hasta que se rellena la tabla con
+    # BackfillNoteMinHashUseCase (o se vuelven a guardar)
+    op.create_table(
+        "note_minhash",
+        sa.Column("note_id", sa.UUID(), nullable=False),
+        sa.Column("user_id", sa.Text(), nullable=False),
+        sa.Column("signature", postgresql.BYTEA(), nullable=True),
+        sa.Column("band_keys", postgresql.ARRAY(sa.BigInteger()), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["note_id"],
+            ["notes.id"],
+            name=op.f("fk_note_minhash_note_id_notes"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("note_id", name=op.f("pk_note_minhash")),
+    )
+    op.create_index(
+        "ix_note_minhash_band_keys",
+        "note_minhash",
+        ["band_keys"],
+        unique=False,
+        postgresql_using="gin",
+    )
+    op.create_index("ix_note_minhash_user_id", "note_minhash", ["user_id"], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_note_minhash_user_id", table_name="note_minhash")
+    op.drop_index("ix_note_minhash_band_keys", table_name="note_minhash")
+    op.drop_table("note_minhash")
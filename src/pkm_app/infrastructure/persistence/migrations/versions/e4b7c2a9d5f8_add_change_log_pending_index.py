@@ -0,0 +1,36 @@
+"""add_change_log_pending_index
+
+Revision ID: e4b7c2a9d5f8
+Revises: c8a4e1f6b2d9
+Create Date: 2026-10-20 10:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e4b7c2a9d5f8"
+down_revision: str | None = "c8a4e1f6b2d9"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Numeración de los cambios pendientes de un usuario (seq IS NULL), que ahora también
+    # hace cada petición del contexto del asistente. Solo contiene las filas sin numerar
+    op.create_index(
+        "ix_change_log_user_id_pending",
+        "change_log",
+        ["user_id"],
+        unique=False,
+        postgresql_where=sa.text("seq IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_change_log_user_id_pending", table_name="change_log")
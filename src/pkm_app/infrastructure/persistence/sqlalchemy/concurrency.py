@@ -0,0 +1,57 @@
+"""
+Control de concurrencia optimista con la columna `version` de notas, proyectos, fuentes y
+keywords.
+
+Los modelos declaran `version` como `version_id_col`: cada UPDATE del ORM incrementa la
+versión y añade `AND version = :cargada` al WHERE. Si otra transacción la cambió después de
+leer la fila, el UPDATE no afecta a ninguna fila y SQLAlchemy lanza `StaleDataError`. Así la
+edición desde varios dispositivos no necesita `SELECT ... FOR UPDATE`: la fila solo queda
+bloqueada durante el propio UPDATE y la escritura que llega tarde recibe un conflicto en
+lugar de pisar la otra.
+
+Los repositorios traducen ambos casos a `ConcurrencyError`: la versión que el cliente espera
+(`expected_version`, la que leyó) no coincide con la actual, o la fila cambió entre la
+lectura y el UPDATE.
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from sqlalchemy.orm.exc import StaleDataError
+
+from src.pkm_app.core.domain.errors import ConcurrencyError
+
+
+def version_conflict(
+    resource_type: str,
+    resource_id: Any,
+    expected_version: int | None,
+    current_version: int | None = None,
+) -> ConcurrencyError:
+    return ConcurrencyError(
+        f"Conflicto de versión en {resource_type} {resource_id}: otra operación lo ha "
+        "modificado desde que se leyó.",
+        resource_id=resource_id,
+        resource_type=resource_type,
+        context={"expected_version": expected_version, "current_version": current_version},
+    )
+
+
+def check_expected_version(
+    instance: Any, expected_version: int | None, resource_type: str
+) -> None:
+    """Lanza ConcurrencyError si el cliente espera una versión distinta de la cargada."""
+    if expected_version is not None and instance.version != expected_version:
+        raise version_conflict(resource_type, instance.id, expected_version, instance.version)
+
+
+@contextmanager
+def stale_data_as_conflict(
+    resource_type: str, resource_id: Any, expected_version: int | None = None
+) -> Iterator[None]:
+    """Traduce el `StaleDataError` de un flush (UPDATE sin filas) a ConcurrencyError."""
+    try:
+        yield
+    except StaleDataError as e:
+        raise version_conflict(resource_type, resource_id, expected_version) from e
@@ -1,71 +1,147 @@
-import os
+"""
+Acceso a los engines y fábricas de sesión de SQLAlchemy.
+
+Importar este módulo no tiene efectos secundarios: la configuración se lee de `Settings`
+y los engines/sessionmakers se crean la primera vez que se piden a través de las funciones
+`get_*`, que los memorizan. Así los tests unitarios y las herramientas de línea de comandos
+pueden importar la capa de persistencia sin base de datos ni variables de entorno.
+
+Los nombres antiguos (`async_engine`, `AsyncSessionLocal`, `ASYNC_DATABASE_URL`, ...) siguen
+disponibles como atributos del módulo, pero se resuelven también de forma perezosa.
+"""
+
 from collections.abc import AsyncGenerator, Iterator
-from contextlib import contextmanager  # Añadido
+from contextlib import contextmanager
+from functools import cache
+from typing import TYPE_CHECKING, Any
 
-from dotenv import load_dotenv
-from sqlalchemy import create_engine
 from sqlalchemy.engine import URL
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy.orm import Session, sessionmaker
 
-# Cargar variables de entorno desde el archivo .env
-# Esto asegura que las variables de DB_USER, DB_PASSWORD, etc., estén disponibles.
-load_dotenv()
-
-# Construir la URL de la base de datos asíncrona desde las variables de entorno
-DB_USER = os.getenv("DB_USER")
-DB_PASSWORD = os.getenv("DB_PASSWORD")
-DB_HOST = os.getenv("DB_HOST", "localhost")  # 'localhost' si la app corre en el host y DB en Docker
-DB_PORT = os.getenv("DB_PORT", "5432")
-DB_NAME = os.getenv("DB_NAME")
-
-if not all([DB_USER, DB_PASSWORD, DB_HOST, DB_PORT, DB_NAME]):
-    raise ValueError(
-        "Faltan variables de entorno para la base de datos en .env: "
-        "DB_USER, DB_PASSWORD, DB_HOST, DB_PORT, DB_NAME."
+from src.pkm_app.infrastructure.config.settings import Settings, get_settings
+
+if TYPE_CHECKING:
+    from sqlalchemy import Engine
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
+    from src.pkm_app.infrastructure.persistence.sqlalchemy.replicas import ReplicaRouter
+
+
+def _validate_database_settings(settings: Settings) -> None:
+    if not all(
+        [settings.DB_USER, settings.DB_PASSWORD, settings.DB_HOST, settings.DB_PORT, settings.DB_NAME]
+    ):
+        raise ValueError(
+            "Faltan variables de entorno para la base de datos en .env: "
+            "DB_USER, DB_PASSWORD, DB_HOST, DB_PORT, DB_NAME."
+        )
+
+
+def _build_database_url(drivername: str, settings: Settings) -> str:
+    _validate_database_settings(settings)
+    return URL.create(
+        drivername=drivername,
+        username=settings.DB_USER,
+        password=settings.DB_PASSWORD,
+        host=settings.DB_HOST,
+        port=int(settings.DB_PORT),
+        database=settings.DB_NAME,
+    ).render_as_string(
+        hide_password=False
+    )  # hide_password=False para que esté completa la URL
+
+
+def get_async_database_url() -> str:
+    """URL asyncpg construida desde Settings. Lanza ValueError si falta configuración."""
+    return _build_database_url("postgresql+asyncpg", get_settings())
+
+
+def get_sync_database_url() -> str:
+    """URL psycopg2 (scripts, Alembic) construida desde Settings."""
+    return _build_database_url("postgresql+psycopg2", get_settings())
+
+
+# --- Configuración Asíncrona ---
+
+
+@cache
+def get_async_engine() -> "AsyncEngine":
+    """Engine asíncrono compartido, creado en la primera llamada."""
+    # Import diferido: la fábrica de engines arrastra el driver y el sistema de pools.
+    from src.pkm_app.infrastructure.persistence.sqlalchemy.engine import create_async_db_engine
+
+    return create_async_db_engine(get_async_database_url(), get_settings())
+
+
+@cache
+def get_async_sessionmaker() -> async_sessionmaker[AsyncSession]:
+    """Fábrica de sesiones asíncronas ligada a `get_async_engine()`."""
+    return async_sessionmaker(
+        bind=get_async_engine(),
+        class_=AsyncSession,
+        expire_on_commit=False,  # Común para evitar problemas con objetos desasociados después del commit
+        autoflush=False,  # Control manual del flush para operaciones asíncronas
+        autocommit=False,  # Control manual del commit
+    )
+
+
+@cache
+def get_async_readonly_engine() -> "AsyncEngine":
+    """
+    Engine asíncrono de solo lectura (autocommit, `default_transaction_read_only`), con un
+    pool propio para que las lecturas no compitan con las transacciones de escritura.
+    """
+    from src.pkm_app.infrastructure.persistence.sqlalchemy.engine import create_async_db_engine
+
+    return create_async_db_engine(get_async_database_url(), get_settings(), read_only=True)
+
+
+@cache
+def get_async_readonly_sessionmaker() -> async_sessionmaker[AsyncSession]:
+    """Fábrica de sesiones ligada a `get_async_readonly_engine()` (sin autoflush)."""
+    return async_sessionmaker(
+        bind=get_async_readonly_engine(),
+        class_=AsyncSession,
+        expire_on_commit=False,
+        autoflush=False,
     )
 
-# URL para SQLAlchemy con asyncpg
-ASYNC_DATABASE_URL = URL.create(
-    drivername="postgresql+asyncpg",
-    username=DB_USER,
-    password=DB_PASSWORD,
-    host=DB_HOST,
-    port=int(DB_PORT),
-    database=DB_NAME,
-).render_as_string(
-    hide_password=False
-)  # hide_password=False para que esté completa la URL
-
-# Crear el motor asíncrono de SQLAlchemy
-# echo=True es útil para desarrollo para ver las sentencias SQL generadas.
-# Considera ponerlo en False o controlarlo con una variable de entorno para producción.
-async_engine = create_async_engine(ASYNC_DATABASE_URL, echo=True)
-
-# Crear una fábrica de sesiones asíncronas (SessionLocal)
-# Esta fábrica se usará para crear nuevas instancias de AsyncSession.
-AsyncSessionLocal = async_sessionmaker(
-    bind=async_engine,
-    class_=AsyncSession,
-    expire_on_commit=False,  # Común para evitar problemas con objetos desasociados después del commit
-    autoflush=False,  # Control manual del flush para operaciones asíncronas
-    autocommit=False,  # Control manual del commit
-)
-
-
-# (Opcional, para uso futuro con FastAPI o gestión de dependencias)
-# Función para obtener una sesión de base de datos de manera asíncrona.
-# Esto es un patrón común para la inyección de dependencias en FastAPI.
+
+@cache
+def get_replica_router() -> "ReplicaRouter | None":
+    """
+    Router de lecturas entre el primario y las réplicas de `DB_REPLICA_URLS`, o None si no
+    hay réplicas configuradas. El primario de lectura es `get_async_readonly_engine()`.
+    Los chequeos de salud periódicos se lanzan con `start_health_checks()` al arrancar la app.
+    """
+    settings = get_settings()
+    if not settings.DB_REPLICA_URLS:
+        return None
+
+    from src.pkm_app.infrastructure.persistence.sqlalchemy.engine import create_async_db_engine
+    from src.pkm_app.infrastructure.persistence.sqlalchemy.replicas import ReplicaRouter
+
+    return ReplicaRouter(
+        primary=get_async_readonly_engine(),
+        replicas=[
+            create_async_db_engine(url, settings, read_only=True)
+            for url in settings.DB_REPLICA_URLS
+        ],
+        strategy=settings.DB_REPLICA_STRATEGY,
+        sticky_seconds=settings.DB_READ_YOUR_WRITES_SECONDS,
+        max_lag_seconds=settings.DB_REPLICA_MAX_LAG_SECONDS,
+    )
+
+
 async def get_async_db_session() -> AsyncGenerator[AsyncSession]:
     """
     Dependency that provides an asynchronous database session.
     Ensures the session is closed after use.
     """
-    async with AsyncSessionLocal() as session:
+    async with get_async_sessionmaker()() as session:
         try:
             yield session
-            # Opcional: await session.commit() si quieres un commit automático aquí,
-            # aunque usualmente el commit se maneja en la lógica de negocio/repositorio.
         except Exception:
             await session.rollback()
             raise
@@ -75,23 +151,24 @@ async def get_async_db_session() -> AsyncGenerator[AsyncSession]:
 
 # --- Configuración Síncrona (para scripts, Alembic, tareas que no requieren async) ---
 
-SYNC_DATABASE_URL_STR = URL.create(
-    drivername="postgresql+psycopg2",  # Driver síncrono
-    username=DB_USER,
-    password=DB_PASSWORD,
-    host=DB_HOST,
-    port=int(DB_PORT),
-    database=DB_NAME,
-).render_as_string(hide_password=False)
 
-sync_engine = create_engine(SYNC_DATABASE_URL_STR, echo=True)  # echo=True para desarrollo
+@cache
+def get_sync_engine() -> "Engine":
+    """Engine síncrono compartido, creado en la primera llamada."""
+    from src.pkm_app.infrastructure.persistence.sqlalchemy.engine import create_sync_db_engine
+
+    return create_sync_db_engine(get_sync_database_url(), get_settings())
 
-SyncSessionLocal = sessionmaker(
-    autocommit=False,
-    autoflush=False,
-    bind=sync_engine,
-    class_=Session,  # Usando la clase correcta de sqlalchemy.orm
-)
+
+@cache
+def get_sync_sessionmaker() -> sessionmaker[Session]:
+    """Fábrica de sesiones síncronas ligada a `get_sync_engine()`."""
+    return sessionmaker(
+        autocommit=False,
+        autoflush=False,
+        bind=get_sync_engine(),
+        class_=Session,
+    )
 
 
 @contextmanager
@@ -100,7 +177,7 @@ def get_sync_db_session() -> Iterator[Session]:
     Dependency that provides a synchronous database session.
     Ensures the session is closed after use.
     """
-    db = SyncSessionLocal()
+    db = get_sync_sessionmaker()()
     try:
         yield db
     except Exception:
@@ -110,7 +187,43 @@ def get_sync_db_session() -> Iterator[Session]:
         db.close()
 
 
-# NOTA: La Base declarativa (Base = declarative_base()) que usan tus modelos SQLAlchemy
-# ya está definida en tu archivo `src/pkm_app/infrastructure/persistence/sqlalchemy/models.py`.
-# No necesitas redefinirla aquí. El engine que hemos creado se usará con esa Base
-# cuando interactúes con los modelos a través de una sesión creada con AsyncSessionLocal.
+async def dispose_engines() -> None:
+    """Cierra los engines creados y olvida las instancias memorizadas (apagado y tests)."""
+    if get_replica_router.cache_info().currsize and (router := get_replica_router()):
+        await router.close()
+    if get_async_engine.cache_info().currsize:
+        await get_async_engine().dispose()
+    if get_async_readonly_engine.cache_info().currsize:
+        await get_async_readonly_engine().dispose()
+    if get_sync_engine.cache_info().currsize:
+        get_sync_engine().dispose()
+    reset_engines()
+
+
+def reset_engines() -> None:
+    """Olvida los engines y sessionmakers memorizados sin cerrarlos."""
+    get_replica_router.cache_clear()
+    get_async_sessionmaker.cache_clear()
+    get_async_engine.cache_clear()
+    get_async_readonly_sessionmaker.cache_clear()
+    get_async_readonly_engine.cache_clear()
+    get_sync_sessionmaker.cache_clear()
+    get_sync_engine.cache_clear()
+
+
+# Compatibilidad con los nombres anteriores, resueltos bajo demanda.
+_LEGACY_ATTRIBUTES = {
+    "ASYNC_DATABASE_URL": get_async_database_url,
+    "SYNC_DATABASE_URL_STR": get_sync_database_url,
+    "async_engine": get_async_engine,
+    "sync_engine": get_sync_engine,
+    "AsyncSessionLocal": get_async_sessionmaker,
+    "SyncSessionLocal": get_sync_sessionmaker,
+}
+
+
+def __getattr__(name: str) -> Any:
+    accessor = _LEGACY_ATTRIBUTES.get(name)
+    if accessor is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return accessor()
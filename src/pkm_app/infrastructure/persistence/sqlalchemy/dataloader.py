@@ -0,0 +1,186 @@
+"""
+DataLoaders por Unit of Work: agrupan y memorizan las búsquedas por id.
+
+Las vistas compuestas (una nota con su proyecto, su fuente, sus enlaces y los proyectos de
+las notas enlazadas) piden entidades una a una con `get_by_id`. Dentro de un
+`SQLAlchemyUnitOfWork`, los repositorios que lo soportan encolan esas peticiones en un
+`DataLoader`: todas las que llegan en la misma vuelta del event loop (p. ej. las lanzadas
+con `asyncio.gather`) se resuelven con una sola consulta `WHERE id = ANY(:ids)` por tipo de
+entidad, y el resultado se memoriza hasta que termina el Unit of Work.
+
+- El registro de loaders vive en `session.info` mientras el Unit of Work está abierto; un
+  repositorio usado fuera de un Unit of Work consulta cada id por separado, como siempre.
+- Las consultas por lotes de todos los loaders de una sesión se serializan con un lock: una
+  `AsyncSession` no admite operaciones concurrentes.
+- Los repositorios olvidan la entrada memorizada al actualizar o borrar la entidad, y el
+  Unit of Work vacía el registro al hacer rollback.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable, Iterable, Mapping
+from typing import Any, Generic, TypeVar
+
+from sqlalchemy import ColumnElement, any_, bindparam
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncSession
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+# Clave del registro en `AsyncSession.info`
+LOADERS_INFO_KEY = "pkm_dataloaders"
+
+# Ids por consulta; una vuelta con más ids se divide en varias consultas
+MAX_BATCH_SIZE = 1000
+
+BatchLoadFn = Callable[[list[K]], Awaitable[Mapping[K, V]]]
+
+
+class DataLoader(Generic[K, V]):
+    """
+    Agrupa las llamadas a `load` de una misma vuelta del event loop en una llamada a
+    `batch_load` y memoriza cada resultado (también los ids no encontrados, como None).
+    """
+
+    def __init__(
+        self,
+        batch_load: BatchLoadFn[K, V],
+        lock: asyncio.Lock | None = None,
+        max_batch_size: int = MAX_BATCH_SIZE,
+    ):
+        self._batch_load = batch_load
+        self._lock = lock or asyncio.Lock()
+        self._max_batch_size = max_batch_size
+        self._futures: dict[K, asyncio.Future[V | None]] = {}
+        self._queue: list[K] = []
+        self._tasks: set[asyncio.Task[None]] = set()
+        self.batches = 0
+
+    async def load(self, key: K) -> V | None:
+        # shield: cancelar a un llamador no debe cancelar el resultado compartido con otros
+        return await asyncio.shield(self._future(key))
+
+    async def load_many(self, keys: Iterable[K]) -> list[V | None]:
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    def prime(self, key: K, value: V | None) -> None:
+        """Memoriza un valor ya conocido (p. ej. la entidad recién creada)."""
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(value)
+        self._futures[key] = future
+
+    def forget(self, key: K) -> None:
+        self._futures.pop(key, None)
+
+    def clear(self) -> None:
+        self._futures.clear()
+
+    def _future(self, key: K) -> asyncio.Future[V | None]:
+        future = self._futures.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._futures[key] = future
+            if not self._queue:
+                loop.call_soon(self._dispatch)
+            self._queue.append(key)
+        return future
+
+    def _dispatch(self) -> None:
+        keys, self._queue = self._queue, []
+        task = asyncio.get_running_loop().create_task(self._run(keys))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, keys: list[K]) -> None:
+        for start in range(0, len(keys), self._max_batch_size):
+            batch = keys[start : start + self._max_batch_size]
+            futures = [self._futures.get(key) for key in batch]
+            try:
+                async with self._lock:
+                    self.batches += 1
+                    values = await self._batch_load(batch)
+            except asyncio.CancelledError:
+                self._abandon(batch, futures, None)
+                raise
+            except Exception as e:
+                self._abandon(batch, futures, e)
+                continue
+            for key, future in zip(batch, futures, strict=True):
+                if future is not None and not future.done():
+                    future.set_result(values.get(key))
+
+    def _abandon(
+        self,
+        keys: list[K],
+        futures: list[asyncio.Future[V | None] | None],
+        error: Exception | None,
+    ) -> None:
+        # Sin memorizar el error: una llamada posterior vuelve a intentarlo
+        for key, future in zip(keys, futures, strict=True):
+            if self._futures.get(key) is future:
+                self._futures.pop(key)
+            if future is None or future.done():
+                continue
+            if error is None:
+                future.cancel()
+            else:
+                future.set_exception(error)
+
+
+class DataLoaderRegistry:
+    """Loaders de un Unit of Work, uno por (tipo de entidad, usuario)."""
+
+    def __init__(self) -> None:
+        self._lock = asyncio.Lock()
+        self._loaders: dict[Hashable, DataLoader[Any, Any]] = {}
+
+    def get(self, key: Hashable, batch_load: BatchLoadFn[K, V]) -> DataLoader[K, V]:
+        loader = self._loaders.get(key)
+        if loader is None:
+            loader = self._loaders[key] = DataLoader(batch_load, lock=self._lock)
+        return loader
+
+    def forget(self, key: Hashable, entity_id: Hashable) -> None:
+        loader = self._loaders.get(key)
+        if loader is not None:
+            loader.forget(entity_id)
+
+    def clear(self) -> None:
+        for loader in self._loaders.values():
+            loader.clear()
+
+    @property
+    def batches(self) -> int:
+        """Consultas por lotes ejecutadas por todos los loaders."""
+        return sum(loader.batches for loader in self._loaders.values())
+
+
+def attach_loaders(session: AsyncSession) -> DataLoaderRegistry | None:
+    """
+    Abre un registro sobre `session` y lo devuelve, o None si la sesión ya tiene uno (un
+    Unit of Work anidado sobre una sesión externa comparte el del exterior).
+    """
+    if LOADERS_INFO_KEY in session.info:
+        return None
+    registry = session.info[LOADERS_INFO_KEY] = DataLoaderRegistry()
+    return registry
+
+
+def detach_loaders(session: AsyncSession) -> None:
+    registry = session.info.pop(LOADERS_INFO_KEY, None)
+    if registry is not None:
+        registry.clear()
+
+
+def session_loaders(session: AsyncSession) -> DataLoaderRegistry | None:
+    """Registro del Unit of Work abierto sobre `session`, o None fuera de un Unit of Work."""
+    return session.info.get(LOADERS_INFO_KEY)
+
+
+def id_in(column: ColumnElement[Any], ids: Iterable[Hashable]) -> ColumnElement[bool]:
+    """
+    `column = ANY(:ids)` con los ids en un único parámetro array: la sentencia es la misma
+    para cualquier número de ids, así que asyncpg reutiliza su sentencia preparada.
+    """
+    return column == any_(bindparam("ids", list(ids), type_=ARRAY(column.type)))
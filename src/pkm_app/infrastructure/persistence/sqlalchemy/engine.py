@@ -0,0 +1,356 @@
+"""
+Fábrica de engines de SQLAlchemy configurada desde `Settings`.
+
+Las opciones del engine (tamaño del pool, overflow, reciclado, pre-ping, `statement_timeout`
+y caché de sentencias preparadas de asyncpg) parten de un preset (`development` o
+`production`) y pueden sobrescribirse individualmente con variables de entorno `DB_*`.
+
+El modo PgBouncer (`DB_PGBOUNCER_MODE=true`) adapta el engine a un PgBouncer en modo
+*transaction pooling*: el pool lo gestiona PgBouncer (`NullPool`), se desactivan las cachés
+de sentencias preparadas, se usan nombres únicos para las sentencias y el timeout se aplica
+en el cliente (`command_timeout`), ya que PgBouncer no acepta `server_settings` en el arranque.
+
+Los engines de solo lectura (`read_only=True`) trabajan en autocommit, sin BEGIN/COMMIT por
+petición, y con `default_transaction_read_only` activado en el servidor, de modo que cualquier
+escritura accidental falla. Usan su propio pool, separado del de escritura.
+
+Cada engine creado aquí registra un `PoolMetrics` mediante eventos del pool, accesible con
+`get_pool_metrics(engine)` y exportado en `/metrics` (`monitoring/collectors.py`), la
+instrumentación de sentencias por caso de uso de `instrumentation.py` y el contador de
+aciertos de la caché de SQL compilado de SQLAlchemy (`cache="sql_compiled"`).
+"""
+
+import logging
+import threading
+import time
+import uuid
+import weakref
+from typing import Any, Literal
+
+from pydantic import BaseModel, ConfigDict
+from sqlalchemy import Engine, create_engine, event
+from sqlalchemy.engine import URL
+from sqlalchemy.engine.interfaces import CacheStats
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, Pool, QueuePool
+
+from src.pkm_app.infrastructure.config.settings import Settings
+from src.pkm_app.infrastructure.monitoring.collectors import record_cache, register_pool
+from src.pkm_app.infrastructure.persistence.sqlalchemy.instrumentation import instrument_queries
+
+logger = logging.getLogger(__name__)
+
+EnginePresetName = Literal["development", "production"]
+
+
+class EngineOptions(BaseModel):
+    """Opciones efectivas con las que se crea un engine."""
+
+    echo: bool = False
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_timeout: float = 30.0
+    pool_recycle: int = -1
+    pool_pre_ping: bool = False
+    statement_timeout_ms: int | None = None
+    statement_cache_size: int = 100
+    pgbouncer_mode: bool = False
+
+    model_config = ConfigDict(frozen=True)
+
+
+ENGINE_PRESETS: dict[str, EngineOptions] = {
+    "development": EngineOptions(),
+    "production": EngineOptions(
+        pool_size=20,
+        max_overflow=10,
+        pool_timeout=10.0,
+        pool_recycle=1800,
+        pool_pre_ping=True,
+        statement_timeout_ms=30_000,
+        statement_cache_size=256,
+    ),
+}
+
+# Correspondencia entre los campos de EngineOptions y los ajustes opcionales de Settings
+_SETTINGS_OVERRIDES = {
+    "pool_size": "DB_POOL_SIZE",
+    "max_overflow": "DB_MAX_OVERFLOW",
+    "pool_timeout": "DB_POOL_TIMEOUT",
+    "pool_recycle": "DB_POOL_RECYCLE",
+    "pool_pre_ping": "DB_POOL_PRE_PING",
+    "statement_timeout_ms": "DB_STATEMENT_TIMEOUT_MS",
+    "statement_cache_size": "DB_STATEMENT_CACHE_SIZE",
+}
+
+
+def resolve_engine_options(settings: Settings) -> EngineOptions:
+    """
+    Combina el preset `DB_ENGINE_PRESET` con los ajustes `DB_*` definidos explícitamente.
+    Lanza ValueError si el preset no existe.
+    """
+    preset = ENGINE_PRESETS.get(settings.DB_ENGINE_PRESET)
+    if preset is None:
+        raise ValueError(
+            f"Preset de engine desconocido: '{settings.DB_ENGINE_PRESET}'. "
+            f"Valores válidos: {', '.join(ENGINE_PRESETS)}."
+        )
+    overrides: dict[str, Any] = {
+        field: getattr(settings, setting_name)
+        for field, setting_name in _SETTINGS_OVERRIDES.items()
+        if getattr(settings, setting_name) is not None
+    }
+    overrides["echo"] = settings.DB_ECHO
+    overrides["pgbouncer_mode"] = settings.DB_PGBOUNCER_MODE
+    return preset.model_copy(update=overrides)
+
+
+def _unique_statement_name() -> str:
+    return f"__asyncpg_{uuid.uuid4()}__"
+
+
+def build_async_engine_kwargs(options: EngineOptions, read_only: bool = False) -> dict[str, Any]:
+    """Traduce las opciones a los argumentos de `create_async_engine` (driver asyncpg)."""
+    connect_args: dict[str, Any] = {}
+    kwargs: dict[str, Any] = {"echo": options.echo, "connect_args": connect_args}
+    server_settings: dict[str, str] = {}
+    if read_only:
+        kwargs["isolation_level"] = "AUTOCOMMIT"
+
+    if options.pgbouncer_mode:
+        # PgBouncer reparte las transacciones entre conexiones de servidor: no puede haber
+        # sentencias preparadas cacheadas ni nombres de sentencia repetidos. Tampoco acepta
+        # server_settings, así que en solo lectura únicamente se aplica el autocommit.
+        kwargs["poolclass"] = NullPool
+        connect_args["statement_cache_size"] = 0
+        connect_args["prepared_statement_cache_size"] = 0
+        connect_args["prepared_statement_name_func"] = _unique_statement_name
+        if options.statement_timeout_ms is not None:
+            connect_args["command_timeout"] = options.statement_timeout_ms / 1000
+        return kwargs
+
+    kwargs.update(
+        poolclass=InstrumentedAsyncAdaptedQueuePool,
+        pool_size=options.pool_size,
+        max_overflow=options.max_overflow,
+        pool_timeout=options.pool_timeout,
+        pool_recycle=options.pool_recycle,
+        pool_pre_ping=options.pool_pre_ping,
+    )
+    connect_args["statement_cache_size"] = options.statement_cache_size
+    connect_args["prepared_statement_cache_size"] = options.statement_cache_size
+    if options.statement_timeout_ms is not None:
+        server_settings["statement_timeout"] = str(options.statement_timeout_ms)
+    if read_only:
+        server_settings["default_transaction_read_only"] = "on"
+    if server_settings:
+        connect_args["server_settings"] = server_settings
+    return kwargs
+
+
+def build_sync_engine_kwargs(options: EngineOptions) -> dict[str, Any]:
+    """Traduce las opciones a los argumentos de `create_engine` (driver psycopg2)."""
+    kwargs: dict[str, Any] = {"echo": options.echo}
+    if options.pgbouncer_mode:
+        kwargs["poolclass"] = NullPool
+        return kwargs
+
+    kwargs.update(
+        poolclass=InstrumentedQueuePool,
+        pool_size=options.pool_size,
+        max_overflow=options.max_overflow,
+        pool_timeout=options.pool_timeout,
+        pool_recycle=options.pool_recycle,
+        pool_pre_ping=options.pool_pre_ping,
+    )
+    if options.statement_timeout_ms is not None:
+        kwargs["connect_args"] = {"options": f"-c statement_timeout={options.statement_timeout_ms}"}
+    return kwargs
+
+
+# --- Métricas del pool ---
+
+
+class PoolMetrics:
+    """
+    Estadísticas de un pool de conexiones, alimentadas por los eventos del pool
+    (`connect`, `checkout`, `checkin`, `invalidate`) y por la espera medida al obtener
+    una conexión en los pools instrumentados.
+    """
+
+    def __init__(self, engine: Engine):
+        self._engine_ref = weakref.ref(engine)
+        self._lock = threading.Lock()
+        self.connections_opened = 0
+        self.checkouts = 0
+        self.checked_out = 0
+        self.peak_checked_out = 0
+        self.invalidations = 0
+        self.timeouts = 0
+        self.wait_count = 0
+        self.wait_time_total = 0.0
+        self.wait_time_max = 0.0
+
+    def attach(self, pool: Pool) -> None:
+        """Registra los listeners en el pool (se conservan al recrearlo con `dispose()`)."""
+        event.listen(pool, "connect", self._on_connect)
+        event.listen(pool, "checkout", self._on_checkout)
+        event.listen(pool, "checkin", self._on_checkin)
+        event.listen(pool, "invalidate", self._on_invalidate)
+
+    def _on_connect(self, dbapi_connection: Any, connection_record: Any) -> None:
+        with self._lock:
+            self.connections_opened += 1
+
+    def _on_checkout(
+        self, dbapi_connection: Any, connection_record: Any, connection_proxy: Any
+    ) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.checked_out += 1
+            self.peak_checked_out = max(self.peak_checked_out, self.checked_out)
+
+    def _on_checkin(self, dbapi_connection: Any, connection_record: Any) -> None:
+        with self._lock:
+            self.checked_out = max(0, self.checked_out - 1)
+
+    def _on_invalidate(
+        self, dbapi_connection: Any, connection_record: Any, exception: BaseException | None
+    ) -> None:
+        with self._lock:
+            self.invalidations += 1
+
+    def record_wait(self, seconds: float, timed_out: bool = False) -> None:
+        with self._lock:
+            self.wait_count += 1
+            self.wait_time_total += seconds
+            self.wait_time_max = max(self.wait_time_max, seconds)
+            if timed_out:
+                self.timeouts += 1
+
+    def capacity(self) -> float:
+        """Conexiones que el pool puede prestar a la vez (0 si no tiene límite)."""
+        engine = self._engine_ref()
+        pool = engine.pool if engine is not None else None
+        if not isinstance(pool, QueuePool) or pool._max_overflow < 0:
+            return 0.0
+        return float(pool.size() + pool._max_overflow)
+
+    def snapshot(self) -> dict[str, float]:
+        """Devuelve una copia de las métricas actuales (tiempos en segundos)."""
+        engine = self._engine_ref()
+        pool = engine.pool if engine is not None else None
+        with self._lock:
+            return {
+                "pool_size": float(pool.size()) if isinstance(pool, QueuePool) else 0.0,
+                "checked_out": float(self.checked_out),
+                "peak_checked_out": float(self.peak_checked_out),
+                "overflow": float(max(pool.overflow(), 0)) if isinstance(pool, QueuePool) else 0.0,
+                "checkouts": float(self.checkouts),
+                "connections_opened": float(self.connections_opened),
+                "invalidations": float(self.invalidations),
+                "timeouts": float(self.timeouts),
+                "wait_time_total": self.wait_time_total,
+                "wait_time_max": self.wait_time_max,
+                "wait_time_avg": self.wait_time_total / self.wait_count if self.wait_count else 0.0,
+            }
+
+
+class _WaitTimingMixin:
+    """Mide el tiempo de espera de `_do_get`, que es donde el pool bloquea si está agotado."""
+
+    metrics: PoolMetrics | None = None
+
+    def _do_get(self) -> Any:
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()  # type: ignore[misc]
+        except PoolTimeoutError:
+            if self.metrics is not None:
+                self.metrics.record_wait(time.perf_counter() - start, timed_out=True)
+            raise
+        if self.metrics is not None:
+            self.metrics.record_wait(time.perf_counter() - start)
+        return connection
+
+    def recreate(self) -> Any:
+        new_pool = super().recreate()  # type: ignore[misc]
+        new_pool.metrics = self.metrics
+        return new_pool
+
+
+class InstrumentedAsyncAdaptedQueuePool(_WaitTimingMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+class InstrumentedQueuePool(_WaitTimingMixin, QueuePool):
+    pass
+
+
+_pool_metrics: "weakref.WeakKeyDictionary[Engine, PoolMetrics]" = weakref.WeakKeyDictionary()
+
+
+def _record_compiled_cache(
+    conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+) -> None:
+    # Las sentencias de texto (`text()`, DDL) no pasan por la caché y no se cuentan
+    cache_hit = getattr(context, "cache_hit", None)
+    if cache_hit is CacheStats.CACHE_HIT or cache_hit is CacheStats.CACHE_MISS:
+        record_cache("sql_compiled", cache_hit is CacheStats.CACHE_HIT)
+
+
+def _engine_label(engine: Engine) -> str:
+    return f"{engine.url.host or 'local'}/{engine.url.database or ''}"
+
+
+def _instrument(engine: Engine, role: str = "read_write") -> PoolMetrics:
+    metrics = PoolMetrics(engine)
+    metrics.attach(engine.pool)
+    if isinstance(engine.pool, _WaitTimingMixin):
+        engine.pool.metrics = metrics
+    _pool_metrics[engine] = metrics
+    register_pool(_engine_label(engine), role, metrics)
+    instrument_queries(engine)
+    event.listen(engine, "after_cursor_execute", _record_compiled_cache)
+    return metrics
+
+
+def get_pool_metrics(engine: Engine | AsyncEngine) -> PoolMetrics | None:
+    """Devuelve las métricas del pool de un engine creado con esta fábrica."""
+    sync_engine = engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+    return _pool_metrics.get(sync_engine)
+
+
+# --- Fábricas ---
+
+
+def create_async_db_engine(
+    url: str | URL,
+    settings: Settings,
+    options: EngineOptions | None = None,
+    read_only: bool = False,
+) -> AsyncEngine:
+    """
+    Crea un engine asíncrono (asyncpg) con las opciones resueltas desde `settings`.
+    Con `read_only=True` el engine trabaja en autocommit y rechaza escrituras.
+    """
+    options = options or resolve_engine_options(settings)
+    if options.pgbouncer_mode and options.statement_timeout_ms is not None:
+        logger.info(
+            "Modo PgBouncer: statement_timeout se aplica en el cliente (command_timeout=%sms).",
+            options.statement_timeout_ms,
+        )
+    engine = create_async_engine(url, **build_async_engine_kwargs(options, read_only=read_only))
+    _instrument(engine.sync_engine, role="read_only" if read_only else "read_write")
+    return engine
+
+
+def create_sync_db_engine(
+    url: str | URL, settings: Settings, options: EngineOptions | None = None
+) -> Engine:
+    """Crea un engine síncrono (psycopg2) con las opciones resueltas desde `settings`."""
+    options = options or resolve_engine_options(settings)
+    engine = create_engine(url, **build_sync_engine_kwargs(options))
+    _instrument(engine)
+    return engine
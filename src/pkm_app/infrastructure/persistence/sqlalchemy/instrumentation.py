@@ -0,0 +1,194 @@
+"""
+Instrumentación de las sentencias SQL por caso de uso y detección de N+1.
+
+Los engines creados con `engine.py` registran listeners `before_cursor_execute` /
+`after_cursor_execute` que atribuyen cada sentencia a la operación en curso
+(`core.application.operations`, que los casos de uso abren con `@traced_use_case`): número
+de sentencias, tiempo en base de datos y filas devueltas. Fuera de una operación los
+listeners no hacen nada más que consultar el `ContextVar`.
+
+Una misma "forma" de sentencia (el SQL con los parámetros y las listas `IN (...)`
+normalizados) que se repite `N_PLUS_ONE_THRESHOLD` veces o más dentro de una operación se
+marca como sospechosa de N+1. Al terminar cada operación se registra un resumen en el log
+(`INFO`, y un `WARNING` aparte si hay sospechas).
+
+En los tests, `assert_max_queries(n)` falla si el bloque lanza más de `n` sentencias:
+
+    with assert_max_queries(3) as stats:
+        await UpdateNoteUseCase(uow).execute(note_id, note_in, user_id)
+"""
+
+import logging
+import re
+import time
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any
+
+from sqlalchemy import Engine, event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.pkm_app.core.application.operations import (
+    Operation,
+    add_operation_observer,
+    current_operation,
+    operation_scope,
+)
+from src.pkm_app.infrastructure.monitoring.collectors import register_function_cache
+
+logger = logging.getLogger(__name__)
+
+N_PLUS_ONE_THRESHOLD = 3
+_STATS_KEY = "sql"
+_START_TIME_ATTRIBUTE = "_pkm_sql_start_time"
+
+_IN_LIST = re.compile(
+    r"\bIN \((?:\s*(?:\$\d+|%\(\w+\)s|\?|:\w+)(?:::\w+)?\s*,?)+\)", re.IGNORECASE
+)
+_PARAMETER = re.compile(r"\$\d+|%\(\w+\)s|%s|\?|(?<![:\w]):\w+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+# SQLAlchemy cachea el SQL compilado, así que el mismo texto se repite mucho
+@lru_cache(maxsize=2048)
+def statement_shape(statement: str) -> str:
+    """SQL normalizado: parámetros como `?`, listas `IN (...)` colapsadas, espacios simples."""
+    shape = _IN_LIST.sub("IN (...)", statement)
+    shape = _PARAMETER.sub("?", shape)
+    return _WHITESPACE.sub(" ", shape).strip()
+
+
+register_function_cache("sql_statement_shape", statement_shape)
+
+
+@dataclass
+class QueryStats:
+    """Sentencias atribuidas a una operación."""
+
+    operation: str
+    statements: int = 0
+    db_time: float = 0.0
+    rows: int = 0
+    shapes: Counter[str] = field(default_factory=Counter)
+
+    def record(self, statement: str, seconds: float, rows: int) -> None:
+        self.statements += 1
+        self.db_time += seconds
+        self.rows += rows
+        self.shapes[statement_shape(statement)] += 1
+
+    def n_plus_one_suspects(self, threshold: int = N_PLUS_ONE_THRESHOLD) -> dict[str, int]:
+        """Formas de sentencia repetidas al menos `threshold` veces."""
+        return {shape: count for shape, count in self.shapes.items() if count >= threshold}
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "operation": self.operation,
+            "sql_statements": self.statements,
+            "sql_time_ms": round(self.db_time * 1000, 3),
+            "sql_rows": self.rows,
+            "sql_n_plus_one": len(self.n_plus_one_suspects()),
+        }
+
+    def report(self) -> str:
+        """Detalle legible: cada forma de sentencia con su número de ejecuciones."""
+        lines = [
+            f"{self.operation}: {self.statements} sentencias, {self.db_time * 1000:.1f} ms, "
+            f"{self.rows} filas"
+        ]
+        suspects = self.n_plus_one_suspects()
+        for shape, count in self.shapes.most_common():
+            marker = "  [N+1?]" if shape in suspects else ""
+            lines.append(f"  {count:>4}× {shape}{marker}")
+        return "\n".join(lines)
+
+
+class _QueryStatsObserver:
+    def operation_started(self, operation: Operation) -> None:
+        operation.data[_STATS_KEY] = QueryStats(operation.name)
+
+    def operation_finished(self, operation: Operation, error: BaseException | None) -> None:
+        stats: QueryStats = operation.data[_STATS_KEY]
+        if not stats.statements:
+            return
+        suspects = stats.n_plus_one_suspects()
+        if suspects:
+            logger.warning(
+                "Posible N+1 en %s: %s",
+                stats.operation,
+                "; ".join(f"{count}× {shape}" for shape, count in suspects.items()),
+                extra=stats.summary(),
+            )
+        logger.info(
+            "SQL de %s: %d sentencias, %.1f ms, %d filas",
+            stats.operation,
+            stats.statements,
+            stats.db_time * 1000,
+            stats.rows,
+            extra=stats.summary(),
+        )
+
+
+add_operation_observer(_QueryStatsObserver())
+
+
+def query_stats() -> QueryStats | None:
+    """Estadísticas SQL de la operación en curso, o None fuera de una operación."""
+    operation = current_operation()
+    return operation.data.get(_STATS_KEY) if operation is not None else None
+
+
+def _before_cursor_execute(
+    conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+) -> None:
+    # En el contexto de ejecución de la sentencia, no en la conexión: si la sentencia falla,
+    # after_cursor_execute no llega y la hora de inicio se descarta con el contexto
+    if context is not None and current_operation() is not None:
+        setattr(context, _START_TIME_ATTRIBUTE, time.perf_counter())
+
+
+def _after_cursor_execute(
+    conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+) -> None:
+    operation = current_operation()
+    start_time = getattr(context, _START_TIME_ATTRIBUTE, None)
+    if operation is None or start_time is None:
+        return
+    seconds = time.perf_counter() - start_time
+    # Con asyncpg, rowcount de un SELECT son las filas ya recibidas (-1 en cursores de servidor)
+    rows = max(cursor.rowcount, 0) if cursor.description is not None else 0
+    # Las sentencias de una operación anidada cuentan también para las que la contienen
+    for scope in operation.chain():
+        stats = scope.data.get(_STATS_KEY)
+        if stats is not None:
+            stats.record(statement, seconds, rows)
+
+
+def instrument_queries(engine: Engine | AsyncEngine) -> None:
+    """Registra los listeners de instrumentación en `engine` (idempotente)."""
+    sync_engine = engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+    if not event.contains(sync_engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+
+
+@contextmanager
+def track_queries(name: str = "track_queries") -> Iterator[QueryStats]:
+    """Abre una operación `name` y devuelve sus estadísticas SQL (completas al salir)."""
+    with operation_scope(name) as operation:
+        yield operation.data[_STATS_KEY]
+
+
+@contextmanager
+def assert_max_queries(limit: int, name: str = "assert_max_queries") -> Iterator[QueryStats]:
+    """Falla con AssertionError si el bloque ejecuta más de `limit` sentencias SQL."""
+    with track_queries(name) as stats:
+        yield stats
+    if stats.statements > limit:
+        raise AssertionError(
+            f"Se esperaban como máximo {limit} sentencias SQL y se ejecutaron "
+            f"{stats.statements}.\n{stats.report()}"
+        )
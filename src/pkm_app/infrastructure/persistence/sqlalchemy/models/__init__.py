@@ -2,9 +2,14 @@ from __future__ import annotations
 
 from .associations import note_keywords_association_table
 from .base import Base, generate_uuid, metadata_obj
+from .change_log import ChangeLog, ChangeLogHorizon, change_log_seq
+from .embedding_cache import EmbeddingCacheEntry
 from .keyword import Keyword
+from .llm_response_cache import LLMResponseCacheEntry
 from .note import Note
 from .note_link import NoteLink
+from .note_minhash import NoteMinHash
+from .note_outbox import NoteOutbox
 from .project import Project
 from .source import Source
 from .user_profile import UserProfile
@@ -20,4 +25,11 @@ __all__ = [
     "Note",
     "Keyword",
     "NoteLink",
+    "ChangeLog",
+    "ChangeLogHorizon",
+    "change_log_seq",
+    "NoteOutbox",
+    "EmbeddingCacheEntry",
+    "NoteMinHash",
+    "LLMResponseCacheEntry",
 ]
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import uuid
+from datetime import datetime
+
+from sqlalchemy import BigInteger, CheckConstraint, Index, Integer, Sequence, Text, text
+from sqlalchemy.dialects.postgresql import TIMESTAMP, UUID, VARCHAR
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from .base import Base
+
+# Posición en el feed de cambios; la asigna el lector (ver change_feed_repository.py)
+change_log_seq = Sequence("change_log_seq", metadata=Base.metadata)
+
+
+class ChangeLog(Base):
+    """
+    Último cambio de cada entidad sincronizable (nota, proyecto, fuente, keyword o enlace).
+
+    Lo escriben los triggers de la migración `add_change_feed`: una fila por entidad que se
+    sobrescribe en cada cambio, así que el log no crece con las ediciones. Los borrados dejan
+    la fila como lápida (`operation = 'delete'`). `seq` queda a NULL hasta que el feed se lee.
+    Sin FK a user_profiles: las lápidas de un usuario borrado se escriben durante el propio
+    borrado en cascada.
+    """
+
+    __tablename__ = "change_log"
+
+    entity_type: Mapped[str] = mapped_column(VARCHAR(20), primary_key=True)
+    entity_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True)
+    user_id: Mapped[str] = mapped_column(Text, nullable=False)
+    operation: Mapped[str] = mapped_column(VARCHAR(10), nullable=False)
+    version: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    seq: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    changed_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True), server_default=func.now(), nullable=False
+    )
+
+    __table_args__ = (
+        # Lectura del feed (seq > cursor) y búsqueda de cambios sin secuenciar (seq IS NULL)
+        Index("ix_change_log_user_id_seq", "user_id", "seq"),
+        # Numeración de los pendientes de un usuario: el planificador estima los NULL de `seq`
+        # con la fracción de toda la tabla y, sin este índice, recorre la tabla entera
+        Index(
+            "ix_change_log_user_id_pending",
+            "user_id",
+            postgresql_where=text("seq IS NULL"),
+        ),
+        # Versión de los datos del usuario para el contexto del asistente (max(changed_at))
+        Index("ix_change_log_user_id_changed_at", "user_id", "changed_at"),
+        CheckConstraint("operation IN ('upsert', 'delete')", name="ck_change_log_operation"),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<ChangeLog(entity_type='{self.entity_type}', entity_id='{self.entity_id}', "
+            f"operation='{self.operation}', seq={self.seq})>"
+        )
+
+
+class ChangeLogHorizon(Base):
+    """Mayor `seq` purgado de cada usuario: los cursores anteriores deben resincronizar."""
+
+    __tablename__ = "change_log_horizon"
+
+    user_id: Mapped[str] = mapped_column(Text, primary_key=True)
+    purged_through: Mapped[int] = mapped_column(BigInteger, nullable=False)
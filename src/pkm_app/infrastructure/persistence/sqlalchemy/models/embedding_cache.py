@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import Integer, Text
+from sqlalchemy.dialects.postgresql import BYTEA, TIMESTAMP
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from .base import Base
+
+
+class EmbeddingCacheEntry(Base):
+    """
+    Embedding de un texto por modelo, compartido por todo el sistema.
+
+    La clave es el hash del texto normalizado (`notes.content_hash` para el texto de una
+    nota), así que un mismo texto se envía una sola vez al modelo aunque aparezca en notas
+    de distintos usuarios. `vector` guarda los float32 en little-endian.
+    """
+
+    __tablename__ = "embedding_cache"
+
+    model: Mapped[str] = mapped_column(Text, primary_key=True)
+    content_hash: Mapped[bytes] = mapped_column(BYTEA, primary_key=True)
+    dimension: Mapped[int] = mapped_column(Integer, nullable=False)
+    vector: Mapped[bytes] = mapped_column(BYTEA, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True), server_default=func.now(), nullable=False
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<EmbeddingCacheEntry(model='{self.model}', "
+            f"content_hash='{self.content_hash.hex()}', dimension={self.dimension})>"
+        )
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import Integer, Text
+from sqlalchemy.dialects.postgresql import BYTEA, TIMESTAMP
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from .base import Base
+
+
+class LLMResponseCacheEntry(Base):
+    """
+    Respuesta de un modelo de lenguaje a una petición determinista (temperatura 0).
+
+    La clave es el SHA-256 de la petición completa (proveedor, modelo, instrucción de
+    sistema, prompt y parámetros), así que solo la encuentra quien hace exactamente la misma
+    petición. `provider` y `model` permiten purgar las entradas de un modelo retirado.
+    """
+
+    __tablename__ = "llm_response_cache"
+
+    cache_key: Mapped[bytes] = mapped_column(BYTEA, primary_key=True)
+    provider: Mapped[str] = mapped_column(Text, nullable=False)
+    model: Mapped[str] = mapped_column(Text, nullable=False)
+    text: Mapped[str] = mapped_column(Text, nullable=False)
+    input_tokens: Mapped[int] = mapped_column(Integer, nullable=False)
+    output_tokens: Mapped[int] = mapped_column(Integer, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True), server_default=func.now(), nullable=False
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<LLMResponseCacheEntry(cache_key='{self.cache_key.hex()}', "
+            f"provider='{self.provider}', model='{self.model}')>"
+        )
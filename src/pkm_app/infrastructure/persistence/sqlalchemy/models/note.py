@@ -4,8 +4,8 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, Optional
 
-from sqlalchemy import ForeignKey, Text
-from sqlalchemy.dialects.postgresql import JSONB, TIMESTAMP, UUID, VARCHAR
+from sqlalchemy import Computed, ForeignKey, Index, Integer, Text, text
+from sqlalchemy.dialects.postgresql import BYTEA, JSONB, TIMESTAMP, UUID, VARCHAR
 
 # Descomenta la siguiente línea cuando vayas a implementar embeddings
 # from pgvector.sqlalchemy import Vector
@@ -65,6 +65,45 @@ class Note(Base):
         nullable=False,
         index=True,
     )
+    # Versión de la fila (control de concurrencia optimista): el ORM la incrementa en cada
+    # UPDATE y exige en el WHERE la versión que cargó
+    version: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("1"))
+    # SHA-256 del título y contenido normalizados (ver core/application/content_hashing.py),
+    # calculado por PostgreSQL en cada escritura. Diferida: los DTOs de nota no la llevan
+    content_hash: Mapped[bytes] = mapped_column(
+        BYTEA,
+        Computed("note_content_hash(title, content)", persisted=True),
+        nullable=False,
+        deferred=True,
+    )
+
+    __table_args__ = (
+        # GIN con jsonb_path_ops: soporta @>, @? y @@ con un índice más compacto que jsonb_ops
+        Index(
+            "ix_notes_note_metadata_gin",
+            "note_metadata",
+            postgresql_using="gin",
+            postgresql_ops={"note_metadata": "jsonb_path_ops"},
+        ),
+        # Sondas de versión de los listados (max(updated_at), count(*) y la suma de
+        # comprobación sobre version y created_at) con index-only scan
+        Index(
+            "ix_notes_user_id_updated_at",
+            "user_id",
+            "updated_at",
+            postgresql_include=["version", "created_at"],
+        ),
+        Index(
+            "ix_notes_user_id_project_id_updated_at",
+            "user_id",
+            "project_id",
+            "updated_at",
+            postgresql_include=["version", "created_at"],
+        ),
+        # Duplicados exactos por usuario (GROUP BY content_hash)
+        Index("ix_notes_user_id_content_hash", "user_id", "content_hash"),
+    )
+    __mapper_args__ = {"version_id_col": version}
 
     # Relaciones
     user: Mapped[UserProfile] = relationship(back_populates="notes")
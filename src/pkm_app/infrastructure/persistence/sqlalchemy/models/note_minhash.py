@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import uuid
+
+from sqlalchemy import BigInteger, ForeignKey, Index, Text
+from sqlalchemy.dialects.postgresql import ARRAY, BYTEA, UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+
+
+class NoteMinHash(Base):
+    """
+    Firma MinHash del contenido de una nota y sus claves LSH (ver `core/application/minhash.py`).
+
+    Una fila por nota, escrita por los casos de uso al crearla o cambiar su contenido. El
+    índice GIN sobre `band_keys` devuelve las notas que comparten alguna clave con otra sin
+    recorrer la tabla. Una nota sin palabras no tiene firma ni claves.
+    """
+
+    __tablename__ = "note_minhash"
+
+    note_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("notes.id", ondelete="CASCADE"), primary_key=True
+    )
+    user_id: Mapped[str] = mapped_column(Text, nullable=False)
+    signature: Mapped[bytes | None] = mapped_column(BYTEA, nullable=True)
+    band_keys: Mapped[list[int]] = mapped_column(ARRAY(BigInteger), nullable=False)
+
+    __table_args__ = (
+        Index("ix_note_minhash_band_keys", "band_keys", postgresql_using="gin"),
+        Index("ix_note_minhash_user_id", "user_id"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<NoteMinHash(note_id='{self.note_id}', user_id='{self.user_id}')>"
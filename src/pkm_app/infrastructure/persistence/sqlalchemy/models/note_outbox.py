@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import uuid
+from datetime import datetime
+
+from sqlalchemy import BigInteger, CheckConstraint, Identity, Integer, Text
+from sqlalchemy.dialects.postgresql import TIMESTAMP, UUID, VARCHAR
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from .base import Base
+
+
+class NoteOutbox(Base):
+    """
+    Cambios de notas pendientes de entregar al almacén vectorial (outbox transaccional).
+
+    Los escriben los triggers de la migración `add_note_outbox` en la transacción del propio
+    cambio, así que un rollback se lleva también el mensaje. El relay los elimina al
+    entregarlos; si la entrega falla, cuenta el intento y los aplaza hasta `available_at`.
+    """
+
+    __tablename__ = "note_outbox"
+
+    id: Mapped[int] = mapped_column(BigInteger, Identity(always=True), primary_key=True)
+    note_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
+    user_id: Mapped[str] = mapped_column(Text, nullable=False)
+    operation: Mapped[str] = mapped_column(VARCHAR(10), nullable=False)
+    version: Mapped[int] = mapped_column(Integer, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True), server_default=func.now(), nullable=False
+    )
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+    available_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True), server_default=func.now(), nullable=False
+    )
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    __table_args__ = (
+        CheckConstraint("operation IN ('upsert', 'delete')", name="ck_note_outbox_operation"),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<NoteOutbox(id={self.id}, note_id='{self.note_id}', "
+            f"operation='{self.operation}', attempts={self.attempts})>"
+        )
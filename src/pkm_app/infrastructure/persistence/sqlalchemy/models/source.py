@@ -4,7 +4,7 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import ForeignKey, Text
+from sqlalchemy import ForeignKey, Index, Integer, Text, text
 from sqlalchemy.dialects.postgresql import JSONB, TIMESTAMP, UUID, VARCHAR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
@@ -42,6 +42,19 @@ class Source(Base):
         onupdate=func.now(),
         nullable=False,
     )
+    # Control de concurrencia optimista, igual que Note.version
+    version: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("1"))
+
+    __table_args__ = (
+        # GIN con jsonb_path_ops: soporta @>, @? y @@ con un índice más compacto que jsonb_ops
+        Index(
+            "ix_sources_link_metadata_gin",
+            "link_metadata",
+            postgresql_using="gin",
+            postgresql_ops={"link_metadata": "jsonb_path_ops"},
+        ),
+    )
+    __mapper_args__ = {"version_id_col": version}
 
     # Relaciones
     user: Mapped[UserProfile] = relationship(back_populates="sources")
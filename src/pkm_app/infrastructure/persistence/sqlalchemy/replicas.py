@@ -0,0 +1,202 @@
+"""
+Enrutado de lecturas entre el primario y N réplicas de lectura.
+
+`ReplicaRouter` elige el engine para cada Unit of Work de solo lectura:
+
+- Si el usuario escribió hace menos de `sticky_seconds`, la lectura va al primario
+  (read-your-writes). Las escrituras las registra `SQLAlchemyUnitOfWork.commit()`.
+- Si no, se elige una réplica sana con la estrategia configurada: `round_robin` o
+  `least_connections` (menos conexiones en uso según las métricas del pool).
+- Las réplicas cuyo chequeo de salud falla o cuyo retraso de replicación supera
+  `max_lag_seconds` se expulsan hasta que un chequeo posterior las readmita. Sin réplicas
+  sanas, las lecturas van al primario.
+
+El chequeo de salud es una función inyectable (`probe`), de modo que el router puede
+probarse con dos instancias locales de PostgreSQL o con un sustituto en los tests.
+"""
+
+import asyncio
+import contextlib
+import itertools
+import logging
+import time
+from collections.abc import Awaitable, Callable, Sequence
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from src.pkm_app.infrastructure.persistence.sqlalchemy.engine import get_pool_metrics
+
+logger = logging.getLogger(__name__)
+
+ROUTING_STRATEGIES = ("round_robin", "least_connections")
+
+# Retraso de replicación en segundos; 0 si el servidor no es una réplica o si ya ha
+# reproducido todo lo recibido (evita falsos positivos cuando el primario está inactivo).
+REPLICATION_LAG_QUERY = text(
+    """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+    """
+)
+
+ReplicaProbe = Callable[[AsyncEngine], Awaitable[float]]
+
+
+async def probe_replication_lag(engine: AsyncEngine) -> float:
+    """Consulta el retraso de replicación de un servidor (lanza excepción si no responde)."""
+    async with engine.connect() as connection:
+        lag = (await connection.execute(REPLICATION_LAG_QUERY)).scalar_one()
+    return float(lag)
+
+
+class Replica:
+    """Estado de una réplica dentro del router."""
+
+    def __init__(self, engine: AsyncEngine):
+        self.engine = engine
+        self.healthy = True
+        self.lag_seconds = 0.0
+        self.last_error: str | None = None
+
+    @property
+    def name(self) -> str:
+        return self.engine.url.render_as_string(hide_password=True)
+
+    def connections_in_use(self) -> float:
+        metrics = get_pool_metrics(self.engine)
+        return metrics.checked_out if metrics is not None else 0.0
+
+
+class ReplicaRouter:
+    def __init__(
+        self,
+        primary: AsyncEngine,
+        replicas: Sequence[AsyncEngine],
+        strategy: str = "round_robin",
+        sticky_seconds: float = 5.0,
+        max_lag_seconds: float = 10.0,
+        probe: ReplicaProbe = probe_replication_lag,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if strategy not in ROUTING_STRATEGIES:
+            raise ValueError(
+                f"Estrategia de réplicas desconocida: '{strategy}'. "
+                f"Valores válidos: {', '.join(ROUTING_STRATEGIES)}."
+            )
+        self.primary = primary
+        self.replicas = [Replica(engine) for engine in replicas]
+        self.strategy = strategy
+        self.sticky_seconds = sticky_seconds
+        self.max_lag_seconds = max_lag_seconds
+        self._probe = probe
+        self._clock = clock
+        self._round_robin = itertools.count()
+        self._last_write: dict[str, float] = {}
+        self._sessionmakers: dict[AsyncEngine, async_sessionmaker[AsyncSession]] = {}
+        self._health_task: asyncio.Task[None] | None = None
+
+    # --- Read-your-writes ---
+
+    def record_write(self, user_id: str | None) -> None:
+        """Marca que `user_id` acaba de escribir: sus lecturas irán al primario un tiempo."""
+        if not user_id or not self.replicas:
+            return
+        now = self._clock()
+        self._last_write[user_id] = now
+        # Limpieza oportunista de las entradas ya caducadas
+        if len(self._last_write) > 1024:
+            expired = [key for key, at in self._last_write.items() if now - at > self.sticky_seconds]
+            for key in expired:
+                del self._last_write[key]
+
+    def is_sticky(self, user_id: str | None) -> bool:
+        if not user_id:
+            return False
+        written_at = self._last_write.get(user_id)
+        return written_at is not None and self._clock() - written_at < self.sticky_seconds
+
+    # --- Selección de engine ---
+
+    def healthy_replicas(self) -> list[Replica]:
+        return [replica for replica in self.replicas if replica.healthy]
+
+    def choose_read_engine(self, user_id: str | None = None) -> AsyncEngine:
+        """Engine para una lectura de `user_id` según stickiness, salud y estrategia."""
+        if self.is_sticky(user_id):
+            return self.primary
+        candidates = self.healthy_replicas()
+        if not candidates:
+            return self.primary
+        if self.strategy == "least_connections":
+            # Los empates (ej. ráfagas que eligen antes de obtener conexión) se reparten
+            # en round-robin para no cargar siempre la primera réplica
+            in_use = [replica.connections_in_use() for replica in candidates]
+            fewest = min(in_use)
+            candidates = [
+                replica for replica, count in zip(candidates, in_use, strict=True) if count == fewest
+            ]
+        return candidates[next(self._round_robin) % len(candidates)].engine
+
+    def read_sessionmaker(self, user_id: str | None = None) -> async_sessionmaker[AsyncSession]:
+        """Sessionmaker (memorizado por engine) para una lectura de `user_id`."""
+        engine = self.choose_read_engine(user_id)
+        sessionmaker = self._sessionmakers.get(engine)
+        if sessionmaker is None:
+            sessionmaker = async_sessionmaker(
+                bind=engine, class_=AsyncSession, expire_on_commit=False, autoflush=False
+            )
+            self._sessionmakers[engine] = sessionmaker
+        return sessionmaker
+
+    # --- Salud y retraso ---
+
+    async def check_health(self) -> None:
+        """Sondea todas las réplicas y expulsa/readmite según salud y retraso."""
+        results = await asyncio.gather(
+            *(self._probe(replica.engine) for replica in self.replicas), return_exceptions=True
+        )
+        for replica, result in zip(self.replicas, results, strict=True):
+            was_healthy = replica.healthy
+            if isinstance(result, BaseException):
+                replica.healthy = False
+                replica.last_error = str(result)
+            else:
+                replica.lag_seconds = result
+                replica.healthy = result <= self.max_lag_seconds
+                replica.last_error = (
+                    None if replica.healthy else f"Retraso de {result:.1f}s sobre el máximo"
+                )
+            if was_healthy != replica.healthy:
+                logger.warning(
+                    "Réplica %s %s: %s",
+                    replica.name,
+                    "readmitida" if replica.healthy else "expulsada",
+                    replica.last_error or "chequeo correcto",
+                )
+
+    async def _health_loop(self, interval: float) -> None:
+        while True:
+            try:
+                await self.check_health()
+            except Exception:  # pragma: no cover - el bucle no debe morir
+                logger.exception("Error inesperado en el chequeo de réplicas")
+            await asyncio.sleep(interval)
+
+    def start_health_checks(self, interval: float) -> None:
+        """Lanza el chequeo periódico en segundo plano (una vez por event loop de la app)."""
+        if self.replicas and self._health_task is None:
+            self._health_task = asyncio.get_running_loop().create_task(self._health_loop(interval))
+
+    async def close(self) -> None:
+        """Detiene los chequeos y cierra los engines de las réplicas (no el primario)."""
+        if self._health_task is not None:
+            self._health_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._health_task
+            self._health_task = None
+        for replica in self.replicas:
+            await replica.engine.dispose()
@@ -1,12 +1,33 @@
+from src.pkm_app.infrastructure.persistence.sqlalchemy.repositories.change_feed_repository import (
+    SQLAlchemyChangeFeedRepository,
+)
+from src.pkm_app.infrastructure.persistence.sqlalchemy.repositories.context_repository import (
+    SQLAlchemyAssistantContextRepository,
+)
+from src.pkm_app.infrastructure.persistence.sqlalchemy.repositories.embedding_repository import (
+    SQLAlchemyEmbeddingCacheRepository,
+)
 from src.pkm_app.infrastructure.persistence.sqlalchemy.repositories.keyword_repository import (
     SQLAlchemyKeywordRepository,
 )
+from src.pkm_app.infrastructure.persistence.sqlalchemy.repositories.llm_cache_repository import (
+    SQLAlchemyLLMResponseCacheRepository,
+)
+from src.pkm_app.infrastructure.persistence.sqlalchemy.repositories.minhash_repository import (
+    SQLAlchemyNearDuplicateRepository,
+)
 from src.pkm_app.infrastructure.persistence.sqlalchemy.repositories.note_link_repository import (
     SQLAlchemyNoteLinkRepository,
 )
+from src.pkm_app.infrastructure.persistence.sqlalchemy.repositories.note_read_repository import (
+    SQLAlchemyNoteReadRepository,
+)
 from src.pkm_app.infrastructure.persistence.sqlalchemy.repositories.note_repository import (
     SQLAlchemyNoteRepository,
 )
+from src.pkm_app.infrastructure.persistence.sqlalchemy.repositories.outbox_repository import (
+    SQLAlchemyOutboxRepository,
+)
 from src.pkm_app.infrastructure.persistence.sqlalchemy.repositories.project_repository import (
     SQLAlchemyProjectRepository,
 )
@@ -18,10 +39,17 @@ from src.pkm_app.infrastructure.persistence.sqlalchemy.repositories.user_profile
 )
 
 __all__ = [
+    "SQLAlchemyAssistantContextRepository",
+    "SQLAlchemyChangeFeedRepository",
+    "SQLAlchemyEmbeddingCacheRepository",
     "SQLAlchemyKeywordRepository",
+    "SQLAlchemyLLMResponseCacheRepository",
+    "SQLAlchemyNearDuplicateRepository",
     "SQLAlchemyNoteLinkRepository",
+    "SQLAlchemyNoteReadRepository",
     "SQLAlchemyNoteRepository",
+    "SQLAlchemyOutboxRepository",
     "SQLAlchemyProjectRepository",
     "SQLAlchemySourceRepository",
     "SQLAlchemyUserProfileRepository",
-]
+]
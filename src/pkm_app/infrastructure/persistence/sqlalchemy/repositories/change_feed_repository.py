@@ -0,0 +1,166 @@
+"""
+Feed de cambios por usuario sobre la tabla `change_log`.
+
+Los triggers de notas, proyectos, fuentes, keywords y enlaces (migración `add_change_feed`)
+mantienen una fila por entidad con su último cambio y `seq = NULL`. La posición en el feed
+no se asigna al escribir sino al leer: una secuencia asignada al escribir no respeta el
+orden de commit (una transacción que toma `seq = 9` puede confirmar después de otra que
+toma `seq = 10`, y un cliente que ya leyó el 10 perdería el 9). Al leer:
+
+1. se toma un advisory lock de transacción por usuario, que serializa a los lectores de un
+   mismo usuario (los escritores no lo toman y nunca esperan por él);
+2. se numeran los cambios confirmados sin `seq` (`FOR UPDATE SKIP LOCKED` salta los que
+   una escritura en curso está modificando: se numerarán en una lectura posterior);
+3. se leen los cambios con `seq > cursor`.
+
+Como cada numeración confirma antes de que el siguiente lector del usuario obtenga el lock,
+un cambio que aparece con `seq` nunca queda por detrás de un cursor ya entregado.
+
+Con cursor 0 no se devuelven cambios, solo el cursor actual: el cliente carga sus datos con
+los listados normales y sigue el feed desde ahí. Paginar el feed desde 0 entregaría cursores
+antiguos (cada fila conserva su `seq`), indistinguibles de los de un cliente que no sincroniza
+desde antes de una purga de lápidas.
+"""
+
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import (
+    BigInteger,
+    Integer,
+    bindparam,
+    delete,
+    func,
+    literal,
+    select,
+    true,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.pkm_app.core.application.dtos import ChangeFeedPage, ChangeRecord
+from src.pkm_app.core.application.interfaces.change_feed_interface import IChangeFeedRepository
+from src.pkm_app.infrastructure.monitoring.collectors import timed_repository
+from src.pkm_app.infrastructure.persistence.sqlalchemy.models import ChangeLog as ChangeLogModel
+from src.pkm_app.infrastructure.persistence.sqlalchemy.models import (
+    ChangeLogHorizon as ChangeLogHorizonModel,
+)
+from src.pkm_app.infrastructure.persistence.sqlalchemy.models import change_log_seq
+from src.pkm_app.infrastructure.persistence.sqlalchemy.repositories.hydration import trusted
+
+CHANGES = ChangeLogModel.__table__
+HORIZON = ChangeLogHorizonModel.__table__
+
+# Primera clave de pg_advisory_xact_lock(int, int); la segunda es el hash del usuario
+SEQUENCER_LOCK_KEY = 0x6368616E  # "chan"
+
+RECORD_FIELDS = ("seq", "entity_type", "entity_id", "operation", "version", "changed_at")
+
+_owner = bindparam("owner")
+_cursor = bindparam("cursor", type_=BigInteger)
+
+LOCK_SEQUENCER = select(
+    func.pg_advisory_xact_lock(literal(SEQUENCER_LOCK_KEY, Integer), func.hashtext(_owner))
+)
+
+_pending = (
+    select(CHANGES.c.entity_type, CHANGES.c.entity_id)
+    .where(CHANGES.c.user_id == _owner, CHANGES.c.seq.is_(None))
+    .with_for_update(skip_locked=True)
+)
+SEQUENCE_PENDING = (
+    update(CHANGES)
+    .where(tuple_(CHANGES.c.entity_type, CHANGES.c.entity_id).in_(_pending))
+    .values(seq=change_log_seq.next_value())
+)
+
+_page = (
+    select(*(CHANGES.c[field] for field in RECORD_FIELDS))
+    .where(CHANGES.c.user_id == _owner, CHANGES.c.seq > _cursor)
+    .order_by(CHANGES.c.seq)
+    .limit(bindparam("limit"))
+    .subquery("page")
+)
+_state = select(
+    func.coalesce(
+        select(HORIZON.c.purged_through).where(HORIZON.c.user_id == _owner).scalar_subquery(),
+        0,
+    ).label("purged_through"),
+    func.coalesce(
+        select(func.max(CHANGES.c.seq)).where(CHANGES.c.user_id == _owner).scalar_subquery(), 0
+    ).label("last_seq"),
+).subquery("state")
+# Horizonte de purga y página en la misma sentencia (misma instantánea): una purga
+# concurrente se ve entera o no se ve
+READ_CHANGES = select(_state, *(_page.c[field] for field in RECORD_FIELDS)).select_from(
+    _state.outerjoin(_page, true())
+)
+
+_purged = (
+    delete(CHANGES)
+    .where(
+        CHANGES.c.operation == "delete",
+        CHANGES.c.seq.is_not(None),
+        CHANGES.c.changed_at < bindparam("older_than"),
+    )
+    .returning(CHANGES.c.user_id, CHANGES.c.seq)
+    .cte("purged")
+)
+_horizon_insert = pg_insert(HORIZON).from_select(
+    ["user_id", "purged_through"],
+    select(_purged.c.user_id, func.max(_purged.c.seq)).group_by(_purged.c.user_id),
+)
+_record_horizon = _horizon_insert.on_conflict_do_update(
+    index_elements=[HORIZON.c.user_id],
+    set_={
+        "purged_through": func.greatest(
+            HORIZON.c.purged_through, _horizon_insert.excluded.purged_through
+        )
+    },
+).cte("record_horizon")
+PURGE_TOMBSTONES = select(func.count()).select_from(_purged).add_cte(_record_horizon)
+
+
+@timed_repository
+class SQLAlchemyChangeFeedRepository(IChangeFeedRepository):
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get_changes_since(self, user_id: str, cursor: int, limit: int) -> ChangeFeedPage:
+        owner = {"owner": user_id}
+        await self.session.execute(LOCK_SEQUENCER, owner)
+        await self.session.execute(SEQUENCE_PENDING, owner)
+        # Una fila de más para saber si hay otra página; con cursor 0 solo hace falta el estado
+        page_size = limit + 1 if cursor else 0
+        rows = (
+            await self.session.execute(
+                READ_CHANGES, {**owner, "cursor": cursor, "limit": page_size}
+            )
+        ).all()
+
+        purged_through, last_seq = rows[0][:2]
+        # Si lo último que se numeró fue una lápida ya purgada, el cursor actual es el horizonte
+        last_seq = max(last_seq, purged_through)
+        if not cursor:
+            return ChangeFeedPage(next_cursor=last_seq)
+        if cursor < purged_through:
+            return ChangeFeedPage(next_cursor=last_seq, reset_required=True)
+
+        records = [_record(row[2:]) for row in rows if row[2] is not None]
+        has_more = len(records) > limit
+        records = records[:limit]
+        return ChangeFeedPage(
+            changes=records,
+            next_cursor=records[-1].seq if records else cursor,
+            has_more=has_more,
+        )
+
+    async def purge_tombstones(self, older_than: datetime) -> int:
+        result = await self.session.execute(PURGE_TOMBSTONES, {"older_than": older_than})
+        return int(result.scalar_one())
+
+
+def _record(values: Any) -> ChangeRecord:
+    return trusted(ChangeRecord, dict(zip(RECORD_FIELDS, values, strict=True)))
@@ -0,0 +1,213 @@
+"""
+Lecturas del contexto del asistente: versión de los datos, candidatos y extractos.
+
+- Estado: si quedan cambios del usuario sin numerar en `change_log`, el último `changed_at`
+  (el instante desde el que se mide la antigüedad de las notas, con una sola bajada por el
+  índice `ix_change_log_user_id_changed_at`) y el `learned_context` del perfil. La versión de
+  los datos no sale de aquí sino del cursor del feed de cambios, que se asigna en orden de
+  commit: `changed_at` es el inicio de la transacción que escribió (now()), y una escritura
+  que confirma tarde puede quedar por debajo del máximo.
+- Candidatos: unión de las notas con keywords de la consulta, las recientes del proyecto y
+  las recientes del usuario (cada rama por índice y con LIMIT), sin leer el contenido:
+  `octet_length` da la longitud sin descomprimir el TOAST. Las notas de cada keyword se
+  buscan con un LATERAL con LIMIT: el planificador estima mal la unión con `note_keywords` y
+  prefiere recorrerla entera.
+- Extractos: `left(content, n)` de cada nota elegida y `left(description, n)` de cada
+  proyecto en una sola consulta, con los ids y longitudes como arrays.
+"""
+
+import uuid
+from collections.abc import Mapping, Sequence
+
+from sqlalchemy import (
+    Integer,
+    Text,
+    any_,
+    bindparam,
+    func,
+    literal_column,
+    select,
+    true,
+    union,
+    union_all,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.pkm_app.core.application.dtos import ContextCandidate, ContextExcerpts, ContextState
+from src.pkm_app.core.application.interfaces.assistant_context_interface import (
+    IAssistantContextRepository,
+)
+from src.pkm_app.infrastructure.monitoring.collectors import timed_repository
+from src.pkm_app.infrastructure.persistence.sqlalchemy.models import ChangeLog as ChangeLogModel
+from src.pkm_app.infrastructure.persistence.sqlalchemy.models import Keyword as KeywordModel
+from src.pkm_app.infrastructure.persistence.sqlalchemy.models import Note as NoteModel
+from src.pkm_app.infrastructure.persistence.sqlalchemy.models import NoteLink as NoteLinkModel
+from src.pkm_app.infrastructure.persistence.sqlalchemy.models import Project as ProjectModel
+from src.pkm_app.infrastructure.persistence.sqlalchemy.models import (
+    UserProfile as UserProfileModel,
+)
+from src.pkm_app.infrastructure.persistence.sqlalchemy.models import (
+    note_keywords_association_table,
+)
+
+CHANGES = ChangeLogModel.__table__
+KEYWORDS = KeywordModel.__table__
+LINKS = NoteLinkModel.__table__
+NOTE_KEYWORDS = note_keywords_association_table
+NOTES = NoteModel.__table__
+PROFILES = UserProfileModel.__table__
+PROJECTS = ProjectModel.__table__
+
+_user_id = bindparam("user_id", type_=Text)
+_limit = bindparam("limit", type_=Integer)
+
+_last_changed_at = (
+    select(func.max(CHANGES.c.changed_at)).where(CHANGES.c.user_id == _user_id).scalar_subquery()
+)
+# En orden descendente PostgreSQL pone los NULL primero: una sola bajada hacia atrás por
+# `ix_change_log_user_id_seq`. Con EXISTS el planificador estima muchas filas sin numerar
+# (las de todos los usuarios) y prefiere recorrer la tabla.
+_pending_changes = (
+    select(CHANGES.c.seq.is_(None))
+    .where(CHANGES.c.user_id == _user_id)
+    .order_by(CHANGES.c.seq.desc())
+    .limit(1)
+    .scalar_subquery()
+)
+_learned_context = (
+    select(PROFILES.c.learned_context).where(PROFILES.c.user_id == _user_id).scalar_subquery()
+)
+GET_STATE = select(_last_changed_at, func.coalesce(_pending_changes, False), _learned_context)
+
+_tagged = (
+    select(NOTE_KEYWORDS.c.note_id)
+    .where(NOTE_KEYWORDS.c.keyword_id == KEYWORDS.c.id)
+    .limit(_limit)
+    .lateral("tagged")
+)
+# Notas con keywords cuyo nombre es uno de los términos, las que tienen más primero
+_matched = (
+    select(_tagged.c.note_id, func.count().label("keyword_hits"))
+    .select_from(KEYWORDS.join(_tagged, true()))
+    .where(
+        KEYWORDS.c.user_id == _user_id,
+        func.lower(KEYWORDS.c.name) == any_(bindparam("terms", type_=ARRAY(Text))),
+    )
+    .group_by(_tagged.c.note_id)
+    .order_by(func.count().desc(), _tagged.c.note_id)
+    .limit(_limit)
+    .cte("matched")
+)
+# Con project_id NULL la rama del proyecto no devuelve filas
+_candidate_ids = union(
+    select(_matched.c.note_id.label("id")),
+    select(NOTES.c.id)
+    .where(NOTES.c.user_id == _user_id, NOTES.c.project_id == bindparam("project_id"))
+    .order_by(NOTES.c.updated_at.desc())
+    .limit(_limit),
+    select(NOTES.c.id)
+    .where(NOTES.c.user_id == _user_id)
+    .order_by(NOTES.c.updated_at.desc())
+    .limit(_limit),
+).subquery("candidate_ids")
+_link_count = (
+    select(func.count()).where(LINKS.c.source_note_id == NOTES.c.id).scalar_subquery()
+    + select(func.count()).where(LINKS.c.target_note_id == NOTES.c.id).scalar_subquery()
+)
+FIND_CANDIDATES = (
+    select(
+        NOTES.c.id,
+        NOTES.c.title,
+        NOTES.c.updated_at,
+        func.octet_length(NOTES.c.content),
+        func.coalesce(_matched.c.keyword_hits, 0),
+        _link_count,
+        NOTES.c.project_id,
+        PROJECTS.c.name,
+        func.coalesce(func.octet_length(PROJECTS.c.description), 0),
+    )
+    .select_from(
+        NOTES.join(_candidate_ids, _candidate_ids.c.id == NOTES.c.id)
+        .outerjoin(_matched, _matched.c.note_id == NOTES.c.id)
+        .outerjoin(PROJECTS, PROJECTS.c.id == NOTES.c.project_id)
+    )
+    .where(NOTES.c.user_id == _user_id)
+)
+
+_note_rows = (
+    func.unnest(
+        bindparam("note_ids", type_=ARRAY(UUID(as_uuid=True))),
+        bindparam("note_chars", type_=ARRAY(Integer)),
+    )
+    .table_valued("id", "chars")
+    .render_derived()
+)
+_project_rows = (
+    func.unnest(
+        bindparam("project_ids", type_=ARRAY(UUID(as_uuid=True))),
+        bindparam("project_chars", type_=ARRAY(Integer)),
+    )
+    .table_valued("id", "chars")
+    .render_derived()
+)
+GET_EXCERPTS = union_all(
+    select(
+        literal_column("'note'").label("kind"),
+        NOTES.c.id,
+        func.left(NOTES.c.content, _note_rows.c.chars),
+    )
+    .select_from(NOTES.join(_note_rows, _note_rows.c.id == NOTES.c.id))
+    .where(NOTES.c.user_id == _user_id),
+    select(
+        literal_column("'project'"),
+        PROJECTS.c.id,
+        func.left(PROJECTS.c.description, _project_rows.c.chars),
+    )
+    .select_from(PROJECTS.join(_project_rows, _project_rows.c.id == PROJECTS.c.id))
+    .where(PROJECTS.c.user_id == _user_id),
+)
+
+
+@timed_repository
+class SQLAlchemyAssistantContextRepository(IAssistantContextRepository):
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get_state(self, user_id: str) -> ContextState:
+        result = await self.session.execute(GET_STATE, {"user_id": user_id})
+        last_changed_at, pending_changes, learned_context = result.one()
+        return ContextState(last_changed_at, learned_context, pending_changes)
+
+    async def find_candidates(
+        self, user_id: str, terms: Sequence[str], project_id: uuid.UUID | None, limit: int
+    ) -> list[ContextCandidate]:
+        result = await self.session.execute(
+            FIND_CANDIDATES,
+            {"user_id": user_id, "terms": list(terms), "project_id": project_id, "limit": limit},
+        )
+        return [ContextCandidate(*row) for row in result]
+
+    async def get_excerpts(
+        self,
+        user_id: str,
+        notes: Mapping[uuid.UUID, int],
+        projects: Mapping[uuid.UUID, int],
+    ) -> ContextExcerpts:
+        excerpts = ContextExcerpts(notes={}, projects={})
+        if not notes and not projects:
+            return excerpts
+        result = await self.session.execute(
+            GET_EXCERPTS,
+            {
+                "user_id": user_id,
+                "note_ids": list(notes),
+                "note_chars": list(notes.values()),
+                "project_ids": list(projects),
+                "project_chars": list(projects.values()),
+            },
+        )
+        for kind, entity_id, text in result:
+            target = excerpts.notes if kind == "note" else excerpts.projects
+            target[entity_id] = text or ""
+        return excerpts
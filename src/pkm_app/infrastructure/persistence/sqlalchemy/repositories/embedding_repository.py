@@ -0,0 +1,62 @@
+"""
+Caché de embeddings en PostgreSQL (`embedding_cache`).
+
+Los vectores se guardan como los bytes float32 little-endian del array, sin serializar: leer
+una entrada es un `np.frombuffer` sin copia. La tabla es de todo el sistema, no por usuario:
+la clave es el hash del texto, que no revela a quién pertenece.
+"""
+
+from collections.abc import Mapping, Sequence
+
+import numpy as np
+from sqlalchemy import bindparam, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.pkm_app.core.application.interfaces.embedding_interface import IEmbeddingCacheRepository
+from src.pkm_app.infrastructure.monitoring.collectors import timed_repository
+from src.pkm_app.infrastructure.persistence.sqlalchemy.models import EmbeddingCacheEntry
+
+EMBEDDING_CACHE = EmbeddingCacheEntry.__table__
+VECTOR_DTYPE = np.dtype("<f4")
+
+GET_MANY = select(EMBEDDING_CACHE.c.content_hash, EMBEDDING_CACHE.c.vector).where(
+    EMBEDDING_CACHE.c.model == bindparam("model"),
+    EMBEDDING_CACHE.c.content_hash.in_(bindparam("hashes", expanding=True)),
+)
+PUT_MANY = insert(EMBEDDING_CACHE).on_conflict_do_nothing(
+    index_elements=[EMBEDDING_CACHE.c.model, EMBEDDING_CACHE.c.content_hash]
+)
+
+
+@timed_repository
+class SQLAlchemyEmbeddingCacheRepository(IEmbeddingCacheRepository):
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get_many(self, model: str, hashes: Sequence[bytes]) -> dict[bytes, np.ndarray]:
+        if not hashes:
+            return {}
+        result = await self.session.execute(GET_MANY, {"model": model, "hashes": list(hashes)})
+        return {
+            content_hash: np.frombuffer(vector, dtype=VECTOR_DTYPE)
+            for content_hash, vector in result
+        }
+
+    async def put_many(self, model: str, vectors: Mapping[bytes, np.ndarray]) -> None:
+        if not vectors:
+            return
+        rows = []
+        for content_hash, vector in vectors.items():
+            data = np.ascontiguousarray(vector, dtype=VECTOR_DTYPE)
+            if data.ndim != 1:
+                raise ValueError("Cada embedding debe ser un vector de una dimensión.")
+            rows.append(
+                {
+                    "model": model,
+                    "content_hash": content_hash,
+                    "dimension": data.shape[0],
+                    "vector": data.tobytes(),
+                }
+            )
+        await self.session.execute(PUT_MANY, rows)
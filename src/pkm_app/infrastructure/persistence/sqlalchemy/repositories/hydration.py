@@ -0,0 +1,167 @@
+"""
+Hidratación confiable de DTOs y entidades a partir de datos de nuestra propia base de datos.
+
+`model_validate` valida cada campo (tipos, longitudes, zonas horarias, validadores de modelo
+en Python) en cada objeto cargado. Los datos que devuelve la base de datos ya cumplieron esas
+reglas al escribirse, así que los repositorios los convierten con `trusted()`.
+
+`trusted()` usa un validador de pydantic-core precompilado por modelo en el que los campos
+se aceptan tal cual (`any`): el núcleo en Rust sigue creando la instancia, leyendo atributos
+ORM (`from_attributes`), aplicando defaults y copiando diccionarios y listas, pero no ejecuta
+comprobaciones de campos ni validadores Python. Los modelos anidados (`project`, `keywords`,
+...) usan a su vez su esquema confiable, y solo los campos cuyo tipo necesita conversión
+(ej. `AnyUrl` desde texto) conservan su esquema original.
+
+pydantic-core reutiliza el validador ya compilado de una clase completa para cualquier
+esquema `model` de esa clase (volvería a validarlo todo), así que el validador confiable se
+compila con los modelos marcados temporalmente como incompletos. Esa marca la ve todo el
+proceso, así que cada validador se compila una sola vez y bajo un candado, y los de los DTOs
+que devuelven los repositorios (`REPOSITORY_MODELS`) al importar este módulo, antes de que
+ningún repositorio los use.
+
+Usar exclusivamente sobre la salida de los repositorios: nunca sobre entradas del usuario.
+"""
+
+import datetime
+import threading
+import types
+import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
+from functools import cache
+from typing import Any, TypeVar, Union, get_args, get_origin
+
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import CoreSchema, SchemaValidator
+from pydantic_core import core_schema as cs
+
+from src.pkm_app.core.application.dtos import (
+    ChangeRecord,
+    DuplicateNoteGroup,
+    KeywordSchema,
+    NoteIndexDocument,
+    NoteLinkSchema,
+    NoteSchema,
+    OutboxMessage,
+    ProjectSchema,
+    SourceSchema,
+    UserProfileSchema,
+)
+from src.pkm_app.infrastructure.monitoring.collectors import register_function_cache
+
+M = TypeVar("M", bound=BaseModel)
+
+# Tipos que la base de datos ya entrega tal y como los dejaría la validación
+_PASSTHROUGH_TYPES = (str, int, float, bool, uuid.UUID, datetime.datetime)
+
+# DTOs que construyen los repositorios: sus validadores se compilan al importar el módulo
+REPOSITORY_MODELS: tuple[type[BaseModel], ...] = (
+    NoteSchema,
+    ProjectSchema,
+    SourceSchema,
+    KeywordSchema,
+    NoteLinkSchema,
+    UserProfileSchema,
+    ChangeRecord,
+    DuplicateNoteGroup,
+    NoteIndexDocument,
+    OutboxMessage,
+)
+
+# Serializa las compilaciones, que cambian temporalmente el estado de las clases
+_COMPILE_LOCK = threading.Lock()
+
+
+def trusted(model: type[M], source: Any) -> M:
+    """
+    Construye `model` desde `source` (dict o instancia ORM) sin validar sus campos.
+
+    Produce el mismo objeto que `model.model_validate(source)` para datos que ya son válidos.
+    """
+    return trusted_validator(model).validate_python(source)  # type: ignore[no-any-return]
+
+
+@cache
+def trusted_validator(model: type[BaseModel]) -> SchemaValidator:
+    """Validador confiable de `model`, compilado en la primera llamada."""
+    schema = _model_schema(model)
+    with _COMPILE_LOCK, _without_prebuilt_validators(_models_in(schema)):
+        return SchemaValidator(schema)
+
+
+register_function_cache("trusted_validator", trusted_validator)
+
+
+def _is_model(annotation: Any) -> bool:
+    return isinstance(annotation, type) and issubclass(annotation, BaseModel)
+
+
+def _passthrough_schema(annotation: Any) -> CoreSchema | None:
+    """Esquema sin comprobaciones para `annotation`, o None si necesita su validación real."""
+    origin = get_origin(annotation)
+    if _is_model(annotation):
+        return _model_schema(annotation)
+    if origin is list or annotation is list:
+        (item,) = get_args(annotation) or (Any,)
+        return cs.list_schema(_model_schema(item) if _is_model(item) else cs.any_schema())
+    if origin is dict or annotation is dict:
+        return cs.dict_schema(cs.any_schema(), cs.any_schema())
+    if annotation is Any or annotation in _PASSTHROUGH_TYPES:
+        return cs.any_schema()
+    return None
+
+
+def _field_schema(annotation: Any) -> CoreSchema:
+    schema: CoreSchema | None
+    if get_origin(annotation) in (Union, types.UnionType):
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        inner = _passthrough_schema(args[0]) if len(args) == 1 else None
+        schema = cs.nullable_schema(inner) if inner is not None else None
+    else:
+        schema = _passthrough_schema(annotation)
+    # Tipos con conversión real (AnyUrl, EmailStr, uniones, ...): esquema original
+    return schema if schema is not None else TypeAdapter(annotation).core_schema
+
+
+def _models_in(schema: Any) -> set[type[BaseModel]]:
+    """Clases de todos los esquemas `model` contenidos en `schema`."""
+    if isinstance(schema, dict):
+        found = {schema["cls"]} if schema.get("type") == "model" else set()
+        return found.union(*(_models_in(value) for value in schema.values()))
+    return set()
+
+
+@contextmanager
+def _without_prebuilt_validators(models: set[type[BaseModel]]) -> Iterator[None]:
+    # pydantic-core solo reutiliza el validador de clases con `__pydantic_complete__` en True
+    for model in models:
+        model.__pydantic_complete__ = False
+    try:
+        yield
+    finally:
+        for model in models:
+            model.__pydantic_complete__ = True
+
+
+def _model_schema(model: type[BaseModel]) -> CoreSchema:
+    fields = {}
+    for name, field in model.__pydantic_fields__.items():
+        schema = _field_schema(field.annotation)
+        if field.default_factory is not None:
+            schema = cs.with_default_schema(schema, default_factory=field.default_factory)
+        elif not field.is_required():
+            schema = cs.with_default_schema(schema, default=field.default)
+        fields[name] = cs.model_field(schema)
+    return cs.model_schema(
+        model,
+        cs.model_fields_schema(fields),
+        config=cs.CoreConfig(from_attributes=True, extra_fields_behavior="ignore"),
+    )
+
+
+def _compile_repository_validators() -> None:
+    for model in REPOSITORY_MODELS:
+        trusted_validator(model)
+
+
+_compile_repository_validators()
@@ -13,9 +13,21 @@ from src.pkm_app.core.application.dtos.keyword_dto import (
     KeywordUpdate,
 )
 from src.pkm_app.core.application.interfaces.keyword_interface import IKeywordRepository
+from src.pkm_app.infrastructure.monitoring.collectors import timed_repository
+from src.pkm_app.infrastructure.persistence.sqlalchemy.concurrency import (
+    check_expected_version,
+    stale_data_as_conflict,
+)
 from src.pkm_app.infrastructure.persistence.sqlalchemy.models import Keyword as KeywordModel
+from src.pkm_app.infrastructure.persistence.sqlalchemy.repositories.hydration import trusted
+from src.pkm_app.infrastructure.persistence.sqlalchemy.repositories.note_repository import (
+    NOTE_KEYWORDS,
+    NOTES,
+    touch_notes,
+)
 
 
+@timed_repository
 class SQLAlchemyKeywordRepository(IKeywordRepository):
     def __init__(self, session: AsyncSession):
         self.session = session
@@ -31,7 +43,7 @@ class SQLAlchemyKeywordRepository(IKeywordRepository):
     async def get_by_id(self, keyword_id: UUID, user_id: str) -> KeywordSchema | None:
         keyword_instance = await self._get_keyword_instance(keyword_id, user_id)
         if keyword_instance:
-            return KeywordSchema.model_validate(keyword_instance)
+            return trusted(KeywordSchema, keyword_instance)
         return None
 
     async def list_by_user(
@@ -46,7 +58,7 @@ class SQLAlchemyKeywordRepository(IKeywordRepository):
         )
         result = await self.session.execute(stmt)
         keywords = result.scalars().all()
-        return [KeywordSchema.model_validate(keyword) for keyword in keywords]
+        return [trusted(KeywordSchema, keyword) for keyword in keywords]
 
     async def create(self, keyword_in: KeywordCreate, user_id: str) -> KeywordSchema:
         # Verificar si ya existe un keyword con el mismo nombre para este usuario
@@ -63,17 +75,22 @@ class SQLAlchemyKeywordRepository(IKeywordRepository):
             self.session.add(keyword_instance)
             await self.session.flush()
             await self.session.refresh(keyword_instance)
-            return KeywordSchema.model_validate(keyword_instance)
+            return trusted(KeywordSchema, keyword_instance)
         except IntegrityError as e:
             await self.session.rollback()
             raise ValueError(f"Error de integridad al crear el keyword: {keyword_in.name}") from e
 
     async def update(
-        self, keyword_id: UUID, keyword_in: KeywordUpdate, user_id: str
+        self,
+        keyword_id: UUID,
+        keyword_in: KeywordUpdate,
+        user_id: str,
+        expected_version: int | None = None,
     ) -> KeywordSchema | None:
         keyword_instance = await self._get_keyword_instance(keyword_id, user_id)
         if not keyword_instance:
             return None
+        check_expected_version(keyword_instance, expected_version, "Keyword")
 
         # Si se está actualizando el nombre, verificar que no exista otro keyword con ese nombre
         if keyword_in.name and keyword_in.name != keyword_instance.name:
@@ -88,9 +105,10 @@ class SQLAlchemyKeywordRepository(IKeywordRepository):
             setattr(keyword_instance, field, value)
 
         try:
-            await self.session.flush()
+            with stale_data_as_conflict("Keyword", keyword_id, expected_version):
+                await self.session.flush()
             await self.session.refresh(keyword_instance)
-            return KeywordSchema.model_validate(keyword_instance)
+            return trusted(KeywordSchema, keyword_instance)
         except IntegrityError as e:
             await self.session.rollback()
             raise ValueError("Error de integridad al actualizar el keyword") from e
@@ -100,6 +118,9 @@ class SQLAlchemyKeywordRepository(IKeywordRepository):
         if not keyword_instance:
             return False
 
+        # El CASCADE de note_keywords quita la keyword de sus notas: nueva versión para ellas
+        tagged = select(NOTE_KEYWORDS.c.note_id).where(NOTE_KEYWORDS.c.keyword_id == keyword_id)
+        await self.session.execute(touch_notes(NOTES.c.id.in_(tagged)))
         await self.session.delete(keyword_instance)
         await self.session.flush()
         return True
@@ -111,5 +132,5 @@ class SQLAlchemyKeywordRepository(IKeywordRepository):
         result = await self.session.execute(stmt)
         keyword = result.scalar_one_or_none()
         if keyword:
-            return KeywordSchema.model_validate(keyword)
+            return trusted(KeywordSchema, keyword)
         return None
@@ -0,0 +1,67 @@
+"""
+Caché de respuestas de modelos de lenguaje en PostgreSQL (`llm_response_cache`).
+
+Como la de embeddings, es de todo el sistema y sus entradas no se invalidan: una petición
+determinista al mismo modelo tiene siempre la misma respuesta.
+"""
+
+from collections.abc import Mapping, Sequence
+
+from sqlalchemy import bindparam, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.pkm_app.core.application.dtos import LLMResponse
+from src.pkm_app.core.application.interfaces.llm_interface import ILLMResponseCacheRepository
+from src.pkm_app.infrastructure.monitoring.collectors import timed_repository
+from src.pkm_app.infrastructure.persistence.sqlalchemy.models import LLMResponseCacheEntry
+
+LLM_CACHE = LLMResponseCacheEntry.__table__
+
+GET_MANY = select(
+    LLM_CACHE.c.cache_key,
+    LLM_CACHE.c.model,
+    LLM_CACHE.c.text,
+    LLM_CACHE.c.input_tokens,
+    LLM_CACHE.c.output_tokens,
+).where(LLM_CACHE.c.cache_key.in_(bindparam("keys", expanding=True)))
+PUT_MANY = insert(LLM_CACHE).on_conflict_do_nothing(index_elements=[LLM_CACHE.c.cache_key])
+
+
+@timed_repository
+class SQLAlchemyLLMResponseCacheRepository(ILLMResponseCacheRepository):
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get_many(self, keys: Sequence[bytes]) -> dict[bytes, LLMResponse]:
+        if not keys:
+            return {}
+        result = await self.session.execute(GET_MANY, {"keys": list(keys)})
+        return {
+            key: LLMResponse(
+                text=text,
+                model=model,
+                input_tokens=input_tokens,
+                output_tokens=output_tokens,
+                cached=True,
+            )
+            for key, model, text, input_tokens, output_tokens in result
+        }
+
+    async def put_many(self, provider: str, responses: Mapping[bytes, LLMResponse]) -> None:
+        if not responses:
+            return
+        await self.session.execute(
+            PUT_MANY,
+            [
+                {
+                    "cache_key": key,
+                    "provider": provider,
+                    "model": response.model,
+                    "text": response.text,
+                    "input_tokens": response.input_tokens,
+                    "output_tokens": response.output_tokens,
+                }
+                for key, response in responses.items()
+            ],
+        )
@@ -0,0 +1,81 @@
+"""
+Traducción de `MetadataFilter` a condiciones SQL sobre columnas JSONB.
+
+Las condiciones se construyen para que PostgreSQL pueda resolverlas con los índices
+creados en la migración de metadata:
+
+- `contains` y `path_equals` usan el operador `@>`, soportado por el índice GIN
+  `jsonb_path_ops` de la columna.
+- `path_equals` añade además `columna #> '{a,b}' = valor::jsonb`, que garantiza la
+  igualdad exacta (la contención de objetos/arrays no la implica) y coincide con los
+  índices de expresión btree creados para las claves "calientes" de la configuración.
+- `has_keys` usa `columna #> '{a,b}' IS NOT NULL` (`#>` devuelve NULL solo si la ruta no
+  existe; un valor JSON null devuelve 'null'::jsonb). `jsonb_path_ops` no indexa claves sin
+  valor, así que la existencia de claves solo usa índice para las claves calientes.
+
+Las rutas se renderizan como literales para que el planificador pueda emparejarlas con
+las expresiones de los índices.
+"""
+
+from typing import Any
+
+from sqlalchemy import ColumnElement, Text, bindparam, literal
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+from sqlalchemy.orm import InstrumentedAttribute
+
+from src.pkm_app.core.application.dtos.metadata_filter_dto import MetadataFilter
+
+# Claves calientes: rutas con índice de expresión btree sobre `columna #> '{...}'`, las que
+# `has_keys` y `path_equals` resuelven por índice. Las migraciones que crean esos índices
+# llevan su propia copia (el esquema no puede cambiar al editar este módulo); una clave
+# nueva se añade aquí y en una migración nueva. test_metadata_filters comprueba que
+# coinciden con las de la migración y que la ruta que se genera es la indexada.
+HOT_METADATA_KEYS: dict[tuple[str, str], tuple[str, ...]] = {
+    ("notes", "note_metadata"): ("reviewed", "source.author"),
+    ("sources", "link_metadata"): (),
+}
+
+
+def split_metadata_path(path: str) -> list[str]:
+    """Convierte una ruta con puntos ('a.b') en la lista de claves ['a', 'b']."""
+    return [segment.strip() for segment in path.split(".")]
+
+
+def _nest(segments: list[str], value: Any) -> dict[str, Any]:
+    """Construye el documento JSON {'a': {'b': value}} para una ruta ['a', 'b']."""
+    document: Any = value
+    for segment in reversed(segments):
+        document = {segment: document}
+    return document  # type: ignore[no-any-return]
+
+
+def _value_at_path(column: InstrumentedAttribute[Any], segments: list[str]) -> ColumnElement[Any]:
+    """Expresión `columna #> ARRAY[...]` con la ruta renderizada como literal."""
+    path_param = bindparam(None, segments, type_=ARRAY(Text), literal_execute=True)
+    return column.op("#>", return_type=JSONB)(path_param)
+
+
+def build_metadata_conditions(
+    column: InstrumentedAttribute[Any], metadata_filter: MetadataFilter
+) -> list[ColumnElement[bool]]:
+    """
+    Devuelve la lista de condiciones (a combinar con AND) equivalente al filtro
+    sobre la columna JSONB indicada.
+    """
+    conditions: list[ColumnElement[bool]] = []
+
+    if metadata_filter.contains:
+        conditions.append(column.contains(metadata_filter.contains))
+
+    for path in metadata_filter.has_keys or []:
+        segments = split_metadata_path(path)
+        conditions.append(_value_at_path(column, segments).is_not(None))
+
+    for path, value in (metadata_filter.path_equals or {}).items():
+        segments = split_metadata_path(path)
+        # La contención permite usar el índice GIN de la columna...
+        conditions.append(column.contains(_nest(segments, value)))
+        # ...y la igualdad exacta, los índices de expresión de las claves calientes.
+        conditions.append(_value_at_path(column, segments) == literal(value, JSONB))
+
+    return conditions
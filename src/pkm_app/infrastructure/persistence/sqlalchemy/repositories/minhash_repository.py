@@ -0,0 +1,149 @@
+"""
+Índice LSH de firmas MinHash (`note_minhash`).
+
+Cada nota tiene una fila con su firma (los uint32 little-endian de `minhash_signature`) y
+sus claves LSH en un array BIGINT con índice GIN: `band_keys && :claves` devuelve las notas
+que comparten alguna banda sin leer las demás. Las claves se calculan aquí, a partir de la
+firma, para que escritura y búsqueda usen siempre las mismas.
+"""
+
+import uuid
+from collections.abc import Mapping, Sequence
+
+import numpy as np
+from sqlalchemy import Integer, and_, any_, bindparam, exists, func, select, true
+from sqlalchemy.dialects.postgresql import aggregate_order_by, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.pkm_app.core.application.dtos import NoteText
+from src.pkm_app.core.application.interfaces.near_duplicate_interface import (
+    INearDuplicateRepository,
+)
+from src.pkm_app.core.application.minhash import SIGNATURE_DTYPE, band_keys
+from src.pkm_app.infrastructure.monitoring.collectors import timed_repository
+from src.pkm_app.infrastructure.persistence.sqlalchemy.models import Note as NoteModel
+from src.pkm_app.infrastructure.persistence.sqlalchemy.models import NoteMinHash
+
+MINHASH = NoteMinHash.__table__
+NOTES = NoteModel.__table__
+
+_upsert = insert(MINHASH)
+SAVE_SIGNATURES = _upsert.on_conflict_do_update(
+    index_elements=[MINHASH.c.note_id],
+    set_={
+        "user_id": _upsert.excluded.user_id,
+        "signature": _upsert.excluded.signature,
+        "band_keys": _upsert.excluded.band_keys,
+    },
+)
+GET_SIGNATURES = select(MINHASH.c.note_id, MINHASH.c.signature).where(
+    MINHASH.c.user_id == bindparam("user_id"),
+    MINHASH.c.note_id.in_(bindparam("note_ids", expanding=True)),
+    MINHASH.c.signature.is_not(None),
+)
+
+_query = MINHASH.alias("query")
+_candidate = MINHASH.alias("candidate")
+_candidate_key = func.unnest(_candidate.c.band_keys).table_valued("key").render_derived()
+_shared_keys = (
+    select(func.count())
+    .select_from(_candidate_key)
+    .where(_candidate_key.c.key == any_(_query.c.band_keys))
+    .scalar_subquery()
+)
+# Índice GIN de `candidate.band_keys` con las claves de la nota consultada
+FIND_CANDIDATES = (
+    select(_candidate.c.note_id, _candidate.c.signature)
+    .select_from(
+        _query.join(
+            _candidate,
+            and_(
+                _candidate.c.band_keys.overlap(_query.c.band_keys),
+                _candidate.c.user_id == _query.c.user_id,
+                _candidate.c.note_id != _query.c.note_id,
+            ),
+        )
+    )
+    .where(_query.c.note_id == bindparam("note_id"), _query.c.user_id == bindparam("user_id"))
+    .order_by(_shared_keys.desc(), _candidate.c.note_id)
+    .limit(bindparam("limit", type_=Integer))
+)
+
+_key = func.unnest(MINHASH.c.band_keys).table_valued("key").render_derived()
+FIND_CANDIDATE_BUCKETS = (
+    select(
+        func.array_agg(aggregate_order_by(MINHASH.c.note_id, MINHASH.c.note_id))[
+            1 : bindparam("max_bucket_size", type_=Integer)
+        ]
+    )
+    .select_from(MINHASH.join(_key, true()))
+    .where(MINHASH.c.user_id == bindparam("user_id"))
+    .group_by(_key.c.key)
+    .having(func.count() > 1)
+)
+
+LIST_UNINDEXED = (
+    select(NOTES.c.id, NOTES.c.user_id, NOTES.c.content)
+    .where(~exists().where(MINHASH.c.note_id == NOTES.c.id))
+    .order_by(NOTES.c.id)
+    .limit(bindparam("limit"))
+)
+
+
+def _row(user_id: str, note_id: uuid.UUID, signature: np.ndarray | None) -> dict:
+    if signature is None:
+        return {"note_id": note_id, "user_id": user_id, "signature": None, "band_keys": []}
+    signature = np.asarray(signature, dtype=SIGNATURE_DTYPE)
+    return {
+        "note_id": note_id,
+        "user_id": user_id,
+        "signature": signature.tobytes(),
+        "band_keys": band_keys(user_id, signature).tolist(),
+    }
+
+
+def _signature(data: bytes) -> np.ndarray:
+    return np.frombuffer(data, dtype=SIGNATURE_DTYPE)
+
+
+@timed_repository
+class SQLAlchemyNearDuplicateRepository(INearDuplicateRepository):
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def save_signatures(
+        self, user_id: str, signatures: Mapping[uuid.UUID, np.ndarray | None]
+    ) -> None:
+        if signatures:
+            rows = [_row(user_id, note_id, signature) for note_id, signature in signatures.items()]
+            await self.session.execute(SAVE_SIGNATURES, rows)
+
+    async def get_signatures(
+        self, user_id: str, note_ids: Sequence[uuid.UUID]
+    ) -> dict[uuid.UUID, np.ndarray]:
+        if not note_ids:
+            return {}
+        result = await self.session.execute(
+            GET_SIGNATURES, {"user_id": user_id, "note_ids": list(note_ids)}
+        )
+        return {note_id: _signature(signature) for note_id, signature in result}
+
+    async def find_candidates(
+        self, user_id: str, note_id: uuid.UUID, limit: int
+    ) -> dict[uuid.UUID, np.ndarray]:
+        result = await self.session.execute(
+            FIND_CANDIDATES, {"user_id": user_id, "note_id": note_id, "limit": limit}
+        )
+        return {candidate_id: _signature(signature) for candidate_id, signature in result}
+
+    async def find_candidate_buckets(
+        self, user_id: str, max_bucket_size: int
+    ) -> list[list[uuid.UUID]]:
+        result = await self.session.execute(
+            FIND_CANDIDATE_BUCKETS, {"user_id": user_id, "max_bucket_size": max_bucket_size}
+        )
+        return [list(note_ids) for note_ids in result.scalars()]
+
+    async def list_unindexed(self, limit: int) -> list[NoteText]:
+        result = await self.session.execute(LIST_UNINDEXED, {"limit": limit})
+        return [NoteText(note_id, user_id, content) for note_id, user_id, content in result]
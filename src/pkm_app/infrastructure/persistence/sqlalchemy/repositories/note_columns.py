@@ -0,0 +1,90 @@
+"""
+Lectura masiva de metadatos de notas en lotes columnares (`NoteColumns`).
+
+Para análisis sobre todas las notas de un usuario (mapas de actividad, estadísticas de
+keywords, grafos) no se crean DTOs por nota: la consulta se recorre con un cursor del
+servidor y cada partición de filas se convierte en arrays de NumPy. La conversión más cara
+se hace en PostgreSQL: los UUID llegan como 16 bytes (`uuid_send`) y las fechas como
+microsegundos desde la época, listos para `np.frombuffer` / `np.fromiter`.
+"""
+
+from collections.abc import AsyncIterator, Sequence
+from typing import Any
+
+import numpy as np
+from sqlalchemy import BigInteger, Select, bindparam, cast, extract, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.pkm_app.core.application.dtos.note_columns_dto import (
+    NO_TYPE,
+    TIMESTAMP_DTYPE,
+    UUID_DTYPE,
+    NoteColumns,
+)
+from src.pkm_app.infrastructure.persistence.sqlalchemy.models import Note as NoteModel
+
+NOTES = NoteModel.__table__
+
+DEFAULT_BATCH_SIZE = 50_000
+_NIL_UUID_BYTES = bytes(16)
+
+
+def _epoch_microseconds(column: Any) -> Any:
+    return cast(extract("epoch", column) * 1_000_000, BigInteger)
+
+
+NOTE_COLUMNS_QUERY: Select[Any] = select(
+    func.uuid_send(NOTES.c.id),
+    func.uuid_send(NOTES.c.project_id),
+    NOTES.c.type,
+    _epoch_microseconds(NOTES.c.created_at),
+    _epoch_microseconds(NOTES.c.updated_at),
+).where(NOTES.c.user_id == bindparam("user_id"))
+
+
+def note_columns_from_rows(
+    rows: Sequence[Sequence[Any]], type_codes: dict[str, int]
+) -> NoteColumns:
+    """
+    Construye un lote de filas de `NOTE_COLUMNS_QUERY`.
+
+    `type_codes` se comparte entre los lotes de una misma lectura y se amplía con los tipos
+    nuevos, de modo que los códigos son estables en todo el recorrido.
+    """
+    ids, project_ids, types, created_at, updated_at = zip(*rows) if rows else ((),) * 5
+    codes = np.fromiter(
+        (NO_TYPE if t is None else type_codes.setdefault(t, len(type_codes)) for t in types),
+        dtype=np.int16,
+        count=len(types),
+    )
+    return NoteColumns(
+        ids=np.frombuffer(b"".join(ids), dtype=UUID_DTYPE),
+        project_ids=np.frombuffer(
+            b"".join(_NIL_UUID_BYTES if p is None else p for p in project_ids), dtype=UUID_DTYPE
+        ),
+        type_codes=codes,
+        type_categories=tuple(type_codes),
+        created_at=np.fromiter(created_at, dtype=np.int64, count=len(created_at)).view(
+            TIMESTAMP_DTYPE
+        ),
+        updated_at=np.fromiter(updated_at, dtype=np.int64, count=len(updated_at)).view(
+            TIMESTAMP_DTYPE
+        ),
+    )
+
+
+async def stream_note_columns(
+    session: AsyncSession, user_id: str, batch_size: int = DEFAULT_BATCH_SIZE
+) -> AsyncIterator[NoteColumns]:
+    """Recorre las notas de `user_id` con un cursor del servidor, `batch_size` filas por lote."""
+    if batch_size <= 0:
+        raise ValueError("batch_size debe ser mayor que 0.")
+    type_codes: dict[str, int] = {}
+    result = await session.stream(
+        NOTE_COLUMNS_QUERY.execution_options(yield_per=batch_size), {"user_id": user_id}
+    )
+    try:
+        async for partition in result.partitions():
+            yield note_columns_from_rows(partition, type_codes)
+    finally:
+        await result.close()
@@ -13,10 +13,13 @@ from src.pkm_app.core.application.dtos.note_link_dto import (
     NoteLinkUpdate,
 )
 from src.pkm_app.core.application.interfaces.note_link_interface import INoteLinkRepository
+from src.pkm_app.infrastructure.monitoring.collectors import timed_repository
 from src.pkm_app.infrastructure.persistence.sqlalchemy.models import Note as NoteModel
 from src.pkm_app.infrastructure.persistence.sqlalchemy.models import NoteLink as NoteLinkModel
+from src.pkm_app.infrastructure.persistence.sqlalchemy.repositories.hydration import trusted
 
 
+@timed_repository
 class SQLAlchemyNoteLinkRepository(INoteLinkRepository):
     def __init__(self, session: AsyncSession):
         self.session = session
@@ -45,7 +48,7 @@ class SQLAlchemyNoteLinkRepository(INoteLinkRepository):
     async def get_by_id(self, link_id: UUID, user_id: str) -> NoteLinkSchema | None:
         link_instance = await self._get_link_instance(link_id, user_id)
         if link_instance:
-            return NoteLinkSchema.model_validate(link_instance)
+            return trusted(NoteLinkSchema, link_instance)
         return None
 
     async def list_by_user(
@@ -61,7 +64,7 @@ class SQLAlchemyNoteLinkRepository(INoteLinkRepository):
         )
         result = await self.session.execute(stmt)
         links = result.scalars().all()
-        return [NoteLinkSchema.model_validate(link) for link in links]
+        return [trusted(NoteLinkSchema, link) for link in links]
 
     async def create(self, link_in: NoteLinkCreate, user_id: str) -> NoteLinkSchema:
         # Validar que source_note_id != target_note_id
@@ -93,7 +96,7 @@ class SQLAlchemyNoteLinkRepository(INoteLinkRepository):
             await self.session.refresh(
                 link_instance, attribute_names=["source_note", "target_note"]
             )
-            return NoteLinkSchema.model_validate(link_instance)
+            return trusted(NoteLinkSchema, link_instance)
         except IntegrityError as e:
             await self.session.rollback()
             raise ValueError("Error de integridad al crear el enlace") from e
@@ -127,7 +130,7 @@ class SQLAlchemyNoteLinkRepository(INoteLinkRepository):
         try:
             await self.session.flush()
             await self.session.refresh(link_instance)
-            return NoteLinkSchema.model_validate(link_instance)
+            return trusted(NoteLinkSchema, link_instance)
         except IntegrityError as e:
             await self.session.rollback()
             raise ValueError("Error de integridad al actualizar el enlace") from e
@@ -154,7 +157,7 @@ class SQLAlchemyNoteLinkRepository(INoteLinkRepository):
         )
         result = await self.session.execute(stmt)
         links = result.scalars().all()
-        return [NoteLinkSchema.model_validate(link) for link in links]
+        return [trusted(NoteLinkSchema, link) for link in links]
 
     async def get_links_by_target_note(
         self, note_id: UUID, user_id: str, skip: int = 0, limit: int = 20
@@ -169,7 +172,7 @@ class SQLAlchemyNoteLinkRepository(INoteLinkRepository):
         )
         result = await self.session.execute(stmt)
         links = result.scalars().all()
-        return [NoteLinkSchema.model_validate(link) for link in links]
+        return [trusted(NoteLinkSchema, link) for link in links]
 
     async def get_links_by_type(
         self, link_type: str, user_id: str, skip: int = 0, limit: int = 20
@@ -184,7 +187,7 @@ class SQLAlchemyNoteLinkRepository(INoteLinkRepository):
         )
         result = await self.session.execute(stmt)
         links = result.scalars().all()
-        return [NoteLinkSchema.model_validate(link) for link in links]
+        return [trusted(NoteLinkSchema, link) for link in links]
 
     async def get_link_between_notes(
         self, source_note_id: UUID, target_note_id: UUID, user_id: str, link_type: str | None = None
@@ -205,5 +208,5 @@ class SQLAlchemyNoteLinkRepository(INoteLinkRepository):
         result = await self.session.execute(stmt)
         link = result.scalar_one_or_none()
         if link:
-            return NoteLinkSchema.model_validate(link)
+            return trusted(NoteLinkSchema, link)
         return None
@@ -0,0 +1,307 @@
+"""
+Camino de lectura rápido para notas sobre SQLAlchemy Core.
+
+`SQLAlchemyNoteReadRepository` sustituye las lecturas de `SQLAlchemyNoteRepository`
+(`get_by_id`, `list_by_user` y los `search_*`) por un único `select()` sobre columnas:
+
+- la página de notas (filtro, orden, offset y limit) se resuelve primero en una subconsulta,
+- proyecto y fuente se unen con LEFT OUTER JOIN,
+- las keywords se agregan en SQL con `array_agg` en un LATERAL por nota de la página,
+
+y los DTOs se construyen directamente desde las filas, sin instancias ORM, identity map ni
+loaders de relaciones. Las escrituras se heredan sin cambios del repositorio ORM.
+"""
+
+import uuid
+from collections.abc import Sequence
+from typing import Any
+
+from sqlalchemy import (
+    ColumnElement,
+    Integer,
+    Select,
+    bindparam,
+    exists,
+    func,
+    lateral,
+    or_,
+    select,
+    true,
+)
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+
+from src.pkm_app.core.application.dtos import MetadataFilter, NoteSchema
+from src.pkm_app.infrastructure.monitoring.collectors import timed_repository
+from src.pkm_app.infrastructure.persistence.sqlalchemy.models import Keyword as KeywordModel
+from src.pkm_app.infrastructure.persistence.sqlalchemy.models import Note as NoteModel
+from src.pkm_app.infrastructure.persistence.sqlalchemy.models import Project as ProjectModel
+from src.pkm_app.infrastructure.persistence.sqlalchemy.models import Source as SourceModel
+from src.pkm_app.infrastructure.persistence.sqlalchemy.models.associations import (
+    note_keywords_association_table,
+)
+from src.pkm_app.infrastructure.persistence.sqlalchemy.repositories.hydration import trusted
+from src.pkm_app.infrastructure.persistence.sqlalchemy.repositories.metadata_filters import (
+    build_metadata_conditions,
+)
+from src.pkm_app.infrastructure.persistence.sqlalchemy.repositories.note_repository import (
+    SQLAlchemyNoteRepository,
+)
+
+NOTES = NoteModel.__table__
+PROJECTS = ProjectModel.__table__
+SOURCES = SourceModel.__table__
+KEYWORDS = KeywordModel.__table__
+# Solo las columnas de notes que lleva NoteSchema (no content_hash, por ejemplo)
+NOTE_COLUMNS = tuple(column for column in NOTES.c if column.name in NoteSchema.model_fields)
+
+PROJECT_PREFIX = "project__"
+SOURCE_PREFIX = "source__"
+
+
+def _keywords_lateral(note_id: ColumnElement[uuid.UUID]) -> Any:
+    """Keywords de una nota como arrays paralelos (id, name, created_at, version) por nombre."""
+    order = KEYWORDS.c.name
+
+    def agg(column: ColumnElement[Any], label: str) -> Any:
+        return func.array_agg(aggregate_order_by(column, order)).label(label)
+
+    return lateral(
+        select(
+            agg(KEYWORDS.c.id, "keyword_ids"),
+            agg(KEYWORDS.c.name, "keyword_names"),
+            agg(KEYWORDS.c.created_at, "keyword_created_at"),
+            agg(KEYWORDS.c.version, "keyword_versions"),
+        )
+        .select_from(
+            note_keywords_association_table.join(
+                KEYWORDS, KEYWORDS.c.id == note_keywords_association_table.c.keyword_id
+            )
+        )
+        .where(note_keywords_association_table.c.note_id == note_id)
+    ).alias("note_keywords")
+
+
+def build_note_rows_query(
+    *conditions: ColumnElement[bool],
+    skip: int | ColumnElement[int] = 0,
+    limit: int | ColumnElement[int] | None = None,
+) -> Select[Any]:
+    """
+    Consulta Core de notas que cumplen `conditions`, ordenadas por `updated_at` descendente,
+    con proyecto, fuente y keywords en la misma fila.
+    """
+    page = (
+        select(
+            *NOTE_COLUMNS,
+            *(column.label(f"{PROJECT_PREFIX}{column.name}") for column in PROJECTS.c),
+            *(column.label(f"{SOURCE_PREFIX}{column.name}") for column in SOURCES.c),
+        )
+        .select_from(
+            NOTES.outerjoin(PROJECTS, PROJECTS.c.id == NOTES.c.project_id).outerjoin(
+                SOURCES, SOURCES.c.id == NOTES.c.source_id
+            )
+        )
+        .where(*conditions)
+        .order_by(NOTES.c.updated_at.desc())
+        .offset(skip)
+        .limit(limit)
+        .subquery("page")
+    )
+    keywords = _keywords_lateral(page.c.id)
+    return (
+        select(page, keywords)
+        .select_from(page.outerjoin(keywords, true()))
+        .order_by(page.c.updated_at.desc())
+    )
+
+
+# Posiciones de cada bloque de columnas en las filas de `build_note_rows_query`
+NOTE_FIELDS = tuple(column.name for column in NOTE_COLUMNS)
+PROJECT_FIELDS = tuple(column.name for column in PROJECTS.c)
+SOURCE_FIELDS = tuple(column.name for column in SOURCES.c)
+_PROJECT_START = len(NOTE_FIELDS)
+_SOURCE_START = _PROJECT_START + len(PROJECT_FIELDS)
+_KEYWORDS_START = _SOURCE_START + len(SOURCE_FIELDS)
+
+
+def _related(fields: tuple[str, ...], values: Sequence[Any]) -> dict[str, Any] | None:
+    # El primer campo es el id: NULL significa que el LEFT JOIN no encontró fila
+    return dict(zip(fields, values, strict=True)) if values[0] is not None else None
+
+
+def note_from_row(row: Sequence[Any]) -> NoteSchema:
+    """Construye el NoteSchema de una fila de `build_note_rows_query`."""
+    data = dict(zip(NOTE_FIELDS, row[:_PROJECT_START], strict=True))
+    data["project"] = _related(PROJECT_FIELDS, row[_PROJECT_START:_SOURCE_START])
+    data["source"] = _related(SOURCE_FIELDS, row[_SOURCE_START:_KEYWORDS_START])
+    keyword_ids, keyword_names, keyword_created_at, keyword_versions = row[_KEYWORDS_START:]
+    user_id = data["user_id"]
+    data["keywords"] = (
+        [
+            {
+                "id": keyword_id,
+                "name": name,
+                "user_id": user_id,
+                "created_at": created_at,
+                "version": version,
+            }
+            for keyword_id, name, created_at, version in zip(
+                keyword_ids, keyword_names, keyword_created_at, keyword_versions, strict=True
+            )
+        ]
+        if keyword_ids
+        else []
+    )
+    return trusted(NoteSchema, data)
+
+
+def _has_keyword(condition: ColumnElement[bool]) -> ColumnElement[bool]:
+    """EXISTS sobre las keywords de la nota (no duplica filas como un JOIN)."""
+    return exists(
+        select(1)
+        .select_from(
+            note_keywords_association_table.join(
+                KEYWORDS, KEYWORDS.c.id == note_keywords_association_table.c.keyword_id
+            )
+        )
+        .where(
+            note_keywords_association_table.c.note_id == NOTES.c.id,
+            KEYWORDS.c.user_id == NOTES.c.user_id,
+            condition,
+        )
+    )
+
+
+# Consultas de forma fija construidas una sola vez: los valores van como parámetros, así
+# que cada llamada se ahorra construir el select (subconsulta, LATERAL, proxies de columnas)
+# y SQLAlchemy reutiliza su clave de caché de compilación.
+_SKIP = bindparam("skip", type_=Integer)
+_LIMIT = bindparam("limit", type_=Integer)
+_USER = NOTES.c.user_id == bindparam("user_id")
+
+GET_BY_ID_QUERY = build_note_rows_query(NOTES.c.id == bindparam("note_id"), _USER)
+LIST_BY_USER_QUERY = build_note_rows_query(_USER, skip=_SKIP, limit=_LIMIT)
+SEARCH_BY_TEXT_QUERY = build_note_rows_query(
+    _USER,
+    or_(
+        NOTES.c.title.ilike(bindparam("search_term")),
+        NOTES.c.content.ilike(bindparam("search_term")),
+    ),
+    skip=_SKIP,
+    limit=_LIMIT,
+)
+SEARCH_BY_PROJECT_QUERY = build_note_rows_query(
+    _USER, NOTES.c.project_id == bindparam("project_id"), skip=_SKIP, limit=_LIMIT
+)
+SEARCH_BY_KEYWORD_QUERY = build_note_rows_query(
+    _USER,
+    _has_keyword(KEYWORDS.c.name == bindparam("keyword_name")),
+    skip=_SKIP,
+    limit=_LIMIT,
+)
+SEARCH_BY_KEYWORD_IN_PROJECT_QUERY = build_note_rows_query(
+    _USER,
+    NOTES.c.project_id == bindparam("project_id"),
+    _has_keyword(KEYWORDS.c.name == bindparam("keyword_name")),
+    skip=_SKIP,
+    limit=_LIMIT,
+)
+SEARCH_BY_KEYWORD_NAMES_QUERY = build_note_rows_query(
+    _USER,
+    NOTES.c.project_id == bindparam("project_id"),
+    _has_keyword(KEYWORDS.c.name.in_(bindparam("keyword_names", expanding=True))),
+    skip=_SKIP,
+    limit=_LIMIT,
+)
+
+
+@timed_repository
+class SQLAlchemyNoteReadRepository(SQLAlchemyNoteRepository):
+    """Repositorio de notas con lecturas por SQLAlchemy Core (las escrituras usan el ORM)."""
+
+    async def _fetch(self, query: Select[Any], **params: Any) -> list[NoteSchema]:
+        result = await self.session.execute(query, params)
+        return [note_from_row(row) for row in result]
+
+    async def get_by_id(self, note_id: uuid.UUID, user_id: str) -> NoteSchema | None:
+        notes = await self._fetch(GET_BY_ID_QUERY, note_id=note_id, user_id=user_id)
+        return notes[0] if notes else None
+
+    async def list_by_user(self, user_id: str, skip: int = 0, limit: int = 100) -> list[NoteSchema]:
+        return await self._fetch(LIST_BY_USER_QUERY, user_id=user_id, skip=skip, limit=limit)
+
+    async def search_by_title_or_content(
+        self, user_id: str, query: str, skip: int = 0, limit: int = 20
+    ) -> list[NoteSchema]:
+        return await self._fetch(
+            SEARCH_BY_TEXT_QUERY, user_id=user_id, search_term=f"%{query}%", skip=skip, limit=limit
+        )
+
+    async def search_by_project(
+        self, project_id: uuid.UUID, user_id: str, skip: int = 0, limit: int = 20
+    ) -> list[NoteSchema]:
+        return await self._fetch(
+            SEARCH_BY_PROJECT_QUERY, user_id=user_id, project_id=project_id, skip=skip, limit=limit
+        )
+
+    async def search_by_keyword_name(
+        self,
+        keyword_name: str,
+        project_id: uuid.UUID | None,
+        user_id: str,
+        skip: int = 0,
+        limit: int = 20,
+    ) -> list[NoteSchema]:
+        if not keyword_name.strip():
+            return []
+        if project_id is None:
+            return await self._fetch(
+                SEARCH_BY_KEYWORD_QUERY,
+                user_id=user_id,
+                keyword_name=keyword_name,
+                skip=skip,
+                limit=limit,
+            )
+        return await self._fetch(
+            SEARCH_BY_KEYWORD_IN_PROJECT_QUERY,
+            user_id=user_id,
+            project_id=project_id,
+            keyword_name=keyword_name,
+            skip=skip,
+            limit=limit,
+        )
+
+    async def search_by_keyword_names(
+        self,
+        keyword_names: list[str],
+        project_id: uuid.UUID,
+        user_id: str,
+        skip: int = 0,
+        limit: int = 20,
+    ) -> list[NoteSchema]:
+        if not keyword_names:
+            return []
+        return await self._fetch(
+            SEARCH_BY_KEYWORD_NAMES_QUERY,
+            user_id=user_id,
+            project_id=project_id,
+            keyword_names=keyword_names,
+            skip=skip,
+            limit=limit,
+        )
+
+    async def search_by_metadata(
+        self,
+        user_id: str,
+        metadata_filter: MetadataFilter,
+        skip: int = 0,
+        limit: int = 20,
+    ) -> list[NoteSchema]:
+        # La forma de la consulta depende del filtro, así que se construye en cada llamada
+        query = build_note_rows_query(
+            _USER,
+            *build_metadata_conditions(NOTES.c.note_metadata, metadata_filter),
+            skip=_SKIP,
+            limit=_LIMIT,
+        )
+        return await self._fetch(query, user_id=user_id, skip=skip, limit=limit)
@@ -1,18 +1,29 @@
 import uuid
-from collections.abc import Sequence
-from typing import Optional
+from collections.abc import AsyncIterator, Sequence
+from datetime import datetime, timedelta
+from typing import Any, Optional
 
+from sqlalchemy import ColumnElement, Update, exists, func, insert, literal, or_, select, true
 from sqlalchemy import delete as sqlalchemy_delete
-from sqlalchemy import or_, select, true
 from sqlalchemy import update as sqlalchemy_update
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload, selectinload
 
 # Esquemas Pydantic
-from src.pkm_app.core.application.dtos import NoteCreate, NoteSchema, NoteUpdate
+from src.pkm_app.core.application.dtos import (
+    DuplicateNoteGroup,
+    MetadataFilter,
+    NoteColumns,
+    NoteCreate,
+    NoteSchema,
+    NoteUpdate,
+)
 
 # Interfaz del Repositorio
 from src.pkm_app.core.application.interfaces.note_interface import INoteRepository
+from src.pkm_app.infrastructure.monitoring.collectors import timed_repository
+from src.pkm_app.infrastructure.persistence.sqlalchemy.concurrency import version_conflict
 from src.pkm_app.infrastructure.persistence.sqlalchemy.models import Keyword as KeywordModel
 
 # Modelos SQLAlchemy
@@ -20,8 +31,70 @@ from src.pkm_app.infrastructure.persistence.sqlalchemy.models import Note as Not
 from src.pkm_app.infrastructure.persistence.sqlalchemy.models import Project as ProjectModel
 from src.pkm_app.infrastructure.persistence.sqlalchemy.models import Source as SourceModel
 from src.pkm_app.infrastructure.persistence.sqlalchemy.models import UserProfile as UserProfileModel
-
-
+from src.pkm_app.infrastructure.persistence.sqlalchemy.models.associations import (
+    note_keywords_association_table,
+)
+from src.pkm_app.infrastructure.persistence.sqlalchemy.models.base import generate_uuid
+from src.pkm_app.infrastructure.persistence.sqlalchemy.repositories.hydration import trusted
+from src.pkm_app.infrastructure.persistence.sqlalchemy.repositories.metadata_filters import (
+    build_metadata_conditions,
+)
+from src.pkm_app.infrastructure.persistence.sqlalchemy.repositories.note_columns import (
+    DEFAULT_BATCH_SIZE,
+    stream_note_columns,
+)
+
+NOTES = NoteModel.__table__
+NOTE_KEYWORDS = note_keywords_association_table
+
+# Suma de comprobación de las sondas de listado. `updated_at` es el inicio de la transacción
+# (now()), no el commit: una escritura que empezó antes del máximo y confirma después no lo
+# mueve. La versión sube en cada UPDATE y `created_at` distingue un alta de un borrado, así
+# que la suma cambia con cualquier escritura confirmada. Ambas columnas van en el INCLUDE de
+# los índices de las sondas, que siguen siendo index-only scans. Se suman por separado (un
+# entero y un intervalo) porque operar fila a fila con la fecha triplica el coste de la sonda.
+LIST_CHECKSUM = (
+    func.coalesce(func.sum(NoteModel.version), 0),
+    func.coalesce(func.sum(NoteModel.created_at - func.to_timestamp(0)), timedelta(0)),
+)
+
+
+def _checksum(version_sum: int, created_at_sum: timedelta) -> int:
+    return version_sum + created_at_sum // timedelta(microseconds=1)
+
+
+def touch_notes(*conditions: ColumnElement[bool], **values: Any) -> Update:
+    """
+    UPDATE que da una versión nueva (`version` y `updated_at`) a las notas que cumplen
+    `conditions`, con los `values` que se indiquen. Lo ejecutan los borrados de proyectos,
+    fuentes y keywords antes de borrar: el ON DELETE de las claves ajenas (SET NULL en
+    `project_id`/`source_id`, CASCADE en `note_keywords`) cambia lo que se lee de la nota sin
+    tocar su versión, y las sondas de las lecturas condicionales no lo verían.
+    """
+    return (
+        sqlalchemy_update(NOTES)
+        .where(*conditions)
+        .values(version=NOTES.c.version + 1, updated_at=func.now(), **values)
+    )
+
+
+def _owned_by(
+    model: type[NoteModel | ProjectModel | SourceModel], entity_id: uuid.UUID, user_id: str
+) -> ColumnElement[bool]:
+    return exists().where(model.id == entity_id, model.user_id == user_id)
+
+
+def _reference_checks(values: dict[str, Any], user_id: str) -> list[ColumnElement[bool]]:
+    """Condiciones EXISTS para el proyecto y la fuente que se asignan a la nota (si hay)."""
+    checks = []
+    if values.get("project_id") is not None:
+        checks.append(_owned_by(ProjectModel, values["project_id"], user_id))
+    if values.get("source_id") is not None:
+        checks.append(_owned_by(SourceModel, values["source_id"], user_id))
+    return checks
+
+
+@timed_repository
 class SQLAlchemyNoteRepository(INoteRepository):
     def __init__(self, session: AsyncSession):
         self.session = session
@@ -40,19 +113,68 @@ class SQLAlchemyNoteRepository(INoteRepository):
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
-    async def _manage_keywords(
-        self, note_instance: NoteModel, keyword_names: list[str] | None, user_id: str
-    ) -> None:
-        """Método helper para gestionar los keywords de una nota."""
-        if keyword_names is None:  # Si es None, no se hace nada con los keywords
-            return
-
-        # Eliminar keywords actuales de la nota para luego añadir los nuevos
-        note_instance.keywords.clear()
+    async def _get_saved_note(self, note_id: uuid.UUID, user_id: str) -> NoteSchema | None:
+        """
+        Relee la nota recién escrita con proyecto, fuente y keywords en una sola consulta.
+        `populate_existing` actualiza la instancia que ya estuviera en el identity map, que
+        las escrituras por SQL Core no tocan.
+        """
+        stmt = (
+            select(NoteModel)
+            .where(NoteModel.id == note_id, NoteModel.user_id == user_id)
+            .options(
+                joinedload(NoteModel.keywords),
+                joinedload(NoteModel.project),
+                joinedload(NoteModel.source),
+            )
+            .execution_options(populate_existing=True)
+        )
+        result = await self.session.execute(stmt)
+        note_instance = result.unique().scalar_one_or_none()
+        if note_instance:
+            return trusted(NoteSchema, note_instance)
+        return None
 
-        if not keyword_names:  # Si la lista está vacía, se eliminan todos los keywords
+    async def _raise_for_unwritten_row(
+        self,
+        values: dict[str, Any],
+        user_id: str,
+        note_id: uuid.UUID | None = None,
+        expected_version: int | None = None,
+    ) -> None:
+        """
+        Explica un INSERT/UPDATE que no ha escrito ninguna fila: lanza ConcurrencyError si la
+        versión de la nota no es `expected_version`, ValueError por la referencia que falta, o
+        vuelve sin más si lo que no existe es la nota (`note_id`). Solo se ejecuta en el camino
+        de error.
+        """
+        project_id, source_id = values.get("project_id"), values.get("source_id")
+        note_version = (
+            select(NOTES.c.version)
+            .where(NOTES.c.id == note_id, NOTES.c.user_id == user_id)
+            .scalar_subquery()
+            if note_id is not None
+            else literal(0)
+        )
+        stmt = select(
+            note_version,
+            _owned_by(ProjectModel, project_id, user_id) if project_id is not None else true(),
+            _owned_by(SourceModel, source_id, user_id) if source_id is not None else true(),
+        )
+        current_version, project_found, source_found = (await self.session.execute(stmt)).one()
+        if current_version is None:
             return
-
+        if note_id is not None and expected_version not in (None, current_version):
+            raise version_conflict("Note", note_id, expected_version, current_version)
+        if not project_found:
+            raise ValueError(f"Proyecto con id {project_id} no encontrado para el usuario.")
+        if not source_found:
+            raise ValueError(f"Fuente con id {source_id} no encontrada para el usuario.")
+        # Las referencias existen ahora pero no al escribir: se borraron y recrearon entre medias
+        raise ValueError("Las referencias de la nota han cambiado durante la escritura.")
+
+    async def _resolve_keywords(self, keyword_names: list[str], user_id: str) -> list[KeywordModel]:
+        """Busca o crea (pendientes de flush) los keywords del usuario con esos nombres."""
         final_keywords: list[KeywordModel] = []
         for name in set(keyword_names):  # Usar set para evitar duplicados en la entrada
             if not name.strip():  # Omitir keywords vacíos
@@ -70,13 +192,30 @@ class SQLAlchemyNoteRepository(INoteRepository):
                 keyword_instance = KeywordModel(user_id=user_id, name=name)
                 self.session.add(keyword_instance)
             final_keywords.append(keyword_instance)
+        return final_keywords
 
-        note_instance.keywords.extend(final_keywords)
+    async def _set_keywords(
+        self, note_id: uuid.UUID, keyword_names: list[str], user_id: str, replace: bool
+    ) -> None:
+        """Asocia los keywords a la nota; con `replace` elimina antes los que tuviera."""
+        if replace:
+            await self.session.execute(
+                sqlalchemy_delete(NOTE_KEYWORDS).where(NOTE_KEYWORDS.c.note_id == note_id)
+            )
+        keywords = await self._resolve_keywords(keyword_names, user_id)
+        if not keywords:  # Lista vacía: la nota se queda sin keywords
+            return
+        await self.session.flush()  # Inserta los keywords nuevos para poder enlazarlos
+        await self.session.execute(
+            insert(NOTE_KEYWORDS).values(
+                [{"note_id": note_id, "keyword_id": keyword.id} for keyword in keywords]
+            )
+        )
 
     async def get_by_id(self, note_id: uuid.UUID, user_id: str) -> NoteSchema | None:
         note_instance = await self._get_note_instance(note_id, user_id)
         if note_instance:
-            return NoteSchema.model_validate(note_instance)
+            return trusted(NoteSchema, note_instance)
         return None
 
     async def list_by_user(self, user_id: str, skip: int = 0, limit: int = 100) -> list[NoteSchema]:
@@ -94,91 +233,102 @@ class SQLAlchemyNoteRepository(INoteRepository):
         )
         result = await self.session.execute(stmt)
         notes_orm = result.scalars().all()
-        return [NoteSchema.model_validate(note) for note in notes_orm]
+        return [trusted(NoteSchema, note) for note in notes_orm]
 
-    async def create(self, note_in: NoteCreate, user_id: str) -> NoteSchema:
-        # Validar existencia de project_id y source_id si se proporcionan
-        if note_in.project_id:
-            project_stmt = select(ProjectModel.id).where(
-                ProjectModel.id == note_in.project_id, ProjectModel.user_id == user_id
-            )
-            project_exists = await self.session.execute(project_stmt)
-            if not project_exists.scalar_one_or_none():
-                raise ValueError(
-                    f"Proyecto con id {note_in.project_id} no encontrado para el usuario."
-                )
-
-        if note_in.source_id:
-            source_stmt = select(SourceModel.id).where(
-                SourceModel.id == note_in.source_id, SourceModel.user_id == user_id
-            )
-            source_exists = await self.session.execute(source_stmt)
-            if not source_exists.scalar_one_or_none():
-                raise ValueError(
-                    f"Fuente con id {note_in.source_id} no encontrada para el usuario."
-                )
-
-        # Crear la instancia del modelo NoteModel
-        db_note_data = note_in.model_dump(
-            exclude_unset=True, exclude={"keywords"}
-        )  # Excluir keywords del dump inicial
-
-        note_instance = NoteModel(**db_note_data, user_id=user_id)
-
-        # Gestionar keywords
-        await self._manage_keywords(note_instance, note_in.keywords, user_id)
+    async def get_updated_at(self, note_id: uuid.UUID, user_id: str) -> datetime | None:
+        stmt = select(NoteModel.updated_at).where(
+            NoteModel.id == note_id, NoteModel.user_id == user_id
+        )
+        return (await self.session.execute(stmt)).scalar_one_or_none()
+
+    async def get_list_stats(
+        self, user_id: str, project_id: uuid.UUID | None = None
+    ) -> tuple[datetime | None, int, int] | None:
+        # Index-only scan sobre los índices (user_id[, project_id], updated_at) de notes
+        stmt = select(func.max(NoteModel.updated_at), func.count(), *LIST_CHECKSUM).where(
+            NoteModel.user_id == user_id
+        )
+        if project_id is None:
+            last_updated_at, count, *sums = (await self.session.execute(stmt)).one()
+            return last_updated_at, count, _checksum(*sums)
 
-        self.session.add(note_instance)
-        await self.session.flush()  # Para obtener el ID y otros defaults de la BD antes de refresh
-        await self.session.refresh(
-            note_instance, attribute_names=["id", "created_at", "updated_at"]
-        )  # Refrescar solo campos necesarios
-        await self.session.refresh(
-            note_instance, attribute_names=["keywords", "project", "source"]
-        )  # Refrescar relaciones
+        # El proyecto va en la misma consulta: su existencia, su fecha de cambio y su versión
+        project = select(ProjectModel.updated_at, ProjectModel.version).where(
+            ProjectModel.id == project_id, ProjectModel.user_id == user_id
+        )
+        stmt = stmt.where(NoteModel.project_id == project_id).add_columns(
+            project.with_only_columns(ProjectModel.updated_at).scalar_subquery(),
+            project.with_only_columns(ProjectModel.version).scalar_subquery(),
+        )
+        row = (await self.session.execute(stmt)).one()
+        last_updated_at, count, version_sum, created_at_sum, project_updated, project_version = row
+        if project_updated is None:
+            return None
+        last_updated_at = max(filter(None, (last_updated_at, project_updated)))
+        return last_updated_at, count, _checksum(version_sum, created_at_sum) + project_version
 
-        return NoteSchema.model_validate(note_instance)
+    async def create(self, note_in: NoteCreate, user_id: str) -> NoteSchema:
+        values = {
+            **note_in.model_dump(exclude_unset=True, exclude={"keywords"}),
+            "id": generate_uuid(),
+            "user_id": user_id,
+        }
+        # INSERT ... SELECT: la fila solo se inserta si el proyecto y la fuente existen y son
+        # del usuario, así que la validación no necesita consultas propias
+        row = select(
+            *(literal(value, NOTES.c[name].type).label(name) for name, value in values.items())
+        ).where(*_reference_checks(values, user_id))
+        stmt = insert(NOTES).from_select(list(values), row).returning(NOTES.c.id)
+        note_id = (await self.session.execute(stmt)).scalar_one_or_none()
+        if note_id is None:
+            await self._raise_for_unwritten_row(values, user_id)
+
+        if note_in.keywords:
+            await self._set_keywords(note_id, note_in.keywords, user_id, replace=False)
+
+        note = await self._get_saved_note(note_id, user_id)
+        assert note is not None
+        return note
 
     async def update(
-        self, note_id: uuid.UUID, note_in: NoteUpdate, user_id: str
+        self,
+        note_id: uuid.UUID,
+        note_in: NoteUpdate,
+        user_id: str,
+        expected_version: int | None = None,
     ) -> NoteSchema | None:
-        note_instance = await self._get_note_instance(note_id, user_id)
-        if not note_instance:
-            return None
-
         update_data = note_in.model_dump(exclude_unset=True, exclude={"keywords"})
-        for field, value in update_data.items():
-            # Validar project_id y source_id si se están actualizando
-            if field == "project_id" and value is not None:
-                project_stmt = select(ProjectModel.id).where(
-                    ProjectModel.id == value, ProjectModel.user_id == user_id
-                )
-                project_exists = await self.session.execute(project_stmt)
-                if not project_exists.scalar_one_or_none():
-                    raise ValueError(f"Proyecto con id {value} no encontrado para el usuario.")
-            elif field == "source_id" and value is not None:
-                source_stmt = select(SourceModel.id).where(
-                    SourceModel.id == value, SourceModel.user_id == user_id
-                )
-                source_exists = await self.session.execute(source_stmt)
-                if not source_exists.scalar_one_or_none():
-                    raise ValueError(f"Fuente con id {value} no encontrada para el usuario.")
-            setattr(note_instance, field, value)
-
-        # Gestionar keywords si se proporcionan en la actualización
         if note_in.keywords is not None:  # Chequeo explícito de None para permitir lista vacía
-            await self._manage_keywords(note_instance, note_in.keywords, user_id)
+            # Cambiar solo las keywords no toca la fila de la nota: se fuerza la nueva
+            # versión (updated_at) para que las lecturas condicionales lo detecten
+            update_data["updated_at"] = func.now()
+
+        if update_data:
+            # UPDATE ... RETURNING con la validación de proyecto y fuente en el WHERE. Es SQL
+            # Core, así que la versión (version_id_col del ORM) se incrementa y compara aquí.
+            conditions = [NOTES.c.id == note_id, NOTES.c.user_id == user_id]
+            if expected_version is not None:
+                conditions.append(NOTES.c.version == expected_version)
+            stmt = (
+                sqlalchemy_update(NOTES)
+                .where(*conditions, *_reference_checks(update_data, user_id))
+                .values({**update_data, "version": NOTES.c.version + 1})
+                .returning(NOTES.c.id)
+            )
+            if (await self.session.execute(stmt)).scalar_one_or_none() is None:
+                await self._raise_for_unwritten_row(
+                    update_data, user_id, note_id, expected_version
+                )
+                return None
 
-        self.session.add(note_instance)  # SQLAlchemy rastrea los cambios
-        await self.session.flush()
-        await self.session.refresh(
-            note_instance, attribute_names=["updated_at"]
-        )  # Refrescar campos afectados
-        await self.session.refresh(
-            note_instance, attribute_names=["keywords", "project", "source"]
-        )  # Refrescar relaciones
+        if note_in.keywords is not None:
+            await self._set_keywords(note_id, note_in.keywords, user_id, replace=True)
 
-        return NoteSchema.model_validate(note_instance)
+        note = await self._get_saved_note(note_id, user_id)
+        if note is not None and not update_data and expected_version not in (None, note.version):
+            # Nada que escribir, pero el cliente partía de una versión que ya no es la actual
+            raise version_conflict("Note", note_id, expected_version, note.version)
+        return note
 
     async def delete(self, note_id: uuid.UUID, user_id: str) -> bool:
         note_instance = await self._get_note_instance(note_id, user_id)
@@ -208,7 +358,7 @@ class SQLAlchemyNoteRepository(INoteRepository):
         )
         result = await self.session.execute(stmt)
         notes_orm = result.scalars().all()
-        return [NoteSchema.model_validate(note) for note in notes_orm]
+        return [trusted(NoteSchema, note) for note in notes_orm]
 
     async def search_by_project(
         self, project_id: uuid.UUID, user_id: str, skip: int = 0, limit: int = 20
@@ -223,7 +373,7 @@ class SQLAlchemyNoteRepository(INoteRepository):
         )
         result = await self.session.execute(stmt)
         notes_orm = result.scalars().all()
-        return [NoteSchema.model_validate(note) for note in notes_orm]
+        return [trusted(NoteSchema, note) for note in notes_orm]
 
     async def search_by_keyword_name(
         self,
@@ -254,7 +404,7 @@ class SQLAlchemyNoteRepository(INoteRepository):
         )
         result = await self.session.execute(stmt)
         notes_orm = result.scalars().all()
-        return [NoteSchema.model_validate(note) for note in notes_orm]
+        return [trusted(NoteSchema, note) for note in notes_orm]
 
     async def search_by_keyword_names(
         self,
@@ -284,4 +434,70 @@ class SQLAlchemyNoteRepository(INoteRepository):
         )
         result = await self.session.execute(stmt)
         notes_orm = result.scalars().all()
-        return [NoteSchema.model_validate(note) for note in notes_orm]
+        return [trusted(NoteSchema, note) for note in notes_orm]
+
+    async def search_by_metadata(
+        self,
+        user_id: str,
+        metadata_filter: MetadataFilter,
+        skip: int = 0,
+        limit: int = 20,
+    ) -> list[NoteSchema]:
+        # Las condiciones JSONB se resuelven con el índice GIN (jsonb_path_ops) de note_metadata
+        stmt = (
+            select(NoteModel)
+            .where(
+                NoteModel.user_id == user_id,
+                *build_metadata_conditions(NoteModel.note_metadata, metadata_filter),
+            )
+            .offset(skip)
+            .limit(limit)
+            .order_by(NoteModel.updated_at.desc())
+            .options(
+                selectinload(NoteModel.keywords),  # Carga ansiosa de keywords
+                joinedload(NoteModel.project),  # Carga ansiosa del proyecto (si existe)
+                joinedload(NoteModel.source),  # Carga ansiosa de la fuente (si existe)
+            )
+        )
+        result = await self.session.execute(stmt)
+        notes_orm = result.scalars().all()
+        return [trusted(NoteSchema, note) for note in notes_orm]
+
+    async def find_exact_duplicates(
+        self, user_id: str, limit: int = 100
+    ) -> list[DuplicateNoteGroup]:
+        # Primero los hashes repetidos, agrupando solo la columna de 32 bytes (sin leer
+        # ningún texto); después, por el índice (user_id, content_hash), solo sus notas
+        note_count = func.count().label("note_count")
+        duplicated = (
+            select(NOTES.c.content_hash, note_count)
+            .where(NOTES.c.user_id == user_id)
+            .group_by(NOTES.c.content_hash)
+            .having(func.count() > 1)
+            .order_by(note_count.desc(), NOTES.c.content_hash)
+            .limit(limit)
+            .cte("duplicated")
+        )
+        stmt = (
+            select(
+                func.encode(duplicated.c.content_hash, "hex").label("content_hash"),
+                func.array_agg(
+                    aggregate_order_by(NOTES.c.id, NOTES.c.created_at, NOTES.c.id)
+                ).label("note_ids"),
+            )
+            .join_from(
+                duplicated,
+                NOTES,
+                (NOTES.c.user_id == user_id) & (NOTES.c.content_hash == duplicated.c.content_hash),
+            )
+            .group_by(duplicated.c.content_hash, duplicated.c.note_count)
+            .order_by(duplicated.c.note_count.desc(), duplicated.c.content_hash)
+        )
+        rows = (await self.session.execute(stmt)).mappings()
+        return [trusted(DuplicateNoteGroup, dict(row)) for row in rows]
+
+    def stream_columns(
+        self, user_id: str, batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> AsyncIterator[NoteColumns]:
+        # Solo columnas, sin ORM: cada partición del cursor del servidor es un lote
+        return stream_note_columns(self.session, user_id, batch_size)
@@ -0,0 +1,89 @@
+"""
+Outbox de notas hacia el almacén vectorial.
+
+Los mensajes los escriben los triggers de `notes` (migración `add_note_outbox`) en la
+transacción del cambio; este repositorio es el lado del relay: reclamar un lote con
+`FOR UPDATE SKIP LOCKED`, leer el estado actual de esas notas y eliminar o aplazar los
+mensajes según haya ido la entrega. Todo dentro de la transacción del relay, así que si
+éste cae antes del commit los mensajes vuelven a estar disponibles (entrega al menos una vez).
+"""
+
+import uuid
+from collections.abc import Sequence
+from datetime import datetime
+
+from sqlalchemy import bindparam, delete, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.pkm_app.core.application.dtos import NoteIndexDocument, OutboxMessage
+from src.pkm_app.core.application.interfaces.outbox_interface import IOutboxRepository
+from src.pkm_app.infrastructure.monitoring.collectors import timed_repository
+from src.pkm_app.infrastructure.persistence.sqlalchemy.models import Note as NoteModel
+from src.pkm_app.infrastructure.persistence.sqlalchemy.models import NoteOutbox as NoteOutboxModel
+from src.pkm_app.infrastructure.persistence.sqlalchemy.repositories.hydration import trusted
+
+OUTBOX = NoteOutboxModel.__table__
+NOTES = NoteModel.__table__
+
+MESSAGE_FIELDS = ("id", "note_id", "user_id", "operation", "version", "created_at", "attempts")
+DOCUMENT_COLUMNS = (
+    NOTES.c.id.label("note_id"),
+    NOTES.c.user_id,
+    NOTES.c.project_id,
+    NOTES.c.type,
+    NOTES.c.title,
+    NOTES.c.content,
+    NOTES.c.content_hash,
+    NOTES.c.version,
+    NOTES.c.updated_at,
+)
+
+CLAIM_BATCH = (
+    select(*(OUTBOX.c[field] for field in MESSAGE_FIELDS))
+    .where(OUTBOX.c.available_at <= func.now())
+    .order_by(OUTBOX.c.id)
+    .limit(bindparam("limit"))
+    .with_for_update(skip_locked=True)
+)
+GET_DOCUMENTS = select(*DOCUMENT_COLUMNS).where(
+    NOTES.c.id.in_(bindparam("note_ids", expanding=True))
+)
+COMPLETE = delete(OUTBOX).where(OUTBOX.c.id.in_(bindparam("message_ids", expanding=True)))
+RETRY_LATER = (
+    update(OUTBOX)
+    .where(OUTBOX.c.id.in_(bindparam("message_ids", expanding=True)))
+    .values(
+        attempts=OUTBOX.c.attempts + 1,
+        last_error=bindparam("error"),
+        available_at=bindparam("available_at"),
+    )
+)
+
+
+@timed_repository
+class SQLAlchemyOutboxRepository(IOutboxRepository):
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def claim_batch(self, limit: int) -> list[OutboxMessage]:
+        rows = (await self.session.execute(CLAIM_BATCH, {"limit": limit})).mappings()
+        return [trusted(OutboxMessage, dict(row)) for row in rows]
+
+    async def get_documents(self, note_ids: Sequence[uuid.UUID]) -> list[NoteIndexDocument]:
+        if not note_ids:
+            return []
+        rows = (await self.session.execute(GET_DOCUMENTS, {"note_ids": list(note_ids)})).mappings()
+        return [trusted(NoteIndexDocument, dict(row)) for row in rows]
+
+    async def complete(self, message_ids: Sequence[int]) -> None:
+        if message_ids:
+            await self.session.execute(COMPLETE, {"message_ids": list(message_ids)})
+
+    async def retry_later(
+        self, message_ids: Sequence[int], error: str, available_at: datetime
+    ) -> None:
+        if message_ids:
+            await self.session.execute(
+                RETRY_LATER,
+                {"message_ids": list(message_ids), "error": error, "available_at": available_at},
+            )
@@ -14,11 +14,23 @@ from src.pkm_app.core.application.dtos.project_dto import (
     ProjectUpdate,
 )
 from src.pkm_app.core.application.interfaces.project_interface import IProjectRepository
+from src.pkm_app.infrastructure.monitoring.collectors import timed_repository
+from src.pkm_app.infrastructure.persistence.sqlalchemy.concurrency import (
+    check_expected_version,
+    stale_data_as_conflict,
+)
+from src.pkm_app.infrastructure.persistence.sqlalchemy.dataloader import id_in, session_loaders
 from src.pkm_app.infrastructure.persistence.sqlalchemy.models import Project as ProjectModel
+from src.pkm_app.infrastructure.persistence.sqlalchemy.repositories.hydration import trusted
+from src.pkm_app.infrastructure.persistence.sqlalchemy.repositories.note_repository import (
+    NOTES,
+    touch_notes,
+)
 
 logger = logging.getLogger(__name__)
 
 
+@timed_repository
 class SQLAlchemyProjectRepository(IProjectRepository):
     def __init__(self, session: AsyncSession):
         self.session = session
@@ -28,7 +40,10 @@ class SQLAlchemyProjectRepository(IProjectRepository):
     ) -> ProjectModel | None:
         """Método helper para obtener una instancia de ProjectModel sin caché inseguro."""
         logger.debug(
-            f"Consultando instancia de proyecto {project_id} para usuario {user_id}, incluir hijos: {include_children}."
+            "Consultando instancia de proyecto %s para usuario %s, incluir hijos: %s.",
+            project_id,
+            user_id,
+            include_children,
         )
         
         stmt = select(ProjectModel).where(
@@ -43,6 +58,12 @@ class SQLAlchemyProjectRepository(IProjectRepository):
 
         return project_instance
 
+    def _forget_loaded(self, project_id: UUID, user_id: str) -> None:
+        """Descarta el proyecto memorizado por el DataLoader del Unit of Work, si lo hay."""
+        loaders = session_loaders(self.session)
+        if loaders is not None:
+            loaders.forget(("projects", user_id), project_id)
+
     async def _get_project_ancestors(self, project_id: UUID, user_id: str) -> set[UUID]:
         """Obtiene todos los ancestros de un proyecto para validación de jerarquía."""
         # Using a Common Table Expression (CTE) to recursively fetch ancestors
@@ -65,29 +86,59 @@ class SQLAlchemyProjectRepository(IProjectRepository):
         )
         SELECT parent_project_id FROM ancestors WHERE parent_project_id IS NOT NULL
         """
-        logger.debug(f"Consultando ancestros para proyecto {project_id}, usuario {user_id}.")
-        result = await self.session.execute(select(UUID).from_statement(text(stmt)), {"project_id": project_id, "user_id": user_id})  # type: ignore
-        ancestor_ids = {row[0] for row in result}
+        logger.debug("Consultando ancestros para proyecto %s, usuario %s.", project_id, user_id)
+        result = await self.session.execute(
+            text(stmt), {"project_id": project_id, "user_id": user_id}
+        )
+        ancestor_ids = set(result.scalars())
         logger.debug(
-            f"Encontrados {len(ancestor_ids)} ancestros para proyecto {project_id}, usuario {user_id}."
+            "Encontrados %s ancestros para proyecto %s, usuario %s.",
+            len(ancestor_ids),
+            project_id,
+            user_id,
         )
         return ancestor_ids
 
     async def get_by_id(self, project_id: UUID, user_id: str) -> ProjectSchema | None:
-        logger.info(f"Consultando proyecto por ID {project_id} para usuario {user_id}.")
+        loaders = session_loaders(self.session)
+        if loaders is not None:
+            # Dentro de un Unit of Work: agrupado con el resto de búsquedas de esta vuelta
+            loader = loaders.get(
+                ("projects", user_id), lambda ids: self.get_many_by_ids(ids, user_id)
+            )
+            return await loader.load(project_id)
+
+        logger.debug("Consultando proyecto por ID %s para usuario %s.", project_id, user_id)
         project_instance = await self._get_project_instance(
             project_id, user_id, include_children=True
         )
         if project_instance:
-            logger.debug(f"Proyecto {project_id} encontrado para usuario {user_id}.")
-            return ProjectSchema.model_validate(project_instance)
-        logger.debug(f"Proyecto {project_id} no encontrado para usuario {user_id}.")
+            logger.debug("Proyecto %s encontrado para usuario %s.", project_id, user_id)
+            return trusted(ProjectSchema, project_instance)
+        logger.debug("Proyecto %s no encontrado para usuario %s.", project_id, user_id)
         return None
 
+    async def get_many_by_ids(
+        self, project_ids: Sequence[UUID], user_id: str
+    ) -> dict[UUID, ProjectSchema]:
+        logger.debug("Consultando %s proyectos por ID para usuario %s.", len(project_ids), user_id)
+        stmt = select(ProjectModel).where(
+            id_in(ProjectModel.id, project_ids), ProjectModel.user_id == user_id
+        )
+        result = await self.session.execute(stmt)
+        return {
+            project.id: trusted(ProjectSchema, project) for project in result.scalars().all()
+        }
+
     async def list_by_user(
         self, user_id: str, skip: int = 0, limit: int = 100
     ) -> list[ProjectSchema]:
-        logger.info(f"Listando proyectos para usuario {user_id} con skip={skip}, limit={limit}.")
+        logger.debug(
+            "Listando proyectos para usuario %s con skip=%s, limit=%s.",
+            user_id,
+            skip,
+            limit,
+        )
         stmt = (
             select(ProjectModel)
             .where(ProjectModel.user_id == user_id)
@@ -98,8 +149,8 @@ class SQLAlchemyProjectRepository(IProjectRepository):
         )
         result = await self.session.execute(stmt)
         projects = result.scalars().all()
-        logger.debug(f"Encontrados {len(projects)} proyectos para usuario {user_id}.")
-        return [ProjectSchema.model_validate(project) for project in projects]
+        logger.debug("Encontrados %s proyectos para usuario %s.", len(projects), user_id)
+        return [trusted(ProjectSchema, project) for project in projects]
 
     def _validate_project_data(self, project_data: dict) -> None:
         """Valida los datos del proyecto."""
@@ -124,7 +175,11 @@ class SQLAlchemyProjectRepository(IProjectRepository):
     async def create(self, project_in: ProjectCreate, user_id: str) -> ProjectSchema:
         project_data = project_in.model_dump()
         self._validate_project_data(project_data)
-        logger.info(f"Intentando crear proyecto para usuario {user_id}: {project_data.get('name')}")
+        logger.debug(
+            "Intentando crear proyecto para usuario %s: %s",
+            user_id,
+            project_data.get('name'),
+        )
 
         # Validar jerarquía si se especifica un padre
         if project_in.parent_project_id:
@@ -144,9 +199,11 @@ class SQLAlchemyProjectRepository(IProjectRepository):
             await self.session.flush()
             await self.session.refresh(project_instance)
             logger.info(
-                f"Proyecto {project_instance.id} creado exitosamente para usuario {user_id}."
+                "Proyecto %s creado exitosamente para usuario %s.",
+                project_instance.id,
+                user_id,
             )
-            return ProjectSchema.model_validate(project_instance)
+            return trusted(ProjectSchema, project_instance)
         except IntegrityError as e:
             await self.session.rollback()
             logger.error(f"Error de integridad al crear proyecto para usuario {user_id}: {str(e)}")
@@ -157,26 +214,24 @@ class SQLAlchemyProjectRepository(IProjectRepository):
             raise
 
     async def update(
-        self, project_id: UUID, project_in: ProjectUpdate, user_id: str
+        self,
+        project_id: UUID,
+        project_in: ProjectUpdate,
+        user_id: str,
+        expected_version: int | None = None,
     ) -> ProjectSchema | None:
-        logger.info(f"Intentando actualizar proyecto {project_id} para usuario {user_id}.")
+        logger.debug("Intentando actualizar proyecto %s para usuario %s.", project_id, user_id)
 
-        # Iniciar la transacción y bloquear la fila del proyecto para la actualización.
-        # Esto previene condiciones de carrera si múltiples peticiones intentan actualizar el mismo proyecto concurrentemente.
-        # `with_for_update=True` añade `FOR UPDATE` a la consulta SQL, bloqueando la fila seleccionada.
-        stmt = (
-            select(ProjectModel)
-            .where(ProjectModel.id == project_id, ProjectModel.user_id == user_id)
-            .with_for_update()
-        )
-        result = await self.session.execute(stmt)
-        project_instance = result.scalar_one_or_none()
+        # Sin bloqueo de fila (`FOR UPDATE`): las escrituras concurrentes se detectan con la
+        # columna `version` (ver concurrency.py) al hacer flush.
+        project_instance = await self._get_project_instance(project_id, user_id)
 
         if not project_instance:
             logger.warning(
                 f"Intento de actualizar proyecto inexistente {project_id} para usuario {user_id}"
             )
             return None
+        check_expected_version(project_instance, expected_version, "Project")
 
         update_data = project_in.model_dump(exclude_unset=True)
         # Re-validar datos en la actualización si es necesario,
@@ -216,19 +271,17 @@ class SQLAlchemyProjectRepository(IProjectRepository):
         for field, value in update_data.items():
             setattr(project_instance, field, value)
 
+        self._forget_loaded(project_id, user_id)
         try:
-            await self.session.flush()
+            with stale_data_as_conflict("Project", project_id, expected_version):
+                await self.session.flush()
             await self.session.refresh(project_instance)
-            logger.info(f"Proyecto {project_id} actualizado exitosamente para usuario {user_id}.")
-
-            # Invalidar caché
-            cache_key_with_children = f"project_instance:{user_id}:{project_id}:True"
-            cache_key_without_children = f"project_instance:{user_id}:{project_id}:False"
-            await self.cache.delete(cache_key_with_children)
-            await self.cache.delete(cache_key_without_children)
-            logger.debug(f"Caché invalidada para proyecto {project_id}, usuario {user_id}.")
-
-            return ProjectSchema.model_validate(project_instance)
+            logger.info(
+                "Proyecto %s actualizado exitosamente para usuario %s.",
+                project_id,
+                user_id,
+            )
+            return trusted(ProjectSchema, project_instance)
         except IntegrityError as e:
             await self.session.rollback()
             logger.error(
@@ -243,37 +296,36 @@ class SQLAlchemyProjectRepository(IProjectRepository):
             raise
 
     async def delete(self, project_id: UUID, user_id: str) -> bool:
-        logger.info(f"Intentando eliminar proyecto {project_id} para usuario {user_id}.")
-        project_instance = await self._get_project_instance(
-            project_id, user_id, include_children=True
-        )  # Esta llamada ya usa la caché
+        logger.debug("Intentando eliminar proyecto %s para usuario %s.", project_id, user_id)
+        # Con el subárbol entero cargado, el cascade "all, delete-orphan" de child_projects
+        # borra todos los subproyectos en el mismo flush, de las hojas hacia arriba
+        stmt = (
+            select(ProjectModel)
+            .where(ProjectModel.id == project_id, ProjectModel.user_id == user_id)
+            .options(selectinload(ProjectModel.child_projects, recursion_depth=-1))
+        )
+        project_instance = (await self.session.execute(stmt)).scalar_one_or_none()
         if not project_instance:
             logger.warning(
                 f"Intento de eliminar proyecto inexistente {project_id} para usuario {user_id}"
             )
             return False
         try:
-            # Eliminar recursivamente los subproyectos
-            # Cada llamada recursiva a delete invalidará su propia caché
-            logger.debug(f"Eliminando subproyectos de {project_id} para usuario {user_id}.")
-            for child in project_instance.child_projects:
-                await self.delete(child.id, user_id)  # type: ignore
-
-            # Las notas asociadas se manejarán automáticamente por la configuración
-            # ondelete="SET NULL" en la relación project_id de Note
+            subtree, pending = [], [project_instance]
+            while pending:
+                project = pending.pop()
+                self._forget_loaded(project.id, user_id)
+                subtree.append(project.id)
+                pending.extend(project.child_projects)
+
+            # Las notas del subárbol se quedan sin proyecto con una versión nueva, en una
+            # sola sentencia (el ORM ya no encuentra notas que desvincular al borrar)
+            await self.session.execute(
+                touch_notes(NOTES.c.project_id.in_(subtree), project_id=None)
+            )
             await self.session.delete(project_instance)
             await self.session.flush()
-            logger.info(f"Proyecto {project_id} eliminado exitosamente para usuario {user_id}.")
-
-            # Invalidar caché para el proyecto eliminado
-            cache_key_with_children = f"project_instance:{user_id}:{project_id}:True"
-            cache_key_without_children = f"project_instance:{user_id}:{project_id}:False"
-            await self.cache.delete(cache_key_with_children)
-            await self.cache.delete(cache_key_without_children)
-            logger.debug(
-                f"Caché invalidada para proyecto eliminado {project_id}, usuario {user_id}."
-            )
-
+            logger.info("Proyecto %s eliminado exitosamente para usuario %s.", project_id, user_id)
             return True
         except IntegrityError as e:
             await self.session.rollback()
@@ -289,16 +341,21 @@ class SQLAlchemyProjectRepository(IProjectRepository):
             raise
 
     async def get_children(self, project_id: UUID, user_id: str) -> list[ProjectSchema]:
-        logger.info(f"Consultando hijos para proyecto {project_id}, usuario {user_id}.")
+        logger.debug("Consultando hijos para proyecto %s, usuario %s.", project_id, user_id)
         project = await self._get_project_instance(project_id, user_id, include_children=True)
         if not project:
             logger.debug(
-                f"Proyecto padre {project_id} no encontrado para usuario {user_id} al buscar hijos."
+                "Proyecto padre %s no encontrado para usuario %s al buscar hijos.",
+                project_id,
+                user_id,
             )
             return []
-        children_schemas = [ProjectSchema.model_validate(child) for child in project.child_projects]
+        children_schemas = [trusted(ProjectSchema, child) for child in project.child_projects]
         logger.debug(
-            f"Encontrados {len(children_schemas)} hijos para proyecto {project_id}, usuario {user_id}."
+            "Encontrados %s hijos para proyecto %s, usuario %s.",
+            len(children_schemas),
+            project_id,
+            user_id,
         )
         return children_schemas
 
@@ -323,8 +380,11 @@ class SQLAlchemyProjectRepository(IProjectRepository):
     async def get_root_projects(
         self, user_id: str, skip: int = 0, limit: int = 100
     ) -> list[ProjectSchema]:
-        logger.info(
-            f"Listando proyectos raíz para usuario {user_id} con skip={skip}, limit={limit}."
+        logger.debug(
+            "Listando proyectos raíz para usuario %s con skip=%s, limit=%s.",
+            user_id,
+            skip,
+            limit,
         )
         stmt = (
             select(ProjectModel)
@@ -339,5 +399,5 @@ class SQLAlchemyProjectRepository(IProjectRepository):
         )
         result = await self.session.execute(stmt)
         projects = result.scalars().all()
-        logger.debug(f"Encontrados {len(projects)} proyectos raíz para usuario {user_id}.")
-        return [ProjectSchema.model_validate(project) for project in projects]
+        logger.debug("Encontrados %s proyectos raíz para usuario %s.", len(projects), user_id)
+        return [trusted(ProjectSchema, project) for project in projects]
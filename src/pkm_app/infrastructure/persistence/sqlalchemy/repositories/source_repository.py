@@ -7,11 +7,27 @@ from sqlalchemy import or_, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.pkm_app.core.application.dtos.metadata_filter_dto import MetadataFilter
 from src.pkm_app.core.application.dtos.source_dto import SourceCreate, SourceSchema, SourceUpdate
 from src.pkm_app.core.application.interfaces.source_interface import ISourceRepository
+from src.pkm_app.infrastructure.monitoring.collectors import timed_repository
+from src.pkm_app.infrastructure.persistence.sqlalchemy.concurrency import (
+    check_expected_version,
+    stale_data_as_conflict,
+)
+from src.pkm_app.infrastructure.persistence.sqlalchemy.dataloader import id_in, session_loaders
 from src.pkm_app.infrastructure.persistence.sqlalchemy.models import Source as SourceModel
+from src.pkm_app.infrastructure.persistence.sqlalchemy.repositories.hydration import trusted
+from src.pkm_app.infrastructure.persistence.sqlalchemy.repositories.note_repository import (
+    NOTES,
+    touch_notes,
+)
+from src.pkm_app.infrastructure.persistence.sqlalchemy.repositories.metadata_filters import (
+    build_metadata_conditions,
+)
 
 
+@timed_repository
 class SQLAlchemySourceRepository(ISourceRepository):
     def __init__(self, session: AsyncSession):
         self.session = session
@@ -24,6 +40,12 @@ class SQLAlchemySourceRepository(ISourceRepository):
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
+    def _forget_loaded(self, source_id: UUID, user_id: str) -> None:
+        """Descarta la fuente memorizada por el DataLoader del Unit of Work, si lo hay."""
+        loaders = session_loaders(self.session)
+        if loaders is not None:
+            loaders.forget(("sources", user_id), source_id)
+
     def _validate_url(self, url: str) -> bool:
         """Valida que la URL tenga un formato válido."""
         if not url:
@@ -41,11 +63,27 @@ class SQLAlchemySourceRepository(ISourceRepository):
         return bool(url_pattern.match(url))
 
     async def get_by_id(self, source_id: UUID, user_id: str) -> SourceSchema | None:
+        loaders = session_loaders(self.session)
+        if loaders is not None:
+            # Dentro de un Unit of Work: agrupado con el resto de búsquedas de esta vuelta
+            loader = loaders.get(
+                ("sources", user_id), lambda ids: self.get_many_by_ids(ids, user_id)
+            )
+            return await loader.load(source_id)
         source_instance = await self._get_source_instance(source_id, user_id)
         if source_instance:
-            return SourceSchema.model_validate(source_instance)
+            return trusted(SourceSchema, source_instance)
         return None
 
+    async def get_many_by_ids(
+        self, source_ids: Sequence[UUID], user_id: str
+    ) -> dict[UUID, SourceSchema]:
+        stmt = select(SourceModel).where(
+            id_in(SourceModel.id, source_ids), SourceModel.user_id == user_id
+        )
+        result = await self.session.execute(stmt)
+        return {source.id: trusted(SourceSchema, source) for source in result.scalars().all()}
+
     async def list_by_user(
         self, user_id: str, skip: int = 0, limit: int = 100
     ) -> list[SourceSchema]:
@@ -58,7 +96,7 @@ class SQLAlchemySourceRepository(ISourceRepository):
         )
         result = await self.session.execute(stmt)
         sources = result.scalars().all()
-        return [SourceSchema.model_validate(source) for source in sources]
+        return [trusted(SourceSchema, source) for source in sources]
 
     async def create(self, source_in: SourceCreate, user_id: str) -> SourceSchema:
         # Validar URL si se proporciona
@@ -72,28 +110,37 @@ class SQLAlchemySourceRepository(ISourceRepository):
                 raise ValueError(f"Ya existe una fuente con la URL: {source_in.url}")
 
         source_data = source_in.model_dump()
+        # asyncpg espera str, no AnyUrl: se guarda la URL normalizada por el DTO
+        if source_in.url:
+            source_data["url"] = str(source_in.url)
         source_instance = SourceModel(**source_data, user_id=user_id)
 
         try:
             self.session.add(source_instance)
             await self.session.flush()
             await self.session.refresh(source_instance)
-            return SourceSchema.model_validate(source_instance)
+            return trusted(SourceSchema, source_instance)
         except IntegrityError as e:
             await self.session.rollback()
             raise ValueError("Error de integridad al crear la fuente") from e
 
     async def update(
-        self, source_id: UUID, source_in: SourceUpdate, user_id: str
+        self,
+        source_id: UUID,
+        source_in: SourceUpdate,
+        user_id: str,
+        expected_version: int | None = None,
     ) -> SourceSchema | None:
         source_instance = await self._get_source_instance(source_id, user_id)
         if not source_instance:
             return None
+        check_expected_version(source_instance, expected_version, "Source")
 
         update_data = source_in.model_dump(exclude_unset=True)
 
         # Validar URL si se está actualizando
         if "url" in update_data and update_data["url"]:
+            update_data["url"] = str(update_data["url"])
             if not self._validate_url(update_data["url"]):
                 raise ValueError("El formato de la URL no es válido")
 
@@ -105,10 +152,12 @@ class SQLAlchemySourceRepository(ISourceRepository):
         for field, value in update_data.items():
             setattr(source_instance, field, value)
 
+        self._forget_loaded(source_id, user_id)
         try:
-            await self.session.flush()
+            with stale_data_as_conflict("Source", source_id, expected_version):
+                await self.session.flush()
             await self.session.refresh(source_instance)
-            return SourceSchema.model_validate(source_instance)
+            return trusted(SourceSchema, source_instance)
         except IntegrityError as e:
             await self.session.rollback()
             raise ValueError("Error de integridad al actualizar la fuente") from e
@@ -118,6 +167,9 @@ class SQLAlchemySourceRepository(ISourceRepository):
         if not source_instance:
             return False
 
+        self._forget_loaded(source_id, user_id)
+        # Las notas de la fuente se quedan sin ella con una versión nueva (ver touch_notes)
+        await self.session.execute(touch_notes(NOTES.c.source_id == source_id, source_id=None))
         await self.session.delete(source_instance)
         await self.session.flush()
         return True
@@ -134,14 +186,14 @@ class SQLAlchemySourceRepository(ISourceRepository):
         )
         result = await self.session.execute(stmt)
         sources = result.scalars().all()
-        return [SourceSchema.model_validate(source) for source in sources]
+        return [trusted(SourceSchema, source) for source in sources]
 
     async def search_by_url(self, url: str, user_id: str) -> SourceSchema | None:
         stmt = select(SourceModel).where(SourceModel.user_id == user_id, SourceModel.url == url)
         result = await self.session.execute(stmt)
         source = result.scalar_one_or_none()
         if source:
-            return SourceSchema.model_validate(source)
+            return trusted(SourceSchema, source)
         return None
 
     async def search_by_title(
@@ -162,4 +214,26 @@ class SQLAlchemySourceRepository(ISourceRepository):
         )
         result = await self.session.execute(stmt)
         sources = result.scalars().all()
-        return [SourceSchema.model_validate(source) for source in sources]
+        return [trusted(SourceSchema, source) for source in sources]
+
+    async def search_by_metadata(
+        self,
+        user_id: str,
+        metadata_filter: MetadataFilter,
+        skip: int = 0,
+        limit: int = 20,
+    ) -> list[SourceSchema]:
+        # Las condiciones JSONB se resuelven con el índice GIN (jsonb_path_ops) de link_metadata
+        stmt = (
+            select(SourceModel)
+            .where(
+                SourceModel.user_id == user_id,
+                *build_metadata_conditions(SourceModel.link_metadata, metadata_filter),
+            )
+            .order_by(SourceModel.title)
+            .offset(skip)
+            .limit(limit)
+        )
+        result = await self.session.execute(stmt)
+        sources = result.scalars().all()
+        return [trusted(SourceSchema, source) for source in sources]
@@ -11,9 +11,12 @@ from src.pkm_app.core.application.dtos.user_profile_dto import (
     UserProfileUpdate,
 )
 from src.pkm_app.core.application.interfaces.user_profile_interface import IUserProfileRepository
+from src.pkm_app.infrastructure.monitoring.collectors import timed_repository
 from src.pkm_app.infrastructure.persistence.sqlalchemy.models import UserProfile as UserProfileModel
+from src.pkm_app.infrastructure.persistence.sqlalchemy.repositories.hydration import trusted
 
 
+@timed_repository
 class SQLAlchemyUserProfileRepository(IUserProfileRepository):
     def __init__(self, session: AsyncSession):
         self.session = session
@@ -27,7 +30,7 @@ class SQLAlchemyUserProfileRepository(IUserProfileRepository):
     async def get_by_id(self, user_id: str) -> UserProfileSchema | None:
         profile_instance = await self._get_profile_instance(user_id)
         if profile_instance:
-            return UserProfileSchema.model_validate(profile_instance)
+            return trusted(UserProfileSchema, profile_instance)
         return None
 
     async def get_by_email(self, email: str) -> UserProfileSchema | None:
@@ -35,14 +38,14 @@ class SQLAlchemyUserProfileRepository(IUserProfileRepository):
         result = await self.session.execute(stmt)
         profile = result.scalar_one_or_none()
         if profile:
-            return UserProfileSchema.model_validate(profile)
+            return trusted(UserProfileSchema, profile)
         return None
 
     async def list_all(self, skip: int = 0, limit: int = 100) -> list[UserProfileSchema]:
         stmt = select(UserProfileModel).order_by(UserProfileModel.name).offset(skip).limit(limit)
         result = await self.session.execute(stmt)
         profiles = result.scalars().all()
-        return [UserProfileSchema.model_validate(profile) for profile in profiles]
+        return [trusted(UserProfileSchema, profile) for profile in profiles]
 
     async def create(self, profile_in: UserProfileCreate) -> UserProfileSchema:
         # Validar email único si se proporciona
@@ -58,7 +61,7 @@ class SQLAlchemyUserProfileRepository(IUserProfileRepository):
             self.session.add(profile_instance)
             await self.session.flush()
             await self.session.refresh(profile_instance)
-            return UserProfileSchema.model_validate(profile_instance)
+            return trusted(UserProfileSchema, profile_instance)
         except IntegrityError as e:
             await self.session.rollback()
             raise ValueError("Error de integridad al crear el perfil de usuario") from e
@@ -82,7 +85,7 @@ class SQLAlchemyUserProfileRepository(IUserProfileRepository):
         try:
             await self.session.flush()
             await self.session.refresh(profile_instance)
-            return UserProfileSchema.model_validate(profile_instance)
+            return trusted(UserProfileSchema, profile_instance)
         except IntegrityError as e:
             await self.session.rollback()
             raise ValueError("Error de integridad al actualizar el perfil de usuario") from e
@@ -109,4 +112,4 @@ class SQLAlchemyUserProfileRepository(IUserProfileRepository):
         )
         result = await self.session.execute(stmt)
         profiles = result.scalars().all()
-        return [UserProfileSchema.model_validate(profile) for profile in profiles]
+        return [trusted(UserProfileSchema, profile) for profile in profiles]
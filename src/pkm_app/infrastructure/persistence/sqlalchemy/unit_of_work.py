@@ -2,24 +2,56 @@ import asyncio
 import contextlib
 from collections.abc import Callable
 from types import TracebackType
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from aiocache import Cache, SimpleMemoryCache
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.pkm_app.core.application.interfaces.assistant_context_interface import (
+    IAssistantContextRepository,
+)
+from src.pkm_app.core.application.interfaces.change_feed_interface import IChangeFeedRepository
 from src.pkm_app.core.application.interfaces.keyword_interface import IKeywordRepository
+from src.pkm_app.core.application.interfaces.near_duplicate_interface import (
+    INearDuplicateRepository,
+)
 from src.pkm_app.core.application.interfaces.note_interface import INoteRepository
 from src.pkm_app.core.application.interfaces.note_link_interface import INoteLinkRepository
 from src.pkm_app.core.application.interfaces.project_interface import IProjectRepository
 from src.pkm_app.core.application.interfaces.source_interface import ISourceRepository
-from src.pkm_app.core.application.interfaces.unit_of_work_interface import IUnitOfWork
-from src.pkm_app.infrastructure.persistence.sqlalchemy.database import AsyncSessionLocal
+from src.pkm_app.core.application.interfaces.unit_of_work_interface import (
+    IReadOnlyUnitOfWork,
+    IUnitOfWork,
+)
+from src.pkm_app.infrastructure.persistence.sqlalchemy.dataloader import (
+    DataLoaderRegistry,
+    attach_loaders,
+    detach_loaders,
+    session_loaders,
+)
+from src.pkm_app.infrastructure.persistence.sqlalchemy.database import (
+    get_async_readonly_sessionmaker,
+    get_async_sessionmaker,
+    get_replica_router,
+)
+from src.pkm_app.infrastructure.persistence.sqlalchemy.repositories.change_feed_repository import (
+    SQLAlchemyChangeFeedRepository,
+)
+from src.pkm_app.infrastructure.persistence.sqlalchemy.repositories.context_repository import (
+    SQLAlchemyAssistantContextRepository,
+)
 from src.pkm_app.infrastructure.persistence.sqlalchemy.repositories.keyword_repository import (
     SQLAlchemyKeywordRepository,
 )
+from src.pkm_app.infrastructure.persistence.sqlalchemy.repositories.minhash_repository import (
+    SQLAlchemyNearDuplicateRepository,
+)
 from src.pkm_app.infrastructure.persistence.sqlalchemy.repositories.note_link_repository import (
     SQLAlchemyNoteLinkRepository,
 )
+from src.pkm_app.infrastructure.persistence.sqlalchemy.repositories.note_read_repository import (
+    SQLAlchemyNoteReadRepository,
+)
 from src.pkm_app.infrastructure.persistence.sqlalchemy.repositories.note_repository import (
     SQLAlchemyNoteRepository,
 )
@@ -30,15 +62,44 @@ from src.pkm_app.infrastructure.persistence.sqlalchemy.repositories.source_repos
     SQLAlchemySourceRepository,
 )
 
+if TYPE_CHECKING:
+    from src.pkm_app.infrastructure.persistence.sqlalchemy.replicas import ReplicaRouter
+
+
+class _DataLoadersMixin:
+    """Registro de DataLoaders ligado a la sesión mientras el UoW está abierto."""
+
+    _session: AsyncSession | None
+    loaders: DataLoaderRegistry | None = None
+    _owns_loaders: bool = False
+
+    def _attach_loaders(self) -> None:
+        assert self._session is not None
+        # Un UoW anidado sobre la misma sesión externa comparte el registro del exterior
+        self._owns_loaders = attach_loaders(self._session) is not None
+        self.loaders = session_loaders(self._session)
+
+    def _detach_loaders(self) -> None:
+        if self._session is not None and self._owns_loaders:
+            detach_loaders(self._session)
+        self.loaders = None
+        self._owns_loaders = False
+
 
-class SQLAlchemyUnitOfWork(IUnitOfWork):
+class SQLAlchemyUnitOfWork(_DataLoadersMixin, IUnitOfWork):
     def __init__(
         self,
-        session_factory_or_session: Callable[[], AsyncSession] | AsyncSession = AsyncSessionLocal,
+        session_factory_or_session: Callable[[], AsyncSession] | AsyncSession | None = None,
         cache: Cache | None = None,
+        router: "ReplicaRouter | None" = None,
+        user_id: str | None = None,
     ):
-        # Permite pasar un sessionmaker o una sesión ya creada
+        # Permite pasar un sessionmaker o una sesión ya creada. Si no se indica ninguno,
+        # se usa el sessionmaker global, que se crea al entrar en el contexto (no al importar).
         self._session_factory_or_session = session_factory_or_session
+        # Con réplicas, cada commit de `user_id` activa su ventana de read-your-writes
+        self._router = router
+        self.user_id = user_id
         self._session: AsyncSession | None = None
         self._uow_manages_transaction: bool = False
         self._cache: Cache = cache or SimpleMemoryCache()
@@ -47,6 +108,9 @@ class SQLAlchemyUnitOfWork(IUnitOfWork):
         self.projects: IProjectRepository
         self.sources: ISourceRepository
         self.note_links: INoteLinkRepository
+        self.changes: IChangeFeedRepository
+        self.near_duplicates: INearDuplicateRepository
+        self.assistant_context: IAssistantContextRepository
 
     async def __aenter__(self) -> "IUnitOfWork":
         """Inicia una nueva sesión y configura los repositorios."""
@@ -54,7 +118,12 @@ class SQLAlchemyUnitOfWork(IUnitOfWork):
         if isinstance(self._session_factory_or_session, AsyncSession):
             self._session = self._session_factory_or_session
         else:
-            session = self._session_factory_or_session()
+            if self._session_factory_or_session is None:
+                session_factory = get_async_sessionmaker()
+                self._router = self._router or get_replica_router()
+            else:
+                session_factory = self._session_factory_or_session
+            session = session_factory()
             if asyncio.iscoroutine(session):
                 self._session = await session
             else:
@@ -68,11 +137,15 @@ class SQLAlchemyUnitOfWork(IUnitOfWork):
         else:
             self._uow_manages_transaction = False
 
+        self._attach_loaders()
         self.notes = SQLAlchemyNoteRepository(self._session)
         self.keywords = SQLAlchemyKeywordRepository(self._session)
         self.projects = SQLAlchemyProjectRepository(self._session)
         self.sources = SQLAlchemySourceRepository(self._session)
         self.note_links = SQLAlchemyNoteLinkRepository(self._session)
+        self.changes = SQLAlchemyChangeFeedRepository(self._session)
+        self.near_duplicates = SQLAlchemyNearDuplicateRepository(self._session)
+        self.assistant_context = SQLAlchemyAssistantContextRepository(self._session)
 
         return self
 
@@ -99,6 +172,7 @@ class SQLAlchemyUnitOfWork(IUnitOfWork):
                 await self._session.close()  # Cerrar la sesión solo si UoW la maneja
 
             # Siempre limpiar la referencia a la sesión y el flag al salir del contexto del UoW
+            self._detach_loaders()
             self._session = None
             self._uow_manages_transaction = False
 
@@ -108,6 +182,8 @@ class SQLAlchemyUnitOfWork(IUnitOfWork):
             raise RuntimeError("Session no inicializada. Use 'async with'.")
         if self._uow_manages_transaction:  # Solo commit si UoW maneja la transacción
             await self._session.commit()
+            if self._router is not None:
+                self._router.record_write(self.user_id)
             # Después de un commit, la transacción se cierra. Si el UoW la maneja,
             # se debe iniciar una nueva para que la sesión siga siendo utilizable
             # dentro del mismo bloque `async with uow`.
@@ -121,6 +197,9 @@ class SQLAlchemyUnitOfWork(IUnitOfWork):
     async def rollback(self) -> None:
         if not self._session:
             raise RuntimeError("Session no inicializada. Use 'async with'.")
+        if self.loaders is not None:
+            # Lo memorizado puede venir de escrituras que se acaban de deshacer
+            self.loaders.clear()
         if self._uow_manages_transaction:  # Solo rollback si UoW maneja la transacción
             await self._session.rollback()
             # Después de un rollback, la transacción se cierra. Si el UoW la maneja,
@@ -132,3 +211,129 @@ class SQLAlchemyUnitOfWork(IUnitOfWork):
         # El rollback de la transacción externa se maneja fuera (e.g., en el fixture).
         # No es necesario ni siquiera un flush aquí.
         # await self._session.flush() # No es necesario, podría causar problemas si la transacción externa ya hizo rollback
+
+
+class SQLAlchemyReadOnlyUnitOfWork(_DataLoadersMixin, IReadOnlyUnitOfWork):
+    """
+    Unit of Work para lecturas: no abre transacciones ni hace flush.
+
+    Por defecto usa el sessionmaker de solo lectura (pool propio, autocommit y
+    `default_transaction_read_only`), así que cada consulta se ejecuta sin BEGIN/COMMIT.
+    Si hay réplicas configuradas (o se pasa `router`), la sesión se abre contra el engine
+    que elija el router para `user_id`. Los repositorios se crean al acceder a ellos por
+    primera vez; las notas se leen por el camino Core (`SQLAlchemyNoteReadRepository`).
+    """
+
+    _REPOSITORY_CLASSES: dict[str, Callable[[AsyncSession], Any]] = {
+        "notes": SQLAlchemyNoteReadRepository,
+        "keywords": SQLAlchemyKeywordRepository,
+        "projects": SQLAlchemyProjectRepository,
+        "sources": SQLAlchemySourceRepository,
+        "note_links": SQLAlchemyNoteLinkRepository,
+        "changes": SQLAlchemyChangeFeedRepository,
+        "near_duplicates": SQLAlchemyNearDuplicateRepository,
+        "assistant_context": SQLAlchemyAssistantContextRepository,
+    }
+
+    def __init__(
+        self,
+        session_factory_or_session: Callable[[], AsyncSession] | AsyncSession | None = None,
+        router: "ReplicaRouter | None" = None,
+        user_id: str | None = None,
+    ):
+        self._session_factory_or_session = session_factory_or_session
+        self._router = router
+        self.user_id = user_id
+        self._session: AsyncSession | None = None
+        self._owns_session: bool = False
+        self._repositories: dict[str, Any] = {}
+
+    async def __aenter__(self) -> "SQLAlchemyReadOnlyUnitOfWork":
+        """Obtiene la sesión; no inicia ninguna transacción."""
+        if isinstance(self._session_factory_or_session, AsyncSession):
+            self._session = self._session_factory_or_session
+            self._owns_session = False
+        else:
+            session_factory = self._session_factory_or_session or self._default_session_factory()
+            session = session_factory()
+            self._session = await session if asyncio.iscoroutine(session) else session
+            self._owns_session = True
+        self._attach_loaders()
+        return self
+
+    def _default_session_factory(self) -> Callable[[], AsyncSession]:
+        router = self._router or get_replica_router()
+        if router is not None:
+            return router.read_sessionmaker(self.user_id)
+        return get_async_readonly_sessionmaker()
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Cierra la sesión si la creó este UoW (devuelve la conexión al pool)."""
+        try:
+            if self._session and self._owns_session:
+                await self._session.close()
+        finally:
+            self._detach_loaders()
+            self._session = None
+            self._owns_session = False
+            self._repositories.clear()
+
+    def _repository(self, name: str) -> Any:
+        if not self._session:
+            raise RuntimeError("Session no inicializada. Use 'async with'.")
+        repository = self._repositories.get(name)
+        if repository is None:
+            repository = self._REPOSITORY_CLASSES[name](self._session)
+            self._repositories[name] = repository
+        return repository
+
+    @property  # type: ignore[override]
+    def notes(self) -> INoteRepository:
+        return self._repository("notes")  # type: ignore[no-any-return]
+
+    @property  # type: ignore[override]
+    def keywords(self) -> IKeywordRepository:
+        return self._repository("keywords")  # type: ignore[no-any-return]
+
+    @property  # type: ignore[override]
+    def projects(self) -> IProjectRepository:
+        return self._repository("projects")  # type: ignore[no-any-return]
+
+    @property  # type: ignore[override]
+    def sources(self) -> ISourceRepository:
+        return self._repository("sources")  # type: ignore[no-any-return]
+
+    @property  # type: ignore[override]
+    def note_links(self) -> INoteLinkRepository:
+        return self._repository("note_links")  # type: ignore[no-any-return]
+
+    @property  # type: ignore[override]
+    def changes(self) -> IChangeFeedRepository:
+        return self._repository("changes")  # type: ignore[no-any-return]
+
+    @property  # type: ignore[override]
+    def near_duplicates(self) -> INearDuplicateRepository:
+        return self._repository("near_duplicates")  # type: ignore[no-any-return]
+
+    @property  # type: ignore[override]
+    def assistant_context(self) -> IAssistantContextRepository:
+        return self._repository("assistant_context")  # type: ignore[no-any-return]
+
+    async def commit(self) -> None:
+        """No hay nada que confirmar en un UoW de solo lectura."""
+        if not self._session:
+            raise RuntimeError("Session no inicializada. Use 'async with'.")
+
+    async def rollback(self) -> None:
+        """Libera la conexión de la sesión propia (en autocommit no se envía ROLLBACK)."""
+        if not self._session:
+            raise RuntimeError("Session no inicializada. Use 'async with'.")
+        if self.loaders is not None:
+            self.loaders.clear()
+        if self._owns_session:
+            await self._session.rollback()
@@ -0,0 +1,28 @@
+"""Validaciones comunes a los índices vectoriales, para que todos rechacen lo mismo."""
+
+from collections.abc import Sequence
+
+import numpy as np
+
+from src.pkm_app.core.application.dtos import VectorBatch
+from src.pkm_app.core.application.dtos.vector_index_dto import VECTOR_DTYPE
+
+
+def check_batch(batch: VectorBatch, dimension: int) -> None:
+    if len(batch) and batch.dimension != dimension:
+        raise ValueError(
+            f"El lote tiene vectores de dimensión {batch.dimension}; el índice es de {dimension}"
+        )
+
+
+def query_vector(vector: np.ndarray | Sequence[float], dimension: int, limit: int) -> np.ndarray:
+    """Vector de consulta normalizado (float32), tras validar dimensión, norma y `limit`."""
+    if limit < 1:
+        raise ValueError("limit debe ser al menos 1")
+    query = np.asarray(vector, dtype=VECTOR_DTYPE)
+    if query.shape != (dimension,):
+        raise ValueError(f"El vector de consulta debe tener forma ({dimension},)")
+    norm = np.linalg.norm(query)
+    if not norm > 0:
+        raise ValueError("El vector de consulta no puede ser nulo")
+    return query / norm
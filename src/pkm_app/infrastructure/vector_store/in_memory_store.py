@@ -0,0 +1,36 @@
+import uuid
+
+from src.pkm_app.core.application.dtos import NoteIndexBatch, NoteIndexDocument
+from src.pkm_app.core.application.interfaces.outbox_interface import INoteIndexSink
+
+
+class InMemoryVectorStore(INoteIndexSink):
+    """
+    Sustituto en memoria del almacén vectorial para tests y benchmarks.
+
+    Guarda los documentos (no calcula vectores) con las mismas reglas de idempotencia que se
+    exigen al almacén real: un documento no sustituye a otro de versión mayor y una lápida
+    descarta los documentos de su versión o anteriores, también los que lleguen después.
+    """
+
+    def __init__(self) -> None:
+        self.documents: dict[uuid.UUID, NoteIndexDocument] = {}
+        self.batches: list[NoteIndexBatch] = []
+        self._deleted_versions: dict[uuid.UUID, int] = {}
+
+    async def apply(self, batch: NoteIndexBatch) -> None:
+        self.batches.append(batch)
+        for tombstone in batch.deletes:
+            deleted_version = max(
+                self._deleted_versions.get(tombstone.note_id, 0), tombstone.version
+            )
+            self._deleted_versions[tombstone.note_id] = deleted_version
+            current = self.documents.get(tombstone.note_id)
+            if current is not None and current.version <= deleted_version:
+                del self.documents[tombstone.note_id]
+        for document in batch.upserts:
+            if self._deleted_versions.get(document.note_id, 0) >= document.version:
+                continue
+            current = self.documents.get(document.note_id)
+            if current is None or current.version <= document.version:
+                self.documents[document.note_id] = document
@@ -0,0 +1,144 @@
+import uuid
+from collections.abc import Sequence
+
+import numpy as np
+
+from src.pkm_app.core.application.dtos import VectorBatch, VectorFilter, VectorSearchHit
+from src.pkm_app.core.application.dtos.vector_index_dto import VECTOR_DTYPE
+from src.pkm_app.core.application.interfaces.vector_index_interface import IVectorIndex
+from src.pkm_app.infrastructure.vector_store.common import check_batch, query_vector
+
+NO_CODE = -1
+
+
+class NumpyVectorIndex(IVectorIndex):
+    """
+    Índice vectorial en memoria con búsqueda exacta, para tests y uso sin servidor.
+
+    Los vectores se guardan normalizados en una matriz float32 que crece por duplicación, y
+    el payload como códigos enteros por fila (usuario, proyecto, tipo), de modo que un
+    filtro es una máscara booleana que se aplica antes de calcular similitudes: solo se
+    multiplican las filas candidatas. Los borrados marcan la fila como libre y la matriz se
+    compacta cuando más de la mitad de las filas están libres.
+    """
+
+    INITIAL_CAPACITY = 1024
+
+    def __init__(self, dimension: int) -> None:
+        if dimension < 1:
+            raise ValueError("dimension debe ser al menos 1")
+        self._dimension = dimension
+        self._size = 0
+        self._vectors = np.empty((self.INITIAL_CAPACITY, dimension), dtype=VECTOR_DTYPE)
+        self._alive = np.zeros(self.INITIAL_CAPACITY, dtype=bool)
+        self._users = np.full(self.INITIAL_CAPACITY, NO_CODE, dtype=np.int32)
+        self._projects = np.full(self.INITIAL_CAPACITY, NO_CODE, dtype=np.int32)
+        self._types = np.full(self.INITIAL_CAPACITY, NO_CODE, dtype=np.int32)
+        self._ids: list[uuid.UUID | None] = []
+        self._rows: dict[uuid.UUID, int] = {}
+        self._codes: dict[str, dict[object, int]] = {"user": {}, "project": {}, "type": {}}
+
+    @property
+    def dimension(self) -> int:
+        return self._dimension
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    async def upsert(self, batch: VectorBatch) -> None:
+        check_batch(batch, self._dimension)
+        if not len(batch):
+            return
+        rows = np.fromiter((self._row_for(point_id) for point_id in batch.ids), dtype=np.intp)
+        norms = np.linalg.norm(batch.vectors, axis=1, keepdims=True)
+        self._vectors[rows] = batch.vectors / norms
+        self._alive[rows] = True
+        self._users[rows] = [self._code("user", p.user_id) for p in batch.payloads]
+        self._projects[rows] = [self._code("project", p.project_id) for p in batch.payloads]
+        self._types[rows] = [self._code("type", p.type) for p in batch.payloads]
+
+    async def delete(self, ids: Sequence[uuid.UUID]) -> None:
+        rows = [row for point_id in ids if (row := self._rows.pop(point_id, None)) is not None]
+        if not rows:
+            return
+        self._alive[rows] = False
+        for row in rows:
+            self._ids[row] = None
+        if self._size > self.INITIAL_CAPACITY and len(self._rows) < self._size // 2:
+            self._compact()
+
+    async def search(
+        self, vector: np.ndarray | Sequence[float], filter: VectorFilter, limit: int = 10
+    ) -> list[VectorSearchHit]:
+        query = query_vector(vector, self._dimension, limit)
+        mask = self._mask(filter)
+        if mask is None:
+            return []
+        rows = np.flatnonzero(mask)
+        scores = self._vectors[rows] @ query
+        if len(rows) > limit:
+            top = np.argpartition(-scores, limit - 1)[:limit]
+            rows, scores = rows[top], scores[top]
+        order = np.argsort(-scores, kind="stable")
+        return [
+            VectorSearchHit(id=self._ids[row], score=float(score))
+            for row, score in zip(rows[order].tolist(), scores[order].tolist(), strict=True)
+        ]
+
+    async def count(self, filter: VectorFilter) -> int:
+        mask = self._mask(filter)
+        return 0 if mask is None else int(np.count_nonzero(mask))
+
+    def _mask(self, filter: VectorFilter) -> np.ndarray | None:
+        """Filas que cumplen el filtro; None si algún valor no aparece en el índice."""
+        mask = self._alive[: self._size].copy()
+        for field, column, value in (
+            ("user", self._users, filter.user_id),
+            ("project", self._projects, filter.project_id),
+            ("type", self._types, filter.type),
+        ):
+            if value is None:
+                continue
+            code = self._codes[field].get(value)
+            if code is None:
+                return None
+            mask &= column[: self._size] == code
+        return mask
+
+    def _code(self, field: str, value: object) -> int:
+        if value is None:
+            return NO_CODE
+        codes = self._codes[field]
+        return codes.setdefault(value, len(codes))
+
+    def _row_for(self, point_id: uuid.UUID) -> int:
+        row = self._rows.get(point_id)
+        if row is None:
+            if self._size == len(self._vectors):
+                self._resize(2 * len(self._vectors))
+            row = self._size
+            self._size += 1
+            self._ids.append(point_id)
+            self._rows[point_id] = row
+        return row
+
+    def _resize(self, capacity: int) -> None:
+        def grow(column: np.ndarray, fill: object) -> np.ndarray:
+            resized = np.full((capacity, *column.shape[1:]), fill, dtype=column.dtype)
+            resized[: self._size] = column[: self._size]
+            return resized
+
+        self._vectors = grow(self._vectors, 0)
+        self._alive = grow(self._alive, False)
+        self._users = grow(self._users, NO_CODE)
+        self._projects = grow(self._projects, NO_CODE)
+        self._types = grow(self._types, NO_CODE)
+
+    def _compact(self) -> None:
+        # Las filas a partir de `_size` no se leen y un alta rellena todas sus columnas
+        keep = np.flatnonzero(self._alive[: self._size])
+        for column in (self._vectors, self._alive, self._users, self._projects, self._types):
+            column[: len(keep)] = column[keep]
+        self._ids = [self._ids[row] for row in keep.tolist()]
+        self._rows = {point_id: row for row, point_id in enumerate(self._ids)}
+        self._size = len(keep)
@@ -0,0 +1,359 @@
+"""
+Índice vectorial sobre Qdrant, hablando su API REST con un cliente httpx compartido.
+
+- Un único `httpx.AsyncClient` por índice mantiene un pool de conexiones keep-alive
+  (`max_connections`); crea el índice una vez por proceso y ciérralo con `close()`.
+- Las altas y borrados se envían en peticiones de `batch_size` puntos, varias a la vez
+  (hasta `max_connections`), con `wait=true`: al volver ya son visibles en las búsquedas.
+- Los filtros por usuario, proyecto y tipo viajan en la búsqueda y Qdrant los aplica al
+  recorrer su grafo HNSW, sobre índices de payload que crea `ensure_collection` (el de
+  `user_id` marcado como tenant, que agrupa en disco los vectores de cada usuario).
+- Los vectores se serializan con orjson directamente desde la matriz NumPy del lote.
+
+`QdrantNoteIndex` es además el destino del relay del outbox (`INoteIndexSink`): calcula los
+embeddings de las notas entregadas y guarda su versión en el payload de cada punto.
+"""
+
+import asyncio
+import uuid
+from collections.abc import Sequence
+from typing import Any
+
+import httpx
+import numpy as np
+import orjson
+
+from src.pkm_app.core.application.content_hashing import note_text
+from src.pkm_app.core.application.dtos import (
+    NoteIndexBatch,
+    VectorBatch,
+    VectorFilter,
+    VectorPayload,
+    VectorSearchHit,
+)
+from src.pkm_app.core.application.interfaces.embedding_interface import ITextEmbedder
+from src.pkm_app.core.application.interfaces.outbox_interface import INoteIndexSink
+from src.pkm_app.core.application.interfaces.vector_index_interface import IVectorIndex
+from src.pkm_app.infrastructure.config.settings import Settings
+from src.pkm_app.infrastructure.vector_store.common import check_batch, query_vector
+
+# Índices de payload que crea ensure_collection
+PAYLOAD_INDEXES: dict[str, dict[str, Any]] = {
+    "user_id": {"type": "keyword", "is_tenant": True},
+    "project_id": {"type": "keyword"},
+    "type": {"type": "keyword"},
+}
+
+
+class QdrantVectorIndex(IVectorIndex):
+    DEFAULT_BATCH_SIZE = 256
+    DEFAULT_MAX_CONNECTIONS = 8
+
+    def __init__(
+        self,
+        url: str,
+        collection: str,
+        dimension: int,
+        *,
+        api_key: str | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        timeout: float = 10.0,
+        hnsw_ef: int | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        if dimension < 1:
+            raise ValueError("dimension debe ser al menos 1")
+        if batch_size < 1 or max_connections < 1:
+            raise ValueError("batch_size y max_connections deben ser al menos 1")
+        self._dimension = dimension
+        self._collection = collection
+        self._batch_size = batch_size
+        self._hnsw_ef = hnsw_ef
+        # Las peticiones de un lote esperan aquí y no en el pool (donde cuenta el timeout)
+        self._requests = asyncio.Semaphore(max_connections)
+        headers = {"content-type": "application/json"}
+        if api_key:
+            headers["api-key"] = api_key
+        self._client = httpx.AsyncClient(
+            base_url=url,
+            headers=headers,
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections, max_keepalive_connections=max_connections
+            ),
+            transport=transport,
+        )
+
+    @classmethod
+    def from_settings(cls, settings: Settings, dimension: int) -> "QdrantVectorIndex":
+        return cls(
+            settings.QDRANT_URL,
+            settings.QDRANT_COLLECTION,
+            dimension,
+            api_key=settings.QDRANT_API_KEY,
+            batch_size=settings.QDRANT_BATCH_SIZE,
+            max_connections=settings.QDRANT_MAX_CONNECTIONS,
+            timeout=settings.QDRANT_TIMEOUT_SECONDS,
+        )
+
+    @property
+    def dimension(self) -> int:
+        return self._dimension
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "QdrantVectorIndex":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    async def ensure_collection(self) -> None:
+        """
+        Crea la colección (distancia coseno) y sus índices de payload si no existe. Si existe
+        con otra dimensión lanza ValueError.
+        """
+        response = await self._client.get(self._path())
+        if response.status_code == httpx.codes.NOT_FOUND:
+            await self._call(
+                "PUT",
+                self._path(),
+                {"vectors": {"size": self._dimension, "distance": "Cosine"}},
+            )
+            for field, schema in PAYLOAD_INDEXES.items():
+                await self._call(
+                    "PUT",
+                    self._path("index"),
+                    {"field_name": field, "field_schema": schema},
+                    params={"wait": "true"},
+                )
+            return
+        response.raise_for_status()
+        size = orjson.loads(response.content)["result"]["config"]["params"]["vectors"]["size"]
+        if size != self._dimension:
+            raise ValueError(
+                f"La colección {self._collection} es de dimensión {size}, no {self._dimension}"
+            )
+
+    async def delete_collection(self) -> None:
+        await self._call("DELETE", self._path())
+
+    async def upsert(self, batch: VectorBatch) -> None:
+        check_batch(batch, self._dimension)
+        await self._put_points(self._collection, _points(batch))
+
+    async def delete(self, ids: Sequence[uuid.UUID]) -> None:
+        point_ids = [str(point_id) for point_id in ids]
+        await asyncio.gather(
+            *(
+                self._call(
+                    "POST",
+                    self._path("points", "delete"),
+                    {"points": point_ids[start : start + self._batch_size]},
+                    params={"wait": "true"},
+                )
+                for start in range(0, len(point_ids), self._batch_size)
+            )
+        )
+
+    async def search(
+        self, vector: np.ndarray | Sequence[float], filter: VectorFilter, limit: int = 10
+    ) -> list[VectorSearchHit]:
+        body: dict[str, Any] = {
+            "vector": query_vector(vector, self._dimension, limit),
+            "filter": _filter(filter),
+            "limit": limit,
+            "with_payload": False,
+            "with_vector": False,
+        }
+        if self._hnsw_ef is not None:
+            body["params"] = {"hnsw_ef": self._hnsw_ef}
+        result = await self._call("POST", self._path("points", "search"), body)
+        return [VectorSearchHit(id=uuid.UUID(hit["id"]), score=hit["score"]) for hit in result]
+
+    async def count(self, filter: VectorFilter) -> int:
+        result = await self._call(
+            "POST", self._path("points", "count"), {"filter": _filter(filter), "exact": True}
+        )
+        return int(result["count"])
+
+    def _path(self, *parts: str, collection: str | None = None) -> str:
+        return "/".join(("/collections", collection or self._collection, *parts))
+
+    async def _put_points(self, collection: str, points: list[dict[str, Any]]) -> None:
+        await asyncio.gather(
+            *(
+                self._call(
+                    "PUT",
+                    self._path("points", collection=collection),
+                    {"points": points[start : start + self._batch_size]},
+                    params={"wait": "true"},
+                )
+                for start in range(0, len(points), self._batch_size)
+            )
+        )
+
+    async def _call(
+        self,
+        method: str,
+        path: str,
+        body: dict[str, Any] | None = None,
+        params: dict[str, str] | None = None,
+    ) -> Any:
+        """Envía `body` y devuelve el `result` de la respuesta (httpx.HTTPStatusError si falla)."""
+        content = None if body is None else orjson.dumps(body, option=orjson.OPT_SERIALIZE_NUMPY)
+        async with self._requests:
+            response = await self._client.request(method, path, content=content, params=params)
+        response.raise_for_status()
+        return orjson.loads(response.content)["result"]
+
+
+def _payload(payload: VectorPayload) -> dict[str, str]:
+    values = {"user_id": payload.user_id}
+    if payload.project_id is not None:
+        values["project_id"] = str(payload.project_id)
+    if payload.type is not None:
+        values["type"] = payload.type
+    return values
+
+
+def _points(batch: VectorBatch) -> list[dict[str, Any]]:
+    return [
+        {"id": str(point_id), "vector": vector, "payload": _payload(payload)}
+        for point_id, vector, payload in zip(batch.ids, batch.vectors, batch.payloads, strict=True)
+    ]
+
+
+def _filter(filter: VectorFilter) -> dict[str, Any]:
+    conditions = {"user_id": filter.user_id, "project_id": filter.project_id, "type": filter.type}
+    return {
+        "must": [
+            {"key": key, "match": {"value": str(value)}}
+            for key, value in conditions.items()
+            if value is not None
+        ]
+    }
+
+
+class QdrantNoteIndex(QdrantVectorIndex, INoteIndexSink):
+    """
+    Índice de notas que recibe las entregas del outbox.
+
+    - Los textos de las notas (`note_text`) se convierten en vectores con `embedder`, en una
+      sola llamada por lote; con un `CachedEmbedder` solo se calculan los textos nuevos.
+    - Cada punto guarda la versión de su nota en el payload (`version`). Antes de escribir se
+      leen las versiones guardadas y se descartan los documentos que no son más recientes.
+    - Un borrado deja una lápida (nota y versión) en la colección auxiliar sin vectores
+      `<colección>_tombstones`, así que un documento que llega tarde de otro relay con una
+      versión igual o anterior no vuelve a indexar la nota.
+
+    La lectura de versiones y la escritura no son atómicas: si dos relays entregan a la vez
+    versiones distintas de la misma nota, puede quedar la anterior. Por eso se ejecuta un
+    único relay por colección (ver `infrastructure/outbox/runner.py`).
+    """
+
+    def __init__(
+        self,
+        url: str,
+        collection: str,
+        embedder: ITextEmbedder,
+        dimension: int,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(url, collection, dimension, **kwargs)
+        self._embedder = embedder
+        self._tombstones = f"{collection}_tombstones"
+
+    @classmethod
+    def from_settings(  # type: ignore[override]
+        cls, settings: Settings, embedder: ITextEmbedder, dimension: int
+    ) -> "QdrantNoteIndex":
+        return cls(
+            settings.QDRANT_URL,
+            settings.QDRANT_COLLECTION,
+            embedder,
+            dimension,
+            api_key=settings.QDRANT_API_KEY,
+            batch_size=settings.QDRANT_BATCH_SIZE,
+            max_connections=settings.QDRANT_MAX_CONNECTIONS,
+            timeout=settings.QDRANT_TIMEOUT_SECONDS,
+        )
+
+    async def ensure_collection(self) -> None:
+        """Crea también la colección de lápidas (solo payload) si no existe."""
+        await super().ensure_collection()
+        response = await self._client.get(self._path(collection=self._tombstones))
+        if response.status_code == httpx.codes.NOT_FOUND:
+            await self._call("PUT", self._path(collection=self._tombstones), {"vectors": {}})
+            return
+        response.raise_for_status()
+
+    async def delete_collection(self) -> None:
+        await super().delete_collection()
+        await self._call("DELETE", self._path(collection=self._tombstones))
+
+    async def apply(self, batch: NoteIndexBatch) -> None:
+        note_ids = [d.note_id for d in batch.upserts] + [t.note_id for t in batch.deletes]
+        indexed, deleted = await asyncio.gather(
+            self._versions(self._collection, note_ids),
+            self._versions(self._tombstones, note_ids),
+        )
+
+        tombstones = [t for t in batch.deletes if t.version > deleted.get(t.note_id, 0)]
+        if tombstones:
+            await self._put_points(
+                self._tombstones,
+                [
+                    {
+                        "id": str(t.note_id),
+                        "vector": {},
+                        "payload": {"user_id": t.user_id, "version": t.version},
+                    }
+                    for t in tombstones
+                ],
+            )
+            deleted.update((t.note_id, t.version) for t in tombstones)
+            await self.delete(
+                [
+                    t.note_id
+                    for t in tombstones
+                    if t.note_id in indexed and indexed[t.note_id] <= t.version
+                ]
+            )
+
+        documents = [
+            d
+            for d in batch.upserts
+            if d.version > max(indexed.get(d.note_id, 0), deleted.get(d.note_id, 0))
+        ]
+        if not documents:
+            return
+        vectors = await self._embedder.embed([note_text(d.title, d.content) for d in documents])
+        vector_batch = VectorBatch(
+            ids=tuple(d.note_id for d in documents),
+            vectors=vectors,
+            payloads=tuple(
+                VectorPayload(user_id=d.user_id, project_id=d.project_id, type=d.type)
+                for d in documents
+            ),
+        )
+        check_batch(vector_batch, self._dimension)
+        points = _points(vector_batch)
+        for point, document in zip(points, documents, strict=True):
+            point["payload"]["version"] = document.version
+        await self._put_points(self._collection, points)
+
+    async def _versions(self, collection: str, ids: Sequence[uuid.UUID]) -> dict[uuid.UUID, int]:
+        """Versión guardada en el payload de los puntos indicados que existen."""
+        if not ids:
+            return {}
+        result = await self._call(
+            "POST",
+            self._path("points", collection=collection),
+            {"ids": [str(point_id) for point_id in ids], "with_payload": ["version"]},
+        )
+        return {
+            uuid.UUID(point["id"]): int(point["payload"].get("version", 0)) for point in result
+        }
@@ -0,0 +1,70 @@
+"""
+Aplicación FastAPI que expone los casos de uso bajo `/api`.
+
+`create_app()` no abre conexiones: los engines se crean con la primera petición que los
+necesita (ver `database.py`). Al arrancar se lanzan los chequeos de salud de las réplicas, si
+las hay, y al apagar se cierran los engines del proceso. `/metrics` sirve las métricas de
+`infrastructure/monitoring` en el mismo puerto que la API.
+"""
+
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Response
+from fastapi.middleware.cors import CORSMiddleware
+
+from src.pkm_app.infrastructure.config.settings import Settings, get_settings
+from src.pkm_app.infrastructure.monitoring import collectors  # noqa: F401 (registra las métricas)
+from src.pkm_app.infrastructure.monitoring.metrics import CONTENT_TYPE, REGISTRY
+from src.pkm_app.infrastructure.persistence.sqlalchemy.database import (
+    dispose_engines,
+    get_replica_router,
+)
+from src.pkm_app.infrastructure.web.api.errors import register_error_handlers
+from src.pkm_app.infrastructure.web.api.responses import ORJSONResponse
+from src.pkm_app.infrastructure.web.api.routers import (
+    changes,
+    context,
+    keywords,
+    note_links,
+    notes,
+    projects,
+    sources,
+)
+
+API_PREFIX = "/api"
+
+
+def create_app(settings: Settings | None = None) -> FastAPI:
+    settings = settings or get_settings()
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+        if settings.DB_REPLICA_URLS and (router := get_replica_router()):
+            router.start_health_checks(settings.DB_REPLICA_HEALTH_CHECK_INTERVAL_SECONDS)
+        try:
+            yield
+        finally:
+            await dispose_engines()
+
+    app = FastAPI(
+        title="Kairos BCP API",
+        default_response_class=ORJSONResponse,
+        lifespan=lifespan,
+    )
+    if settings.API_CORS_ORIGINS:
+        app.add_middleware(
+            CORSMiddleware,
+            allow_origins=settings.API_CORS_ORIGINS,
+            allow_methods=["*"],
+            allow_headers=["*"],
+        )
+    register_error_handlers(app)
+    for module in (notes, projects, sources, keywords, note_links, changes, context):
+        app.include_router(module.router, prefix=API_PREFIX)
+
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics() -> Response:
+        return Response(REGISTRY.render(), media_type=CONTENT_TYPE)
+
+    return app
@@ -0,0 +1,102 @@
+"""
+Dependencias de FastAPI: usuario de la petición y unidades de trabajo.
+
+Cada petición recibe una sesión de los pools compartidos de `database.py` (escritura) o del
+router de réplicas/engine de solo lectura (lecturas) y la envuelve en su unidad de trabajo;
+la conexión vuelve al pool al cerrar la sesión, al terminar la petición. FastAPI resuelve
+cada dependencia una vez por petición, así que el repositorio de proyectos comparte la
+sesión con la unidad de trabajo.
+"""
+
+from collections.abc import AsyncGenerator
+from typing import Annotated
+
+from fastapi import Depends, Header, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.pkm_app.core.application.interfaces.project_interface import IProjectRepository
+from src.pkm_app.core.application.interfaces.unit_of_work_interface import (
+    IReadOnlyUnitOfWork,
+    IUnitOfWork,
+)
+from src.pkm_app.infrastructure.persistence.sqlalchemy.database import (
+    get_async_db_session,
+    get_async_readonly_sessionmaker,
+    get_replica_router,
+)
+from src.pkm_app.infrastructure.persistence.sqlalchemy.repositories.project_repository import (
+    SQLAlchemyProjectRepository,
+)
+from src.pkm_app.infrastructure.persistence.sqlalchemy.unit_of_work import (
+    SQLAlchemyReadOnlyUnitOfWork,
+    SQLAlchemyUnitOfWork,
+)
+
+
+async def current_user_id(x_user_id: Annotated[str | None, Header()] = None) -> str:
+    """
+    Usuario de la petición, tomado de la cabecera `X-User-ID`. La aplicación no gestiona
+    la autenticación: la cabecera la fija el frontend o el proxy que autentica.
+    """
+    if not x_user_id:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED, detail="Falta la cabecera X-User-ID."
+        )
+    return x_user_id
+
+
+UserId = Annotated[str, Depends(current_user_id)]
+
+
+def known_version(if_none_match: Annotated[str | None, Header()] = None) -> str | None:
+    """Versión que el cliente ya tiene (cabecera `If-None-Match`, sin `W/` ni comillas)."""
+    if not if_none_match:
+        return None
+    return if_none_match.strip().removeprefix("W/").strip('"') or None
+
+
+KnownVersion = Annotated[str | None, Depends(known_version)]
+
+# Versión (`version` de la respuesta) sobre la que el cliente hizo su edición: si ya no es la
+# actual, el PATCH responde 409 en lugar de pisar el cambio de otro dispositivo
+ExpectedVersion = Annotated[int | None, Query(ge=1)]
+
+
+async def get_read_session(user_id: UserId) -> AsyncGenerator[AsyncSession]:
+    """Sesión de lectura: réplica elegida por el router o engine de solo lectura."""
+    router = get_replica_router()
+    session_factory = (
+        router.read_sessionmaker(user_id) if router else get_async_readonly_sessionmaker()
+    )
+    async with session_factory() as session:
+        yield session
+
+
+def get_unit_of_work(
+    session: Annotated[AsyncSession, Depends(get_async_db_session)], user_id: UserId
+) -> IUnitOfWork:
+    return SQLAlchemyUnitOfWork(session, router=get_replica_router(), user_id=user_id)
+
+
+def get_read_unit_of_work(
+    session: Annotated[AsyncSession, Depends(get_read_session)],
+) -> IReadOnlyUnitOfWork:
+    return SQLAlchemyReadOnlyUnitOfWork(session)
+
+
+def get_project_repository(
+    session: Annotated[AsyncSession, Depends(get_async_db_session)],
+) -> IProjectRepository:
+    return SQLAlchemyProjectRepository(session)
+
+
+def get_read_project_repository(
+    session: Annotated[AsyncSession, Depends(get_read_session)],
+) -> IProjectRepository:
+    return SQLAlchemyProjectRepository(session)
+
+
+UnitOfWork = Annotated[IUnitOfWork, Depends(get_unit_of_work)]
+ReadUnitOfWork = Annotated[IReadOnlyUnitOfWork, Depends(get_read_unit_of_work)]
+ProjectRepository = Annotated[IProjectRepository, Depends(get_project_repository)]
+ReadProjectRepository = Annotated[IProjectRepository, Depends(get_read_project_repository)]
@@ -0,0 +1,86 @@
+"""
+Traducción de los errores de dominio a respuestas HTTP.
+
+El cuerpo sigue la interfaz `ApiError` del frontend: `{message, status, code, details}`, donde
+`code` es el nombre de la excepción y `details` su contexto.
+"""
+
+import logging
+from typing import Any
+
+from fastapi import FastAPI, Request
+
+from src.pkm_app.core.domain.errors import (
+    BusinessRuleViolationError,
+    ConcurrencyError,
+    DomainError,
+    DuplicateEntityError,
+    PermissionDeniedError,
+    RepositoryError,
+    ResourceNotFoundError,
+    ValidationError,
+)
+from src.pkm_app.infrastructure.web.api.responses import ORJSONResponse
+
+logger = logging.getLogger(__name__)
+
+# El primer tipo que coincide decide el código; el resto de DomainError son 400
+_STATUS_CODES: tuple[tuple[type[DomainError], int], ...] = (
+    (ResourceNotFoundError, 404),
+    (PermissionDeniedError, 403),
+    (DuplicateEntityError, 409),
+    (ConcurrencyError, 409),
+    (ValidationError, 422),
+    (BusinessRuleViolationError, 422),
+    (RepositoryError, 500),
+)
+
+
+def _unwrap(error: DomainError) -> DomainError:
+    """
+    Algunos casos de uso (ej. `GetProjectUseCase`) envuelven cualquier error en un
+    RepositoryError; se responde con el error de dominio original si lo hay.
+    """
+    while isinstance(error, RepositoryError) and isinstance(error.__cause__, DomainError):
+        error = error.__cause__
+    return error
+
+
+def status_code_for(error: DomainError) -> int:
+    for error_type, status_code in _STATUS_CODES:
+        if isinstance(error, error_type):
+            return status_code
+    return 400
+
+
+def _json_safe(value: Any) -> Any:
+    if value is None or isinstance(value, str | int | float | bool):
+        return value
+    if isinstance(value, dict):
+        return {str(key): _json_safe(item) for key, item in value.items()}
+    if isinstance(value, list | tuple | set):
+        return [_json_safe(item) for item in value]
+    return str(value)
+
+
+async def domain_error_handler(request: Request, exc: Exception) -> ORJSONResponse:
+    assert isinstance(exc, DomainError)
+    error = _unwrap(exc)
+    status_code = status_code_for(error)
+    if status_code >= 500:
+        logger.error(
+            "Error no recuperable en %s %s", request.method, request.url.path, exc_info=exc
+        )
+    return ORJSONResponse(
+        {
+            "message": error.message,
+            "status": status_code,
+            "code": type(error).__name__,
+            "details": _json_safe(error.context),
+        },
+        status_code=status_code,
+    )
+
+
+def register_error_handlers(app: FastAPI) -> None:
+    app.add_exception_handler(DomainError, domain_error_handler)
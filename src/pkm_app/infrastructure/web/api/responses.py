@@ -0,0 +1,89 @@
+"""
+Serialización de las respuestas de la API con orjson.
+
+Los endpoints devuelven directamente `ORJSONResponse` (o `StreamingResponse` en los listados)
+en lugar del DTO: así FastAPI no pasa el resultado por `jsonable_encoder`, que es la parte más
+cara de la respuesta. `response_model` se sigue declarando en cada ruta para la documentación
+OpenAPI. Los DTOs se vuelcan con `model_dump()` y orjson serializa UUID y datetime de forma
+nativa.
+"""
+
+import uuid
+from collections.abc import AsyncIterator, Iterable
+from typing import Any
+
+import orjson
+from fastapi import Response, status
+from fastapi.responses import ORJSONResponse as _ORJSONResponse
+from fastapi.responses import StreamingResponse
+from pydantic import AnyUrl, BaseModel
+
+JSON_MEDIA_TYPE = "application/json"
+
+# Elementos serializados por bloque enviado en los listados
+STREAM_CHUNK_SIZE = 100
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+    if isinstance(value, uuid.UUID):
+        # orjson solo serializa uuid.UUID exacto; asyncpg devuelve su propia subclase
+        return str(value)
+    if isinstance(value, AnyUrl):
+        # `url` de las fuentes (y de la fuente anidada en las notas)
+        return str(value)
+    raise TypeError(f"Tipo no serializable a JSON: {type(value).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    # OPT_UTC_Z: fechas UTC con "Z", igual que las serializa pydantic
+    return orjson.dumps(
+        content, default=_default, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+    )
+
+
+class ORJSONResponse(_ORJSONResponse):
+    """`ORJSONResponse` de FastAPI que además acepta modelos pydantic."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+async def _json_array_chunks(
+    items: Iterable[Any], chunk_size: int = STREAM_CHUNK_SIZE
+) -> AsyncIterator[bytes]:
+    yield b"["
+    chunk: list[bytes] = []
+    first = True
+    for item in items:
+        chunk.append(dumps(item))
+        if len(chunk) == chunk_size:
+            yield (b"" if first else b",") + b",".join(chunk)
+            first = False
+            chunk = []
+    if chunk:
+        yield (b"" if first else b",") + b",".join(chunk)
+    yield b"]"
+
+
+def stream_json_array(
+    items: Iterable[Any], status_code: int = 200, headers: dict[str, str] | None = None
+) -> StreamingResponse:
+    """Array JSON enviado por bloques: cada bloque se serializa justo antes de enviarse."""
+    return StreamingResponse(
+        _json_array_chunks(items),
+        status_code=status_code,
+        headers=headers,
+        media_type=JSON_MEDIA_TYPE,
+    )
+
+
+def etag_headers(version: str) -> dict[str, str]:
+    """Cabecera `ETag` con la versión de una lectura condicional."""
+    return {"ETag": f'"{version}"'}
+
+
+def not_modified(version: str) -> Response:
+    """304 sin cuerpo para un cliente cuya versión sigue vigente."""
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=etag_headers(version))
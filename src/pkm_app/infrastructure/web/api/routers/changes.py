@@ -0,0 +1,26 @@
+"""Feed de cambios (`/changes`) para la sincronización incremental de clientes."""
+
+from fastapi import APIRouter, Query
+
+from src.pkm_app.core.application.dtos import ChangeFeedPage
+from src.pkm_app.core.application.use_cases.change_feed.get_changes_since_use_case import (
+    GetChangesSinceUseCase,
+)
+from src.pkm_app.infrastructure.web.api.dependencies import UnitOfWork, UserId
+from src.pkm_app.infrastructure.web.api.responses import ORJSONResponse
+
+router = APIRouter(prefix="/changes", tags=["changes"])
+
+
+# Usa la unidad de trabajo de escritura: la lectura numera los cambios pendientes
+@router.get("", response_model=ChangeFeedPage)
+async def get_changes(
+    user_id: UserId,
+    uow: UnitOfWork,
+    cursor: int = Query(0, ge=0),
+    limit: int = Query(
+        GetChangesSinceUseCase.DEFAULT_LIMIT, ge=1, le=GetChangesSinceUseCase.MAX_LIMIT
+    ),
+) -> ORJSONResponse:
+    page = await GetChangesSinceUseCase(uow).execute(user_id=user_id, cursor=cursor, limit=limit)
+    return ORJSONResponse(page)
@@ -0,0 +1,34 @@
+"""Contexto del asistente (`/context`): notas, proyectos y perfil en un presupuesto de tokens."""
+
+import uuid
+
+from fastapi import APIRouter, Query
+
+from src.pkm_app.core.application.dtos import AssembledContext
+from src.pkm_app.core.application.use_cases.assistant_context.assemble_context_use_case import (
+    AssembleContextUseCase,
+    ContextMemo,
+)
+from src.pkm_app.infrastructure.web.api.dependencies import UnitOfWork, UserId
+from src.pkm_app.infrastructure.web.api.responses import ORJSONResponse
+
+router = APIRouter(prefix="/context", tags=["context"])
+
+# Compartida por las peticiones del proceso; sus claves llevan la versión de los datos
+memo = ContextMemo()
+
+
+@router.get("", response_model=AssembledContext)
+async def assemble_context(
+    user_id: UserId,
+    uow: UnitOfWork,
+    q: str = Query("", max_length=1000),
+    max_tokens: int = Query(
+        AssembleContextUseCase.DEFAULT_MAX_TOKENS, ge=1, le=AssembleContextUseCase.MAX_MAX_TOKENS
+    ),
+    project_id: uuid.UUID | None = None,
+) -> ORJSONResponse:
+    context = await AssembleContextUseCase(uow, memo).execute(
+        user_id=user_id, query=q, max_tokens=max_tokens, project_id=project_id
+    )
+    return ORJSONResponse(context)
@@ -0,0 +1,84 @@
+"""Endpoints de palabras clave (`/keywords`)."""
+
+import uuid
+
+from fastapi import APIRouter, Query, Response, status
+from fastapi.responses import StreamingResponse
+
+from src.pkm_app.core.application.dtos import KeywordCreate, KeywordSchema, KeywordUpdate
+from src.pkm_app.core.application.use_cases.keyword.create_keyword_use_case import (
+    CreateKeywordUseCase,
+)
+from src.pkm_app.core.application.use_cases.keyword.delete_keyword_use_case import (
+    DeleteKeywordUseCase,
+)
+from src.pkm_app.core.application.use_cases.keyword.get_keyword_use_case import (
+    GetKeywordUseCase,
+)
+from src.pkm_app.core.application.use_cases.keyword.list_keywords_use_case import (
+    ListKeywordsUseCase,
+)
+from src.pkm_app.core.application.use_cases.keyword.update_keyword_use_case import (
+    UpdateKeywordUseCase,
+)
+from src.pkm_app.core.domain.errors import KeywordNotFoundError
+from src.pkm_app.infrastructure.web.api.dependencies import (
+    ExpectedVersion,
+    ReadUnitOfWork,
+    UnitOfWork,
+    UserId,
+)
+from src.pkm_app.infrastructure.web.api.responses import ORJSONResponse, stream_json_array
+
+router = APIRouter(prefix="/keywords", tags=["keywords"])
+
+
+@router.get("", response_model=list[KeywordSchema])
+async def list_keywords(
+    user_id: UserId,
+    uow: ReadUnitOfWork,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(ListKeywordsUseCase.DEFAULT_LIMIT, ge=1),
+) -> StreamingResponse:
+    keywords = await ListKeywordsUseCase(uow).execute(user_id=user_id, skip=skip, limit=limit)
+    return stream_json_array(keywords)
+
+
+@router.post("", response_model=KeywordSchema, status_code=status.HTTP_201_CREATED)
+async def create_keyword(
+    keyword_in: KeywordCreate, user_id: UserId, uow: UnitOfWork
+) -> ORJSONResponse:
+    keyword = await CreateKeywordUseCase(uow).execute(keyword_in=keyword_in, user_id=user_id)
+    return ORJSONResponse(keyword, status_code=status.HTTP_201_CREATED)
+
+
+@router.get("/{keyword_id}", response_model=KeywordSchema)
+async def get_keyword(
+    keyword_id: uuid.UUID, user_id: UserId, uow: ReadUnitOfWork
+) -> ORJSONResponse:
+    keyword = await GetKeywordUseCase(uow).execute(keyword_id=keyword_id, user_id=user_id)
+    return ORJSONResponse(keyword)
+
+
+@router.patch("/{keyword_id}", response_model=KeywordSchema)
+async def update_keyword(
+    keyword_id: uuid.UUID,
+    keyword_in: KeywordUpdate,
+    user_id: UserId,
+    uow: UnitOfWork,
+    expected_version: ExpectedVersion = None,
+) -> ORJSONResponse:
+    keyword = await UpdateKeywordUseCase(uow).execute(
+        keyword_id=keyword_id,
+        keyword_in=keyword_in,
+        user_id=user_id,
+        expected_version=expected_version,
+    )
+    return ORJSONResponse(keyword)
+
+
+@router.delete("/{keyword_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_keyword(keyword_id: uuid.UUID, user_id: UserId, uow: UnitOfWork) -> Response:
+    if not await DeleteKeywordUseCase(uow).execute(keyword_id=keyword_id, user_id=user_id):
+        raise KeywordNotFoundError("Palabra clave no encontrada.", keyword_id=keyword_id)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -0,0 +1,84 @@
+"""Endpoints de enlaces entre notas (`/note-links`)."""
+
+import uuid
+
+from fastapi import APIRouter, Query, Response, status
+from fastapi.responses import StreamingResponse
+
+from src.pkm_app.core.application.dtos import NoteLinkCreate, NoteLinkSchema, NoteLinkUpdate
+from src.pkm_app.core.application.use_cases.note_link.create_note_link_use_case import (
+    CreateNoteLinkUseCase,
+)
+from src.pkm_app.core.application.use_cases.note_link.delete_note_link_use_case import (
+    DeleteNoteLinkUseCase,
+)
+from src.pkm_app.core.application.use_cases.note_link.get_note_link_use_case import (
+    GetNoteLinkUseCase,
+)
+from src.pkm_app.core.application.use_cases.note_link.list_note_links_use_case import (
+    ListNoteLinksUseCase,
+)
+from src.pkm_app.core.application.use_cases.note_link.update_note_link_use_case import (
+    UpdateNoteLinkUseCase,
+)
+from src.pkm_app.core.domain.errors import NoteLinkNotFoundError
+from src.pkm_app.infrastructure.web.api.dependencies import ReadUnitOfWork, UnitOfWork, UserId
+from src.pkm_app.infrastructure.web.api.responses import ORJSONResponse, stream_json_array
+
+router = APIRouter(prefix="/note-links", tags=["note-links"])
+
+
+@router.get("", response_model=list[NoteLinkSchema])
+async def list_note_links(
+    user_id: UserId,
+    uow: ReadUnitOfWork,
+    source_note_id: uuid.UUID | None = None,
+    target_note_id: uuid.UUID | None = None,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(ListNoteLinksUseCase.DEFAULT_LIMIT, ge=1),
+) -> StreamingResponse:
+    note_links = await ListNoteLinksUseCase(uow).execute(
+        user_id=user_id,
+        source_note_id=source_note_id,
+        target_note_id=target_note_id,
+        skip=skip,
+        limit=limit,
+    )
+    return stream_json_array(note_links)
+
+
+@router.post("", response_model=NoteLinkSchema, status_code=status.HTTP_201_CREATED)
+async def create_note_link(
+    note_link_in: NoteLinkCreate, user_id: UserId, uow: UnitOfWork
+) -> ORJSONResponse:
+    note_link = await CreateNoteLinkUseCase(uow).execute(
+        note_link_in=note_link_in, user_id=user_id
+    )
+    return ORJSONResponse(note_link, status_code=status.HTTP_201_CREATED)
+
+
+@router.get("/{note_link_id}", response_model=NoteLinkSchema)
+async def get_note_link(
+    note_link_id: uuid.UUID, user_id: UserId, uow: ReadUnitOfWork
+) -> ORJSONResponse:
+    note_link = await GetNoteLinkUseCase(uow).execute(note_link_id=note_link_id, user_id=user_id)
+    return ORJSONResponse(note_link)
+
+
+@router.patch("/{note_link_id}", response_model=NoteLinkSchema)
+async def update_note_link(
+    note_link_id: uuid.UUID, note_link_in: NoteLinkUpdate, user_id: UserId, uow: UnitOfWork
+) -> ORJSONResponse:
+    note_link = await UpdateNoteLinkUseCase(uow).execute(
+        note_link_id=note_link_id, note_link_in=note_link_in, user_id=user_id
+    )
+    return ORJSONResponse(note_link)
+
+
+@router.delete("/{note_link_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_note_link(
+    note_link_id: uuid.UUID, user_id: UserId, uow: UnitOfWork
+) -> Response:
+    if not await DeleteNoteLinkUseCase(uow).execute(note_link_id=note_link_id, user_id=user_id):
+        raise NoteLinkNotFoundError("Enlace no encontrado.", link_id=note_link_id)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -0,0 +1,133 @@
+"""Endpoints de notas (`/notes`)."""
+
+import uuid
+
+from fastapi import APIRouter, Query, Response, status
+
+from src.pkm_app.core.application.dtos import (
+    DuplicateNoteGroup,
+    NearDuplicateCluster,
+    NoteCreate,
+    NoteSchema,
+    NoteUpdate,
+)
+from src.pkm_app.core.application.use_cases.near_duplicates.find_near_duplicates_use_case import (
+    FindNearDuplicatesUseCase,
+)
+from src.pkm_app.core.application.use_cases.note.create_note_use_case import CreateNoteUseCase
+from src.pkm_app.core.application.use_cases.note.delete_note_use_case import DeleteNoteUseCase
+from src.pkm_app.core.application.use_cases.note.find_duplicate_notes_use_case import (
+    FindDuplicateNotesUseCase,
+)
+from src.pkm_app.core.application.use_cases.note.get_note_use_case import GetNoteUseCase
+from src.pkm_app.core.application.use_cases.note.list_notes_use_case import ListNotesUseCase
+from src.pkm_app.core.application.use_cases.note.update_note_use_case import UpdateNoteUseCase
+from src.pkm_app.core.application.versioning import NotModified
+from src.pkm_app.core.domain.errors import NoteNotFoundError
+from src.pkm_app.infrastructure.web.api.dependencies import (
+    ExpectedVersion,
+    KnownVersion,
+    ReadUnitOfWork,
+    UnitOfWork,
+    UserId,
+)
+from src.pkm_app.infrastructure.web.api.responses import (
+    ORJSONResponse,
+    etag_headers,
+    not_modified,
+    stream_json_array,
+)
+
+router = APIRouter(prefix="/notes", tags=["notes"])
+
+
+@router.get("", response_model=list[NoteSchema])
+async def list_notes(
+    user_id: UserId,
+    uow: ReadUnitOfWork,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(ListNotesUseCase.DEFAULT_LIMIT, ge=1),
+    known_version: KnownVersion = None,
+) -> Response:
+    result = await ListNotesUseCase(uow).execute_if_modified(
+        user_id=user_id, known_version=known_version, skip=skip, limit=limit
+    )
+    if isinstance(result, NotModified):
+        return not_modified(result.version)
+    return stream_json_array(result.data, headers=etag_headers(result.version))
+
+
+@router.post("", response_model=NoteSchema, status_code=status.HTTP_201_CREATED)
+async def create_note(note_in: NoteCreate, user_id: UserId, uow: UnitOfWork) -> ORJSONResponse:
+    note = await CreateNoteUseCase(uow).execute(note_in=note_in, user_id=user_id)
+    return ORJSONResponse(note, status_code=status.HTTP_201_CREATED)
+
+
+# Antes de "/{note_id}": si no, "duplicates" se validaría como UUID
+@router.get("/duplicates", response_model=list[DuplicateNoteGroup])
+async def find_duplicate_notes(
+    user_id: UserId,
+    uow: ReadUnitOfWork,
+    limit: int = Query(FindDuplicateNotesUseCase.DEFAULT_LIMIT, ge=1),
+) -> ORJSONResponse:
+    groups = await FindDuplicateNotesUseCase(uow).execute(user_id=user_id, limit=limit)
+    return ORJSONResponse(groups)
+
+
+@router.get("/near-duplicates", response_model=list[NearDuplicateCluster])
+async def find_near_duplicates(
+    user_id: UserId,
+    uow: ReadUnitOfWork,
+    threshold: float = Query(FindNearDuplicatesUseCase.DEFAULT_THRESHOLD, gt=0, le=1),
+    limit: int = Query(FindNearDuplicatesUseCase.DEFAULT_LIMIT, ge=1),
+) -> ORJSONResponse:
+    clusters = await FindNearDuplicatesUseCase(uow).execute(
+        user_id=user_id, threshold=threshold, limit=limit
+    )
+    return ORJSONResponse(clusters)
+
+
+@router.get("/{note_id}/near-duplicates", response_model=list[NearDuplicateCluster])
+async def find_note_near_duplicates(
+    note_id: uuid.UUID,
+    user_id: UserId,
+    uow: ReadUnitOfWork,
+    threshold: float = Query(FindNearDuplicatesUseCase.DEFAULT_THRESHOLD, gt=0, le=1),
+) -> ORJSONResponse:
+    clusters = await FindNearDuplicatesUseCase(uow).execute(
+        user_id=user_id, note_id=note_id, threshold=threshold
+    )
+    return ORJSONResponse(clusters)
+
+
+@router.get("/{note_id}", response_model=NoteSchema)
+async def get_note(
+    note_id: uuid.UUID, user_id: UserId, uow: ReadUnitOfWork, known_version: KnownVersion = None
+) -> Response:
+    result = await GetNoteUseCase(uow).execute_if_modified(
+        note_id=note_id, user_id=user_id, known_version=known_version
+    )
+    if isinstance(result, NotModified):
+        return not_modified(result.version)
+    return ORJSONResponse(result.data, headers=etag_headers(result.version))
+
+
+@router.patch("/{note_id}", response_model=NoteSchema)
+async def update_note(
+    note_id: uuid.UUID,
+    note_in: NoteUpdate,
+    user_id: UserId,
+    uow: UnitOfWork,
+    expected_version: ExpectedVersion = None,
+) -> ORJSONResponse:
+    note = await UpdateNoteUseCase(uow).execute(
+        note_id=note_id, note_in=note_in, user_id=user_id, expected_version=expected_version
+    )
+    return ORJSONResponse(note)
+
+
+@router.delete("/{note_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_note(note_id: uuid.UUID, user_id: UserId, uow: UnitOfWork) -> Response:
+    if not await DeleteNoteUseCase(uow).execute(note_id=note_id, user_id=user_id):
+        raise NoteNotFoundError("Nota no encontrada.", note_id=note_id)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
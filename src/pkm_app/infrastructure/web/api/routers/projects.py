@@ -0,0 +1,134 @@
+"""Endpoints de proyectos (`/projects`) y de las notas de un proyecto."""
+
+import uuid
+
+from fastapi import APIRouter, Query, Response, status
+from fastapi.responses import StreamingResponse
+
+from src.pkm_app.core.application.dtos import (
+    NoteSchema,
+    ProjectCreate,
+    ProjectSchema,
+    ProjectUpdate,
+)
+from src.pkm_app.core.application.use_cases.note.search_notes_by_project_use_case import (
+    SearchNotesByProjectUseCase,
+)
+from src.pkm_app.core.application.use_cases.project.create_project_use_case import (
+    CreateProjectUseCase,
+)
+from src.pkm_app.core.application.use_cases.project.delete_project_use_case import (
+    DeleteProjectUseCase,
+)
+from src.pkm_app.core.application.use_cases.project.get_project_use_case import (
+    GetProjectUseCase,
+)
+from src.pkm_app.core.application.use_cases.project.list_projects_use_case import (
+    ListProjectsUseCase,
+)
+from src.pkm_app.core.application.use_cases.project.update_project_use_case import (
+    UpdateProjectUseCase,
+)
+from src.pkm_app.core.application.versioning import NotModified
+from src.pkm_app.core.domain.errors import ProjectNotFoundError
+from src.pkm_app.infrastructure.web.api.dependencies import (
+    ExpectedVersion,
+    KnownVersion,
+    ProjectRepository,
+    ReadProjectRepository,
+    ReadUnitOfWork,
+    UnitOfWork,
+    UserId,
+)
+from src.pkm_app.infrastructure.web.api.responses import (
+    ORJSONResponse,
+    etag_headers,
+    not_modified,
+    stream_json_array,
+)
+
+router = APIRouter(prefix="/projects", tags=["projects"])
+
+
+@router.get("", response_model=list[ProjectSchema])
+async def list_projects(
+    user_id: UserId,
+    repository: ReadProjectRepository,
+    uow: ReadUnitOfWork,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(ListProjectsUseCase.DEFAULT_LIMIT, ge=1),
+) -> StreamingResponse:
+    projects = await ListProjectsUseCase(repository, uow).execute(
+        user_id=user_id, skip=skip, limit=limit
+    )
+    return stream_json_array(projects)
+
+
+@router.post("", response_model=ProjectSchema, status_code=status.HTTP_201_CREATED)
+async def create_project(
+    project_in: ProjectCreate, user_id: UserId, uow: UnitOfWork
+) -> ORJSONResponse:
+    project = await CreateProjectUseCase(uow).execute(project_in=project_in, user_id=user_id)
+    return ORJSONResponse(project, status_code=status.HTTP_201_CREATED)
+
+
+@router.get("/{project_id}", response_model=ProjectSchema)
+async def get_project(
+    project_id: uuid.UUID, user_id: UserId, repository: ReadProjectRepository, uow: ReadUnitOfWork
+) -> ORJSONResponse:
+    project = await GetProjectUseCase(repository, uow).execute(
+        project_id=project_id, user_id=user_id
+    )
+    return ORJSONResponse(project)
+
+
+@router.get("/{project_id}/notes", response_model=list[NoteSchema])
+async def list_project_notes(
+    project_id: uuid.UUID,
+    user_id: UserId,
+    uow: ReadUnitOfWork,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(SearchNotesByProjectUseCase.DEFAULT_LIMIT, ge=1),
+    known_version: KnownVersion = None,
+) -> Response:
+    result = await SearchNotesByProjectUseCase(uow).execute_if_modified(
+        project_id=project_id,
+        user_id=user_id,
+        known_version=known_version,
+        skip=skip,
+        limit=limit,
+    )
+    if isinstance(result, NotModified):
+        return not_modified(result.version)
+    _, notes = result.data
+    return stream_json_array(notes, headers=etag_headers(result.version))
+
+
+@router.patch("/{project_id}", response_model=ProjectSchema)
+async def update_project(
+    project_id: uuid.UUID,
+    project_in: ProjectUpdate,
+    user_id: UserId,
+    repository: ProjectRepository,
+    uow: UnitOfWork,
+    expected_version: ExpectedVersion = None,
+) -> ORJSONResponse:
+    project = await UpdateProjectUseCase(repository, uow).execute(
+        project_id=project_id,
+        project_in=project_in,
+        user_id=user_id,
+        expected_version=expected_version,
+    )
+    return ORJSONResponse(project)
+
+
+@router.delete("/{project_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_project(
+    project_id: uuid.UUID, user_id: UserId, repository: ProjectRepository, uow: UnitOfWork
+) -> Response:
+    deleted = await DeleteProjectUseCase(repository, uow).execute(
+        project_id=project_id, user_id=user_id
+    )
+    if not deleted:
+        raise ProjectNotFoundError("Proyecto no encontrado.", project_id=project_id)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
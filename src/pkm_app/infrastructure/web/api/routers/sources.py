@@ -0,0 +1,82 @@
+"""Endpoints de fuentes (`/sources`)."""
+
+import uuid
+
+from fastapi import APIRouter, Query, Response, status
+from fastapi.responses import StreamingResponse
+
+from src.pkm_app.core.application.dtos import SourceCreate, SourceSchema, SourceUpdate
+from src.pkm_app.core.application.use_cases.source.create_source_use_case import (
+    CreateSourceUseCase,
+)
+from src.pkm_app.core.application.use_cases.source.delete_source_use_case import (
+    DeleteSourceUseCase,
+)
+from src.pkm_app.core.application.use_cases.source.get_source_use_case import GetSourceUseCase
+from src.pkm_app.core.application.use_cases.source.list_sources_use_case import (
+    ListSourcesUseCase,
+)
+from src.pkm_app.core.application.use_cases.source.update_source_use_case import (
+    UpdateSourceUseCase,
+)
+from src.pkm_app.core.domain.errors import SourceNotFoundError
+from src.pkm_app.infrastructure.web.api.dependencies import (
+    ExpectedVersion,
+    ReadUnitOfWork,
+    UnitOfWork,
+    UserId,
+)
+from src.pkm_app.infrastructure.web.api.responses import ORJSONResponse, stream_json_array
+
+router = APIRouter(prefix="/sources", tags=["sources"])
+
+
+@router.get("", response_model=list[SourceSchema])
+async def list_sources(
+    user_id: UserId,
+    uow: ReadUnitOfWork,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(ListSourcesUseCase.DEFAULT_LIMIT, ge=1),
+) -> StreamingResponse:
+    sources = await ListSourcesUseCase(uow).execute(user_id=user_id, skip=skip, limit=limit)
+    return stream_json_array(sources)
+
+
+@router.post("", response_model=SourceSchema, status_code=status.HTTP_201_CREATED)
+async def create_source(
+    source_in: SourceCreate, user_id: UserId, uow: UnitOfWork
+) -> ORJSONResponse:
+    source = await CreateSourceUseCase(uow).execute(source_in=source_in, user_id=user_id)
+    return ORJSONResponse(source, status_code=status.HTTP_201_CREATED)
+
+
+@router.get("/{source_id}", response_model=SourceSchema)
+async def get_source(
+    source_id: uuid.UUID, user_id: UserId, uow: ReadUnitOfWork
+) -> ORJSONResponse:
+    source = await GetSourceUseCase(uow).execute(source_id=source_id, user_id=user_id)
+    return ORJSONResponse(source)
+
+
+@router.patch("/{source_id}", response_model=SourceSchema)
+async def update_source(
+    source_id: uuid.UUID,
+    source_in: SourceUpdate,
+    user_id: UserId,
+    uow: UnitOfWork,
+    expected_version: ExpectedVersion = None,
+) -> ORJSONResponse:
+    source = await UpdateSourceUseCase(uow).execute(
+        source_id=source_id,
+        source_in=source_in,
+        user_id=user_id,
+        expected_version=expected_version,
+    )
+    return ORJSONResponse(source)
+
+
+@router.delete("/{source_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_source(source_id: uuid.UUID, user_id: UserId, uow: UnitOfWork) -> Response:
+    if not await DeleteSourceUseCase(uow).execute(source_id=source_id, user_id=user_id):
+        raise SourceNotFoundError("Fuente no encontrada.", source_id=source_id)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
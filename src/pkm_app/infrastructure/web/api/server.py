@@ -0,0 +1,100 @@
+"""
+Arranque de la API con uvicorn.
+
+La aplicación es asíncrona, así que basta un worker por CPU (no hace falta el `2 * CPU + 1`
+de los servidores síncronos). Cada worker es un proceso con sus propios pools: el de
+escritura, el de solo lectura y uno por réplica. El número de workers por defecto se limita
+para que todas sus conexiones al primario quepan en `API_DB_CONNECTION_BUDGET`. Con
+PgBouncer (`DB_PGBOUNCER_MODE`) las conexiones las reparte PgBouncer y no se limita.
+"""
+
+import logging
+import os
+from logging.handlers import QueueHandler
+from typing import Any
+
+from fastapi import FastAPI
+
+from src.pkm_app.infrastructure.config.settings import Settings, get_settings
+from src.pkm_app.infrastructure.monitoring.metrics import set_metrics_enabled
+from src.pkm_app.infrastructure.persistence.sqlalchemy.engine import resolve_engine_options
+
+logger = logging.getLogger(__name__)
+
+APP_FACTORY = "src.pkm_app.infrastructure.web.api.server:create_worker_app"
+
+# Pools contra el primario por worker: escritura y solo lectura
+PRIMARY_POOLS_PER_WORKER = 2
+
+
+def connections_per_worker(settings: Settings) -> int:
+    """Conexiones máximas que un worker puede abrir contra el primario."""
+    options = resolve_engine_options(settings)
+    return PRIMARY_POOLS_PER_WORKER * (options.pool_size + options.max_overflow)
+
+
+def resolve_workers(settings: Settings, cpu_count: int | None = None) -> int:
+    """`API_WORKERS` si está definido; si no, un worker por CPU dentro del presupuesto."""
+    if settings.API_WORKERS is not None:
+        if settings.API_WORKERS < 1:
+            raise ValueError("API_WORKERS debe ser al menos 1.")
+        return settings.API_WORKERS
+    workers = cpu_count or os.cpu_count() or 1
+    if settings.DB_PGBOUNCER_MODE:
+        return workers
+    per_worker = connections_per_worker(settings)
+    by_budget = max(1, settings.API_DB_CONNECTION_BUDGET // per_worker)
+    if by_budget < workers:
+        logger.warning(
+            "Se limitan los workers a %d (de %d CPU): cada uno abre hasta %d conexiones y el "
+            "presupuesto es API_DB_CONNECTION_BUDGET=%d.",
+            by_budget,
+            workers,
+            per_worker,
+            settings.API_DB_CONNECTION_BUDGET,
+        )
+    return min(workers, by_budget)
+
+
+def create_worker_app() -> FastAPI:
+    """
+    Fábrica que importa cada worker de uvicorn: los workers son procesos nuevos y no heredan
+    la configuración de logging ni de métricas del proceso principal. Con un solo worker se
+    ejecuta en el propio proceso principal, que ya tiene el logging configurado.
+    """
+    from src.pkm_app.infrastructure.web.api.app import create_app
+    from src.pkm_app.logging_config import configure_logging
+
+    settings = get_settings()
+    if not any(isinstance(h, QueueHandler) for h in logging.getLogger().handlers):
+        configure_logging()
+    set_metrics_enabled(settings.METRICS_ENABLED)
+    return create_app(settings)
+
+
+def uvicorn_options(settings: Settings) -> dict[str, Any]:
+    """Argumentos de `uvicorn.run` para la configuración dada."""
+    return {
+        "factory": True,
+        "host": settings.API_HOST,
+        "port": settings.API_PORT,
+        "workers": resolve_workers(settings),
+        # El logging de cada worker lo configura `create_worker_app` (logging_config)
+        "log_config": None,
+        "access_log": False,
+        "proxy_headers": True,
+        "timeout_keep_alive": 5,
+    }
+
+
+def run(settings: Settings | None = None) -> None:
+    import uvicorn
+
+    options = uvicorn_options(settings or get_settings())
+    logger.info(
+        "API en http://%s:%s/api con %d workers",
+        options["host"],
+        options["port"],
+        options["workers"],
+    )
+    uvicorn.run(APP_FACTORY, **options)
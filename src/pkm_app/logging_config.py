@@ -1,8 +1,36 @@
 # src/pkm_app/logging_config.py
+"""
+Configuración de logging de la aplicación.
+
+Los handlers de `LOGGING_CONFIG` no escriben desde el hilo que registra el log: `configure_logging`
+los coloca detrás de un único `QueueHandler` y un `QueueListener` los atiende en un hilo aparte.
+Así una consola o un fichero lentos no bloquean el bucle de eventos. Si la cola se llena, los
+registros se descartan (y se cuentan) en lugar de esperar.
+
+Variables de entorno:
+
+    LOG_LEVEL      nivel de los loggers de la aplicación (INFO por defecto)
+    LOG_FORMAT     "json" para emitir un objeto JSON por línea (texto por defecto)
+    LOG_SAMPLING   muestreo de los eventos DEBUG por logger, ej.
+                   "src.pkm_app.infrastructure=10,sqlalchemy=100" (1 de cada N)
+"""
+
+import atexit
+import copy
+import itertools
+import json
+import logging
 import logging.config
 import os
+import queue
+from datetime import UTC, datetime
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any
 
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()  # Permite configurar el nivel general desde .env
+LOG_FORMAT = os.getenv("LOG_FORMAT", "text").lower()
+LOG_SAMPLING = os.getenv("LOG_SAMPLING", "")
+LOG_QUEUE_SIZE = int(os.getenv("LOG_QUEUE_SIZE", "10000"))
 
 LOGGING_CONFIG = {
     "version": 1,
@@ -40,6 +68,11 @@ LOGGING_CONFIG = {
             "level": LOG_LEVEL,
             "propagate": False,  # Evita que los logs de 'pkm_app' se pasen al logger root si ya los manejaste
         },
+        "src.pkm_app": {  # Los módulos se importan como `src.pkm_app...`
+            "handlers": ["console"],
+            "level": LOG_LEVEL,
+            "propagate": False,
+        },
         "sqlalchemy": {  # Logger específico para SQLAlchemy
             "handlers": ["console"],
             # Nivel INFO para ver queries, DEBUG para queries + resultados de filas
@@ -68,11 +101,191 @@ LOGGING_CONFIG = {
 }
 
 
+# Atributos propios de LogRecord; el resto llega por `extra=` y se incluye en el JSON
+_RECORD_ATTRIBUTES = frozenset(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+
+class JsonFormatter(logging.Formatter):
+    """Un objeto JSON por registro, con los campos de `extra` al mismo nivel."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: dict[str, Any] = {
+            "timestamp": datetime.fromtimestamp(record.created, UTC).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "module": record.module,
+            "function": record.funcName,
+            "line": record.lineno,
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRIBUTES and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        if record.stack_info:
+            entry["stack"] = self.formatStack(record.stack_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class SamplingFilter(logging.Filter):
+    """Deja pasar 1 de cada N registros DEBUG (o inferiores) de los loggers indicados.
+
+    `rates` asocia un prefijo de logger con N; se aplica el prefijo más largo que coincida.
+    Los niveles INFO y superiores nunca se muestrean.
+    """
+
+    def __init__(self, rates: dict[str, int]) -> None:
+        super().__init__()
+        for name, rate in rates.items():
+            if rate < 1:
+                raise ValueError(f"La tasa de muestreo de '{name}' debe ser >= 1.")
+        self.rates = dict(rates)
+        self._rate_by_logger: dict[str, int] = {}
+        self._counters: dict[str, itertools.count[int]] = {}
+
+    def _rate(self, name: str) -> int:
+        rate = self._rate_by_logger.get(name)
+        if rate is None:
+            matches = [
+                prefix
+                for prefix in self.rates
+                if name == prefix or name.startswith(prefix + ".")
+            ]
+            rate = self.rates[max(matches, key=len)] if matches else 1
+            self._rate_by_logger[name] = rate
+        return rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.DEBUG:
+            return True
+        rate = self._rate(record.name)
+        if rate == 1:
+            return True
+        counter = self._counters.setdefault(record.name, itertools.count())
+        # next() sobre itertools.count es atómico bajo el GIL
+        return next(counter) % rate == 0
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """QueueHandler que nunca espera: con la cola llena descarta el registro y lo cuenta."""
+
+    def __init__(self, log_queue: "queue.Queue[logging.LogRecord]") -> None:
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Solo se resuelve el mensaje (los argumentos pueden cambiar después); fecha, formato
+        # y JSON se calculan en el hilo del listener. Sobre una copia, como QueueHandler: el
+        # registro original lo siguen recibiendo los demás handlers
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+_listener: QueueListener | None = None
+_queue_handler: NonBlockingQueueHandler | None = None
+
+
+def parse_sampling(spec: str) -> dict[str, int]:
+    """Convierte "logger=N,otro=M" en {"logger": N, "otro": M}."""
+    rates: dict[str, int] = {}
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        name, separator, rate = item.partition("=")
+        if not separator or not name.strip() or not rate.strip().isdigit():
+            raise ValueError(f"Entrada de LOG_SAMPLING no válida: '{item}'.")
+        rates[name.strip()] = int(rate)
+    return rates
+
+
+def _build_config(level: str, json_format: bool) -> dict[str, Any]:
+    config = copy.deepcopy(LOGGING_CONFIG)
+    if json_format:
+        config["formatters"]["json"] = {"()": JsonFormatter}
+        for handler in config["handlers"].values():
+            handler["formatter"] = "json"
+    config["handlers"]["console"]["level"] = level
+    for name in ("pkm_app", "src.pkm_app"):
+        config["loggers"][name]["level"] = level
+    return config
+
+
+def configure_logging(
+    level: str | None = None,
+    json_format: bool | None = None,
+    sampling: dict[str, int] | None = None,
+    queue_size: int | None = None,
+) -> NonBlockingQueueHandler:
+    """Aplica `LOGGING_CONFIG` con los handlers detrás de una cola atendida en segundo plano.
+
+    Los argumentos omitidos se toman de LOG_LEVEL, LOG_FORMAT, LOG_SAMPLING y LOG_QUEUE_SIZE.
+    Puede llamarse varias veces: cada llamada detiene el listener anterior.
+    Devuelve el handler de la cola (su atributo `dropped` cuenta los registros descartados).
+    """
+    global _listener, _queue_handler
+
+    level = (level or LOG_LEVEL).upper()
+    json_format = LOG_FORMAT == "json" if json_format is None else json_format
+    sampling = parse_sampling(LOG_SAMPLING) if sampling is None else sampling
+    queue_size = LOG_QUEUE_SIZE if queue_size is None else queue_size
+
+    shutdown_logging()
+    config = _build_config(level, json_format)
+    logging.config.dictConfig(config)
+
+    # Sustituir los handlers configurados por la cola; el listener escribe en ellos
+    loggers = [logging.getLogger(name) for name in config["loggers"]] + [logging.getLogger()]
+    handlers: list[logging.Handler] = []
+    for configured_logger in loggers:
+        handlers.extend(h for h in configured_logger.handlers if h not in handlers)
+
+    queue_handler = NonBlockingQueueHandler(queue.Queue(maxsize=queue_size))
+    if sampling:
+        queue_handler.addFilter(SamplingFilter(sampling))
+    for configured_logger in loggers:
+        if configured_logger.handlers:
+            configured_logger.handlers = [queue_handler]
+
+    _listener = QueueListener(queue_handler.queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    _queue_handler = queue_handler
+    return queue_handler
+
+
+def shutdown_logging() -> None:
+    """Detiene el listener tras escribir los registros pendientes de la cola."""
+    global _listener, _queue_handler
+
+    if _queue_handler is not None and _queue_handler.dropped:
+        logging.getLogger(__name__).warning(
+            "Se descartaron %d registros de log por cola llena.", _queue_handler.dropped
+        )
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.flush()
+        _listener = None
+    _queue_handler = None
+
+
+atexit.register(shutdown_logging)
+
+
 def setup_logging() -> None:
     """Aplica la configuración de logging."""
-    logging.config.dictConfig(LOGGING_CONFIG)
-    # logger = logging.getLogger(__name__)
-    # logger.info("Sistema de logging configurado.")
+    configure_logging()
 
 
 # Si quieres que el logging se configure al importar este módulo:
@@ -119,7 +332,7 @@ logger = logging.getLogger(__name__)
 
 class MiServicio:
     def hacer_algo_importante(self, dato):
-        logger.debug(f"Recibido dato para procesar: {dato}")
+        logger.debug("Recibido dato para procesar: %s", dato)
         try:
             if dato is None:
                 logger.warning("El dato recibido es None, se procederá con valor por defecto.")
@@ -127,7 +340,7 @@ class MiServicio:
 
             # ... procesamiento ...
             resultado = f"Procesado: {dato}"
-            logger.info(f"Dato procesado exitosamente. Resultado: {resultado}")
+            logger.info("Dato procesado exitosamente. Resultado: %s", resultado)
             return resultado
         except Exception as e:
             logger.error(f"Ocurrió un error al procesar el dato '{dato}'. Error: {e}", exc_info=True)
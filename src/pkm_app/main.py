@@ -12,6 +12,11 @@ from pathlib import Path
 from pkm_app.infrastructure.config.settings import get_settings
 from pkm_app.logging_config import configure_logging
 
+# Mismo nombre de módulo que usan los repositorios y casos de uso (src.pkm_app...): el
+# registro de métricas que se exporta tiene que ser el que ellos alimentan
+from src.pkm_app.infrastructure.monitoring.metrics import set_metrics_enabled
+from src.pkm_app.infrastructure.monitoring.server import start_metrics_server
+
 
 def setup_application() -> None:
     """
@@ -33,6 +38,10 @@ def setup_application() -> None:
         # Validate critical paths and dependencies
         if not settings.DATABASE_URL:
             raise ValueError("DATABASE_URL is required but not configured")
+
+        set_metrics_enabled(settings.METRICS_ENABLED)
+        if settings.METRICS_PORT:
+            start_metrics_server(settings.METRICS_PORT)
             
         logger.info("Application setup completed successfully")
         
@@ -72,20 +81,57 @@ def run_streamlit_ui() -> None:
         sys.exit(1)
 
 
+def run_api() -> None:
+    """
+    Launch the FastAPI server (see infrastructure/web/api).
+
+    Host, port and worker count come from the API_* settings.
+    """
+    logger = logging.getLogger(__name__)
+    logger.info("Starting API server...")
+
+    try:
+        from src.pkm_app.infrastructure.web.api.server import run
+
+        run()
+    except Exception as e:
+        logger.error(f"Failed to start API server: {e}")
+        sys.exit(1)
+
+
+def run_relay() -> None:
+    """
+    Launch the outbox relay that keeps Qdrant in sync with PostgreSQL
+    (see infrastructure/outbox/runner.py). Run a single relay per collection.
+    """
+    logger = logging.getLogger(__name__)
+    logger.info("Starting outbox relay...")
+
+    try:
+        from src.pkm_app.infrastructure.outbox.runner import run
+
+        run()
+    except Exception as e:
+        logger.error(f"Failed to run outbox relay: {e}")
+        sys.exit(1)
+
+
 def main() -> None:
     """
     Main entry point for the application.
     
-    Sets up the application and launches the default interface.
+    Sets up the application and launches the requested interface:
+    `api` for the FastAPI server, `relay` for the outbox relay, the Streamlit UI otherwise.
     """
     setup_application()
     
-    # For now, default to Streamlit UI
-    # In the future, this could support different interfaces:
-    # - FastAPI server
-    # - CLI interface
-    # - etc.
-    run_streamlit_ui()
+    # In the future, this could support more interfaces (e.g. a CLI)
+    if len(sys.argv) > 1 and sys.argv[1] == "api":
+        run_api()
+    elif len(sys.argv) > 1 and sys.argv[1] == "relay":
+        run_relay()
+    else:
+        run_streamlit_ui()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,149 @@
+# src/pkm_app/tests/benchmarks/conftest.py
+"""
+Fixtures comunes para los benchmarks contra PostgreSQL.
+
+Los benchmarks necesitan una base de datos real (la configurada con DB_USER, DB_HOST, ...)
+con las migraciones aplicadas, por lo que no se ejecutan por defecto. Para lanzarlos:
+
+    RUN_BENCHMARKS=1 pytest src/pkm_app/tests/benchmarks -s
+
+Cada benchmark trabaja dentro de una transacción que se revierte al final, así que los
+datos sembrados no quedan en la base de datos.
+
+Los casos registrados en `bench_report` se guardan al terminar la sesión en BENCH_RESULTS
+(por defecto `bench-results/<fecha>.json`). Si se indica BENCH_BASELINE (un JSON anterior),
+la sesión falla cuando algún caso empeora más de BENCH_REGRESSION_THRESHOLD (0.2 = 20 %) en
+BENCH_REGRESSION_METRIC (p95_ms por defecto).
+"""
+
+import os
+import uuid
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession
+
+from src.pkm_app.infrastructure.config.settings import get_settings
+from src.pkm_app.infrastructure.persistence.sqlalchemy.database import get_async_database_url
+from src.pkm_app.infrastructure.persistence.sqlalchemy.engine import create_async_db_engine
+from src.pkm_app.tests.benchmarks.report import (
+    DEFAULT_METRIC,
+    DEFAULT_THRESHOLD,
+    BenchmarkReport,
+    compare,
+)
+
+RUN_BENCHMARKS = os.getenv("RUN_BENCHMARKS") == "1"
+
+_REPORT = BenchmarkReport()
+
+
+def pytest_runtest_setup(item: pytest.Item) -> None:
+    if not RUN_BENCHMARKS:
+        pytest.skip("Benchmarks desactivados. Usa RUN_BENCHMARKS=1 para ejecutarlos.")
+
+
+def pytest_sessionfinish(session: pytest.Session, exitstatus: int) -> None:
+    if not _REPORT.cases:
+        return
+    default_path = f"bench-results/{datetime.now(UTC):%Y%m%dT%H%M%S}.json"
+    path = _REPORT.write(os.getenv("BENCH_RESULTS", default_path))
+    reporter = session.config.pluginmanager.get_plugin("terminalreporter")
+    write = reporter.write_line if reporter else print
+    write(f"Resultados de benchmarks guardados en {path}")
+
+    if baseline_path := os.getenv("BENCH_BASELINE"):
+        regressions = compare(
+            BenchmarkReport.load(baseline_path),
+            _REPORT,
+            float(os.getenv("BENCH_REGRESSION_THRESHOLD", str(DEFAULT_THRESHOLD))),
+            os.getenv("BENCH_REGRESSION_METRIC", DEFAULT_METRIC),
+        )
+        for regression in regressions:
+            write(f"REGRESIÓN {regression}")
+        if regressions:
+            session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+
+@pytest.fixture(scope="session")
+def bench_report() -> BenchmarkReport:
+    """Informe de la sesión: los benchmarks añaden sus casos con `bench_report.add(...)`."""
+    return _REPORT
+
+
+@pytest_asyncio.fixture
+async def bench_engine() -> AsyncIterator[AsyncEngine]:
+    engine = create_async_db_engine(get_async_database_url(), get_settings())
+    yield engine
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def bench_connection(bench_engine: AsyncEngine) -> AsyncIterator[AsyncConnection]:
+    """Conexión dentro de una transacción que se revierte al terminar el benchmark."""
+    async with bench_engine.connect() as connection:
+        transaction = await connection.begin()
+        try:
+            yield connection
+        finally:
+            await transaction.rollback()
+
+
+@pytest_asyncio.fixture
+async def bench_session(bench_connection: AsyncConnection) -> AsyncIterator[AsyncSession]:
+    """Sesión ORM ligada a la transacción del benchmark (los commits crean savepoints)."""
+    session = AsyncSession(
+        bind=bench_connection,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
+    )
+    try:
+        yield session
+    finally:
+        await session.close()
+
+
+@pytest_asyncio.fixture
+async def bench_user_id(bench_connection: AsyncConnection) -> str:
+    user_id = f"bench_user_{uuid.uuid4()}"
+    await bench_connection.execute(
+        text("INSERT INTO user_profiles (user_id, name) VALUES (:user_id, 'Benchmark user')"),
+        {"user_id": user_id},
+    )
+    return user_id
+
+
+@pytest_asyncio.fixture
+async def committed_note() -> AsyncIterator[tuple[str, uuid.UUID]]:
+    """Usuario y nota confirmados (visibles desde cualquier conexión); se borran al final."""
+    engine = create_async_db_engine(get_async_database_url(), get_settings())
+    user_id = f"bench_user_{uuid.uuid4()}"
+    note_id = uuid.uuid4()
+    async with engine.begin() as connection:
+        await connection.execute(
+            text("INSERT INTO user_profiles (user_id, name) VALUES (:user_id, 'Benchmark user')"),
+            {"user_id": user_id},
+        )
+        await connection.execute(
+            text(
+                "INSERT INTO notes (id, user_id, content) "
+                "VALUES (:id, :user_id, 'Benchmark note')"
+            ),
+            {"id": note_id, "user_id": user_id},
+        )
+    try:
+        yield user_id, note_id
+    finally:
+        async with engine.begin() as connection:
+            await connection.execute(text("DELETE FROM notes WHERE user_id = :u"), {"u": user_id})
+            await connection.execute(
+                text("DELETE FROM user_profiles WHERE user_id = :u"), {"u": user_id}
+            )
+            # Las lápidas que acaban de dejar los borrados
+            await connection.execute(
+                text("DELETE FROM change_log WHERE user_id = :u"), {"u": user_id}
+            )
+        await engine.dispose()
@@ -0,0 +1,176 @@
+# src/pkm_app/tests/benchmarks/report.py
+"""
+Resultados de los benchmarks en JSON y comparación entre ejecuciones.
+
+Cada caso guarda percentiles de latencia (ms) y rendimiento (operaciones por segundo). Para
+comparar una ejecución con otra de referencia:
+
+    python -m src.pkm_app.tests.benchmarks.report baseline.json current.json --threshold 0.2
+
+El comando termina con código 1 si algún caso empeora más que el umbral en la métrica
+elegida (p95 por defecto). Con BENCH_BASELINE, la propia sesión de pytest hace esa comparación
+al terminar (ver conftest.py).
+"""
+
+import argparse
+import json
+import math
+import platform
+import statistics
+import sys
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+# Métricas en las que un valor mayor es peor
+LATENCY_METRICS = ("p50_ms", "p90_ms", "p95_ms", "p99_ms", "mean_ms")
+DEFAULT_METRIC = "p95_ms"
+DEFAULT_THRESHOLD = 0.2
+
+
+def percentile(samples: list[float], q: float) -> float:
+    """Percentil `q` (0-100) con interpolación lineal entre muestras ordenadas."""
+    ordered = sorted(samples)
+    position = (len(ordered) - 1) * q / 100
+    low, high = math.floor(position), math.ceil(position)
+    return ordered[low] + (ordered[high] - ordered[low]) * (position - low)
+
+
+@dataclass(frozen=True)
+class CaseResult:
+    name: str
+    samples: int
+    p50_ms: float
+    p90_ms: float
+    p95_ms: float
+    p99_ms: float
+    mean_ms: float
+    throughput_ops: float
+
+    @classmethod
+    def from_timings(cls, name: str, timings_ms: list[float]) -> "CaseResult":
+        if not timings_ms:
+            raise ValueError(f"El caso '{name}' no tiene mediciones.")
+        return cls(
+            name=name,
+            samples=len(timings_ms),
+            p50_ms=percentile(timings_ms, 50),
+            p90_ms=percentile(timings_ms, 90),
+            p95_ms=percentile(timings_ms, 95),
+            p99_ms=percentile(timings_ms, 99),
+            mean_ms=statistics.fmean(timings_ms),
+            throughput_ops=1000 * len(timings_ms) / sum(timings_ms),
+        )
+
+
+@dataclass
+class BenchmarkReport:
+    """Resultados de una ejecución de la suite, serializables a JSON."""
+
+    metadata: dict[str, Any] = field(default_factory=dict)
+    cases: dict[str, CaseResult] = field(default_factory=dict)
+
+    def add(self, name: str, timings_ms: list[float]) -> CaseResult:
+        result = CaseResult.from_timings(name, timings_ms)
+        self.cases[name] = result
+        return result
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "metadata": {
+                "created_at": datetime.now(UTC).isoformat(),
+                "python": platform.python_version(),
+                "machine": platform.node(),
+                **self.metadata,
+            },
+            "cases": {name: asdict(case) for name, case in sorted(self.cases.items())},
+        }
+
+    def write(self, path: str | Path) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict(), indent=2, ensure_ascii=False), encoding="utf-8")
+        return path
+
+    @classmethod
+    def load(cls, path: str | Path) -> "BenchmarkReport":
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        return cls(
+            metadata=data.get("metadata", {}),
+            cases={name: CaseResult(**case) for name, case in data["cases"].items()},
+        )
+
+
+@dataclass(frozen=True)
+class Regression:
+    name: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def change(self) -> float:
+        return self.current / self.baseline - 1 if self.baseline else math.inf
+
+    def __str__(self) -> str:
+        return (
+            f"{self.name}: {self.metric} {self.baseline:.3f} -> {self.current:.3f} "
+            f"({self.change:+.0%})"
+        )
+
+
+def compare(
+    baseline: BenchmarkReport,
+    current: BenchmarkReport,
+    threshold: float = DEFAULT_THRESHOLD,
+    metric: str = DEFAULT_METRIC,
+) -> list[Regression]:
+    """
+    Casos comunes a ambas ejecuciones que empeoran más de `threshold` (0.2 = 20 %).
+    Para `throughput_ops` empeorar es bajar; para las latencias, subir.
+    """
+    if metric not in (*LATENCY_METRICS, "throughput_ops"):
+        raise ValueError(f"Métrica desconocida: '{metric}'.")
+    regressions = []
+    for name in sorted(baseline.cases.keys() & current.cases.keys()):
+        before = getattr(baseline.cases[name], metric)
+        after = getattr(current.cases[name], metric)
+        if metric == "throughput_ops":
+            worse = after < before * (1 - threshold)
+        else:
+            worse = after > before * (1 + threshold)
+        if worse:
+            regressions.append(Regression(name, metric, before, after))
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Compara dos ejecuciones de benchmarks.")
+    parser.add_argument("baseline", type=Path)
+    parser.add_argument("current", type=Path)
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument(
+        "--metric", default=DEFAULT_METRIC, choices=[*LATENCY_METRICS, "throughput_ops"]
+    )
+    args = parser.parse_args(argv)
+
+    baseline = BenchmarkReport.load(args.baseline)
+    current = BenchmarkReport.load(args.current)
+    regressions = compare(baseline, current, args.threshold, args.metric)
+    for name in sorted(baseline.cases.keys() & current.cases.keys()):
+        before = getattr(baseline.cases[name], args.metric)
+        after = getattr(current.cases[name], args.metric)
+        print(f"{name:60} {before:12.3f} {after:12.3f}")
+    for missing in sorted(baseline.cases.keys() - current.cases.keys()):
+        print(f"{missing:60} (no está en la ejecución actual)")
+    if regressions:
+        print(f"\n{len(regressions)} regresiones (umbral {args.threshold:.0%}):")
+        for regression in regressions:
+            print(f"  {regression}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,162 @@
+# src/pkm_app/tests/benchmarks/seed.py
+"""
+Siembra de un conjunto de datos de benchmark con volúmenes configurables.
+
+Todo se genera en PostgreSQL con `INSERT ... SELECT generate_series(...)`, sin viajar fila a
+fila desde Python. Los ids son deterministas (`md5(run:tipo:usuario:i)::uuid`), así que el
+benchmark puede calcular el id de cualquier fila sembrada sin consultarlo.
+
+Volúmenes (por variable de entorno, valores por usuario salvo BENCH_USERS):
+
+    BENCH_USERS, BENCH_PROJECTS, BENCH_SOURCES, BENCH_NOTES, BENCH_KEYWORDS,
+    BENCH_KEYWORDS_PER_NOTE, BENCH_LINKS
+"""
+
+import hashlib
+import os
+import uuid
+from dataclasses import dataclass, field
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+NOTE_TYPES = ("markdown", "text", "code", "mixed")
+SOURCE_TYPES = ("web", "book", "article", "video")
+LINK_TYPES = ("reference", "relates_to", "depends_on", "contradicts", "supports")
+
+
+@dataclass(frozen=True)
+class SeedVolumes:
+    users: int = 2
+    projects: int = 20
+    sources: int = 20
+    notes: int = 5000
+    keywords: int = 200
+    keywords_per_note: int = 3
+    links: int = 2000
+
+    @classmethod
+    def from_env(cls) -> "SeedVolumes":
+        defaults = cls()
+
+        def volume(name: str, default: int) -> int:
+            return int(os.getenv(f"BENCH_{name.upper()}", str(default)))
+
+        volumes = cls(
+            **{name: volume(name, getattr(defaults, name)) for name in cls.__dataclass_fields__}
+        )
+        if volumes.keywords_per_note > volumes.keywords:
+            raise ValueError("BENCH_KEYWORDS_PER_NOTE no puede superar BENCH_KEYWORDS.")
+        if volumes.notes < 2 or volumes.links > volumes.notes * (volumes.notes - 1):
+            raise ValueError("Se necesitan al menos 2 notas y como mucho n·(n-1) enlaces.")
+        return volumes
+
+    def as_dict(self) -> dict[str, int]:
+        return {name: getattr(self, name) for name in self.__dataclass_fields__}
+
+
+@dataclass(frozen=True)
+class SeededData:
+    """Identificadores del conjunto sembrado (los ids siguen `seeded_id`)."""
+
+    run: str
+    volumes: SeedVolumes
+    user_ids: list[str] = field(default_factory=list)
+
+    def id(self, kind: str, user: int, index: int) -> uuid.UUID:
+        return seeded_id(self.run, kind, self.user_ids[user], index)
+
+    def keyword_name(self, index: int) -> str:
+        return f"kw_{index}"
+
+
+def seeded_id(run: str, kind: str, user_id: str, index: int) -> uuid.UUID:
+    """Mismo valor que `md5(run || ':' || kind || ':' || user_id || ':' || index)::uuid`."""
+    return uuid.UUID(hashlib.md5(f"{run}:{kind}:{user_id}:{index}".encode()).hexdigest())
+
+
+def _sql_id(kind: str, index: str) -> str:
+    return f"md5(:run || ':{kind}:' || u.user_id || ':' || {index})::uuid"
+
+
+_SEED_STATEMENTS = [
+    """
+    INSERT INTO user_profiles (user_id, name, email)
+    SELECT :run || '_user_' || i, 'Benchmark user ' || i, :run || '_' || i || '@example.com'
+    FROM generate_series(1, :users) AS i
+    """,
+    f"""
+    INSERT INTO projects (id, user_id, name, description, parent_project_id)
+    SELECT {_sql_id("project", "i")}, u.user_id, 'Proyecto ' || i, 'Descripción ' || i,
+           CASE WHEN i > 5 THEN {_sql_id("project", "1 + i % 5")} END
+    FROM users u, generate_series(1, :projects) AS i
+    ORDER BY i
+    """,
+    f"""
+    INSERT INTO sources (id, user_id, type, title, url, link_metadata)
+    SELECT {_sql_id("source", "i")}, u.user_id,
+           (CAST(:source_types AS text[]))[1 + i % cardinality(CAST(:source_types AS text[]))],
+           'Fuente ' || i, 'https://bench.local/' || u.user_id || '/' || i,
+           jsonb_build_object('author', 'Autor ' || i % 10)
+    FROM users u, generate_series(1, :sources) AS i
+    """,
+    f"""
+    INSERT INTO keywords (id, user_id, name)
+    SELECT {_sql_id("keyword", "i")}, u.user_id, 'kw_' || i
+    FROM users u, generate_series(1, :keywords) AS i
+    """,
+    f"""
+    INSERT INTO notes (id, user_id, project_id, source_id, title, content, type, note_metadata,
+                       created_at, updated_at)
+    SELECT {_sql_id("note", "i")}, u.user_id,
+           CASE WHEN :projects > 0 AND i % 10 <> 0 THEN
+               {_sql_id("project", "1 + i % greatest(:projects, 1)")} END,
+           CASE WHEN :sources > 0 AND i % 4 = 0 THEN
+               {_sql_id("source", "1 + i % greatest(:sources, 1)")} END,
+           'Nota ' || i, 'Contenido de la nota ' || i || ' ' || repeat('texto ', 40),
+           (CAST(:note_types AS text[]))[1 + i % cardinality(CAST(:note_types AS text[]))],
+           jsonb_build_object('i', i, 'status', CASE WHEN i % 3 = 0 THEN 'draft' ELSE 'done' END),
+           now() - i * interval '1 minute', now() - i * interval '1 second'
+    FROM users u, generate_series(1, :notes) AS i
+    """,
+    f"""
+    INSERT INTO note_keywords (note_id, keyword_id)
+    SELECT {_sql_id("note", "i")}, {_sql_id("keyword", "1 + (i * 7 + j) % :keywords")}
+    FROM users u, generate_series(1, :notes) AS i, generate_series(0, :keywords_per_note - 1) AS j
+    """,
+    f"""
+    INSERT INTO note_links (id, user_id, source_note_id, target_note_id, link_type)
+    SELECT {_sql_id("link", "l")}, u.user_id,
+           {_sql_id("note", "1 + (l - 1) % :notes")},
+           {_sql_id("note", "1 + ((l - 1) % :notes + 1 + (l - 1) / :notes) % :notes")},
+           (CAST(:link_types AS text[]))[1 + l % cardinality(CAST(:link_types AS text[]))]
+    FROM users u, generate_series(1, :links) AS l
+    """,
+]
+
+
+async def seed(connection: AsyncConnection, volumes: SeedVolumes) -> SeededData:
+    """Siembra `volumes` en la transacción de `connection` y devuelve sus identificadores."""
+    run = f"bench_{uuid.uuid4().hex[:8]}"
+    params = {
+        "run": run,
+        "note_types": list(NOTE_TYPES),
+        "source_types": list(SOURCE_TYPES),
+        "link_types": list(LINK_TYPES),
+        **volumes.as_dict(),
+    }
+    users_cte = (
+        "WITH users AS (SELECT user_id FROM user_profiles WHERE user_id LIKE :run || '_user_%') "
+    )
+    for index, statement in enumerate(_SEED_STATEMENTS):
+        sql = statement if index == 0 else users_cte + statement
+        await connection.execute(text(sql), params)
+    # Los datos no están confirmados, así que autovacuum no puede analizarlos
+    await connection.execute(
+        text("ANALYZE user_profiles, projects, sources, keywords, notes, note_keywords, note_links")
+    )
+    return SeededData(
+        run=run,
+        volumes=volumes,
+        user_ids=[f"{run}_user_{i}" for i in range(1, volumes.users + 1)],
+    )
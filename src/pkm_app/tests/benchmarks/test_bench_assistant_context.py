@@ -0,0 +1,253 @@
+# src/pkm_app/tests/benchmarks/test_bench_assistant_context.py
+"""
+Benchmark del armado del contexto del asistente sobre NOTES notas de un usuario (con
+keywords, enlaces, proyectos y `learned_context`), con los datos confirmados y VACUUM:
+
+- Armado en frío: versión (cursor del feed y estado), candidatas y extractos, por consulta
+  distinta.
+- Memoria caliente: la misma consulta con los datos sin cambios (solo la sonda de versión).
+- Ingenuo: las mismas candidatas y el mismo orden, pero cada nota se lee entera con
+  `get_by_id` y se trunca en Python hasta llenar el presupuesto.
+- Sonda de versión sola (numeración del feed, estado y commit) y el plan del estado.
+
+Aparte, reproduce con dos sesiones una edición que confirma con un `changed_at` anterior al
+último y comprueba que el contexto la recoge.
+
+El contenido de las notas se alarga a unos NOTE_CHARS caracteres para que leerlas enteras
+cueste lo que cuesta con notas reales.
+"""
+
+import os
+import time
+import uuid
+from collections.abc import AsyncIterator
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from src.pkm_app.core.application import context_packing
+from src.pkm_app.core.application.use_cases.assistant_context.assemble_context_use_case import (
+    AssembleContextUseCase,
+    ContextMemo,
+)
+from src.pkm_app.core.application.dtos import NoteUpdate
+from src.pkm_app.infrastructure.persistence.sqlalchemy.database import (
+    dispose_engines,
+    get_async_sessionmaker,
+)
+from src.pkm_app.infrastructure.persistence.sqlalchemy.repositories.context_repository import (
+    GET_STATE,
+)
+from src.pkm_app.infrastructure.persistence.sqlalchemy.repositories.note_repository import (
+    SQLAlchemyNoteRepository,
+)
+from src.pkm_app.infrastructure.persistence.sqlalchemy.unit_of_work import SQLAlchemyUnitOfWork
+from src.pkm_app.tests.benchmarks.seed import SeedVolumes, seed
+from src.pkm_app.tests.benchmarks.utils import explain, used_indexes
+
+NOTES = int(os.getenv("BENCH_CONTEXT_NOTES", "50000"))
+KEYWORDS = int(os.getenv("BENCH_CONTEXT_KEYWORDS", "500"))
+LINKS = int(os.getenv("BENCH_CONTEXT_LINKS", "50000"))
+NOTE_CHARS = int(os.getenv("BENCH_CONTEXT_NOTE_CHARS", "4000"))
+QUERIES = int(os.getenv("BENCH_CONTEXT_QUERIES", "100"))
+MAX_TOKENS = int(os.getenv("BENCH_CONTEXT_MAX_TOKENS", "4000"))
+
+
+@pytest_asyncio.fixture
+async def context_user(bench_engine: AsyncEngine) -> AsyncIterator[str]:
+    volumes = SeedVolumes(
+        users=1, projects=20, sources=0, notes=NOTES, keywords=KEYWORDS, links=LINKS
+    )
+    async with bench_engine.begin() as connection:
+        seeded = await seed(connection, volumes)
+        user_id = seeded.user_ids[0]
+        await connection.execute(
+            text(
+                "UPDATE notes SET content = left(repeat(content || ' ', :n / length(content) + 1), "
+                ":n) WHERE user_id = :u"
+            ),
+            {"u": user_id, "n": NOTE_CHARS},
+        )
+        await connection.execute(
+            text(
+                "UPDATE user_profiles SET learned_context = CAST(:c AS jsonb) WHERE user_id = :u"
+            ),
+            {"u": user_id, "c": '{"idioma": "es", "estilo": "respuestas breves con ejemplos"}'},
+        )
+    async with bench_engine.connect() as connection:
+        await connection.execution_options(isolation_level="AUTOCOMMIT")
+        await connection.execute(
+            text("VACUUM (ANALYZE) notes, change_log, keywords, note_keywords, note_links")
+        )
+    try:
+        yield user_id
+    finally:
+        async with bench_engine.begin() as connection:
+            await connection.execute(text("DELETE FROM notes WHERE user_id = :u"), {"u": user_id})
+            for table in ("user_profiles", "change_log", "note_outbox"):
+                await connection.execute(
+                    text(f"DELETE FROM {table} WHERE user_id = :u"), {"u": user_id}
+                )
+
+
+def _queries() -> list[str]:
+    step = max(KEYWORDS // QUERIES, 1)
+    return [
+        f"kw_{1 + i * step % KEYWORDS} kw_{1 + (i * step + 7) % KEYWORDS} nota"
+        for i in range(QUERIES)
+    ]
+
+
+async def _naive(user_id: str, query: str) -> int:
+    """Mismas candidatas y orden; cada nota se lee entera y se trunca hasta el presupuesto."""
+    uow = SQLAlchemyUnitOfWork(get_async_sessionmaker())
+    async with uow:
+        await uow.changes.get_changes_since(user_id=user_id, cursor=0, limit=1)
+        state = await uow.assistant_context.get_state(user_id)
+        await uow.commit()
+        words = context_packing.query_words(query)
+        candidates = await uow.assistant_context.find_candidates(
+            user_id,
+            context_packing.query_terms(query),
+            None,
+            AssembleContextUseCase.CANDIDATE_LIMIT,
+        )
+        ranked = context_packing.rank(candidates, words, None, state.last_changed_at)
+        remaining = MAX_TOKENS * context_packing.CHARS_PER_TOKEN
+        parts = []
+        for candidate in ranked:
+            if remaining <= 0:
+                break
+            note = await uow.notes.get_by_id(note_id=candidate.note_id, user_id=user_id)
+            part = f"## Nota: {note.title}\n{note.content}"[:remaining]
+            parts.append(part)
+            remaining -= len(part) + 2
+    return context_packing.estimate_tokens("\n\n".join(parts))
+
+
+async def _timed(calls) -> list[float]:
+    timings = []
+    for call in calls:
+        start = time.perf_counter()
+        await call()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+@pytest.mark.asyncio
+async def test_context_assembly_latency(bench_report, bench_engine: AsyncEngine, context_user):
+    user_id = context_user
+    queries = _queries()
+    session_factory = get_async_sessionmaker()
+    memo = ContextMemo()
+    contexts = []
+
+    def assemble(query: str, memo: ContextMemo | None):
+        async def call():
+            contexts.append(
+                await AssembleContextUseCase(SQLAlchemyUnitOfWork(session_factory), memo).execute(
+                    user_id=user_id, query=query, max_tokens=MAX_TOKENS
+                )
+            )
+
+        return call
+
+    # Calentamiento del pool y de los planes; numera de una vez los cambios de la siembra
+    await assemble(queries[0], None)()
+    cold = await _timed([assemble(query, memo) for query in queries])
+    cold_contexts = contexts[-QUERIES:]
+    warm = await _timed([assemble(query, memo) for query in queries])
+    naive_tokens: list[int] = []
+
+    def naive(query: str):
+        async def call():
+            naive_tokens.append(await _naive(user_id, query))
+
+        return call
+
+    naive_timings = await _timed([naive(query) for query in queries])
+
+    async def probe():
+        async with SQLAlchemyUnitOfWork(session_factory) as uow:
+            await uow.changes.get_changes_since(user_id=user_id, cursor=0, limit=1)
+            await uow.assistant_context.get_state(user_id)
+            await uow.commit()
+
+    probe_timings = await _timed([probe for _ in queries])
+    await dispose_engines()
+    async with bench_engine.connect() as connection:
+        plan = await explain(connection, GET_STATE.params(user_id=user_id))
+
+    assert memo.hits == QUERIES
+    assert all(context.tokens <= MAX_TOKENS for context in cold_contexts)
+    assert all(any(item.kind == "note" for item in c.items) for c in cold_contexts)
+    assert {"ix_change_log_user_id_changed_at", "ix_change_log_user_id_seq"} <= set(
+        used_indexes(plan)
+    ), plan
+
+    stats = {
+        "cold": bench_report.add("assistant_context/cold", cold),
+        "memo": bench_report.add("assistant_context/memo", warm),
+        "naive": bench_report.add("assistant_context/naive_get_by_id", naive_timings),
+        "probe": bench_report.add("assistant_context/version_probe", probe_timings),
+    }
+    notes = sum(item.kind == "note" for c in cold_contexts for item in c.items) / QUERIES
+    tokens = sum(c.tokens for c in cold_contexts) / QUERIES
+    print(
+        f"\n[assistant context] {NOTES} notas de ~{NOTE_CHARS} caracteres, presupuesto "
+        f"{MAX_TOKENS} tokens: {notes:.1f} notas y {tokens:.0f} tokens por contexto "
+        f"(ingenuo {sum(naive_tokens) / QUERIES:.0f} tokens)"
+    )
+    for name, stat in stats.items():
+        print(f"[assistant context] {name:<6} p50={stat.p50_ms:.2f} ms p95={stat.p95_ms:.2f} ms")
+
+
+@pytest.mark.asyncio
+async def test_late_commit_below_the_last_change_invalidates_the_memo(
+    bench_engine: AsyncEngine, committed_note: tuple[str, uuid.UUID]
+):
+    user_id, note_id = committed_note
+    other_note_id = uuid.uuid4()
+    async with bench_engine.begin() as connection:
+        await connection.execute(
+            text("INSERT INTO notes (id, user_id, content) VALUES (:id, :u, 'Otra nota')"),
+            {"id": other_note_id, "u": user_id},
+        )
+    memo = ContextMemo()
+
+    async def assemble():
+        return await AssembleContextUseCase(
+            SQLAlchemyUnitOfWork(get_async_sessionmaker()), memo
+        ).execute(user_id=user_id, query="nota")
+
+    async def rename(session: AsyncSession, target: uuid.UUID, title: str) -> None:
+        await SQLAlchemyNoteRepository(session).update(target, NoteUpdate(title=title), user_id)
+
+    try:
+        async with AsyncSession(bench_engine) as late, AsyncSession(bench_engine) as early:
+            # `late` empieza primero (su now() es anterior) pero confirma el último
+            await late.execute(text("SELECT now()"))
+            await rename(early, other_note_id, "Nueva")
+            await early.commit()
+            before = await assemble()
+            await rename(late, note_id, "Tardía")
+            await late.commit()
+
+        async with bench_engine.connect() as connection:
+            changed_at = dict(
+                (
+                    await connection.execute(
+                        text("SELECT entity_id, changed_at FROM change_log WHERE user_id = :u"),
+                        {"u": user_id},
+                    )
+                ).all()
+            )
+        assert changed_at[note_id] < changed_at[other_note_id]
+        after = await assemble()
+    finally:
+        await dispose_engines()
+    assert after.version != before.version
+    assert "Tardía" in [item.title for item in after.items]
+
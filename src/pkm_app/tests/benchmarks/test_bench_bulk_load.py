@@ -0,0 +1,53 @@
+# src/pkm_app/tests/benchmarks/test_bench_bulk_load.py
+"""
+Benchmark de la carga masiva con COPY (`data_generation/bulk_generator.py`).
+
+Genera BENCH_BULK_USERS × BENCH_BULK_NOTES_PER_USER notas con BENCH_BULK_WORKERS procesos y
+las carga con COPY. A diferencia del resto de benchmarks, los datos se confirman (cada lote
+va en su propia transacción), así que se borran al terminar.
+"""
+
+import os
+
+import asyncpg
+import pytest
+
+from src.pkm_app.tests.benchmarks.report import BenchmarkReport
+from src.pkm_app.tests.data_generation.bulk_generator import (
+    BulkConfig,
+    default_dsn,
+    load,
+    remove,
+)
+
+USERS = int(os.getenv("BENCH_BULK_USERS", "2"))
+NOTES_PER_USER = int(os.getenv("BENCH_BULK_NOTES_PER_USER", "50000"))
+WORKERS = int(os.getenv("BENCH_BULK_WORKERS", str(os.cpu_count() or 1)))
+# Semilla propia para no chocar con datos cargados a mano con la semilla por defecto
+SEED = 990_001
+
+
+@pytest.mark.asyncio
+async def test_bulk_load_with_copy(bench_report: BenchmarkReport):
+    config = BulkConfig(seed=SEED, users=USERS, notes_per_user=NOTES_PER_USER)
+    dsn = default_dsn()
+
+    stats = await load(config, dsn, workers=WORKERS, replace=True)
+    pool = await asyncpg.create_pool(dsn, min_size=1, max_size=1)
+    try:
+        loaded = await pool.fetchval(
+            "SELECT count(*) FROM notes WHERE user_id = ANY($1::text[])", config.user_ids()
+        )
+        await remove(pool, config)
+    finally:
+        await pool.close()
+
+    assert loaded == config.total_notes
+    total_rows = sum(stats.rows.values())
+    notes_per_second = config.total_notes / stats.seconds
+    bench_report.add("bulk_load.copy_total", [stats.seconds * 1000])
+    print(f"\n{stats.summary()}")
+    print(
+        f"{notes_per_second:,.0f} notas/s; 1M notas en ~{1_000_000 / notes_per_second / 60:.1f} "
+        f"min ({total_rows / config.total_notes:.1f} filas por nota, {WORKERS} procesos)"
+    )
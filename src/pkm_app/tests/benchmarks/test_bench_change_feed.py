@@ -0,0 +1,290 @@
+# src/pkm_app/tests/benchmarks/test_bench_change_feed.py
+"""
+Benchmark del feed de cambios frente a volver a listar todo.
+
+Un cliente con NOTES notas cargadas (cursor inicial con cursor 0 y listado completo) vuelve
+tras CHANGES ediciones y un borrado:
+
+- incremental: `GetChangesSinceUseCase` desde su cursor y `GetNoteUseCase` de cada nota
+  cambiada (el feed no lleva el contenido), O(cambios);
+- completo: `ListNotesUseCase` página a página (MAX_LIMIT) hasta tener todas, O(datos).
+
+También mide lo que añaden los triggers a las escrituras (UPDATE de una nota y UPDATE de
+todas) deshabilitando el trigger de UPDATE de `notes` en la misma transacción, y comprueba el
+caso que motiva numerar al leer: una escritura que confirma después de otra posterior no se
+queda por detrás de un cursor ya entregado. Salvo esa comprobación, que necesita varias
+conexiones y confirma sus datos, todo se revierte al terminar.
+"""
+
+import asyncio
+import os
+import time
+import uuid
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession, async_sessionmaker
+
+from src.pkm_app.core.application.dtos import ChangeFeedPage
+from src.pkm_app.core.application.use_cases.change_feed.get_changes_since_use_case import (
+    GetChangesSinceUseCase,
+)
+from src.pkm_app.core.application.use_cases.change_feed.purge_change_tombstones_use_case import (
+    PurgeChangeTombstonesUseCase,
+)
+from src.pkm_app.core.application.use_cases.note.get_note_use_case import GetNoteUseCase
+from src.pkm_app.core.application.use_cases.note.list_notes_use_case import ListNotesUseCase
+from src.pkm_app.infrastructure.config.settings import get_settings
+from src.pkm_app.infrastructure.persistence.sqlalchemy.database import get_async_database_url
+from src.pkm_app.infrastructure.persistence.sqlalchemy.engine import create_async_db_engine
+from src.pkm_app.infrastructure.persistence.sqlalchemy.unit_of_work import (
+    SQLAlchemyReadOnlyUnitOfWork,
+    SQLAlchemyUnitOfWork,
+)
+
+NOTES = int(os.getenv("BENCH_CHANGE_FEED_NOTES", "5000"))
+CHANGES = int(os.getenv("BENCH_CHANGE_FEED_CHANGES", "20"))
+ROUNDS = int(os.getenv("BENCH_CHANGE_FEED_ROUNDS", "20"))
+SINGLE_UPDATES = 200
+
+
+async def _seed_notes(connection: AsyncConnection, user_id: str) -> list[uuid.UUID]:
+    rows = await connection.execute(
+        text(
+            """
+            INSERT INTO notes (id, user_id, title, content)
+            SELECT gen_random_uuid(), :user_id, 'Nota ' || i, repeat('texto ', 40)
+            FROM generate_series(1, :n) AS i
+            RETURNING id
+            """
+        ),
+        {"user_id": user_id, "n": NOTES},
+    )
+    return list(rows.scalars())
+
+
+async def _sync(session: AsyncSession, user_id: str, cursor: int) -> ChangeFeedPage:
+    """Consume el feed desde `cursor` hasta agotarlo; devuelve todos los cambios en una página."""
+    use_case = GetChangesSinceUseCase(SQLAlchemyUnitOfWork(session))
+    page = await use_case.execute(user_id=user_id, cursor=cursor)
+    changes = list(page.changes)
+    while page.has_more:
+        page = await use_case.execute(user_id=user_id, cursor=page.next_cursor)
+        changes.extend(page.changes)
+    return page.model_copy(update={"changes": changes})
+
+
+async def _edit(connection: AsyncConnection, note_ids: list[uuid.UUID], round_: int) -> None:
+    start = (round_ * (CHANGES + 1)) % (len(note_ids) - CHANGES - 1)
+    await connection.execute(
+        text("UPDATE notes SET title = 'Editada ' || :round WHERE id = ANY(:ids)"),
+        {"round": str(round_), "ids": note_ids[start : start + CHANGES]},
+    )
+    await connection.execute(
+        text("DELETE FROM notes WHERE id = :id"), {"id": note_ids.pop(start + CHANGES)}
+    )
+
+
+@pytest.mark.asyncio
+async def test_incremental_sync_vs_full_relist(
+    bench_report, bench_connection, bench_session, bench_user_id
+):
+    note_ids = await _seed_notes(bench_connection, bench_user_id)
+    page = await _sync(bench_session, bench_user_id, 0)
+    assert page.changes == [] and page.next_cursor > 0
+    cursor = page.next_cursor
+
+    incremental: list[float] = []
+    full: list[float] = []
+    for round_ in range(ROUNDS):
+        await _edit(bench_connection, note_ids, round_)
+
+        start = time.perf_counter()
+        page = await GetChangesSinceUseCase(SQLAlchemyUnitOfWork(bench_session)).execute(
+            user_id=bench_user_id, cursor=cursor
+        )
+        get_note = GetNoteUseCase(SQLAlchemyReadOnlyUnitOfWork(bench_session))
+        for change in page.changes:
+            if change.operation == "upsert":
+                await get_note.execute(note_id=change.entity_id, user_id=bench_user_id)
+        incremental.append((time.perf_counter() - start) * 1000)
+        assert len(page.changes) == CHANGES + 1
+        assert sum(change.operation == "delete" for change in page.changes) == 1
+        assert not page.has_more and page.next_cursor > cursor
+        cursor = page.next_cursor
+
+        start = time.perf_counter()
+        list_notes = ListNotesUseCase(SQLAlchemyReadOnlyUnitOfWork(bench_session))
+        listed, skip = 0, 0
+        while batch := await list_notes.execute(
+            user_id=bench_user_id, skip=skip, limit=ListNotesUseCase.MAX_LIMIT
+        ):
+            listed += len(batch)
+            skip += ListNotesUseCase.MAX_LIMIT
+        full.append((time.perf_counter() - start) * 1000)
+        assert listed == len(note_ids)
+
+    inc = bench_report.add("change_feed/incremental_sync", incremental)
+    rel = bench_report.add("change_feed/full_relist", full)
+    print(
+        f"\n[change feed] {NOTES} notas, {CHANGES + 1} cambios por sincronización: "
+        f"incremental p50={inc.p50_ms:.1f} ms p95={inc.p95_ms:.1f} ms | "
+        f"listado completo p50={rel.p50_ms:.1f} ms p95={rel.p95_ms:.1f} ms "
+        f"({rel.p50_ms / inc.p50_ms:.0f}x)"
+    )
+
+
+@pytest.mark.asyncio
+async def test_cursor_zero_covers_existing_entities(bench_connection, bench_session, bench_user_id):
+    # Cambios pendientes de antes de la primera sincronización, como los del backfill de la
+    # migración del feed
+    note_ids = await _seed_notes(bench_connection, bench_user_id)
+    await bench_connection.execute(
+        text(
+            "INSERT INTO change_log (entity_type, entity_id, user_id, operation, version) "
+            "SELECT 'project', gen_random_uuid(), :user_id, 'upsert', 1"
+        ),
+        {"user_id": bench_user_id},
+    )
+
+    page = await GetChangesSinceUseCase(SQLAlchemyUnitOfWork(bench_session)).execute(
+        user_id=bench_user_id, cursor=0
+    )
+    assert page.changes == [] and not page.has_more and not page.reset_required
+    last_seq = await bench_connection.scalar(
+        text("SELECT max(seq) FROM change_log WHERE user_id = :user_id"),
+        {"user_id": bench_user_id},
+    )
+    assert page.next_cursor == last_seq
+
+    # Desde ese cursor solo llega lo que cambia después
+    assert (await _sync(bench_session, bench_user_id, page.next_cursor)).changes == []
+    await bench_connection.execute(
+        text("UPDATE notes SET title = 'Editada' WHERE id = :id"), {"id": note_ids[0]}
+    )
+    page = await _sync(bench_session, bench_user_id, page.next_cursor)
+    assert [(change.entity_id, change.operation) for change in page.changes] == [
+        (note_ids[0], "upsert")
+    ]
+
+
+@pytest.mark.asyncio
+async def test_purged_tombstones_require_reset(bench_connection, bench_session, bench_user_id):
+    note_ids = await _seed_notes(bench_connection, bench_user_id)
+    stale_cursor = (await _sync(bench_session, bench_user_id, 0)).next_cursor
+    await bench_connection.execute(text("DELETE FROM notes WHERE id = :id"), {"id": note_ids[0]})
+    page = await _sync(bench_session, bench_user_id, stale_cursor)
+    assert [change.operation for change in page.changes] == ["delete"]
+    cursor = page.next_cursor
+
+    purged = await PurgeChangeTombstonesUseCase(SQLAlchemyUnitOfWork(bench_session)).execute(
+        retention=timedelta(0)
+    )
+    assert purged >= 1
+
+    page = await GetChangesSinceUseCase(SQLAlchemyUnitOfWork(bench_session)).execute(
+        user_id=bench_user_id, cursor=stale_cursor
+    )
+    assert page.reset_required and page.changes == []
+    assert page.next_cursor == cursor
+    # Un cliente al día no se ve afectado por la purga
+    page = await _sync(bench_session, bench_user_id, cursor)
+    assert page.changes == [] and not page.reset_required
+
+
+async def _time_updates(
+    connection: AsyncConnection, note_ids: list[uuid.UUID]
+) -> tuple[list[float], list[float]]:
+    single: list[float] = []
+    for i in range(SINGLE_UPDATES):
+        start = time.perf_counter()
+        await connection.execute(
+            text("UPDATE notes SET title = 'Editada' WHERE id = :id"),
+            {"id": note_ids[i % len(note_ids)]},
+        )
+        single.append((time.perf_counter() - start) * 1000)
+    bulk: list[float] = []
+    for _ in range(5):
+        start = time.perf_counter()
+        await connection.execute(
+            text("UPDATE notes SET title = 'Editada' WHERE id = ANY(:ids)"), {"ids": note_ids}
+        )
+        bulk.append((time.perf_counter() - start) * 1000)
+    return single, bulk
+
+
+@pytest.mark.asyncio
+async def test_trigger_write_overhead(bench_report, bench_connection, bench_user_id):
+    note_ids = await _seed_notes(bench_connection, bench_user_id)
+
+    results = {}
+    for name, enabled in (("without_trigger", False), ("with_trigger", True)):
+        action = "ENABLE" if enabled else "DISABLE"
+        await bench_connection.execute(
+            text(f"ALTER TABLE notes {action} TRIGGER notes_changes_update")
+        )
+        single, bulk = await _time_updates(bench_connection, note_ids)
+        results[name] = (
+            bench_report.add(f"change_feed/update_one/{name}", single),
+            bench_report.add(f"change_feed/update_all/{name}", bulk),
+        )
+    for name, (single, bulk) in results.items():
+        print(
+            f"\n[change feed] {name:<16} UPDATE de 1 nota p50={single.p50_ms:.2f} ms | "
+            f"UPDATE de {NOTES} notas p50={bulk.p50_ms:.1f} ms"
+        )
+
+
+@pytest.mark.asyncio
+async def test_late_commit_is_not_left_behind_the_cursor():
+    """Una edición que confirma después que otra posterior aparece tras el cursor entregado."""
+    engine = create_async_db_engine(get_async_database_url(), get_settings())
+    session_factory = async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+    user_id = f"bench_user_{uuid.uuid4()}"
+    slow_note, fast_note = uuid.uuid4(), uuid.uuid4()
+    async with engine.begin() as connection:
+        await connection.execute(
+            text("INSERT INTO user_profiles (user_id, name) VALUES (:user_id, 'Benchmark user')"),
+            {"user_id": user_id},
+        )
+        await connection.execute(
+            text("INSERT INTO notes (id, user_id, content) VALUES (:id, :user_id, 'Lenta')"),
+            {"id": slow_note, "user_id": user_id},
+        )
+
+    try:
+        async with session_factory() as session:
+            cursor = (await _sync(session, user_id, 0)).next_cursor
+
+        async with engine.connect() as slow:
+            transaction = await slow.begin()
+            await slow.execute(
+                text("UPDATE notes SET title = 'Editada' WHERE id = :id"), {"id": slow_note}
+            )
+            # Otra escritura empieza después y confirma antes
+            async with engine.begin() as fast:
+                await fast.execute(
+                    text("INSERT INTO notes (id, user_id, content) VALUES (:id, :user_id, 'R')"),
+                    {"id": fast_note, "user_id": user_id},
+                )
+            async with session_factory() as session:
+                page = await asyncio.wait_for(_sync(session, user_id, cursor), timeout=5)
+            assert [change.entity_id for change in page.changes] == [fast_note]
+            cursor = page.next_cursor
+            await transaction.commit()
+
+        async with session_factory() as session:
+            page = await _sync(session, user_id, cursor)
+        assert [change.entity_id for change in page.changes] == [slow_note]
+        assert page.changes[0].seq > cursor
+    finally:
+        async with engine.begin() as connection:
+            await connection.execute(text("DELETE FROM notes WHERE user_id = :u"), {"u": user_id})
+            await connection.execute(
+                text("DELETE FROM user_profiles WHERE user_id = :u"), {"u": user_id}
+            )
+            await connection.execute(
+                text("DELETE FROM change_log WHERE user_id = :u"), {"u": user_id}
+            )
+        await engine.dispose()
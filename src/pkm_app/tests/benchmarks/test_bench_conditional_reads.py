@@ -0,0 +1,361 @@
+# src/pkm_app/tests/benchmarks/test_bench_conditional_reads.py
+"""
+Benchmark de las lecturas condicionales bajo carga de sondeo.
+
+Simula clientes que refrescan periódicamente una nota, su listado y las notas de un
+proyecto sin que los datos cambien: compara `execute` (lectura e hidratación completas en
+cada sondeo) con `execute_if_modified` enviando la versión vigente, que solo ejecuta la
+sonda. Siembra NOTES notas con KEYWORDS_PER_NOTE keywords en un proyecto (y OTHER_NOTES de
+otro usuario, para que el filtro por usuario sea selectivo) y comprueba con EXPLAIN que la
+sonda de los listados es un index-only scan sobre `(user_id, [project_id,] updated_at)`.
+Aparte, reproduce con dos conexiones una escritura que confirma por debajo del máximo
+`updated_at` y comprueba que cambia la versión del listado, y que borrar la keyword o el
+proyecto de una nota cambia la versión de la nota y la del listado.
+
+La nota suelta se lee por clave primaria tanto en la sonda como en la lectura completa, así
+que ahí la ganancia es solo la hidratación y la serialización que se evitan.
+
+Los datos se confirman y se pasa VACUUM sobre ellos (como haría autovacuum en producción):
+dentro de una transacción sin confirmar el mapa de visibilidad está vacío y un index-only
+scan tendría que visitar el heap en cada fila. Al final se borran ambos usuarios y, en
+cascada, todo lo sembrado.
+"""
+
+import os
+import statistics
+import time
+import uuid
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import Any
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession
+
+from src.pkm_app.core.application.dtos import NoteUpdate, ProjectCreate
+from src.pkm_app.core.application.use_cases.note.get_note_use_case import GetNoteUseCase
+from src.pkm_app.core.application.use_cases.note.list_notes_use_case import ListNotesUseCase
+from src.pkm_app.core.application.use_cases.note.search_notes_by_project_use_case import (
+    SearchNotesByProjectUseCase,
+)
+from src.pkm_app.core.application.versioning import NotModified, Versioned
+from src.pkm_app.infrastructure.persistence.sqlalchemy.database import (
+    dispose_engines,
+    get_async_readonly_sessionmaker,
+)
+from src.pkm_app.infrastructure.persistence.sqlalchemy.models import Note as NoteModel
+from src.pkm_app.infrastructure.persistence.sqlalchemy.repositories.keyword_repository import (
+    SQLAlchemyKeywordRepository,
+)
+from src.pkm_app.infrastructure.persistence.sqlalchemy.repositories.note_repository import (
+    LIST_CHECKSUM,
+    SQLAlchemyNoteRepository,
+)
+from src.pkm_app.infrastructure.persistence.sqlalchemy.repositories.project_repository import (
+    SQLAlchemyProjectRepository,
+)
+from src.pkm_app.infrastructure.persistence.sqlalchemy.unit_of_work import (
+    SQLAlchemyReadOnlyUnitOfWork,
+)
+
+from .utils import explain, iter_plan_nodes
+
+NOTES = int(os.getenv("BENCH_CONDITIONAL_NOTES", "5000"))
+OTHER_NOTES = int(os.getenv("BENCH_CONDITIONAL_OTHER_NOTES", "50000"))
+POLLS = int(os.getenv("BENCH_CONDITIONAL_POLLS", "300"))
+KEYWORDS_PER_NOTE = 3
+WARMUP = 20
+
+
+async def _seed(connection: AsyncConnection, user_id: str) -> uuid.UUID:
+    project_id = uuid.uuid4()
+    await connection.execute(
+        text("INSERT INTO projects (id, user_id, name) VALUES (:id, :user_id, 'Bench project')"),
+        {"id": project_id, "user_id": user_id},
+    )
+    await connection.execute(
+        text(
+            """
+            INSERT INTO keywords (id, user_id, name)
+            SELECT gen_random_uuid(), :user_id, 'kw_' || i FROM generate_series(1, 50) AS i
+            """
+        ),
+        {"user_id": user_id},
+    )
+    await connection.execute(
+        text(
+            """
+            INSERT INTO notes (id, user_id, project_id, title, content, updated_at)
+            SELECT gen_random_uuid(), :user_id, :project_id, 'Nota ' || i, repeat('texto ', 40),
+                   now() - i * interval '1 second'
+            FROM generate_series(1, :n) AS i
+            """
+        ),
+        {"user_id": user_id, "project_id": project_id, "n": NOTES},
+    )
+    await connection.execute(
+        text(
+            """
+            INSERT INTO note_keywords (note_id, keyword_id)
+            SELECT n.id, k.id
+            FROM notes n
+            CROSS JOIN LATERAL (
+                SELECT id FROM keywords
+                WHERE user_id = :user_id AND n.id IS NOT NULL
+                ORDER BY random() LIMIT :per_note
+            ) AS k
+            WHERE n.user_id = :user_id
+            """
+        ),
+        {"user_id": user_id, "per_note": KEYWORDS_PER_NOTE},
+    )
+    return project_id
+
+
+@pytest_asyncio.fixture
+async def polled_data(
+    bench_engine: AsyncEngine, committed_note: tuple[str, uuid.UUID]
+) -> AsyncIterator[tuple[str, uuid.UUID, uuid.UUID]]:
+    """Usuario, una de sus notas y su proyecto, con los datos confirmados y con VACUUM."""
+    user_id, note_id = committed_note
+    other_user_id = f"bench_user_{uuid.uuid4()}"
+    async with bench_engine.begin() as connection:
+        project_id = await _seed(connection, user_id)
+        await connection.execute(
+            text("INSERT INTO user_profiles (user_id, name) VALUES (:user_id, 'Other user')"),
+            {"user_id": other_user_id},
+        )
+        await connection.execute(
+            text(
+                """
+                INSERT INTO notes (id, user_id, content)
+                SELECT gen_random_uuid(), :user_id, 'Otra nota ' || i
+                FROM generate_series(1, :n) AS i
+                """
+            ),
+            {"user_id": other_user_id, "n": OTHER_NOTES},
+        )
+    async with bench_engine.connect() as connection:
+        await connection.execution_options(isolation_level="AUTOCOMMIT")
+        await connection.execute(text("VACUUM (ANALYZE) notes, note_keywords, keywords"))
+    try:
+        yield user_id, note_id, project_id
+    finally:
+        async with bench_engine.begin() as connection:
+            for owner in (user_id, other_user_id):
+                await connection.execute(
+                    text("DELETE FROM notes WHERE user_id = :u"), {"u": owner}
+                )
+            await connection.execute(
+                text("DELETE FROM user_profiles WHERE user_id = :u"), {"u": other_user_id}
+            )
+
+
+async def _polling_latencies(poll: Callable[[], Awaitable[Any]]) -> list[float]:
+    timings = []
+    for i in range(WARMUP + POLLS):
+        start = time.perf_counter()
+        await poll()
+        if i >= WARMUP:
+            timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+@pytest.mark.asyncio
+async def test_conditional_reads_under_polling(
+    polled_data: tuple[str, uuid.UUID, uuid.UUID], bench_report
+):
+    user_id, note_id, project_id = polled_data
+    session_factory = get_async_readonly_sessionmaker()
+
+    def uow() -> SQLAlchemyReadOnlyUnitOfWork:
+        return SQLAlchemyReadOnlyUnitOfWork(session_factory)
+
+    async def current_version(result: Versioned[Any] | NotModified) -> str:
+        assert isinstance(result, Versioned)
+        return result.version
+
+    note_version = await current_version(
+        await GetNoteUseCase(uow()).execute_if_modified(note_id=note_id, user_id=user_id)
+    )
+    list_version = await current_version(
+        await ListNotesUseCase(uow()).execute_if_modified(user_id=user_id)
+    )
+    project_version = await current_version(
+        await SearchNotesByProjectUseCase(uow()).execute_if_modified(
+            project_id=project_id, user_id=user_id
+        )
+    )
+
+    async def expect_not_modified(result: Versioned[Any] | NotModified) -> None:
+        assert isinstance(result, NotModified)
+
+    cases: dict[str, tuple[Callable[[], Awaitable[Any]], Callable[[], Awaitable[Any]]]] = {
+        "get_note": (
+            lambda: GetNoteUseCase(uow()).execute(note_id=note_id, user_id=user_id),
+            lambda: GetNoteUseCase(uow()).execute_if_modified(
+                note_id=note_id, user_id=user_id, known_version=note_version
+            ),
+        ),
+        "list_notes": (
+            lambda: ListNotesUseCase(uow()).execute(user_id=user_id),
+            lambda: ListNotesUseCase(uow()).execute_if_modified(
+                user_id=user_id, known_version=list_version
+            ),
+        ),
+        "project_notes": (
+            lambda: SearchNotesByProjectUseCase(uow()).execute(
+                project_id=project_id, user_id=user_id
+            ),
+            lambda: SearchNotesByProjectUseCase(uow()).execute_if_modified(
+                project_id=project_id, user_id=user_id, known_version=project_version
+            ),
+        ),
+    }
+
+    medians: dict[str, tuple[float, float]] = {}
+    try:
+        for name, (full_read, conditional_read) in cases.items():
+            await expect_not_modified(await conditional_read())
+            full = await _polling_latencies(full_read)
+            conditional = await _polling_latencies(conditional_read)
+            bench_report.add(f"conditional_reads/{name}/full", full)
+            bench_report.add(f"conditional_reads/{name}/not_modified", conditional)
+            medians[name] = (statistics.median(full), statistics.median(conditional))
+            print(
+                f"\n[conditional-reads] {name}: completa median={medians[name][0]:.3f}ms "
+                f"no_modificada median={medians[name][1]:.3f}ms "
+                f"({medians[name][0] / medians[name][1]:.1f}x)"
+            )
+    finally:
+        await dispose_engines()
+
+    # Las páginas (con keywords) son mucho más caras que la sonda; la nota suelta solo se informa
+    assert medians["list_notes"][1] < medians["list_notes"][0]
+    assert medians["project_notes"][1] < medians["project_notes"][0]
+
+
+@pytest.mark.asyncio
+async def test_list_probes_are_index_only_scans(
+    bench_engine: AsyncEngine, polled_data: tuple[str, uuid.UUID, uuid.UUID]
+):
+    user_id, _, project_id = polled_data
+    probe = select(func.max(NoteModel.updated_at), func.count(), *LIST_CHECKSUM).where(
+        NoteModel.user_id == user_id
+    )
+    probes = {
+        "ix_notes_user_id_updated_at": probe,
+        "ix_notes_user_id_project_id_updated_at": probe.where(NoteModel.project_id == project_id),
+    }
+
+    async with bench_engine.connect() as connection:
+        for index_name, statement in probes.items():
+            explained = await explain(connection, statement)
+            scans = [
+                node
+                for node in iter_plan_nodes(explained["Plan"])
+                if node.get("Index Name") == index_name
+            ]
+            print(
+                f"\n[conditional-reads] sonda {index_name}: "
+                f"{explained['Execution Time']:.3f}ms, {[n['Node Type'] for n in scans]}"
+            )
+            assert [node["Node Type"] for node in scans] == ["Index Only Scan"]
+            assert scans[0]["Heap Fetches"] == 0
+
+
+@pytest.mark.asyncio
+async def test_late_commit_below_the_maximum_changes_the_list_version(
+    bench_engine: AsyncEngine, committed_note: tuple[str, uuid.UUID]
+):
+    user_id, note_id = committed_note
+    newer_note_id = uuid.uuid4()
+    async with bench_engine.begin() as connection:
+        await connection.execute(
+            text("INSERT INTO notes (id, user_id, content) VALUES (:id, :u, 'Otra nota')"),
+            {"id": newer_note_id, "u": user_id},
+        )
+    session_factory = get_async_readonly_sessionmaker()
+
+    async def list_version(known_version: str | None = None) -> Versioned[Any] | NotModified:
+        use_case = ListNotesUseCase(SQLAlchemyReadOnlyUnitOfWork(session_factory))
+        return await use_case.execute_if_modified(user_id=user_id, known_version=known_version)
+
+    async def rename(session: AsyncSession, target: uuid.UUID, title: str) -> None:
+        await SQLAlchemyNoteRepository(session).update(target, NoteUpdate(title=title), user_id)
+
+    try:
+        async with AsyncSession(bench_engine) as late, AsyncSession(bench_engine) as early:
+            # `late` empieza primero (su now() es anterior) pero confirma el último
+            await late.execute(text("SELECT now()"))
+            await rename(early, newer_note_id, "Nueva")
+            await early.commit()
+            known = await list_version()
+            assert isinstance(known, Versioned)
+            await rename(late, note_id, "Tardía")
+            await late.commit()
+
+        async with bench_engine.connect() as connection:
+            maximum, older = (
+                await connection.execute(
+                    select(
+                        func.max(NoteModel.updated_at),
+                        func.min(NoteModel.updated_at),
+                    ).where(NoteModel.user_id == user_id)
+                )
+            ).one()
+        assert older < maximum  # el máximo no se ha movido con la escritura tardía
+        current = await list_version(known.version)
+        assert isinstance(current, Versioned)
+        assert "Tardía" in [note.title for note in current.data]
+    finally:
+        await dispose_engines()
+
+
+@pytest.mark.asyncio
+async def test_related_deletions_change_the_versions(
+    bench_engine: AsyncEngine, committed_note: tuple[str, uuid.UUID]
+):
+    user_id, note_id = committed_note
+    session_factory = get_async_readonly_sessionmaker()
+
+    def uow() -> SQLAlchemyReadOnlyUnitOfWork:
+        return SQLAlchemyReadOnlyUnitOfWork(session_factory)
+
+    async def versions() -> tuple[str, str, Any]:
+        note = await GetNoteUseCase(uow()).execute_if_modified(note_id=note_id, user_id=user_id)
+        page = await ListNotesUseCase(uow()).execute_if_modified(user_id=user_id)
+        assert isinstance(note, Versioned) and isinstance(page, Versioned)
+        return note.version, page.version, note.data
+
+    try:
+        async with AsyncSession(bench_engine) as session:
+            project = await SQLAlchemyProjectRepository(session).create(
+                ProjectCreate(name="Proyecto"), user_id
+            )
+            note = await SQLAlchemyNoteRepository(session).update(
+                note_id, NoteUpdate(project_id=project.id, keywords=["borrable"]), user_id
+            )
+            await session.commit()
+        assert note is not None
+        before = await versions()
+
+        async with AsyncSession(bench_engine) as session:
+            assert await SQLAlchemyKeywordRepository(session).delete(
+                note.keywords[0].id, user_id
+            )
+            await session.commit()
+        without_keyword = await versions()
+        assert without_keyword[2].keywords == []
+        assert without_keyword[0] != before[0] and without_keyword[1] != before[1]
+
+        async with AsyncSession(bench_engine) as session:
+            assert await SQLAlchemyProjectRepository(session).delete(project.id, user_id)
+            await session.commit()
+        without_project = await versions()
+        assert without_project[2].project_id is None
+        assert without_project[0] != without_keyword[0]
+        assert without_project[1] != without_keyword[1]
+    finally:
+        await dispose_engines()
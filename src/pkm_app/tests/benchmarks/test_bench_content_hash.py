@@ -0,0 +1,225 @@
+# src/pkm_app/tests/benchmarks/test_bench_content_hash.py
+"""
+Benchmark del hash de contenido de las notas (`notes.content_hash`) y de lo que se apoya en él.
+
+- Paridad: el hash que calcula PostgreSQL coincide con `content_hashing.content_hash()` en
+  textos con saltos de línea Windows, Unicode descompuesto, espacios y sin título.
+- Duplicados exactos: latencia p50/p95 de `find_exact_duplicates` sobre NOTES notas de un
+  usuario, de las que DUPLICATE_RATE repiten el texto de otra, frente a agrupar por el texto.
+- Outbox: volver a guardar una nota con el mismo texto (o solo cambiar metadatos) no genera
+  mensaje; cambiar el texto sí.
+- Caché de embeddings: EMBED_TEXTS textos (con DUPLICATE_RATE repetidos) en lotes de
+  EMBED_BATCH contra un modelo simulado de EMBED_CALL_MS por llamada: en frío, con la
+  memoria del proceso y desde la tabla compartida (otro proceso), con las llamadas y
+  textos que llegan al modelo en cada caso.
+
+Todo salvo la caché de embeddings se escribe en una transacción que se revierte; las
+entradas de caché usan un modelo propio del benchmark y se borran al terminar.
+"""
+
+import asyncio
+import os
+import time
+import uuid
+from collections.abc import Sequence
+
+import numpy as np
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession, async_sessionmaker
+
+from src.pkm_app.core.application.content_hashing import content_hash
+from src.pkm_app.core.application.interfaces.embedding_interface import ITextEmbedder
+from src.pkm_app.infrastructure.embeddings.cached_embedder import CachedEmbedder
+from src.pkm_app.infrastructure.persistence.sqlalchemy.repositories.note_repository import (
+    SQLAlchemyNoteRepository,
+)
+
+NOTES = int(os.getenv("BENCH_HASH_NOTES", "50000"))
+DUPLICATE_RATE = float(os.getenv("BENCH_HASH_DUPLICATE_RATE", "0.05"))
+QUERIES = int(os.getenv("BENCH_HASH_QUERIES", "20"))
+EMBED_TEXTS = int(os.getenv("BENCH_HASH_EMBED_TEXTS", "5000"))
+EMBED_BATCH = int(os.getenv("BENCH_HASH_EMBED_BATCH", "100"))
+EMBED_CALL_MS = float(os.getenv("BENCH_HASH_EMBED_CALL_MS", "20"))
+DIMENSION = 384
+BENCH_MODEL = f"bench-embedder-{uuid.uuid4().hex[:8]}"
+
+PARITY_CASES = [
+    (None, "Contenido"),
+    ("Título", "Contenido"),
+    ("  Título con espacios  ", "\n\tContenido\n\n"),
+    ("Windows", "línea 1\r\nlínea 2\r\n"),
+    ("Cafe\u0301", "Descompuesto: cafe\u0301"),
+    ("", "Sin título"),
+    ("Emoji 🧠", "Texto con 漢字 y ñ"),
+    ("Solo título", ""),
+]
+
+
+class _SlowEmbedder(ITextEmbedder):
+    """Modelo simulado: vector determinista por texto y latencia fija por llamada."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.texts = 0
+
+    @property
+    def model(self) -> str:
+        return BENCH_MODEL
+
+    async def embed(self, texts: Sequence[str]) -> np.ndarray:
+        self.calls += 1
+        self.texts += len(texts)
+        await asyncio.sleep(EMBED_CALL_MS / 1000)
+        seeds = [int.from_bytes(content_hash(None, t)[:4], "little") for t in texts]
+        return np.stack(
+            [np.random.default_rng(seed).standard_normal(DIMENSION) for seed in seeds]
+        ).astype(np.float32)
+
+
+@pytest.mark.asyncio
+async def test_sql_and_python_hashes_match(bench_connection: AsyncConnection, bench_user_id):
+    for title, content in PARITY_CASES:
+        stored = (
+            await bench_connection.execute(
+                text(
+                    "INSERT INTO notes (id, user_id, title, content) "
+                    "VALUES (gen_random_uuid(), :u, :t, :c) RETURNING content_hash"
+                ),
+                {"u": bench_user_id, "t": title, "c": content},
+            )
+        ).scalar_one()
+        assert bytes(stored) == content_hash(title, content), (title, content)
+    print(f"\n[content hash] {len(PARITY_CASES)} casos: hash SQL == hash Python")
+
+
+@pytest.mark.asyncio
+async def test_duplicate_finder_latency(
+    bench_report, bench_connection: AsyncConnection, bench_session: AsyncSession, bench_user_id
+):
+    # Las notas i > originales repiten el texto de la nota i % originales
+    originals = int(NOTES * (1 - DUPLICATE_RATE))
+    await bench_connection.execute(
+        text(
+            """
+            INSERT INTO notes (id, user_id, title, content)
+            SELECT gen_random_uuid(), :u, 'Nota ' || (i % :o),
+                   repeat('texto de la nota ' || (i % :o) || ' ', 30)
+            FROM generate_series(0, :n - 1) AS i
+            """
+        ),
+        {"u": bench_user_id, "n": NOTES, "o": originals},
+    )
+    await bench_connection.execute(text("ANALYZE notes"))
+    repo = SQLAlchemyNoteRepository(bench_session)
+    expected_groups = min(NOTES - originals, 1000)
+
+    timings: list[float] = []
+    for _ in range(QUERIES):
+        start = time.perf_counter()
+        groups = await repo.find_exact_duplicates(bench_user_id, limit=1000)
+        timings.append((time.perf_counter() - start) * 1000)
+    assert len(groups) == expected_groups
+    assert all(len(group.note_ids) == 2 for group in groups)
+    stats = bench_report.add("content_hash/find_exact_duplicates", timings)
+
+    by_text: list[float] = []
+    for _ in range(QUERIES):
+        start = time.perf_counter()
+        await bench_connection.execute(
+            text(
+                "SELECT array_agg(id ORDER BY created_at, id) FROM notes WHERE user_id = :u "
+                "GROUP BY title, content HAVING count(*) > 1 ORDER BY count(*) DESC LIMIT 1000"
+            ),
+            {"u": bench_user_id},
+        )
+        by_text.append((time.perf_counter() - start) * 1000)
+    baseline = bench_report.add("content_hash/group_by_text", by_text)
+    print(
+        f"\n[content hash] {NOTES} notas, {NOTES - originals} duplicadas: por hash "
+        f"p50={stats.p50_ms:.1f} ms p95={stats.p95_ms:.1f} ms; por texto "
+        f"p50={baseline.p50_ms:.1f} ms p95={baseline.p95_ms:.1f} ms"
+    )
+
+
+@pytest.mark.asyncio
+async def test_identical_resave_produces_no_outbox_message(
+    bench_connection: AsyncConnection, bench_user_id
+):
+    note_id = uuid.uuid4()
+
+    async def messages() -> int:
+        return (
+            await bench_connection.execute(
+                text("SELECT count(*) FROM note_outbox WHERE note_id = :id"), {"id": note_id}
+            )
+        ).scalar_one()
+
+    await bench_connection.execute(
+        text("INSERT INTO notes (id, user_id, title, content) VALUES (:id, :u, 'Nota', :c)"),
+        {"id": note_id, "u": bench_user_id, "c": "línea 1\nlínea 2"},
+    )
+    created = await messages()
+    for statement, params in (
+        ("UPDATE notes SET content = :c WHERE id = :id", {"c": "línea 1\r\nlínea 2\n"}),
+        ("UPDATE notes SET title = ' Nota ' WHERE id = :id", {}),
+        ("UPDATE notes SET note_metadata = '{\"a\": 1}' WHERE id = :id", {}),
+    ):
+        await bench_connection.execute(text(statement), {"id": note_id, **params})
+    unchanged = await messages()
+    await bench_connection.execute(
+        text("UPDATE notes SET content = 'otro texto' WHERE id = :id"), {"id": note_id}
+    )
+
+    assert (created, unchanged, await messages()) == (1, 1, 2)
+    print("\n[content hash] re-guardados con el mismo texto: 0 mensajes de outbox")
+
+
+@pytest.mark.asyncio
+async def test_embedding_cache_cold_and_warm(bench_report, bench_engine: AsyncEngine):
+    rng = np.random.default_rng(47)
+    originals = int(EMBED_TEXTS * (1 - DUPLICATE_RATE))
+    corpus = [f"Texto de la nota {i}" for i in range(originals)]
+    corpus += [corpus[i] for i in rng.integers(originals, size=EMBED_TEXTS - originals)]
+    factory = async_sessionmaker(bind=bench_engine, class_=AsyncSession, expire_on_commit=False)
+
+    async def run(embedder: CachedEmbedder) -> tuple[list[float], np.ndarray]:
+        timings: list[float] = []
+        vectors = []
+        for offset in range(0, EMBED_TEXTS, EMBED_BATCH):
+            start = time.perf_counter()
+            vectors.append(await embedder.embed(corpus[offset : offset + EMBED_BATCH]))
+            timings.append((time.perf_counter() - start) * 1000)
+        return timings, np.concatenate(vectors)
+
+    try:
+        model = _SlowEmbedder()
+        embedder = CachedEmbedder(model, factory)
+        cold, cold_vectors = await run(embedder)
+        cold_calls, cold_texts = model.calls, model.texts
+        memory, memory_vectors = await run(embedder)
+        other_model = _SlowEmbedder()
+        database, database_vectors = await run(CachedEmbedder(other_model, factory))
+    finally:
+        async with bench_engine.begin() as connection:
+            await connection.execute(
+                text("DELETE FROM embedding_cache WHERE model = :m"), {"m": BENCH_MODEL}
+            )
+
+    assert cold_texts == len(set(corpus))
+    assert model.calls == cold_calls and other_model.calls == 0
+    np.testing.assert_array_equal(memory_vectors, cold_vectors)
+    np.testing.assert_array_equal(database_vectors, cold_vectors)
+    for name, timings, calls, texts in (
+        ("cold", cold, cold_calls, cold_texts),
+        ("memory", memory, 0, 0),
+        ("database", database, 0, 0),
+    ):
+        stats = bench_report.add(f"content_hash/embed_{name}", timings)
+        print(
+            f"\n[content hash] embeddings {name:<8} lote de {EMBED_BATCH}: "
+            f"p50={stats.p50_ms:.2f} ms p95={stats.p95_ms:.2f} ms, "
+            f"{calls} llamadas y {texts} textos al modelo",
+            end="",
+        )
+    print()
@@ -0,0 +1,166 @@
+# src/pkm_app/tests/benchmarks/test_bench_dataloader.py
+"""
+Sentencias SQL de una página de detalle de nota con y sin DataLoaders.
+
+La página carga la nota, su proyecto, su fuente, sus LINKS enlaces salientes, cada nota
+enlazada y el proyecto de cada nota enlazada (las notas enlazadas se reparten entre
+PROJECTS proyectos). Sin Unit of Work, cada `get_by_id` de proyecto o fuente es su propia
+consulta (más la de `child_projects` de cada proyecto); dentro de un Unit of Work las
+búsquedas lanzadas juntas se agrupan en un `WHERE id = ANY(:ids)` por tipo de entidad y
+los ids repetidos se resuelven de memoria. Las notas enlazadas se siguen leyendo una a una
+en ambos casos: el DataLoader cubre proyectos y fuentes.
+"""
+
+import asyncio
+import uuid
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Any
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+from src.pkm_app.core.application.interfaces.note_interface import INoteRepository
+from src.pkm_app.core.application.interfaces.note_link_interface import INoteLinkRepository
+from src.pkm_app.core.application.interfaces.project_interface import IProjectRepository
+from src.pkm_app.core.application.interfaces.source_interface import ISourceRepository
+from src.pkm_app.infrastructure.persistence.sqlalchemy.instrumentation import track_queries
+from src.pkm_app.infrastructure.persistence.sqlalchemy.repositories import (
+    SQLAlchemyNoteLinkRepository,
+    SQLAlchemyNoteReadRepository,
+    SQLAlchemyProjectRepository,
+    SQLAlchemySourceRepository,
+)
+from src.pkm_app.infrastructure.persistence.sqlalchemy.unit_of_work import (
+    SQLAlchemyReadOnlyUnitOfWork,
+)
+
+LINKS = 10
+PROJECTS = 4
+
+
+async def _seed(connection: AsyncConnection, user_id: str) -> uuid.UUID:
+    """Nota con proyecto, fuente y LINKS enlaces a notas de PROJECTS proyectos."""
+    project_ids = [uuid.uuid4() for _ in range(PROJECTS)]
+    source_id, note_id = uuid.uuid4(), uuid.uuid4()
+    for i, project_id in enumerate(project_ids):
+        await connection.execute(
+            text("INSERT INTO projects (id, user_id, name) VALUES (:id, :user_id, :name)"),
+            {"id": project_id, "user_id": user_id, "name": f"Proyecto {i}"},
+        )
+    await connection.execute(
+        text("INSERT INTO sources (id, user_id, title) VALUES (:id, :user_id, 'Fuente')"),
+        {"id": source_id, "user_id": user_id},
+    )
+    await connection.execute(
+        text(
+            "INSERT INTO notes (id, user_id, project_id, source_id, content) "
+            "VALUES (:id, :user_id, :project_id, :source_id, 'Nota principal')"
+        ),
+        {"id": note_id, "user_id": user_id, "project_id": project_ids[0], "source_id": source_id},
+    )
+    for i in range(LINKS):
+        linked_id = uuid.uuid4()
+        await connection.execute(
+            text(
+                "INSERT INTO notes (id, user_id, project_id, content) "
+                "VALUES (:id, :user_id, :project_id, :content)"
+            ),
+            {
+                "id": linked_id,
+                "user_id": user_id,
+                "project_id": project_ids[i % PROJECTS],
+                "content": f"Nota enlazada {i}",
+            },
+        )
+        await connection.execute(
+            text(
+                "INSERT INTO note_links (id, user_id, source_note_id, target_note_id) "
+                "VALUES (gen_random_uuid(), :user_id, :source, :target)"
+            ),
+            {"user_id": user_id, "source": note_id, "target": linked_id},
+        )
+    return note_id
+
+
+async def _sequential(calls: Sequence[Callable[[], Awaitable[Any]]]) -> list[Any]:
+    return [await call() for call in calls]
+
+
+async def _concurrent(calls: Sequence[Callable[[], Awaitable[Any]]]) -> list[Any]:
+    return list(await asyncio.gather(*(call() for call in calls)))
+
+
+async def _note_detail_page(
+    notes: INoteRepository,
+    projects: IProjectRepository,
+    sources: ISourceRepository,
+    note_links: INoteLinkRepository,
+    note_id: uuid.UUID,
+    user_id: str,
+    run: Callable[[Sequence[Callable[[], Awaitable[Any]]]], Awaitable[list[Any]]],
+) -> dict[str, Any]:
+    note = await notes.get_by_id(note_id, user_id)
+    assert note is not None and note.project_id and note.source_id
+    links = await note_links.get_links_by_source_note(note_id, user_id, limit=LINKS)
+    linked_notes = [await notes.get_by_id(link.target_note_id, user_id) for link in links]
+    project_ids = [note.project_id] + [linked.project_id for linked in linked_notes if linked]
+    calls: list[Callable[[], Awaitable[Any]]] = [
+        lambda project_id=project_id: projects.get_by_id(project_id, user_id)
+        for project_id in project_ids
+    ]
+    calls.append(lambda: sources.get_by_id(note.source_id, user_id))
+    *loaded_projects, source = await run(calls)
+    return {
+        "note": note,
+        "links": links,
+        "linked_notes": linked_notes,
+        "projects": loaded_projects,
+        "source": source,
+    }
+
+
+@pytest.mark.asyncio
+async def test_note_detail_page_query_count(
+    bench_connection: AsyncConnection, bench_session: AsyncSession, bench_user_id: str
+):
+    note_id = await _seed(bench_connection, bench_user_id)
+
+    # Antes: repositorios sin Unit of Work, una consulta por id
+    with track_queries("note_detail/sin_dataloader") as before:
+        unbatched = await _note_detail_page(
+            SQLAlchemyNoteReadRepository(bench_session),
+            SQLAlchemyProjectRepository(bench_session),
+            SQLAlchemySourceRepository(bench_session),
+            SQLAlchemyNoteLinkRepository(bench_session),
+            note_id,
+            bench_user_id,
+            _sequential,
+        )
+    bench_session.expunge_all()
+
+    # Después: mismas llamadas dentro de un Unit of Work, lanzadas juntas
+    with track_queries("note_detail/con_dataloader") as after:
+        async with SQLAlchemyReadOnlyUnitOfWork(bench_session) as uow:
+            batched = await _note_detail_page(
+                uow.notes,
+                uow.projects,
+                uow.sources,
+                uow.note_links,
+                note_id,
+                bench_user_id,
+                _concurrent,
+            )
+
+    print(
+        f"\n[dataloader] página de detalle con {LINKS} enlaces: "
+        f"{before.statements} sentencias ({before.db_time * 1000:.1f} ms) sin DataLoader, "
+        f"{after.statements} ({after.db_time * 1000:.1f} ms) con DataLoader"
+    )
+    assert [p.model_dump() for p in batched["projects"]] == [
+        p.model_dump() for p in unbatched["projects"]
+    ]
+    assert batched["source"] == unbatched["source"]
+    # nota + enlaces + LINKS notas enlazadas + un lote de proyectos + un lote de fuentes
+    assert after.statements == 2 + LINKS + 2
+    assert before.statements > after.statements
@@ -0,0 +1,71 @@
+# src/pkm_app/tests/benchmarks/test_bench_import_time.py
+"""
+Benchmark de tiempo de importación (`python -X importtime`) de los puntos de entrada de la
+capa de persistencia.
+
+Cada módulo se importa REPEAT veces en un proceso limpio y sin variables DB_*, y se informa
+la mediana del tiempo acumulado. Además se comprueba que la importación no crea engines:
+ni el driver asyncpg ni la fábrica de engines deben cargarse hasta el primer uso.
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+REPEAT = int(os.getenv("BENCH_IMPORT_REPEAT", "5"))
+PROJECT_ROOT = Path(__file__).resolve().parents[4]
+
+ENTRY_POINTS = [
+    "src.pkm_app.infrastructure.persistence.sqlalchemy.database",
+    "src.pkm_app.infrastructure.persistence.sqlalchemy.unit_of_work",
+    "src.pkm_app.core.application.use_cases.note.get_note_use_case",
+]
+
+# Módulos que solo deben importarse al crear el primer engine
+DEFERRED_MODULES = {
+    "asyncpg",
+    "src.pkm_app.infrastructure.persistence.sqlalchemy.engine",
+}
+
+
+def _import_time(module: str) -> tuple[float, set[str]]:
+    """Importa `module` en un proceso nuevo; devuelve (ms acumulados, módulos importados)."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT,
+        env={"PATH": os.environ.get("PATH", "")},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    cumulative_us = None
+    imported = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        name = name.strip()
+        imported.add(name)
+        if name == module:
+            cumulative_us = int(cumulative)
+    assert cumulative_us is not None, result.stderr
+    return cumulative_us / 1000, imported
+
+
+@pytest.mark.parametrize("module", ENTRY_POINTS)
+def test_entry_point_import_time(module: str):
+    timings = []
+    imported: set[str] = set()
+    for _ in range(REPEAT):
+        elapsed_ms, imported = _import_time(module)
+        timings.append(elapsed_ms)
+
+    assert not DEFERRED_MODULES & imported, DEFERRED_MODULES & imported
+    print(
+        f"[import] {module} median={statistics.median(timings):.1f}ms "
+        f"min={min(timings):.1f}ms modules={len(imported)}"
+    )
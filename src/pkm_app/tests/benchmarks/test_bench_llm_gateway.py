@@ -0,0 +1,113 @@
+# src/pkm_app/tests/benchmarks/test_bench_llm_gateway.py
+"""
+Benchmark del gateway de modelos de lenguaje con el proveedor falso (sin red).
+
+REQUESTS peticiones deterministas (DUPLICATE_RATE repiten el prompt de otra) llegan de
+CALLERS tareas concurrentes contra un proveedor de CALL_MS por llamada que admite lotes de
+BATCH_SIZE, con MAX_CONCURRENCY llamadas a la vez como máximo:
+
+- Directo: cada petición es una llamada al proveedor, con el mismo límite de concurrencia.
+- Gateway en frío, con la memoria del proceso caliente y desde la tabla compartida (otro
+  proceso): latencia p50/p95 por petición, tiempo total y llamadas al proveedor.
+
+Las entradas de caché usan un proveedor propio del benchmark y se borran al terminar.
+"""
+
+import asyncio
+import os
+import time
+import uuid
+
+import numpy as np
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from src.pkm_app.core.application.dtos import LLMRequest
+from src.pkm_app.infrastructure.llm.fake_provider import FakeLLMProvider
+from src.pkm_app.infrastructure.llm.gateway import LLMGateway
+
+REQUESTS = int(os.getenv("BENCH_LLM_REQUESTS", "2000"))
+DUPLICATE_RATE = float(os.getenv("BENCH_LLM_DUPLICATE_RATE", "0.3"))
+CALLERS = int(os.getenv("BENCH_LLM_CALLERS", "50"))
+CALL_MS = float(os.getenv("BENCH_LLM_CALL_MS", "50"))
+BATCH_SIZE = int(os.getenv("BENCH_LLM_BATCH_SIZE", "16"))
+MAX_CONCURRENCY = int(os.getenv("BENCH_LLM_MAX_CONCURRENCY", "4"))
+BENCH_PROVIDER = f"bench-llm-{uuid.uuid4().hex[:8]}"
+
+
+def _prompts() -> list[str]:
+    rng = np.random.default_rng(49)
+    originals = int(REQUESTS * (1 - DUPLICATE_RATE))
+    prompts = [f"Resume la nota {i}" for i in range(originals)]
+    prompts += [prompts[i] for i in rng.integers(originals, size=REQUESTS - originals)]
+    rng.shuffle(prompts)
+    return prompts
+
+
+async def _run(generate, prompts: list[str]) -> tuple[list[float], float]:
+    """Reparte las peticiones entre CALLERS tareas; latencia de cada una y tiempo total."""
+    timings: list[float] = []
+
+    async def caller(offset: int) -> None:
+        for prompt in prompts[offset::CALLERS]:
+            start = time.perf_counter()
+            await generate(LLMRequest(model="bench", prompt=prompt))
+            timings.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(caller(offset) for offset in range(CALLERS)))
+    return timings, time.perf_counter() - start
+
+
+def _provider() -> FakeLLMProvider:
+    return FakeLLMProvider(
+        name=BENCH_PROVIDER, max_batch_size=BATCH_SIZE, latency=CALL_MS / 1000
+    )
+
+
+@pytest.mark.asyncio
+async def test_gateway_against_direct_provider_calls(bench_report, bench_engine: AsyncEngine):
+    prompts = _prompts()
+    factory = async_sessionmaker(bind=bench_engine, class_=AsyncSession, expire_on_commit=False)
+
+    direct_provider = _provider()
+    limiter = asyncio.Semaphore(MAX_CONCURRENCY)
+
+    async def direct(request: LLMRequest):
+        async with limiter:
+            return (await direct_provider.generate([request]))[0]
+
+    runs = {"direct": (await _run(direct, prompts), len(direct_provider.calls))}
+    try:
+        provider = _provider()
+        # La memoria cabe todas las respuestas: la segunda pasada no llega a la tabla
+        gateway = LLMGateway(
+            provider, factory, max_concurrency=MAX_CONCURRENCY, memory_size=REQUESTS
+        )
+        runs["cold"] = (await _run(gateway.generate, prompts), len(provider.calls))
+        cold_calls = len(provider.calls)
+        runs["memory"] = (await _run(gateway.generate, prompts), len(provider.calls) - cold_calls)
+        other_provider = _provider()
+        other_process = LLMGateway(other_provider, factory, max_concurrency=MAX_CONCURRENCY)
+        runs["database"] = (await _run(other_process.generate, prompts), len(other_provider.calls))
+        usage = gateway.usage()
+    finally:
+        async with bench_engine.begin() as connection:
+            await connection.execute(
+                text("DELETE FROM llm_response_cache WHERE provider = :p"), {"p": BENCH_PROVIDER}
+            )
+
+    assert usage.provider_requests == len(set(prompts))
+    assert runs["memory"][1] == 0 and runs["database"][1] == 0
+    for name, ((timings, total), calls) in runs.items():
+        stats = bench_report.add(f"llm_gateway/{name}", timings)
+        print(
+            f"\n[llm gateway] {name:<8} {REQUESTS} peticiones: p50={stats.p50_ms:.2f} ms "
+            f"p95={stats.p95_ms:.2f} ms, total {total:.2f} s, {calls} llamadas al proveedor",
+            end="",
+        )
+    print(
+        f"\n[llm gateway] frío: {usage.shared} compartidas en vuelo, "
+        f"{usage.provider_requests / max(usage.provider_calls, 1):.1f} peticiones por llamada"
+    )
@@ -0,0 +1,140 @@
+# src/pkm_app/tests/benchmarks/test_bench_logging.py
+"""
+Benchmark del coste del logging en el camino de un caso de uso.
+
+Ejecuta `GetNoteUseCase` CALLS veces sobre una unidad de trabajo en memoria (sin base de
+datos, para aislar el logging) en tres modos:
+
+    off    logging desactivado
+    sync   `LOGGING_CONFIG` aplicado tal cual: el handler escribe desde el hilo del caso de uso
+    queue  `configure_logging()`: los handlers escriben desde el hilo del QueueListener
+
+La salida es un stream que tarda SINK_DELAY_US microsegundos por escritura, para simular una
+consola o un recolector de logs lentos. Se informa la latencia por llamada y las llamadas por
+segundo de cada modo.
+"""
+
+import asyncio
+import logging
+import logging.config
+import os
+import sys
+import time
+import uuid
+from collections.abc import Iterator
+from datetime import UTC, datetime
+
+import pytest
+
+from src.pkm_app import logging_config
+from src.pkm_app.core.application.dtos import NoteSchema
+from src.pkm_app.core.application.use_cases.note.get_note_use_case import GetNoteUseCase
+
+CALLS = int(os.getenv("BENCH_LOGGING_CALLS", "2000"))
+SINK_DELAY_US = int(os.getenv("BENCH_LOGGING_SINK_DELAY_US", "200"))
+
+USER_ID = "bench_user"
+NOW = datetime(2025, 1, 1, tzinfo=UTC)
+
+
+class SlowStream:
+    """Stream que simula una salida lenta (backpressure de stdout)."""
+
+    def __init__(self, delay_us: int) -> None:
+        self.delay = delay_us / 1_000_000
+        self.writes = 0
+
+    def write(self, data: str) -> int:
+        time.sleep(self.delay)
+        self.writes += 1
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+
+class InMemoryNotes:
+    def __init__(self, note: NoteSchema) -> None:
+        self.note = note
+
+    async def get_by_id(self, note_id: uuid.UUID, user_id: str) -> NoteSchema | None:
+        return self.note if note_id == self.note.id and user_id == self.note.user_id else None
+
+
+class InMemoryUnitOfWork:
+    def __init__(self, note: NoteSchema) -> None:
+        self.notes = InMemoryNotes(note)
+
+    async def __aenter__(self) -> "InMemoryUnitOfWork":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        return None
+
+    async def rollback(self) -> None:
+        return None
+
+
+@pytest.fixture
+def restore_logging() -> Iterator[None]:
+    names = [*logging_config.LOGGING_CONFIG["loggers"], ""]
+    saved = {
+        name: (lg.handlers[:], lg.level, lg.propagate, lg.disabled)
+        for name in names
+        for lg in [logging.getLogger(name)]
+    }
+    yield
+    logging_config.shutdown_logging()
+    logging.disable(logging.NOTSET)
+    for name, (handlers, level, propagate, disabled) in saved.items():
+        lg = logging.getLogger(name)
+        lg.handlers, lg.level, lg.propagate, lg.disabled = handlers, level, propagate, disabled
+
+
+def _configure(mode: str) -> None:
+    logging.disable(logging.NOTSET)
+    logging_config.shutdown_logging()
+    if mode == "off":
+        logging.disable(logging.CRITICAL)
+    elif mode == "sync":
+        logging.config.dictConfig(logging_config.LOGGING_CONFIG)
+    else:
+        logging_config.configure_logging(sampling={})
+
+
+async def _run(use_case: GetNoteUseCase, note_id: uuid.UUID) -> list[float]:
+    timings_ms = []
+    for _ in range(CALLS):
+        start = time.perf_counter()
+        await use_case.execute(note_id=note_id, user_id=USER_ID)
+        timings_ms.append((time.perf_counter() - start) * 1000)
+    return timings_ms
+
+
+def test_bench_use_case_throughput_with_logging(bench_report, restore_logging, monkeypatch):
+    note = NoteSchema(
+        id=uuid.uuid4(), user_id=USER_ID, title="Nota", content="texto", created_at=NOW, updated_at=NOW
+    )
+    use_case = GetNoteUseCase(InMemoryUnitOfWork(note))  # type: ignore[arg-type]
+
+    stdout = sys.stdout  # la salida simulada sustituye a sys.stdout durante cada modo
+    results = {}
+    for mode in ("off", "sync", "queue"):
+        sink = SlowStream(SINK_DELAY_US)
+        monkeypatch.setattr(sys, "stdout", sink)
+        _configure(mode)
+        started = time.perf_counter()
+        timings_ms = asyncio.run(_run(use_case, note.id))
+        elapsed = time.perf_counter() - started
+        dropped = logging_config._queue_handler.dropped if logging_config._queue_handler else 0
+        logging_config.shutdown_logging()
+
+        result = bench_report.add(f"logging/get_note/{mode}", timings_ms)
+        results[mode] = result
+        print(
+            f"\n{mode:>5}: {CALLS / elapsed:,.0f} llamadas/s, p50 {result.p50_ms:.3f} ms, "
+            f"p95 {result.p95_ms:.3f} ms, {sink.writes} escrituras, {dropped} descartados",
+            file=stdout,
+        )
+
+    assert results["queue"].p50_ms < results["sync"].p50_ms
@@ -0,0 +1,140 @@
+# src/pkm_app/tests/benchmarks/test_bench_metadata_indexes.py
+"""
+Benchmark de los filtros de metadata JSONB.
+
+Siembra BENCH_METADATA_NOTES notas (por defecto 100000) con metadata variada y comprueba
+con EXPLAIN ANALYZE que los filtros selectivos (~1% de filas) usan los índices de metadata
+(GIN jsonb_path_ops o los índices de expresión de claves calientes). Después compara el
+tiempo de ejecución con el de un plan sin índices (bitmap/index scan desactivados).
+
+El filtro `has_keys` solo tiene índice para claves calientes: usa "reviewed", una de las que
+fija la migración de metadata. Si falta su índice, ese caso se omite.
+
+Los tiempos se toman de "Execution Time" de EXPLAIN ANALYZE: cada EXPLAIN se planifica de
+nuevo, mientras que las sentencias preparadas de asyncpg reutilizarían el plan cacheado
+al cambiar `enable_*scan`.
+"""
+
+import os
+import statistics
+from typing import Any
+
+import pytest
+from sqlalchemy import Select, select, text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from src.pkm_app.core.application.dtos import MetadataFilter
+from src.pkm_app.infrastructure.persistence.sqlalchemy.models import Note as NoteModel
+from src.pkm_app.infrastructure.persistence.sqlalchemy.models import Source as SourceModel
+from src.pkm_app.infrastructure.persistence.sqlalchemy.repositories.metadata_filters import (
+    build_metadata_conditions,
+)
+
+from .utils import explain, used_indexes
+
+NOTES = int(os.getenv("BENCH_METADATA_NOTES", "100000"))
+
+REPEAT = 10
+HOT_KEY_INDEXES = {"has_keys": "ix_notes_note_metadata_key_reviewed"}
+
+SELECTIVE_FILTERS = {
+    "contains": MetadataFilter(contains={"status": "archived"}),
+    "has_keys": MetadataFilter(has_keys=["reviewed"]),
+    "path_equals": MetadataFilter(path_equals={"source.author": "author_7"}),
+}
+
+
+async def _seed_notes(connection: AsyncConnection, user_id: str) -> None:
+    await connection.execute(
+        text(
+            """
+            INSERT INTO notes (id, user_id, content, note_metadata)
+            SELECT gen_random_uuid(), :user_id, 'Benchmark note ' || i,
+                   jsonb_build_object(
+                       'status', CASE WHEN i % 100 = 0 THEN 'archived' ELSE 'active' END,
+                       'priority', i % 5,
+                       'source', jsonb_build_object('author', 'author_' || (i % 100))
+                   ) || CASE WHEN i % 100 = 1 THEN '{"reviewed": true}'::jsonb
+                             ELSE '{}'::jsonb END
+            FROM generate_series(1, :total) AS i
+            """
+        ),
+        {"user_id": user_id, "total": NOTES},
+    )
+    await connection.execute(text("ANALYZE notes"))
+
+
+async def _execution_times(connection: AsyncConnection, stmt: Select[Any]) -> list[float]:
+    return [(await explain(connection, stmt))["Execution Time"] for _ in range(REPEAT)]
+
+
+async def _index_exists(connection: AsyncConnection, index_name: str) -> bool:
+    result = await connection.execute(
+        text("SELECT 1 FROM pg_indexes WHERE indexname = :name"), {"name": index_name}
+    )
+    return result.first() is not None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("filter_name", list(SELECTIVE_FILTERS))
+async def test_note_metadata_filters_use_indexes(
+    bench_connection: AsyncConnection, bench_user_id: str, filter_name: str
+):
+    hot_key_index = HOT_KEY_INDEXES.get(filter_name)
+    if hot_key_index and not await _index_exists(bench_connection, hot_key_index):
+        pytest.skip(f"Falta el índice de clave caliente {hot_key_index}")
+
+    await _seed_notes(bench_connection, bench_user_id)
+    metadata_filter = SELECTIVE_FILTERS[filter_name]
+    stmt = select(NoteModel.id).where(
+        NoteModel.user_id == bench_user_id,
+        *build_metadata_conditions(NoteModel.note_metadata, metadata_filter),
+    )
+
+    explained = await explain(bench_connection, stmt)
+    indexes = used_indexes(explained)
+    assert any("metadata" in index for index in indexes), explained["Plan"]
+
+    rows = (await bench_connection.execute(stmt)).all()
+    assert len(rows) == NOTES // 100
+
+    indexed = await _execution_times(bench_connection, stmt)
+    await bench_connection.execute(text("SET LOCAL enable_bitmapscan = off"))
+    await bench_connection.execute(text("SET LOCAL enable_indexscan = off"))
+    unindexed = await _execution_times(bench_connection, stmt)
+    await bench_connection.execute(text("RESET enable_bitmapscan"))
+    await bench_connection.execute(text("RESET enable_indexscan"))
+
+    print(
+        f"[metadata] {filter_name:<12} indexes={sorted(indexes)} "
+        f"median={statistics.median(indexed):.2f}ms "
+        f"median_sin_indices={statistics.median(unindexed):.2f}ms"
+    )
+    assert statistics.median(indexed) < statistics.median(unindexed)
+
+
+@pytest.mark.asyncio
+async def test_source_metadata_filter_uses_gin_index(
+    bench_connection: AsyncConnection, bench_user_id: str
+):
+    await bench_connection.execute(
+        text(
+            """
+            INSERT INTO sources (id, user_id, title, link_metadata)
+            SELECT gen_random_uuid(), :user_id, 'Source ' || i,
+                   jsonb_build_object('site', 'site_' || (i % 1000), 'lang', 'es')
+            FROM generate_series(1, :total) AS i
+            """
+        ),
+        {"user_id": bench_user_id, "total": NOTES},
+    )
+    await bench_connection.execute(text("ANALYZE sources"))
+
+    stmt = select(SourceModel.id).where(
+        SourceModel.user_id == bench_user_id,
+        *build_metadata_conditions(
+            SourceModel.link_metadata, MetadataFilter(contains={"site": "site_3"})
+        ),
+    )
+    explained = await explain(bench_connection, stmt)
+    assert "ix_sources_link_metadata_gin" in used_indexes(explained), explained["Plan"]
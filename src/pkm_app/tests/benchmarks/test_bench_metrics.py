@@ -0,0 +1,158 @@
+# src/pkm_app/tests/benchmarks/test_bench_metrics.py
+"""
+Sobrecoste de las métricas (`infrastructure/monitoring`) sobre una petición real.
+
+Ejecuta `GetNoteUseCase` contra PostgreSQL REQUESTS veces con las métricas activadas y
+desactivadas (rondas alternas, para repartir el ruido de la base de datos) y cuenta las
+anotaciones que produce una petición: observaciones del caso de uso, llamadas a repositorio
+medidas y consultas a la caché de SQL compilado. El sobrecoste se calcula con el coste de
+cada anotación medido aparte, que es estable, y se compara con la duración media de la
+petición: debe quedar por debajo de MAX_OVERHEAD. La diferencia directa entre ambos modos se
+informa también, pero depende del ruido de la base de datos.
+"""
+
+import os
+import time
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.pkm_app.core.application.use_cases.note.get_note_use_case import GetNoteUseCase
+from src.pkm_app.infrastructure.monitoring.collectors import (
+    CACHE_REQUESTS,
+    REPOSITORY_DURATION,
+    USE_CASE_DURATION,
+    timed_repository,
+)
+from src.pkm_app.infrastructure.monitoring.metrics import (
+    Counter,
+    Histogram,
+    set_metrics_enabled,
+)
+from src.pkm_app.infrastructure.persistence.sqlalchemy.unit_of_work import (
+    SQLAlchemyReadOnlyUnitOfWork,
+)
+from src.pkm_app.tests.benchmarks.seed import SeedVolumes, seed
+
+pytestmark = pytest.mark.asyncio
+
+REQUESTS = int(os.getenv("BENCH_METRICS_REQUESTS", "200"))
+ROUNDS = int(os.getenv("BENCH_METRICS_ROUNDS", "6"))
+MICRO_CALLS = 100_000
+MAX_OVERHEAD = 0.02
+
+
+def _histogram_total(histogram: Histogram) -> int:
+    return sum(cumulative[-1] for cumulative, _ in histogram.values().values())
+
+
+def _counter_total(counter: Counter, cache: str) -> int:
+    return int(sum(value for (name, _), value in counter.values().items() if name == cache))
+
+
+def _per_call_seconds(function, calls: int = MICRO_CALLS) -> float:
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(calls):
+            function()
+        best = min(best, time.perf_counter() - start)
+    return best / calls
+
+
+async def _per_call_seconds_async(function, calls: int = MICRO_CALLS // 10) -> float:
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(calls):
+            await function()
+        best = min(best, time.perf_counter() - start)
+    return best / calls
+
+
+@timed_repository
+class _NoopRepository:
+    async def get(self) -> None:
+        return None
+
+
+class _PlainRepository:
+    async def get(self) -> None:
+        return None
+
+
+async def test_bench_metrics_overhead(
+    bench_connection, bench_session: AsyncSession, bench_report
+):
+    seeded = await seed(bench_connection, SeedVolumes(users=1, notes=50, links=10))
+    user_id = seeded.user_ids[0]
+    note_ids = [seeded.id("note", 0, i) for i in range(1, 51)]
+    use_case = GetNoteUseCase(SQLAlchemyReadOnlyUnitOfWork(bench_session))
+
+    async def run(count: int) -> list[float]:
+        timings_ms = []
+        for i in range(count):
+            start = time.perf_counter()
+            await use_case.execute(note_id=note_ids[i % len(note_ids)], user_id=user_id)
+            timings_ms.append((time.perf_counter() - start) * 1000)
+        return timings_ms
+
+    await run(50)  # calentamiento: conexiones y caché de SQL compilado
+
+    # Anotaciones que produce una petición
+    before = (
+        _histogram_total(USE_CASE_DURATION),
+        _histogram_total(REPOSITORY_DURATION),
+        _counter_total(CACHE_REQUESTS, "sql_compiled"),
+    )
+    await run(1)
+    use_case_observations, repository_calls, cache_records = (
+        after - prior
+        for after, prior in zip(
+            (
+                _histogram_total(USE_CASE_DURATION),
+                _histogram_total(REPOSITORY_DURATION),
+                _counter_total(CACHE_REQUESTS, "sql_compiled"),
+            ),
+            before,
+        )
+    )
+
+    timings: dict[str, list[float]] = {"on": [], "off": []}
+    try:
+        for _ in range(ROUNDS):
+            for mode in ("off", "on"):
+                set_metrics_enabled(mode == "on")
+                timings[mode].extend(await run(REQUESTS))
+    finally:
+        set_metrics_enabled(True)
+
+    # Coste de cada anotación, medido aislado
+    histogram = Histogram("bench_overhead_seconds", "Bench.", ("a", "b"), registry=None)
+    counter = Counter("bench_overhead_total", "Bench.", ("a", "b"), registry=None)
+    observe_s = _per_call_seconds(lambda: histogram.observe(0.003, "GetNoteUseCase", "success"))
+    inc_s = _per_call_seconds(lambda: counter.inc("sql_compiled", "hit"))
+    wrapper_s = await _per_call_seconds_async(_NoopRepository().get) - (
+        await _per_call_seconds_async(_PlainRepository().get)
+    )
+
+    cost_s = (
+        use_case_observations * observe_s
+        + repository_calls * max(wrapper_s, observe_s)
+        + cache_records * inc_s
+    )
+    result_on = bench_report.add("metrics/get_note/on", timings["on"])
+    result_off = bench_report.add("metrics/get_note/off", timings["off"])
+    overhead = cost_s / (result_on.mean_ms / 1000)
+    print(
+        f"\nPetición: {result_on.mean_ms:.3f} ms (on) / {result_off.mean_ms:.3f} ms (off); "
+        f"anotaciones por petición: {use_case_observations} caso de uso, "
+        f"{repository_calls} repositorio, {cache_records} caché; "
+        f"observe {observe_s * 1e9:.0f} ns, inc {inc_s * 1e9:.0f} ns, "
+        f"envoltorio de repositorio {wrapper_s * 1e9:.0f} ns; "
+        f"sobrecoste {overhead:.3%} (diferencia medida "
+        f"{(result_on.mean_ms - result_off.mean_ms) / result_off.mean_ms:+.2%})"
+    )
+
+    assert use_case_observations == 1 and repository_calls >= 1
+    assert overhead < MAX_OVERHEAD
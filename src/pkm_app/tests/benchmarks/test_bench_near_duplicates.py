@@ -0,0 +1,215 @@
+# src/pkm_app/tests/benchmarks/test_bench_near_duplicates.py
+"""
+Benchmark de la detección de notas casi duplicadas (MinHash + LSH, `note_minhash`).
+
+- Búsqueda de candidatos: latencia p50/p95 de `find_candidates` más la verificación de la
+  similitud estimada para una nota, sobre NOTES notas de un usuario, frente a leer todas las
+  firmas del usuario y compararlas en NumPy. El plan debe usar el índice GIN de las claves.
+- Recall: de CLUSTERS grupos sembrados de CLUSTER_SIZE notas (cada una es la firma base con
+  MUTATION de sus posiciones cambiadas), qué fracción de las parejas se encuentra.
+- Agrupación de todo el usuario con `find_candidate_buckets` (pocas repeticiones: recorre
+  todas las claves).
+- Coste de escritura: calcular la firma de una nota de NOTE_WORDS palabras y guardarla.
+
+Las firmas de las NOTES notas son sintéticas (valores uint32 aleatorios), así que la siembra
+no depende del texto; todo se escribe en una transacción que se revierte.
+"""
+
+import os
+import time
+import uuid
+
+import numpy as np
+import pytest
+from sqlalchemy import insert, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+from src.pkm_app.core.application.minhash import (
+    NUM_PERM,
+    SIGNATURE_DTYPE,
+    band_keys,
+    estimated_jaccard,
+    minhash_signature,
+)
+from src.pkm_app.infrastructure.persistence.sqlalchemy.repositories.minhash_repository import (
+    FIND_CANDIDATES,
+    MINHASH,
+    SQLAlchemyNearDuplicateRepository,
+)
+
+NOTES = int(os.getenv("BENCH_NEAR_DUP_NOTES", "1000000"))
+CLUSTERS = int(os.getenv("BENCH_NEAR_DUP_CLUSTERS", "1000"))
+CLUSTER_SIZE = int(os.getenv("BENCH_NEAR_DUP_CLUSTER_SIZE", "5"))
+MUTATION = float(os.getenv("BENCH_NEAR_DUP_MUTATION", "0.05"))
+QUERIES = int(os.getenv("BENCH_NEAR_DUP_QUERIES", "200"))
+SCAN_QUERIES = int(os.getenv("BENCH_NEAR_DUP_SCAN_QUERIES", "5"))
+NOTE_WORDS = int(os.getenv("BENCH_NEAR_DUP_NOTE_WORDS", "400"))
+WRITES = int(os.getenv("BENCH_NEAR_DUP_WRITES", "200"))
+THRESHOLD = 0.8
+INSERT_CHUNK = 10_000
+
+
+def _signatures(rng: np.random.Generator) -> tuple[np.ndarray, np.ndarray]:
+    """Firmas de NOTES notas; las primeras CLUSTERS * CLUSTER_SIZE forman los grupos."""
+    signatures = rng.integers(0, 2**32, size=(NOTES, NUM_PERM), dtype=np.uint32)
+    planted = CLUSTERS * CLUSTER_SIZE
+    clusters = np.repeat(np.arange(CLUSTERS), CLUSTER_SIZE)
+    signatures[:planted] = signatures[clusters * CLUSTER_SIZE]
+    mutated = rng.random((planted, NUM_PERM)) < MUTATION
+    signatures[:planted][mutated] = rng.integers(0, 2**32, size=mutated.sum(), dtype=np.uint32)
+    return signatures.astype(SIGNATURE_DTYPE), clusters
+
+
+async def _seed(
+    connection: AsyncConnection, user_id: str, signatures: np.ndarray
+) -> list[uuid.UUID]:
+    await connection.execute(
+        text(
+            "INSERT INTO notes (id, user_id, content) "
+            "SELECT gen_random_uuid(), :u, 'nota ' || i FROM generate_series(1, :n) AS i"
+        ),
+        {"u": user_id, "n": NOTES},
+    )
+    note_ids = list(
+        (
+            await connection.execute(
+                text("SELECT id FROM notes WHERE user_id = :u ORDER BY id"), {"u": user_id}
+            )
+        ).scalars()
+    )
+    keys = band_keys(user_id, signatures)
+    for offset in range(0, NOTES, INSERT_CHUNK):
+        end = min(offset + INSERT_CHUNK, NOTES)
+        await connection.execute(
+            insert(MINHASH),
+            [
+                {
+                    "note_id": note_ids[i],
+                    "user_id": user_id,
+                    "signature": signatures[i].tobytes(),
+                    "band_keys": keys[i].tolist(),
+                }
+                for i in range(offset, end)
+            ],
+        )
+    await connection.execute(text("ANALYZE note_minhash"))
+    return note_ids
+
+
+@pytest.mark.asyncio
+async def test_near_duplicate_lookup_latency_and_recall(
+    bench_report, bench_connection: AsyncConnection, bench_session: AsyncSession, bench_user_id
+):
+    rng = np.random.default_rng(48)
+    signatures, clusters = _signatures(rng)
+    start = time.perf_counter()
+    note_ids = await _seed(bench_connection, bench_user_id, signatures)
+    seed_s = time.perf_counter() - start
+    repo = SQLAlchemyNearDuplicateRepository(bench_session)
+
+    plan = "\n".join(
+        (
+            await bench_connection.execute(
+                text(
+                    "EXPLAIN "
+                    + str(
+                        FIND_CANDIDATES.params(
+                            user_id=bench_user_id, note_id=note_ids[0], limit=1000
+                        ).compile(
+                            dialect=bench_connection.dialect,
+                            compile_kwargs={"literal_binds": True},
+                        )
+                    )
+                )
+            )
+        ).scalars()
+    )
+    assert "ix_note_minhash_band_keys" in plan, plan
+
+    queries = rng.integers(CLUSTERS * CLUSTER_SIZE, size=QUERIES)
+    timings: list[float] = []
+    found_pairs = expected_pairs = candidates_seen = 0
+    for i in queries.tolist():
+        start = time.perf_counter()
+        candidates = await repo.find_candidates(bench_user_id, note_ids[i], 1000)
+        similar = set()
+        if candidates:
+            estimates = estimated_jaccard(signatures[i], np.stack(list(candidates.values())))
+            similar = {c for c, s in zip(candidates, estimates.tolist()) if s >= THRESHOLD}
+        timings.append((time.perf_counter() - start) * 1000)
+        members = np.flatnonzero(clusters == clusters[i])
+        expected = {note_ids[j] for j in members.tolist() if j != i}
+        found_pairs += len(expected & similar)
+        expected_pairs += len(expected)
+        candidates_seen += len(candidates)
+    recall = found_pairs / expected_pairs
+    stats = bench_report.add("near_duplicates/find_candidates", timings)
+
+    scan: list[float] = []
+    for i in queries[:SCAN_QUERIES].tolist():
+        start = time.perf_counter()
+        result = await bench_connection.execute(
+            text("SELECT note_id, signature FROM note_minhash WHERE user_id = :u"),
+            {"u": bench_user_id},
+        )
+        ids, blobs = zip(*result)
+        matrix = np.frombuffer(b"".join(blobs), dtype=SIGNATURE_DTYPE).reshape(-1, NUM_PERM)
+        matches = np.flatnonzero(estimated_jaccard(signatures[i], matrix) >= THRESHOLD)
+        scan.append((time.perf_counter() - start) * 1000)
+        assert note_ids[i] in {ids[j] for j in matches.tolist()}
+    baseline = bench_report.add("near_duplicates/full_scan", scan)
+
+    buckets: list[float] = []
+    for _ in range(SCAN_QUERIES):
+        start = time.perf_counter()
+        groups = await repo.find_candidate_buckets(bench_user_id, 100)
+        buckets.append((time.perf_counter() - start) * 1000)
+    bucket_stats = bench_report.add("near_duplicates/find_candidate_buckets", buckets)
+
+    assert recall >= 0.95
+    print(
+        f"\n[near duplicates] {NOTES} notas sembradas en {seed_s:.0f} s, {CLUSTERS} grupos de "
+        f"{CLUSTER_SIZE}: candidatos p50={stats.p50_ms:.2f} ms p95={stats.p95_ms:.2f} ms "
+        f"({candidates_seen / QUERIES:.1f} por consulta), recall={recall:.3f}; leer y comparar "
+        f"todas las firmas p50={baseline.p50_ms:.0f} ms; cubos de todo el usuario "
+        f"p50={bucket_stats.p50_ms:.0f} ms ({len(groups)} cubos)"
+    )
+
+
+@pytest.mark.asyncio
+async def test_signature_write_overhead(
+    bench_report, bench_connection: AsyncConnection, bench_session: AsyncSession, bench_user_id
+):
+    rng = np.random.default_rng(49)
+    vocabulary = [f"palabra{i}" for i in range(5000)]
+    texts = [" ".join(rng.choice(vocabulary, NOTE_WORDS)) for _ in range(WRITES)]
+    note_ids = list(
+        (
+            await bench_connection.execute(
+                text(
+                    "INSERT INTO notes (id, user_id, content) SELECT gen_random_uuid(), :u, c "
+                    "FROM unnest(CAST(:texts AS text[])) AS c RETURNING id"
+                ),
+                {"u": bench_user_id, "texts": texts},
+            )
+        ).scalars()
+    )
+    repo = SQLAlchemyNearDuplicateRepository(bench_session)
+
+    compute: list[float] = []
+    save: list[float] = []
+    for note_id, content in zip(note_ids, texts):
+        start = time.perf_counter()
+        signature = minhash_signature(content)
+        computed = time.perf_counter()
+        await repo.save_signatures(bench_user_id, {note_id: signature})
+        compute.append((computed - start) * 1000)
+        save.append((time.perf_counter() - computed) * 1000)
+    compute_stats = bench_report.add("near_duplicates/compute_signature", compute)
+    save_stats = bench_report.add("near_duplicates/save_signature", save)
+
+    print(
+        f"\n[near duplicates] nota de {NOTE_WORDS} palabras: firma p50="
+        f"{compute_stats.p50_ms:.2f} ms p95={compute_stats.p95_ms:.2f} ms, guardarla p50="
+        f"{save_stats.p50_ms:.2f} ms p95={save_stats.p95_ms:.2f} ms"
+    )
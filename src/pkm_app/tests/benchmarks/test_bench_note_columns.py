@@ -0,0 +1,86 @@
+# src/pkm_app/tests/benchmarks/test_bench_note_columns.py
+"""
+Benchmark de la lectura masiva en lotes columnares (`stream_columns`).
+
+Siembra NOTES notas y las recorre con un cursor del servidor en lotes de BATCH_SIZE. Se
+informa la memoria de los lotes frente a la de SAMPLE objetos NoteSchema equivalentes
+(medida con tracemalloc) y las notas por segundo de la lectura.
+"""
+
+import os
+import time
+import tracemalloc
+
+import numpy as np
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+from src.pkm_app.infrastructure.persistence.sqlalchemy.repositories.note_repository import (
+    SQLAlchemyNoteRepository,
+)
+
+NOTES = int(os.getenv("BENCH_COLUMNS_NOTES", "200000"))
+BATCH_SIZE = int(os.getenv("BENCH_COLUMNS_BATCH_SIZE", "50000"))
+SAMPLE = 2000
+TYPES = ["markdown", "text", "code", "mixed"]
+
+
+async def _seed(connection: AsyncConnection, user_id: str) -> None:
+    await connection.execute(
+        text(
+            """
+            INSERT INTO notes (id, user_id, title, content, type, note_metadata, created_at,
+                               updated_at)
+            SELECT gen_random_uuid(), :user_id, 'Nota ' || i, repeat('texto ', 40),
+                   (CAST(:types AS text[]))[1 + i % 4], jsonb_build_object('i', i),
+                   now() - i * interval '1 minute', now() - i * interval '1 second'
+            FROM generate_series(1, :n) AS i
+            """
+        ),
+        {"user_id": user_id, "n": NOTES, "types": TYPES},
+    )
+
+
+@pytest.mark.asyncio
+async def test_stream_columns_fits_in_tens_of_mb(
+    bench_connection: AsyncConnection, bench_session: AsyncSession, bench_user_id: str
+):
+    await _seed(bench_connection, bench_user_id)
+    repository = SQLAlchemyNoteRepository(bench_session)
+
+    start = time.perf_counter()
+    batches = [batch async for batch in repository.stream_columns(bench_user_id, BATCH_SIZE)]
+    elapsed = time.perf_counter() - start
+
+    assert sum(len(batch) for batch in batches) == NOTES
+    assert max(len(batch) for batch in batches) <= BATCH_SIZE
+    columns_bytes = sum(batch.nbytes for batch in batches)
+
+    # Coinciden con la base de datos
+    last = batches[-1]
+    row = (
+        await bench_connection.execute(
+            text("SELECT type, updated_at FROM notes WHERE id = :id"), {"id": last.note_id(0)}
+        )
+    ).one()
+    assert last.note_type(0) == row.type
+    assert last.updated_at[0] == np.datetime64(row.updated_at.replace(tzinfo=None), "us")
+    assert set().union(*(batch.type_categories for batch in batches)) == set(TYPES)
+
+    # Memoria de SAMPLE notas como NoteSchema (sin keywords ni relaciones)
+    tracemalloc.start()
+    notes = await repository.list_by_user(bench_user_id, limit=SAMPLE)
+    schema_bytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(notes) == SAMPLE
+
+    per_note_columns = columns_bytes / NOTES
+    per_note_schema = schema_bytes / SAMPLE
+    print(
+        f"[columns] {NOTES} notas en {len(batches)} lotes: {columns_bytes / 2**20:.1f} MB "
+        f"({per_note_columns:.0f} B/nota) vs NoteSchema≈{per_note_schema:,.0f} B/nota; "
+        f"1M notas ≈ {per_note_columns * 1e6 / 2**20:.0f} MB vs "
+        f"{per_note_schema * 1e6 / 2**30:.1f} GB; {NOTES / elapsed:,.0f} notas/s"
+    )
+    assert per_note_columns * 20 < per_note_schema
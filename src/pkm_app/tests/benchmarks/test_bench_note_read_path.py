@@ -0,0 +1,123 @@
+# src/pkm_app/tests/benchmarks/test_bench_note_read_path.py
+"""
+Benchmark del camino de lectura Core (`SQLAlchemyNoteReadRepository`) frente al ORM
+(`SQLAlchemyNoteRepository`).
+
+Siembra NOTES notas con proyecto y KEYWORDS_PER_NOTE keywords cada una y lee páginas de
+PAGE_SIZE notas con `list_by_user`. Se informa el rendimiento en filas por segundo de CPU
+del proceso (un núcleo, ya que el event loop es monohilo): así se mide el coste de
+hidratación en el cliente y no la latencia de la base de datos.
+"""
+
+import os
+import time
+import uuid
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+from src.pkm_app.core.application.dtos import NoteSchema
+from src.pkm_app.infrastructure.persistence.sqlalchemy.repositories.note_read_repository import (
+    SQLAlchemyNoteReadRepository,
+)
+from src.pkm_app.infrastructure.persistence.sqlalchemy.repositories.note_repository import (
+    SQLAlchemyNoteRepository,
+)
+
+NOTES = int(os.getenv("BENCH_READ_PATH_NOTES", "2000"))
+KEYWORDS_PER_NOTE = 3
+PAGE_SIZE = 100
+ROUNDS = int(os.getenv("BENCH_READ_PATH_ROUNDS", "5"))
+
+
+async def _seed(connection: AsyncConnection, user_id: str) -> uuid.UUID:
+    project_id = uuid.uuid4()
+    await connection.execute(
+        text("INSERT INTO projects (id, user_id, name) VALUES (:id, :user_id, 'Bench project')"),
+        {"id": project_id, "user_id": user_id},
+    )
+    await connection.execute(
+        text(
+            """
+            INSERT INTO keywords (id, user_id, name)
+            SELECT gen_random_uuid(), :user_id, 'kw_' || i FROM generate_series(1, 50) AS i
+            """
+        ),
+        {"user_id": user_id},
+    )
+    await connection.execute(
+        text(
+            """
+            INSERT INTO notes (id, user_id, project_id, title, content, note_metadata, updated_at)
+            SELECT gen_random_uuid(), :user_id, :project_id, 'Nota ' || i, repeat('texto ', 40),
+                   jsonb_build_object('i', i), now() - i * interval '1 second'
+            FROM generate_series(1, :n) AS i
+            """
+        ),
+        {"user_id": user_id, "project_id": project_id, "n": NOTES},
+    )
+    await connection.execute(
+        text(
+            """
+            INSERT INTO note_keywords (note_id, keyword_id)
+            SELECT n.id, k.id
+            FROM notes n
+            CROSS JOIN LATERAL (
+                SELECT id FROM keywords
+                WHERE user_id = :user_id AND n.id IS NOT NULL
+                ORDER BY random() LIMIT :per_note
+            ) AS k
+            WHERE n.user_id = :user_id
+            """
+        ),
+        {"user_id": user_id, "per_note": KEYWORDS_PER_NOTE},
+    )
+    # Los datos no están confirmados, así que autovacuum no puede analizarlos; sin
+    # estadísticas el planificador subestima la tabla y elige mal el plan del LATERAL.
+    await connection.execute(text("ANALYZE notes, note_keywords, keywords, projects"))
+    return project_id
+
+
+def _normalized(note: NoteSchema) -> dict:
+    data = note.model_dump()
+    data["keywords"] = sorted(data["keywords"], key=lambda keyword: keyword["name"])
+    return data
+
+
+async def _rows_per_cpu_second(repository, user_id: str) -> float:
+    rows = 0
+    start = time.process_time()
+    for _ in range(ROUNDS):
+        for skip in range(0, NOTES, PAGE_SIZE):
+            rows += len(await repository.list_by_user(user_id, skip=skip, limit=PAGE_SIZE))
+    return rows / (time.process_time() - start)
+
+
+@pytest.mark.asyncio
+async def test_core_read_path_matches_orm_and_is_faster(
+    bench_connection: AsyncConnection, bench_session: AsyncSession, bench_user_id: str
+):
+    await _seed(bench_connection, bench_user_id)
+    orm = SQLAlchemyNoteRepository(bench_session)
+    core = SQLAlchemyNoteReadRepository(bench_session)
+
+    # Mismos DTOs por ambos caminos (las keywords del ORM no tienen orden garantizado)
+    orm_page = await orm.list_by_user(bench_user_id, limit=PAGE_SIZE)
+    core_page = await core.list_by_user(bench_user_id, limit=PAGE_SIZE)
+    assert [_normalized(n) for n in core_page] == [_normalized(n) for n in orm_page]
+    first = orm_page[0]
+    assert _normalized(await core.get_by_id(first.id, bench_user_id)) == _normalized(
+        await orm.get_by_id(first.id, bench_user_id)
+    )
+    bench_session.expunge_all()
+
+    orm_rate = await _rows_per_cpu_second(orm, bench_user_id)
+    bench_session.expunge_all()
+    core_rate = await _rows_per_cpu_second(core, bench_user_id)
+
+    print(
+        f"[read-path] list_by_user páginas de {PAGE_SIZE}: ORM={orm_rate:,.0f} filas/s-CPU "
+        f"Core={core_rate:,.0f} filas/s-CPU ({core_rate / orm_rate:.1f}x)"
+    )
+    assert core_rate > orm_rate
@@ -0,0 +1,138 @@
+# src/pkm_app/tests/benchmarks/test_bench_note_writes.py
+"""
+Latencia y sentencias SQL de `create` y `update` de notas con proyecto y fuente.
+
+El repositorio valida las referencias dentro del propio INSERT/UPDATE (`WHERE EXISTS`),
+obtiene el id con RETURNING y relee la nota con sus relaciones en un único SELECT: dos
+idas y vueltas por escritura. Como referencia se mide el camino anterior, reproducido
+aquí: una consulta por referencia, flush del ORM y dos `refresh`.
+"""
+
+import os
+import uuid
+from typing import Any
+
+import pytest
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+from src.pkm_app.core.application.dtos import NoteCreate, NoteUpdate
+from src.pkm_app.infrastructure.persistence.sqlalchemy.instrumentation import track_queries
+from src.pkm_app.infrastructure.persistence.sqlalchemy.models import Note as NoteModel
+from src.pkm_app.infrastructure.persistence.sqlalchemy.models import Project as ProjectModel
+from src.pkm_app.infrastructure.persistence.sqlalchemy.models import Source as SourceModel
+from src.pkm_app.infrastructure.persistence.sqlalchemy.repositories.note_repository import (
+    SQLAlchemyNoteRepository,
+)
+
+from .utils import time_async
+
+ROUNDS = int(os.getenv("BENCH_NOTE_WRITES_ROUNDS", "200"))
+
+
+async def _seed(connection: AsyncConnection, user_id: str) -> tuple[uuid.UUID, uuid.UUID]:
+    project_id, source_id = uuid.uuid4(), uuid.uuid4()
+    await connection.execute(
+        text("INSERT INTO projects (id, user_id, name) VALUES (:id, :user_id, 'Proyecto')"),
+        {"id": project_id, "user_id": user_id},
+    )
+    await connection.execute(
+        text("INSERT INTO sources (id, user_id, title) VALUES (:id, :user_id, 'Fuente')"),
+        {"id": source_id, "user_id": user_id},
+    )
+    return project_id, source_id
+
+
+async def _check_reference(session: AsyncSession, model: Any, ref_id: Any, user_id: str) -> None:
+    if ref_id is None:
+        return
+    result = await session.execute(
+        select(model.id).where(model.id == ref_id, model.user_id == user_id)
+    )
+    assert result.scalar_one_or_none() is not None
+
+
+async def _legacy_create(session: AsyncSession, note_in: NoteCreate, user_id: str) -> NoteModel:
+    """Camino anterior de `create`: consulta por referencia, flush y dos refresh."""
+    await _check_reference(session, ProjectModel, note_in.project_id, user_id)
+    await _check_reference(session, SourceModel, note_in.source_id, user_id)
+    data = note_in.model_dump(exclude_unset=True, exclude={"keywords"})
+    note = NoteModel(**data, user_id=user_id)
+    session.add(note)
+    await session.flush()
+    await session.refresh(note, attribute_names=["id", "created_at", "updated_at"])
+    await session.refresh(note, attribute_names=["keywords", "project", "source"])
+    return note
+
+
+async def _legacy_update(
+    repository: SQLAlchemyNoteRepository, note_id: uuid.UUID, note_in: NoteUpdate, user_id: str
+) -> NoteModel:
+    """Camino anterior de `update`: carga la nota, valida cada referencia, flush y refresh."""
+    session = repository.session
+    note = await repository._get_note_instance(note_id, user_id)
+    assert note is not None
+    for field, value in note_in.model_dump(exclude_unset=True, exclude={"keywords"}).items():
+        if field == "project_id":
+            await _check_reference(session, ProjectModel, value, user_id)
+        elif field == "source_id":
+            await _check_reference(session, SourceModel, value, user_id)
+        setattr(note, field, value)
+    await session.flush()
+    await session.refresh(note, attribute_names=["updated_at"])
+    await session.refresh(note, attribute_names=["keywords", "project", "source"])
+    return note
+
+
+@pytest.mark.asyncio
+async def test_note_writes_take_two_round_trips(
+    bench_connection: AsyncConnection,
+    bench_session: AsyncSession,
+    bench_user_id: str,
+    bench_report,
+):
+    project_id, source_id = await _seed(bench_connection, bench_user_id)
+    repository = SQLAlchemyNoteRepository(bench_session)
+    note_in = NoteCreate(
+        title="Nota", content="Contenido", project_id=project_id, source_id=source_id
+    )
+    edit = NoteUpdate(content="Editado", project_id=project_id, source_id=source_id)
+    note = await repository.create(note_in, bench_user_id)  # calienta cachés y SAVEPOINT
+
+    with track_queries("note_writes/create") as create_stats:
+        created = await repository.create(note_in, bench_user_id)
+    with track_queries("note_writes/update") as update_stats:
+        updated = await repository.update(note.id, edit, bench_user_id)
+    assert created.project and created.project.id == project_id
+    assert created.source and created.source.id == source_id
+    assert updated is not None and updated.content == "Editado"
+    assert create_stats.statements == 2, create_stats.report()
+    assert update_stats.statements == 2, update_stats.report()
+
+    with track_queries("note_writes/legacy") as legacy_stats:
+        await _legacy_create(bench_session, note_in, bench_user_id)
+    bench_session.expunge_all()
+
+    timings = {
+        "create": await time_async(
+            lambda: repository.create(note_in, bench_user_id), repeat=ROUNDS
+        ),
+        "update": await time_async(
+            lambda: repository.update(note.id, edit, bench_user_id), repeat=ROUNDS
+        ),
+        "legacy_create": await time_async(
+            lambda: _legacy_create(bench_session, note_in, bench_user_id), repeat=ROUNDS
+        ),
+        "legacy_update": await time_async(
+            lambda: _legacy_update(repository, note.id, edit, bench_user_id), repeat=ROUNDS
+        ),
+    }
+    results = {name: bench_report.add(f"note_writes/{name}", t) for name, t in timings.items()}
+    print(
+        f"\n[note-writes] create: {create_stats.statements} sentencias, "
+        f"p50 {results['create'].p50_ms:.2f} ms (antes {legacy_stats.statements}, "
+        f"p50 {results['legacy_create'].p50_ms:.2f} ms); update: {update_stats.statements} "
+        f"sentencias, p50 {results['update'].p50_ms:.2f} ms "
+        f"(antes p50 {results['legacy_update'].p50_ms:.2f} ms)"
+    )
+    assert legacy_stats.statements > create_stats.statements
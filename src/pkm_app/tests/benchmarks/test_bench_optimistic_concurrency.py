@@ -0,0 +1,168 @@
+# src/pkm_app/tests/benchmarks/test_bench_optimistic_concurrency.py
+"""
+Contención en ediciones concurrentes de proyectos: `SELECT ... FOR UPDATE` frente a versiones.
+
+WRITERS dispositivos editan EDITS veces cada uno los mismos ROWS proyectos. Cada edición lee
+el proyecto, "piensa" THINK_MS fuera de cualquier transacción (el usuario edita en su
+dispositivo) y guarda con `SQLAlchemyProjectRepository.update` en su propia transacción:
+
+- pesimista (camino anterior, reproducido aquí): el repositorio bloquea la fila con
+  `FOR UPDATE` hasta el commit y la escritura no lleva versión esperada, así que la última
+  gana. Se cuentan las ediciones perdidas: las que pisan un cambio que el dispositivo no
+  había leído.
+- optimista: sin bloqueo previo, `expected_version` = la versión leída; si otra escritura
+  llegó antes (ConcurrencyError) el dispositivo vuelve a leer y reintenta.
+
+Imprime el throughput (ediciones/s), la latencia por edición, las ediciones perdidas y los
+conflictos reintentados. Los proyectos se crean con commit (cada dispositivo usa su propia
+conexión) y se eliminan al terminar.
+"""
+
+import asyncio
+import os
+import time
+import uuid
+from dataclasses import dataclass, field
+
+import pytest
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.pkm_app.core.application.dtos import ProjectUpdate
+from src.pkm_app.core.domain.errors import ConcurrencyError
+from src.pkm_app.infrastructure.config.settings import get_settings
+from src.pkm_app.infrastructure.persistence.sqlalchemy.database import get_async_database_url
+from src.pkm_app.infrastructure.persistence.sqlalchemy.engine import create_async_db_engine
+from src.pkm_app.infrastructure.persistence.sqlalchemy.models import Project as ProjectModel
+from src.pkm_app.infrastructure.persistence.sqlalchemy.repositories.project_repository import (
+    SQLAlchemyProjectRepository,
+)
+
+WRITERS = int(os.getenv("BENCH_CONCURRENCY_WRITERS", "8"))
+EDITS = int(os.getenv("BENCH_CONCURRENCY_EDITS", "10"))
+ROWS = int(os.getenv("BENCH_CONCURRENCY_ROWS", "4"))
+THINK_MS = float(os.getenv("BENCH_CONCURRENCY_THINK_MS", "20"))
+
+
+class _LockingProjectRepository(SQLAlchemyProjectRepository):
+    """Camino anterior de `update`: la fila se lee con `FOR UPDATE`."""
+
+    async def _get_project_instance(
+        self, project_id: uuid.UUID, user_id: str, include_children: bool = False
+    ) -> ProjectModel | None:
+        stmt = (
+            select(ProjectModel)
+            .where(ProjectModel.id == project_id, ProjectModel.user_id == user_id)
+            .with_for_update()
+        )
+        return (await self.session.execute(stmt)).scalar_one_or_none()
+
+
+@dataclass
+class _Outcome:
+    timings: list[float] = field(default_factory=list)
+    lost_updates: int = 0
+    conflicts: int = 0
+
+
+async def _edit(
+    session_factory: async_sessionmaker[AsyncSession],
+    project_id: uuid.UUID,
+    user_id: str,
+    optimistic: bool,
+    outcome: _Outcome,
+) -> None:
+    repository_class = SQLAlchemyProjectRepository if optimistic else _LockingProjectRepository
+    while True:
+        async with session_factory() as session:
+            project = await SQLAlchemyProjectRepository(session).get_by_id(project_id, user_id)
+        assert project is not None and project.version is not None
+        await asyncio.sleep(THINK_MS / 1000)
+        project_in = ProjectUpdate(
+            name=project.name, description=f"editado {time.perf_counter_ns()}"
+        )
+        try:
+            async with session_factory() as session, session.begin():
+                saved = await repository_class(session).update(
+                    project_id,
+                    project_in,
+                    user_id,
+                    expected_version=project.version if optimistic else None,
+                )
+        except ConcurrencyError:
+            outcome.conflicts += 1
+            continue
+        assert saved is not None and saved.version is not None
+        if saved.version != project.version + 1:
+            outcome.lost_updates += 1
+        return
+
+
+async def _run(
+    session_factory: async_sessionmaker[AsyncSession],
+    project_ids: list[uuid.UUID],
+    user_id: str,
+    optimistic: bool,
+) -> tuple[_Outcome, float]:
+    outcome = _Outcome()
+
+    async def device(offset: int) -> None:
+        for i in range(EDITS):
+            start = time.perf_counter()
+            await _edit(
+                session_factory, project_ids[(offset + i) % ROWS], user_id, optimistic, outcome
+            )
+            outcome.timings.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(device(offset) for offset in range(WRITERS)))
+    return outcome, time.perf_counter() - start
+
+
+@pytest.mark.asyncio
+async def test_concurrent_project_edits(bench_report):
+    engine = create_async_db_engine(get_async_database_url(), get_settings())
+    session_factory = async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+    user_id = f"bench_user_{uuid.uuid4()}"
+    project_ids = [uuid.uuid4() for _ in range(ROWS)]
+    async with engine.begin() as connection:
+        await connection.execute(
+            text("INSERT INTO user_profiles (user_id, name) VALUES (:user_id, 'Benchmark user')"),
+            {"user_id": user_id},
+        )
+        for i, project_id in enumerate(project_ids):
+            await connection.execute(
+                text("INSERT INTO projects (id, user_id, name) VALUES (:id, :user_id, :name)"),
+                {"id": project_id, "user_id": user_id, "name": f"Proyecto {i}"},
+            )
+
+    try:
+        for name, optimistic in (("pesimista", False), ("optimista", True)):
+            outcome, elapsed = await _run(session_factory, project_ids, user_id, optimistic)
+            result = bench_report.add(f"project_edits/{name}", outcome.timings)
+            print(
+                f"\n[concurrencia] {name:<10} {WRITERS * EDITS / elapsed:7.1f} ediciones/s "
+                f"p50={result.p50_ms:.1f} ms p95={result.p95_ms:.1f} ms "
+                f"perdidas={outcome.lost_updates} conflictos reintentados={outcome.conflicts}"
+            )
+            if optimistic:
+                assert outcome.lost_updates == 0
+
+        async with engine.connect() as connection:
+            versions = (
+                await connection.execute(
+                    text("SELECT sum(version - 1) FROM projects WHERE user_id = :u"),
+                    {"u": user_id},
+                )
+            ).scalar_one()
+        # Toda edición guardada incrementa la versión una vez, también las que pisan otra
+        assert versions == 2 * WRITERS * EDITS
+    finally:
+        async with engine.begin() as connection:
+            await connection.execute(
+                text("DELETE FROM projects WHERE user_id = :u"), {"u": user_id}
+            )
+            await connection.execute(
+                text("DELETE FROM user_profiles WHERE user_id = :u"), {"u": user_id}
+            )
+        await engine.dispose()
@@ -0,0 +1,232 @@
+# src/pkm_app/tests/benchmarks/test_bench_outbox.py
+"""
+Benchmark del outbox de notas y su relay hacia el almacén vectorial.
+
+Cada caso escribe en PostgreSQL (con commit: el relay usa sus propias conexiones) NOTES
+notas, ROUNDS ediciones de las mismas HOT notas y DELETED borrados, y drena el outbox hacia
+un `InMemoryVectorStore` que simula el coste de red de cada llamada (STORE_CALL_MS):
+
+- lote de 1 mensaje frente a lotes de `OutboxRelay.DEFAULT_BATCH_SIZE`: mensajes/s y
+  llamadas al almacén (las ediciones de una nota dentro de un lote se reducen a una);
+- RELAYS relays a la vez con un almacén que falla en FAILURE_RATE de las llamadas, mientras
+  se sigue escribiendo: al terminar, el almacén coincide con la base de datos.
+
+Antes de medir se drena lo que hubiera en el outbox (otros benchmarks, backfill) y al
+terminar se borran los usuarios creados.
+"""
+
+import asyncio
+import os
+import random
+import time
+import uuid
+from collections.abc import AsyncIterator
+from datetime import timedelta
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from src.pkm_app.core.application.dtos import NoteIndexBatch
+from src.pkm_app.infrastructure.outbox.relay import OutboxRelay
+from src.pkm_app.infrastructure.vector_store.in_memory_store import InMemoryVectorStore
+
+NOTES = int(os.getenv("BENCH_OUTBOX_NOTES", "1000"))
+HOT = int(os.getenv("BENCH_OUTBOX_HOT", "100"))
+ROUNDS = int(os.getenv("BENCH_OUTBOX_ROUNDS", "10"))
+DELETED = int(os.getenv("BENCH_OUTBOX_DELETED", "50"))
+STORE_CALL_MS = float(os.getenv("BENCH_OUTBOX_STORE_CALL_MS", "2"))
+RELAYS = int(os.getenv("BENCH_OUTBOX_RELAYS", "4"))
+FAILURE_RATE = float(os.getenv("BENCH_OUTBOX_FAILURE_RATE", "0.2"))
+
+
+class _RemoteStore(InMemoryVectorStore):
+    """Almacén en memoria con la latencia de una llamada de red y fallos opcionales."""
+
+    def __init__(self, failure_rate: float = 0.0, seed: int = 0) -> None:
+        super().__init__()
+        self.calls = 0
+        self.failures = 0
+        self._failure_rate = failure_rate
+        self._random = random.Random(seed)
+
+    async def apply(self, batch: NoteIndexBatch) -> None:
+        self.calls += 1
+        await asyncio.sleep(STORE_CALL_MS / 1000)
+        if self._random.random() < self._failure_rate:
+            self.failures += 1
+            raise ConnectionError("almacén no disponible")
+        await super().apply(batch)
+
+
+class _ImpatientRelay(OutboxRelay):
+    """Reintenta enseguida para que el benchmark no espere el backoff real."""
+
+    BASE_RETRY_DELAY = timedelta(milliseconds=10)
+
+
+async def _drain(relay: OutboxRelay) -> int:
+    claimed = 0
+    while (result := await relay.run_once()).claimed:
+        claimed += result.claimed
+    return claimed
+
+
+@pytest_asyncio.fixture
+async def session_factory(bench_engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    factory = async_sessionmaker(bind=bench_engine, class_=AsyncSession, expire_on_commit=False)
+    await _drain(OutboxRelay(InMemoryVectorStore(), factory))
+    return factory
+
+
+@pytest_asyncio.fixture
+async def make_user(bench_engine: AsyncEngine) -> AsyncIterator:
+    users: list[str] = []
+
+    async def make() -> str:
+        user_id = f"bench_user_{uuid.uuid4()}"
+        async with bench_engine.begin() as connection:
+            await connection.execute(
+                text("INSERT INTO user_profiles (user_id, name) VALUES (:u, 'Benchmark user')"),
+                {"u": user_id},
+            )
+        users.append(user_id)
+        return user_id
+
+    yield make
+    async with bench_engine.begin() as connection:
+        for user_id in users:
+            for table in ("notes", "user_profiles", "change_log"):
+                await connection.execute(
+                    text(f"DELETE FROM {table} WHERE user_id = :u"), {"u": user_id}
+                )
+            await connection.execute(
+                text("DELETE FROM note_outbox WHERE user_id = :u"), {"u": user_id}
+            )
+
+
+async def _write_workload(engine: AsyncEngine, user_id: str) -> int:
+    """Altas, ediciones de las notas calientes y borrados; devuelve los mensajes generados."""
+    async with engine.begin() as connection:
+        note_ids = (
+            await connection.execute(
+                text(
+                    """
+                    INSERT INTO notes (id, user_id, title, content)
+                    SELECT gen_random_uuid(), :u, 'Nota ' || i, repeat('texto ', 40)
+                    FROM generate_series(1, :n) AS i
+                    RETURNING id
+                    """
+                ),
+                {"u": user_id, "n": NOTES},
+            )
+        ).scalars().all()
+    for round_ in range(ROUNDS):
+        async with engine.begin() as connection:
+            await connection.execute(
+                text(
+                    "UPDATE notes SET content = 'Edición ' || :r, version = version + 1 "
+                    "WHERE id = ANY(:ids)"
+                ),
+                {"r": str(round_), "ids": list(note_ids[:HOT])},
+            )
+    async with engine.begin() as connection:
+        await connection.execute(
+            text("DELETE FROM notes WHERE id = ANY(:ids)"), {"ids": list(note_ids[-DELETED:])}
+        )
+    return NOTES + ROUNDS * HOT + DELETED
+
+
+async def _assert_store_matches_database(
+    engine: AsyncEngine, store: InMemoryVectorStore, user_id: str
+) -> None:
+    async with engine.connect() as connection:
+        rows = (
+            await connection.execute(
+                text("SELECT id, version, content FROM notes WHERE user_id = :u"), {"u": user_id}
+            )
+        ).all()
+    indexed = {
+        document.note_id: (document.version, document.content)
+        for document in store.documents.values()
+        if document.user_id == user_id
+    }
+    assert indexed == {note_id: (version, content) for note_id, version, content in rows}
+
+
+@pytest.mark.asyncio
+async def test_outbox_rows_share_the_note_transaction(bench_engine, make_user):
+    user_id = await make_user()
+    note_id = uuid.uuid4()
+    async with bench_engine.connect() as connection:
+        transaction = await connection.begin()
+        await connection.execute(
+            text("INSERT INTO notes (id, user_id, content) VALUES (:id, :u, 'x')"),
+            {"id": note_id, "u": user_id},
+        )
+        await transaction.rollback()
+        pending = await connection.execute(
+            text("SELECT count(*) FROM note_outbox WHERE note_id = :id"), {"id": note_id}
+        )
+        assert pending.scalar_one() == 0
+
+
+@pytest.mark.asyncio
+async def test_batched_relay_throughput(bench_report, bench_engine, session_factory, make_user):
+    for name, batch_size in (("batch_1", 1), ("batch_default", OutboxRelay.DEFAULT_BATCH_SIZE)):
+        user_id = await make_user()
+        messages = await _write_workload(bench_engine, user_id)
+        store = _RemoteStore()
+        relay = OutboxRelay(store, session_factory, batch_size=batch_size, name=name)
+
+        start = time.perf_counter()
+        claimed = await _drain(relay)
+        elapsed = time.perf_counter() - start
+
+        assert claimed == messages
+        await _assert_store_matches_database(bench_engine, store, user_id)
+        deliveries = sum(len(batch) for batch in store.batches)
+        bench_report.add(f"outbox/{name}", [elapsed * 1000])
+        print(
+            f"\n[outbox] {name:<14} {messages} mensajes en {elapsed:6.2f} s "
+            f"({messages / elapsed:7.0f} mensajes/s), {store.calls} llamadas al almacén, "
+            f"{deliveries} entregas"
+        )
+
+
+@pytest.mark.asyncio
+async def test_concurrent_relays_converge_despite_failures(
+    bench_engine, session_factory, make_user
+):
+    user_id = await make_user()
+    store = _RemoteStore(failure_rate=FAILURE_RATE, seed=42)
+    relays = [
+        _ImpatientRelay(store, session_factory, batch_size=50, name=f"relay_{i}")
+        for i in range(RELAYS)
+    ]
+    stop = asyncio.Event()
+    workers = [asyncio.create_task(relay.run(stop, idle_interval=0.01)) for relay in relays]
+    try:
+        messages = await _write_workload(bench_engine, user_id)
+        # Hasta que no quede nada del usuario en el outbox (incluidos los reintentos)
+        async with bench_engine.connect() as connection:
+            deadline = time.perf_counter() + 60
+            while time.perf_counter() < deadline:
+                pending = await connection.execute(
+                    text("SELECT count(*) FROM note_outbox WHERE user_id = :u"), {"u": user_id}
+                )
+                await connection.commit()
+                if pending.scalar_one() == 0:
+                    break
+                await asyncio.sleep(0.05)
+    finally:
+        stop.set()
+        await asyncio.gather(*workers)
+
+    await _assert_store_matches_database(bench_engine, store, user_id)
+    print(
+        f"\n[outbox] {RELAYS} relays, {messages} mensajes: {store.calls} llamadas, "
+        f"{store.failures} fallidas y reintentadas"
+    )
+    assert store.failures > 0
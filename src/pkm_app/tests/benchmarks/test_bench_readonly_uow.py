@@ -0,0 +1,85 @@
+# src/pkm_app/tests/benchmarks/test_bench_readonly_uow.py
+"""
+Benchmark del Unit of Work de solo lectura frente al transaccional.
+
+Ejecuta REQUESTS llamadas secuenciales a GetNoteUseCase con cada UoW y compara la latencia
+por petición. El UoW transaccional abre una transacción (BEGIN), crea los cinco repositorios
+y hace ROLLBACK al salir; el de solo lectura usa el pool en autocommit y crea solo el
+repositorio que se consulta.
+"""
+
+import os
+import statistics
+import time
+import uuid
+from collections.abc import Callable
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+
+from src.pkm_app.core.application.interfaces.unit_of_work_interface import IReadOnlyUnitOfWork
+from src.pkm_app.core.application.use_cases.note.get_note_use_case import GetNoteUseCase
+from src.pkm_app.infrastructure.persistence.sqlalchemy.database import (
+    dispose_engines,
+    get_async_readonly_engine,
+    get_async_readonly_sessionmaker,
+    get_async_sessionmaker,
+)
+from src.pkm_app.infrastructure.persistence.sqlalchemy.unit_of_work import (
+    SQLAlchemyReadOnlyUnitOfWork,
+    SQLAlchemyUnitOfWork,
+)
+
+REQUESTS = int(os.getenv("BENCH_READONLY_REQUESTS", "500"))
+WARMUP = 20
+
+
+async def _latencies(
+    make_uow: Callable[[], IReadOnlyUnitOfWork], note_id: uuid.UUID, user_id: str
+) -> list[float]:
+    timings = []
+    for i in range(WARMUP + REQUESTS):
+        start = time.perf_counter()
+        note = await GetNoteUseCase(make_uow()).execute(note_id, user_id)
+        if i >= WARMUP:
+            timings.append((time.perf_counter() - start) * 1000)
+        assert note.id == note_id
+    return timings
+
+
+@pytest.mark.asyncio
+async def test_readonly_uow_per_request_overhead(committed_note: tuple[str, uuid.UUID]):
+    user_id, note_id = committed_note
+    try:
+        write_factory = get_async_sessionmaker()
+        read_factory = get_async_readonly_sessionmaker()
+        transactional = await _latencies(
+            lambda: SQLAlchemyUnitOfWork(write_factory), note_id, user_id
+        )
+        read_only = await _latencies(
+            lambda: SQLAlchemyReadOnlyUnitOfWork(read_factory), note_id, user_id
+        )
+    finally:
+        await dispose_engines()
+
+    transactional_median = statistics.median(transactional)
+    read_only_median = statistics.median(read_only)
+    print(
+        f"[readonly-uow] transaccional median={transactional_median:.3f}ms "
+        f"solo_lectura median={read_only_median:.3f}ms "
+        f"ahorro={transactional_median - read_only_median:.3f}ms/petición"
+    )
+    assert read_only_median < transactional_median
+
+
+@pytest.mark.asyncio
+async def test_readonly_engine_rejects_writes():
+    try:
+        async with get_async_readonly_engine().connect() as connection:
+            with pytest.raises(DBAPIError, match="read-only transaction"):
+                await connection.execute(
+                    text("INSERT INTO user_profiles (user_id, name) VALUES ('ro_check', 'x')")
+                )
+    finally:
+        await dispose_engines()
@@ -0,0 +1,559 @@
+# src/pkm_app/tests/benchmarks/test_bench_repositories.py
+"""
+Suite de rendimiento de los repositorios SQLAlchemy y de los casos de uso principales.
+
+Siembra una vez por módulo un conjunto de datos con los volúmenes de `SeedVolumes.from_env()`
+(ver seed.py) y mide cada método de cada `SQLAlchemy*Repository` y varios casos de uso:
+REPEAT llamadas tras WARMUP de calentamiento, rotando por usuarios y filas sembradas. Los
+percentiles y el rendimiento de cada caso van al informe JSON de la sesión (ver report.py).
+
+Las escrituras se ejecutan en savepoints de la transacción del módulo, que se revierte al
+terminar; las que borran filas borran primero filas creadas para ello (fuera de la medición).
+
+Los casos de métodos con defectos conocidos se marcan como `xfail` estricto con el motivo:
+siguen ejecutándose y, cuando se corrija el defecto, el benchmark falla para recordar quitar
+la marca y empezar a medirlos.
+"""
+
+import os
+import time
+import uuid
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+from src.pkm_app.core.application.dtos import (
+    KeywordCreate,
+    KeywordUpdate,
+    MetadataFilter,
+    NoteCreate,
+    NoteLinkCreate,
+    NoteLinkUpdate,
+    NoteUpdate,
+    ProjectCreate,
+    ProjectUpdate,
+    SourceCreate,
+    SourceUpdate,
+    UserProfileCreate,
+    UserProfileUpdate,
+)
+from src.pkm_app.core.application.use_cases.keyword.create_keyword_use_case import (
+    CreateKeywordUseCase,
+)
+from src.pkm_app.core.application.use_cases.note.create_note_use_case import CreateNoteUseCase
+from src.pkm_app.core.application.use_cases.note.get_note_use_case import GetNoteUseCase
+from src.pkm_app.core.application.use_cases.note.list_notes_use_case import ListNotesUseCase
+from src.pkm_app.core.application.use_cases.note.search_notes_by_project_use_case import (
+    SearchNotesByProjectUseCase,
+)
+from src.pkm_app.core.application.use_cases.note.update_note_use_case import UpdateNoteUseCase
+from src.pkm_app.core.application.use_cases.note_link.list_note_links_use_case import (
+    ListNoteLinksUseCase,
+)
+from src.pkm_app.infrastructure.config.settings import get_settings
+from src.pkm_app.infrastructure.persistence.sqlalchemy.database import get_async_database_url
+from src.pkm_app.infrastructure.persistence.sqlalchemy.engine import create_async_db_engine
+from src.pkm_app.infrastructure.persistence.sqlalchemy.repositories import (
+    SQLAlchemyKeywordRepository,
+    SQLAlchemyNoteLinkRepository,
+    SQLAlchemyNoteReadRepository,
+    SQLAlchemyNoteRepository,
+    SQLAlchemyProjectRepository,
+    SQLAlchemySourceRepository,
+    SQLAlchemyUserProfileRepository,
+)
+from src.pkm_app.infrastructure.persistence.sqlalchemy.unit_of_work import (
+    SQLAlchemyReadOnlyUnitOfWork,
+    SQLAlchemyUnitOfWork,
+)
+from src.pkm_app.tests.benchmarks.report import BenchmarkReport
+from src.pkm_app.tests.benchmarks.seed import (
+    LINK_TYPES,
+    NOTE_TYPES,
+    SOURCE_TYPES,
+    SeededData,
+    SeedVolumes,
+    seed,
+)
+
+REPEAT = int(os.getenv("BENCH_REPEAT", "50"))
+WARMUP = int(os.getenv("BENCH_WARMUP", "5"))
+
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+
+@dataclass
+class Context:
+    """Sesión del caso y acceso a las filas sembradas, rotando con el número de iteración."""
+
+    session: AsyncSession
+    data: SeededData
+
+    def user(self, i: int) -> str:
+        return self.data.user_ids[i % len(self.data.user_ids)]
+
+    def seeded(self, kind: str, i: int, count: int, offset: int = 0) -> uuid.UUID:
+        """Id de la fila `kind` número (i + offset) del usuario de la iteración `i`."""
+        return self.data.id(kind, i % len(self.data.user_ids), 1 + (i + offset) % count)
+
+    def note(self, i: int, offset: int = 0) -> uuid.UUID:
+        return self.seeded("note", i, self.data.volumes.notes, offset)
+
+    def project(self, i: int) -> uuid.UUID:
+        return self.seeded("project", i, self.data.volumes.projects)
+
+    def source(self, i: int) -> uuid.UUID:
+        return self.seeded("source", i, self.data.volumes.sources)
+
+    def keyword(self, i: int) -> uuid.UUID:
+        return self.seeded("keyword", i, self.data.volumes.keywords)
+
+    def link(self, i: int) -> uuid.UUID:
+        return self.seeded("link", i, self.data.volumes.links)
+
+    def keyword_name(self, i: int) -> str:
+        return self.data.keyword_name(1 + i % self.data.volumes.keywords)
+
+    def unique(self, i: int) -> str:
+        """Sufijo único para las filas creadas por el benchmark."""
+        return f"{self.data.run}_{i}_{uuid.uuid4().hex[:6]}"
+
+
+Run = Callable[[Context, int, Any], Awaitable[Any]]
+Prepare = Callable[[Context, int], Awaitable[Any]]
+
+
+@dataclass(frozen=True)
+class Case:
+    name: str
+    run: Run
+    prepare: Prepare | None = None
+    known_issue: str | None = None
+
+
+def _notes(ctx: Context) -> SQLAlchemyNoteRepository:
+    return SQLAlchemyNoteRepository(ctx.session)
+
+
+def _core_notes(ctx: Context) -> SQLAlchemyNoteReadRepository:
+    return SQLAlchemyNoteReadRepository(ctx.session)
+
+
+def _keywords(ctx: Context) -> SQLAlchemyKeywordRepository:
+    return SQLAlchemyKeywordRepository(ctx.session)
+
+
+def _projects(ctx: Context) -> SQLAlchemyProjectRepository:
+    return SQLAlchemyProjectRepository(ctx.session)
+
+
+def _sources(ctx: Context) -> SQLAlchemySourceRepository:
+    return SQLAlchemySourceRepository(ctx.session)
+
+
+def _links(ctx: Context) -> SQLAlchemyNoteLinkRepository:
+    return SQLAlchemyNoteLinkRepository(ctx.session)
+
+
+def _profiles(ctx: Context) -> SQLAlchemyUserProfileRepository:
+    return SQLAlchemyUserProfileRepository(ctx.session)
+
+
+def _new_note(ctx: Context, i: int) -> NoteCreate:
+    return NoteCreate(
+        title=f"Nueva {i}",
+        content="Contenido " * 20,
+        type=NOTE_TYPES[i % len(NOTE_TYPES)],
+        project_id=ctx.project(i),
+        keywords=[ctx.keyword_name(i + k) for k in range(3)] + [f"nueva_{ctx.unique(i)}"],
+    )
+
+
+async def _created_note(ctx: Context, i: int) -> uuid.UUID:
+    return (await _notes(ctx).create(_new_note(ctx, i), ctx.user(i))).id
+
+
+async def _created_keyword(ctx: Context, i: int) -> uuid.UUID:
+    return (await _keywords(ctx).create(KeywordCreate(name=ctx.unique(i)), ctx.user(i))).id
+
+
+async def _created_project(ctx: Context, i: int) -> uuid.UUID:
+    return (await _projects(ctx).create(ProjectCreate(name=ctx.unique(i)), ctx.user(i))).id
+
+
+async def _created_project_tree(ctx: Context, i: int) -> uuid.UUID:
+    """Proyecto con un subproyecto que a su vez tiene otro; devuelve la raíz."""
+    root = await _created_project(ctx, i)
+    parent_id = root
+    for _ in range(2):
+        project_in = ProjectCreate(name=ctx.unique(i), parent_project_id=parent_id)
+        parent_id = (await _projects(ctx).create(project_in, ctx.user(i))).id
+    return root
+
+
+async def _created_source(ctx: Context, i: int) -> uuid.UUID:
+    return (await _sources(ctx).create(SourceCreate(title=ctx.unique(i)), ctx.user(i))).id
+
+
+async def _created_link(ctx: Context, i: int) -> uuid.UUID:
+    link = NoteLinkCreate(
+        source_note_id=ctx.note(i), target_note_id=ctx.note(i, offset=1), link_type=ctx.unique(i)
+    )
+    return (await _links(ctx).create(link, ctx.user(i))).id
+
+
+async def _created_profile(ctx: Context, i: int) -> str:
+    user_id = ctx.unique(i)
+    await _profiles(ctx).create(UserProfileCreate(user_id=user_id, name=f"Perfil {i}"))
+    return user_id
+
+
+METADATA_FILTER = MetadataFilter(contains={"status": "draft"})
+
+# Defectos conocidos de los repositorios, detectados por esta suite
+NOT_LOADED_RELATIONS = (
+    "No carga project/source de forma ansiosa: el acceso perezoso falla en async (MissingGreenlet)"
+)
+
+CASES = [
+    # --- SQLAlchemyNoteRepository (ORM) ---
+    Case("notes.get_by_id", lambda c, i, _: _notes(c).get_by_id(c.note(i), c.user(i))),
+    Case(
+        "notes.list_by_user",
+        lambda c, i, _: _notes(c).list_by_user(c.user(i), skip=i, limit=50),
+        known_issue=NOT_LOADED_RELATIONS,
+    ),
+    Case("notes.create", lambda c, i, _: _notes(c).create(_new_note(c, i), c.user(i))),
+    Case(
+        "notes.update",
+        lambda c, i, _: _notes(c).update(
+            c.note(i),
+            NoteUpdate(title=f"Editada {i}", keywords=[c.keyword_name(i), c.keyword_name(i + 1)]),
+            c.user(i),
+        ),
+    ),
+    Case("notes.delete", lambda c, i, note_id: _notes(c).delete(note_id, c.user(i)), _created_note),
+    Case(
+        "notes.search_by_title_or_content",
+        lambda c, i, _: _notes(c).search_by_title_or_content(c.user(i), f"Nota {i % 100}"),
+        known_issue=NOT_LOADED_RELATIONS,
+    ),
+    Case(
+        "notes.search_by_project",
+        lambda c, i, _: _notes(c).search_by_project(c.project(i), c.user(i)),
+        known_issue=NOT_LOADED_RELATIONS,
+    ),
+    Case(
+        "notes.search_by_keyword_name",
+        lambda c, i, _: _notes(c).search_by_keyword_name(c.keyword_name(i), None, c.user(i)),
+        known_issue=NOT_LOADED_RELATIONS,
+    ),
+    Case(
+        "notes.search_by_keyword_names",
+        lambda c, i, _: _notes(c).search_by_keyword_names(
+            [c.keyword_name(i), c.keyword_name(i + 1)], c.project(i), c.user(i)
+        ),
+        known_issue=NOT_LOADED_RELATIONS,
+    ),
+    Case(
+        "notes.search_by_metadata",
+        lambda c, i, _: _notes(c).search_by_metadata(c.user(i), METADATA_FILTER),
+    ),
+    # --- SQLAlchemyNoteReadRepository (Core) ---
+    Case("notes_core.get_by_id", lambda c, i, _: _core_notes(c).get_by_id(c.note(i), c.user(i))),
+    Case(
+        "notes_core.list_by_user",
+        lambda c, i, _: _core_notes(c).list_by_user(c.user(i), skip=i, limit=50),
+    ),
+    Case(
+        "notes_core.search_by_title_or_content",
+        lambda c, i, _: _core_notes(c).search_by_title_or_content(c.user(i), f"Nota {i % 100}"),
+    ),
+    Case(
+        "notes_core.search_by_project",
+        lambda c, i, _: _core_notes(c).search_by_project(c.project(i), c.user(i)),
+    ),
+    Case(
+        "notes_core.search_by_keyword_name",
+        lambda c, i, _: _core_notes(c).search_by_keyword_name(c.keyword_name(i), None, c.user(i)),
+    ),
+    Case(
+        "notes_core.search_by_keyword_names",
+        lambda c, i, _: _core_notes(c).search_by_keyword_names(
+            [c.keyword_name(i), c.keyword_name(i + 1)], c.project(i), c.user(i)
+        ),
+    ),
+    Case(
+        "notes_core.search_by_metadata",
+        lambda c, i, _: _core_notes(c).search_by_metadata(c.user(i), METADATA_FILTER),
+    ),
+    # --- SQLAlchemyKeywordRepository ---
+    Case("keywords.get_by_id", lambda c, i, _: _keywords(c).get_by_id(c.keyword(i), c.user(i))),
+    Case("keywords.list_by_user", lambda c, i, _: _keywords(c).list_by_user(c.user(i), limit=100)),
+    Case(
+        "keywords.create",
+        lambda c, i, _: _keywords(c).create(KeywordCreate(name=c.unique(i)), c.user(i)),
+    ),
+    Case(
+        "keywords.update",
+        lambda c, i, kw_id: _keywords(c).update(kw_id, KeywordUpdate(name=c.unique(i)), c.user(i)),
+        _created_keyword,
+    ),
+    Case(
+        "keywords.delete",
+        lambda c, i, kw_id: _keywords(c).delete(kw_id, c.user(i)),
+        _created_keyword,
+    ),
+    Case(
+        "keywords.get_by_name",
+        lambda c, i, _: _keywords(c).get_by_name(c.keyword_name(i), c.user(i)),
+    ),
+    # --- SQLAlchemyProjectRepository ---
+    Case("projects.get_by_id", lambda c, i, _: _projects(c).get_by_id(c.project(i), c.user(i))),
+    Case("projects.list_by_user", lambda c, i, _: _projects(c).list_by_user(c.user(i))),
+    Case(
+        "projects.create",
+        lambda c, i, _: _projects(c).create(ProjectCreate(name=c.unique(i)), c.user(i)),
+    ),
+    Case(
+        "projects.update",
+        lambda c, i, _: _projects(c).update(
+            c.project(i), ProjectUpdate(name=f"Proyecto {i}", description=f"Editado {i}"), c.user(i)
+        ),
+    ),
+    Case(
+        "projects.delete",
+        lambda c, i, project_id: _projects(c).delete(project_id, c.user(i)),
+        _created_project,
+    ),
+    Case(
+        "projects.delete_with_subprojects",
+        lambda c, i, project_id: _projects(c).delete(project_id, c.user(i)),
+        _created_project_tree,
+    ),
+    Case(
+        "projects.get_children",
+        lambda c, i, _: _projects(c).get_children(c.project(i), c.user(i)),
+    ),
+    Case(
+        "projects.validate_hierarchy",
+        lambda c, i, _: _projects(c).validate_hierarchy(
+            c.seeded("project", i, c.data.volumes.projects, offset=5), c.project(i), c.user(i)
+        ),
+    ),
+    Case("projects.get_root_projects", lambda c, i, _: _projects(c).get_root_projects(c.user(i))),
+    # --- SQLAlchemySourceRepository ---
+    Case("sources.get_by_id", lambda c, i, _: _sources(c).get_by_id(c.source(i), c.user(i))),
+    Case("sources.list_by_user", lambda c, i, _: _sources(c).list_by_user(c.user(i))),
+    Case(
+        "sources.create",
+        lambda c, i, _: _sources(c).create(
+            SourceCreate(type="web", title=c.unique(i), url=f"https://new.local/{c.unique(i)}"),
+            c.user(i),
+        ),
+    ),
+    Case(
+        "sources.update",
+        lambda c, i, _: _sources(c).update(
+            c.source(i), SourceUpdate(description=f"Editada {i}"), c.user(i)
+        ),
+    ),
+    Case(
+        "sources.delete",
+        lambda c, i, source_id: _sources(c).delete(source_id, c.user(i)),
+        _created_source,
+    ),
+    Case(
+        "sources.search_by_type",
+        lambda c, i, _: _sources(c).search_by_type(SOURCE_TYPES[i % len(SOURCE_TYPES)], c.user(i)),
+    ),
+    Case(
+        "sources.search_by_url",
+        lambda c, i, _: _sources(c).search_by_url(
+            f"https://bench.local/{c.user(i)}/{1 + i % c.data.volumes.sources}", c.user(i)
+        ),
+    ),
+    Case(
+        "sources.search_by_title",
+        lambda c, i, _: _sources(c).search_by_title("Fuente 1", c.user(i)),
+    ),
+    Case(
+        "sources.search_by_metadata",
+        lambda c, i, _: _sources(c).search_by_metadata(
+            c.user(i), MetadataFilter(contains={"author": f"Autor {i % 10}"})
+        ),
+    ),
+    # --- SQLAlchemyNoteLinkRepository ---
+    Case("note_links.get_by_id", lambda c, i, _: _links(c).get_by_id(c.link(i), c.user(i))),
+    Case("note_links.list_by_user", lambda c, i, _: _links(c).list_by_user(c.user(i), limit=100)),
+    Case(
+        "note_links.create",
+        lambda c, i, _: _links(c).create(
+            NoteLinkCreate(
+                source_note_id=c.note(i), target_note_id=c.note(i, offset=2), link_type=c.unique(i)
+            ),
+            c.user(i),
+        ),
+    ),
+    Case(
+        "note_links.update",
+        lambda c, i, _: _links(c).update(
+            c.link(i), NoteLinkUpdate(description=f"Editado {i}"), c.user(i)
+        ),
+    ),
+    Case(
+        "note_links.delete",
+        lambda c, i, link_id: _links(c).delete(link_id, c.user(i)),
+        _created_link,
+    ),
+    Case(
+        "note_links.get_links_by_source_note",
+        lambda c, i, _: _links(c).get_links_by_source_note(c.note(i), c.user(i)),
+    ),
+    Case(
+        "note_links.get_links_by_target_note",
+        lambda c, i, _: _links(c).get_links_by_target_note(c.note(i), c.user(i)),
+    ),
+    Case(
+        "note_links.get_links_by_type",
+        lambda c, i, _: _links(c).get_links_by_type(LINK_TYPES[i % len(LINK_TYPES)], c.user(i)),
+    ),
+    Case(
+        "note_links.get_link_between_notes",
+        lambda c, i, _: _links(c).get_link_between_notes(
+            c.note(i), c.note(i, offset=1), c.user(i)
+        ),
+    ),
+    # --- SQLAlchemyUserProfileRepository ---
+    Case("user_profiles.get_by_id", lambda c, i, _: _profiles(c).get_by_id(c.user(i))),
+    Case(
+        "user_profiles.get_by_email",
+        lambda c, i, _: _profiles(c).get_by_email(f"{c.user(i)}@example.com".replace("_user", "")),
+    ),
+    Case("user_profiles.list_all", lambda c, i, _: _profiles(c).list_all(limit=50)),
+    Case(
+        "user_profiles.create",
+        lambda c, i, _: _profiles(c).create(UserProfileCreate(user_id=c.unique(i), name="Nuevo")),
+    ),
+    Case(
+        "user_profiles.update",
+        lambda c, i, _: _profiles(c).update(c.user(i), UserProfileUpdate(name=f"Editado {i}")),
+    ),
+    Case(
+        "user_profiles.delete",
+        lambda c, i, user_id: _profiles(c).delete(user_id),
+        _created_profile,
+    ),
+    Case("user_profiles.search_by_name", lambda c, i, _: _profiles(c).search_by_name("Benchmark")),
+    # --- Casos de uso ---
+    Case(
+        "use_cases.get_note",
+        lambda c, i, _: GetNoteUseCase(SQLAlchemyReadOnlyUnitOfWork(c.session)).execute(
+            c.note(i), c.user(i)
+        ),
+    ),
+    Case(
+        "use_cases.list_notes",
+        lambda c, i, _: ListNotesUseCase(SQLAlchemyReadOnlyUnitOfWork(c.session)).execute(
+            c.user(i), skip=i, limit=50
+        ),
+    ),
+    Case(
+        "use_cases.search_notes_by_project",
+        lambda c, i, _: SearchNotesByProjectUseCase(
+            SQLAlchemyReadOnlyUnitOfWork(c.session)
+        ).execute(c.project(i), c.user(i)),
+    ),
+    Case(
+        "use_cases.list_note_links",
+        lambda c, i, _: ListNoteLinksUseCase(SQLAlchemyReadOnlyUnitOfWork(c.session)).execute(
+            c.user(i), source_note_id=c.note(i)
+        ),
+    ),
+    Case(
+        "use_cases.create_note",
+        lambda c, i, _: CreateNoteUseCase(SQLAlchemyUnitOfWork(c.session)).execute(
+            _new_note(c, i), c.user(i)
+        ),
+    ),
+    Case(
+        "use_cases.update_note",
+        lambda c, i, _: UpdateNoteUseCase(SQLAlchemyUnitOfWork(c.session)).execute(
+            c.note(i), NoteUpdate(content=f"Contenido editado {i}"), c.user(i)
+        ),
+    ),
+    Case(
+        "use_cases.create_keyword",
+        lambda c, i, _: CreateKeywordUseCase(SQLAlchemyUnitOfWork(c.session)).execute(
+            KeywordCreate(name=c.unique(i)), c.user(i)
+        ),
+    ),
+]
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def seeded() -> AsyncIterator[tuple[AsyncConnection, SeededData]]:
+    """Conjunto sembrado una vez para todo el módulo, dentro de una transacción revertida."""
+    engine = create_async_db_engine(get_async_database_url(), get_settings())
+    try:
+        async with engine.connect() as connection:
+            transaction = await connection.begin()
+            try:
+                yield connection, await seed(connection, SeedVolumes.from_env())
+            finally:
+                await transaction.rollback()
+    finally:
+        await engine.dispose()
+
+
+async def _measure(case: Case, ctx: Context, start: int, count: int) -> list[float]:
+    timings = []
+    for i in range(start, start + count):
+        ctx.session.expunge_all()
+        prepared = await case.prepare(ctx, i) if case.prepare else None
+        begin = time.perf_counter()
+        await case.run(ctx, i, prepared)
+        timings.append((time.perf_counter() - begin) * 1000)
+    return timings
+
+
+@pytest.mark.parametrize(
+    "case",
+    [
+        pytest.param(
+            case,
+            id=case.name,
+            marks=[pytest.mark.xfail(reason=case.known_issue, strict=True)]
+            if case.known_issue
+            else [],
+        )
+        for case in CASES
+    ],
+)
+async def test_benchmark(
+    case: Case, seeded: tuple[AsyncConnection, SeededData], bench_report: BenchmarkReport
+):
+    connection, data = seeded
+    session = AsyncSession(
+        bind=connection, expire_on_commit=False, join_transaction_mode="create_savepoint"
+    )
+    bench_report.metadata.setdefault("volumes", data.volumes.as_dict())
+    bench_report.metadata.setdefault("repeat", REPEAT)
+    try:
+        ctx = Context(session=session, data=data)
+        await _measure(case, ctx, 0, WARMUP)
+        result = bench_report.add(case.name, await _measure(case, ctx, WARMUP, REPEAT))
+    finally:
+        # Lo escrito por el caso (savepoint de la sesión) no llega a la transacción del módulo
+        await session.rollback()
+        await session.close()
+
+    print(
+        f"[bench] {case.name:45} p50={result.p50_ms:7.2f}ms p95={result.p95_ms:7.2f}ms "
+        f"p99={result.p99_ms:7.2f}ms {result.throughput_ops:8.0f} ops/s"
+    )
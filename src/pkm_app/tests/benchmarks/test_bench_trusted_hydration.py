@@ -0,0 +1,121 @@
+# src/pkm_app/tests/benchmarks/test_bench_trusted_hydration.py
+"""
+Benchmark de la hidratación confiable (`trusted`) frente a `model_validate`.
+
+Construye lotes de BATCH notas con los datos que entregan los repositorios (proyecto,
+fuente y KEYWORDS_PER_NOTE keywords por nota) y las convierte a `NoteSchema` y a la entidad
+`Note` por ambos caminos. Se informa el rendimiento en objetos por segundo de CPU (mejor de
+ROUNDS lotes). No necesita base de datos.
+"""
+
+import os
+import time
+import uuid
+from collections.abc import Callable
+from datetime import UTC, datetime
+from typing import Any
+
+import pytest
+from pydantic import BaseModel
+
+from src.pkm_app.core.application.dtos import NoteSchema
+from src.pkm_app.core.domain.entities import Note
+from src.pkm_app.infrastructure.persistence.sqlalchemy.repositories.hydration import trusted
+
+BATCH = int(os.getenv("BENCH_HYDRATION_BATCH", "10000"))
+KEYWORDS_PER_NOTE = 3
+ROUNDS = int(os.getenv("BENCH_HYDRATION_ROUNDS", "5"))
+
+USER_ID = "bench_user"
+NOW = datetime(2025, 1, 1, tzinfo=UTC)
+
+
+def _note_schema_rows() -> list[dict[str, Any]]:
+    project = {
+        "id": uuid.uuid4(),
+        "user_id": USER_ID,
+        "name": "Bench project",
+        "description": None,
+        "parent_project_id": None,
+        "created_at": NOW,
+        "updated_at": NOW,
+    }
+    source = {
+        "id": uuid.uuid4(),
+        "user_id": USER_ID,
+        "type": "web",
+        "title": "Bench source",
+        "description": None,
+        "url": "https://example.com/articulo",
+        "link_metadata": None,
+        "created_at": NOW,
+        "updated_at": NOW,
+    }
+    return [
+        {
+            "id": uuid.uuid4(),
+            "user_id": USER_ID,
+            "title": f"Nota {i}",
+            "content": "texto " * 40,
+            "type": "markdown",
+            "note_metadata": {"i": i},
+            "project_id": project["id"],
+            "source_id": source["id"],
+            "created_at": NOW,
+            "updated_at": NOW,
+            "project": dict(project),
+            "source": dict(source),
+            "keywords": [
+                {"id": uuid.uuid4(), "user_id": USER_ID, "name": f"kw_{k}", "created_at": NOW}
+                for k in range(KEYWORDS_PER_NOTE)
+            ],
+        }
+        for i in range(BATCH)
+    ]
+
+
+def _note_entity_rows() -> list[dict[str, Any]]:
+    return [
+        {
+            "id": uuid.uuid4(),
+            "title": f"Nota {i}",
+            "content": "texto " * 40,
+            "type": "markdown",
+            "metadata": {"i": i},
+            "project_id": uuid.uuid4(),
+            "keyword_ids": [uuid.uuid4() for _ in range(KEYWORDS_PER_NOTE)],
+            "created_at": NOW,
+            "updated_at": NOW,
+        }
+        for i in range(BATCH)
+    ]
+
+
+def _objects_per_cpu_second(build: Callable[[dict[str, Any]], BaseModel], rows: list) -> float:
+    best = float("inf")
+    for _ in range(ROUNDS):
+        start = time.process_time()
+        for row in rows:
+            build(row)
+        best = min(best, time.process_time() - start)
+    return len(rows) / best
+
+
+@pytest.mark.parametrize(
+    ("model", "make_rows"), [(NoteSchema, _note_schema_rows), (Note, _note_entity_rows)]
+)
+def test_trusted_hydration_matches_validation_and_is_faster(model: type[BaseModel], make_rows):
+    rows = make_rows()
+
+    # Mismos objetos por ambos caminos
+    validated = [model.model_validate(row) for row in rows]
+    assert [trusted(model, row) for row in rows] == validated
+
+    validate_rate = _objects_per_cpu_second(model.model_validate, rows)
+    trusted_rate = _objects_per_cpu_second(lambda row: trusted(model, row), rows)
+
+    print(
+        f"[hydration] {model.__name__} lotes de {BATCH}: validate={validate_rate:,.0f} obj/s-CPU "
+        f"trusted={trusted_rate:,.0f} obj/s-CPU ({trusted_rate / validate_rate:.1f}x)"
+    )
+    assert trusted_rate > validate_rate
@@ -0,0 +1,158 @@
+# src/pkm_app/tests/benchmarks/test_bench_vector_index.py
+"""
+Benchmark de los índices vectoriales (`IVectorIndex`) sobre el mismo corpus generado.
+
+El corpus tiene POINTS vectores de DIMENSION componentes agrupados en CLUSTERS centros (como
+los embeddings de notas de unos pocos temas), repartidos entre USERS usuarios con
+PROJECTS proyectos cada uno y cuatro tipos. Para QUERIES consultas cerca de un punto del
+corpus se calcula aparte, por fuerza bruta con NumPy, el top-K exacto con tres filtros
+(usuario; usuario y proyecto; usuario y tipo), y de cada backend se informa:
+
+- altas por segundo en lotes de UPSERT_BATCH puntos;
+- latencia p50/p95 de búsqueda con cada filtro;
+- recall@K frente al top-K exacto (el índice NumPy es exacto: su recall debe ser 1).
+
+El backend Qdrant se mide solo si BENCH_QDRANT_URL apunta a un servidor (p. ej. el de
+docker-compose, http://localhost:6333); usa una colección temporal que se borra al terminar.
+No necesita PostgreSQL.
+"""
+
+import os
+import time
+import uuid
+from dataclasses import dataclass
+from functools import cache
+
+import numpy as np
+import pytest
+
+from src.pkm_app.core.application.dtos import VectorBatch, VectorFilter, VectorPayload
+from src.pkm_app.core.application.interfaces.vector_index_interface import IVectorIndex
+from src.pkm_app.infrastructure.vector_store.numpy_index import NumpyVectorIndex
+from src.pkm_app.infrastructure.vector_store.qdrant_index import QdrantVectorIndex
+
+POINTS = int(os.getenv("BENCH_VECTOR_POINTS", "50000"))
+DIMENSION = int(os.getenv("BENCH_VECTOR_DIMENSION", "384"))
+CLUSTERS = int(os.getenv("BENCH_VECTOR_CLUSTERS", "200"))
+USERS = int(os.getenv("BENCH_VECTOR_USERS", "4"))
+PROJECTS = int(os.getenv("BENCH_VECTOR_PROJECTS", "10"))
+QUERIES = int(os.getenv("BENCH_VECTOR_QUERIES", "200"))
+K = 10
+UPSERT_BATCH = 1000
+TYPES = ["idea", "task", "reference", "journal"]
+QDRANT_URL = os.getenv("BENCH_QDRANT_URL")
+
+
+@dataclass(frozen=True)
+class Corpus:
+    batch: VectorBatch
+    users: np.ndarray
+    queries: np.ndarray
+    filters: dict[str, list[VectorFilter]]
+    truth: dict[str, list[set[uuid.UUID]]]
+
+
+@cache
+def _corpus() -> Corpus:
+    rng = np.random.default_rng(46)
+    centers = rng.normal(size=(CLUSTERS, DIMENSION))
+    vectors = centers[rng.integers(CLUSTERS, size=POINTS)] + rng.normal(
+        scale=0.6, size=(POINTS, DIMENSION)
+    )
+    vectors = vectors.astype(np.float32)
+    users = rng.integers(USERS, size=POINTS)
+    projects = rng.integers(PROJECTS, size=POINTS)
+    types = rng.integers(len(TYPES), size=POINTS)
+    project_ids = [uuid.uuid4() for _ in range(USERS * PROJECTS)]
+    ids = tuple(uuid.uuid4() for _ in range(POINTS))
+    payloads = tuple(
+        VectorPayload(
+            user_id=f"user_{user}",
+            project_id=project_ids[user * PROJECTS + project],
+            type=TYPES[type_],
+        )
+        for user, project, type_ in zip(users.tolist(), projects.tolist(), types.tolist())
+    )
+    batch = VectorBatch(ids=ids, vectors=vectors, payloads=payloads)
+
+    sources = rng.integers(POINTS, size=QUERIES)
+    queries = (vectors[sources] + rng.normal(scale=0.6, size=(QUERIES, DIMENSION))).astype(
+        np.float32
+    )
+    normalized = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    filters: dict[str, list[VectorFilter]] = {"user": [], "user_project": [], "user_type": []}
+    truth: dict[str, list[set[uuid.UUID]]] = {kind: [] for kind in filters}
+    for query, source in zip(queries, sources.tolist()):
+        user, project, type_ = users[source], projects[source], types[source]
+        for kind, mask in (
+            ("user", users == user),
+            ("user_project", (users == user) & (projects == project)),
+            ("user_type", (users == user) & (types == type_)),
+        ):
+            project_id = project_ids[user * PROJECTS + project]
+            filters[kind].append(
+                VectorFilter(
+                    user_id=f"user_{user}",
+                    project_id=project_id if "project" in kind else None,
+                    type=TYPES[type_] if "type" in kind else None,
+                )
+            )
+            rows = np.flatnonzero(mask)
+            top = rows[np.argsort(-(normalized[rows] @ query))[:K]]
+            truth[kind].append({ids[row] for row in top.tolist()})
+    return Corpus(batch, users, queries, filters, truth)
+
+
+async def _qdrant() -> QdrantVectorIndex:
+    index = QdrantVectorIndex(QDRANT_URL, f"bench_{uuid.uuid4().hex}", DIMENSION)
+    await index.ensure_collection()
+    return index
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "backend",
+    [
+        "numpy",
+        pytest.param(
+            "qdrant",
+            marks=pytest.mark.skipif(not QDRANT_URL, reason="BENCH_QDRANT_URL no definido"),
+        ),
+    ],
+)
+async def test_recall_and_latency(bench_report, backend):
+    corpus = _corpus()
+    index: IVectorIndex = NumpyVectorIndex(DIMENSION) if backend == "numpy" else await _qdrant()
+    try:
+        start = time.perf_counter()
+        for offset in range(0, POINTS, UPSERT_BATCH):
+            await index.upsert(corpus.batch.slice(offset, offset + UPSERT_BATCH))
+        upsert_seconds = time.perf_counter() - start
+        assert await index.count(VectorFilter(user_id="user_0")) == int(
+            np.count_nonzero(corpus.users == 0)
+        )
+        print(
+            f"\n[vector index] {backend:<6} {POINTS} altas de dimensión {DIMENSION} en "
+            f"{upsert_seconds:.2f} s ({POINTS / upsert_seconds:.0f} puntos/s)"
+        )
+
+        for kind, filters in corpus.filters.items():
+            timings: list[float] = []
+            recalls: list[float] = []
+            for query, filter_, expected in zip(corpus.queries, filters, corpus.truth[kind]):
+                start = time.perf_counter()
+                hits = await index.search(query, filter_, limit=K)
+                timings.append((time.perf_counter() - start) * 1000)
+                recalls.append(len({hit.id for hit in hits} & expected) / len(expected))
+            stats = bench_report.add(f"vector_index/{backend}/search_{kind}", timings)
+            recall = float(np.mean(recalls))
+            print(
+                f"[vector index] {backend:<6} filtro {kind:<12} p50={stats.p50_ms:.2f} ms "
+                f"p95={stats.p95_ms:.2f} ms recall@{K}={recall:.3f}"
+            )
+            if backend == "numpy":
+                assert recall > 0.999
+    finally:
+        if isinstance(index, QdrantVectorIndex):
+            await index.delete_collection()
+            await index.close()
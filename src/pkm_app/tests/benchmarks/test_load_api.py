@@ -0,0 +1,104 @@
+# src/pkm_app/tests/benchmarks/test_load_api.py
+"""
+Prueba de carga de la API (`infrastructure/web/api`) dentro del proceso.
+
+Las peticiones pasan por la aplicación FastAPI completa (dependencias, casos de uso, pools
+compartidos de `database.py` y serialización con orjson) a través de `httpx.ASGITransport`,
+sin sockets ni uvicorn, con CONCURRENCY clientes concurrentes y REQUESTS peticiones por
+endpoint. Informa las peticiones/s de cada endpoint (reloj de pared, con concurrencia) y
+registra sus latencias en `bench_report`.
+
+Las notas se crean con commit sobre el usuario de `committed_note`, que las elimina al final.
+"""
+
+import asyncio
+import os
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+
+import httpx
+import pytest
+
+from src.pkm_app.infrastructure.config.settings import get_settings
+from src.pkm_app.infrastructure.persistence.sqlalchemy.database import dispose_engines
+from src.pkm_app.infrastructure.web.api.app import create_app
+
+REQUESTS = int(os.getenv("BENCH_API_REQUESTS", "1000"))
+CONCURRENCY = int(os.getenv("BENCH_API_CONCURRENCY", "32"))
+WARMUP = 50
+
+
+async def _load(
+    send: Callable[[int], Awaitable[httpx.Response]], requests: int, expected_status: int
+) -> tuple[list[float], float]:
+    """Lanza `requests` llamadas a `send(i)` con CONCURRENCY clientes; latencias y req/s."""
+    timings_ms: list[float] = []
+    pending = iter(range(requests))
+
+    async def client_loop() -> None:
+        for i in pending:
+            start = time.perf_counter()
+            response = await send(i)
+            timings_ms.append((time.perf_counter() - start) * 1000)
+            assert response.status_code == expected_status, response.text
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client_loop() for _ in range(CONCURRENCY)))
+    return timings_ms, requests / (time.perf_counter() - start)
+
+
+@pytest.mark.asyncio
+async def test_load_api_endpoints(committed_note: tuple[str, uuid.UUID], bench_report):
+    user_id, note_id = committed_note
+    headers = {"X-User-ID": user_id}
+    app = create_app(get_settings())
+    transport = httpx.ASGITransport(app=app)
+    created: list[str] = []
+
+    async def create(i: int) -> httpx.Response:
+        response = await client.post(
+            "/api/notes",
+            json={"title": f"Nota {i}", "content": f"Contenido de carga {i}"},
+            headers=headers,
+        )
+        created.append(response.json()["id"])
+        return response
+
+    async def get(i: int) -> httpx.Response:
+        return await client.get(f"/api/notes/{note_id}", headers=headers)
+
+    async def list_notes(i: int) -> httpx.Response:
+        return await client.get("/api/notes?limit=50", headers=headers)
+
+    async def update(i: int) -> httpx.Response:
+        # Notas distintas en cada petición concurrente: sin esperas por bloqueos de fila
+        return await client.patch(
+            f"/api/notes/{created[i % len(created)]}",
+            json={"content": f"Contenido actualizado {i}"},
+            headers=headers,
+        )
+
+    cases: list[tuple[str, Callable[[int], Awaitable[httpx.Response]], int]] = [
+        ("POST /api/notes", create, 201),
+        ("GET /api/notes/{id}", get, 200),
+        ("GET /api/notes", list_notes, 200),
+        ("PATCH /api/notes/{id}", update, 200),
+    ]
+    results: dict[str, float] = {}
+    try:
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            await _load(get, WARMUP, 200)  # calentamiento: conexiones y caché de SQL compilado
+            for name, send, expected_status in cases:
+                timings_ms, requests_per_second = await _load(send, REQUESTS, expected_status)
+                results[name] = requests_per_second
+                result = bench_report.add(f"api/{name}", timings_ms)
+                print(
+                    f"\n{name}: {requests_per_second:.0f} req/s con {CONCURRENCY} clientes; "
+                    f"p50 {result.p50_ms:.2f} ms, p95 {result.p95_ms:.2f} ms"
+                )
+    finally:
+        await dispose_engines()
+
+    assert len(created) == REQUESTS
+    assert all(requests_per_second > 0 for requests_per_second in results.values())
@@ -0,0 +1,84 @@
+# src/pkm_app/tests/benchmarks/test_load_engine_pool.py
+"""
+Prueba de carga del engine: CONCURRENCY llamadas concurrentes a GetNoteUseCase (por defecto
+200), cada una con su propio Unit of Work, para los presets de engine y el modo PgBouncer.
+
+El caso "pgbouncer" abre una conexión por llamada (el pool lo gestiona PgBouncer), así que
+solo se ejecuta contra un PgBouncer real indicado en BENCH_PGBOUNCER_URL.
+
+Imprime el throughput (llamadas/s) y las métricas del pool (pico de conexiones, overflow,
+espera media/máxima) de cada configuración. Los datos se crean con commit (cada llamada usa
+su propia conexión) y se eliminan al terminar.
+"""
+
+import asyncio
+import os
+import time
+import uuid
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.pkm_app.core.application.use_cases.note.get_note_use_case import GetNoteUseCase
+from src.pkm_app.infrastructure.config.settings import get_settings
+from src.pkm_app.infrastructure.persistence.sqlalchemy.database import get_async_database_url
+from src.pkm_app.infrastructure.persistence.sqlalchemy.engine import (
+    ENGINE_PRESETS,
+    EngineOptions,
+    create_async_db_engine,
+    get_pool_metrics,
+)
+from src.pkm_app.infrastructure.persistence.sqlalchemy.unit_of_work import SQLAlchemyUnitOfWork
+
+CONCURRENCY = int(os.getenv("BENCH_CONCURRENCY", "200"))
+PGBOUNCER_URL = os.getenv("BENCH_PGBOUNCER_URL")
+
+ENGINE_CONFIGS = {
+    "development": ENGINE_PRESETS["development"],
+    "production": ENGINE_PRESETS["production"],
+    "pgbouncer": ENGINE_PRESETS["production"].model_copy(update={"pgbouncer_mode": True}),
+}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("config_name", list(ENGINE_CONFIGS))
+async def test_concurrent_use_case_throughput(
+    committed_note: tuple[str, uuid.UUID], config_name: str
+):
+    user_id, note_id = committed_note
+    options: EngineOptions = ENGINE_CONFIGS[config_name]
+    url = get_async_database_url()
+    if options.pgbouncer_mode:
+        if not PGBOUNCER_URL:
+            pytest.skip("Define BENCH_PGBOUNCER_URL para medir el modo PgBouncer.")
+        url = PGBOUNCER_URL
+    engine = create_async_db_engine(url, get_settings(), options=options)
+    session_factory = async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+
+    async def call() -> None:
+        note = await GetNoteUseCase(SQLAlchemyUnitOfWork(session_factory)).execute(
+            note_id, user_id
+        )
+        assert note.id == note_id
+
+    try:
+        start = time.perf_counter()
+        await asyncio.gather(*(call() for _ in range(CONCURRENCY)))
+        elapsed = time.perf_counter() - start
+    finally:
+        await engine.dispose()
+
+    metrics = get_pool_metrics(engine)
+    assert metrics is not None
+    snapshot = metrics.snapshot()
+    assert snapshot["checkouts"] == CONCURRENCY
+    if not options.pgbouncer_mode:
+        assert snapshot["peak_checked_out"] <= options.pool_size + options.max_overflow
+
+    print(
+        f"[pool] {config_name:<12} {CONCURRENCY / elapsed:8.1f} llamadas/s "
+        f"peak_checked_out={snapshot['peak_checked_out']:.0f} "
+        f"connections_opened={snapshot['connections_opened']:.0f} "
+        f"wait_avg={snapshot['wait_time_avg'] * 1000:.2f}ms "
+        f"wait_max={snapshot['wait_time_max'] * 1000:.2f}ms"
+    )
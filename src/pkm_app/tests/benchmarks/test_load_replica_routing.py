@@ -0,0 +1,129 @@
+# src/pkm_app/tests/benchmarks/test_load_replica_routing.py
+"""
+Prueba de carga del enrutado de lecturas a réplicas.
+
+Por defecto la "réplica" es el mismo servidor configurado (DB_HOST) alcanzado con otra URL,
+lo que basta para comprobar el chequeo de salud real, el reparto entre engines y la
+stickiness read-your-writes. Con dos instancias locales (ej. una réplica en streaming en
+otro puerto) se indica su URL en BENCH_REPLICA_URL.
+
+Lanza CONCURRENCY lecturas concurrentes de GetNoteUseCase por estrategia e informa el
+reparto de lecturas entre primario y réplicas y la mediana de latencia.
+"""
+
+import asyncio
+import os
+import statistics
+import time
+import uuid
+from collections import Counter
+
+import pytest
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.pkm_app.core.application.use_cases.note.get_note_use_case import GetNoteUseCase
+from src.pkm_app.infrastructure.config.settings import get_settings
+from src.pkm_app.infrastructure.persistence.sqlalchemy.database import get_async_database_url
+from src.pkm_app.infrastructure.persistence.sqlalchemy.engine import create_async_db_engine
+from src.pkm_app.infrastructure.persistence.sqlalchemy.replicas import ReplicaRouter
+from src.pkm_app.infrastructure.persistence.sqlalchemy.unit_of_work import (
+    SQLAlchemyReadOnlyUnitOfWork,
+)
+
+CONCURRENCY = int(os.getenv("BENCH_REPLICA_CONCURRENCY", "200"))
+
+
+def _replica_urls() -> list[str]:
+    if url := os.getenv("BENCH_REPLICA_URL"):
+        return [url]
+    primary = make_url(get_async_database_url())
+    # Dos "réplicas" que apuntan al mismo servidor por nombres distintos
+    return [
+        primary.set(host="127.0.0.1").render_as_string(hide_password=False),
+        primary.set(host="localhost").render_as_string(hide_password=False),
+    ]
+
+
+def _router(strategy: str) -> ReplicaRouter:
+    settings = get_settings()
+    return ReplicaRouter(
+        primary=create_async_db_engine(get_async_database_url(), settings, read_only=True),
+        replicas=[create_async_db_engine(url, settings, read_only=True) for url in _replica_urls()],
+        strategy=strategy,
+        sticky_seconds=30.0,
+    )
+
+
+async def _close(router: ReplicaRouter) -> None:
+    await router.close()
+    await router.primary.dispose()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("strategy", ["round_robin", "least_connections"])
+async def test_reads_are_spread_across_replicas(
+    strategy: str, committed_note: tuple[str, uuid.UUID]
+):
+    user_id, note_id = committed_note
+    router = _router(strategy)
+    used: Counter[AsyncEngine] = Counter()
+
+    async def read() -> float:
+        start = time.perf_counter()
+        uow = SQLAlchemyReadOnlyUnitOfWork(router=router, user_id=user_id)
+        note = await GetNoteUseCase(uow).execute(note_id, user_id)
+        assert note.id == note_id
+        return (time.perf_counter() - start) * 1000
+
+    original = router.choose_read_engine
+
+    def counting_choose(user: str | None = None) -> AsyncEngine:
+        engine = original(user)
+        used[engine] += 1
+        return engine
+
+    router.choose_read_engine = counting_choose  # type: ignore[method-assign]
+    try:
+        await router.check_health()
+        assert all(replica.healthy for replica in router.replicas)
+        timings = await asyncio.gather(*(read() for _ in range(CONCURRENCY)))
+
+        # Tras una escritura del usuario, sus lecturas van al primario durante la ventana
+        router.record_write(user_id)
+        await read()
+    finally:
+        await _close(router)
+
+    replica_reads = {replica.name: used[replica.engine] for replica in router.replicas}
+    print(
+        f"[replicas] {strategy}: median={statistics.median(timings):.2f}ms "
+        f"primario={used[router.primary]} réplicas={replica_reads} "
+        f"lag={[replica.lag_seconds for replica in router.replicas]}"
+    )
+    assert used[router.primary] == 1
+    assert sum(replica_reads.values()) == CONCURRENCY
+    if strategy == "round_robin":
+        assert len(set(replica_reads.values())) == 1
+
+
+@pytest.mark.asyncio
+async def test_unreachable_replica_is_ejected():
+    settings = get_settings()
+    unreachable = make_url(get_async_database_url()).set(host="127.0.0.1", port=1)
+    router = ReplicaRouter(
+        primary=create_async_db_engine(get_async_database_url(), settings, read_only=True),
+        replicas=[
+            create_async_db_engine(
+                unreachable.render_as_string(hide_password=False), settings, read_only=True
+            ),
+            create_async_db_engine(_replica_urls()[0], settings, read_only=True),
+        ],
+    )
+    try:
+        await router.check_health()
+    finally:
+        await _close(router)
+
+    assert [replica.healthy for replica in router.replicas] == [False, True]
+    assert {router.choose_read_engine() for _ in range(4)} == {router.replicas[1].engine}
@@ -0,0 +1,134 @@
+# src/pkm_app/tests/benchmarks/test_query_budgets.py
+"""
+Presupuesto de sentencias SQL por caso de uso (`assert_max_queries`).
+
+Cada test ejecuta un caso de uso contra PostgreSQL y falla si lanza más sentencias de las
+previstas o si aparece una forma de sentencia repetida (sospecha de N+1). Al cambiar un
+repositorio o un caso de uso, un aumento de sentencias rompe el test en CI en lugar de
+pasar desapercibido. Los presupuestos son los valores actuales (incluyen el SAVEPOINT y el
+RELEASE de la sesión de test): si una mejora los reduce, hay que bajarlos aquí.
+"""
+
+import uuid
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+from src.pkm_app.core.application.dtos import KeywordCreate, NoteCreate, NoteUpdate
+from src.pkm_app.core.application.use_cases.keyword.create_keyword_use_case import (
+    CreateKeywordUseCase,
+)
+from src.pkm_app.core.application.use_cases.note.create_note_use_case import CreateNoteUseCase
+from src.pkm_app.core.application.use_cases.note.delete_note_use_case import DeleteNoteUseCase
+from src.pkm_app.core.application.use_cases.note.get_note_use_case import GetNoteUseCase
+from src.pkm_app.core.application.use_cases.note.list_notes_use_case import ListNotesUseCase
+from src.pkm_app.core.application.use_cases.note.update_note_use_case import UpdateNoteUseCase
+from src.pkm_app.infrastructure.persistence.sqlalchemy.instrumentation import (
+    assert_max_queries,
+)
+from src.pkm_app.infrastructure.persistence.sqlalchemy.unit_of_work import (
+    SQLAlchemyReadOnlyUnitOfWork,
+    SQLAlchemyUnitOfWork,
+)
+
+pytestmark = pytest.mark.asyncio
+
+KEYWORDS = ["alfa", "beta", "gamma"]
+
+
+async def _create_note(session: AsyncSession, user_id: str) -> uuid.UUID:
+    note = await CreateNoteUseCase(SQLAlchemyUnitOfWork(session)).execute(
+        NoteCreate(title="Nota", content="Contenido", keywords=KEYWORDS), user_id
+    )
+    session.expunge_all()
+    return note.id
+
+
+async def _seed_notes(connection: AsyncConnection, user_id: str, count: int) -> None:
+    await connection.execute(
+        text(
+            "INSERT INTO notes (id, user_id, content) "
+            "SELECT gen_random_uuid(), :user_id, 'Nota ' || i FROM generate_series(1, :n) AS i"
+        ),
+        {"user_id": user_id, "n": count},
+    )
+
+
+def _assert_no_n_plus_one(stats) -> None:
+    assert not stats.n_plus_one_suspects(), stats.report()
+
+
+async def test_create_note(bench_session: AsyncSession, bench_user_id: str):
+    # 5 fijas + 2 por keyword (buscarla y crearla)
+    with assert_max_queries(5 + 2 * len(KEYWORDS)) as stats:
+        await CreateNoteUseCase(SQLAlchemyUnitOfWork(bench_session)).execute(
+            NoteCreate(title="Nota", content="Contenido", keywords=KEYWORDS), bench_user_id
+        )
+    print(f"\n{stats.report()}")
+
+
+@pytest.mark.xfail(
+    reason="NoteRepository.create busca y crea cada keyword con su propia sentencia",
+    strict=True,
+)
+async def test_create_note_keywords_without_n_plus_one(
+    bench_session: AsyncSession, bench_user_id: str
+):
+    with assert_max_queries(5 + 2 * len(KEYWORDS)) as stats:
+        await CreateNoteUseCase(SQLAlchemyUnitOfWork(bench_session)).execute(
+            NoteCreate(title="Nota", content="Contenido", keywords=KEYWORDS), bench_user_id
+        )
+    _assert_no_n_plus_one(stats)
+
+
+async def test_update_note(bench_session: AsyncSession, bench_user_id: str):
+    note_id = await _create_note(bench_session, bench_user_id)
+    with assert_max_queries(4) as stats:
+        await UpdateNoteUseCase(SQLAlchemyUnitOfWork(bench_session)).execute(
+            note_id, NoteUpdate(content="Editado"), bench_user_id
+        )
+    print(f"\n{stats.report()}")
+    _assert_no_n_plus_one(stats)
+
+
+async def test_delete_note(bench_session: AsyncSession, bench_user_id: str):
+    note_id = await _create_note(bench_session, bench_user_id)
+    with assert_max_queries(8) as stats:
+        await DeleteNoteUseCase(SQLAlchemyUnitOfWork(bench_session)).execute(
+            note_id, bench_user_id
+        )
+    print(f"\n{stats.report()}")
+    _assert_no_n_plus_one(stats)
+
+
+async def test_get_note(bench_session: AsyncSession, bench_user_id: str):
+    note_id = await _create_note(bench_session, bench_user_id)
+    with assert_max_queries(2) as stats:
+        await GetNoteUseCase(SQLAlchemyReadOnlyUnitOfWork(bench_session)).execute(
+            note_id, bench_user_id
+        )
+    print(f"\n{stats.report()}")
+    _assert_no_n_plus_one(stats)
+
+
+async def test_list_notes_does_not_grow_with_page_size(
+    bench_connection: AsyncConnection, bench_session: AsyncSession, bench_user_id: str
+):
+    await _seed_notes(bench_connection, bench_user_id, 50)
+    with assert_max_queries(2) as stats:
+        notes = await ListNotesUseCase(SQLAlchemyReadOnlyUnitOfWork(bench_session)).execute(
+            bench_user_id, limit=50
+        )
+    print(f"\n{stats.report()}")
+    assert len(notes) == 50 and stats.rows == 50
+    _assert_no_n_plus_one(stats)
+
+
+async def test_create_keyword(bench_session: AsyncSession, bench_user_id: str):
+    with assert_max_queries(5) as stats:
+        await CreateKeywordUseCase(SQLAlchemyUnitOfWork(bench_session)).execute(
+            KeywordCreate(name="delta"), bench_user_id
+        )
+    print(f"\n{stats.report()}")
+    _assert_no_n_plus_one(stats)
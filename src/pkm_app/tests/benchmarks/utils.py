@@ -0,0 +1,59 @@
+# src/pkm_app/tests/benchmarks/utils.py
+"""Utilidades compartidas por los benchmarks."""
+
+import json
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncConnection
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.base import Executable
+from sqlalchemy.sql.elements import ClauseElement
+
+
+class Explain(Executable, ClauseElement):
+    """Envuelve una sentencia en `EXPLAIN (ANALYZE, FORMAT JSON)` conservando sus parámetros."""
+
+    inherit_cache = False
+
+    def __init__(self, statement: ClauseElement, analyze: bool = True):
+        self.statement = statement
+        self.analyze = analyze
+
+
+@compiles(Explain, "postgresql")
+def _compile_explain(element: Explain, compiler: Any, **kw: Any) -> str:
+    options = "ANALYZE, BUFFERS, FORMAT JSON" if element.analyze else "FORMAT JSON"
+    return f"EXPLAIN ({options}) " + compiler.process(element.statement, **kw)
+
+
+async def explain(connection: AsyncConnection, statement: ClauseElement) -> dict[str, Any]:
+    """Ejecuta EXPLAIN ANALYZE y devuelve el plan raíz (dict con 'Plan', 'Execution Time'...)."""
+    result = await connection.execute(Explain(statement))
+    raw = result.scalar_one()
+    plan = json.loads(raw) if isinstance(raw, str) else raw
+    return plan[0]  # type: ignore[no-any-return]
+
+
+def iter_plan_nodes(plan: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from iter_plan_nodes(child)
+
+
+def used_indexes(explained: dict[str, Any]) -> set[str]:
+    """Nombres de los índices usados en cualquier nodo del plan."""
+    return {
+        node["Index Name"] for node in iter_plan_nodes(explained["Plan"]) if "Index Name" in node
+    }
+
+
+async def time_async(fn: Callable[[], Awaitable[Any]], repeat: int = 20) -> list[float]:
+    """Ejecuta `fn` `repeat` veces y devuelve las duraciones en milisegundos."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
@@ -0,0 +1,651 @@
+"""
+High-volume test data generator that streams rows into PostgreSQL with COPY.
+
+Unlike `generate_test_data.py` (a few dozen entities rendered as INSERT statements), this
+module is meant for datasets of millions of notes:
+
+- Rows are generated in parallel worker processes, in chunks of `chunk_size` notes. Each
+  chunk seeds its own Faker and NumPy generators from `(seed, phase, user, chunk)`, so the
+  dataset depends only on the `BulkConfig`, never on the number of workers or on timing.
+- Ids are derived from `(seed, kind, user, index)` with BLAKE2b, so a chunk can reference
+  rows generated by other chunks (projects, keywords, link targets) without sharing state.
+- Workers encode each chunk as CSV; the main process only pipes the bytes to
+  `COPY ... FROM STDIN` over a few asyncpg connections. The same bytes can be written to
+  files instead (`--output`) and loaded later with `psql \\copy`.
+- Distributions are skewed like real knowledge bases: keywords per note are Poisson, with
+  Zipf keyword popularity; outgoing links per note follow a power law and link targets a
+  Zipf popularity (a few hub notes receive most links); projects nest up to
+  `max_project_depth` levels and notes concentrate in a few large projects.
+
+Usage (from the project root):
+
+    python -m src.pkm_app.tests.data_generation.bulk_generator \\
+        --users 10 --notes-per-user 100000 --workers 8 --seed 42 --replace
+"""
+
+import argparse
+import asyncio
+import csv
+import hashlib
+import io
+import json
+import math
+import os
+import time
+import uuid
+from collections.abc import AsyncIterator, Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime, timedelta
+from functools import cache
+from itertools import repeat
+from pathlib import Path
+
+import asyncpg
+import numpy as np
+from faker import Faker
+from sqlalchemy.engine import make_url
+
+from src.pkm_app.infrastructure.persistence.sqlalchemy.database import get_async_database_url
+
+NOTE_TYPES = ["markdown", "text", "code", "mixed"]
+SOURCE_TYPES = ["article", "book", "website", "video"]
+LINK_TYPES = ["reference", "relates_to", "depends_on", "contradicts", "supports"]
+NOTE_STATUSES = ["draft", "in_progress", "done", "archived"]
+
+# Columns written for each table, in COPY order
+TABLE_COLUMNS = {
+    "user_profiles": ("user_id", "name", "email", "preferences", "created_at", "updated_at"),
+    "projects": (
+        "id",
+        "user_id",
+        "name",
+        "description",
+        "parent_project_id",
+        "created_at",
+        "updated_at",
+    ),
+    "sources": (
+        "id",
+        "user_id",
+        "type",
+        "title",
+        "description",
+        "url",
+        "link_metadata",
+        "created_at",
+        "updated_at",
+    ),
+    "keywords": ("id", "user_id", "name", "created_at"),
+    "notes": (
+        "id",
+        "user_id",
+        "project_id",
+        "source_id",
+        "title",
+        "content",
+        "type",
+        "note_metadata",
+        "created_at",
+        "updated_at",
+    ),
+    "note_keywords": ("note_id", "keyword_id"),
+    "note_links": ("id", "source_note_id", "target_note_id", "link_type", "user_id", "created_at"),
+}
+
+
+@dataclass(frozen=True)
+class BulkConfig:
+    """
+    Size and shape of the generated dataset. Two runs with the same config produce the same
+    rows (the number of workers does not matter).
+    """
+
+    seed: int = 42
+    users: int = 2
+    notes_per_user: int = 10_000
+    projects_per_user: int = 30
+    sources_per_user: int = 100
+    keywords_per_user: int = 300
+    chunk_size: int = 5_000
+
+    # Keywords per note ~ Poisson(mean), clipped; keyword popularity ~ Zipf(exponent)
+    keywords_per_note_mean: float = 2.5
+    keywords_per_note_max: int = 12
+    keyword_popularity_exponent: float = 1.1
+
+    # Outgoing links per note ~ power law (Zipf(a) - 1), clipped; targets ~ Zipf(exponent)
+    link_degree_exponent: float = 2.2
+    links_per_note_max: int = 50
+    link_target_exponent: float = 0.9
+
+    # Probability that a project is nested under an earlier one, and maximum depth (root = 0)
+    project_nesting: float = 0.6
+    max_project_depth: int = 4
+    # Notes per project ~ Zipf(exponent); share of notes without project / with a source
+    project_size_exponent: float = 1.0
+    notes_without_project: float = 0.1
+    notes_with_source: float = 0.3
+
+    # Notes are created between `end_date - history_days` and `end_date`
+    end_date: datetime = datetime(2025, 1, 1, tzinfo=UTC)
+    history_days: int = 730
+
+    def __post_init__(self) -> None:
+        if self.users <= 0 or self.notes_per_user <= 0 or self.chunk_size <= 0:
+            raise ValueError("users, notes_per_user and chunk_size must be greater than 0.")
+        if self.projects_per_user < 0 or self.sources_per_user < 0:
+            raise ValueError("projects_per_user and sources_per_user cannot be negative.")
+        if self.keywords_per_user < self.keywords_per_note_max:
+            raise ValueError("keywords_per_user must be at least keywords_per_note_max.")
+        if self.link_degree_exponent <= 1:
+            raise ValueError("link_degree_exponent must be greater than 1.")
+
+    @property
+    def total_notes(self) -> int:
+        return self.users * self.notes_per_user
+
+    def user_id(self, user: int) -> str:
+        return f"bulk-{self.seed}-user-{user}"
+
+    def user_ids(self) -> list[str]:
+        return [self.user_id(user) for user in range(self.users)]
+
+
+def entity_id(seed: int, kind: str, user: int, index: int) -> uuid.UUID:
+    """Deterministic id of row `index` of `kind` for `user`."""
+    digest = hashlib.blake2b(f"{seed}:{kind}:{user}:{index}".encode(), digest_size=16).digest()
+    return uuid.UUID(bytes=digest, version=4)
+
+
+# --- Chunks ---
+
+
+@dataclass(frozen=True)
+class Chunk:
+    """Unit of work for a worker: rows of `phase` for `user`, notes `[start, stop)`."""
+
+    phase: str
+    user: int
+    start: int = 0
+    stop: int = 0
+
+
+@dataclass
+class ChunkData:
+    """CSV payload of a chunk, per table, in the order the tables must be loaded."""
+
+    chunk: Chunk
+    tables: dict[str, bytes] = field(default_factory=dict)
+    rows: dict[str, int] = field(default_factory=dict)
+
+
+class _TableWriter:
+    def __init__(self) -> None:
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer, lineterminator="\n")
+        self.rows = 0
+
+    def write(self, *values: object) -> None:
+        # None -> empty unquoted field, which COPY ... CSV reads as NULL
+        self._writer.writerow(values)
+        self.rows += 1
+
+    def getvalue(self) -> bytes:
+        return self._buffer.getvalue().encode()
+
+
+def _rng(config: BulkConfig, chunk: Chunk) -> tuple[np.random.Generator, Faker]:
+    key = [config.seed, PHASES.index(chunk.phase), chunk.user, chunk.start]
+    fake = Faker()
+    fake.seed_instance(int(np.random.SeedSequence(key).generate_state(1)[0]))
+    return np.random.default_rng(key), fake
+
+
+@cache
+def _zipf_cdf(size: int, exponent: float) -> np.ndarray:
+    weights = 1.0 / np.arange(1, size + 1, dtype=np.float64) ** exponent
+    cdf = np.cumsum(weights)
+    return cdf / cdf[-1]
+
+
+def _zipf_draw(rng: np.random.Generator, size: int, exponent: float, count: int) -> np.ndarray:
+    """`count` ranks in `[0, size)`, rank r drawn with probability ∝ 1 / (r + 1)^exponent."""
+    ranks = np.searchsorted(_zipf_cdf(size, exponent), rng.random(count), side="right")
+    return np.minimum(ranks, size - 1)
+
+
+@cache
+def _scatter(size: int, user: int) -> tuple[int, int]:
+    """
+    Bijection `rank -> (rank * stride + offset) % size`, so that popular ranks are spread over
+    the whole note range instead of being the oldest notes.
+    """
+    stride = max(int(size * 0.618_033_9), 1) | 1
+    while math.gcd(stride, size) != 1:
+        stride += 2
+    return stride, (user * 7_919) % size
+
+
+def _timestamps(
+    config: BulkConfig, rng: np.random.Generator, count: int
+) -> tuple[list[datetime], list[datetime]]:
+    history = config.history_days * 86_400.0
+    age = rng.random(count) * history
+    # Most notes are edited shortly after creation, a few long after
+    edited_after = np.minimum(rng.exponential(7 * 86_400.0, count), age)
+    created = [config.end_date - timedelta(seconds=float(s)) for s in age]
+    updated = [c + timedelta(seconds=float(s)) for c, s in zip(created, edited_after, strict=True)]
+    return created, updated
+
+
+def _build_users(config: BulkConfig, chunk: Chunk) -> ChunkData:
+    rng, fake = _rng(config, chunk)
+    created, updated = _timestamps(config, rng, config.users)
+    table = _TableWriter()
+    for user in range(config.users):
+        preferences = {
+            "theme": str(rng.choice(["light", "dark", "system"])),
+            "language": str(rng.choice(["es", "en"])),
+        }
+        table.write(
+            config.user_id(user),
+            fake.name(),
+            f"user{user}.{config.seed}@example.com",
+            json.dumps(preferences),
+            created[user].isoformat(),
+            updated[user].isoformat(),
+        )
+    return ChunkData(chunk, {"user_profiles": table.getvalue()}, {"user_profiles": table.rows})
+
+
+def _build_catalog(config: BulkConfig, chunk: Chunk) -> ChunkData:
+    """Projects (nested up to `max_project_depth`), sources and keywords of one user."""
+    rng, fake = _rng(config, chunk)
+    user, user_id = chunk.user, config.user_id(chunk.user)
+    data = ChunkData(chunk)
+
+    projects = _TableWriter()
+    depths: list[int] = []
+    created, updated = _timestamps(config, rng, config.projects_per_user)
+    for index in range(config.projects_per_user):
+        candidates = [p for p, depth in enumerate(depths) if depth < config.max_project_depth]
+        parent = None
+        if candidates and rng.random() < config.project_nesting:
+            parent = int(rng.choice(candidates))
+        depths.append(0 if parent is None else depths[parent] + 1)
+        projects.write(
+            entity_id(config.seed, "project", user, index),
+            user_id,
+            f"{fake.catch_phrase()} #{index}",
+            fake.sentence(),
+            None if parent is None else entity_id(config.seed, "project", user, parent),
+            created[index].isoformat(),
+            updated[index].isoformat(),
+        )
+
+    sources = _TableWriter()
+    created, updated = _timestamps(config, rng, config.sources_per_user)
+    for index in range(config.sources_per_user):
+        source_type = SOURCE_TYPES[int(rng.integers(len(SOURCE_TYPES)))]
+        metadata = {"author": fake.name(), "year": int(rng.integers(1950, 2025))}
+        sources.write(
+            entity_id(config.seed, "source", user, index),
+            user_id,
+            source_type,
+            fake.sentence(nb_words=6).rstrip("."),
+            fake.sentence(),
+            f"{fake.url()}{fake.uri_path()}/{index}" if source_type != "book" else None,
+            json.dumps(metadata),
+            created[index].isoformat(),
+            updated[index].isoformat(),
+        )
+
+    keywords = _TableWriter()
+    created, _ = _timestamps(config, rng, config.keywords_per_user)
+    for index in range(config.keywords_per_user):
+        keywords.write(
+            entity_id(config.seed, "keyword", user, index),
+            user_id,
+            # The suffix keeps (user_id, name) unique
+            f"{fake.word()}-{index}",
+            created[index].isoformat(),
+        )
+
+    for name, table in (("projects", projects), ("sources", sources), ("keywords", keywords)):
+        data.tables[name] = table.getvalue()
+        data.rows[name] = table.rows
+    return data
+
+
+def _build_notes(config: BulkConfig, chunk: Chunk) -> ChunkData:
+    """Notes `[start, stop)` of one user and their keyword associations."""
+    rng, fake = _rng(config, chunk)
+    user, user_id = chunk.user, config.user_id(chunk.user)
+    count = chunk.stop - chunk.start
+
+    # Text is assembled from a per-chunk pool: Faker is by far the slowest part otherwise
+    sentences = [fake.sentence(nb_words=int(n)) for n in rng.integers(6, 18, 512)]
+    words = fake.words(nb=512)
+    sentence_counts = np.clip(rng.lognormal(1.6, 0.6, count).astype(int), 1, 60)
+    title_words = rng.integers(len(words), size=(count, 4))
+
+    if config.projects_per_user:
+        project_ranks = _zipf_draw(
+            rng, config.projects_per_user, config.project_size_exponent, count
+        )
+    has_project = rng.random(count) >= config.notes_without_project
+    has_source = (rng.random(count) < config.notes_with_source) & (config.sources_per_user > 0)
+    source_indexes = rng.integers(max(config.sources_per_user, 1), size=count)
+    note_types = rng.integers(len(NOTE_TYPES), size=count)
+    statuses = rng.integers(len(NOTE_STATUSES), size=count)
+    keyword_counts = np.minimum(
+        rng.poisson(config.keywords_per_note_mean, count), config.keywords_per_note_max
+    )
+    # Drawn with replacement and deduplicated per note: popular keywords may repeat
+    keyword_draws = _zipf_draw(
+        rng,
+        config.keywords_per_user,
+        config.keyword_popularity_exponent,
+        int(keyword_counts.sum()) * 2,
+    )
+    created, updated = _timestamps(config, rng, count)
+
+    notes, note_keywords = _TableWriter(), _TableWriter()
+    draw = 0
+    for row in range(count):
+        index = chunk.start + row
+        note_id = entity_id(config.seed, "note", user, index)
+        project_id = None
+        if config.projects_per_user and has_project[row]:
+            project_id = entity_id(config.seed, "project", user, int(project_ranks[row]))
+        source_id = None
+        if has_source[row]:
+            source_id = entity_id(config.seed, "source", user, int(source_indexes[row]))
+        picks = rng.integers(len(sentences), size=int(sentence_counts[row]))
+        metadata = {"status": NOTE_STATUSES[statuses[row]], "sentences": len(picks)}
+        notes.write(
+            note_id,
+            user_id,
+            project_id,
+            source_id,
+            " ".join(words[w] for w in title_words[row]).capitalize(),
+            " ".join(sentences[p] for p in picks),
+            NOTE_TYPES[note_types[row]],
+            json.dumps(metadata),
+            created[row].isoformat(),
+            updated[row].isoformat(),
+        )
+
+        wanted = int(keyword_counts[row])
+        candidates = keyword_draws[draw : draw + 2 * wanted].tolist()
+        draw += 2 * wanted
+        for keyword in list(dict.fromkeys(candidates))[:wanted]:
+            note_keywords.write(note_id, entity_id(config.seed, "keyword", user, keyword))
+
+    return ChunkData(
+        chunk,
+        {"notes": notes.getvalue(), "note_keywords": note_keywords.getvalue()},
+        {"notes": notes.rows, "note_keywords": note_keywords.rows},
+    )
+
+
+def _build_links(config: BulkConfig, chunk: Chunk) -> ChunkData:
+    """Outgoing links of notes `[start, stop)` of one user (targets among all its notes)."""
+    rng, _ = _rng(config, chunk)
+    user, user_id = chunk.user, config.user_id(chunk.user)
+    size = config.notes_per_user
+    count = chunk.stop - chunk.start
+
+    degrees = np.minimum(
+        rng.zipf(config.link_degree_exponent, count) - 1, min(config.links_per_note_max, size - 1)
+    )
+    stride, offset = _scatter(size, user)
+    targets = (
+        _zipf_draw(rng, size, config.link_target_exponent, int(degrees.sum()) * 2) * stride
+        + offset
+    ) % size
+    link_types = rng.integers(len(LINK_TYPES), size=len(targets))
+    created, _ = _timestamps(config, rng, count)
+
+    links = _TableWriter()
+    draw = 0
+    for row in range(count):
+        index = chunk.start + row
+        wanted = int(degrees[row])
+        candidates = targets[draw : draw + 2 * wanted].tolist()
+        types = link_types[draw : draw + 2 * wanted]
+        draw += 2 * wanted
+        # No self-links and one link per target (the unique key also includes link_type)
+        chosen = [t for t in dict.fromkeys(candidates) if t != index][:wanted]
+        for position, target in enumerate(chosen):
+            links.write(
+                entity_id(config.seed, "link", user, index * (size - 1) + position),
+                entity_id(config.seed, "note", user, index),
+                entity_id(config.seed, "note", user, target),
+                LINK_TYPES[types[position]],
+                user_id,
+                created[row].isoformat(),
+            )
+    return ChunkData(chunk, {"note_links": links.getvalue()}, {"note_links": links.rows})
+
+
+# Phases run one after another, so every foreign key points to rows already loaded
+PHASES = ["users", "catalog", "notes", "links"]
+_BUILDERS: dict[str, Callable[[BulkConfig, Chunk], ChunkData]] = {
+    "users": _build_users,
+    "catalog": _build_catalog,
+    "notes": _build_notes,
+    "links": _build_links,
+}
+
+
+def plan(config: BulkConfig, phase: str) -> list[Chunk]:
+    """Chunks of `phase`, in a stable order."""
+    if phase == "users":
+        return [Chunk("users", 0)]
+    if phase == "catalog":
+        return [Chunk("catalog", user) for user in range(config.users)]
+    return [
+        Chunk(phase, user, start, min(start + config.chunk_size, config.notes_per_user))
+        for user in range(config.users)
+        for start in range(0, config.notes_per_user, config.chunk_size)
+    ]
+
+
+def build_chunk(config: BulkConfig, chunk: Chunk) -> ChunkData:
+    """Generates the rows of `chunk`. Runs in worker processes; pure function of its inputs."""
+    return _BUILDERS[chunk.phase](config, chunk)
+
+
+def generate(config: BulkConfig) -> Iterator[ChunkData]:
+    """Generates every chunk in this process, in load order (small datasets and tests)."""
+    for phase in PHASES:
+        for chunk in plan(config, phase):
+            yield build_chunk(config, chunk)
+
+
+# --- Loading ---
+
+
+@dataclass
+class LoadStats:
+    rows: dict[str, int] = field(default_factory=dict)
+    seconds: float = 0.0
+
+    def add(self, data: ChunkData) -> None:
+        for table, rows in data.rows.items():
+            self.rows[table] = self.rows.get(table, 0) + rows
+
+    def summary(self) -> str:
+        total = sum(self.rows.values())
+        lines = [f"{table:15} {rows:>12,}" for table, rows in self.rows.items()]
+        lines.append(f"{total:,} rows in {self.seconds:.1f}s ({total / self.seconds:,.0f} rows/s)")
+        return "\n".join(lines)
+
+
+async def _phase_results(
+    config: BulkConfig, executor: ProcessPoolExecutor, chunks: list[Chunk], max_in_flight: int
+) -> AsyncIterator[ChunkData]:
+    """Yields chunks as workers finish them, keeping at most `max_in_flight` in memory."""
+    loop = asyncio.get_running_loop()
+    pending: set[asyncio.Future[ChunkData]] = set()
+    queue = iter(chunks)
+    for chunk in queue:
+        pending.add(loop.run_in_executor(executor, build_chunk, config, chunk))
+        if len(pending) >= max_in_flight:
+            break
+    while pending:
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for future in done:
+            next_chunk = next(queue, None)
+            if next_chunk is not None:
+                pending.add(loop.run_in_executor(executor, build_chunk, config, next_chunk))
+            yield future.result()
+
+
+async def _copy_chunk(pool: asyncpg.Pool, data: ChunkData) -> None:
+    async with pool.acquire() as connection, connection.transaction():
+        for table, payload in data.tables.items():
+            await connection.copy_to_table(
+                table, source=io.BytesIO(payload), columns=TABLE_COLUMNS[table], format="csv"
+            )
+
+
+async def _tune_connection(connection: asyncpg.Connection) -> None:
+    # Disposable data: no need to wait for the WAL flush on every chunk
+    await connection.execute("SET synchronous_commit = off")
+
+
+async def remove(pool: asyncpg.Pool, config: BulkConfig) -> None:
+    """Deletes the users of `config` and, by cascade, everything generated for them."""
+    await pool.execute(
+        "DELETE FROM user_profiles WHERE user_id = ANY($1::text[])", config.user_ids()
+    )
+
+
+async def load(
+    config: BulkConfig,
+    dsn: str,
+    workers: int | None = None,
+    connections: int = 4,
+    replace: bool = False,
+) -> LoadStats:
+    """
+    Generates the dataset with `workers` processes and loads it with COPY over `connections`
+    connections. Each chunk is loaded in its own transaction; with `replace`, the users of a
+    previous run with the same seed are deleted first.
+    """
+    stats = LoadStats()
+    started = time.perf_counter()
+    workers = workers or os.cpu_count() or 1
+    pool = await asyncpg.create_pool(dsn, min_size=1, max_size=connections, init=_tune_connection)
+    try:
+        if replace:
+            await remove(pool, config)
+        with ProcessPoolExecutor(workers) as executor:
+            for phase in PHASES:
+                chunks = plan(config, phase)
+                copies: set[asyncio.Task[None]] = set()
+                async for data in _phase_results(config, executor, chunks, 2 * workers):
+                    stats.add(data)
+                    copies.add(asyncio.create_task(_copy_chunk(pool, data)))
+                    if len(copies) >= 2 * connections:
+                        done, copies = await asyncio.wait(
+                            copies, return_when=asyncio.FIRST_COMPLETED
+                        )
+                        for task in done:
+                            task.result()
+                # The next phase references rows of this one
+                await asyncio.gather(*copies)
+        await pool.execute("ANALYZE " + ", ".join(TABLE_COLUMNS))
+    finally:
+        await pool.close()
+    stats.seconds = time.perf_counter() - started
+    return stats
+
+
+def write_csv(config: BulkConfig, output: Path, workers: int | None = None) -> LoadStats:
+    """
+    Writes one CSV file per table into `output`, plus `load.sql` with the `\\copy` commands
+    for psql in dependency order.
+    """
+    stats = LoadStats()
+    started = time.perf_counter()
+    output.mkdir(parents=True, exist_ok=True)
+    files = {table: open(output / f"{table}.csv", "wb") for table in TABLE_COLUMNS}
+    try:
+        with ProcessPoolExecutor(workers or os.cpu_count() or 1) as executor:
+            for phase in PHASES:
+                chunks = plan(config, phase)
+                for data in executor.map(build_chunk, repeat(config), chunks):
+                    stats.add(data)
+                    for table, payload in data.tables.items():
+                        files[table].write(payload)
+    finally:
+        for file in files.values():
+            file.close()
+    commands = [
+        f"\\copy {table} ({', '.join(columns)}) FROM '{table}.csv' WITH (FORMAT csv)"
+        for table, columns in TABLE_COLUMNS.items()
+    ]
+    (output / "load.sql").write_text("\n".join(commands) + "\n", encoding="utf-8")
+    stats.seconds = time.perf_counter() - started
+    return stats
+
+
+def default_dsn() -> str:
+    """Database URL from Settings (.env), in the form asyncpg expects."""
+    # asyncpg takes a plain libpq URL, without the SQLAlchemy driver suffix
+    url = make_url(get_async_database_url()).set(drivername="postgresql")
+    return url.render_as_string(hide_password=False)
+
+
+def main(argv: list[str] | None = None) -> None:
+    defaults = BulkConfig()
+    parser = argparse.ArgumentParser(description="Generates a large PKM dataset with COPY.")
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument("--users", type=int, default=defaults.users)
+    parser.add_argument("--notes-per-user", type=int, default=defaults.notes_per_user)
+    parser.add_argument("--projects-per-user", type=int, default=defaults.projects_per_user)
+    parser.add_argument("--sources-per-user", type=int, default=defaults.sources_per_user)
+    parser.add_argument("--keywords-per-user", type=int, default=defaults.keywords_per_user)
+    parser.add_argument(
+        "--keywords-per-note", type=float, default=defaults.keywords_per_note_mean
+    )
+    parser.add_argument("--link-exponent", type=float, default=defaults.link_degree_exponent)
+    parser.add_argument("--max-project-depth", type=int, default=defaults.max_project_depth)
+    parser.add_argument("--chunk-size", type=int, default=defaults.chunk_size)
+    parser.add_argument("--workers", type=int, default=None, help="default: CPU count")
+    parser.add_argument("--connections", type=int, default=4)
+    parser.add_argument("--dsn", help="postgresql:// URL; default: built from Settings (.env)")
+    parser.add_argument("--output", type=Path, help="write CSV files here instead of loading")
+    parser.add_argument(
+        "--replace", action="store_true", help="delete a previous run with the same seed first"
+    )
+    args = parser.parse_args(argv)
+
+    config = BulkConfig(
+        seed=args.seed,
+        users=args.users,
+        notes_per_user=args.notes_per_user,
+        projects_per_user=args.projects_per_user,
+        sources_per_user=args.sources_per_user,
+        keywords_per_user=args.keywords_per_user,
+        keywords_per_note_mean=args.keywords_per_note,
+        link_degree_exponent=args.link_exponent,
+        max_project_depth=args.max_project_depth,
+        chunk_size=args.chunk_size,
+    )
+    print(f"Generating {config.total_notes:,} notes: {asdict(config)}")
+    if args.output:
+        stats = write_csv(config, args.output, args.workers)
+    else:
+        stats = asyncio.run(
+            load(config, args.dsn or default_dsn(), args.workers, args.connections, args.replace)
+        )
+    print(stats.summary())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+import pytest
+from pydantic import ValidationError
+
+from pkm_app.core.application.dtos.metadata_filter_dto import MetadataFilter
+
+
+class TestMetadataFilterDTO:
+    def test_metadata_filter_creation(self):
+        dto = MetadataFilter(
+            contains={"status": "draft"},
+            has_keys=["reviewed", "source.author"],
+            path_equals={"source.author": "Ada"},
+        )
+        assert dto.contains == {"status": "draft"}
+        assert dto.has_keys == ["reviewed", "source.author"]
+        assert dto.path_equals == {"source.author": "Ada"}
+        assert not dto.is_empty()
+
+    def test_metadata_filter_empty(self):
+        assert MetadataFilter().is_empty()
+        assert MetadataFilter(contains={}, has_keys=[], path_equals={}).is_empty()
+
+    @pytest.mark.parametrize("path", ["", "a..b", ".a", "a.", "  "])
+    def test_metadata_filter_invalid_has_keys_path(self, path):
+        with pytest.raises(ValidationError):
+            MetadataFilter(has_keys=[path])
+
+    @pytest.mark.parametrize("path", ["", "a..b", "a."])
+    def test_metadata_filter_invalid_path_equals_path(self, path):
+        with pytest.raises(ValidationError):
+            MetadataFilter(path_equals={path: 1})
+
+    def test_metadata_filter_extra_fields_forbidden(self):
+        with pytest.raises(ValidationError):
+            MetadataFilter(contains={"a": 1}, extra_field="fail")
+
+    def test_metadata_filter_is_frozen(self):
+        dto = MetadataFilter(has_keys=["a"])
+        with pytest.raises(ValidationError):
+            dto.has_keys = ["b"]
@@ -0,0 +1,37 @@
+import pytest
+
+from src.pkm_app.core.application.content_hashing import (
+    HASH_SIZE,
+    content_hash,
+    normalize_text,
+    note_text,
+    text_hash,
+)
+
+
+def test_note_text_joins_title_and_content_with_a_blank_line():
+    assert note_text("Título", "Contenido") == "Título\n\nContenido"
+    assert note_text(None, "Contenido") == "Contenido"
+    assert note_text("  ", "Contenido") == "Contenido"
+
+
+@pytest.mark.parametrize(
+    "variant",
+    [
+        "Línea 1\r\nLínea 2",
+        "  Línea 1\nLínea 2\n\n",
+        "Li\u0301nea 1\nLi\u0301nea 2",  # NFD
+    ],
+)
+def test_equivalent_texts_have_the_same_hash(variant):
+    assert normalize_text(variant) == "Línea 1\nLínea 2"
+    assert content_hash("Nota", variant) == content_hash("Nota", "Línea 1\nLínea 2")
+
+
+def test_hash_changes_with_title_and_inner_whitespace():
+    base = content_hash("Nota", "Contenido")
+
+    assert len(base) == HASH_SIZE
+    assert content_hash(None, "Contenido") != base
+    assert content_hash("Nota", "Conte nido") != base
+    assert content_hash("Nota", "Contenido") == text_hash("Nota\n\nContenido")
@@ -0,0 +1,133 @@
+import uuid
+from datetime import UTC, datetime, timedelta
+
+from src.pkm_app.core.application import context_packing
+from src.pkm_app.core.application.context_packing import (
+    MIN_EXCERPT_CHARS,
+    NOTE_MAX_TOKENS,
+    assemble,
+    estimate_tokens,
+    plan,
+    query_terms,
+    query_words,
+    rank,
+)
+from src.pkm_app.core.application.dtos import ContextCandidate, ContextExcerpts
+
+NOW = datetime(2026, 10, 1, tzinfo=UTC)
+
+
+def candidate(**overrides) -> ContextCandidate:
+    values = {
+        "note_id": uuid.uuid4(),
+        "title": "Nota",
+        "updated_at": NOW,
+        "content_length": 100,
+        "keyword_hits": 0,
+        "link_count": 0,
+    }
+    values.update(overrides)
+    return ContextCandidate(**values)
+
+
+def excerpts_for(sections, texts: dict[uuid.UUID, str]) -> ContextExcerpts:
+    return ContextExcerpts(
+        notes={s.id: texts[s.id][: s.chars] for s in sections if s.kind == "note"},
+        projects={s.id: texts[s.id][: s.chars] for s in sections if s.kind == "project"},
+    )
+
+
+def test_estimate_rounds_up_to_whole_tokens():
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("abcd") == 1
+    assert estimate_tokens("abcde") == 2
+
+
+def test_query_terms_are_lowercase_words_and_adjacent_pairs():
+    assert query_words("Machine learning, machine LEARNING y a") == ["machine", "learning"]
+    assert query_terms("Machine learning para notas") == [
+        "machine",
+        "learning",
+        "para",
+        "notas",
+        "machine learning",
+        "learning para",
+        "para notas",
+    ]
+
+
+def test_rank_prefers_keywords_then_title_then_recency():
+    project_id = uuid.uuid4()
+    old = candidate(updated_at=NOW - timedelta(days=365))
+    recent = candidate()
+    titled = candidate(title="Ideas sobre Python", updated_at=NOW - timedelta(days=365))
+    tagged = candidate(keyword_hits=1, updated_at=NOW - timedelta(days=365))
+    in_project = candidate(project_id=project_id, updated_at=NOW - timedelta(days=365))
+
+    ranked = rank([old, recent, titled, in_project, tagged], ["python"], project_id, NOW)
+
+    assert ranked == [tagged, titled, in_project, recent, old]
+
+
+def test_links_break_ties_between_equally_recent_notes():
+    lonely = candidate()
+    linked = candidate(link_count=5)
+
+    assert rank([lonely, linked], [], None, NOW) == [linked, lonely]
+
+
+def test_plan_keeps_the_budget_and_truncates_the_note_that_does_not_fit():
+    first = candidate(content_length=600)
+    second = candidate(content_length=10_000)
+    third = candidate(content_length=10_000)
+
+    sections = plan([first, second, third], "", None, max_tokens=300)
+
+    assert [s.id for s in sections] == [first.note_id, second.note_id]
+    assert sections[0].chars == 600 and not sections[0].truncated
+    assert sections[1].truncated and sections[1].chars >= MIN_EXCERPT_CHARS
+    texts = {first.note_id: "a " * 300, second.note_id: "b " * 5000}
+    context = assemble(sections, "", excerpts_for(sections, texts), 300, "v1")
+    assert context.tokens <= 300
+    assert [item.truncated for item in context.items] == [False, True]
+
+
+def test_long_notes_are_capped_so_several_fit():
+    notes = [candidate(content_length=100_000) for _ in range(3)]
+
+    sections = plan(notes, "", None, max_tokens=10 * NOTE_MAX_TOKENS)
+
+    assert len(sections) == 3
+    assert all(
+        context_packing.tokens_for_chars(len(s.heading) + 3 + s.chars) <= NOTE_MAX_TOKENS
+        for s in sections
+    )
+
+
+def test_profile_and_requested_project_go_first():
+    project_id, other_project = uuid.uuid4(), uuid.uuid4()
+    notes = [
+        candidate(project_id=other_project, project_name="Otro", project_description_length=50),
+        candidate(project_id=project_id, project_name="Tesis", project_description_length=50),
+    ]
+
+    sections = plan(notes, '{"idioma": "es"}', project_id, max_tokens=2000)
+
+    assert [(s.kind, s.id) for s in sections[:3]] == [
+        ("profile", None),
+        ("project", project_id),
+        ("project", other_project),
+    ]
+    assert [s.kind for s in sections[3:]] == ["note", "note"]
+
+
+def test_deleted_notes_are_skipped_when_assembling():
+    kept, deleted = candidate(content_length=5), candidate(content_length=5)
+    sections = plan([kept, deleted], "", None, max_tokens=500)
+
+    context = assemble(
+        sections, "", ContextExcerpts(notes={kept.note_id: "hola"}, projects={}), 500, "v1"
+    )
+
+    assert [item.id for item in context.items] == [kept.note_id]
+    assert context.text.endswith("\nhola")
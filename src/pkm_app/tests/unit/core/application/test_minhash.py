@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+
+from src.pkm_app.core.application.minhash import (
+    BANDS,
+    NUM_PERM,
+    SIGNATURE_DTYPE,
+    band_keys,
+    estimated_jaccard,
+    minhash_signature,
+    shingle_hashes,
+)
+
+TEXT = " ".join(f"palabra{i}" for i in range(200))
+
+
+def _jaccard(a: str, b: str) -> float:
+    first, second = set(shingle_hashes(a).tolist()), set(shingle_hashes(b).tolist())
+    return len(first & second) / len(first | second)
+
+
+def test_signature_is_deterministic_and_has_num_perm_values():
+    signature = minhash_signature(TEXT)
+
+    assert signature.dtype == SIGNATURE_DTYPE
+    assert signature.shape == (NUM_PERM,)
+    np.testing.assert_array_equal(signature, minhash_signature(TEXT))
+
+
+def test_signature_ignores_case_and_whitespace():
+    np.testing.assert_array_equal(
+        minhash_signature("Hola  Mundo\r\nfeliz"), minhash_signature("hola mundo\nFELIZ")
+    )
+
+
+@pytest.mark.parametrize("content", [None, "", "  ¡! ..."])
+def test_text_without_words_has_no_signature(content):
+    assert minhash_signature(content) is None
+
+
+def test_short_text_is_a_single_shingle():
+    assert shingle_hashes("dos palabras").shape == (1,)
+
+
+def test_estimated_jaccard_is_close_to_the_true_similarity():
+    words = TEXT.split()
+    edited = " ".join(words[:180] + ["cambio"] * 5 + words[185:])
+    expected = _jaccard(TEXT, edited)
+
+    estimate = estimated_jaccard(minhash_signature(TEXT), minhash_signature(edited)[None, :])
+
+    assert estimate.shape == (1,)
+    assert estimate[0] == pytest.approx(expected, abs=0.1)
+
+
+def test_band_keys_have_one_int64_per_band_and_accept_matrices():
+    signatures = np.stack([minhash_signature(TEXT), minhash_signature("otro texto distinto")])
+
+    keys = band_keys("user-1", signatures)
+
+    assert keys.dtype == np.int64
+    assert keys.shape == (2, BANDS)
+    np.testing.assert_array_equal(keys[0], band_keys("user-1", signatures[0]))
+
+
+def test_band_keys_depend_on_the_user():
+    signature = minhash_signature(TEXT)
+
+    assert not np.intersect1d(band_keys("user-1", signature), band_keys("user-2", signature)).size
+
+
+def test_near_duplicates_share_band_keys_and_unrelated_texts_do_not():
+    near = TEXT.replace("palabra100", "otra")
+    unrelated = " ".join(f"termino{i}" for i in range(200))
+    keys = band_keys("user-1", minhash_signature(TEXT))
+
+    assert np.intersect1d(keys, band_keys("user-1", minhash_signature(near))).size
+    assert not np.intersect1d(keys, band_keys("user-1", minhash_signature(unrelated))).size
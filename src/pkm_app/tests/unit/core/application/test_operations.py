@@ -0,0 +1,90 @@
+import asyncio
+
+import pytest
+
+from src.pkm_app.core.application.operations import (
+    Operation,
+    add_operation_observer,
+    current_operation,
+    operation_scope,
+    remove_operation_observer,
+    traced_use_case,
+)
+
+
+class RecordingObserver:
+    def __init__(self):
+        self.events: list[tuple[str, str, BaseException | None]] = []
+
+    def operation_started(self, operation: Operation) -> None:
+        self.events.append(("started", operation.name, None))
+
+    def operation_finished(self, operation: Operation, error: BaseException | None) -> None:
+        self.events.append(("finished", operation.name, error))
+
+
+@pytest.fixture
+def observer():
+    observer = RecordingObserver()
+    add_operation_observer(observer)
+    yield observer
+    remove_operation_observer(observer)
+
+
+class DummyUseCase:
+    @traced_use_case
+    async def execute(self, value: int) -> tuple[str | None, int]:
+        operation = current_operation()
+        return (operation.name if operation else None), value
+
+
+def test_operation_scope_sets_and_restores_current_operation():
+    assert current_operation() is None
+    with operation_scope("outer") as outer:
+        assert current_operation() is outer
+        with operation_scope("inner") as inner:
+            assert current_operation() is inner
+            assert [op.name for op in inner.chain()] == ["inner", "outer"]
+        assert current_operation() is outer
+    assert current_operation() is None
+
+
+@pytest.mark.asyncio
+async def test_traced_use_case_names_operation_after_class(observer: RecordingObserver):
+    assert await DummyUseCase().execute(3) == ("DummyUseCase", 3)
+    assert DummyUseCase.execute.__name__ == "execute"
+    assert observer.events == [
+        ("started", "DummyUseCase", None),
+        ("finished", "DummyUseCase", None),
+    ]
+
+
+def test_observers_receive_the_error(observer: RecordingObserver):
+    with pytest.raises(ValueError):
+        with operation_scope("failing"):
+            raise ValueError("boom")
+    assert isinstance(observer.events[-1][2], ValueError)
+
+
+def test_failing_observer_does_not_break_the_operation(observer: RecordingObserver):
+    class BrokenObserver(RecordingObserver):
+        def operation_started(self, operation: Operation) -> None:
+            raise RuntimeError("observer bug")
+
+    broken = BrokenObserver()
+    add_operation_observer(broken)
+    try:
+        with operation_scope("resilient") as operation:
+            assert current_operation() is operation
+    finally:
+        remove_operation_observer(broken)
+    assert observer.events[-1] == ("finished", "resilient", None)
+
+
+@pytest.mark.asyncio
+async def test_child_tasks_see_the_operation():
+    async def child() -> Operation | None:
+        return current_operation()
+
+    with operation_scope("parent") as operation:
+        assert await asyncio.create_task(child()) is operation
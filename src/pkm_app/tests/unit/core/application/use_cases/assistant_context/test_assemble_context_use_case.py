@@ -0,0 +1,163 @@
+import uuid
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.pkm_app.core.application.dtos import (
+    ChangeFeedPage,
+    ContextCandidate,
+    ContextExcerpts,
+    ContextState,
+)
+from src.pkm_app.core.application.use_cases.assistant_context.assemble_context_use_case import (
+    AssembleContextUseCase,
+    ContextMemo,
+)
+from src.pkm_app.core.domain.errors import PermissionDeniedError, RepositoryError
+
+USER_ID = "test_user_id"
+CHANGED_AT = datetime(2026, 10, 1, tzinfo=UTC)
+
+
+def _candidate(content_length: int = 40, **overrides) -> ContextCandidate:
+    values = {
+        "note_id": uuid.uuid4(),
+        "title": "Nota",
+        "updated_at": CHANGED_AT,
+        "content_length": content_length,
+        "keyword_hits": 0,
+        "link_count": 0,
+    }
+    values.update(overrides)
+    return ContextCandidate(**values)
+
+
+@pytest.fixture
+def mock_uow():
+    uow = AsyncMock()
+    uow.__aenter__.return_value = uow
+    uow.changes.get_changes_since.return_value = ChangeFeedPage(next_cursor=10)
+    uow.assistant_context.get_state.return_value = ContextState(CHANGED_AT, {"tono": "breve"})
+    return uow
+
+
+@pytest.mark.asyncio
+async def test_context_reads_only_the_excerpts_that_fit(mock_uow):
+    tagged = _candidate(keyword_hits=1)
+    recent = _candidate(content_length=50_000)
+    mock_uow.assistant_context.find_candidates.return_value = [recent, tagged]
+    mock_uow.assistant_context.get_excerpts.return_value = ContextExcerpts(
+        notes={tagged.note_id: "x" * 40, recent.note_id: "y " * 500}, projects={}
+    )
+
+    context = await AssembleContextUseCase(mock_uow).execute(
+        user_id=USER_ID, query="Python asyncio", max_tokens=500
+    )
+
+    terms = mock_uow.assistant_context.find_candidates.await_args.args[1]
+    assert terms == ["python", "asyncio", "python asyncio"]
+    _, notes, projects = mock_uow.assistant_context.get_excerpts.await_args.args
+    assert list(notes) == [tagged.note_id, recent.note_id]
+    assert notes[tagged.note_id] == 40 and notes[recent.note_id] < 2000
+    assert projects == {}
+    assert [item.kind for item in context.items] == ["profile", "note", "note"]
+    assert context.text.startswith('## Perfil del usuario\n{"tono": "breve"}')
+    assert context.tokens <= context.max_tokens == 500
+
+
+@pytest.mark.asyncio
+async def test_memo_answers_while_the_data_version_does_not_change(mock_uow):
+    mock_uow.assistant_context.find_candidates.return_value = []
+    mock_uow.assistant_context.get_excerpts.return_value = ContextExcerpts(notes={}, projects={})
+    memo = ContextMemo()
+
+    first = await AssembleContextUseCase(mock_uow, memo).execute(user_id=USER_ID, query="Python")
+    again = await AssembleContextUseCase(mock_uow, memo).execute(user_id=USER_ID, query="python")
+    mock_uow.assistant_context.get_state.return_value = ContextState(CHANGED_AT, None)
+    profile_changed = await AssembleContextUseCase(mock_uow, memo).execute(
+        user_id=USER_ID, query="python"
+    )
+
+    assert again is first
+    assert profile_changed.version != first.version
+    assert mock_uow.assistant_context.find_candidates.await_count == 2
+    assert (memo.hits, memo.misses, len(memo)) == (1, 2, 2)
+    mock_uow.changes.get_changes_since.assert_awaited_with(user_id=USER_ID, cursor=0, limit=1)
+    # La numeración de los cambios pendientes se confirma en cada petición
+    assert mock_uow.commit.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_a_late_commit_below_the_last_changed_at_changes_the_version(mock_uow):
+    # La escritura tardía no mueve el último changed_at (now() al empezar su transacción),
+    # pero el feed la numera después de todo lo anterior
+    mock_uow.assistant_context.find_candidates.return_value = []
+    mock_uow.assistant_context.get_excerpts.return_value = ContextExcerpts(notes={}, projects={})
+    memo = ContextMemo()
+
+    first = await AssembleContextUseCase(mock_uow, memo).execute(user_id=USER_ID, query="python")
+    mock_uow.changes.get_changes_since.return_value = ChangeFeedPage(next_cursor=11)
+    late = await AssembleContextUseCase(mock_uow, memo).execute(user_id=USER_ID, query="python")
+
+    assert late.version != first.version
+    assert memo.hits == 0
+    assert mock_uow.assistant_context.find_candidates.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_changes_left_unsequenced_bypass_the_memo(mock_uow):
+    mock_uow.assistant_context.get_state.return_value = ContextState(
+        CHANGED_AT, None, pending_changes=True
+    )
+    mock_uow.assistant_context.find_candidates.return_value = []
+    mock_uow.assistant_context.get_excerpts.return_value = ContextExcerpts(notes={}, projects={})
+    memo = ContextMemo()
+
+    for _ in range(2):
+        await AssembleContextUseCase(mock_uow, memo).execute(user_id=USER_ID, query="python")
+
+    assert (memo.hits, memo.misses, len(memo)) == (0, 0, 0)
+    assert mock_uow.assistant_context.find_candidates.await_count == 2
+
+
+def test_memo_evicts_the_least_recently_used_context():
+    memo = ContextMemo(maxsize=2)
+    memo.put("a", object())
+    memo.put("b", object())
+    memo.get("a")
+    memo.put("c", object())
+
+    assert memo.get("b") is None
+    assert memo.get("a") is not None and memo.get("c") is not None
+
+
+@pytest.mark.asyncio
+async def test_budget_defaults_and_is_clamped(mock_uow):
+    mock_uow.assistant_context.find_candidates.return_value = []
+    mock_uow.assistant_context.get_excerpts.return_value = ContextExcerpts(notes={}, projects={})
+    use_case = AssembleContextUseCase(mock_uow)
+
+    default = await use_case.execute(user_id=USER_ID, max_tokens=0)
+    clamped = await use_case.execute(user_id=USER_ID, max_tokens=10**9)
+
+    assert default.max_tokens == AssembleContextUseCase.DEFAULT_MAX_TOKENS
+    assert clamped.max_tokens == AssembleContextUseCase.MAX_MAX_TOKENS
+
+
+@pytest.mark.asyncio
+async def test_missing_user_is_rejected(mock_uow):
+    with pytest.raises(PermissionDeniedError):
+        await AssembleContextUseCase(mock_uow).execute(user_id="", query="python")
+    mock_uow.assistant_context.get_state.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_repository_errors_are_wrapped(mock_uow):
+    mock_uow.assistant_context.find_candidates.side_effect = Exception("DB down")
+
+    with pytest.raises(RepositoryError) as exc_info:
+        await AssembleContextUseCase(mock_uow).execute(user_id=USER_ID, query="python")
+
+    assert exc_info.value.context["operation"] == "assemble_context"
+    mock_uow.rollback.assert_awaited_once()
@@ -0,0 +1,108 @@
+import uuid
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.pkm_app.core.application.dtos import ChangeFeedPage, ChangeRecord
+from src.pkm_app.core.application.use_cases.change_feed.get_changes_since_use_case import (
+    GetChangesSinceUseCase,
+)
+from src.pkm_app.core.domain.errors import PermissionDeniedError, RepositoryError, ValidationError
+
+USER_ID = "test_user_id"
+
+
+@pytest.fixture
+def mock_uow():
+    uow = AsyncMock()
+    uow.__aenter__.return_value = uow
+    return uow
+
+
+def _page(*seqs: int, has_more: bool = False) -> ChangeFeedPage:
+    changes = [
+        ChangeRecord(
+            seq=seq,
+            entity_type="note",
+            entity_id=uuid.uuid4(),
+            operation="upsert",
+            version=1,
+            changed_at=datetime.now(UTC),
+        )
+        for seq in seqs
+    ]
+    return ChangeFeedPage(changes=changes, next_cursor=seqs[-1] if seqs else 0, has_more=has_more)
+
+
+@pytest.mark.asyncio
+async def test_get_changes_since_commits_the_sequencing(mock_uow):
+    mock_uow.changes.get_changes_since.return_value = _page(11, 12, has_more=True)
+
+    page = await GetChangesSinceUseCase(mock_uow).execute(user_id=USER_ID, cursor=10, limit=2)
+
+    mock_uow.changes.get_changes_since.assert_awaited_once_with(
+        user_id=USER_ID, cursor=10, limit=2
+    )
+    mock_uow.commit.assert_awaited_once()
+    assert [change.seq for change in page.changes] == [11, 12]
+    assert page.next_cursor == 12
+    assert page.has_more
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("limit", "expected"),
+    [
+        (None, GetChangesSinceUseCase.DEFAULT_LIMIT),
+        (0, GetChangesSinceUseCase.DEFAULT_LIMIT),
+        (5000, GetChangesSinceUseCase.MAX_LIMIT),
+    ],
+)
+async def test_get_changes_since_normalizes_limit(mock_uow, limit, expected):
+    mock_uow.changes.get_changes_since.return_value = _page()
+
+    await GetChangesSinceUseCase(mock_uow).execute(user_id=USER_ID, limit=limit)
+
+    mock_uow.changes.get_changes_since.assert_awaited_once_with(
+        user_id=USER_ID, cursor=0, limit=expected
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_changes_since_requires_user_id(mock_uow):
+    with pytest.raises(PermissionDeniedError):
+        await GetChangesSinceUseCase(mock_uow).execute(user_id="")
+    mock_uow.changes.get_changes_since.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_get_changes_since_rejects_negative_cursor(mock_uow):
+    with pytest.raises(ValidationError):
+        await GetChangesSinceUseCase(mock_uow).execute(user_id=USER_ID, cursor=-1)
+    mock_uow.changes.get_changes_since.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_get_changes_since_returns_reset_pages_as_is(mock_uow):
+    mock_uow.changes.get_changes_since.return_value = ChangeFeedPage(
+        next_cursor=40, reset_required=True
+    )
+
+    page = await GetChangesSinceUseCase(mock_uow).execute(user_id=USER_ID, cursor=3)
+
+    assert page.reset_required
+    assert page.changes == []
+    assert page.next_cursor == 40
+
+
+@pytest.mark.asyncio
+async def test_get_changes_since_wraps_repository_errors(mock_uow):
+    mock_uow.changes.get_changes_since.side_effect = Exception("DB caída")
+
+    with pytest.raises(RepositoryError) as exc_info:
+        await GetChangesSinceUseCase(mock_uow).execute(user_id=USER_ID, cursor=1)
+
+    mock_uow.rollback.assert_awaited_once()
+    mock_uow.commit.assert_not_awaited()
+    assert exc_info.value.context["operation"] == "get_changes_since"
@@ -0,0 +1,46 @@
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.pkm_app.core.application.use_cases.change_feed.purge_change_tombstones_use_case import (
+    PurgeChangeTombstonesUseCase,
+)
+from src.pkm_app.core.domain.errors import RepositoryError, ValidationError
+
+
+@pytest.fixture
+def mock_uow():
+    uow = AsyncMock()
+    uow.__aenter__.return_value = uow
+    return uow
+
+
+@pytest.mark.asyncio
+async def test_purge_uses_default_retention_and_commits(mock_uow):
+    mock_uow.changes.purge_tombstones.return_value = 7
+
+    purged = await PurgeChangeTombstonesUseCase(mock_uow).execute()
+
+    assert purged == 7
+    older_than = mock_uow.changes.purge_tombstones.await_args.kwargs["older_than"]
+    expected = datetime.now(UTC) - PurgeChangeTombstonesUseCase.DEFAULT_RETENTION
+    assert abs(older_than - expected) < timedelta(seconds=5)
+    mock_uow.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_purge_rejects_negative_retention(mock_uow):
+    with pytest.raises(ValidationError):
+        await PurgeChangeTombstonesUseCase(mock_uow).execute(retention=timedelta(days=-1))
+    mock_uow.changes.purge_tombstones.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_purge_wraps_repository_errors(mock_uow):
+    mock_uow.changes.purge_tombstones.side_effect = Exception("DB caída")
+
+    with pytest.raises(RepositoryError):
+        await PurgeChangeTombstonesUseCase(mock_uow).execute(retention=timedelta(days=1))
+
+    mock_uow.rollback.assert_awaited_once()
@@ -0,0 +1,57 @@
+import uuid
+from unittest.mock import AsyncMock
+
+import numpy as np
+import pytest
+
+from src.pkm_app.core.application.dtos import NoteText
+from src.pkm_app.core.application.minhash import minhash_signature
+from src.pkm_app.core.application.use_cases.near_duplicates.backfill_note_minhash_use_case import (
+    BackfillNoteMinHashUseCase,
+)
+from src.pkm_app.core.domain.errors import RepositoryError, ValidationError
+
+
+@pytest.fixture
+def mock_uow():
+    uow = AsyncMock()
+    uow.__aenter__.return_value = uow
+    return uow
+
+
+@pytest.mark.asyncio
+async def test_backfill_saves_signatures_per_user_and_commits_each_batch(mock_uow):
+    first = [
+        NoteText(uuid.uuid4(), "user-1", "una nota de prueba"),
+        NoteText(uuid.uuid4(), "user-2", None),
+    ]
+    second = [NoteText(uuid.uuid4(), "user-1", "otra nota")]
+    mock_uow.near_duplicates.list_unindexed.side_effect = [first, second, []]
+
+    indexed = await BackfillNoteMinHashUseCase(mock_uow).execute(batch_size=2)
+
+    assert indexed == 3
+    assert mock_uow.commit.await_count == 2
+    saved = mock_uow.near_duplicates.save_signatures.await_args_list
+    assert [call.args[0] for call in saved] == ["user-1", "user-2", "user-1"]
+    np.testing.assert_array_equal(
+        saved[0].args[1][first[0].note_id], minhash_signature("una nota de prueba")
+    )
+    assert saved[1].args[1] == {first[1].note_id: None}
+    mock_uow.near_duplicates.list_unindexed.assert_awaited_with(2)
+
+
+@pytest.mark.asyncio
+async def test_backfill_rejects_non_positive_batch_size(mock_uow):
+    with pytest.raises(ValidationError):
+        await BackfillNoteMinHashUseCase(mock_uow).execute(batch_size=0)
+    mock_uow.near_duplicates.list_unindexed.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_backfill_wraps_repository_errors(mock_uow):
+    mock_uow.near_duplicates.list_unindexed.side_effect = Exception("DB down")
+
+    with pytest.raises(RepositoryError):
+        await BackfillNoteMinHashUseCase(mock_uow).execute()
+    mock_uow.rollback.assert_awaited_once()
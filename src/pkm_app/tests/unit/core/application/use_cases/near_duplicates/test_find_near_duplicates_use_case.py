@@ -0,0 +1,119 @@
+import uuid
+from unittest.mock import AsyncMock
+
+import numpy as np
+import pytest
+
+from src.pkm_app.core.application.minhash import NUM_PERM, SIGNATURE_DTYPE
+from src.pkm_app.core.application.use_cases.near_duplicates.find_near_duplicates_use_case import (
+    FindNearDuplicatesUseCase,
+)
+from src.pkm_app.core.domain.errors import PermissionDeniedError, RepositoryError, ValidationError
+
+USER_ID = "test_user_id"
+
+
+def _signature(changed: int = 0, offset: int = 0) -> np.ndarray:
+    """Firma base con `changed` posiciones alteradas: similitud estimada 1 - changed/NUM_PERM."""
+    signature = np.arange(offset, offset + NUM_PERM, dtype=SIGNATURE_DTYPE)
+    signature[:changed] += 10_000
+    return signature
+
+
+@pytest.fixture
+def mock_uow():
+    uow = AsyncMock()
+    uow.__aenter__.return_value = uow
+    return uow
+
+
+@pytest.mark.asyncio
+async def test_note_cluster_keeps_candidates_above_the_threshold(mock_uow):
+    note_id, close, closer, far = (uuid.uuid4() for _ in range(4))
+    mock_uow.near_duplicates.get_signatures.return_value = {note_id: _signature()}
+    mock_uow.near_duplicates.find_candidates.return_value = {
+        close: _signature(changed=12),
+        closer: _signature(changed=6),
+        far: _signature(changed=60),
+    }
+
+    clusters = await FindNearDuplicatesUseCase(mock_uow).execute(user_id=USER_ID, note_id=note_id)
+
+    assert len(clusters) == 1
+    assert clusters[0].anchor_id == note_id
+    assert [note.note_id for note in clusters[0].notes] == [closer, close]
+    assert clusters[0].notes[0].similarity == pytest.approx(1 - 6 / NUM_PERM)
+    mock_uow.near_duplicates.find_candidates.assert_awaited_once_with(
+        USER_ID, note_id, FindNearDuplicatesUseCase.MAX_CANDIDATES
+    )
+
+
+@pytest.mark.asyncio
+async def test_note_without_signature_has_no_near_duplicates(mock_uow):
+    mock_uow.near_duplicates.get_signatures.return_value = {}
+
+    clusters = await FindNearDuplicatesUseCase(mock_uow).execute(
+        user_id=USER_ID, note_id=uuid.uuid4()
+    )
+
+    assert clusters == []
+    mock_uow.near_duplicates.find_candidates.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_user_clusters_merge_buckets_and_drop_false_positives(mock_uow):
+    a, b, c, d, e = sorted(uuid.uuid4() for _ in range(5))
+    # a~b y b~c en cubos distintos forman un único grupo; d comparte cubo con a sin parecerse
+    mock_uow.near_duplicates.find_candidate_buckets.return_value = [[a, b, d], [b, c], [d, e]]
+    mock_uow.near_duplicates.get_signatures.return_value = {
+        a: _signature(),
+        b: _signature(changed=6),
+        c: _signature(changed=12),
+        d: _signature(offset=5_000),
+        e: _signature(offset=5_000, changed=3),
+    }
+
+    clusters = await FindNearDuplicatesUseCase(mock_uow).execute(user_id=USER_ID)
+
+    assert [cluster.anchor_id for cluster in clusters] == [b, min(d, e)]
+    assert {note.note_id for note in clusters[0].notes} == {a, c}
+    assert [note.note_id for note in clusters[1].notes] == [max(d, e)]
+    mock_uow.near_duplicates.find_candidate_buckets.assert_awaited_once_with(
+        USER_ID, FindNearDuplicatesUseCase.MAX_BUCKET_SIZE
+    )
+
+
+@pytest.mark.asyncio
+async def test_user_clusters_are_limited(mock_uow):
+    pairs = [(uuid.uuid4(), uuid.uuid4()) for _ in range(3)]
+    mock_uow.near_duplicates.find_candidate_buckets.return_value = [list(p) for p in pairs]
+    mock_uow.near_duplicates.get_signatures.return_value = {
+        note_id: _signature(offset=1_000 * i) for i, pair in enumerate(pairs) for note_id in pair
+    }
+
+    clusters = await FindNearDuplicatesUseCase(mock_uow).execute(user_id=USER_ID, limit=2)
+
+    assert len(clusters) == 2
+
+
+@pytest.mark.asyncio
+async def test_find_near_duplicates_requires_user_id(mock_uow):
+    with pytest.raises(PermissionDeniedError):
+        await FindNearDuplicatesUseCase(mock_uow).execute(user_id="")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("threshold", [0, -0.5, 1.5])
+async def test_find_near_duplicates_rejects_invalid_thresholds(mock_uow, threshold):
+    with pytest.raises(ValidationError):
+        await FindNearDuplicatesUseCase(mock_uow).execute(user_id=USER_ID, threshold=threshold)
+    mock_uow.near_duplicates.find_candidate_buckets.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_find_near_duplicates_wraps_repository_errors(mock_uow):
+    mock_uow.near_duplicates.find_candidate_buckets.side_effect = Exception("DB down")
+
+    with pytest.raises(RepositoryError):
+        await FindNearDuplicatesUseCase(mock_uow).execute(user_id=USER_ID)
+    mock_uow.rollback.assert_awaited_once()
@@ -0,0 +1,229 @@
+import uuid
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.pkm_app.core.application.dtos import NoteSchema, ProjectSchema
+from src.pkm_app.core.application.use_cases.note import list_notes_use_case
+from src.pkm_app.core.application.use_cases.note.get_note_use_case import GetNoteUseCase
+from src.pkm_app.core.application.use_cases.note.list_notes_use_case import ListNotesUseCase
+from src.pkm_app.core.application.use_cases.note.search_notes_by_project_use_case import (
+    SearchNotesByProjectUseCase,
+)
+from src.pkm_app.core.application.versioning import (
+    NotModified,
+    Versioned,
+    entity_version,
+    scope_version,
+)
+from src.pkm_app.core.domain.errors import (
+    NoteNotFoundError,
+    PermissionDeniedError,
+    ProjectNotFoundError,
+)
+
+USER_ID = "test_user_id"
+NOW = datetime(2025, 1, 1, 12, 0, tzinfo=UTC)
+
+
+def make_note(**overrides) -> NoteSchema:
+    values = {
+        "id": uuid.uuid4(),
+        "user_id": USER_ID,
+        "title": "Nota",
+        "content": "Contenido",
+        "created_at": NOW,
+        "updated_at": NOW,
+    }
+    values.update(overrides)
+    return NoteSchema(**values)
+
+
+@pytest.fixture
+def uow():
+    mock = AsyncMock()
+    mock.__aenter__.return_value = mock
+    return mock
+
+
+def test_entity_version_changes_with_updated_at():
+    note_id = uuid.uuid4()
+    version = entity_version(note_id, NOW)
+
+    assert version == entity_version(note_id, NOW.replace(tzinfo=None))  # naive = UTC
+    assert version != entity_version(note_id, NOW + timedelta(microseconds=1))
+    assert version != entity_version(uuid.uuid4(), NOW)
+
+
+def test_scope_version_depends_on_scope_maximum_and_count():
+    version = scope_version("notes:u:0:50", NOW, 3)
+
+    assert version == scope_version("notes:u:0:50", NOW, 3)
+    assert version != scope_version("notes:u:50:50", NOW, 3)
+    assert version != scope_version("notes:u:0:50", NOW, 2)  # una nota borrada
+    assert version != scope_version("notes:u:0:50", NOW + timedelta(seconds=1), 3)
+    assert version != scope_version("notes:u:0:50", NOW, 3, 1)  # una escritura confirmada
+    assert scope_version("notes:u:0:50", None, 0) != version
+
+
+@pytest.mark.asyncio
+async def test_get_note_without_known_version_loads_the_note(uow):
+    note = make_note()
+    uow.notes.get_by_id.return_value = note
+
+    result = await GetNoteUseCase(uow).execute_if_modified(note_id=note.id, user_id=USER_ID)
+
+    assert result == Versioned(note, entity_version(note.id, NOW))
+    uow.notes.get_updated_at.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_get_note_with_current_version_only_probes(uow):
+    note_id = uuid.uuid4()
+    uow.notes.get_updated_at.return_value = NOW
+    version = entity_version(note_id, NOW)
+
+    result = await GetNoteUseCase(uow).execute_if_modified(
+        note_id=note_id, user_id=USER_ID, known_version=version
+    )
+
+    assert result == NotModified(version)
+    uow.notes.get_updated_at.assert_awaited_once_with(note_id=note_id, user_id=USER_ID)
+    uow.notes.get_by_id.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_get_note_with_stale_version_returns_the_new_one(uow):
+    later = NOW + timedelta(seconds=5)
+    note = make_note(updated_at=later)
+    uow.notes.get_updated_at.return_value = later
+    uow.notes.get_by_id.return_value = note
+
+    result = await GetNoteUseCase(uow).execute_if_modified(
+        note_id=note.id, user_id=USER_ID, known_version=entity_version(note.id, NOW)
+    )
+
+    assert isinstance(result, Versioned)
+    assert result.data == note
+    assert result.version == entity_version(note.id, later)
+
+
+@pytest.mark.asyncio
+async def test_get_note_if_modified_raises_not_found_for_missing_note(uow):
+    uow.notes.get_updated_at.return_value = None
+    uow.notes.get_by_id.return_value = None
+
+    with pytest.raises(NoteNotFoundError):
+        await GetNoteUseCase(uow).execute_if_modified(
+            note_id=uuid.uuid4(), user_id=USER_ID, known_version="abc"
+        )
+
+
+@pytest.mark.asyncio
+async def test_get_note_if_modified_requires_user_id(uow):
+    with pytest.raises(PermissionDeniedError):
+        await GetNoteUseCase(uow).execute_if_modified(note_id=uuid.uuid4(), user_id="")
+
+
+@pytest.mark.asyncio
+async def test_list_notes_with_current_version_skips_the_listing(uow):
+    uow.notes.get_list_stats.return_value = (NOW, 7, 42)
+    version = scope_version(f"notes:{USER_ID}:0:50", NOW, 7, 42)
+
+    result = await ListNotesUseCase(uow).execute_if_modified(
+        user_id=USER_ID, known_version=version
+    )
+
+    assert result == NotModified(version)
+    uow.notes.get_list_stats.assert_awaited_once_with(user_id=USER_ID)
+    uow.notes.list_by_user.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_list_notes_pages_have_their_own_version(uow):
+    notes = [make_note()]
+    uow.notes.get_list_stats.return_value = (NOW, 7, 42)
+    uow.notes.list_by_user.return_value = notes
+    first_page = scope_version(f"notes:{USER_ID}:0:50", NOW, 7, 42)
+
+    result = await ListNotesUseCase(uow).execute_if_modified(
+        user_id=USER_ID, known_version=first_page, skip=50, limit=50
+    )
+
+    assert result == Versioned(notes, scope_version(f"notes:{USER_ID}:50:50", NOW, 7, 42))
+    uow.notes.list_by_user.assert_awaited_once_with(user_id=USER_ID, skip=50, limit=50)
+
+
+@pytest.mark.asyncio
+async def test_list_notes_detects_a_late_commit_below_the_maximum(uow):
+    # Una transacción que empezó antes del máximo confirma después de que el cliente leyera
+    # el listado: su updated_at (now() al empezar) no mueve el máximo ni el recuento
+    notes = [make_note(), make_note(updated_at=NOW - timedelta(seconds=5))]
+    uow.notes.get_list_stats.return_value = (NOW, 2, 42)
+    known = scope_version(f"notes:{USER_ID}:0:50", NOW, 2, 42)
+    uow.notes.get_list_stats.return_value = (NOW, 2, 43)
+    uow.notes.list_by_user.return_value = notes
+
+    result = await ListNotesUseCase(uow).execute_if_modified(
+        user_id=USER_ID, known_version=known
+    )
+
+    assert isinstance(result, Versioned)
+    assert result.version != known
+    uow.notes.list_by_user.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_list_notes_if_modified_wraps_repository_errors(uow):
+    uow.notes.get_list_stats.side_effect = Exception("DB caída")
+
+    # El módulo importa los errores como `pkm_app.…`: se usa su misma clase
+    with pytest.raises(list_notes_use_case.RepositoryError):
+        await ListNotesUseCase(uow).execute_if_modified(user_id=USER_ID)
+    uow.rollback.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_project_notes_with_current_version_skip_project_and_notes(uow):
+    project_id = uuid.uuid4()
+    uow.notes.get_list_stats.return_value = (NOW, 2, 42)
+    version = scope_version(f"project-notes:{USER_ID}:{project_id}:0:50", NOW, 2, 42)
+
+    result = await SearchNotesByProjectUseCase(uow).execute_if_modified(
+        project_id=project_id, user_id=USER_ID, known_version=version
+    )
+
+    assert result == NotModified(version)
+    uow.notes.get_list_stats.assert_awaited_once_with(user_id=USER_ID, project_id=project_id)
+    uow.projects.get_by_id.assert_not_awaited()
+    uow.notes.search_by_project.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_project_notes_if_modified_returns_project_and_notes(uow):
+    project = ProjectSchema(
+        id=uuid.uuid4(), user_id=USER_ID, name="Proyecto", created_at=NOW, updated_at=NOW
+    )
+    notes = [make_note(project_id=project.id)]
+    uow.notes.get_list_stats.return_value = (NOW, 1, 42)
+    uow.projects.get_by_id.return_value = project
+    uow.notes.search_by_project.return_value = notes
+
+    result = await SearchNotesByProjectUseCase(uow).execute_if_modified(
+        project_id=project.id, user_id=USER_ID
+    )
+
+    assert isinstance(result, Versioned)
+    assert result.data == (project, notes)
+
+
+@pytest.mark.asyncio
+async def test_project_notes_if_modified_raises_not_found_for_missing_project(uow):
+    uow.notes.get_list_stats.return_value = None
+
+    with pytest.raises(ProjectNotFoundError):
+        await SearchNotesByProjectUseCase(uow).execute_if_modified(
+            project_id=uuid.uuid4(), user_id=USER_ID
+        )
+    uow.projects.get_by_id.assert_not_awaited()
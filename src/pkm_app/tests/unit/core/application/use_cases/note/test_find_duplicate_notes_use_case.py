@@ -0,0 +1,65 @@
+import uuid
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.pkm_app.core.application.dtos import DuplicateNoteGroup
+from src.pkm_app.core.application.use_cases.note.find_duplicate_notes_use_case import (
+    FindDuplicateNotesUseCase,
+)
+from src.pkm_app.core.domain.errors import PermissionDeniedError, RepositoryError
+
+USER_ID = "test_user_id"
+
+
+@pytest.fixture
+def mock_uow():
+    uow = AsyncMock()
+    uow.__aenter__.return_value = uow
+    return uow
+
+
+@pytest.mark.asyncio
+async def test_find_duplicates_returns_the_repository_groups(mock_uow):
+    group = DuplicateNoteGroup(content_hash="00" * 32, note_ids=[uuid.uuid4(), uuid.uuid4()])
+    mock_uow.notes.find_exact_duplicates.return_value = [group]
+
+    groups = await FindDuplicateNotesUseCase(mock_uow).execute(user_id=USER_ID, limit=10)
+
+    assert groups == [group]
+    mock_uow.notes.find_exact_duplicates.assert_awaited_once_with(user_id=USER_ID, limit=10)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "limit, expected",
+    [
+        (None, FindDuplicateNotesUseCase.DEFAULT_LIMIT),
+        (0, FindDuplicateNotesUseCase.DEFAULT_LIMIT),
+        (10_000, FindDuplicateNotesUseCase.MAX_LIMIT),
+    ],
+)
+async def test_find_duplicates_clamps_the_limit(mock_uow, limit, expected):
+    mock_uow.notes.find_exact_duplicates.return_value = []
+
+    await FindDuplicateNotesUseCase(mock_uow).execute(user_id=USER_ID, limit=limit)
+
+    mock_uow.notes.find_exact_duplicates.assert_awaited_once_with(user_id=USER_ID, limit=expected)
+
+
+@pytest.mark.asyncio
+async def test_find_duplicates_requires_user_id(mock_uow):
+    with pytest.raises(PermissionDeniedError):
+        await FindDuplicateNotesUseCase(mock_uow).execute(user_id="")
+
+    mock_uow.notes.find_exact_duplicates.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_find_duplicates_wraps_repository_errors(mock_uow):
+    mock_uow.notes.find_exact_duplicates.side_effect = Exception("Error de base de datos")
+
+    with pytest.raises(RepositoryError):
+        await FindDuplicateNotesUseCase(mock_uow).execute(user_id=USER_ID)
+
+    mock_uow.rollback.assert_awaited_once()
@@ -9,6 +9,7 @@ from src.pkm_app.core.application.use_cases.note.update_note_use_case import (
     UpdateNoteUseCase,
 )
 from src.pkm_app.core.domain.errors import (
+    ConcurrencyError,
     NoteNotFoundError,
     PermissionDeniedError,
     ValidationError,
@@ -56,7 +57,7 @@ async def test_update_note_success(update_note_use_case, mock_uow_instance):
     )
 
     mock_uow_instance.__aenter__.return_value.notes.update.assert_called_once_with(
-        note_id=note_id, note_in=note_update_data, user_id=user_id
+        note_id=note_id, note_in=note_update_data, user_id=user_id, expected_version=None
     )
     mock_uow_instance.__aenter__.return_value.commit.assert_called_once()
     assert result == expected_updated_note
@@ -80,7 +81,29 @@ async def test_update_note_not_found_by_repository(update_note_use_case, mock_uo
 
     assert error_message in str(exc_info.value)
     mock_uow_instance.__aenter__.return_value.notes.update.assert_called_once_with(
-        note_id=note_id, note_in=note_update_data, user_id=user_id
+        note_id=note_id, note_in=note_update_data, user_id=user_id, expected_version=None
+    )
+    mock_uow_instance.__aenter__.return_value.rollback.assert_called_once()
+    mock_uow_instance.__aenter__.return_value.commit.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_update_note_version_conflict(update_note_use_case, mock_uow_instance):
+    note_id = uuid.uuid4()
+    user_id = "test_user_id"
+    note_update_data = NoteUpdate(title="Updated Title")
+    mock_uow_instance.__aenter__.return_value.notes.update.side_effect = ConcurrencyError(
+        "Conflicto de versión", resource_id=note_id, resource_type="Note"
+    )
+
+    with pytest.raises(ConcurrencyError) as exc_info:
+        await update_note_use_case.execute(
+            note_id=note_id, note_in=note_update_data, user_id=user_id, expected_version=2
+        )
+
+    assert exc_info.value.context["operation"] == "update_note"
+    mock_uow_instance.__aenter__.return_value.notes.update.assert_called_once_with(
+        note_id=note_id, note_in=note_update_data, user_id=user_id, expected_version=2
     )
     mock_uow_instance.__aenter__.return_value.rollback.assert_called_once()
     mock_uow_instance.__aenter__.return_value.commit.assert_not_called()
@@ -0,0 +1,173 @@
+import csv
+import io
+from collections import Counter
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+from src.pkm_app.tests.data_generation.bulk_generator import (
+    PHASES,
+    TABLE_COLUMNS,
+    BulkConfig,
+    build_chunk,
+    entity_id,
+    generate,
+    plan,
+    write_csv,
+)
+
+CONFIG = BulkConfig(
+    users=2,
+    notes_per_user=600,
+    projects_per_user=25,
+    sources_per_user=10,
+    keywords_per_user=40,
+    chunk_size=250,
+)
+
+
+def _rows(chunks, table: str) -> list[dict[str, str]]:
+    rows = []
+    for data in chunks:
+        if table in data.tables:
+            reader = csv.reader(io.StringIO(data.tables[table].decode()))
+            rows.extend(dict(zip(TABLE_COLUMNS[table], row, strict=True)) for row in reader)
+    return rows
+
+
+@pytest.fixture(scope="module")
+def dataset():
+    chunks = list(generate(CONFIG))
+    return {table: _rows(chunks, table) for table in TABLE_COLUMNS}
+
+
+def test_same_config_generates_same_rows():
+    first = [data.tables for data in generate(CONFIG)]
+    second = [data.tables for data in generate(CONFIG)]
+    assert first == second
+
+    other_seed = replace(CONFIG, seed=CONFIG.seed + 1)
+    assert [data.tables for data in generate(other_seed)] != first
+
+
+def test_chunks_do_not_depend_on_generation_order():
+    chunks = plan(CONFIG, "notes")
+    in_order = [build_chunk(CONFIG, chunk).tables for chunk in chunks]
+    reversed_order = [build_chunk(CONFIG, chunk).tables for chunk in reversed(chunks)]
+    assert in_order == reversed_order[::-1]
+
+
+def test_plan_covers_every_note_once():
+    for phase in ("notes", "links"):
+        chunks = plan(CONFIG, phase)
+        covered = Counter(
+            (chunk.user, index) for chunk in chunks for index in range(chunk.start, chunk.stop)
+        )
+        assert len(covered) == CONFIG.total_notes and set(covered.values()) == {1}
+        assert all(chunk.stop - chunk.start <= CONFIG.chunk_size for chunk in chunks)
+    assert PHASES == ["users", "catalog", "notes", "links"]
+
+
+def test_row_counts(dataset):
+    assert len(dataset["user_profiles"]) == CONFIG.users
+    assert len(dataset["projects"]) == CONFIG.users * CONFIG.projects_per_user
+    assert len(dataset["keywords"]) == CONFIG.users * CONFIG.keywords_per_user
+    assert len(dataset["notes"]) == CONFIG.total_notes
+
+
+def test_references_point_to_generated_rows(dataset):
+    ids = {
+        table: {row["id"] for row in dataset[table]}
+        for table in ("projects", "sources", "keywords", "notes")
+    }
+    users = {row["user_id"] for row in dataset["user_profiles"]}
+
+    for note in dataset["notes"]:
+        assert note["user_id"] in users
+        # Campo vacío sin comillas = NULL en COPY ... CSV
+        assert note["project_id"] == "" or note["project_id"] in ids["projects"]
+        assert note["source_id"] == "" or note["source_id"] in ids["sources"]
+    for association in dataset["note_keywords"]:
+        assert association["note_id"] in ids["notes"]
+        assert association["keyword_id"] in ids["keywords"]
+    for link in dataset["note_links"]:
+        assert {link["source_note_id"], link["target_note_id"]} <= ids["notes"]
+
+
+def test_rows_respect_unique_and_check_constraints(dataset):
+    links = dataset["note_links"]
+    assert all(link["source_note_id"] != link["target_note_id"] for link in links)
+    assert len({(link["source_note_id"], link["target_note_id"]) for link in links}) == len(links)
+    assert len({link["id"] for link in links}) == len(links)
+
+    associations = [(row["note_id"], row["keyword_id"]) for row in dataset["note_keywords"]]
+    assert len(set(associations)) == len(associations)
+    keywords = [(row["user_id"], row["name"]) for row in dataset["keywords"]]
+    assert len(set(keywords)) == len(keywords)
+    emails = [row["email"] for row in dataset["user_profiles"]]
+    assert len(set(emails)) == len(emails)
+
+
+def test_project_depth_is_bounded(dataset):
+    parents = {row["id"]: row["parent_project_id"] for row in dataset["projects"]}
+
+    def depth(project_id: str) -> int:
+        parent = parents[project_id]
+        return 0 if parent == "" else depth(parent) + 1
+
+    depths = Counter(depth(project_id) for project_id in parents)
+    assert max(depths) <= CONFIG.max_project_depth
+    assert depths[0] < len(parents)  # hay subproyectos
+
+
+def test_distributions_are_skewed(dataset):
+    notes_per_project = Counter(row["project_id"] for row in dataset["notes"] if row["project_id"])
+    largest, *_, smallest = sorted(notes_per_project.values(), reverse=True)
+    assert largest > 5 * smallest
+
+    in_degree = Counter(link["target_note_id"] for link in dataset["note_links"])
+    out_degree = Counter(link["source_note_id"] for link in dataset["note_links"])
+    mean_in = len(dataset["note_links"]) / len(in_degree)
+    assert max(in_degree.values()) > 10 * mean_in  # notas "hub"
+    assert max(out_degree.values()) <= CONFIG.links_per_note_max
+
+    keywords_per_note = Counter(row["note_id"] for row in dataset["note_keywords"])
+    assert max(keywords_per_note.values()) <= CONFIG.keywords_per_note_max
+    keyword_use = Counter(row["keyword_id"] for row in dataset["note_keywords"])
+    assert keyword_use.most_common(1)[0][1] > 5 * min(keyword_use.values())
+
+
+def test_entity_id_is_deterministic():
+    assert entity_id(1, "note", 0, 5) == entity_id(1, "note", 0, 5)
+    assert entity_id(1, "note", 0, 5) != entity_id(1, "note", 1, 5)
+    assert entity_id(1, "note", 0, 5).version == 4
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        {"users": 0},
+        {"chunk_size": 0},
+        {"keywords_per_user": 3, "keywords_per_note_max": 5},
+        {"link_degree_exponent": 1.0},
+    ],
+)
+def test_invalid_config(overrides):
+    with pytest.raises(ValueError):
+        BulkConfig(**overrides)
+
+
+def test_write_csv_with_worker_processes(tmp_path: Path):
+    config = BulkConfig(
+        users=1, notes_per_user=300, projects_per_user=5, keywords_per_user=20, chunk_size=100
+    )
+    stats = write_csv(config, tmp_path, workers=2)
+
+    chunks = list(generate(config))
+    for table in TABLE_COLUMNS:
+        expected = b"".join(data.tables.get(table, b"") for data in chunks)
+        assert (tmp_path / f"{table}.csv").read_bytes() == expected
+    assert stats.rows["notes"] == 300
+    load_sql = (tmp_path / "load.sql").read_text().splitlines()
+    assert [line.split()[1] for line in load_sql] == list(TABLE_COLUMNS)
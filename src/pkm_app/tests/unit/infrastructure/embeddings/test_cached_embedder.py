@@ -0,0 +1,125 @@
+from unittest import mock
+
+import numpy as np
+import pytest
+
+from src.pkm_app.core.application.content_hashing import text_hash
+from src.pkm_app.core.application.interfaces.embedding_interface import (
+    IEmbeddingCacheRepository,
+    ITextEmbedder,
+)
+from src.pkm_app.infrastructure.embeddings import cached_embedder as cached_embedder_module
+from src.pkm_app.infrastructure.embeddings.cached_embedder import CachedEmbedder
+
+
+class FakeEmbedder(ITextEmbedder):
+    """Vector determinista por texto; guarda los textos de cada llamada."""
+
+    def __init__(self) -> None:
+        self.calls: list[list[str]] = []
+
+    @property
+    def model(self) -> str:
+        return "fake-embedder"
+
+    async def embed(self, texts):
+        self.calls.append(list(texts))
+        return np.array([[len(text), ord(text[0]), 1.0] for text in texts], dtype=np.float32)
+
+
+class FakeCache(IEmbeddingCacheRepository):
+    def __init__(self) -> None:
+        self.vectors: dict[tuple[str, bytes], np.ndarray] = {}
+        self.lookups = 0
+        self.fail = False
+
+    async def get_many(self, model, hashes):
+        self.lookups += 1
+        if self.fail:
+            raise ConnectionError("sin base de datos")
+        return {h: self.vectors[model, h] for h in hashes if (model, h) in self.vectors}
+
+    async def put_many(self, model, vectors):
+        if self.fail:
+            raise ConnectionError("sin base de datos")
+        for content_hash, vector in vectors.items():
+            self.vectors.setdefault((model, content_hash), vector)
+
+
+def _session_factory():
+    session = mock.MagicMock()
+    session.__aenter__.return_value = session
+    session.begin.return_value.__aenter__.return_value = None
+    session.begin.return_value.__aexit__.return_value = False
+    return mock.Mock(return_value=session)
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = FakeCache()
+    monkeypatch.setattr(
+        cached_embedder_module, "SQLAlchemyEmbeddingCacheRepository", lambda session: cache
+    )
+    return cache
+
+
+@pytest.mark.asyncio
+async def test_only_misses_reach_the_model_once_per_distinct_text(cache):
+    inner = FakeEmbedder()
+    embedder = CachedEmbedder(inner, _session_factory())
+
+    first = await embedder.embed(["alfa", "beta", "alfa"])
+    second = await embedder.embed(["beta", "gamma"])
+
+    assert inner.calls == [["alfa", "beta"], ["gamma"]]
+    assert first.shape == (3, 3) and first.dtype == np.float32
+    np.testing.assert_array_equal(first[0], first[2])
+    np.testing.assert_array_equal(second[0], first[1])
+    assert set(cache.vectors) == {
+        ("fake-embedder", text_hash(text)) for text in ("alfa", "beta", "gamma")
+    }
+
+
+@pytest.mark.asyncio
+async def test_persistent_cache_is_shared_between_processes(cache):
+    await CachedEmbedder(FakeEmbedder(), _session_factory()).embed(["alfa"])
+    inner = FakeEmbedder()
+    other_process = CachedEmbedder(inner, _session_factory())
+
+    vectors = await other_process.embed(["alfa"])
+    await other_process.embed(["alfa"])
+
+    assert inner.calls == []
+    assert cache.lookups == 2  # la segunda llamada sale de la memoria
+    np.testing.assert_array_equal(vectors[0], [4, ord("a"), 1])
+
+
+@pytest.mark.asyncio
+async def test_memory_is_bounded_lru(cache):
+    embedder = CachedEmbedder(FakeEmbedder(), _session_factory(), memory_size=2)
+
+    await embedder.embed(["a1", "b1"])
+    await embedder.embed(["a1"])
+    await embedder.embed(["c1"])
+
+    assert list(embedder._memory) == [text_hash("a1"), text_hash("c1")]
+
+
+@pytest.mark.asyncio
+async def test_cache_failures_fall_back_to_the_model(cache):
+    cache.fail = True
+    inner = FakeEmbedder()
+
+    vectors = await CachedEmbedder(inner, _session_factory()).embed(["alfa"])
+
+    assert inner.calls == [["alfa"]]
+    assert vectors.shape == (1, 3)
+
+
+@pytest.mark.asyncio
+async def test_model_returning_wrong_number_of_vectors_is_rejected(cache):
+    inner = FakeEmbedder()
+    inner.embed = mock.AsyncMock(return_value=np.ones((1, 3)))
+
+    with pytest.raises(ValueError):
+        await CachedEmbedder(inner, _session_factory()).embed(["alfa", "beta"])
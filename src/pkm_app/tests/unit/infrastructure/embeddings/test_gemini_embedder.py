@@ -0,0 +1,57 @@
+import httpx
+import numpy as np
+import orjson
+import pytest
+
+from src.pkm_app.infrastructure.embeddings.gemini_embedder import GeminiEmbedder
+
+
+def _embedder(handler, dimension: int = 3) -> GeminiEmbedder:
+    return GeminiEmbedder(
+        "clave-test",
+        "gemini-embedding-test",
+        dimension,
+        url="http://gemini",
+        transport=httpx.MockTransport(handler),
+    )
+
+
+def _vectors(request: httpx.Request) -> httpx.Response:
+    texts = [r["content"]["parts"][0]["text"] for r in orjson.loads(request.content)["requests"]]
+    return httpx.Response(
+        200, json={"embeddings": [{"values": [len(text), 1.0, 0.0]} for text in texts]}
+    )
+
+
+@pytest.mark.asyncio
+async def test_batch_embed_request_and_response(monkeypatch):
+    sent: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request)
+        return _vectors(request)
+
+    monkeypatch.setattr(GeminiEmbedder, "MAX_TEXTS_PER_REQUEST", 2)
+    embedder = _embedder(handler)
+
+    vectors = await embedder.embed(["a", "bb", "ccc"])
+    await embedder.close()
+
+    assert [r.url.path for r in sent] == ["/models/gemini-embedding-test:batchEmbedContents"] * 2
+    assert sent[0].headers["x-goog-api-key"] == "clave-test"
+    assert orjson.loads(sent[0].content)["requests"][0] == {
+        "model": "models/gemini-embedding-test",
+        "content": {"parts": [{"text": "a"}]},
+        "outputDimensionality": 3,
+    }
+    assert vectors.dtype == np.float32
+    assert vectors[:, 0].tolist() == [1.0, 2.0, 3.0]
+    assert embedder.model == "gemini-embedding-test/3"
+
+
+@pytest.mark.asyncio
+async def test_wrong_dimension_and_http_errors_are_raised():
+    with pytest.raises(ValueError):
+        await _embedder(_vectors, dimension=4).embed(["a"])
+    with pytest.raises(httpx.HTTPStatusError):
+        await _embedder(lambda request: httpx.Response(429, json={})).embed(["a"])
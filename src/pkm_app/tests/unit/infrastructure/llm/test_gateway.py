@@ -0,0 +1,227 @@
+import asyncio
+from unittest import mock
+
+import pytest
+
+from src.pkm_app.core.application.dtos import LLMRequest, LLMResponse
+from src.pkm_app.core.application.interfaces.llm_interface import ILLMResponseCacheRepository
+from src.pkm_app.infrastructure.config.settings import Settings
+from src.pkm_app.infrastructure.llm import gateway as gateway_module
+from src.pkm_app.infrastructure.llm.fake_provider import FakeLLMProvider
+from src.pkm_app.infrastructure.llm.gateway import LLMGateway, request_key
+from src.pkm_app.infrastructure.persistence.sqlalchemy import database
+
+MODEL = "modelo-test"
+
+
+def _request(prompt: str = "Resume la nota", **overrides) -> LLMRequest:
+    return LLMRequest(model=MODEL, prompt=prompt, **overrides)
+
+
+def _gateway(provider: FakeLLMProvider, **kwargs) -> LLMGateway:
+    return LLMGateway(provider, persistent_cache=False, **kwargs)
+
+
+class FakeCache(ILLMResponseCacheRepository):
+    def __init__(self) -> None:
+        self.responses: dict[bytes, LLMResponse] = {}
+        self.lookups = 0
+        self.fail = False
+
+    async def get_many(self, keys):
+        self.lookups += 1
+        if self.fail:
+            raise ConnectionError("sin base de datos")
+        return {key: self.responses[key] for key in keys if key in self.responses}
+
+    async def put_many(self, provider, responses):
+        if self.fail:
+            raise ConnectionError("sin base de datos")
+        for key, response in responses.items():
+            self.responses.setdefault(key, response.model_copy(update={"cached": True}))
+
+
+def _session_factory():
+    session = mock.MagicMock()
+    session.__aenter__.return_value = session
+    session.begin.return_value.__aenter__.return_value = None
+    session.begin.return_value.__aexit__.return_value = False
+    return mock.Mock(return_value=session)
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = FakeCache()
+    monkeypatch.setattr(
+        gateway_module, "SQLAlchemyLLMResponseCacheRepository", lambda session: cache
+    )
+    return cache
+
+
+def test_request_key_depends_on_every_field_and_the_provider():
+    request = _request()
+
+    assert request_key("fake", request) == request_key("fake", _request())
+    assert request_key("fake", request) != request_key("gemini", request)
+    assert request_key("fake", request) != request_key("fake", _request(system="Sé breve"))
+    assert request_key("fake", request) != request_key("fake", _request(max_output_tokens=5))
+
+
+@pytest.mark.asyncio
+async def test_deterministic_requests_are_answered_from_memory():
+    provider = FakeLLMProvider()
+    gateway = _gateway(provider)
+
+    first = await gateway.generate(_request())
+    second = await gateway.generate(_request())
+
+    assert len(provider.calls) == 1
+    assert (first.cached, second.cached) == (False, True)
+    assert second.text == first.text
+    assert gateway.usage().memory_hits == 1
+
+
+@pytest.mark.asyncio
+async def test_sampled_requests_are_never_cached_or_shared():
+    provider = FakeLLMProvider(max_batch_size=1)
+    gateway = _gateway(provider)
+
+    await asyncio.gather(*(gateway.generate(_request(temperature=0.7)) for _ in range(3)))
+
+    assert gateway.usage().provider_requests == 3
+    assert gateway.usage().shared == 0
+
+
+@pytest.mark.asyncio
+async def test_identical_in_flight_requests_share_one_provider_call():
+    provider = FakeLLMProvider(latency=0.01)
+    gateway = _gateway(provider)
+
+    responses = await asyncio.gather(*(gateway.generate(_request()) for _ in range(5)))
+    repeated = await gateway.generate_many([_request("otra"), _request("otra")])
+
+    assert [len(batch) for batch in provider.calls] == [1, 1]
+    assert sorted(response.cached for response in responses) == [False] + [True] * 4
+    assert len({response.text for response in responses}) == 1
+    assert repeated[0].text == repeated[1].text
+    usage = gateway.usage()
+    assert usage.shared == 5
+    assert usage.requests == usage.shared + usage.provider_requests
+
+
+@pytest.mark.asyncio
+async def test_requests_are_batched_up_to_the_provider_limit():
+    provider = FakeLLMProvider(max_batch_size=16)
+    gateway = _gateway(provider)
+
+    responses = await gateway.generate_many([_request(f"nota {i}") for i in range(40)])
+    await asyncio.gather(*(gateway.generate(_request(f"suelta {i}")) for i in range(10)))
+
+    assert [len(batch) for batch in provider.calls] == [16, 16, 8, 10]
+    assert [response.text.endswith(f"nota {i}") for i, response in enumerate(responses)] == [
+        True
+    ] * 40
+
+
+@pytest.mark.asyncio
+async def test_provider_calls_are_limited_to_max_concurrency():
+    provider = FakeLLMProvider(max_batch_size=1, latency=0.01)
+    gateway = _gateway(provider, max_concurrency=2)
+
+    await gateway.generate_many([_request(f"nota {i}") for i in range(8)])
+
+    assert len(provider.calls) == 8
+    assert provider.max_in_flight == 2
+
+
+@pytest.mark.asyncio
+async def test_usage_accounts_tokens_and_provider_time():
+    provider = FakeLLMProvider(latency=0.01)
+    gateway = _gateway(provider)
+
+    responses = await gateway.generate_many([_request("a" * 40), _request("b" * 8)])
+
+    usage = gateway.usage()
+    assert (usage.provider_calls, usage.provider_requests) == (1, 2)
+    assert usage.input_tokens == 10 + 2
+    assert usage.output_tokens == sum(response.output_tokens for response in responses)
+    assert usage.provider_seconds >= 0.01
+
+
+@pytest.mark.asyncio
+async def test_provider_errors_reach_every_waiter_and_are_not_cached():
+    provider = FakeLLMProvider(latency=0.01)
+    provider.error = TimeoutError("sin respuesta")
+    gateway = _gateway(provider)
+
+    outcomes = await asyncio.gather(
+        *(gateway.generate(_request()) for _ in range(3)), return_exceptions=True
+    )
+    retried = await gateway.generate(_request())
+
+    assert all(isinstance(outcome, TimeoutError) for outcome in outcomes)
+    assert retried.cached is False
+    assert gateway.usage().failed_calls == 1
+    assert gateway._in_flight == {}
+
+
+@pytest.mark.asyncio
+async def test_persistent_cache_is_shared_between_processes(cache):
+    await LLMGateway(FakeLLMProvider(), _session_factory()).generate(_request())
+    provider = FakeLLMProvider()
+    other_process = LLMGateway(provider, _session_factory())
+
+    response = await other_process.generate(_request())
+    await other_process.generate(_request())
+
+    assert provider.calls == []
+    assert response.cached is True
+    assert cache.lookups == 2  # la segunda llamada sale de la memoria
+    assert other_process.usage().database_hits == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_failures_fall_back_to_the_provider(cache):
+    cache.fail = True
+    provider = FakeLLMProvider()
+
+    response = await LLMGateway(provider, _session_factory()).generate(_request())
+
+    assert len(provider.calls) == 1
+    assert response.text
+
+
+@pytest.mark.asyncio
+async def test_missing_database_configuration_falls_back_to_the_provider(monkeypatch):
+    # Sin session_factory ni variables DB_*: la fábrica global lanza ValueError
+    settings = Settings(_env_file=None, DB_USER="", DB_PASSWORD="", DB_HOST="", DB_NAME="")
+    monkeypatch.setattr(database, "get_settings", lambda: settings)
+    database.reset_engines()
+    provider = FakeLLMProvider()
+    try:
+        response = await LLMGateway(provider).generate(_request())
+    finally:
+        database.reset_engines()
+
+    assert len(provider.calls) == 1
+    assert response.text
+
+
+@pytest.mark.asyncio
+async def test_provider_returning_wrong_number_of_responses_is_rejected():
+    provider = FakeLLMProvider()
+    provider.generate = mock.AsyncMock(return_value=[])
+
+    with pytest.raises(ValueError):
+        await _gateway(provider).generate(_request())
+
+
+def test_from_settings_selects_the_provider():
+    settings = Settings(LLM_PROVIDER="fake", LLM_MAX_CONCURRENCY=3, LLM_BATCH_WINDOW_MS=10)
+
+    gateway = LLMGateway.from_settings(settings)
+
+    assert isinstance(gateway.provider, FakeLLMProvider)
+    assert gateway.batch_window == pytest.approx(0.01)
+    with pytest.raises(ValueError):
+        LLMGateway.from_settings(Settings(LLM_PROVIDER="otro"))
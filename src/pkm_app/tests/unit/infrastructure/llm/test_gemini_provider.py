@@ -0,0 +1,58 @@
+import httpx
+import orjson
+import pytest
+
+from src.pkm_app.core.application.dtos import LLMRequest
+from src.pkm_app.infrastructure.llm.gemini_provider import GeminiProvider
+
+
+def _provider(handler) -> GeminiProvider:
+    return GeminiProvider("clave-test", url="http://gemini", transport=httpx.MockTransport(handler))
+
+
+@pytest.mark.asyncio
+async def test_generate_content_request_and_response():
+    sent: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request)
+        return httpx.Response(
+            200,
+            json={
+                "candidates": [{"content": {"parts": [{"text": "Hola "}, {"text": "mundo"}]}}],
+                "usageMetadata": {"promptTokenCount": 7, "candidatesTokenCount": 2},
+                "modelVersion": "gemini-test-001",
+            },
+        )
+
+    provider = _provider(handler)
+    request = LLMRequest(
+        model="gemini-test", prompt="Saluda", system="Sé breve", max_output_tokens=10
+    )
+
+    [response] = await provider.generate([request])
+    await provider.close()
+
+    assert sent[0].url.path == "/models/gemini-test:generateContent"
+    assert sent[0].headers["x-goog-api-key"] == "clave-test"
+    assert orjson.loads(sent[0].content) == {
+        "contents": [{"role": "user", "parts": [{"text": "Saluda"}]}],
+        "generationConfig": {"temperature": 0.0, "maxOutputTokens": 10},
+        "systemInstruction": {"parts": [{"text": "Sé breve"}]},
+    }
+    assert (response.text, response.model) == ("Hola mundo", "gemini-test-001")
+    assert (response.input_tokens, response.output_tokens) == (7, 2)
+    assert provider.max_batch_size == 1
+
+
+@pytest.mark.asyncio
+async def test_http_errors_are_raised():
+    provider = _provider(lambda request: httpx.Response(429, json={"error": "cuota"}))
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await provider.generate([LLMRequest(model="gemini-test", prompt="Saluda")])
+
+
+def test_api_key_is_required():
+    with pytest.raises(ValueError):
+        GeminiProvider("")
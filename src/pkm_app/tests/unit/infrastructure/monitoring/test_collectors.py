@@ -0,0 +1,92 @@
+import pytest
+from sqlalchemy import column, select, table, text
+
+from src.pkm_app.core.application.operations import operation_scope, traced_use_case
+from src.pkm_app.core.domain.errors import RepositoryError
+from src.pkm_app.infrastructure.config.settings import Settings
+from src.pkm_app.infrastructure.monitoring.collectors import (
+    CACHE_REQUESTS,
+    REPOSITORY_DURATION,
+    USE_CASE_DURATION,
+    timed_repository,
+)
+from src.pkm_app.infrastructure.monitoring.metrics import REGISTRY
+from src.pkm_app.infrastructure.persistence.sqlalchemy.engine import create_sync_db_engine
+
+
+def count(histogram, *labels) -> int:
+    cumulative, _ = histogram.values().get(labels, ([0], 0.0))
+    return cumulative[-1]
+
+
+class MetricsProbeUseCase:
+    @traced_use_case
+    async def execute(self, fail: bool) -> str:
+        if fail:
+            raise RepositoryError("fallo", operation="probe", repository_type="Probe")
+        return "ok"
+
+
+@timed_repository
+class ProbeRepository:
+    async def get(self, value: int) -> int:
+        return value
+
+    async def fail(self) -> None:
+        raise ValueError("no")
+
+    async def _private(self) -> None:
+        return None
+
+
+@pytest.mark.asyncio
+async def test_use_case_latency_is_recorded_by_outcome():
+    before_ok = count(USE_CASE_DURATION, "MetricsProbeUseCase", "success")
+    before_error = count(USE_CASE_DURATION, "MetricsProbeUseCase", "RepositoryError")
+
+    await MetricsProbeUseCase().execute(fail=False)
+    with pytest.raises(RepositoryError):
+        await MetricsProbeUseCase().execute(fail=True)
+    # Las operaciones que no son casos de uso no cuentan
+    with operation_scope("MetricsProbeUseCase"):
+        pass
+
+    assert count(USE_CASE_DURATION, "MetricsProbeUseCase", "success") == before_ok + 1
+    assert count(USE_CASE_DURATION, "MetricsProbeUseCase", "RepositoryError") == before_error + 1
+
+
+@pytest.mark.asyncio
+async def test_timed_repository_wraps_public_coroutines_only():
+    repository = ProbeRepository()
+
+    assert await repository.get(3) == 3
+    with pytest.raises(ValueError):
+        await repository.fail()
+    await repository._private()
+
+    assert count(REPOSITORY_DURATION, "ProbeRepository", "get", "success") >= 1
+    assert count(REPOSITORY_DURATION, "ProbeRepository", "fail", "ValueError") >= 1
+    assert count(REPOSITORY_DURATION, "ProbeRepository", "_private", "success") == 0
+    assert ProbeRepository.get.__name__ == "get"
+
+
+def test_engine_pool_and_compiled_cache_are_exported(tmp_path):
+    engine = create_sync_db_engine(
+        f"sqlite:///{tmp_path / 'metrics.db'}",
+        Settings(_env_file=None, DB_POOL_SIZE=2, DB_MAX_OVERFLOW=2),
+    )
+    hits_before = CACHE_REQUESTS.values().get(("sql_compiled", "hit"), 0.0)
+
+    with engine.connect() as connection:
+        connection.execute(text("CREATE TABLE t (x INTEGER)"))
+        query = select(column("x")).select_from(table("t"))
+        connection.execute(query)
+        connection.execute(query)
+        rendered = REGISTRY.render()
+
+    label = f'engine="local/{tmp_path / "metrics.db"}",role="read_write"'
+    assert f"pkm_db_pool_checked_out{{{label}}} 1" in rendered
+    assert f"pkm_db_pool_saturation{{{label}}} 0.25" in rendered
+    assert CACHE_REQUESTS.values()[("sql_compiled", "hit")] >= hits_before + 1
+    assert 'pkm_cache_hit_ratio{cache="sql_compiled"}' in rendered
+    engine.dispose()
@@ -0,0 +1,123 @@
+import threading
+import urllib.request
+
+import pytest
+
+from src.pkm_app.infrastructure.monitoring.metrics import (
+    CONTENT_TYPE,
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsRegistry,
+    set_metrics_enabled,
+)
+from src.pkm_app.infrastructure.monitoring.server import start_metrics_server
+
+
+@pytest.fixture
+def registry():
+    return MetricsRegistry()
+
+
+def test_counter_aggregates_per_thread_shards(registry):
+    counter = Counter("requests_total", "Peticiones.", ("route",), registry=registry)
+
+    def work():
+        for _ in range(1000):
+            counter.inc("/notes")
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    counter.inc("/keywords", amount=2)
+
+    assert counter.values() == {("/notes",): 4000.0, ("/keywords",): 2.0}
+    assert len(counter._shards) == 5
+
+
+def test_counter_collect_callback_is_added(registry):
+    counter = Counter(
+        "cache_total", "Caché.", ("result",), registry=registry, collect=lambda: [(("hit",), 5)]
+    )
+    counter.inc("hit")
+
+    assert counter.values() == {("hit",): 6.0}
+
+
+def test_histogram_renders_cumulative_buckets(registry):
+    histogram = Histogram(
+        "latency_seconds", "Latencia.", ("op",), registry=registry, buckets=(0.1, 1.0)
+    )
+    for value in (0.05, 0.1, 0.5, 3.0):
+        histogram.observe(value, "get")
+
+    assert registry.render().splitlines() == [
+        "# HELP latency_seconds Latencia.",
+        "# TYPE latency_seconds histogram",
+        'latency_seconds_bucket{op="get",le="0.1"} 2',
+        'latency_seconds_bucket{op="get",le="1"} 3',
+        'latency_seconds_bucket{op="get",le="+Inf"} 4',
+        'latency_seconds_sum{op="get"} 3.65',
+        'latency_seconds_count{op="get"} 4',
+    ]
+
+
+def test_gauge_sums_samples_with_same_labels_and_escapes_values(registry):
+    Gauge(
+        "pool_size",
+        "Pool.",
+        ("engine",),
+        registry=registry,
+        collect=lambda: [(('db "a"',), 2), (('db "a"',), 3)],
+    )
+
+    assert 'pool_size{engine="db \\"a\\""} 5' in registry.render()
+
+
+def test_disabled_metrics_record_nothing(registry):
+    counter = Counter("disabled_total", "Desactivado.", registry=registry)
+    set_metrics_enabled(False)
+    try:
+        counter.inc()
+    finally:
+        set_metrics_enabled(True)
+
+    assert counter.values() == {}
+
+
+def test_invalid_definitions_are_rejected(registry):
+    Counter("dup_total", "Uno.", registry=registry)
+    with pytest.raises(ValueError, match="ya está registrada"):
+        Counter("dup_total", "Dos.", registry=registry)
+    with pytest.raises(ValueError, match="_total"):
+        Counter("requests", "Sin sufijo.", registry=registry)
+    with pytest.raises(ValueError, match="etiqueta"):
+        Histogram("bad_seconds", "Etiqueta reservada.", ("le",), registry=registry)
+    with pytest.raises(ValueError, match="crecientes"):
+        Histogram("unsorted_seconds", "Buckets.", registry=registry, buckets=(1.0, 0.5))
+
+
+def test_render_rejects_wrong_label_count(registry):
+    counter = Counter("labels_total", "Etiquetas.", ("a", "b"), registry=registry)
+    counter.inc("solo_una")
+
+    with pytest.raises(ValueError, match="espera las etiquetas"):
+        registry.render()
+
+
+def test_metrics_server_exposes_registry(registry):
+    Counter("served_total", "Servido.", registry=registry).inc()
+    server = start_metrics_server(0, host="127.0.0.1", registry=registry)
+    try:
+        url = f"http://127.0.0.1:{server.server_port}"
+        with urllib.request.urlopen(f"{url}/metrics") as response:
+            body = response.read().decode()
+            assert response.headers["Content-Type"] == CONTENT_TYPE
+        assert "served_total 1" in body
+        with pytest.raises(urllib.error.HTTPError):
+            urllib.request.urlopen(f"{url}/otra")
+    finally:
+        server.shutdown()
+        server.server_close()
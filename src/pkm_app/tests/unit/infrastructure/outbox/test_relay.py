@@ -0,0 +1,153 @@
+import uuid
+from datetime import UTC, datetime, timedelta
+from unittest import mock
+
+import pytest
+
+from src.pkm_app.core.application.content_hashing import content_hash
+from src.pkm_app.core.application.dtos import NoteIndexDocument, OutboxMessage
+from src.pkm_app.core.application.interfaces.outbox_interface import IOutboxRepository
+from src.pkm_app.infrastructure.monitoring.collectors import OUTBOX_MESSAGES
+from src.pkm_app.infrastructure.outbox import relay as relay_module
+from src.pkm_app.infrastructure.outbox.relay import OutboxRelay, coalesce, latest_by_note
+from src.pkm_app.infrastructure.vector_store.in_memory_store import InMemoryVectorStore
+
+NOW = datetime.now(UTC)
+
+
+def _message(message_id: int, note_id: uuid.UUID, operation: str = "upsert", version: int = 1):
+    return OutboxMessage(
+        id=message_id,
+        note_id=note_id,
+        user_id="user_1",
+        operation=operation,
+        version=version,
+        created_at=NOW - timedelta(seconds=5),
+    )
+
+
+def _document(note_id: uuid.UUID, version: int = 1) -> NoteIndexDocument:
+    return NoteIndexDocument(
+        note_id=note_id,
+        user_id="user_1",
+        content="Contenido",
+        content_hash=content_hash(None, "Contenido"),
+        version=version,
+        updated_at=NOW,
+    )
+
+
+class FakeOutbox(IOutboxRepository):
+    def __init__(self, messages, documents):
+        self.messages = messages
+        self.documents = {document.note_id: document for document in documents}
+        self.completed: list[int] = []
+        self.retried: list[tuple[list[int], datetime]] = []
+        self.requested_documents: list[uuid.UUID] = []
+
+    async def claim_batch(self, limit):
+        return self.messages[:limit]
+
+    async def get_documents(self, note_ids):
+        self.requested_documents.extend(note_ids)
+        return [self.documents[note_id] for note_id in note_ids if note_id in self.documents]
+
+    async def complete(self, message_ids):
+        self.completed.extend(message_ids)
+
+    async def retry_later(self, message_ids, error, available_at):
+        self.retried.append((list(message_ids), available_at))
+
+
+def _session_factory():
+    session = mock.MagicMock()
+    session.__aenter__.return_value = session
+    session.begin.return_value.__aenter__.return_value = None
+    session.begin.return_value.__aexit__.return_value = False
+    return mock.Mock(return_value=session)
+
+
+@pytest.fixture
+def use_outbox(monkeypatch):
+    def install(outbox: FakeOutbox) -> None:
+        monkeypatch.setattr(relay_module, "SQLAlchemyOutboxRepository", lambda session: outbox)
+
+    return install
+
+
+def test_coalesce_keeps_one_delivery_per_note():
+    edited, deleted, gone = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    messages = [
+        _message(1, edited),
+        _message(2, deleted),
+        _message(3, edited, version=2),
+        _message(4, deleted, operation="delete", version=4),
+        _message(5, gone),
+    ]
+
+    batch = coalesce(latest_by_note(messages), [_document(edited, version=3)])
+
+    assert [document.note_id for document in batch.upserts] == [edited]
+    assert batch.upserts[0].version == 3  # estado actual, no el del mensaje
+    assert [(t.note_id, t.version) for t in batch.deletes] == [(deleted, 4)]
+    assert len(batch) == 2
+
+
+@pytest.mark.asyncio
+async def test_run_once_delivers_coalesced_batch_and_completes_every_message(use_outbox):
+    note_id = uuid.uuid4()
+    outbox = FakeOutbox([_message(i, note_id, version=i) for i in (1, 2, 3)], [_document(note_id)])
+    use_outbox(outbox)
+    store = InMemoryVectorStore()
+    coalesced_before = OUTBOX_MESSAGES.values().get(("test_relay", "coalesced"), 0.0)
+
+    result = await OutboxRelay(store, _session_factory(), name="test_relay").run_once()
+
+    assert (result.claimed, result.delivered, result.failed) == (3, 1, 0)
+    assert outbox.requested_documents == [note_id]
+    assert outbox.completed == [1, 2, 3]
+    assert list(store.documents) == [note_id]
+    assert OUTBOX_MESSAGES.values()[("test_relay", "coalesced")] == coalesced_before + 2
+
+
+@pytest.mark.asyncio
+async def test_run_once_with_empty_outbox_does_not_call_the_sink(use_outbox):
+    use_outbox(FakeOutbox([], []))
+    store = InMemoryVectorStore()
+
+    result = await OutboxRelay(store, _session_factory()).run_once()
+
+    assert result.claimed == 0
+    assert store.batches == []
+
+
+@pytest.mark.asyncio
+async def test_failed_delivery_is_retried_later_with_backoff(use_outbox):
+    note_id = uuid.uuid4()
+    message = _message(7, note_id).model_copy(update={"attempts": 2})
+    outbox = FakeOutbox([message], [_document(note_id)])
+    use_outbox(outbox)
+    sink = mock.AsyncMock()
+    sink.apply.side_effect = ConnectionError("almacén caído")
+
+    result = await OutboxRelay(sink, _session_factory()).run_once()
+
+    assert result.failed == 1
+    assert outbox.completed == []
+    [(message_ids, retry_at)] = outbox.retried
+    assert message_ids == [7]
+    # Tercer intento: 1 s * 2^2
+    expected = datetime.now(UTC) + timedelta(seconds=4)
+    assert abs(retry_at - expected) < timedelta(seconds=1)
+
+
+def test_retry_delay_is_capped():
+    relay = OutboxRelay(InMemoryVectorStore(), _session_factory())
+
+    assert relay._retry_delay(1) == timedelta(seconds=1)
+    assert relay._retry_delay(30) == OutboxRelay.MAX_RETRY_DELAY
+
+
+def test_batch_size_must_be_positive():
+    with pytest.raises(ValueError):
+        OutboxRelay(InMemoryVectorStore(), batch_size=0)
@@ -0,0 +1,158 @@
+import uuid
+from datetime import UTC, datetime
+from unittest import mock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.pkm_app.infrastructure.persistence.sqlalchemy.repositories.change_feed_repository import (
+    LOCK_SEQUENCER,
+    PURGE_TOMBSTONES,
+    READ_CHANGES,
+    SEQUENCE_PENDING,
+    SQLAlchemyChangeFeedRepository,
+)
+
+USER_ID = "user_1"
+NOW = datetime(2026, 10, 19, tzinfo=UTC)
+
+
+def _sql(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+def _rows(*rows):
+    result = mock.Mock()
+    result.all.return_value = list(rows)
+    return result
+
+
+def _change(seq: int, operation: str = "upsert", purged_through: int = 0, last_seq: int = 0):
+    return (purged_through, last_seq, seq, "note", uuid.uuid4(), operation, 2, NOW)
+
+
+@pytest.fixture
+def session():
+    return mock.AsyncMock(spec=AsyncSession)
+
+
+def test_sequencing_skips_rows_locked_by_running_writes():
+    sql = _sql(SEQUENCE_PENDING)
+
+    assert sql.startswith("UPDATE change_log SET seq=nextval('change_log_seq')")
+    assert "change_log.seq IS NULL FOR UPDATE SKIP LOCKED" in sql
+    assert "pg_advisory_xact_lock" in _sql(LOCK_SEQUENCER)
+
+
+def test_read_gets_the_horizon_in_the_same_statement():
+    sql = _sql(READ_CHANGES)
+
+    assert "change_log.seq > %(cursor)s" in sql
+    assert "FROM change_log_horizon" in sql
+    assert "LEFT OUTER JOIN" in sql
+    assert "ORDER BY change_log.seq" in sql
+
+
+def test_purge_only_removes_sequenced_tombstones_and_records_horizon():
+    sql = _sql(PURGE_TOMBSTONES)
+
+    assert "DELETE FROM change_log WHERE change_log.operation = " in sql
+    assert "change_log.seq IS NOT NULL" in sql
+    assert "INSERT INTO change_log_horizon" in sql
+    assert "greatest(change_log_horizon.purged_through" in sql
+
+
+@pytest.mark.asyncio
+async def test_get_changes_since_sequences_before_reading(session):
+    session.execute.side_effect = [mock.Mock(), mock.Mock(), _rows(_change(11), _change(12))]
+    repo = SQLAlchemyChangeFeedRepository(session)
+
+    page = await repo.get_changes_since(USER_ID, cursor=10, limit=5)
+
+    statements = [call.args[0] for call in session.execute.await_args_list]
+    assert statements == [LOCK_SEQUENCER, SEQUENCE_PENDING, READ_CHANGES]
+    params = session.execute.await_args_list[2].args[1]
+    assert params == {"owner": USER_ID, "cursor": 10, "limit": 6}
+    assert [change.seq for change in page.changes] == [11, 12]
+    assert page.changes[0].entity_type == "note"
+    assert page.next_cursor == 12
+    assert not page.has_more
+
+
+@pytest.mark.asyncio
+async def test_get_changes_since_pages_with_one_extra_row(session):
+    rows = [_change(seq) for seq in (4, 5, 6)]
+    session.execute.side_effect = [mock.Mock(), mock.Mock(), _rows(*rows)]
+    repo = SQLAlchemyChangeFeedRepository(session)
+
+    page = await repo.get_changes_since(USER_ID, cursor=3, limit=2)
+
+    assert [change.seq for change in page.changes] == [4, 5]
+    assert page.next_cursor == 5
+    assert page.has_more
+
+
+@pytest.mark.asyncio
+async def test_get_changes_since_without_changes_keeps_the_cursor(session):
+    # La LEFT JOIN devuelve siempre la fila de estado, con la página a NULL
+    empty = (0, 9, None, None, None, None, None, None)
+    session.execute.side_effect = [mock.Mock(), mock.Mock(), _rows(empty)]
+    repo = SQLAlchemyChangeFeedRepository(session)
+
+    page = await repo.get_changes_since(USER_ID, cursor=9, limit=5)
+
+    assert page.changes == []
+    assert page.next_cursor == 9
+    assert not page.reset_required
+
+
+@pytest.mark.asyncio
+async def test_cursor_behind_purged_tombstones_requires_reset(session):
+    row = _change(30, operation="delete", purged_through=20, last_seq=42)
+    session.execute.side_effect = [mock.Mock(), mock.Mock(), _rows(row)]
+    repo = SQLAlchemyChangeFeedRepository(session)
+
+    page = await repo.get_changes_since(USER_ID, cursor=15, limit=5)
+
+    assert page.reset_required
+    assert page.changes == []
+    assert page.next_cursor == 42
+
+
+@pytest.mark.asyncio
+async def test_reset_cursor_is_never_behind_the_horizon(session):
+    # La última fila numerada era una lápida ya purgada
+    state = (20, 18, None, None, None, None, None, None)
+    session.execute.side_effect = [mock.Mock(), mock.Mock(), _rows(state)]
+    repo = SQLAlchemyChangeFeedRepository(session)
+
+    page = await repo.get_changes_since(USER_ID, cursor=15, limit=5)
+
+    assert page.reset_required
+    assert page.next_cursor == 20
+
+
+@pytest.mark.asyncio
+async def test_cursor_zero_returns_only_the_current_cursor(session):
+    state = (20, 57, None, None, None, None, None, None)
+    session.execute.side_effect = [mock.Mock(), mock.Mock(), _rows(state)]
+    repo = SQLAlchemyChangeFeedRepository(session)
+
+    page = await repo.get_changes_since(USER_ID, cursor=0, limit=5)
+
+    assert session.execute.await_args_list[2].args[1]["limit"] == 0
+    assert page.changes == []
+    assert page.next_cursor == 57
+    assert not page.reset_required
+
+
+@pytest.mark.asyncio
+async def test_purge_tombstones_returns_count(session):
+    result = mock.Mock()
+    result.scalar_one.return_value = 3
+    session.execute.return_value = result
+    repo = SQLAlchemyChangeFeedRepository(session)
+
+    assert await repo.purge_tombstones(NOW) == 3
+    session.execute.assert_awaited_once_with(PURGE_TOMBSTONES, {"older_than": NOW})
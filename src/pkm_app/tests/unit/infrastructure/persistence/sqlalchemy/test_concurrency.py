@@ -0,0 +1,53 @@
+import uuid
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.orm.exc import StaleDataError
+
+from src.pkm_app.core.domain.errors import ConcurrencyError
+from src.pkm_app.infrastructure.persistence.sqlalchemy.concurrency import (
+    check_expected_version,
+    stale_data_as_conflict,
+)
+from src.pkm_app.infrastructure.persistence.sqlalchemy.models import Keyword as KeywordModel
+from src.pkm_app.infrastructure.persistence.sqlalchemy.models import Note as NoteModel
+from src.pkm_app.infrastructure.persistence.sqlalchemy.models import Project as ProjectModel
+from src.pkm_app.infrastructure.persistence.sqlalchemy.models import Source as SourceModel
+
+
+@pytest.mark.parametrize("model", [NoteModel, ProjectModel, SourceModel, KeywordModel])
+def test_models_use_version_as_version_id_col(model):
+    mapper = model.__mapper__
+
+    assert mapper.version_id_col is model.__table__.c.version
+    assert not model.__table__.c.version.nullable
+
+
+def test_check_expected_version_accepts_matching_or_missing_version():
+    instance = SimpleNamespace(id=uuid.uuid4(), version=4)
+
+    check_expected_version(instance, None, "Project")
+    check_expected_version(instance, 4, "Project")
+
+
+def test_check_expected_version_raises_conflict_with_both_versions():
+    instance = SimpleNamespace(id=uuid.uuid4(), version=4)
+
+    with pytest.raises(ConcurrencyError) as exc_info:
+        check_expected_version(instance, 3, "Project")
+
+    assert exc_info.value.context["resource_type"] == "Project"
+    assert exc_info.value.context["expected_version"] == 3
+    assert exc_info.value.context["current_version"] == 4
+
+
+def test_stale_data_error_becomes_conflict():
+    source_id = uuid.uuid4()
+
+    with pytest.raises(ConcurrencyError) as exc_info:
+        with stale_data_as_conflict("Source", source_id, expected_version=2):
+            raise StaleDataError("UPDATE statement on table 'sources' expected to update 1 row")
+
+    assert isinstance(exc_info.value.__cause__, StaleDataError)
+    assert exc_info.value.context["expected_version"] == 2
+    assert exc_info.value.context["current_version"] is None
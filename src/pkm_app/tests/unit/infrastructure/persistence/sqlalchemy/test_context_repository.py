@@ -0,0 +1,86 @@
+import uuid
+from unittest import mock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.pkm_app.infrastructure.persistence.sqlalchemy.repositories.context_repository import (
+    FIND_CANDIDATES,
+    GET_EXCERPTS,
+    GET_STATE,
+    SQLAlchemyAssistantContextRepository,
+)
+
+USER_ID = "user-1"
+
+
+def _sql(statement) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+def test_state_reports_unsequenced_changes_and_the_learned_context():
+    sql = _sql(GET_STATE)
+
+    assert "max(change_log.changed_at)" in sql
+    assert "SELECT change_log.seq IS NULL" in sql
+    assert "ORDER BY change_log.seq DESC" in sql
+    assert "user_profiles.learned_context" in sql
+    assert "updated_at" not in sql
+
+
+@pytest.mark.asyncio
+async def test_state_row_is_mapped_to_the_dto():
+    session = mock.AsyncMock(spec=AsyncSession)
+    result = mock.Mock()
+    result.one.return_value = (None, True, {"tono": "breve"})
+    session.execute.return_value = result
+
+    state = await SQLAlchemyAssistantContextRepository(session).get_state(USER_ID)
+
+    assert state.pending_changes
+    assert state.learned_context == {"tono": "breve"}
+    assert state.last_changed_at is None
+
+
+def test_candidates_do_not_read_the_content():
+    sql = _sql(FIND_CANDIDATES)
+
+    assert "octet_length(notes.content)" in sql
+    assert "notes.content," not in sql
+    assert "lower(keywords.name) = ANY" in sql
+    assert "JOIN LATERAL (SELECT note_keywords.note_id" in sql
+    assert sql.count("ORDER BY notes.updated_at DESC") == 2
+
+
+def test_excerpts_read_only_the_requested_prefixes():
+    sql = _sql(GET_EXCERPTS)
+
+    assert "left(notes.content, anon_1.chars)" in sql
+    assert "left(projects.description, anon_2.chars)" in sql
+    assert "UNION ALL" in sql
+
+
+@pytest.mark.asyncio
+async def test_excerpts_are_split_by_kind():
+    session = mock.AsyncMock(spec=AsyncSession)
+    note_id, project_id = uuid.uuid4(), uuid.uuid4()
+    session.execute.return_value = [("note", note_id, "hola"), ("project", project_id, None)]
+    repo = SQLAlchemyAssistantContextRepository(session)
+
+    excerpts = await repo.get_excerpts(USER_ID, {note_id: 4}, {project_id: 10})
+
+    assert excerpts.notes == {note_id: "hola"}
+    assert excerpts.projects == {project_id: ""}
+    params = session.execute.await_args.args[1]
+    assert params["note_ids"] == [note_id] and params["note_chars"] == [4]
+
+
+@pytest.mark.asyncio
+async def test_no_excerpts_requested_means_no_query():
+    session = mock.AsyncMock(spec=AsyncSession)
+
+    excerpts = await SQLAlchemyAssistantContextRepository(session).get_excerpts(USER_ID, {}, {})
+
+    assert excerpts.notes == {} and excerpts.projects == {}
+    session.execute.assert_not_awaited()
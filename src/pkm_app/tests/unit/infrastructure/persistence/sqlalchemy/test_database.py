@@ -1,44 +1,47 @@
 import pytest
-import os
-import sys  # Añadido para manipular sys.modules
+import subprocess
+import sys
 from unittest import mock
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy.engine import URL
-from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, Session
 
-# Mockear las variables de entorno antes de que database.py las cargue
-DEFAULT_ENV_VARS = {
+from pkm_app.infrastructure.persistence.sqlalchemy import database
+from src.pkm_app.infrastructure.config.settings import Settings
+
+ENGINE_MODULE = "src.pkm_app.infrastructure.persistence.sqlalchemy.engine"
+
+DEFAULT_DB_SETTINGS = {
     "DB_USER": "test_user",
     "DB_PASSWORD": "test_password",
     "DB_HOST": "test_host",
-    "DB_PORT": "1234",
+    "DB_PORT": 1234,
     "DB_NAME": "test_db",
 }
 
 
 @pytest.fixture(autouse=True)
-def mock_env_vars(monkeypatch):
-    """Mockea las variables de entorno para todos los tests en este módulo."""
-    for key, value in DEFAULT_ENV_VARS.items():
-        monkeypatch.setenv(key, value)
-    # Mockear load_dotenv a nivel global para todos los tests que importen 'database'
-    # Esto debe hacerse antes de la primera importación de 'database'
-    monkeypatch.setattr("dotenv.load_dotenv", lambda: None)
+def test_settings(monkeypatch):
+    """Settings de prueba (sin leer .env) y engines memorizados limpios en cada test."""
+    settings = Settings(_env_file=None, **DEFAULT_DB_SETTINGS)
+    monkeypatch.setattr(database, "get_settings", lambda: settings)
+    database.reset_engines()
+    yield settings
+    database.reset_engines()
 
 
 @pytest.fixture
 def mock_sqlalchemy_creators(monkeypatch):
-    """Mockea create_async_engine y async_sessionmaker."""
+    """Mockea la fábrica de engines asíncronos y async_sessionmaker."""
     mock_engine_creator = mock.MagicMock()
-    monkeypatch.setattr("sqlalchemy.ext.asyncio.create_async_engine", mock_engine_creator)
+    monkeypatch.setattr(f"{ENGINE_MODULE}.create_async_db_engine", mock_engine_creator)
 
     mock_session_maker_creator_func = mock.MagicMock(spec=async_sessionmaker)
 
-    # Lo que async_sessionmaker(...) devuelve (el callable AsyncSessionLocal)
-    mock_async_session_local_callable = mock.Mock(spec=async_sessionmaker)  # spec para el callable
+    # Lo que async_sessionmaker(...) devuelve (el callable de sesiones)
+    mock_async_session_local_callable = mock.Mock(spec=async_sessionmaker)
 
-    # Lo que AsyncSessionLocal() devuelve (la instancia de sesión)
+    # Lo que el callable devuelve (la instancia de sesión)
     mock_async_session_instance = mock.AsyncMock(spec=AsyncSession)
     # Configurar __aenter__ para que devuelva la propia instancia de sesión mockeada
     mock_async_session_instance.__aenter__.return_value = mock_async_session_instance
@@ -50,9 +53,7 @@ def mock_sqlalchemy_creators(monkeypatch):
     mock_async_session_local_callable.return_value = mock_async_session_instance
     mock_session_maker_creator_func.return_value = mock_async_session_local_callable
 
-    monkeypatch.setattr(
-        "sqlalchemy.ext.asyncio.async_sessionmaker", mock_session_maker_creator_func
-    )
+    monkeypatch.setattr(database, "async_sessionmaker", mock_session_maker_creator_func)
 
     return (
         mock_engine_creator,
@@ -62,85 +63,78 @@ def mock_sqlalchemy_creators(monkeypatch):
     )
 
 
-def import_database_module():
-    """
-    Importa y devuelve el módulo database.
-    Se asegura de que se recargue si ya está en sys.modules para aplicar mocks
-    o reflejar cambios en el entorno (ej. variables de entorno eliminadas).
-    """
-    import importlib
-
-    module_name = "pkm_app.infrastructure.persistence.sqlalchemy.database"
-
-    # Los mocks (dotenv, sqlalchemy) deben ser aplicados por las fixtures ANTES de llamar esta función.
-
-    if module_name in sys.modules:
-        # Si el módulo ya fue importado, lo recargamos.
-        reloaded_module = importlib.reload(sys.modules[module_name])
-    else:
-        # Si es la primera vez en este contexto (ej. después de del sys.modules[module_name]), lo importamos.
-        reloaded_module = importlib.import_module(module_name)
-    return reloaded_module
-
+def test_import_has_no_side_effects():
+    """Importar database (y el Unit of Work) no crea engines ni carga el driver asyncpg."""
+    code = (
+        "import sys\n"
+        "import src.pkm_app.infrastructure.persistence.sqlalchemy.unit_of_work\n"
+        "from src.pkm_app.infrastructure.persistence.sqlalchemy import database\n"
+        "assert database.get_async_engine.cache_info().currsize == 0\n"
+        "assert 'asyncpg' not in sys.modules\n"
+    )
+    # Sin variables DB_*: antes la importación lanzaba ValueError
+    result = subprocess.run(
+        [sys.executable, "-c", code], env={"PATH": ""}, capture_output=True, text=True
+    )
+    assert result.returncode == 0, result.stderr
 
-def test_database_url_construction(monkeypatch):
-    """Verifica que ASYNC_DATABASE_URL se construye correctamente."""
-    # monkeypatch.setattr ya se encarga de mockear load_dotenv en mock_env_vars
-    database = import_database_module()
 
+def test_database_url_construction():
+    """Verifica que la URL asíncrona se construye desde Settings."""
     expected_url = URL.create(
         drivername="postgresql+asyncpg",
-        username=DEFAULT_ENV_VARS["DB_USER"],
-        password=DEFAULT_ENV_VARS["DB_PASSWORD"],
-        host=DEFAULT_ENV_VARS["DB_HOST"],
-        port=int(DEFAULT_ENV_VARS["DB_PORT"]),
-        database=DEFAULT_ENV_VARS["DB_NAME"],
+        username=DEFAULT_DB_SETTINGS["DB_USER"],
+        password=DEFAULT_DB_SETTINGS["DB_PASSWORD"],
+        host=DEFAULT_DB_SETTINGS["DB_HOST"],
+        port=DEFAULT_DB_SETTINGS["DB_PORT"],
+        database=DEFAULT_DB_SETTINGS["DB_NAME"],
     ).render_as_string(hide_password=False)
 
+    assert database.get_async_database_url() == expected_url
+    # Nombre anterior, resuelto de forma perezosa
     assert database.ASYNC_DATABASE_URL == expected_url
 
 
-def test_missing_env_vars_raises_value_error(monkeypatch):
-    """Verifica que se lanza ValueError si faltan variables de entorno."""
-    module_name = "pkm_app.infrastructure.persistence.sqlalchemy.database"
+def test_missing_settings_raises_value_error_on_first_use(monkeypatch):
+    """Sin configuración, el error aparece al pedir el engine, no al importar."""
+    monkeypatch.setattr(
+        database, "get_settings", lambda: Settings(_env_file=None, DB_USER="", DB_NAME="")
+    )
 
-    # Eliminar todas las variables de entorno relevantes
-    for var in DEFAULT_ENV_VARS.keys():
-        monkeypatch.delenv(var, raising=False)
+    with pytest.raises(ValueError, match="Faltan variables de entorno para la base de datos"):
+        database.get_async_engine()
 
-    # Asegurarse de que el módulo database no esté usando una versión cacheada
-    # que podría haber leído las variables de entorno antes de que las elimináramos.
-    if module_name in sys.modules:
-        del sys.modules[module_name]
 
-    with pytest.raises(ValueError, match="Faltan variables de entorno para la base de datos"):
-        # La importación (y por tanto la comprobación de env vars) ocurre aquí.
-        # Como lo eliminamos de sys.modules, import_database_module lo importará "de nuevo".
-        import_database_module()
+def test_async_engine_creation(mock_sqlalchemy_creators, test_settings):
+    """Verifica que el engine asíncrono se crea con la fábrica, la URL y los Settings."""
+    mock_engine_creator, _, _, _ = mock_sqlalchemy_creators
+
+    engine = database.get_async_engine()
 
+    mock_engine_creator.assert_called_once_with(database.get_async_database_url(), test_settings)
+    assert engine is mock_engine_creator.return_value
 
-def test_async_engine_creation(mock_sqlalchemy_creators, monkeypatch):
-    """Verifica que create_async_engine se llama con la URL y echo=True."""
+
+def test_async_engine_is_memoized(mock_sqlalchemy_creators):
+    """El engine se crea una sola vez y reset_engines() lo olvida."""
     mock_engine_creator, _, _, _ = mock_sqlalchemy_creators
 
-    # Importar el módulo DESPUÉS de que mock_sqlalchemy_creators haya aplicado los mocks
-    database_module = import_database_module()
+    assert database.get_async_engine() is database.get_async_engine()
+    assert database.async_engine is database.get_async_engine()
+    mock_engine_creator.assert_called_once()
 
-    mock_engine_creator.assert_called_once_with(database_module.ASYNC_DATABASE_URL, echo=True)
+    database.reset_engines()
+    database.get_async_engine()
+    assert mock_engine_creator.call_count == 2
 
 
-def test_async_session_local_creation(mock_sqlalchemy_creators, monkeypatch):
+def test_async_session_local_creation(mock_sqlalchemy_creators):
     """Verifica que async_sessionmaker se llama con los parámetros correctos."""
     mock_engine_creator, mock_session_maker_creator_func, _, _ = mock_sqlalchemy_creators
-
-    # El engine que create_async_engine (mockeado) "devolvería"
-    # Necesitamos que el mock_engine_creator.return_value sea algo,
-    # ya que database.py lo usa como 'bind'
     mock_created_engine = mock.MagicMock()
     mock_engine_creator.return_value = mock_created_engine
 
-    # Importar el módulo DESPUÉS de que los mocks estén listos
-    import_database_module()
+    database.get_async_sessionmaker()
 
     mock_session_maker_creator_func.assert_called_once_with(
         bind=mock_created_engine,
@@ -151,23 +145,75 @@ def test_async_session_local_creation(mock_sqlalchemy_creators, monkeypatch):
     )
 
 
+def test_readonly_engine_uses_separate_pool(mock_sqlalchemy_creators, test_settings):
+    """El engine de solo lectura es otro engine (otro pool) creado con read_only=True."""
+    mock_engine_creator, mock_session_maker_creator_func, _, _ = mock_sqlalchemy_creators
+    mock_engine_creator.side_effect = lambda *args, **kwargs: mock.MagicMock()
+
+    readonly_engine = database.get_async_readonly_engine()
+
+    assert readonly_engine is not database.get_async_engine()
+    mock_engine_creator.assert_any_call(
+        database.get_async_database_url(), test_settings, read_only=True
+    )
+    database.get_async_readonly_sessionmaker()
+    mock_session_maker_creator_func.assert_called_once_with(
+        bind=readonly_engine, class_=AsyncSession, expire_on_commit=False, autoflush=False
+    )
+
+
+def test_replica_router_is_none_without_replicas(mock_sqlalchemy_creators):
+    mock_engine_creator, _, _, _ = mock_sqlalchemy_creators
+
+    assert database.get_replica_router() is None
+    mock_engine_creator.assert_not_called()
+
+
+def test_replica_router_from_settings(mock_sqlalchemy_creators, monkeypatch):
+    """Con DB_REPLICA_URLS se crea un engine de solo lectura por réplica."""
+    mock_engine_creator, _, _, _ = mock_sqlalchemy_creators
+    mock_engine_creator.side_effect = lambda *args, **kwargs: mock.MagicMock()
+    replica_urls = ["postgresql+asyncpg://u:p@replica1/db", "postgresql+asyncpg://u:p@replica2/db"]
+    settings = Settings(
+        _env_file=None,
+        DB_REPLICA_URLS=replica_urls,
+        DB_REPLICA_STRATEGY="least_connections",
+        DB_READ_YOUR_WRITES_SECONDS=2.5,
+        **DEFAULT_DB_SETTINGS,
+    )
+    monkeypatch.setattr(database, "get_settings", lambda: settings)
+
+    router = database.get_replica_router()
+
+    assert router is database.get_replica_router()
+    assert router.primary is database.get_async_readonly_engine()
+    assert len(router.replicas) == 2
+    assert router.strategy == "least_connections"
+    assert router.sticky_seconds == 2.5
+    for url in replica_urls:
+        mock_engine_creator.assert_any_call(url, settings, read_only=True)
+
+
+@pytest.mark.asyncio
+async def test_dispose_engines_disposes_and_forgets(mock_sqlalchemy_creators):
+    mock_engine_creator, _, _, _ = mock_sqlalchemy_creators
+    mock_engine_creator.return_value.dispose = mock.AsyncMock()
+
+    database.get_async_engine()
+    await database.dispose_engines()
+
+    mock_engine_creator.return_value.dispose.assert_awaited_once()
+    assert database.get_async_engine.cache_info().currsize == 0
+
+
 @pytest.mark.asyncio
 async def test_get_async_db_session_success(mock_sqlalchemy_creators, monkeypatch):
     """Verifica que get_async_db_session proporciona y cierra una sesión."""
     _, _, mock_callable_session_local, mock_session_instance = mock_sqlalchemy_creators
 
-    database_module = import_database_module()
-
-    # Sobrescribir AsyncSessionLocal en el módulo 'database_module' importado
-    # con nuestro callable mockeado.
-    monkeypatch.setattr(database_module, "AsyncSessionLocal", mock_callable_session_local)
-
     retrieved_session = None
-    # Usar el get_async_db_session del módulo importado
-    async for s in database_module.get_async_db_session():
+    async for s in database.get_async_db_session():
         retrieved_session = s
-        # s es el resultado de mock_session_instance.__aenter__()
-        # que hemos configurado para que sea mock_session_instance
         assert s is mock_session_instance
 
     assert retrieved_session is not None
@@ -184,41 +230,25 @@ async def test_get_async_db_session_exception_rollbacks_and_closes(
     """Verifica que la sesión hace rollback y se cierra en caso de excepción."""
     _, _, mock_callable_session_local, mock_session_instance = mock_sqlalchemy_creators
 
-    database_module = import_database_module()
-    monkeypatch.setattr(database_module, "AsyncSessionLocal", mock_callable_session_local)
-
-    custom_exception = ValueError("Test Exception")
-
-    agen = database_module.get_async_db_session()
-
-    # Consumir el generador hasta el primer yield para obtener la sesión
+    agen = database.get_async_db_session()
     s = await agen.__anext__()
     assert s is mock_session_instance
 
-    # Ahora, inyectar la excepción en el generador
-    # Esto debería ser capturado por el bloque `except Exception:` en `get_async_db_session`
+    # La excepción inyectada la captura el bloque `except Exception:` de get_async_db_session
     with pytest.raises(ValueError, match="Test Exception"):
-        await agen.athrow(custom_exception)
-
-    # Cuando athrow propaga una excepción fuera del generador, este se cierra automáticamente.
-    # No se necesita una llamada explícita a agen.aclose() en este caso específico,
-    # a menos que el generador manejara la excepción de athrow y continuara con StopAsyncIteration.
+        await agen.athrow(ValueError("Test Exception"))
 
-    # Verificaciones
     mock_callable_session_local.assert_called_once()
     mock_session_instance.__aenter__.assert_called_once()
-
-    # El rollback y close deben ser llamados por la lógica explícita
-    # en los bloques except y finally de get_async_db_session
     mock_session_instance.rollback.assert_called_once()
     mock_session_instance.close.assert_called_once()
 
 
 @pytest.fixture
 def mock_sqlalchemy_sync_creators(monkeypatch):
-    """Mockea create_engine y sessionmaker para la configuración síncrona."""
-    mock_sync_engine_creator = mock.MagicMock(spec=create_engine)
-    monkeypatch.setattr("sqlalchemy.create_engine", mock_sync_engine_creator)
+    """Mockea la fábrica de engines síncronos y sessionmaker."""
+    mock_sync_engine_creator = mock.MagicMock()
+    monkeypatch.setattr(f"{ENGINE_MODULE}.create_sync_db_engine", mock_sync_engine_creator)
 
     mock_sync_session_maker_creator_func = mock.MagicMock(spec=sessionmaker)
 
@@ -232,7 +262,7 @@ def mock_sqlalchemy_sync_creators(monkeypatch):
     mock_sync_session_local_callable.return_value = mock_sync_session_instance
     mock_sync_session_maker_creator_func.return_value = mock_sync_session_local_callable
 
-    monkeypatch.setattr("sqlalchemy.orm.sessionmaker", mock_sync_session_maker_creator_func)
+    monkeypatch.setattr(database, "sessionmaker", mock_sync_session_maker_creator_func)
 
     return (
         mock_sync_engine_creator,
@@ -242,43 +272,41 @@ def mock_sqlalchemy_sync_creators(monkeypatch):
     )
 
 
-def test_sync_database_url_construction(monkeypatch):
-    """Verifica que SYNC_DATABASE_URL_STR se construye correctamente."""
-    database = import_database_module()
-
+def test_sync_database_url_construction():
+    """Verifica que la URL síncrona se construye desde Settings."""
     expected_url = URL.create(
         drivername="postgresql+psycopg2",
-        username=DEFAULT_ENV_VARS["DB_USER"],
-        password=DEFAULT_ENV_VARS["DB_PASSWORD"],
-        host=DEFAULT_ENV_VARS["DB_HOST"],
-        port=int(DEFAULT_ENV_VARS["DB_PORT"]),
-        database=DEFAULT_ENV_VARS["DB_NAME"],
+        username=DEFAULT_DB_SETTINGS["DB_USER"],
+        password=DEFAULT_DB_SETTINGS["DB_PASSWORD"],
+        host=DEFAULT_DB_SETTINGS["DB_HOST"],
+        port=DEFAULT_DB_SETTINGS["DB_PORT"],
+        database=DEFAULT_DB_SETTINGS["DB_NAME"],
     ).render_as_string(hide_password=False)
 
+    assert database.get_sync_database_url() == expected_url
     assert database.SYNC_DATABASE_URL_STR == expected_url
 
 
-def test_sync_engine_creation(mock_sqlalchemy_sync_creators, monkeypatch):
-    """Verifica que create_engine se llama con la URL y echo=True."""
+def test_sync_engine_creation(mock_sqlalchemy_sync_creators, test_settings):
+    """Verifica que el engine síncrono se crea con la fábrica, la URL y los Settings."""
     mock_sync_engine_creator, _, _, _ = mock_sqlalchemy_sync_creators
 
-    database_module = import_database_module()
+    assert database.get_sync_engine() is database.get_sync_engine()
 
     mock_sync_engine_creator.assert_called_once_with(
-        database_module.SYNC_DATABASE_URL_STR, echo=True
+        database.get_sync_database_url(), test_settings
     )
 
 
-def test_sync_session_local_creation(mock_sqlalchemy_sync_creators, monkeypatch):
+def test_sync_session_local_creation(mock_sqlalchemy_sync_creators):
     """Verifica que sessionmaker se llama con los parámetros correctos."""
     mock_sync_engine_creator, mock_sync_session_maker_creator_func, _, _ = (
         mock_sqlalchemy_sync_creators
     )
-
     mock_created_sync_engine = mock.MagicMock()
     mock_sync_engine_creator.return_value = mock_created_sync_engine
 
-    import_database_module()
+    database.get_sync_sessionmaker()
 
     mock_sync_session_maker_creator_func.assert_called_once_with(
         autocommit=False, autoflush=False, bind=mock_created_sync_engine, class_=Session
@@ -291,11 +319,8 @@ def test_get_sync_db_session_success(mock_sqlalchemy_sync_creators, monkeypatch)
         mock_sqlalchemy_sync_creators
     )
 
-    database_module = import_database_module()
-    monkeypatch.setattr(database_module, "SyncSessionLocal", mock_callable_sync_session_local)
-
     retrieved_session = None
-    with database_module.get_sync_db_session() as s:
+    with database.get_sync_db_session() as s:
         retrieved_session = s
         assert s is mock_sync_session_instance
 
@@ -313,15 +338,10 @@ def test_get_sync_db_session_exception_rollbacks_and_closes(
         mock_sqlalchemy_sync_creators
     )
 
-    database_module = import_database_module()
-    monkeypatch.setattr(database_module, "SyncSessionLocal", mock_callable_sync_session_local)
-
-    custom_exception = ValueError("Test Sync Exception")
-
     with pytest.raises(ValueError, match="Test Sync Exception"):
-        with database_module.get_sync_db_session() as s:
+        with database.get_sync_db_session() as s:
             assert s is mock_sync_session_instance
-            raise custom_exception
+            raise ValueError("Test Sync Exception")
 
     mock_callable_sync_session_local.assert_called_once()
     mock_sync_session_instance.rollback.assert_called_once()
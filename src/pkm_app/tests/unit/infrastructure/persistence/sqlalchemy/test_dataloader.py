@@ -0,0 +1,180 @@
+import asyncio
+import uuid
+from unittest import mock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.pkm_app.infrastructure.persistence.sqlalchemy.dataloader import (
+    DataLoader,
+    DataLoaderRegistry,
+    id_in,
+    session_loaders,
+)
+from src.pkm_app.infrastructure.persistence.sqlalchemy.models import Project as ProjectModel
+from src.pkm_app.infrastructure.persistence.sqlalchemy.repositories.project_repository import (
+    SQLAlchemyProjectRepository,
+)
+from src.pkm_app.infrastructure.persistence.sqlalchemy.unit_of_work import (
+    SQLAlchemyReadOnlyUnitOfWork,
+    SQLAlchemyUnitOfWork,
+)
+
+
+def recording_batch_load(calls: list[list[int]]):
+    async def batch_load(keys: list[int]) -> dict[int, str]:
+        calls.append(keys)
+        return {key: f"valor {key}" for key in keys if key >= 0}
+
+    return batch_load
+
+
+@pytest.mark.asyncio
+async def test_loads_in_the_same_tick_are_coalesced_and_memoized():
+    calls: list[list[int]] = []
+    loader = DataLoader(recording_batch_load(calls))
+
+    results = await asyncio.gather(loader.load(1), loader.load(2), loader.load(1), loader.load(-1))
+    again = await loader.load(2)
+
+    assert results == ["valor 1", "valor 2", "valor 1", None]
+    assert again == "valor 2"
+    assert calls == [[1, 2, -1]]
+    assert loader.batches == 1
+
+
+@pytest.mark.asyncio
+async def test_sequential_loads_use_separate_batches():
+    calls: list[list[int]] = []
+    loader = DataLoader(recording_batch_load(calls))
+
+    assert await loader.load(1) == "valor 1"
+    assert await loader.load_many([2, 3]) == ["valor 2", "valor 3"]
+
+    assert calls == [[1], [2, 3]]
+
+
+@pytest.mark.asyncio
+async def test_large_ticks_are_split_by_max_batch_size():
+    calls: list[list[int]] = []
+    loader = DataLoader(recording_batch_load(calls), max_batch_size=2)
+
+    assert await loader.load_many([1, 2, 3]) == ["valor 1", "valor 2", "valor 3"]
+
+    assert calls == [[1, 2], [3]]
+
+
+@pytest.mark.asyncio
+async def test_errors_reach_every_caller_and_are_not_memoized():
+    attempts = 0
+
+    async def flaky(keys: list[int]) -> dict[int, str]:
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            raise RuntimeError("DB caída")
+        return {key: "ok" for key in keys}
+
+    loader = DataLoader(flaky)
+
+    results = await asyncio.gather(loader.load(1), loader.load(2), return_exceptions=True)
+    assert [type(result) for result in results] == [RuntimeError, RuntimeError]
+    assert await loader.load(1) == "ok"
+
+
+@pytest.mark.asyncio
+async def test_forget_prime_and_clear():
+    calls: list[list[int]] = []
+    loader = DataLoader(recording_batch_load(calls))
+    loader.prime(5, "precargado")
+
+    assert await loader.load(5) == "precargado"
+    await loader.load(1)
+    loader.forget(1)
+    await loader.load(1)
+    loader.clear()
+    await loader.load(5)
+
+    assert calls == [[1], [1], [5]]
+
+
+@pytest.mark.asyncio
+async def test_registry_serializes_batches_of_all_loaders():
+    running = 0
+    overlapped = False
+
+    async def batch_load(keys: list[int]) -> dict[int, int]:
+        nonlocal running, overlapped
+        running += 1
+        overlapped = overlapped or running > 1
+        await asyncio.sleep(0)
+        running -= 1
+        return {key: key for key in keys}
+
+    registry = DataLoaderRegistry()
+    projects = registry.get(("projects", "user-1"), batch_load)
+    sources = registry.get(("sources", "user-1"), batch_load)
+
+    assert registry.get(("projects", "user-1"), batch_load) is projects
+    assert await asyncio.gather(projects.load(1), sources.load(2)) == [1, 2]
+    assert not overlapped
+    assert registry.batches == 2
+
+
+def test_id_in_uses_a_single_array_parameter():
+    ids = [uuid.uuid4() for _ in range(3)]
+
+    compiled = id_in(ProjectModel.id, ids).compile(dialect=postgresql.dialect())
+
+    assert str(compiled) == "projects.id = ANY (%(ids)s::UUID[])"
+    assert compiled.params == {"ids": ids}
+
+
+@pytest.mark.asyncio
+async def test_unit_of_work_scopes_loaders_to_its_context():
+    session = AsyncSession()
+    uow = SQLAlchemyReadOnlyUnitOfWork(session)
+
+    async with uow:
+        registry = uow.loaders
+        assert registry is not None
+        assert session_loaders(session) is registry
+        async with SQLAlchemyReadOnlyUnitOfWork(session) as nested:
+            assert nested.loaders is registry
+        assert session_loaders(session) is registry
+
+    assert uow.loaders is None
+    assert session_loaders(session) is None
+
+
+@pytest.mark.asyncio
+async def test_repository_get_by_id_is_batched_inside_a_unit_of_work():
+    session = AsyncSession()
+    user_id = "user-1"
+    ids = [uuid.uuid4() for _ in range(3)]
+    projects = {project_id: mock.sentinel.project for project_id in ids[:2]}
+
+    with mock.patch.object(
+        SQLAlchemyProjectRepository, "get_many_by_ids", autospec=True, return_value=projects
+    ) as get_many_by_ids:
+        async with SQLAlchemyReadOnlyUnitOfWork(session) as uow:
+            results = await asyncio.gather(
+                *(uow.projects.get_by_id(project_id, user_id) for project_id in ids + ids[:1])
+            )
+            await uow.projects.get_by_id(ids[0], user_id)
+
+    assert results == [mock.sentinel.project, mock.sentinel.project, None, mock.sentinel.project]
+    get_many_by_ids.assert_awaited_once_with(mock.ANY, ids, user_id)
+
+
+@pytest.mark.asyncio
+async def test_rollback_clears_memoized_entities():
+    session = mock.AsyncMock(spec=AsyncSession)
+    session.info = {}
+    session.in_transaction = mock.Mock(return_value=True)  # transacción externa
+    async with SQLAlchemyUnitOfWork(session) as uow:
+        loader = uow.loaders.get(("projects", "user-1"), recording_batch_load([]))
+        loader.prime(1, "antes del rollback")
+        await uow.rollback()
+        assert await loader.load(1) == "valor 1"
@@ -0,0 +1,55 @@
+from unittest import mock
+
+import numpy as np
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.pkm_app.infrastructure.persistence.sqlalchemy.repositories.embedding_repository import (
+    PUT_MANY,
+    SQLAlchemyEmbeddingCacheRepository,
+)
+
+MODEL = "modelo-test"
+
+
+def test_put_keeps_the_vector_already_stored():
+    sql = str(PUT_MANY.compile(dialect=postgresql.dialect()))
+
+    assert sql.endswith("ON CONFLICT (model, content_hash) DO NOTHING")
+
+
+@pytest.mark.asyncio
+async def test_empty_requests_do_not_reach_the_database():
+    session = mock.AsyncMock(spec=AsyncSession)
+    repo = SQLAlchemyEmbeddingCacheRepository(session)
+
+    assert await repo.get_many(MODEL, []) == {}
+    await repo.put_many(MODEL, {})
+
+    session.execute.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_vectors_are_stored_as_little_endian_float32_bytes():
+    session = mock.AsyncMock(spec=AsyncSession)
+    repo = SQLAlchemyEmbeddingCacheRepository(session)
+    vector = np.array([0.5, -1.0, 2.0], dtype=np.float64)
+
+    await repo.put_many(MODEL, {b"h" * 32: vector})
+
+    [row] = session.execute.await_args.args[1]
+    assert row["dimension"] == 3
+    assert row["vector"] == vector.astype("<f4").tobytes()
+
+    session.execute.return_value = [(b"h" * 32, row["vector"])]
+    stored = await repo.get_many(MODEL, [b"h" * 32])
+    np.testing.assert_array_equal(stored[b"h" * 32], vector.astype(np.float32))
+
+
+@pytest.mark.asyncio
+async def test_put_rejects_matrices():
+    repo = SQLAlchemyEmbeddingCacheRepository(mock.AsyncMock(spec=AsyncSession))
+
+    with pytest.raises(ValueError):
+        await repo.put_many(MODEL, {b"h" * 32: np.ones((2, 2))})
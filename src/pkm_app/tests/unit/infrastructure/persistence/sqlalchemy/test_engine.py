@@ -0,0 +1,124 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.pool import NullPool
+
+from src.pkm_app.infrastructure.config.settings import Settings
+from src.pkm_app.infrastructure.persistence.sqlalchemy.engine import (
+    ENGINE_PRESETS,
+    EngineOptions,
+    InstrumentedAsyncAdaptedQueuePool,
+    build_async_engine_kwargs,
+    build_sync_engine_kwargs,
+    create_async_db_engine,
+    create_sync_db_engine,
+    get_pool_metrics,
+    resolve_engine_options,
+)
+
+
+def make_settings(**overrides) -> Settings:
+    return Settings(_env_file=None, **overrides)
+
+
+def test_resolve_engine_options_uses_preset_defaults():
+    options = resolve_engine_options(make_settings(DB_ENGINE_PRESET="production"))
+    assert options == ENGINE_PRESETS["production"]
+    assert options.echo is False
+
+
+def test_resolve_engine_options_applies_explicit_overrides():
+    options = resolve_engine_options(
+        make_settings(
+            DB_ENGINE_PRESET="production",
+            DB_POOL_SIZE=3,
+            DB_STATEMENT_TIMEOUT_MS=500,
+            DB_ECHO=True,
+        )
+    )
+    assert options.pool_size == 3
+    assert options.statement_timeout_ms == 500
+    assert options.echo is True
+    # Los ajustes no definidos conservan el valor del preset
+    assert options.pool_recycle == ENGINE_PRESETS["production"].pool_recycle
+
+
+def test_resolve_engine_options_unknown_preset_raises():
+    with pytest.raises(ValueError, match="Preset de engine desconocido"):
+        resolve_engine_options(make_settings(DB_ENGINE_PRESET="turbo"))
+
+
+def test_build_async_engine_kwargs_pool_and_asyncpg_settings():
+    options = EngineOptions(pool_size=7, statement_timeout_ms=1500, statement_cache_size=50)
+    kwargs = build_async_engine_kwargs(options)
+
+    assert kwargs["poolclass"] is InstrumentedAsyncAdaptedQueuePool
+    assert kwargs["pool_size"] == 7
+    assert kwargs["echo"] is False
+    assert kwargs["connect_args"]["statement_cache_size"] == 50
+    assert kwargs["connect_args"]["prepared_statement_cache_size"] == 50
+    assert kwargs["connect_args"]["server_settings"] == {"statement_timeout": "1500"}
+
+
+def test_build_async_engine_kwargs_pgbouncer_mode():
+    options = EngineOptions(pgbouncer_mode=True, statement_timeout_ms=2000)
+    kwargs = build_async_engine_kwargs(options)
+    connect_args = kwargs["connect_args"]
+
+    assert kwargs["poolclass"] is NullPool
+    assert "pool_size" not in kwargs
+    assert connect_args["statement_cache_size"] == 0
+    assert connect_args["prepared_statement_cache_size"] == 0
+    assert "server_settings" not in connect_args
+    assert connect_args["command_timeout"] == 2.0
+    name_func = connect_args["prepared_statement_name_func"]
+    assert name_func() != name_func()
+
+
+def test_build_async_engine_kwargs_read_only():
+    kwargs = build_async_engine_kwargs(EngineOptions(statement_timeout_ms=1500), read_only=True)
+
+    assert kwargs["isolation_level"] == "AUTOCOMMIT"
+    assert kwargs["connect_args"]["server_settings"] == {
+        "statement_timeout": "1500",
+        "default_transaction_read_only": "on",
+    }
+
+
+def test_build_sync_engine_kwargs_statement_timeout():
+    kwargs = build_sync_engine_kwargs(EngineOptions(statement_timeout_ms=100))
+    assert kwargs["connect_args"] == {"options": "-c statement_timeout=100"}
+
+
+def test_create_async_db_engine_registers_pool_metrics():
+    engine = create_async_db_engine(
+        "postgresql+asyncpg://user:pw@localhost/db", make_settings(DB_POOL_SIZE=4)
+    )
+    metrics = get_pool_metrics(engine)
+    assert metrics is not None
+    assert metrics.snapshot()["pool_size"] == 4
+
+
+def test_pool_metrics_track_checkouts_and_wait_time(tmp_path):
+    engine = create_sync_db_engine(
+        f"sqlite:///{tmp_path / 'metrics.db'}", make_settings(DB_POOL_SIZE=2)
+    )
+    metrics = get_pool_metrics(engine)
+    assert metrics is not None
+
+    with engine.connect() as first, engine.connect() as second:
+        first.execute(text("SELECT 1"))
+        second.execute(text("SELECT 1"))
+        assert metrics.snapshot()["checked_out"] == 2
+
+    snapshot = metrics.snapshot()
+    assert snapshot["checked_out"] == 0
+    assert snapshot["peak_checked_out"] == 2
+    assert snapshot["checkouts"] == 2
+    assert snapshot["connections_opened"] == 2
+    assert snapshot["wait_time_total"] >= 0
+
+    # Las métricas sobreviven a la recreación del pool
+    engine.dispose()
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+    assert metrics.snapshot()["checkouts"] == 3
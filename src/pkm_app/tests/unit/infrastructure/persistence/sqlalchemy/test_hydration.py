@@ -0,0 +1,282 @@
+import uuid
+from datetime import UTC, datetime
+
+import pytest
+from pydantic import AnyUrl, BaseModel, ValidationError
+from pydantic_core import SchemaValidator
+
+from src.pkm_app.core.application.dtos import (
+    KeywordSchema,
+    NoteLinkSchema,
+    NoteSchema,
+    ProjectSchema,
+    SourceSchema,
+    UserProfileSchema,
+)
+from src.pkm_app.core.domain.entities import (
+    Keyword,
+    Note,
+    NoteLink,
+    Project,
+    Source,
+    Tag,
+    UserProfile,
+)
+from src.pkm_app.infrastructure.persistence.sqlalchemy.models import Keyword as KeywordModel
+from src.pkm_app.infrastructure.persistence.sqlalchemy.models import Note as NoteModel
+from src.pkm_app.infrastructure.persistence.sqlalchemy.models import Project as ProjectModel
+from src.pkm_app.infrastructure.persistence.sqlalchemy.models import Source as SourceModel
+from src.pkm_app.infrastructure.persistence.sqlalchemy.repositories import hydration
+from src.pkm_app.infrastructure.persistence.sqlalchemy.repositories.hydration import (
+    REPOSITORY_MODELS,
+    _model_schema,
+    trusted,
+    trusted_validator,
+)
+
+USER_ID = "user_1"
+NOW = datetime(2025, 1, 1, tzinfo=UTC)
+
+
+def _project() -> dict:
+    return {
+        "id": uuid.uuid4(),
+        "user_id": USER_ID,
+        "name": "Proyecto",
+        "description": None,
+        "parent_project_id": None,
+        "created_at": NOW,
+        "updated_at": NOW,
+        "version": 1,
+    }
+
+
+def _source() -> dict:
+    return {
+        "id": uuid.uuid4(),
+        "user_id": USER_ID,
+        "type": "web",
+        "title": "Fuente",
+        "description": None,
+        "url": "https://example.com/articulo?x=1",
+        "link_metadata": {"lang": "es"},
+        "created_at": NOW,
+        "updated_at": NOW,
+        "version": 1,
+    }
+
+
+def _keyword(name: str) -> dict:
+    return {"id": uuid.uuid4(), "user_id": USER_ID, "name": name, "created_at": NOW}
+
+
+def _note() -> dict:
+    project, source = _project(), _source()
+    return {
+        "id": uuid.uuid4(),
+        "user_id": USER_ID,
+        "title": "Nota",
+        "content": "Contenido",
+        "type": "markdown",
+        "note_metadata": {"status": "draft", "tags": ["a", "b"]},
+        "project_id": project["id"],
+        "source_id": source["id"],
+        "created_at": NOW,
+        "updated_at": NOW,
+        "version": 1,
+        "project": project,
+        "source": source,
+        "keywords": [_keyword("a"), _keyword("b")],
+    }
+
+
+DTO_CASES = [
+    (NoteSchema, _note()),
+    (NoteSchema, {**_note(), "project": None, "source": None, "keywords": []}),
+    (ProjectSchema, _project()),
+    (SourceSchema, _source()),
+    (SourceSchema, {**_source(), "url": None, "link_metadata": None}),
+    (KeywordSchema, _keyword("python")),
+    (
+        NoteLinkSchema,
+        {
+            "id": uuid.uuid4(),
+            "user_id": USER_ID,
+            "source_note_id": uuid.uuid4(),
+            "target_note_id": uuid.uuid4(),
+            "link_type": "reference",
+            "description": None,
+            "created_at": NOW,
+        },
+    ),
+    (
+        UserProfileSchema,
+        {
+            "user_id": USER_ID,
+            "name": "Ana",
+            "email": "ana@example.com",
+            "preferences": {"theme": "dark"},
+            "learned_context": {},
+            "created_at": NOW,
+            "updated_at": NOW,
+        },
+    ),
+]
+
+def _entity(**fields) -> dict:
+    # El id explícito hace comparables ambos objetos (por defecto es uuid4)
+    return {"id": uuid.uuid4(), "created_at": NOW, "updated_at": NOW, **fields}
+
+
+ENTITY_CASES = [
+    (
+        Note,
+        _entity(
+            title="Nota",
+            content="Contenido",
+            type="code",
+            metadata={"lang": "python"},
+            project_id=uuid.uuid4(),
+            keyword_ids=[uuid.uuid4()],
+        ),
+    ),
+    (Note, _entity(title="Nota", content="Contenido", type="text")),
+    (Project, _entity(name="Proyecto", status="on_hold")),
+    (Keyword, _entity(name="python", user_id=uuid.uuid4())),
+    (Source, _entity(title="Fuente", source_type="article", url="https://example.com")),
+    (
+        NoteLink,
+        _entity(source_note_id=uuid.uuid4(), target_note_id=uuid.uuid4(), link_type="supports"),
+    ),
+    (UserProfile, _entity(username="ana_01", email="ana@example.com", preferences={"x": 1})),
+    (Tag, _entity(name="system.status.draft", parent_id=uuid.uuid4())),
+]
+
+
+def assert_same(trusted_obj: BaseModel, validated: BaseModel) -> None:
+    assert type(trusted_obj) is type(validated)
+    assert trusted_obj == validated
+    assert trusted_obj.model_fields_set == validated.model_fields_set
+    assert trusted_obj.model_dump(mode="json") == validated.model_dump(mode="json")
+    for name in type(validated).model_fields:
+        assert type(getattr(trusted_obj, name)) is type(getattr(validated, name)), name
+
+
+@pytest.mark.parametrize(("model", "data"), DTO_CASES + ENTITY_CASES)
+def test_trusted_matches_model_validate(model: type[BaseModel], data: dict):
+    assert_same(trusted(model, data), model.model_validate(data))
+
+
+def test_trusted_nested_models_are_built():
+    note = trusted(NoteSchema, _note())
+
+    assert isinstance(note.project, ProjectSchema)
+    assert isinstance(note.source, SourceSchema)
+    assert isinstance(note.source.url, AnyUrl)
+    assert all(isinstance(keyword, KeywordSchema) for keyword in note.keywords)
+    assert_same(note.project, ProjectSchema.model_validate(note.project.model_dump()))
+
+
+def test_trusted_from_orm_instances():
+    data = _note()
+    model = NoteModel(
+        **{k: v for k, v in data.items() if k not in ("project", "source", "keywords")},
+        project=ProjectModel(**data["project"]),
+        source=SourceModel(**data["source"]),
+        keywords=[KeywordModel(**keyword) for keyword in data["keywords"]],
+    )
+
+    assert_same(trusted(NoteSchema, model), NoteSchema.model_validate(model))
+
+
+def test_trusted_applies_defaults_for_missing_fields():
+    data = {k: v for k, v in _note().items() if k not in ("project", "source", "keywords")}
+    data.pop("note_metadata")
+
+    note = trusted(NoteSchema, data)
+
+    assert_same(note, NoteSchema.model_validate(data))
+    assert note.keywords == [] and note.project is None
+
+
+def test_trusted_entity_default_factories_run_per_object():
+    data = {"name": "system.a", "created_at": NOW, "updated_at": NOW}
+    first, second = trusted(Tag, data), trusted(Tag, data)
+
+    assert first.id != second.id
+    assert first.metadata is not second.metadata
+    assert first.model_fields_set == {"name", "created_at", "updated_at"}
+
+
+def test_trusted_copies_containers():
+    data = _note()
+
+    note = trusted(NoteSchema, data)
+    data["note_metadata"]["status"] = "changed"
+
+    assert note.note_metadata["status"] == "draft"
+
+
+def test_trusted_skips_field_checks():
+    # Solo para datos de la base de datos: un valor inválido no se rechaza
+    project = trusted(ProjectSchema, {**_project(), "name": ""})
+
+    assert project.name == ""
+
+
+def test_trusted_entities_stay_frozen():
+    tag = trusted(Tag, _entity(name="system.a"))
+
+    with pytest.raises(ValidationError):
+        tag.name = "system.b"
+
+
+def test_compiling_trusted_validator_keeps_normal_validation():
+    trusted_validator(NoteSchema)
+
+    assert NoteSchema.__pydantic_complete__ and ProjectSchema.__pydantic_complete__
+    with pytest.raises(ValidationError):
+        ProjectSchema.model_validate({**_project(), "name": ""})
+
+
+def test_trusted_validator_is_compiled_once():
+    assert trusted_validator(NoteSchema) is trusted_validator(NoteSchema)
+
+
+def test_repository_models_are_compiled_on_import():
+    misses = trusted_validator.cache_info().misses
+
+    for model in REPOSITORY_MODELS:
+        trusted_validator(model)
+
+    assert trusted_validator.cache_info().misses == misses
+
+
+def test_pydantic_core_reuses_the_validator_of_complete_models():
+    # Comportamiento de pydantic-core por el que se marcan las clases como incompletas al
+    # compilar: si deja de reutilizar el validador de la clase, la marca sobra
+    validator = SchemaValidator(_model_schema(ProjectSchema))
+
+    with pytest.raises(ValidationError):
+        validator.validate_python({**_project(), "name": ""})
+
+
+def test_trusted_validator_compiles_under_the_lock(monkeypatch):
+    class Child(BaseModel):
+        name: str
+
+    class Parent(BaseModel):
+        child: Child
+
+    seen = []
+
+    def compile_validator(schema):
+        seen.append((hydration._COMPILE_LOCK.locked(), Child.__pydantic_complete__))
+        return SchemaValidator(schema)
+
+    monkeypatch.setattr(hydration, "SchemaValidator", compile_validator)
+    trusted_validator(Parent)
+
+    # Marcada como incompleta solo mientras se compila, con el candado tomado
+    assert seen == [(True, False)]
+    assert Child.__pydantic_complete__
@@ -0,0 +1,129 @@
+import logging
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+
+from src.pkm_app.core.application.operations import operation_scope
+from src.pkm_app.infrastructure.config.settings import Settings
+from src.pkm_app.infrastructure.persistence.sqlalchemy.engine import create_sync_db_engine
+from src.pkm_app.infrastructure.persistence.sqlalchemy.instrumentation import (
+    assert_max_queries,
+    instrument_queries,
+    query_stats,
+    statement_shape,
+    track_queries,
+)
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    instrument_queries(engine)
+    with engine.begin() as connection:
+        connection.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)"))
+        connection.execute(
+            text("INSERT INTO items (id, name) VALUES (:id, :name)"),
+            [{"id": i, "name": f"item {i}"} for i in range(10)],
+        )
+    yield engine
+    engine.dispose()
+
+
+def _get_item(connection, item_id: int):
+    return connection.execute(text("SELECT name FROM items WHERE id = :id"), {"id": item_id})
+
+
+def test_statement_shape_normalizes_parameters_and_in_lists():
+    asyncpg = "SELECT *  FROM notes\n WHERE id IN ($1::UUID, $2::UUID) AND user_id = $3"
+    assert statement_shape(asyncpg) == "SELECT * FROM notes WHERE id IN (...) AND user_id = ?"
+    assert statement_shape("SELECT * FROM notes WHERE id IN ($1) AND user_id = $2") == (
+        statement_shape(asyncpg)
+    )
+    assert statement_shape("SELECT x::text FROM t WHERE a = :a AND b = %(b)s") == (
+        "SELECT x::text FROM t WHERE a = ? AND b = ?"
+    )
+
+
+def test_track_queries_counts_statements_and_time(engine):
+    with track_queries("listing") as stats, engine.connect() as connection:
+        connection.execute(text("SELECT id FROM items")).all()
+        _get_item(connection, 1).all()
+
+    assert stats.operation == "listing"
+    assert stats.statements == 2
+    assert stats.db_time > 0
+    # sqlite no informa rowcount en los SELECT (asyncpg sí: ver test_query_budgets.py)
+    assert stats.rows == 0
+    assert not stats.n_plus_one_suspects()
+
+
+def test_statements_outside_an_operation_are_not_recorded(engine):
+    with engine.connect() as connection:
+        _get_item(connection, 1).all()
+    assert query_stats() is None
+
+
+def test_repeated_statement_shape_is_an_n_plus_one_suspect(engine, caplog):
+    caplog.set_level(logging.WARNING)
+    with track_queries("per_item") as stats, engine.connect() as connection:
+        for item_id in range(4):
+            _get_item(connection, item_id).all()
+
+    assert stats.n_plus_one_suspects() == {"SELECT name FROM items WHERE id = ?": 4}
+    assert "[N+1?]" in stats.report()
+    assert "Posible N+1 en per_item" in caplog.text
+
+
+def test_failed_statements_leave_no_state_on_the_connection(engine):
+    with track_queries("failing") as stats, engine.connect() as connection:
+        info = dict(connection.info)
+        for _ in range(3):
+            with pytest.raises(OperationalError):
+                connection.execute(text("SELECT missing FROM items"))
+        assert connection.info == info
+        _get_item(connection, 1).all()
+
+    # Solo cuenta la sentencia que terminó
+    assert stats.statements == 1
+
+
+def test_nested_operations_count_for_every_enclosing_operation(engine):
+    with track_queries("outer") as outer, engine.connect() as connection:
+        _get_item(connection, 1).all()
+        with operation_scope("inner"):
+            _get_item(connection, 2).all()
+            inner = query_stats()
+    assert inner is not None and inner.statements == 1
+    assert outer.statements == 2
+
+
+def test_assert_max_queries(engine):
+    with assert_max_queries(2), engine.connect() as connection:
+        _get_item(connection, 1).all()
+        _get_item(connection, 2).all()
+
+    with pytest.raises(AssertionError, match="como máximo 1 sentencias SQL .* 3") as excinfo:
+        with assert_max_queries(1), engine.connect() as connection:
+            for item_id in range(3):
+                _get_item(connection, item_id).all()
+    assert "3× SELECT name FROM items WHERE id = ?  [N+1?]" in str(excinfo.value)
+
+
+def test_engine_factory_instruments_queries(tmp_path):
+    engine = create_sync_db_engine(
+        f"sqlite:///{tmp_path / 'instrumented.db'}", Settings(_env_file=None)
+    )
+    try:
+        with track_queries() as stats, engine.connect() as connection:
+            connection.execute(text("SELECT 1")).all()
+        assert stats.statements == 1
+    finally:
+        engine.dispose()
+
+
+def test_instrument_queries_is_idempotent(engine):
+    instrument_queries(engine)
+    with track_queries() as stats, engine.connect() as connection:
+        _get_item(connection, 1).all()
+    assert stats.statements == 1
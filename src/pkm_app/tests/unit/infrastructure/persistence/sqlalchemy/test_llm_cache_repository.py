@@ -0,0 +1,54 @@
+from unittest import mock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.pkm_app.core.application.dtos import LLMResponse
+from src.pkm_app.infrastructure.persistence.sqlalchemy.repositories.llm_cache_repository import (
+    PUT_MANY,
+    SQLAlchemyLLMResponseCacheRepository,
+)
+
+KEY = b"k" * 32
+
+
+def test_put_keeps_the_response_already_stored():
+    sql = str(PUT_MANY.compile(dialect=postgresql.dialect()))
+
+    assert sql.endswith("ON CONFLICT (cache_key) DO NOTHING")
+
+
+@pytest.mark.asyncio
+async def test_empty_requests_do_not_reach_the_database():
+    session = mock.AsyncMock(spec=AsyncSession)
+    repo = SQLAlchemyLLMResponseCacheRepository(session)
+
+    assert await repo.get_many([]) == {}
+    await repo.put_many("fake", {})
+
+    session.execute.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_responses_round_trip_marked_as_cached():
+    session = mock.AsyncMock(spec=AsyncSession)
+    repo = SQLAlchemyLLMResponseCacheRepository(session)
+    response = LLMResponse(text="Hola", model="modelo", input_tokens=3, output_tokens=1)
+
+    await repo.put_many("fake", {KEY: response})
+    rows = session.execute.await_args.args[1]
+    session.execute.return_value = [(KEY, "modelo", "Hola", 3, 1)]
+    stored = await repo.get_many([KEY])
+
+    assert rows == [
+        {
+            "cache_key": KEY,
+            "provider": "fake",
+            "model": "modelo",
+            "text": "Hola",
+            "input_tokens": 3,
+            "output_tokens": 1,
+        }
+    ]
+    assert stored == {KEY: response.model_copy(update={"cached": True})}
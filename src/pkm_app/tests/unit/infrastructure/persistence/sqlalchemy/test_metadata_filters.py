@@ -0,0 +1,98 @@
+import importlib.util
+from pathlib import Path
+
+from sqlalchemy import and_, select
+from sqlalchemy.dialects import postgresql
+
+from src.pkm_app.core.application.dtos.metadata_filter_dto import MetadataFilter
+from src.pkm_app.infrastructure.persistence import migrations
+from src.pkm_app.infrastructure.persistence.sqlalchemy.models import Note as NoteModel
+from src.pkm_app.infrastructure.persistence.sqlalchemy.models import Source as SourceModel
+from src.pkm_app.infrastructure.persistence.sqlalchemy.repositories.metadata_filters import (
+    HOT_METADATA_KEYS,
+    build_metadata_conditions,
+    split_metadata_path,
+)
+
+
+def _compile(metadata_filter: MetadataFilter) -> tuple[str, dict]:
+    conditions = build_metadata_conditions(NoteModel.note_metadata, metadata_filter)
+    stmt = select(NoteModel.id).where(and_(*conditions))
+    compiled = stmt.compile(dialect=postgresql.asyncpg.dialect())
+    return str(compiled), compiled.params
+
+
+def test_split_metadata_path():
+    assert split_metadata_path("source.author") == ["source", "author"]
+    assert split_metadata_path("status") == ["status"]
+
+
+def test_empty_filter_builds_no_conditions():
+    assert build_metadata_conditions(NoteModel.note_metadata, MetadataFilter()) == []
+
+
+def test_contains_uses_containment_operator():
+    sql, params = _compile(MetadataFilter(contains={"status": "draft"}))
+    assert "notes.note_metadata @>" in sql
+    assert {"status": "draft"} in params.values()
+
+
+def test_has_keys_checks_path_is_not_null():
+    sql, _ = _compile(MetadataFilter(has_keys=["reviewed", "source.author"]))
+    assert sql.count("notes.note_metadata #>") == 2
+    assert sql.count("IS NOT NULL") == 2
+
+
+def test_path_equals_combines_containment_and_exact_equality():
+    sql, params = _compile(MetadataFilter(path_equals={"source.author": "Ada"}))
+    assert "notes.note_metadata @>" in sql
+    assert "notes.note_metadata #>" in sql
+    assert {"source": {"author": "Ada"}} in params.values()
+    assert "Ada" in params.values()
+
+
+def test_paths_are_rendered_as_literals_for_index_matching():
+    conditions = build_metadata_conditions(
+        NoteModel.note_metadata, MetadataFilter(has_keys=["source.author"])
+    )
+    compiled = (
+        select(NoteModel.id)
+        .where(*conditions)
+        .compile(dialect=postgresql.dialect(), compile_kwargs={"render_postcompile": True})
+    )
+    assert "ARRAY['source', 'author']" in str(compiled)
+
+
+def _hot_keys_migration():
+    versions = Path(migrations.__file__).parent / "versions"
+    spec = importlib.util.spec_from_file_location(
+        "hot_keys_migration", versions / "c340362ea40a_add_jsonb_metadata_indexes.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_hot_keys_match_the_indexes_of_their_migration():
+    migration = _hot_keys_migration()
+    assert {table: tuple(keys) for table, keys in migration.HOT_KEYS.items()} == HOT_METADATA_KEYS
+
+    columns = {
+        ("notes", "note_metadata"): NoteModel.note_metadata,
+        ("sources", "link_metadata"): SourceModel.link_metadata,
+    }
+    for (table, column), keys in HOT_METADATA_KEYS.items():
+        for key_path in keys:
+            # La ruta que genera el filtro es la de la expresión del índice
+            conditions = build_metadata_conditions(
+                columns[table, column], MetadataFilter(has_keys=[key_path])
+            )
+            compiled = str(
+                select(columns[table, column])
+                .where(*conditions)
+                .compile(dialect=postgresql.dialect(), compile_kwargs={"render_postcompile": True})
+            )
+            segments = split_metadata_path(key_path)
+            assert "ARRAY[" + ", ".join(f"'{s}'" for s in segments) + "]" in compiled
+            indexed = ",".join(f'"{s}"' for s in segments)
+            assert migration._text_array_literal(key_path) == "'{" + indexed + "}'"
@@ -0,0 +1,85 @@
+import uuid
+from unittest import mock
+
+import numpy as np
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.pkm_app.core.application.minhash import (
+    BANDS,
+    NUM_PERM,
+    SIGNATURE_DTYPE,
+    band_keys,
+)
+from src.pkm_app.infrastructure.persistence.sqlalchemy.repositories.minhash_repository import (
+    FIND_CANDIDATE_BUCKETS,
+    FIND_CANDIDATES,
+    SAVE_SIGNATURES,
+    SQLAlchemyNearDuplicateRepository,
+)
+
+USER_ID = "user-1"
+
+
+def _sql(statement) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+def test_save_replaces_the_previous_signature():
+    assert "ON CONFLICT (note_id) DO UPDATE" in _sql(SAVE_SIGNATURES)
+
+
+def test_candidates_are_looked_up_by_overlapping_band_keys_of_the_same_user():
+    sql = _sql(FIND_CANDIDATES)
+
+    assert "candidate.band_keys && query.band_keys" in sql
+    assert "candidate.user_id = query.user_id" in sql
+    assert "candidate.note_id != query.note_id" in sql
+
+
+def test_buckets_group_notes_by_band_key():
+    sql = _sql(FIND_CANDIDATE_BUCKETS)
+
+    assert "unnest(note_minhash.band_keys)" in sql
+    assert "HAVING count(*) > " in sql
+
+
+@pytest.mark.asyncio
+async def test_signatures_are_stored_with_their_band_keys():
+    session = mock.AsyncMock(spec=AsyncSession)
+    repo = SQLAlchemyNearDuplicateRepository(session)
+    note_id, empty_id = uuid.uuid4(), uuid.uuid4()
+    signature = np.arange(NUM_PERM, dtype=np.int64)
+
+    await repo.save_signatures(USER_ID, {note_id: signature, empty_id: None})
+
+    rows = session.execute.await_args.args[1]
+    assert rows[0]["signature"] == signature.astype(SIGNATURE_DTYPE).tobytes()
+    assert rows[0]["band_keys"] == band_keys(USER_ID, signature.astype(SIGNATURE_DTYPE)).tolist()
+    assert len(rows[0]["band_keys"]) == BANDS
+    assert rows[1] == {"note_id": empty_id, "user_id": USER_ID, "signature": None, "band_keys": []}
+
+
+@pytest.mark.asyncio
+async def test_signatures_are_read_back_as_uint32_arrays():
+    session = mock.AsyncMock(spec=AsyncSession)
+    note_id = uuid.uuid4()
+    signature = np.arange(NUM_PERM, dtype=SIGNATURE_DTYPE)
+    session.execute.return_value = [(note_id, signature.tobytes())]
+    repo = SQLAlchemyNearDuplicateRepository(session)
+
+    signatures = await repo.get_signatures(USER_ID, [note_id])
+
+    np.testing.assert_array_equal(signatures[note_id], signature)
+
+
+@pytest.mark.asyncio
+async def test_empty_requests_do_not_reach_the_database():
+    session = mock.AsyncMock(spec=AsyncSession)
+    repo = SQLAlchemyNearDuplicateRepository(session)
+
+    assert await repo.get_signatures(USER_ID, []) == {}
+    await repo.save_signatures(USER_ID, {})
+
+    session.execute.assert_not_awaited()
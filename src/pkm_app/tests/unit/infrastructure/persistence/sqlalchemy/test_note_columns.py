@@ -0,0 +1,118 @@
+import uuid
+from datetime import UTC, datetime
+from unittest import mock
+
+import numpy as np
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.pkm_app.core.application.dtos import NoteColumns
+from src.pkm_app.infrastructure.persistence.sqlalchemy.repositories.note_columns import (
+    NOTE_COLUMNS_QUERY,
+    note_columns_from_rows,
+    stream_note_columns,
+)
+from src.pkm_app.infrastructure.persistence.sqlalchemy.repositories.note_repository import (
+    SQLAlchemyNoteRepository,
+)
+
+CREATED = datetime(2025, 1, 1, tzinfo=UTC)
+UPDATED = datetime(2025, 1, 2, 12, 30, tzinfo=UTC)
+
+
+def _micros(value: datetime) -> int:
+    return int(value.timestamp() * 1_000_000)
+
+
+def _row(note_id: uuid.UUID, project_id: uuid.UUID | None, note_type: str | None) -> tuple:
+    # Mismo formato que NOTE_COLUMNS_QUERY: uuid_send(...) y microsegundos desde la época
+    return (
+        note_id.bytes,
+        project_id.bytes if project_id else None,
+        note_type,
+        _micros(CREATED),
+        _micros(UPDATED),
+    )
+
+
+def test_query_converts_columns_in_postgres():
+    sql = str(NOTE_COLUMNS_QUERY.compile(dialect=postgresql.dialect()))
+
+    assert "uuid_send(notes.id)" in sql and "uuid_send(notes.project_id)" in sql
+    assert "EXTRACT(epoch FROM notes.created_at)" in sql
+    assert "notes.user_id = %(user_id)s" in sql
+
+
+def test_note_columns_from_rows():
+    ids = [uuid.uuid4() for _ in range(3)]
+    project_id = uuid.uuid4()
+    rows = [_row(ids[0], project_id, "markdown"), _row(ids[1], None, None), _row(ids[2], None, "code")]
+
+    columns = note_columns_from_rows(rows, {})
+
+    assert isinstance(columns, NoteColumns) and len(columns) == 3
+    assert [columns.note_id(i) for i in range(3)] == ids
+    assert [columns.project_id(i) for i in range(3)] == [project_id, None, None]
+    assert [columns.note_type(i) for i in range(3)] == ["markdown", None, "code"]
+    assert columns.type_categories == ("markdown", "code")
+    assert columns.created_at[0] == np.datetime64("2025-01-01T00:00:00", "us")
+    assert columns.updated_at[2] == np.datetime64("2025-01-02T12:30:00", "us")
+    assert columns.has_project().tolist() == [True, False, False]
+    assert columns.type_mask("code").tolist() == [False, False, True]
+    assert columns.type_mask(None).tolist() == [False, True, False]
+    assert not columns.type_mask("mixed").any()
+    assert columns.position(ids[2]) == 2 and columns.position(uuid.uuid4()) is None
+    # 16 + 16 bytes de UUID, 2 del tipo y 8 + 8 de las fechas por nota
+    assert columns.nbytes == 3 * 50
+
+
+def test_type_codes_are_stable_across_batches():
+    type_codes: dict[str, int] = {}
+    first = note_columns_from_rows([_row(uuid.uuid4(), None, "text")], type_codes)
+    second = note_columns_from_rows(
+        [_row(uuid.uuid4(), None, "code"), _row(uuid.uuid4(), None, "text")], type_codes
+    )
+
+    assert first.type_categories == ("text",)
+    assert second.type_categories == ("text", "code")
+    assert second.type_codes.tolist() == [1, first.type_codes[0]]
+
+
+def test_note_columns_from_empty_rows():
+    columns = note_columns_from_rows([], {})
+
+    assert len(columns) == 0 and columns.nbytes == 0
+
+
+class _FakeStreamResult:
+    def __init__(self, partitions):
+        self._partitions = partitions
+        self.close = mock.AsyncMock()
+
+    async def partitions(self):
+        for partition in self._partitions:
+            yield partition
+
+
+@pytest.mark.asyncio
+async def test_stream_columns_yields_one_batch_per_partition():
+    session = mock.AsyncMock(spec=AsyncSession)
+    result = _FakeStreamResult(
+        [[_row(uuid.uuid4(), None, "text")] * 2, [_row(uuid.uuid4(), None, "code")]]
+    )
+    session.stream.return_value = result
+
+    batches = [b async for b in SQLAlchemyNoteRepository(session).stream_columns("u", 2)]
+
+    assert [len(batch) for batch in batches] == [2, 1]
+    stmt, params = session.stream.await_args.args
+    assert stmt.get_execution_options()["yield_per"] == 2
+    assert params == {"user_id": "u"}
+    result.close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_stream_columns_rejects_invalid_batch_size():
+    with pytest.raises(ValueError):
+        await anext(stream_note_columns(mock.AsyncMock(spec=AsyncSession), "u", 0))
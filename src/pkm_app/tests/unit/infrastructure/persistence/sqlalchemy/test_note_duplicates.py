@@ -0,0 +1,30 @@
+import uuid
+from unittest import mock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.pkm_app.infrastructure.persistence.sqlalchemy.repositories.note_repository import (
+    SQLAlchemyNoteRepository,
+)
+
+
+@pytest.mark.asyncio
+async def test_find_exact_duplicates_groups_by_hash_without_reading_text():
+    oldest, newest = uuid.uuid4(), uuid.uuid4()
+    session = mock.AsyncMock(spec=AsyncSession)
+    result = mock.Mock()
+    result.mappings.return_value = [{"content_hash": "ab" * 32, "note_ids": [oldest, newest]}]
+    session.execute.return_value = result
+
+    [group] = await SQLAlchemyNoteRepository(session).find_exact_duplicates("user_1", limit=5)
+
+    assert group.content_hash == "ab" * 32
+    assert group.note_ids == [oldest, newest]
+    stmt = session.execute.await_args.args[0]
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+    assert "notes.content" not in sql.replace("notes.content_hash", "")
+    assert "array_agg(notes.id ORDER BY notes.created_at, notes.id)" in sql
+    assert "GROUP BY notes.content_hash \nHAVING count(*) > " in sql
+    assert "notes.content_hash = duplicated.content_hash" in sql
@@ -0,0 +1,131 @@
+import uuid
+from datetime import UTC, datetime
+from unittest import mock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.pkm_app.core.application.dtos import MetadataFilter, NoteSchema
+from src.pkm_app.infrastructure.persistence.sqlalchemy.repositories.note_read_repository import (
+    NOTES,
+    PROJECTS,
+    SOURCES,
+    SQLAlchemyNoteReadRepository,
+    build_note_rows_query,
+    note_from_row,
+)
+
+USER_ID = "user_1"
+NOW = datetime(2025, 1, 1, tzinfo=UTC)
+
+
+def _sql(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+def _row(**overrides):
+    note_id = uuid.uuid4()
+    mapping = {
+        "id": note_id,
+        "user_id": USER_ID,
+        "project_id": None,
+        "source_id": None,
+        "title": "Nota",
+        "content": "Contenido",
+        "type": None,
+        "note_metadata": {"status": "draft"},
+        "created_at": NOW,
+        "updated_at": NOW,
+        "version": 1,
+        **{f"project__{column.name}": None for column in PROJECTS.c},
+        **{f"source__{column.name}": None for column in SOURCES.c},
+        "keyword_ids": None,
+        "keyword_names": None,
+        "keyword_created_at": None,
+        "keyword_versions": None,
+    }
+    mapping.update(overrides)
+    # Mismo orden de columnas que build_note_rows_query
+    return tuple(mapping.values())
+
+
+def test_query_pages_notes_before_aggregating_keywords():
+    sql = _sql(build_note_rows_query(NOTES.c.user_id == USER_ID, skip=10, limit=5))
+
+    assert "array_agg(keywords.name ORDER BY keywords.name)" in sql
+    assert "LEFT OUTER JOIN LATERAL" in sql
+    assert "LEFT OUTER JOIN projects" in sql and "LEFT OUTER JOIN sources" in sql
+    # El LIMIT/OFFSET se aplica en la subconsulta de la página, antes de agregar keywords
+    page_sql = sql[sql.index("FROM (SELECT") : sql.index(") AS page")]
+    assert "LIMIT" in page_sql and "OFFSET" in page_sql
+
+
+def test_note_from_row_without_relations():
+    note = note_from_row(_row())
+
+    assert isinstance(note, NoteSchema)
+    assert note.project is None and note.source is None
+    assert note.keywords == []
+    assert note.note_metadata == {"status": "draft"}
+
+
+def test_note_from_row_with_project_and_keywords():
+    project_id = uuid.uuid4()
+    keyword_ids = [uuid.uuid4(), uuid.uuid4()]
+    row = _row(
+        project_id=project_id,
+        project__id=project_id,
+        project__user_id=USER_ID,
+        project__name="Proyecto",
+        project__created_at=NOW,
+        project__updated_at=NOW,
+        keyword_ids=keyword_ids,
+        keyword_names=["a", "b"],
+        keyword_created_at=[NOW, NOW],
+        keyword_versions=[1, 3],
+    )
+
+    note = note_from_row(row)
+
+    assert note.project.id == project_id and note.project.name == "Proyecto"
+    assert [k.id for k in note.keywords] == keyword_ids
+    assert [k.name for k in note.keywords] == ["a", "b"]
+    assert all(k.user_id == USER_ID for k in note.keywords)
+    assert [k.version for k in note.keywords] == [1, 3]
+
+
+@pytest.fixture
+def session():
+    session = mock.AsyncMock(spec=AsyncSession)
+    session.execute.return_value = [_row()]
+    return session
+
+
+@pytest.mark.asyncio
+async def test_get_by_id_returns_none_when_no_rows(session):
+    session.execute.return_value = []
+    repo = SQLAlchemyNoteReadRepository(session)
+
+    assert await repo.get_by_id(uuid.uuid4(), USER_ID) is None
+
+
+@pytest.mark.asyncio
+async def test_search_by_keyword_names_uses_exists(session):
+    repo = SQLAlchemyNoteReadRepository(session)
+
+    notes = await repo.search_by_keyword_names(["a", "b"], uuid.uuid4(), USER_ID)
+
+    assert len(notes) == 1
+    sql = _sql(session.execute.await_args.args[0])
+    assert "EXISTS (SELECT 1" in sql
+    assert await repo.search_by_keyword_names([], uuid.uuid4(), USER_ID) == []
+
+
+@pytest.mark.asyncio
+async def test_search_by_metadata_applies_filter(session):
+    repo = SQLAlchemyNoteReadRepository(session)
+
+    await repo.search_by_metadata(USER_ID, MetadataFilter(contains={"status": "draft"}))
+
+    assert "notes.note_metadata @>" in _sql(session.execute.await_args.args[0])
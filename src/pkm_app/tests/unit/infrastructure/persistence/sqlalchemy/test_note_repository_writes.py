@@ -0,0 +1,100 @@
+import uuid
+from unittest import mock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.pkm_app.core.application.dtos import NoteCreate, NoteUpdate
+from src.pkm_app.core.domain.errors import ConcurrencyError
+from src.pkm_app.infrastructure.persistence.sqlalchemy.repositories.note_repository import (
+    SQLAlchemyNoteRepository,
+)
+
+USER_ID = "user_1"
+
+
+def _sql(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+def _result(scalar=None, row=None):
+    result = mock.Mock()
+    result.scalar_one_or_none.return_value = scalar
+    result.one.return_value = row
+    result.unique.return_value = result
+    return result
+
+
+@pytest.fixture
+def session():
+    return mock.AsyncMock(spec=AsyncSession)
+
+
+@pytest.mark.asyncio
+async def test_create_validates_references_inside_the_insert(session):
+    project_id, source_id = uuid.uuid4(), uuid.uuid4()
+    session.execute.side_effect = [_result(), _result(row=(0, True, False))]
+    repo = SQLAlchemyNoteRepository(session)
+
+    with pytest.raises(ValueError, match="Fuente con id"):
+        await repo.create(
+            NoteCreate(content="Contenido", project_id=project_id, source_id=source_id), USER_ID
+        )
+
+    insert_sql = _sql(session.execute.await_args_list[0].args[0])
+    assert insert_sql.startswith("INSERT INTO notes")
+    assert "EXISTS (SELECT * \nFROM projects" in insert_sql
+    assert "EXISTS (SELECT * \nFROM sources" in insert_sql
+    assert "RETURNING notes.id" in insert_sql
+
+
+@pytest.mark.asyncio
+async def test_create_missing_project_is_reported_first(session):
+    session.execute.side_effect = [_result(), _result(row=(0, False, False))]
+    repo = SQLAlchemyNoteRepository(session)
+
+    with pytest.raises(ValueError, match="Proyecto con id"):
+        await repo.create(
+            NoteCreate(content="Contenido", project_id=uuid.uuid4(), source_id=uuid.uuid4()),
+            USER_ID,
+        )
+
+
+@pytest.mark.asyncio
+async def test_update_of_missing_note_returns_none(session):
+    session.execute.side_effect = [_result(), _result(row=(None, False, True))]
+    repo = SQLAlchemyNoteRepository(session)
+
+    note = await repo.update(uuid.uuid4(), NoteUpdate(project_id=uuid.uuid4()), USER_ID)
+
+    assert note is None
+    update_sql = _sql(session.execute.await_args_list[0].args[0])
+    assert update_sql.startswith("UPDATE notes SET project_id=")
+    assert "RETURNING notes.id" in update_sql
+
+
+@pytest.mark.asyncio
+async def test_update_with_stale_expected_version_raises_conflict(session):
+    note_id = uuid.uuid4()
+    session.execute.side_effect = [_result(), _result(row=(3, True, True))]
+    repo = SQLAlchemyNoteRepository(session)
+
+    with pytest.raises(ConcurrencyError) as exc_info:
+        await repo.update(note_id, NoteUpdate(title="Nuevo"), USER_ID, expected_version=2)
+
+    assert exc_info.value.context["expected_version"] == 2
+    assert exc_info.value.context["current_version"] == 3
+    update_sql = _sql(session.execute.await_args_list[0].args[0])
+    assert "version=(notes.version + %(version_1)s::INTEGER)" in update_sql
+    assert "AND notes.version = %(version_2)s::INTEGER" in update_sql
+
+
+@pytest.mark.asyncio
+async def test_update_without_changes_only_reads_the_note(session):
+    session.execute.return_value = _result()
+    repo = SQLAlchemyNoteRepository(session)
+
+    assert await repo.update(uuid.uuid4(), NoteUpdate(), USER_ID) is None
+    session.execute.assert_awaited_once()
+    assert _sql(session.execute.await_args.args[0]).startswith("SELECT notes.id")
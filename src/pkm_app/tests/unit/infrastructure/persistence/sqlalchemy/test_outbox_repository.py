@@ -0,0 +1,56 @@
+import uuid
+from unittest import mock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.pkm_app.infrastructure.persistence.sqlalchemy.repositories.outbox_repository import (
+    CLAIM_BATCH,
+    SQLAlchemyOutboxRepository,
+)
+
+
+def test_claim_skips_messages_locked_by_other_relays():
+    sql = str(CLAIM_BATCH.compile(dialect=postgresql.dialect()))
+
+    assert "WHERE note_outbox.available_at <= now() ORDER BY note_outbox.id" in sql
+    assert sql.endswith("FOR UPDATE SKIP LOCKED")
+
+
+@pytest.mark.asyncio
+async def test_empty_requests_do_not_reach_the_database():
+    session = mock.AsyncMock(spec=AsyncSession)
+    repo = SQLAlchemyOutboxRepository(session)
+
+    assert await repo.get_documents([]) == []
+    await repo.complete([])
+    await repo.retry_later([], "error", mock.Mock())
+
+    session.execute.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_get_documents_maps_the_note_id():
+    note_id = uuid.uuid4()
+    session = mock.AsyncMock(spec=AsyncSession)
+    result = mock.Mock()
+    result.mappings.return_value = [
+        {
+            "note_id": note_id,
+            "user_id": "user_1",
+            "project_id": None,
+            "type": "idea",
+            "title": None,
+            "content": "Contenido",
+            "content_hash": bytes(32),
+            "version": 3,
+            "updated_at": mock.sentinel.updated_at,
+        }
+    ]
+    session.execute.return_value = result
+
+    [document] = await SQLAlchemyOutboxRepository(session).get_documents([note_id])
+
+    assert document.note_id == note_id
+    assert document.version == 3
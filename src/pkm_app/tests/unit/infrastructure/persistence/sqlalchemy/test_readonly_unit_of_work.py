@@ -0,0 +1,80 @@
+from unittest import mock
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.pkm_app.infrastructure.persistence.sqlalchemy.repositories.note_repository import (
+    SQLAlchemyNoteRepository,
+)
+from src.pkm_app.infrastructure.persistence.sqlalchemy.unit_of_work import (
+    SQLAlchemyReadOnlyUnitOfWork,
+)
+
+
+@pytest.fixture
+def mock_session():
+    session = mock.AsyncMock(spec=AsyncSession)
+    return session
+
+
+@pytest.fixture
+def session_factory(mock_session):
+    return mock.Mock(return_value=mock_session)
+
+
+@pytest.mark.asyncio
+async def test_enter_does_not_begin_transaction(session_factory, mock_session):
+    async with SQLAlchemyReadOnlyUnitOfWork(session_factory) as uow:
+        assert uow._session is mock_session
+
+    session_factory.assert_called_once()
+    mock_session.begin.assert_not_called()
+    mock_session.flush.assert_not_called()
+    mock_session.close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_repositories_are_created_lazily_and_cached(session_factory):
+    async with SQLAlchemyReadOnlyUnitOfWork(session_factory) as uow:
+        assert uow._repositories == {}
+        notes = uow.notes
+        assert isinstance(notes, SQLAlchemyNoteRepository)
+        assert uow.notes is notes
+        assert list(uow._repositories) == ["notes"]
+
+    assert uow._repositories == {}
+
+
+@pytest.mark.asyncio
+async def test_repository_access_outside_context_raises():
+    uow = SQLAlchemyReadOnlyUnitOfWork(mock.Mock())
+    with pytest.raises(RuntimeError, match="Session no inicializada"):
+        _ = uow.notes
+
+
+@pytest.mark.asyncio
+async def test_commit_is_noop_and_rollback_releases_connection(session_factory, mock_session):
+    async with SQLAlchemyReadOnlyUnitOfWork(session_factory) as uow:
+        await uow.commit()
+        await uow.rollback()
+
+    mock_session.commit.assert_not_called()
+    mock_session.rollback.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_external_session_is_not_closed_or_rolled_back(mock_session):
+    async with SQLAlchemyReadOnlyUnitOfWork(mock_session) as uow:
+        await uow.rollback()
+
+    mock_session.rollback.assert_not_called()
+    mock_session.close.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_session_closed_when_body_raises(session_factory, mock_session):
+    with pytest.raises(ValueError):
+        async with SQLAlchemyReadOnlyUnitOfWork(session_factory):
+            raise ValueError("boom")
+
+    mock_session.close.assert_awaited_once()
@@ -0,0 +1,159 @@
+from unittest import mock
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.pkm_app.infrastructure.config.settings import Settings
+from src.pkm_app.infrastructure.persistence.sqlalchemy.engine import (
+    create_async_db_engine,
+    get_pool_metrics,
+)
+from src.pkm_app.infrastructure.persistence.sqlalchemy.replicas import ReplicaRouter
+from src.pkm_app.infrastructure.persistence.sqlalchemy.unit_of_work import (
+    SQLAlchemyReadOnlyUnitOfWork,
+    SQLAlchemyUnitOfWork,
+)
+
+SETTINGS = Settings(_env_file=None)
+
+
+def _engine(host: str):
+    # Engines reales que nunca llegan a conectar: sirven de sustituto de cada servidor
+    return create_async_db_engine(f"postgresql+asyncpg://u:p@{host}:5432/db", SETTINGS)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeProbe:
+    """Sustituto del chequeo de salud: retraso por host, o excepción si el host está caído."""
+
+    def __init__(self, **lags):
+        self.lags = lags
+
+    async def __call__(self, engine) -> float:
+        lag = self.lags[engine.url.host]
+        if isinstance(lag, Exception):
+            raise lag
+        return lag
+
+
+@pytest.fixture
+def engines():
+    return _engine("primary"), _engine("replica1"), _engine("replica2")
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def _router(engines, clock, probe=None, **kwargs) -> ReplicaRouter:
+    primary, *replicas = engines
+    return ReplicaRouter(primary, replicas, clock=clock, probe=probe or FakeProbe(), **kwargs)
+
+
+def test_unknown_strategy_raises(engines, clock):
+    with pytest.raises(ValueError, match="Estrategia de réplicas desconocida"):
+        _router(engines, clock, strategy="random")
+
+
+def test_round_robin_alternates_replicas(engines, clock):
+    router = _router(engines, clock)
+    hosts = [router.choose_read_engine("user").url.host for _ in range(4)]
+    assert hosts == ["replica1", "replica2", "replica1", "replica2"]
+
+
+def test_least_connections_uses_pool_metrics(engines, clock):
+    router = _router(engines, clock, strategy="least_connections")
+    get_pool_metrics(engines[1]).checked_out = 3
+    get_pool_metrics(engines[2]).checked_out = 1
+    assert router.choose_read_engine().url.host == "replica2"
+
+    get_pool_metrics(engines[2]).checked_out = 5
+    assert router.choose_read_engine().url.host == "replica1"
+
+    # Empate: se reparte en round-robin
+    get_pool_metrics(engines[2]).checked_out = 3
+    assert {router.choose_read_engine().url.host for _ in range(2)} == {"replica1", "replica2"}
+
+
+def test_read_your_writes_window(engines, clock):
+    router = _router(engines, clock, sticky_seconds=5.0)
+    router.record_write("writer")
+
+    assert router.choose_read_engine("writer") is engines[0]
+    assert router.choose_read_engine("other").url.host.startswith("replica")
+    assert router.choose_read_engine(None).url.host.startswith("replica")
+
+    clock.now += 5.0
+    assert router.choose_read_engine("writer").url.host.startswith("replica")
+
+
+def test_record_write_without_replicas_is_ignored(clock):
+    router = ReplicaRouter(_engine("primary"), [], clock=clock)
+    router.record_write("writer")
+    assert router._last_write == {}
+    assert router.choose_read_engine("writer") is router.primary
+
+
+@pytest.mark.asyncio
+async def test_unhealthy_and_lagging_replicas_are_ejected_and_readmitted(engines, clock):
+    probe = FakeProbe(replica1=OSError("connection refused"), replica2=0.5)
+    router = _router(engines, clock, probe=probe, max_lag_seconds=10.0)
+
+    await router.check_health()
+    assert [r.healthy for r in router.replicas] == [False, True]
+    assert "connection refused" in router.replicas[0].last_error
+    assert {router.choose_read_engine().url.host for _ in range(4)} == {"replica2"}
+
+    probe.lags["replica2"] = 30.0
+    await router.check_health()
+    assert router.healthy_replicas() == []
+    assert router.choose_read_engine() is engines[0]
+
+    probe.lags.update(replica1=0.0, replica2=1.0)
+    await router.check_health()
+    assert [r.healthy for r in router.replicas] == [True, True]
+    assert router.replicas[1].lag_seconds == 1.0
+
+
+def test_read_sessionmaker_is_cached_per_engine(engines, clock):
+    router = _router(engines, clock)
+    first = router.read_sessionmaker()
+    second = router.read_sessionmaker()
+    third = router.read_sessionmaker()
+    assert first.kw["bind"] is engines[1]
+    assert second.kw["bind"] is engines[2]
+    assert third is first
+
+
+@pytest.mark.asyncio
+async def test_unit_of_work_commit_records_write(engines, clock):
+    router = _router(engines, clock)
+    session = mock.AsyncMock(spec=AsyncSession)
+    session.in_transaction = mock.Mock(return_value=False)
+    session.begin = mock.AsyncMock()
+    session.is_active = True
+
+    async with SQLAlchemyUnitOfWork(lambda: session, router=router, user_id="writer") as uow:
+        await uow.commit()
+
+    assert router.is_sticky("writer")
+    assert not router.is_sticky("other")
+
+
+@pytest.mark.asyncio
+async def test_read_only_unit_of_work_routes_through_router(engines, clock):
+    router = _router(engines, clock)
+    router.record_write("writer")
+
+    async with SQLAlchemyReadOnlyUnitOfWork(router=router, user_id="writer") as uow:
+        assert uow._session.bind is engines[0]
+    async with SQLAlchemyReadOnlyUnitOfWork(router=router, user_id="reader") as uow:
+        assert uow._session.bind is engines[1]
@@ -0,0 +1,94 @@
+"""
+Servidor Qdrant mínimo para `httpx.MockTransport`: implementa, con búsqueda exacta, las
+rutas REST que usan `QdrantVectorIndex` y `QdrantNoteIndex` (también colecciones sin vectores,
+como la de lápidas) y guarda las peticiones recibidas.
+"""
+
+import re
+from typing import Any
+
+import httpx
+import numpy as np
+import orjson
+
+_ROUTE = re.compile(r"^/collections/(?P<name>[^/]+)(?P<rest>(/[^/]+)*)$")
+
+
+class FakeQdrant:
+    def __init__(self) -> None:
+        self.collections: dict[str, dict[str, Any]] = {}
+        self.requests: list[httpx.Request] = []
+
+    def transport(self) -> httpx.MockTransport:
+        return httpx.MockTransport(self.handle)
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        match = _ROUTE.match(request.url.path)
+        assert match, request.url.path
+        name, rest = match["name"], match["rest"]
+        body = orjson.loads(request.content) if request.content else {}
+        collection = self.collections.get(name)
+        if rest == "" and request.method == "PUT":
+            size = body["vectors"].get("size")
+            self.collections[name] = {"size": size, "points": {}, "indexes": {}}
+            return _ok(True)
+        if collection is None:
+            return httpx.Response(404, json={"status": {"error": "Not found"}})
+        if rest == "" and request.method == "GET":
+            return _ok({"config": {"params": {"vectors": {"size": collection["size"]}}}})
+        if rest == "" and request.method == "DELETE":
+            del self.collections[name]
+            return _ok(True)
+        if rest == "/index":
+            collection["indexes"][body["field_name"]] = body["field_schema"]
+            return _ok({"status": "completed"})
+        points = collection["points"]
+        if rest == "/points" and request.method == "POST":
+            fields = body["with_payload"]
+            return _ok(
+                [
+                    {"id": point_id, "payload": {k: v for k, v in payload.items() if k in fields}}
+                    for point_id in body["ids"]
+                    if point_id in points
+                    for _, payload in [points[point_id]]
+                ]
+            )
+        if rest == "/points":
+            for point in body["points"]:
+                if collection["size"] is None:
+                    assert point["vector"] == {}, "colección sin vectores"
+                    points[point["id"]] = (None, point["payload"])
+                    continue
+                vector = np.asarray(point["vector"], dtype=np.float32)
+                points[point["id"]] = (vector / np.linalg.norm(vector), point["payload"])
+            return _ok({"status": "completed"})
+        if rest == "/points/delete":
+            for point_id in body["points"]:
+                points.pop(point_id, None)
+            return _ok({"status": "completed"})
+        matching = {
+            point_id: vector
+            for point_id, (vector, payload) in points.items()
+            if all(
+                payload.get(condition["key"]) == condition["match"]["value"]
+                for condition in body["filter"]["must"]
+            )
+        }
+        if rest == "/points/count":
+            return _ok({"count": len(matching)})
+        if rest == "/points/search":
+            query = np.asarray(body["vector"], dtype=np.float32)
+            hits = sorted(
+                (
+                    {"id": point_id, "score": float(vector @ query)}
+                    for point_id, vector in matching.items()
+                ),
+                key=lambda hit: -hit["score"],
+            )
+            return _ok(hits[: body["limit"]])
+        raise AssertionError(f"Ruta no soportada: {request.method} {request.url.path}")
+
+
+def _ok(result: Any) -> httpx.Response:
+    return httpx.Response(200, json={"result": result, "status": "ok", "time": 0.0})
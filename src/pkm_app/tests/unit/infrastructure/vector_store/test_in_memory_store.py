@@ -0,0 +1,62 @@
+import uuid
+from datetime import UTC, datetime
+
+import pytest
+
+from src.pkm_app.core.application.content_hashing import content_hash
+from src.pkm_app.core.application.dtos import (
+    NoteIndexBatch,
+    NoteIndexDocument,
+    NoteIndexTombstone,
+)
+from src.pkm_app.infrastructure.vector_store.in_memory_store import InMemoryVectorStore
+
+NOTE_ID = uuid.uuid4()
+UPDATED_AT = datetime.now(UTC)
+
+
+def _document(version: int, content: str = "Contenido") -> NoteIndexDocument:
+    return NoteIndexDocument(
+        note_id=NOTE_ID,
+        user_id="user_1",
+        content=content,
+        content_hash=content_hash(None, content),
+        version=version,
+        updated_at=UPDATED_AT,
+    )
+
+
+def _tombstone(version: int) -> NoteIndexTombstone:
+    return NoteIndexTombstone(note_id=NOTE_ID, user_id="user_1", version=version)
+
+
+@pytest.mark.asyncio
+async def test_redelivery_is_idempotent():
+    store = InMemoryVectorStore()
+    batch = NoteIndexBatch(upserts=[_document(2)])
+
+    await store.apply(batch)
+    await store.apply(batch)
+
+    assert store.documents == {NOTE_ID: _document(2)}
+
+
+@pytest.mark.asyncio
+async def test_older_versions_do_not_overwrite_newer_ones():
+    store = InMemoryVectorStore()
+
+    await store.apply(NoteIndexBatch(upserts=[_document(3, "nuevo")]))
+    await store.apply(NoteIndexBatch(upserts=[_document(2, "viejo")]))
+
+    assert store.documents[NOTE_ID].content == "nuevo"
+
+
+@pytest.mark.asyncio
+async def test_late_upsert_does_not_resurrect_a_deleted_note():
+    store = InMemoryVectorStore()
+
+    await store.apply(NoteIndexBatch(upserts=[_document(1)]))
+    await store.apply(NoteIndexBatch(deletes=[_tombstone(2)]))
+    await store.apply(NoteIndexBatch(upserts=[_document(2)]))
+
+    assert store.documents == {}
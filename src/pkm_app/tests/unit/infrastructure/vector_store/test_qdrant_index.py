@@ -0,0 +1,176 @@
+import uuid
+from datetime import UTC, datetime
+
+import numpy as np
+import orjson
+import pytest
+
+from src.pkm_app.core.application.content_hashing import content_hash
+from src.pkm_app.core.application.dtos import (
+    NoteIndexBatch,
+    NoteIndexDocument,
+    NoteIndexTombstone,
+    VectorBatch,
+    VectorFilter,
+    VectorPayload,
+)
+from src.pkm_app.core.application.interfaces.embedding_interface import ITextEmbedder
+from src.pkm_app.infrastructure.vector_store.qdrant_index import (
+    PAYLOAD_INDEXES,
+    QdrantNoteIndex,
+    QdrantVectorIndex,
+)
+from src.pkm_app.tests.unit.infrastructure.vector_store.fake_qdrant import FakeQdrant
+
+PROJECT_ID = uuid.uuid4()
+
+
+def _index(server: FakeQdrant, dimension: int = 4, **kwargs) -> QdrantVectorIndex:
+    return QdrantVectorIndex(
+        "http://qdrant:6333", "notes", dimension, transport=server.transport(), **kwargs
+    )
+
+
+def _batch(size: int) -> VectorBatch:
+    return VectorBatch(
+        ids=tuple(uuid.uuid4() for _ in range(size)),
+        vectors=np.ones((size, 4)),
+        payloads=(VectorPayload(user_id="user_1", project_id=PROJECT_ID),) * size,
+    )
+
+
+@pytest.mark.asyncio
+async def test_ensure_collection_creates_collection_and_payload_indexes():
+    server = FakeQdrant()
+    index = _index(server)
+
+    await index.ensure_collection()
+    await index.ensure_collection()
+
+    assert server.collections["notes"]["size"] == 4
+    assert server.collections["notes"]["indexes"] == PAYLOAD_INDEXES
+    created = [
+        r for r in server.requests if r.method == "PUT" and r.url.path == "/collections/notes"
+    ]
+    assert len(created) == 1
+    assert orjson.loads(created[0].content)["vectors"]["distance"] == "Cosine"
+
+
+@pytest.mark.asyncio
+async def test_ensure_collection_rejects_other_dimension():
+    server = FakeQdrant()
+    await _index(server, dimension=8).ensure_collection()
+
+    with pytest.raises(ValueError):
+        await _index(server).ensure_collection()
+
+
+@pytest.mark.asyncio
+async def test_upserts_and_deletes_are_sent_in_batches_and_waited_for():
+    server = FakeQdrant()
+    index = _index(server, batch_size=2)
+    await index.ensure_collection()
+    batch = _batch(5)
+    server.requests.clear()
+
+    await index.upsert(batch)
+    await index.delete(batch.ids)
+
+    upserts = [r for r in server.requests if r.url.path == "/collections/notes/points"]
+    deletes = [r for r in server.requests if r.url.path == "/collections/notes/points/delete"]
+    assert sorted(len(orjson.loads(r.content)["points"]) for r in upserts) == [1, 2, 2]
+    assert sorted(len(orjson.loads(r.content)["points"]) for r in deletes) == [1, 2, 2]
+    assert all(r.url.params["wait"] == "true" for r in upserts + deletes)
+    point = orjson.loads(upserts[0].content)["points"][0]
+    assert point["payload"] == {"user_id": "user_1", "project_id": str(PROJECT_ID)}
+
+
+@pytest.mark.asyncio
+async def test_search_pushes_filter_down_and_sends_api_key():
+    server = FakeQdrant()
+    index = _index(server, api_key="secreto", hnsw_ef=128)
+    await index.ensure_collection()
+
+    await index.search([1, 0, 0, 0], VectorFilter(user_id="user_1", type="idea"), limit=3)
+
+    request = server.requests[-1]
+    body = orjson.loads(request.content)
+    assert request.headers["api-key"] == "secreto"
+    assert body["filter"] == {
+        "must": [
+            {"key": "user_id", "match": {"value": "user_1"}},
+            {"key": "type", "match": {"value": "idea"}},
+        ]
+    }
+    assert body["limit"] == 3 and body["params"] == {"hnsw_ef": 128}
+    assert body["with_payload"] is False
+
+
+class FakeEmbedder(ITextEmbedder):
+    """Vector determinista por texto; guarda los textos de cada llamada."""
+
+    def __init__(self) -> None:
+        self.calls: list[list[str]] = []
+
+    @property
+    def model(self) -> str:
+        return "fake-embedder"
+
+    async def embed(self, texts):
+        self.calls.append(list(texts))
+        return np.array([[len(text), ord(text[0]), 1.0, 1.0] for text in texts], np.float32)
+
+
+def _document(note_id: uuid.UUID, version: int, content: str = "Contenido") -> NoteIndexDocument:
+    return NoteIndexDocument(
+        note_id=note_id,
+        user_id="user_1",
+        project_id=PROJECT_ID,
+        title="Título",
+        content=content,
+        content_hash=content_hash("Título", content),
+        version=version,
+        updated_at=datetime.now(UTC),
+    )
+
+
+async def _note_index(server: FakeQdrant, embedder: ITextEmbedder) -> QdrantNoteIndex:
+    index = QdrantNoteIndex(
+        "http://qdrant:6333", "notes", embedder, 4, transport=server.transport()
+    )
+    await index.ensure_collection()
+    return index
+
+
+@pytest.mark.asyncio
+async def test_note_index_embeds_note_text_and_stores_version():
+    server, embedder = FakeQdrant(), FakeEmbedder()
+    index = await _note_index(server, embedder)
+    note_id = uuid.uuid4()
+
+    await index.apply(NoteIndexBatch(upserts=[_document(note_id, 2)]))
+    await index.apply(NoteIndexBatch(upserts=[_document(note_id, 2)]))
+    await index.apply(NoteIndexBatch(upserts=[_document(note_id, 1, "Anterior")]))
+
+    assert embedder.calls == [["Título\n\nContenido"]]
+    _, payload = server.collections["notes"]["points"][str(note_id)]
+    assert payload == {"user_id": "user_1", "project_id": str(PROJECT_ID), "version": 2}
+    assert server.collections["notes_tombstones"]["size"] is None
+
+
+@pytest.mark.asyncio
+async def test_note_index_tombstone_survives_late_upserts():
+    server, embedder = FakeQdrant(), FakeEmbedder()
+    index = await _note_index(server, embedder)
+    note_id = uuid.uuid4()
+    await index.apply(NoteIndexBatch(upserts=[_document(note_id, 2)]))
+
+    tombstone = NoteIndexTombstone(note_id=note_id, user_id="user_1", version=3)
+    await index.apply(NoteIndexBatch(deletes=[tombstone]))
+    # Un relay que leyó la nota antes del borrado la entrega después
+    await index.apply(NoteIndexBatch(upserts=[_document(note_id, 3)]))
+
+    assert str(note_id) not in server.collections["notes"]["points"]
+    assert server.collections["notes_tombstones"]["points"][str(note_id)][1]["version"] == 3
+    assert await index.count(VectorFilter(user_id="user_1")) == 0
+    assert len(embedder.calls) == 1
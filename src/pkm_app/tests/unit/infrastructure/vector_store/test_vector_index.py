@@ -0,0 +1,189 @@
+"""
+Contrato común de `IVectorIndex`: las mismas pruebas contra el índice NumPy, contra
+`QdrantVectorIndex` sobre un Qdrant simulado y, si QDRANT_TEST_URL apunta a un servidor,
+contra un Qdrant real (en una colección temporal).
+"""
+
+import os
+import uuid
+from collections.abc import AsyncIterator
+
+import numpy as np
+import pytest
+import pytest_asyncio
+
+from src.pkm_app.core.application.dtos import VectorBatch, VectorFilter, VectorPayload
+from src.pkm_app.core.application.interfaces.vector_index_interface import IVectorIndex
+from src.pkm_app.infrastructure.vector_store.numpy_index import NumpyVectorIndex
+from src.pkm_app.infrastructure.vector_store.qdrant_index import QdrantVectorIndex
+from src.pkm_app.tests.unit.infrastructure.vector_store.fake_qdrant import FakeQdrant
+
+DIMENSION = 8
+PROJECT_A = uuid.uuid4()
+PROJECT_B = uuid.uuid4()
+QDRANT_TEST_URL = os.getenv("QDRANT_TEST_URL")
+
+
+@pytest_asyncio.fixture(
+    params=[
+        "numpy",
+        "qdrant_fake",
+        pytest.param(
+            "qdrant_server",
+            marks=pytest.mark.skipif(not QDRANT_TEST_URL, reason="QDRANT_TEST_URL no definido"),
+        ),
+    ]
+)
+async def index(request) -> AsyncIterator[IVectorIndex]:
+    if request.param == "numpy":
+        yield NumpyVectorIndex(DIMENSION)
+        return
+    qdrant = QdrantVectorIndex(
+        QDRANT_TEST_URL or "http://qdrant",
+        f"test_{uuid.uuid4().hex}",
+        DIMENSION,
+        batch_size=64,
+        transport=FakeQdrant().transport() if request.param == "qdrant_fake" else None,
+    )
+    await qdrant.ensure_collection()
+    try:
+        yield qdrant
+    finally:
+        await qdrant.delete_collection()
+        await qdrant.close()
+
+
+def _batch(
+    vectors: np.ndarray,
+    user_id: str = "user_1",
+    project_id: uuid.UUID | None = None,
+    type: str | None = None,
+) -> VectorBatch:
+    return VectorBatch(
+        ids=tuple(uuid.uuid4() for _ in range(len(vectors))),
+        vectors=vectors,
+        payloads=(VectorPayload(user_id=user_id, project_id=project_id, type=type),)
+        * len(vectors),
+    )
+
+
+def _exact_ids(batch: VectorBatch, query: np.ndarray, limit: int) -> list[uuid.UUID]:
+    vectors = batch.vectors / np.linalg.norm(batch.vectors, axis=1, keepdims=True)
+    scores = vectors @ (query / np.linalg.norm(query))
+    return [batch.ids[row] for row in np.argsort(-scores)[:limit]]
+
+
+@pytest.mark.asyncio
+async def test_search_returns_nearest_by_cosine_similarity(index):
+    rng = np.random.default_rng(1)
+    batch = _batch(rng.normal(size=(200, DIMENSION)))
+    await index.upsert(batch)
+    query = rng.normal(size=DIMENSION)
+
+    hits = await index.search(query, VectorFilter(user_id="user_1"), limit=5)
+
+    assert [hit.id for hit in hits] == _exact_ids(batch, query, 5)
+    scores = [hit.score for hit in hits]
+    assert scores == sorted(scores, reverse=True) and -1 <= scores[-1] <= scores[0] <= 1
+
+
+@pytest.mark.asyncio
+async def test_filters_are_applied_before_taking_the_limit(index):
+    rng = np.random.default_rng(2)
+    query = np.ones(DIMENSION)
+    # Los vectores de otros usuarios/proyectos/tipos están más cerca de la consulta
+    close = rng.normal(query, 0.01, size=(30, DIMENSION))
+    far = rng.normal(size=(10, DIMENSION))
+    await index.upsert(_batch(close, user_id="user_2", project_id=PROJECT_A, type="idea"))
+    await index.upsert(_batch(close, user_id="user_1", project_id=PROJECT_B, type="idea"))
+    await index.upsert(_batch(close, user_id="user_1", project_id=PROJECT_A, type="task"))
+    target = _batch(far, user_id="user_1", project_id=PROJECT_A, type="idea")
+    await index.upsert(target)
+
+    hits = await index.search(
+        query, VectorFilter(user_id="user_1", project_id=PROJECT_A, type="idea"), limit=5
+    )
+
+    assert [hit.id for hit in hits] == _exact_ids(target, query, 5)
+    assert await index.count(VectorFilter(user_id="user_1")) == 70
+    assert await index.count(VectorFilter(user_id="user_1", project_id=PROJECT_A)) == 40
+    assert await index.count(VectorFilter(user_id="user_1", type="idea")) == 40
+    assert await index.count(VectorFilter(user_id="user_3")) == 0
+    assert await index.search(query, VectorFilter(user_id="user_3")) == []
+
+
+@pytest.mark.asyncio
+async def test_upsert_replaces_vector_and_payload(index):
+    batch = _batch(np.eye(DIMENSION)[:2], project_id=PROJECT_A)
+    await index.upsert(batch)
+
+    moved = VectorBatch(
+        ids=batch.ids[:1],
+        vectors=-np.eye(DIMENSION)[:1],
+        payloads=(VectorPayload(user_id="user_1", project_id=PROJECT_B),),
+    )
+    await index.upsert(moved)
+
+    assert await index.count(VectorFilter(user_id="user_1")) == 2
+    hits = await index.search(np.eye(DIMENSION)[0], VectorFilter(user_id="user_1"), limit=2)
+    assert hits[-1].id == batch.ids[0] and hits[-1].score == pytest.approx(-1, abs=1e-5)
+    hits = await index.search(
+        np.ones(DIMENSION), VectorFilter(user_id="user_1", project_id=PROJECT_B)
+    )
+    assert [hit.id for hit in hits] == [batch.ids[0]]
+
+
+@pytest.mark.asyncio
+async def test_delete_removes_points_and_ignores_unknown_ids(index):
+    rng = np.random.default_rng(3)
+    batch = _batch(rng.normal(size=(300, DIMENSION)))
+    await index.upsert(batch)
+
+    await index.delete([*batch.ids[:250], uuid.uuid4()])
+    await index.delete([])
+
+    assert await index.count(VectorFilter(user_id="user_1")) == 50
+    query = rng.normal(size=DIMENSION)
+    hits = await index.search(query, VectorFilter(user_id="user_1"), limit=100)
+    remaining = batch.slice(250, len(batch))
+    assert [hit.id for hit in hits] == _exact_ids(remaining, query, 50)
+
+
+@pytest.mark.asyncio
+async def test_invalid_vectors_are_rejected(index):
+    with pytest.raises(ValueError):
+        await index.upsert(_batch(np.ones((2, DIMENSION + 1))))
+    with pytest.raises(ValueError):
+        await index.search(np.ones(DIMENSION + 1), VectorFilter(user_id="user_1"))
+    with pytest.raises(ValueError):
+        await index.search(np.zeros(DIMENSION), VectorFilter(user_id="user_1"))
+    with pytest.raises(ValueError):
+        await index.search(np.ones(DIMENSION), VectorFilter(user_id="user_1"), limit=0)
+
+
+def test_batch_rejects_duplicate_ids_and_zero_vectors():
+    point_id = uuid.uuid4()
+    payload = VectorPayload(user_id="user_1")
+    with pytest.raises(ValueError):
+        VectorBatch(ids=(point_id, point_id), vectors=np.ones((2, 3)), payloads=(payload,) * 2)
+    with pytest.raises(ValueError):
+        VectorBatch(ids=(point_id,), vectors=np.zeros((1, 3)), payloads=(payload,))
+    with pytest.raises(ValueError):
+        VectorBatch(ids=(point_id,), vectors=np.ones((2, 3)), payloads=(payload,))
+
+
+@pytest.mark.asyncio
+async def test_numpy_index_grows_and_compacts():
+    index = NumpyVectorIndex(DIMENSION)
+    rng = np.random.default_rng(4)
+    batch = _batch(rng.normal(size=(3 * NumpyVectorIndex.INITIAL_CAPACITY, DIMENSION)))
+    await index.upsert(batch)
+
+    await index.delete(batch.ids[: 2 * NumpyVectorIndex.INITIAL_CAPACITY])
+
+    assert len(index) == NumpyVectorIndex.INITIAL_CAPACITY
+    assert index._size == NumpyVectorIndex.INITIAL_CAPACITY
+    query = rng.normal(size=DIMENSION)
+    remaining = batch.slice(2 * NumpyVectorIndex.INITIAL_CAPACITY, len(batch))
+    hits = await index.search(query, VectorFilter(user_id="user_1"), limit=10)
+    assert [hit.id for hit in hits] == _exact_ids(remaining, query, 10)
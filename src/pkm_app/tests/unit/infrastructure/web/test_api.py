@@ -0,0 +1,335 @@
+import json
+import uuid
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import numpy as np
+import pytest
+import pytest_asyncio
+
+from src.pkm_app.core.application.dtos import (
+    ChangeFeedPage,
+    ContextExcerpts,
+    ContextState,
+    DuplicateNoteGroup,
+    NoteSchema,
+    ProjectSchema,
+    SourceSchema,
+)
+from src.pkm_app.core.application.minhash import NUM_PERM, SIGNATURE_DTYPE
+from src.pkm_app.core.application.versioning import entity_version
+from src.pkm_app.core.domain.errors import NoteNotFoundError
+from src.pkm_app.infrastructure.config.settings import Settings
+from src.pkm_app.infrastructure.web.api.app import create_app
+from src.pkm_app.infrastructure.web.api.dependencies import (
+    get_project_repository,
+    get_read_project_repository,
+    get_read_unit_of_work,
+    get_unit_of_work,
+)
+from src.pkm_app.infrastructure.web.api.responses import stream_json_array
+from src.pkm_app.infrastructure.web.api.server import resolve_workers
+
+HEADERS = {"X-User-ID": "user-1"}
+
+
+def make_note(**overrides) -> NoteSchema:
+    now = datetime.now(UTC)
+    values = {
+        "id": uuid.uuid4(),
+        "user_id": "user-1",
+        "title": "Nota",
+        "content": "Contenido",
+        "created_at": now,
+        "updated_at": now,
+    }
+    values.update(overrides)
+    return NoteSchema(**values)
+
+
+def make_uow():
+    uow = AsyncMock()
+    uow.__aenter__.return_value = uow
+    uow.notes.get_list_stats.return_value = (None, 0, 0)
+    return uow
+
+
+@pytest.fixture
+def uow():
+    return make_uow()
+
+
+@pytest_asyncio.fixture
+async def client(uow):
+    app = create_app(Settings())
+    app.dependency_overrides[get_unit_of_work] = lambda: uow
+    app.dependency_overrides[get_read_unit_of_work] = lambda: uow
+    app.dependency_overrides[get_read_project_repository] = lambda: MagicMock()
+    app.dependency_overrides[get_project_repository] = lambda: MagicMock()
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as http_client:
+        yield http_client
+
+
+@pytest.mark.asyncio
+async def test_get_note_is_serialized_with_orjson(client, uow):
+    note = make_note()
+    uow.notes.get_by_id.return_value = note
+
+    response = await client.get(f"/api/notes/{note.id}", headers=HEADERS)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == json.loads(note.model_dump_json())
+    uow.notes.get_by_id.assert_awaited_once_with(note_id=note.id, user_id="user-1")
+
+
+@pytest.mark.asyncio
+async def test_list_notes_streams_a_json_array(client, uow):
+    notes = [make_note(title=f"Nota {i}") for i in range(3)]
+    uow.notes.list_by_user.return_value = notes
+
+    response = await client.get("/api/notes?skip=5&limit=3", headers=HEADERS)
+
+    assert response.status_code == 200
+    assert [item["title"] for item in response.json()] == ["Nota 0", "Nota 1", "Nota 2"]
+    uow.notes.list_by_user.assert_awaited_once_with(user_id="user-1", skip=5, limit=3)
+
+
+@pytest.mark.asyncio
+async def test_duplicates_route_is_not_taken_for_a_note_id(client, uow):
+    group = DuplicateNoteGroup(content_hash="ab" * 32, note_ids=[uuid.uuid4(), uuid.uuid4()])
+    uow.notes.find_exact_duplicates.return_value = [group]
+
+    response = await client.get("/api/notes/duplicates?limit=5", headers=HEADERS)
+
+    assert response.status_code == 200
+    assert response.json() == [json.loads(group.model_dump_json())]
+    uow.notes.find_exact_duplicates.assert_awaited_once_with(user_id="user-1", limit=5)
+    uow.notes.get_by_id.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_note_near_duplicates_returns_the_cluster_of_the_note(client, uow):
+    note_id, duplicate_id = uuid.uuid4(), uuid.uuid4()
+    signature = np.arange(NUM_PERM, dtype=SIGNATURE_DTYPE)
+    uow.near_duplicates.get_signatures.return_value = {note_id: signature}
+    uow.near_duplicates.find_candidates.return_value = {duplicate_id: signature.copy()}
+
+    response = await client.get(f"/api/notes/{note_id}/near-duplicates", headers=HEADERS)
+
+    assert response.status_code == 200
+    assert response.json() == [
+        {"anchor_id": str(note_id), "notes": [{"note_id": str(duplicate_id), "similarity": 1.0}]}
+    ]
+
+
+@pytest.mark.asyncio
+async def test_near_duplicates_rejects_thresholds_out_of_range(client, uow):
+    response = await client.get("/api/notes/near-duplicates?threshold=0", headers=HEADERS)
+
+    assert response.status_code == 422
+    uow.near_duplicates.find_candidate_buckets.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_context_is_assembled_within_the_requested_budget(client, uow):
+    uow.changes.get_changes_since.return_value = ChangeFeedPage(next_cursor=1)
+    uow.assistant_context.get_state.return_value = ContextState(datetime.now(UTC), None)
+    uow.assistant_context.find_candidates.return_value = []
+    uow.assistant_context.get_excerpts.return_value = ContextExcerpts(notes={}, projects={})
+
+    response = await client.get("/api/context?q=python&max_tokens=300", headers=HEADERS)
+
+    assert response.status_code == 200
+    assert response.json()["max_tokens"] == 300
+    assert uow.assistant_context.find_candidates.await_args.args[:2] == ("user-1", ["python"])
+    uow.commit.assert_awaited()
+
+
+@pytest.mark.asyncio
+async def test_get_note_answers_304_when_the_etag_still_matches(client, uow):
+    note = make_note()
+    uow.notes.get_by_id.return_value = note
+    uow.notes.get_updated_at.return_value = note.updated_at
+
+    first = await client.get(f"/api/notes/{note.id}", headers=HEADERS)
+    etag = first.headers["etag"]
+    second = await client.get(
+        f"/api/notes/{note.id}", headers={**HEADERS, "If-None-Match": f"W/{etag}"}
+    )
+
+    assert etag == f'"{entity_version(note.id, note.updated_at)}"'
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["etag"] == etag
+    uow.notes.get_by_id.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_list_notes_answers_304_until_the_list_changes(client, uow):
+    uow.notes.list_by_user.return_value = [make_note()]
+
+    etag = (await client.get("/api/notes", headers=HEADERS)).headers["etag"]
+    conditional = {**HEADERS, "If-None-Match": etag}
+    unchanged = await client.get("/api/notes", headers=conditional)
+    uow.notes.get_list_stats.return_value = (datetime.now(UTC), 1, 1)
+    changed = await client.get("/api/notes", headers=conditional)
+
+    assert unchanged.status_code == 304
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert uow.notes.list_by_user.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_stream_json_array_sends_chunks():
+    items = [{"n": i} for i in range(250)]
+
+    chunks = [chunk async for chunk in stream_json_array(items).body_iterator]
+
+    assert len(chunks) == 5  # "[", tres bloques de hasta 100 elementos y "]"
+    assert json.loads(b"".join(chunks)) == items
+    empty = [chunk async for chunk in stream_json_array([]).body_iterator]
+    assert json.loads(b"".join(empty)) == []
+
+
+@pytest.mark.asyncio
+async def test_create_note_commits_and_returns_201(client, uow):
+    note = make_note(content="Nueva")
+    uow.notes.create.return_value = note
+
+    response = await client.post("/api/notes", json={"content": "Nueva"}, headers=HEADERS)
+
+    assert response.status_code == 201
+    assert response.json()["id"] == str(note.id)
+    uow.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_create_project_commits_and_returns_201(client, uow):
+    now = datetime.now(UTC)
+    project = ProjectSchema(
+        id=uuid.uuid4(), user_id="user-1", name="Proyecto", created_at=now, updated_at=now
+    )
+    uow.projects.create.return_value = project
+
+    response = await client.post("/api/projects", json={"name": "Proyecto"}, headers=HEADERS)
+
+    assert response.status_code == 201
+    assert response.json()["id"] == str(project.id)
+    uow.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_circular_project_hierarchy_is_a_validation_error(client, uow):
+    uow.projects.update.side_effect = ValueError("Jerarquía circular")
+
+    response = await client.patch(
+        f"/api/projects/{uuid.uuid4()}",
+        json={"parent_project_id": str(uuid.uuid4())},
+        headers=HEADERS,
+    )
+
+    assert response.status_code == 422
+    assert response.json()["code"] == "ValidationError"
+    uow.commit.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_source_url_is_serialized_as_text(client, uow):
+    now = datetime.now(UTC)
+    uow.sources.get_by_id.return_value = SourceSchema(
+        id=uuid.uuid4(),
+        user_id="user-1",
+        url="https://example.com/articulo",
+        created_at=now,
+        updated_at=now,
+    )
+
+    response = await client.get(f"/api/sources/{uuid.uuid4()}", headers=HEADERS)
+
+    assert response.status_code == 200
+    assert response.json()["url"] == "https://example.com/articulo"
+
+
+@pytest.mark.asyncio
+async def test_missing_user_header_is_rejected(client, uow):
+    response = await client.get(f"/api/notes/{uuid.uuid4()}")
+
+    assert response.status_code == 401
+    uow.notes.get_by_id.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_domain_errors_follow_the_api_error_shape(client, uow):
+    note_id = uuid.uuid4()
+    uow.notes.get_by_id.return_value = None
+
+    response = await client.get(f"/api/notes/{note_id}", headers=HEADERS)
+
+    assert response.status_code == 404
+    body = response.json()
+    assert body["status"] == 404
+    assert body["code"] == "NoteNotFoundError"
+    assert body["message"]
+    assert isinstance(body["details"], dict)
+
+
+@pytest.mark.asyncio
+async def test_repository_error_wrapping_a_domain_error_uses_the_original(client, uow):
+    uow.projects.get_by_id.return_value = None
+
+    response = await client.get(f"/api/projects/{uuid.uuid4()}", headers=HEADERS)
+
+    assert response.status_code == 404
+    assert response.json()["code"] == "ProjectNotFoundError"
+
+
+@pytest.mark.asyncio
+async def test_delete_returns_204_or_404(client, uow):
+    note_id = uuid.uuid4()
+    uow.notes.delete.return_value = True
+    assert (await client.delete(f"/api/notes/{note_id}", headers=HEADERS)).status_code == 204
+
+    uow.notes.delete.side_effect = NoteNotFoundError("No existe.", note_id=note_id)
+    assert (await client.delete(f"/api/notes/{note_id}", headers=HEADERS)).status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_changes_use_the_write_unit_of_work_and_commit(client, uow):
+    uow.changes.get_changes_since.return_value = ChangeFeedPage(next_cursor=7, has_more=True)
+
+    response = await client.get("/api/changes?cursor=5&limit=2", headers=HEADERS)
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "changes": [],
+        "next_cursor": 7,
+        "has_more": True,
+        "reset_required": False,
+    }
+    uow.changes.get_changes_since.assert_awaited_once_with(user_id="user-1", cursor=5, limit=2)
+    uow.commit.assert_awaited_once()
+    assert (await client.get("/api/changes?cursor=-1", headers=HEADERS)).status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint(client):
+    response = await client.get("/metrics")
+
+    assert response.status_code == 200
+    assert "pkm_use_case_duration_seconds" in response.text
+
+
+def test_workers_are_capped_by_the_connection_budget():
+    # development: pool_size 5 + max_overflow 10, dos pools por worker -> 30 conexiones
+    settings = Settings(API_DB_CONNECTION_BUDGET=90)
+    assert resolve_workers(settings, cpu_count=2) == 2
+    assert resolve_workers(settings, cpu_count=16) == 3
+    assert resolve_workers(Settings(API_DB_CONNECTION_BUDGET=10), cpu_count=4) == 1
+    assert resolve_workers(Settings(API_WORKERS=6), cpu_count=2) == 6
+    assert resolve_workers(Settings(DB_PGBOUNCER_MODE=True), cpu_count=16) == 16
+    with pytest.raises(ValueError, match="API_WORKERS"):
+        resolve_workers(Settings(API_WORKERS=0))
@@ -0,0 +1,176 @@
+import json
+import logging
+import queue
+import sys
+import threading
+
+import pytest
+
+from src.pkm_app import logging_config
+from src.pkm_app.logging_config import (
+    LOGGING_CONFIG,
+    JsonFormatter,
+    NonBlockingQueueHandler,
+    SamplingFilter,
+    configure_logging,
+    parse_sampling,
+    shutdown_logging,
+)
+
+
+def make_record(
+    name: str = "src.pkm_app.test", level: int = logging.INFO, msg: str = "mensaje", args=()
+) -> logging.LogRecord:
+    return logging.LogRecord(name, level, __file__, 1, msg, args, None)
+
+
+@pytest.fixture
+def restore_logging():
+    """configure_logging cambia loggers globales: se restauran al terminar el test."""
+    names = [*LOGGING_CONFIG["loggers"], ""]
+    saved = {
+        name: (lg.handlers[:], lg.level, lg.propagate, lg.disabled)
+        for name in names
+        for lg in [logging.getLogger(name)]
+    }
+    yield
+    shutdown_logging()
+    for name, (handlers, level, propagate, disabled) in saved.items():
+        lg = logging.getLogger(name)
+        lg.handlers, lg.level, lg.propagate, lg.disabled = handlers, level, propagate, disabled
+
+
+class CollectingHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records: list[logging.LogRecord] = []
+        self.threads: set[str] = set()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+        self.threads.add(threading.current_thread().name)
+
+
+def test_json_formatter_includes_extra_fields_and_exception():
+    try:
+        raise RuntimeError("fallo")
+    except RuntimeError:
+        record = logging.LogRecord(
+            "src.pkm_app.test", logging.ERROR, __file__, 10, "Nota %s", ("n1",), sys.exc_info()
+        )
+    record.user_id = "u1"
+    record.note_id = object()  # no serializable: se convierte con str()
+
+    entry = json.loads(JsonFormatter().format(record))
+
+    assert entry["message"] == "Nota n1"
+    assert entry["level"] == "ERROR"
+    assert entry["logger"] == "src.pkm_app.test"
+    assert entry["user_id"] == "u1"
+    assert isinstance(entry["note_id"], str)
+    assert "RuntimeError: fallo" in entry["exception"]
+    assert "args" not in entry and "msg" not in entry
+
+
+def test_sampling_filter_keeps_one_of_n_debug_records():
+    sampling = SamplingFilter({"src.pkm_app.infrastructure": 4})
+    debug = [
+        sampling.filter(make_record("src.pkm_app.infrastructure.repo", logging.DEBUG))
+        for _ in range(12)
+    ]
+    info = [
+        sampling.filter(make_record("src.pkm_app.infrastructure.repo", logging.INFO))
+        for _ in range(5)
+    ]
+    other = [sampling.filter(make_record("src.pkm_app.core", logging.DEBUG)) for _ in range(5)]
+
+    assert sum(debug) == 3
+    assert all(info)
+    assert all(other)
+
+
+def test_sampling_filter_uses_longest_matching_prefix():
+    sampling = SamplingFilter({"src.pkm_app": 2, "src.pkm_app.core": 5})
+
+    passed = [sampling.filter(make_record("src.pkm_app.core.x", logging.DEBUG)) for _ in range(10)]
+    # Un prefijo debe coincidir en un límite de nombre, no a mitad de palabra
+    assert sampling._rate("src.pkm_app.corex") == 2
+    assert sum(passed) == 2
+
+
+def test_sampling_filter_rejects_invalid_rate():
+    with pytest.raises(ValueError, match="muestreo"):
+        SamplingFilter({"src.pkm_app": 0})
+
+
+def test_parse_sampling():
+    assert parse_sampling("") == {}
+    assert parse_sampling("src.pkm_app=10, sqlalchemy=100") == {
+        "src.pkm_app": 10,
+        "sqlalchemy": 100,
+    }
+    with pytest.raises(ValueError, match="LOG_SAMPLING"):
+        parse_sampling("src.pkm_app")
+    with pytest.raises(ValueError, match="LOG_SAMPLING"):
+        parse_sampling("src.pkm_app=diez")
+
+
+def test_queue_handler_resolves_message_and_drops_when_full():
+    handler = NonBlockingQueueHandler(queue.Queue(maxsize=1))
+    values = ["a"]
+
+    handler.handle(make_record(msg="valores %s", args=(values,)))
+    values.append("b")  # cambiar el argumento después no altera el registro encolado
+    handler.handle(make_record(msg="descartado"))
+
+    queued = handler.queue.get_nowait()
+    assert queued.getMessage() == "valores ['a']"
+    assert queued.args is None
+    assert handler.dropped == 1
+
+
+def test_queue_handler_does_not_modify_the_callers_record():
+    handler = NonBlockingQueueHandler(queue.Queue())
+    try:
+        raise ValueError("fallo")
+    except ValueError:
+        exc_info = sys.exc_info()
+    record = make_record(msg="valores %s", args=(1,))
+    record.exc_info = exc_info
+
+    handler.handle(record)
+
+    queued = handler.queue.get_nowait()
+    assert queued is not record
+    assert queued.exc_info is None and "ValueError: fallo" in queued.exc_text
+    assert (record.msg, record.args, record.exc_info) == ("valores %s", (1,), exc_info)
+
+
+def test_configure_logging_writes_from_listener_thread(restore_logging):
+    configure_logging(level="DEBUG", json_format=False, sampling={})
+    collector = CollectingHandler()
+    # El listener escribe en los handlers configurados; se añade uno para observarlo
+    logging_config._listener.handlers = (*logging_config._listener.handlers, collector)
+    logger = logging.getLogger("src.pkm_app.tests.logging")
+
+    assert [type(h) for h in logging.getLogger("src.pkm_app").handlers] == [
+        NonBlockingQueueHandler
+    ]
+    logger.info("Nota %s creada", "n1")
+    shutdown_logging()
+
+    assert [record.getMessage() for record in collector.records] == ["Nota n1 creada"]
+    assert threading.current_thread().name not in collector.threads
+
+
+def test_configure_logging_json_output(restore_logging, capsys):
+    configure_logging(level="INFO", json_format=True, sampling={})
+    logging.getLogger("src.pkm_app.tests.logging").info(
+        "Listadas %s notas", 3, extra={"user_id": "u1"}
+    )
+    shutdown_logging()
+
+    line = capsys.readouterr().out.strip().splitlines()[-1]
+    entry = json.loads(line)
+    assert entry["message"] == "Listadas 3 notas"
+    assert entry["user_id"] == "u1"